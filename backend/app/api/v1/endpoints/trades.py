@@ -1,15 +1,27 @@
 """
 거래 내역 API 엔드포인트
 """
-from typing import List
-from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Literal
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, and_
-from sqlalchemy.ext.asyncio import AsyncSession
-from decimal import Decimal
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from backend.app.db.session import get_db
+from backend.app.db.session import get_db, get_session_factory
 from backend.app.models.trade import Trade
+from backend.app.services.trade_listing import (
+    InvalidCursorError,
+    TradeFilter,
+    count_trades,
+    export_trades_csv,
+    export_trades_ndjson,
+    list_trades_page,
+)
+from backend.app.services.trade_statistics import (
+    apply_trade_rollup,
+    get_trade_statistics_summary,
+)
 from backend.app.schemas.trade import (
     TradeCreate,
     TradeResponse,
@@ -22,8 +34,10 @@ router = APIRouter()
 
 @router.get("/", response_model=TradeListResponse)
 async def get_trades(
-    skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
+    skip: int = Query(0, ge=0, description="건너뛸 항목 수 (cursor 미사용 시)"),
     limit: int = Query(50, ge=1, le=100, description="페이지당 항목 수"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    count: Literal["exact", "estimated", "none"] = Query("exact", description="전체 건수 계산 방식"),
     symbol: str | None = Query(None, description="거래 심볼 필터"),
     side: str | None = Query(None, description="거래 방향 필터 (buy/sell)"),
     status: str | None = Query(None, description="거래 상태 필터"),
@@ -34,53 +48,83 @@ async def get_trades(
     """
     거래 내역 목록 조회
     
-    - **skip**: 페이지네이션을 위한 오프셋
+    - **skip**: 페이지네이션을 위한 오프셋 (깊은 페이지는 cursor 권장)
     - **limit**: 페이지당 항목 수 (최대 100)
+    - **cursor**: keyset 페이지네이션 커서 (응답의 next_cursor를 그대로 전달)
+    - **count**: exact(정확), estimated(추정, PostgreSQL), none(생략)
     - **symbol**: 특정 심볼만 필터링
     - **side**: buy 또는 sell 필터
     - **status**: 거래 상태 필터
     - **from_date**: 시작 날짜 (ISO 8601 형식)
     - **to_date**: 종료 날짜 (ISO 8601 형식)
     """
-    # 기본 쿼리
-    query = select(Trade)
-    count_query = select(func.count(Trade.id))
-    
-    # 필터 적용
-    conditions = []
-    if symbol:
-        conditions.append(Trade.symbol == symbol)
-    if side:
-        conditions.append(Trade.side == side)
-    if status:
-        conditions.append(Trade.status == status)
-    if from_date:
-        conditions.append(Trade.created_at >= from_date)
-    if to_date:
-        conditions.append(Trade.created_at <= to_date)
-    
-    if conditions:
-        query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
-    
-    # 정렬 및 페이지네이션
-    query = query.order_by(Trade.created_at.desc()).offset(skip).limit(limit)
-    
-    # 실행
-    result = await db.execute(query)
-    trades = result.scalars().all()
-    
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="cursor와 skip은 함께 사용할 수 없습니다.")
+
+    filters = TradeFilter(
+        symbol=symbol, side=side, status=status, from_date=from_date, to_date=to_date
+    )
+    try:
+        trades, next_cursor = await list_trades_page(
+            db, filters, limit=limit, cursor=cursor, skip=skip
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다.")
+
+    total, is_estimate = await count_trades(db, filters, mode=count)
     
     return TradeListResponse(
         trades=[TradeResponse.model_validate(trade) for trade in trades],
         total=total,
+        total_is_estimate=is_estimate,
         page=skip // limit + 1,
         page_size=limit,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/export")
+async def export_trades(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="내보내기 형식"),
+    symbol: str | None = Query(None, description="거래 심볼 필터"),
+    side: str | None = Query(None, description="거래 방향 필터 (buy/sell)"),
+    status: str | None = Query(None, description="거래 상태 필터"),
+    from_date: datetime | None = Query(None, description="시작 날짜"),
+    to_date: datetime | None = Query(None, description="종료 날짜"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> StreamingResponse:
+    """
+    거래 내역 대량 내보내기 (오프라인 분석용)
+    
+    전체 행을 메모리에 올리지 않고 배치 단위로 스트리밍합니다.
+    정렬은 목록 조회와 같은 최신순입니다.
+    """
+    filters = TradeFilter(
+        symbol=symbol, side=side, status=status, from_date=from_date, to_date=to_date
+    )
+    if format == "csv":
+        return StreamingResponse(
+            _stream_export(session_factory, export_trades_csv, filters),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="trades.csv"'},
+        )
+    return StreamingResponse(
+        _stream_export(session_factory, export_trades_ndjson, filters),
+        media_type="application/x-ndjson",
     )
 
 
+async def _stream_export(
+    session_factory: async_sessionmaker[AsyncSession],
+    export: Callable[[AsyncSession, TradeFilter], AsyncIterator[str]],
+    filters: TradeFilter,
+) -> AsyncIterator[str]:
+    """본문 전송이 끝날 때까지 유지되는 세션으로 내보내기 (Depends 세션은 응답 반환 시 닫힘)"""
+    async with session_factory() as db:
+        async for chunk in export(db, filters):
+            yield chunk
+
+
 @router.get("/{trade_id}", response_model=TradeResponse)
 async def get_trade(
     trade_id: str,
@@ -115,9 +159,11 @@ async def create_trade(
     if existing:
         raise HTTPException(status_code=409, detail="이미 존재하는 거래 ID입니다.")
     
-    # 거래 생성
+    # 거래 생성 (일별 집계도 같은 트랜잭션에서 갱신)
     trade = Trade(**trade_in.model_dump())
     db.add(trade)
+    await db.flush()
+    await apply_trade_rollup(db, [trade])
     await db.commit()
     await db.refresh(trade)
     
@@ -135,64 +181,8 @@ async def get_trade_statistics(
     
     - **symbol**: 특정 심볼만 집계
     - **days**: 최근 N일간의 데이터 집계
-    """
-    # 기간 필터
-    from_date = datetime.utcnow() - timedelta(days=days)
-    conditions = [Trade.created_at >= from_date, Trade.status == "completed"]
-    
-    if symbol:
-        conditions.append(Trade.symbol == symbol)
-    
-    # 전체 통계
-    total_query = select(func.count(Trade.id)).where(and_(*conditions))
-    total_result = await db.execute(total_query)
-    total_trades = total_result.scalar() or 0
-    
-    # 매수 통계
-    buy_query = select(func.count(Trade.id)).where(
-        and_(Trade.side == "buy", *conditions)
-    )
-    buy_result = await db.execute(buy_query)
-    total_buy = buy_result.scalar() or 0
-    
-    # 매도 통계
-    sell_query = select(func.count(Trade.id)).where(
-        and_(Trade.side == "sell", *conditions)
-    )
-    sell_result = await db.execute(sell_query)
-    total_sell = sell_result.scalar() or 0
-    
-    # 총 거래량 및 수수료
-    sum_query = select(
-        func.sum(Trade.total),
-        func.sum(Trade.fee),
-    ).where(and_(*conditions))
-    sum_result = await db.execute(sum_query)
-    total_volume, total_fee = sum_result.one()
-    
-    # 평균 매수가
-    avg_buy_query = select(func.avg(Trade.price)).where(
-        and_(Trade.side == "buy", *conditions)
-    )
-    avg_buy_result = await db.execute(avg_buy_query)
-    avg_buy_price = avg_buy_result.scalar()
-    
-    # 평균 매도가
-    avg_sell_query = select(func.avg(Trade.price)).where(
-        and_(Trade.side == "sell", *conditions)
-    )
-    avg_sell_result = await db.execute(avg_sell_query)
-    avg_sell_price = avg_sell_result.scalar()
-    
-    return TradeStatistics(
-        total_trades=total_trades,
-        total_buy=total_buy,
-        total_sell=total_sell,
-        total_volume_krw=total_volume or Decimal("0"),
-        total_fee=total_fee or Decimal("0"),
-        avg_buy_price=avg_buy_price,
-        avg_sell_price=avg_sell_price,
-    )
-
-
 
+    조건부 집계 단일 쿼리로 계산하며, 긴 기간은 일별 집계(trade_daily_stats)를 사용합니다.
+    """
+    summary = await get_trade_statistics_summary(db, symbol=symbol, days=days)
+    return TradeStatistics(**summary)
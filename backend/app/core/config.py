@@ -67,6 +67,15 @@ class Settings(BaseSettings):
     TELEGRAM_BOT_TOKEN: Optional[str] = None
     TELEGRAM_CHAT_ID: Optional[str] = None
     TELEGRAM_ENABLED: bool = False
+    TELEGRAM_API_BASE_URL: Optional[str] = None  # Bot API 서버 (기본: https://api.telegram.org/bot)
+    TELEGRAM_ASYNC_DISPATCH: bool = True  # 큐 + 백그라운드 전송 (False: 호출 시 직접 전송)
+    TELEGRAM_COALESCE_WINDOW: float = 1.0  # 병합 대기 시간 (초)
+    TELEGRAM_MIN_INTERVAL: float = 1.0  # 채팅별 최소 전송 간격 (초)
+    TELEGRAM_QUEUE_SIZE: int = 1000
+    TELEGRAM_MAX_ATTEMPTS: int = 3
+    TELEGRAM_SNAPSHOT_TTL: float = 15.0  # 봇 포트폴리오 스냅샷 유효 시간 (초)
+    TELEGRAM_SNAPSHOT_MAX_STALE: float = 300.0  # 이보다 오래되면 갱신 완료까지 대기 (초)
+    SCAN_RESULT_PATH: str = "data/last_scan.json"  # 스케줄러 마지막 스캔 결과 (봇과 공유)
     
     # Sentry
     SENTRY_DSN: Optional[str] = None
@@ -13,6 +13,7 @@ import pandas as pd
 from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from backend.app.core.config import settings
 
@@ -39,32 +40,57 @@ def get_container():
         from src.api.upbit_client import UpbitClient
         from src.data.collector import DataCollector
         from backend.app.db.session import AsyncSessionLocal
+        from src.config.settings import CoordinationConfig
 
         # 레거시 서비스 생성 (UpbitClient, DataCollector만 유지)
         # AIService 제거 - Container.get_ai_port()가 OpenAIAdapter 기본 반환
         upbit_client = UpbitClient()
         data_collector = DataCollector()
 
-        # Container로 래핑 (PostgreSQL session_factory 전달)
+        # Container로 래핑 (PostgreSQL session_factory + 텔레그램 봇과 공유하는 로컬 조율 디렉토리)
         _container = Container.create_from_legacy(
             upbit_client=upbit_client,
             data_collector=data_collector,
             session_factory=AsyncSessionLocal,
+            coordination_dir=CoordinationConfig.DIR,
         )
         logger.info("✅ Container 싱글톤 초기화 완료 (Clean Architecture)")
 
     return _container
 
 
+# ============================================================================
+# TradingRuntime 싱글톤 (사이클 간 파이프라인/Executor 재사용)
+# ============================================================================
+_runtime = None
+
+
+def get_trading_runtime():
+    """
+    TradingRuntime 싱글톤 인스턴스 반환
+
+    스케줄러 프로세스가 소유하는 장기 실행 런타임입니다.
+    파이프라인 스테이지, 코인 선택기, 스캔 Executor를 사이클 간 재사용합니다.
+    """
+    global _runtime
+    if _runtime is None:
+        from src.application.services.trading_runtime import TradingRuntime
+        _runtime = TradingRuntime()
+        logger.info("✅ TradingRuntime 싱글톤 초기화 완료")
+
+    return _runtime
+
+
 def get_trading_orchestrator():
     """
     TradingOrchestrator 인스턴스 반환
 
     Container를 통해 TradingOrchestrator를 획득합니다.
     main.py 의존성 없이 거래 사이클을 실행할 수 있습니다.
+    스케줄러의 TradingRuntime을 주입하여 파이프라인을 재사용합니다.
     """
     container = get_container()
-    return container.get_trading_orchestrator()
+    return container.get_trading_orchestrator(runtime=get_trading_runtime())
 
 
 def get_upbit_client():
@@ -146,17 +172,27 @@ async def trading_job():
     container = get_container()
     lock_port = container.get_lock_port()
     lock_acquired = False
+    # 사이클 보드: 텔레그램 /run이 진행 중인 사이클에 합류할 수 있도록 진행/결과 기록
+    coordinator = container.get_cycle_coordinator(owner="scheduler")
+    run_id = None
 
     try:
         # Lock 획득 시도 (trading_cycle 락)
         lock_acquired = await lock_port.acquire("trading_cycle", timeout_seconds=600)
         if not lock_acquired:
             logger.warning("⚠️ trading_cycle 락 획득 실패 - 다른 작업이 실행 중입니다")
+            coordinator.record_busy()
             scheduler_job_failure_total.labels(job_name='trading_job').inc()
             return
 
-        logger.info("🔒 trading_cycle 락 획득 완료")
+        # 주문 직전 fencing token 검증용 lease (lease 미지원 어댑터면 None)
+        lock_lease = lock_port.get_lease("trading_cycle")
+        logger.info(
+            "🔒 trading_cycle 락 획득 완료"
+            + (f" (fencing token {lock_lease.token})" if lock_lease is not None else "")
+        )
         logger.info(f"[{datetime.now()}] 트레이딩 작업 시작")
+        run_id = coordinator.begin()
 
         # 1. TradingOrchestrator 초기화 (Clean Architecture)
         ticker = TradingConfig.TICKER
@@ -251,6 +287,18 @@ async def trading_job():
                 logger.info(f"  - 선택 코인: {selected_coin}")
                 logger.info(f"  - metrics: {bt_result.get('metrics', {})}")
 
+                # 📂 마지막 스캔 결과 공유 (텔레그램 봇 /scan, /status가 재스캔 없이 사용)
+                try:
+                    from src.application.services.scan_result_store import get_scan_result_store
+                    get_scan_result_store().save(backtest_data)
+                except Exception as store_error:
+                    logger.warning(f"스캔 결과 저장 실패: {store_error}")
+                coordinator.progress(run_id, "scanned", {
+                    'scan_summary': scan_summary,
+                    'selected_coin': selected_coin,
+                    'all_backtest_results': all_backtest_results,
+                })
+
                 # 📱 1) 스캔 결과 알림 (유동성 + 백테스팅 요약)
                 try:
                     await notify_scan_result(
@@ -286,6 +334,7 @@ async def trading_job():
                     trading_type='spot',
                     enable_scanning=True,  # 멀티코인 스캐닝 활성화
                     max_positions=3,
+                    lock_lease=lock_lease,
                 ),
                 timeout=TRADING_CYCLE_TIMEOUT
             )
@@ -328,6 +377,9 @@ async def trading_job():
 
         # 4. 결과 처리
         status = result.get('status', 'failed')
+        # 합류한 프로세스가 DB 저장/알림을 기다리지 않도록 결과부터 기록
+        coordinator.finish(run_id, result, failed=status == 'failed')
+        run_id = None
         if status == 'success':
             logger.info(f"✅ 거래 사이클 성공: {result['decision']}")
             
@@ -573,6 +625,9 @@ async def trading_job():
         # 실패 메트릭
         scheduler_job_failure_total.labels(job_name='trading_job').inc()
 
+        # 결과 기록 전에 실패한 경우 (run_id가 남아 있으면)
+        coordinator.finish(run_id, {'status': 'failed', 'decision': 'hold', 'error': str(e)}, failed=True)
+
     finally:
         # Lock 해제 (반드시 실행)
         if lock_acquired:
@@ -590,7 +645,7 @@ async def position_management_job():
     Clean Architecture:
     - main.py 의존성 제거
     - TradingOrchestrator를 통해 포지션 관리 실행
-    - Lock으로 trading_job과 상호 배제
+    - Lock으로 trading_job과 상호 배제 (진행 중인 사이클 뒤에서 FIFO 대기)
     """
     from backend.app.services.notification import notify_error
     from backend.app.services.metrics import (
@@ -608,22 +663,35 @@ async def position_management_job():
     lock_acquired = False
 
     try:
-        # Lock 획득 시도 (trading_cycle 락 - trading_job과 동일한 락 사용)
-        # 60초 타임아웃으로 trading_job이 끝날 때까지 대기
-        lock_acquired = await lock_port.acquire("trading_cycle", timeout_seconds=60)
+        # Lock 획득 (trading_cycle 락 - trading_job과 동일한 락 사용)
+        # 사이클이 실행 중이면 슬롯을 버리지 않고 POSITION_LOCK_WAIT까지 대기열에서 대기
+        from src.config.settings import CoordinationConfig
+        lock_lease = await lock_port.acquire_lease(
+            "trading_cycle",
+            timeout_seconds=300,
+            wait_seconds=CoordinationConfig.POSITION_LOCK_WAIT,
+        )
+        lock_acquired = lock_lease is not None
         if not lock_acquired:
-            logger.warning("⚠️ trading_cycle 락 획득 실패 - trading_job이 실행 중입니다. 스킵합니다.")
+            logger.warning(
+                f"⚠️ trading_cycle 락 대기 시간 초과 ({CoordinationConfig.POSITION_LOCK_WAIT:.0f}초) "
+                f"- 이번 포지션 관리를 스킵합니다."
+            )
             scheduler_job_success_total.labels(job_name='position_management_job').inc()
             return
 
-        logger.info("🔒 position_management 락 획득 완료")
+        waited = time() - job_start_time
+        logger.info(
+            f"🔒 position_management 락 획득 완료 (대기 {waited:.1f}초"
+            + (f", fencing token {lock_lease.token})" if lock_lease.token is not None else ")")
+        )
         logger.info(f"[{datetime.now()}] 포지션 관리 작업 시작 (15분 주기)")
 
         # TradingOrchestrator 초기화 (Clean Architecture)
         orchestrator = get_trading_orchestrator()
 
         # 포지션 관리 사이클 실행
-        result = await orchestrator.execute_position_management()
+        result = await orchestrator.execute_position_management(lock_lease=lock_lease)
 
         # 결과 처리
         duration = time() - job_start_time
@@ -682,6 +750,75 @@ async def position_management_job():
             logger.info("🔓 position_management 락 해제 완료")
 
 
+async def position_reconcile_job():
+    """
+    포지션 대조 작업 (PERSISTENCE_POSITION_RECONCILE_MINUTES 주기)
+
+    positions 테이블(인메모리 인덱스)을 거래소 잔고와 대조하여 보정합니다.
+    거래 경로의 포지션 조회는 로컬에서 처리하고, 거래소 잔고 조회는 이 작업에서만 수행합니다.
+    스케줄러 시작 직후 1회 실행되어 재시작 후 상태를 복구합니다.
+    """
+    container = get_container()
+    lock_port = container.get_lock_port()
+    lock_acquired = False
+
+    try:
+        lock_acquired = await lock_port.acquire("trading_cycle", timeout_seconds=60)
+        if not lock_acquired:
+            logger.warning("⚠️ trading_cycle 락 획득 실패 - 포지션 대조를 다음 주기로 미룹니다.")
+            return
+
+        report = await container.get_manage_position_use_case().reconcile_positions()
+        changed = sum(len(report[key]) for key in ("created", "updated", "closed"))
+        if changed:
+            logger.warning(
+                f"포지션 대조 보정: 생성 {report['created']}, "
+                f"수정 {report['updated']}, 청산 {report['closed']}"
+            )
+        else:
+            logger.info("✅ 포지션 대조 완료: 불일치 없음")
+        if report.get("unreadable"):
+            logger.warning(f"⚠️ 포지션 조회 실패로 대조 보류: {report['unreadable']}")
+
+    except Exception as e:
+        logger.error(f"포지션 대조 작업 중 오류 발생: {e}", exc_info=True)
+
+        if settings.SENTRY_ENABLED:
+            import sentry_sdk
+            sentry_sdk.capture_exception(e)
+
+    finally:
+        if lock_acquired:
+            await lock_port.release("trading_cycle")
+
+
+_orderbook_recorder = None
+
+
+def get_orderbook_recorder():
+    """오더북 기록기 싱글톤 (SlippageConfig 기반)"""
+    global _orderbook_recorder
+    if _orderbook_recorder is None:
+        from src.backtesting.orderbook_store import create_orderbook_recorder
+        _orderbook_recorder = create_orderbook_recorder()
+    return _orderbook_recorder
+
+
+async def orderbook_recorder_job():
+    """
+    오더북 기록 작업 (SLIPPAGE_ORDERBOOK_RECORDER_INTERVAL 주기)
+
+    감시 티커의 호가창을 기록하여 백테스트 슬리피지 재생(OrderbookReplay)에 사용합니다.
+    거래 사이클과 무관한 읽기 전용 작업이므로 trading_cycle 락을 잡지 않습니다.
+    """
+    try:
+        recorder = get_orderbook_recorder()
+        written = await asyncio.to_thread(recorder.record_once)
+        logger.debug(f"오더북 기록: {written}/{len(recorder.tickers)}개 티커")
+    except Exception as e:
+        logger.error(f"오더북 기록 작업 중 오류 발생: {e}", exc_info=True)
+
+
 async def portfolio_snapshot_job():
     """
     포트폴리오 스냅샷 저장 작업
@@ -789,10 +926,12 @@ def add_jobs():
     실행 시점:
     - trading_job: 매시 01분 (1시간봉 마감 + 1분 버퍼)
     - position_management_job: :01, :16, :31, :46 (15분봉 마감 + 1분 버퍼)
+    - position_reconcile_job: 시작 직후 + 30분 주기 (PERSISTENCE_POSITION_RECONCILE_MINUTES)
     - portfolio_snapshot_job: 매시 01분
+    - orderbook_recorder_job: SLIPPAGE_ORDERBOOK_RECORDER_INTERVAL초 주기 (활성화 시)
     - daily_report_job: 매일 09:00
     """
-    from src.config.settings import SchedulerConfig
+    from src.config.settings import SchedulerConfig, PersistenceConfig, SlippageConfig
 
     if not settings.SCHEDULER_ENABLED:
         logger.warning("스케줄러가 비활성화되어 있습니다.")
@@ -824,6 +963,20 @@ def add_jobs():
     )
     logger.info(f"✅ 포지션 관리 작업 등록됨 (CronTrigger: :{SchedulerConfig.POSITION_JOB_MINUTES})")
 
+    # 2-1. 포지션 대조 (거래소 잔고 ↔ positions 테이블, 시작 직후 1회 + 주기 실행)
+    if PersistenceConfig.POSITION_RECONCILE_MINUTES > 0:
+        from zoneinfo import ZoneInfo
+
+        scheduler.add_job(
+            position_reconcile_job,
+            trigger=IntervalTrigger(minutes=PersistenceConfig.POSITION_RECONCILE_MINUTES),
+            id="position_reconcile_job",
+            name=f"포지션 대조 (매 {PersistenceConfig.POSITION_RECONCILE_MINUTES}분)",
+            next_run_time=datetime.now(ZoneInfo("Asia/Seoul")),
+            replace_existing=True,
+        )
+        logger.info(f"✅ 포지션 대조 작업 등록됨 (IntervalTrigger: {PersistenceConfig.POSITION_RECONCILE_MINUTES}분)")
+
     # 3. 포트폴리오 스냅샷 (매시 N분)
     scheduler.add_job(
         portfolio_snapshot_job,
@@ -837,6 +990,19 @@ def add_jobs():
     )
     logger.info(f"✅ 포트폴리오 스냅샷 작업 등록됨 (CronTrigger: 매시 {SchedulerConfig.PORTFOLIO_JOB_MINUTE:02d}분)")
 
+    # 3-1. 오더북 기록 (백테스트 슬리피지 재생용, 기본 비활성화)
+    if SlippageConfig.ORDERBOOK_RECORDER_ENABLED:
+        scheduler.add_job(
+            orderbook_recorder_job,
+            trigger=IntervalTrigger(seconds=SlippageConfig.ORDERBOOK_RECORDER_INTERVAL_SECONDS),
+            id="orderbook_recorder_job",
+            name=f"오더북 기록 (매 {SlippageConfig.ORDERBOOK_RECORDER_INTERVAL_SECONDS}초)",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+        logger.info(f"✅ 오더북 기록 작업 등록됨 (IntervalTrigger: {SlippageConfig.ORDERBOOK_RECORDER_INTERVAL_SECONDS}초)")
+
     # 4. 일일 리포트 (매일 N시 M분)
     scheduler.add_job(
         daily_report_job,
@@ -870,6 +1036,7 @@ def start_scheduler():
         return
 
     add_jobs()
+    get_trading_runtime().start()
     scheduler.start()
     logger.info("✅ 스케줄러 시작됨 (CronTrigger 기반)")
 
@@ -901,6 +1068,21 @@ def start_scheduler():
             logger.info(f"⏰ 다음 트레이딩 작업 실행 예정: {trading_job_info.next_run_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
 
+async def close_persistence():
+    """
+    영속성 어댑터 종료 (write-behind 큐에 남은 기록 flush)
+
+    스케줄러 종료 전에 이벤트 루프 안에서 호출합니다.
+    """
+    if _container is None:
+        return
+    try:
+        await _container.close()
+        logger.info("✅ 영속성 write-behind 큐 flush 완료")
+    except Exception as e:
+        logger.error(f"영속성 어댑터 종료 실패: {e}")
+
+
 def stop_scheduler():
     """스케줄러 중지"""
     if not scheduler.running:
@@ -908,6 +1090,12 @@ def stop_scheduler():
         return
     
     scheduler.shutdown(wait=True)
+
+    # 런타임 종료 (Executor/스레드 정리)
+    if _runtime is not None:
+        logger.info(f"TradingRuntime 상태: {_runtime.health()}")
+        _runtime.shutdown()
+
     logger.info("✅ 스케줄러 중지됨")
 
 
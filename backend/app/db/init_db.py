@@ -14,6 +14,9 @@ from backend.app.models import (
     Order,
     SystemLog,
     BotConfig,
+    TradeDailyStat,
+    Position,
+    DecisionAccuracyStat,
 )
 
 logger = logging.getLogger(__name__)
@@ -96,6 +99,8 @@ async def init_db() -> None:
     
     1. 테이블 생성
     2. 기본 설정 데이터 추가
+    3. 거래 일별 집계 백필 (비어 있는 경우)
+    4. AI 판단 정확도 일별 집계 백필 (비어 있는 경우)
     """
     try:
         logger.info("🚀 데이터베이스 초기화 시작...")
@@ -108,6 +113,18 @@ async def init_db() -> None:
         
         async with AsyncSessionLocal() as session:
             await init_default_config(session)
+
+        # 3. 거래 일별 집계 백필
+        from backend.app.services.trade_statistics import ensure_trade_rollup
+
+        async with AsyncSessionLocal() as session:
+            await ensure_trade_rollup(session)
+
+        # 4. AI 판단 정확도 일별 집계 백필
+        from backend.app.services.decision_accuracy import ensure_accuracy_rollup
+
+        async with AsyncSessionLocal() as session:
+            await ensure_accuracy_rollup(session)
         
         logger.info("✅ 데이터베이스 초기화 완료!")
         
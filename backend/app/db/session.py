@@ -55,3 +55,13 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    FastAPI 의존성 주입용 세션 팩토리
+
+    StreamingResponse처럼 응답 반환 후에 DB를 읽는 엔드포인트는 get_db 세션이
+    본문 전송 전에 닫힐 수 있으므로, 팩토리를 받아 생성기 안에서 세션을 엽니다.
+    """
+    return AsyncSessionLocal
@@ -96,6 +96,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     # TODO: 스케줄러 중지
     # scheduler.shutdown()
+
+    # 알림 큐에 남은 메시지 전송
+    from backend.app.services.notification import close_notifier
+    await close_notifier()
     
     logger.info("✅ 애플리케이션 종료 완료")
 
@@ -11,6 +11,10 @@ from backend.app.models.bot_config import BotConfig
 from backend.app.models.risk_state import RiskState
 from backend.app.models.idempotency_key import IdempotencyKey
 from backend.app.models.decision_record import DecisionRecordModel
+from backend.app.models.ai_decision_cache import AIDecisionCacheEntry
+from backend.app.models.trade_daily_stat import TradeDailyStat
+from backend.app.models.position import Position
+from backend.app.models.decision_accuracy_stat import DecisionAccuracyStat
 
 __all__ = [
     "Trade",
@@ -22,6 +26,10 @@ __all__ = [
     "RiskState",
     "IdempotencyKey",
     "DecisionRecordModel",
+    "AIDecisionCacheEntry",
+    "TradeDailyStat",
+    "Position",
+    "DecisionAccuracyStat",
 ]
 
 
@@ -0,0 +1,47 @@
+"""
+AI 결정 캐시 모델
+
+동일 캔들/프롬프트에 대한 중복 LLM 호출 방지를 위한 캐시 테이블
+키 형식: {ticker}:{sha256(prompt_version|candle_ts|analysis_type|prompt)}
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, DateTime, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base import Base
+
+
+class AIDecisionCacheEntry(Base):
+    """AI 결정 캐시 테이블"""
+    __tablename__ = "ai_decision_cache"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    key: Mapped[str] = mapped_column(
+        String(128), unique=True, nullable=False, index=True,
+        comment="캐시 키 (ticker:sha256)"
+    )
+    ticker: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True,
+        comment="거래 쌍"
+    )
+    decision: Mapped[dict] = mapped_column(
+        JSON, nullable=False,
+        comment="직렬화된 TradingDecision"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now,
+        comment="생성 시각"
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False,
+        comment="만료 시각 (다음 캔들 종가 시점)"
+    )
+
+    # 만료 시각 기준 인덱스 (cleanup 쿼리 최적화)
+    __table_args__ = (
+        Index('ix_ai_decision_cache_expires_at', 'expires_at'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AIDecisionCacheEntry(key={self.key}, expires_at={self.expires_at})>"
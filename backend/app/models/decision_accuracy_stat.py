@@ -0,0 +1,66 @@
+"""
+AI 판단 정확도 일별 집계(rollup) 모델
+
+프롬프트 A/B 비교용 정확도 분석을 decision_records 전체 집계 대신
+(일자, 프롬프트 버전, 심볼, 판단) 단위 집계 행으로 처리하기 위한 테이블입니다.
+DecisionRecordAdapter.link_pnl()이 is_profitable을 채울 때 같은 트랜잭션에서 증분 갱신됩니다.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import String, Numeric, Date, DateTime, Integer, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base import Base
+
+
+class DecisionAccuracyStat(Base):
+    """AI 판단 정확도 일별 집계 테이블"""
+    __tablename__ = "decision_accuracy_daily"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    day: Mapped[date] = mapped_column(
+        Date, nullable=False,
+        comment="판단일 (decision_records.created_at 기준, UTC)"
+    )
+    prompt_version: Mapped[str] = mapped_column(
+        String(20), nullable=False,
+        comment="프롬프트 버전 (예: 1.0.0)"
+    )
+    symbol: Mapped[str] = mapped_column(
+        String(20), nullable=False,
+        comment="거래 심볼 (예: KRW-BTC)"
+    )
+    decision: Mapped[str] = mapped_column(
+        String(20), nullable=False,
+        comment="AI 판단: ALLOW, BLOCK, HOLD"
+    )
+    total: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False,
+        comment="PnL 연동된 판단 수"
+    )
+    correct: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False,
+        comment="수익(is_profitable=True) 판단 수"
+    )
+    pnl_sum: Mapped[Decimal] = mapped_column(
+        Numeric(20, 4), default=Decimal("0"), nullable=False,
+        comment="손익률 합계 (%) (평균 = pnl_sum / total)"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False,
+        comment="최종 갱신 시각"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            'day', 'prompt_version', 'symbol', 'decision',
+            name='uq_decision_accuracy_daily_key',
+        ),
+        Index('ix_decision_accuracy_daily_version_day', 'prompt_version', 'day'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<DecisionAccuracyStat {self.day} v{self.prompt_version} "
+            f"{self.symbol} {self.decision} {self.correct}/{self.total}>"
+        )
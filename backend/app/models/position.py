@@ -0,0 +1,51 @@
+"""
+보유 포지션 모델
+현재 보유 중인 포지션(심볼당 1행)을 저장합니다.
+
+거래 체결 시 write-through로 갱신되며, 청산된 포지션은 삭제됩니다.
+거래소 잔고와의 대조(reconcile)는 주기 작업에서 수행합니다.
+"""
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import String, Numeric, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base import Base
+
+
+class Position(Base):
+    """보유 포지션 테이블"""
+    __tablename__ = "positions"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    position_id: Mapped[str] = mapped_column(
+        String(100), unique=True, nullable=False,
+        comment="포지션 고유 ID (UUID)"
+    )
+    symbol: Mapped[str] = mapped_column(
+        String(20), unique=True, nullable=False, index=True,
+        comment="거래 심볼 (예: KRW-BTC)"
+    )
+    currency: Mapped[str] = mapped_column(
+        String(20), nullable=False,
+        comment="기초 자산 (예: BTC)"
+    )
+    volume: Mapped[Decimal] = mapped_column(
+        Numeric(20, 8), nullable=False,
+        comment="보유 수량"
+    )
+    avg_entry_price: Mapped[Decimal] = mapped_column(
+        Numeric(20, 8), nullable=False,
+        comment="평균 진입가 (KRW)"
+    )
+    entry_time: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False,
+        comment="최초 진입 시각"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False,
+        comment="최종 갱신 시각"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Position {self.symbol} {self.volume} @ {self.avg_entry_price}>"
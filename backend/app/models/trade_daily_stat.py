@@ -0,0 +1,59 @@
+"""
+거래 일별 집계(rollup) 모델
+
+/trades/statistics/summary 의 긴 기간 조회를 trades 테이블 전체 스캔 대신
+(일자, 심볼, 방향) 단위 집계 행으로 처리하기 위한 테이블입니다.
+completed 상태 거래가 INSERT 될 때 같은 트랜잭션에서 증분 갱신됩니다.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import String, Numeric, Date, DateTime, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base import Base
+
+
+class TradeDailyStat(Base):
+    """거래 일별 집계 테이블"""
+    __tablename__ = "trade_daily_stats"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    day: Mapped[date] = mapped_column(
+        Date, nullable=False, index=True,
+        comment="거래일 (UTC)"
+    )
+    symbol: Mapped[str] = mapped_column(
+        String(20), nullable=False,
+        comment="거래 심볼 (예: KRW-BTC)"
+    )
+    side: Mapped[str] = mapped_column(
+        String(10), nullable=False,
+        comment="매수(buy) 또는 매도(sell)"
+    )
+    trade_count: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False,
+        comment="거래 수"
+    )
+    volume_krw: Mapped[Decimal] = mapped_column(
+        Numeric(30, 8), default=Decimal("0"), nullable=False,
+        comment="총 거래 금액 합계 (sum(total))"
+    )
+    fee_sum: Mapped[Decimal] = mapped_column(
+        Numeric(30, 8), default=Decimal("0"), nullable=False,
+        comment="수수료 합계"
+    )
+    price_sum: Mapped[Decimal] = mapped_column(
+        Numeric(30, 8), default=Decimal("0"), nullable=False,
+        comment="체결 가격 합계 (평균가 = price_sum / trade_count)"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False,
+        comment="최종 갱신 시각"
+    )
+
+    __table_args__ = (
+        UniqueConstraint('day', 'symbol', 'side', name='uq_trade_daily_stats_day_symbol_side'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TradeDailyStat {self.day} {self.symbol} {self.side} x{self.trade_count}>"
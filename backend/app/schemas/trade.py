@@ -49,9 +49,11 @@ class TradeResponse(TradeBase):
 class TradeListResponse(BaseModel):
     """거래 목록 응답 스키마"""
     trades: list[TradeResponse]
-    total: int = Field(..., description="전체 거래 수")
+    total: int | None = Field(..., description="전체 거래 수 (count=none이면 생략)")
+    total_is_estimate: bool = Field(default=False, description="total이 플래너 추정치인지 여부")
     page: int = Field(default=1, description="현재 페이지")
     page_size: int = Field(default=50, description="페이지당 항목 수")
+    next_cursor: str | None = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,363 @@
+"""
+AI 판단 정확도 분석 서비스
+
+프롬프트 A/B 비교를 위한 정확도 집계를 담당합니다.
+
+- decision_accuracy_daily(일별 rollup)를 (일자, 프롬프트 버전, 심볼, 판단) 단위로 유지
+  → 조회는 decision_records 크기가 아닌 rollup 행 수(기간 × 조합 수)에만 비례
+- rollup은 DecisionRecordAdapter.link_pnl()이 is_profitable을 채울 때
+  같은 트랜잭션에서 apply_accuracy_rollup()으로 증분 갱신합니다.
+  (PnL 재연동 시 이전 결과를 빼고 새 결과를 더함)
+- 기존 데이터는 rebuild_accuracy_rollup()으로 한 번 채웁니다.
+- 정확도에는 Wilson 신뢰구간을 함께 제공하여 표본이 적은 조합을 구분합니다.
+"""
+import logging
+import math
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.decision_accuracy_stat import DecisionAccuracyStat
+from backend.app.models.decision_record import DecisionRecordModel
+
+logger = logging.getLogger(__name__)
+
+# 분석 차원 (get_accuracy_breakdown group_by 허용 값)
+BREAKDOWN_DIMENSIONS = ("prompt_version", "symbol", "decision", "day")
+
+# 95% 신뢰수준 z 값
+DEFAULT_Z = 1.96
+
+
+def wilson_interval(correct: int, total: int, z: float = DEFAULT_Z) -> Tuple[float, float]:
+    """
+    정확도(이항 비율) Wilson 신뢰구간
+
+    Args:
+        correct: 성공 수
+        total: 시행 수
+        z: 표준정규 분위수 (기본 1.96 = 95%)
+
+    Returns:
+        (하한, 상한) - total이 0이면 (0.0, 1.0)
+    """
+    if total <= 0:
+        return 0.0, 1.0
+    p = correct / total
+    z2 = z * z
+    denominator = 1 + z2 / total
+    center = (p + z2 / (2 * total)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / total + z2 / (4 * total * total)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+# ============================================================================
+# rollup 갱신
+# ============================================================================
+
+def link_delta(
+    record: Any,
+    previous: Optional[Tuple[bool, Optional[Decimal]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    PnL 연동 1건 → rollup 증분
+
+    Args:
+        record: PnL이 반영된 DecisionRecordModel
+        previous: 재연동 시 이전 (is_profitable, pnl_percent)
+
+    Returns:
+        증분 dict (변화 없으면 None)
+    """
+    if record.is_profitable is None:
+        return None
+
+    total = 1
+    correct = 1 if record.is_profitable else 0
+    pnl = Decimal(str(record.pnl_percent or 0))
+    if previous is not None:
+        previous_profitable, previous_pnl = previous
+        total -= 1
+        correct -= 1 if previous_profitable else 0
+        pnl -= Decimal(str(previous_pnl or 0))
+        if correct == 0 and pnl == 0:
+            return None
+
+    created_at = record.created_at or datetime.utcnow()
+    return {
+        "day": created_at.date(),
+        "prompt_version": record.prompt_version,
+        "symbol": record.symbol,
+        "decision": record.decision,
+        "total": total,
+        "correct": correct,
+        "pnl_sum": pnl,
+    }
+
+
+def _dialect_name(db: AsyncSession) -> Optional[str]:
+    """세션에 바인딩된 DB 방언 이름 (확인 불가 시 None)"""
+    try:
+        return db.get_bind().dialect.name
+    except Exception:
+        return None
+
+
+async def apply_accuracy_rollup(db: AsyncSession, deltas: Iterable[Dict[str, Any]]) -> int:
+    """
+    정확도 증분을 일별 rollup에 반영 (커밋하지 않음 - 호출자 트랜잭션에 포함)
+
+    PostgreSQL/SQLite는 INSERT ... ON CONFLICT DO UPDATE 한 번으로 처리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        deltas: link_delta() 결과 목록
+
+    Returns:
+        갱신된 rollup 행 수
+    """
+    rows = [dict(delta, updated_at=datetime.utcnow()) for delta in deltas if delta]
+    if not rows:
+        return 0
+
+    dialect = _dialect_name(db)
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(DecisionAccuracyStat)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", "prompt_version", "symbol", "decision"],
+            set_={
+                "total": DecisionAccuracyStat.total + stmt.excluded.total,
+                "correct": DecisionAccuracyStat.correct + stmt.excluded.correct,
+                "pnl_sum": DecisionAccuracyStat.pnl_sum + stmt.excluded.pnl_sum,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await db.execute(stmt, rows)
+        return len(rows)
+
+    # 기타 DB: UPDATE 후 없으면 INSERT
+    for row in rows:
+        result = await db.execute(
+            update(DecisionAccuracyStat)
+            .where(
+                DecisionAccuracyStat.day == row["day"],
+                DecisionAccuracyStat.prompt_version == row["prompt_version"],
+                DecisionAccuracyStat.symbol == row["symbol"],
+                DecisionAccuracyStat.decision == row["decision"],
+            )
+            .values(
+                total=DecisionAccuracyStat.total + row["total"],
+                correct=DecisionAccuracyStat.correct + row["correct"],
+                pnl_sum=DecisionAccuracyStat.pnl_sum + row["pnl_sum"],
+                updated_at=row["updated_at"],
+            )
+        )
+        if result.rowcount == 0:
+            db.add(DecisionAccuracyStat(**row))
+    return len(rows)
+
+
+async def rebuild_accuracy_rollup(db: AsyncSession) -> int:
+    """
+    decision_records에서 rollup 전체 재생성 (초기 백필/정합성 복구용, 커밋 포함)
+
+    Returns:
+        생성된 rollup 행 수
+    """
+    Model = DecisionRecordModel
+    day = func.date(Model.created_at)
+    query = select(
+        day,
+        Model.prompt_version,
+        Model.symbol,
+        Model.decision,
+        func.count(Model.id),
+        func.count(Model.id).filter(Model.is_profitable.is_(True)),
+        func.sum(Model.pnl_percent),
+    ).where(Model.is_profitable.isnot(None)).group_by(
+        day, Model.prompt_version, Model.symbol, Model.decision
+    )
+
+    rows = (await db.execute(query)).all()
+    await db.execute(delete(DecisionAccuracyStat))
+    now = datetime.utcnow()
+    for day_value, prompt_version, symbol, decision, total, correct, pnl_sum in rows:
+        if isinstance(day_value, str):
+            day_value = date.fromisoformat(day_value)
+        db.add(DecisionAccuracyStat(
+            day=day_value, prompt_version=prompt_version, symbol=symbol, decision=decision,
+            total=total, correct=correct or 0, pnl_sum=pnl_sum or Decimal("0"), updated_at=now,
+        ))
+    await db.commit()
+    logger.info(f"AI 판단 정확도 일별 집계 재생성 완료: {len(rows)}행")
+    return len(rows)
+
+
+async def ensure_accuracy_rollup(db: AsyncSession) -> None:
+    """rollup이 비어 있고 PnL 연동된 기록이 있으면 백필 (기존 배포 최초 1회)"""
+    has_rollup = (await db.execute(select(DecisionAccuracyStat.id).limit(1))).first() is not None
+    if has_rollup:
+        return
+    has_linked = (await db.execute(
+        select(DecisionRecordModel.id).where(DecisionRecordModel.is_profitable.isnot(None)).limit(1)
+    )).first() is not None
+    if has_linked:
+        await rebuild_accuracy_rollup(db)
+
+
+# ============================================================================
+# 조회
+# ============================================================================
+
+async def get_accuracy_summary(
+    db: AsyncSession,
+    prompt_version: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    정확도 요약 (accuracy/total/correct)
+
+    온전한 날짜는 rollup에서, start_date가 자정이 아니면
+    시작일의 부분 구간만 decision_records에서 합산합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        prompt_version: 프롬프트 버전 필터
+        start_date: 시작 시각 필터
+
+    Returns:
+        {"accuracy", "total", "correct"}
+    """
+    conditions = []
+    if prompt_version:
+        conditions.append(DecisionAccuracyStat.prompt_version == prompt_version)
+
+    total = 0
+    correct = 0
+    if start_date is not None:
+        first_full_day = start_date.date()
+        if start_date.time() != time.min:
+            first_full_day += timedelta(days=1)
+            Model = DecisionRecordModel
+            raw_conditions = [
+                Model.is_profitable.isnot(None),
+                Model.created_at >= start_date,
+                Model.created_at < datetime.combine(first_full_day, time.min),
+            ]
+            if prompt_version:
+                raw_conditions.append(Model.prompt_version == prompt_version)
+            raw_total, raw_correct = (await db.execute(
+                select(
+                    func.count(Model.id),
+                    func.count(Model.id).filter(Model.is_profitable.is_(True)),
+                ).where(and_(*raw_conditions))
+            )).one()
+            total += int(raw_total or 0)
+            correct += int(raw_correct or 0)
+        conditions.append(DecisionAccuracyStat.day >= first_full_day)
+
+    query = select(
+        func.sum(DecisionAccuracyStat.total),
+        func.sum(DecisionAccuracyStat.correct),
+    )
+    if conditions:
+        query = query.where(and_(*conditions))
+    rollup_total, rollup_correct = (await db.execute(query)).one()
+    total += int(rollup_total or 0)
+    correct += int(rollup_correct or 0)
+
+    return {
+        "accuracy": correct / total if total > 0 else 0.0,
+        "total": total,
+        "correct": correct,
+    }
+
+
+async def get_accuracy_breakdown(
+    db: AsyncSession,
+    start_day: Optional[date] = None,
+    end_day: Optional[date] = None,
+    prompt_versions: Optional[Sequence[str]] = None,
+    symbols: Optional[Sequence[str]] = None,
+    decisions: Optional[Sequence[str]] = None,
+    group_by: Sequence[str] = BREAKDOWN_DIMENSIONS,
+    z: float = DEFAULT_Z,
+) -> List[Dict[str, Any]]:
+    """
+    정확도 분석 매트릭스 (rollup 단일 GROUP BY 쿼리)
+
+    Args:
+        db: 데이터베이스 세션
+        start_day: 시작일 (포함)
+        end_day: 종료일 (포함)
+        prompt_versions: 프롬프트 버전 필터
+        symbols: 심볼 필터
+        decisions: 판단 필터 (ALLOW/BLOCK/HOLD)
+        group_by: 분석 차원 (BREAKDOWN_DIMENSIONS 부분집합, 빈 값이면 전체 합계 1행)
+        z: 신뢰구간 z 값
+
+    Returns:
+        [{<차원>..., total, correct, accuracy, ci_low, ci_high, avg_pnl_percent}]
+        (차원 순서대로 정렬)
+
+    Raises:
+        ValueError: 지원하지 않는 차원
+    """
+    unknown = [dimension for dimension in group_by if dimension not in BREAKDOWN_DIMENSIONS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 분석 차원: {unknown}")
+
+    conditions = []
+    if start_day is not None:
+        conditions.append(DecisionAccuracyStat.day >= start_day)
+    if end_day is not None:
+        conditions.append(DecisionAccuracyStat.day <= end_day)
+    if prompt_versions:
+        conditions.append(DecisionAccuracyStat.prompt_version.in_(list(prompt_versions)))
+    if symbols:
+        conditions.append(DecisionAccuracyStat.symbol.in_(list(symbols)))
+    if decisions:
+        conditions.append(DecisionAccuracyStat.decision.in_([d.upper() for d in decisions]))
+
+    columns = [getattr(DecisionAccuracyStat, dimension) for dimension in group_by]
+    query = select(
+        *columns,
+        func.sum(DecisionAccuracyStat.total),
+        func.sum(DecisionAccuracyStat.correct),
+        func.sum(DecisionAccuracyStat.pnl_sum),
+    )
+    if conditions:
+        query = query.where(and_(*conditions))
+    if columns:
+        query = query.group_by(*columns).order_by(*columns)
+
+    breakdown = []
+    for row in (await db.execute(query)).all():
+        keys = row[:len(columns)]
+        total, correct, pnl_sum = row[len(columns):]
+        total = int(total or 0)
+        if total <= 0:
+            continue
+        correct = int(correct or 0)
+        ci_low, ci_high = wilson_interval(correct, total, z)
+        item = dict(zip(group_by, keys))
+        if isinstance(item.get("day"), str):
+            item["day"] = date.fromisoformat(item["day"])
+        item.update({
+            "total": total,
+            "correct": correct,
+            "accuracy": correct / total,
+            "ci_low": ci_low,
+            "ci_high": ci_high,
+            "avg_pnl_percent": float(pnl_sum or 0) / total,
+        })
+        breakdown.append(item)
+    return breakdown
@@ -60,6 +60,108 @@ ai_confidence = Histogram(
     ['symbol', 'decision']
 )
 
+# AI API 호출 메트릭
+ai_request_duration_seconds = Histogram(
+    'ai_request_duration_seconds',
+    'AI API request latency in seconds',
+    ['model', 'call_type', 'outcome'],
+    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+)
+
+ai_tokens_total = Counter(
+    'ai_tokens_total',
+    'Total AI tokens used',
+    ['model', 'kind']
+)
+
+ai_request_retries_total = Counter(
+    'ai_request_retries_total',
+    'Total AI API request retries',
+    ['model', 'reason']
+)
+
+ai_prompt_tokens = Histogram(
+    'ai_prompt_tokens',
+    'AI prompt tokens per section (after budget)',
+    ['prompt', 'section'],
+    buckets=(10, 25, 50, 100, 200, 400, 800, 1600, 3200)
+)
+
+# AI 결정 캐시 메트릭
+ai_decision_cache_requests_total = Counter(
+    'ai_decision_cache_requests_total',
+    'Total AI decision cache lookups',
+    ['result']  # hit_memory, hit_store, miss
+)
+
+ai_decision_cache_hit_rate = Gauge(
+    'ai_decision_cache_hit_rate',
+    'AI decision cache hit rate (0.0 - 1.0)'
+)
+
+# 영속성 write-behind 메트릭
+persistence_queue_depth = Gauge(
+    'persistence_write_queue_depth',
+    'Rows waiting in the persistence write-behind queue'
+)
+
+persistence_flush_duration_seconds = Histogram(
+    'persistence_flush_duration_seconds',
+    'Persistence batch INSERT latency',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+persistence_flush_batch_size = Histogram(
+    'persistence_flush_batch_size',
+    'Rows per persistence batch INSERT',
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000)
+)
+
+persistence_dropped_rows_total = Counter(
+    'persistence_dropped_rows_total',
+    'Write-behind rows dropped after exhausting retries',
+    ['table']
+)
+
+# 알림 전송 큐 메트릭
+notification_queue_depth = Gauge(
+    'notification_queue_depth',
+    'Messages waiting in the Telegram notification queue'
+)
+
+notification_messages_total = Counter(
+    'notification_messages_total',
+    'Telegram notification dispatcher events',
+    ['result']
+)
+
+# 락 lease 메트릭
+lock_wait_seconds = Histogram(
+    'lock_wait_seconds',
+    'Time spent waiting to acquire a lock lease',
+    ['lock_name', 'outcome'],
+    buckets=(0.01, 0.1, 0.5, 1, 5, 15, 30, 60, 120, 300)
+)
+
+lock_hold_seconds = Histogram(
+    'lock_hold_seconds',
+    'Time a lock lease was held',
+    ['lock_name'],
+    buckets=(0.1, 1, 5, 15, 30, 60, 120, 300, 600)
+)
+
+# 거래 사이클 조율 메트릭 (스케줄러 ↔ 텔레그램 봇)
+trading_cycle_requests_total = Counter(
+    'trading_cycle_requests_total',
+    'Trading cycle requests by outcome (executed, attached, reused, busy)',
+    ['owner', 'outcome']
+)
+
+trading_cycle_duplicate_ratio = Gauge(
+    'trading_cycle_duplicate_ratio',
+    'Share of executed trading cycles that repeated an already executed candle (24h)'
+)
+
 # 포트폴리오 메트릭
 portfolio_value_krw = Gauge(
     'portfolio_value_krw',
@@ -116,6 +218,82 @@ def record_ai_decision(symbol: str, decision: str, confidence: float):
     ai_confidence.labels(symbol=symbol, decision=decision).observe(confidence)
 
 
+def record_ai_request(
+    model: str,
+    call_type: str,
+    outcome: str,
+    duration: float,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0
+):
+    """AI API 호출 메트릭 기록 (지연 시간 + 토큰 사용량)"""
+    ai_request_duration_seconds.labels(model=model, call_type=call_type, outcome=outcome).observe(duration)
+    if prompt_tokens:
+        ai_tokens_total.labels(model=model, kind='prompt').inc(prompt_tokens)
+    if completion_tokens:
+        ai_tokens_total.labels(model=model, kind='completion').inc(completion_tokens)
+
+
+def record_ai_retry(model: str, reason: str):
+    """AI API 재시도 메트릭 기록"""
+    ai_request_retries_total.labels(model=model, reason=reason).inc()
+
+
+def record_prompt_tokens(prompt_name: str, total_tokens: int, section_tokens: dict):
+    """프롬프트 섹션별 토큰 수 기록"""
+    ai_prompt_tokens.labels(prompt=prompt_name, section='_total').observe(total_tokens)
+    for section, tokens in section_tokens.items():
+        ai_prompt_tokens.labels(prompt=prompt_name, section=section).observe(tokens)
+
+
+def record_ai_decision_cache(result: str, hit_rate: float):
+    """AI 결정 캐시 조회 메트릭 기록"""
+    ai_decision_cache_requests_total.labels(result=result).inc()
+    ai_decision_cache_hit_rate.set(hit_rate)
+
+
+def record_persistence_queue_depth(depth: int):
+    """영속성 write-behind 큐 길이 기록"""
+    persistence_queue_depth.set(depth)
+
+
+def record_persistence_flush(batch_size: int, duration: float):
+    """영속성 배치 INSERT 크기/지연 시간 기록"""
+    persistence_flush_batch_size.observe(batch_size)
+    persistence_flush_duration_seconds.observe(duration)
+
+
+def record_persistence_dropped(table: str, count: int = 1):
+    """재시도 후에도 기록하지 못하고 폐기된 write-behind 행 수 기록"""
+    persistence_dropped_rows_total.labels(table=table).inc(count)
+
+
+def record_notification_queue_depth(depth: int):
+    """알림 전송 큐 길이 기록"""
+    notification_queue_depth.set(depth)
+
+
+def record_notification_message(result: str, count: int = 1):
+    """알림 전송 결과 기록 (sent, coalesced, retried, failed, dropped)"""
+    notification_messages_total.labels(result=result).inc(count)
+
+
+def record_cycle_request(owner: str, outcome: str, duplicate_ratio: float):
+    """거래 사이클 요청 결과와 중복 실행 비율 기록"""
+    trading_cycle_requests_total.labels(owner=owner, outcome=outcome).inc()
+    trading_cycle_duplicate_ratio.set(duplicate_ratio)
+
+
+def record_lock_wait(lock_name: str, outcome: str, seconds: float):
+    """락 대기 시간 기록 (acquired, timeout)"""
+    lock_wait_seconds.labels(lock_name=lock_name, outcome=outcome).observe(seconds)
+
+
+def record_lock_hold(lock_name: str, seconds: float):
+    """락 보유 시간 기록"""
+    lock_hold_seconds.labels(lock_name=lock_name).observe(seconds)
+
+
 def record_portfolio_value(value_krw: float, profit_rate: float):
     """포트폴리오 메트릭 기록"""
     portfolio_value_krw.set(value_krw)
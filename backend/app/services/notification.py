@@ -10,6 +10,10 @@ from datetime import datetime
 from decimal import Decimal
 
 from backend.app.core.config import settings
+from backend.app.services.notification_dispatcher import (
+    NotificationDispatcher,
+    NotificationRejected,
+)
 from src.scanner.sector_mapping import get_coin_sector, get_sector_korean_name
 
 logger = logging.getLogger(__name__)
@@ -38,9 +42,21 @@ def escape_html(text: str) -> str:
 
 
 class TelegramNotifier:
-    """Telegram 봇을 통한 알림 전송"""
+    """
+    Telegram 봇을 통한 알림 전송
+
+    TELEGRAM_ASYNC_DISPATCH가 켜져 있으면 send_message()는 메시지를
+    NotificationDispatcher 큐에 넣고 즉시 반환하며, 실제 전송(병합/분할/속도 제한/재시도)은
+    백그라운드 작업이 수행합니다.
+    """
     
-    def __init__(self):
+    def __init__(self, dispatcher: Optional[NotificationDispatcher] = None):
+        """
+        초기화
+
+        Args:
+            dispatcher: 알림 전송 큐 (None이면 설정값으로 생성)
+        """
         self.enabled = settings.TELEGRAM_ENABLED
         self.bot_token = settings.TELEGRAM_BOT_TOKEN
         self.chat_id = settings.TELEGRAM_CHAT_ID
@@ -49,7 +65,11 @@ class TelegramNotifier:
         if self.enabled:
             try:
                 from telegram import Bot
-                self._bot = Bot(token=self.bot_token)
+                base_url = getattr(settings, "TELEGRAM_API_BASE_URL", None)
+                if base_url:
+                    self._bot = Bot(token=self.bot_token, base_url=base_url)
+                else:
+                    self._bot = Bot(token=self.bot_token)
                 logger.info("✅ Telegram 봇 초기화 완료")
             except ImportError:
                 logger.error("python-telegram-bot 라이브러리가 설치되지 않았습니다.")
@@ -57,6 +77,16 @@ class TelegramNotifier:
             except Exception as e:
                 logger.error(f"Telegram 봇 초기화 실패: {e}")
                 self.enabled = False
+
+        self._dispatcher = dispatcher
+        if self._dispatcher is None and getattr(settings, "TELEGRAM_ASYNC_DISPATCH", False) is True:
+            self._dispatcher = NotificationDispatcher(
+                send=self._deliver,
+                coalesce_window=settings.TELEGRAM_COALESCE_WINDOW,
+                min_interval=settings.TELEGRAM_MIN_INTERVAL,
+                max_queue_size=settings.TELEGRAM_QUEUE_SIZE,
+                max_attempts=settings.TELEGRAM_MAX_ATTEMPTS,
+            )
     
     async def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
         """
@@ -67,24 +97,64 @@ class TelegramNotifier:
             parse_mode: 파싱 모드 (HTML, Markdown)
         
         Returns:
-            bool: 전송 성공 여부
+            bool: 전송 성공 여부 (큐 사용 시 큐 추가 여부)
         """
         if not self.enabled or not self._bot:
             logger.debug(f"Telegram 알림 비활성화: {message}")
             return False
+
+        if self._dispatcher is not None:
+            return self._dispatcher.enqueue(self.chat_id, message, parse_mode)
         
         try:
-            await self._bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=parse_mode,
-            )
+            await self._deliver(self.chat_id, message, parse_mode)
             logger.info("✅ Telegram 메시지 전송 성공")
             return True
         except Exception as e:
             logger.error(f"Telegram 메시지 전송 실패: {e}")
             return False
 
+    async def _deliver(self, chat_id: str, text: str, parse_mode: Optional[str]) -> None:
+        """
+        Bot API 직접 전송 (실패 시 예외)
+
+        재시도해도 소용없는 오류(잘못된 요청, 차단 등)는 NotificationRejected로 변환합니다.
+        """
+        try:
+            from telegram.error import BadRequest, Forbidden
+        except ImportError:  # pragma: no cover - 라이브러리 없으면 봇도 없음
+            BadRequest = Forbidden = ()
+
+        try:
+            await self._bot.send_message(chat_id=chat_id, text=text, parse_mode=parse_mode)
+        except (BadRequest, Forbidden) as e:
+            raise NotificationRejected(str(e)) from e
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        큐에 남은 알림 전송 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 모두 전송(또는 실패 처리)되었는지 여부
+        """
+        if self._dispatcher is None:
+            return True
+        return await self._dispatcher.flush(timeout)
+
+    async def aclose(self, timeout: Optional[float] = 10.0) -> None:
+        """남은 알림 전송 후 백그라운드 작업 종료"""
+        if self._dispatcher is not None:
+            await self._dispatcher.aclose(timeout)
+
+    def get_queue_stats(self) -> dict:
+        """알림 큐 통계 (큐 미사용 시 빈 dict)"""
+        if self._dispatcher is None:
+            return {}
+        return self._dispatcher.get_stats()
+
     def _get_filter_table_data(self, metrics: dict, filter_results: dict) -> list:
         """
         필터 테이블 데이터 생성
@@ -720,13 +790,21 @@ class TelegramNotifier:
         # Trading Pass 통과 수 (없으면 백테스트 통과 수 사용)
         trading_pass_count = scan_summary.get('trading_pass_passed', scan_summary.get('backtest_passed', 0))
 
+        # 2단 스캔 1단계 (전체 마켓 사전 필터) 요약
+        tier1 = (scan_summary.get('tier_stats') or {}).get('tier1')
+        prefilter_line = (
+            f"🌐 <b>전체 마켓 필터:</b> {tier1.get('universe', 0)}개 → {tier1.get('survivors', 0)}개 "
+            f"({tier1.get('seconds', 0):.1f}초)\n"
+            if tier1 else ""
+        )
+
         message = f"""
 🔍 <b>멀티코인 스캔 결과</b>
 
 ━━━━━━━━━━━━━━━━━━━━
 <b>📊 스캔 요약</b>
 ━━━━━━━━━━━━━━━━━━━━
-📈 <b>유동성 스캔:</b> {scan_summary.get('liquidity_scanned', 0)}개 코인
+{prefilter_line}📈 <b>유동성 스캔:</b> {scan_summary.get('liquidity_scanned', 0)}개 코인
 🔬 <b>백테스팅 통과:</b> {scan_summary.get('backtest_passed', 0)}개 코인
 🔐 <b>Trading Pass:</b> {trading_pass_count}개 코인
 ✅ <b>최종 선택:</b> {scan_summary.get('selected', 0)}개 코인
@@ -898,6 +976,11 @@ async def notify_bot_status(*args, **kwargs) -> bool:
     return await notifier.notify_bot_status(*args, **kwargs)
 
 
+async def close_notifier(timeout: float = 10.0) -> None:
+    """알림 큐 종료 (남은 알림 전송 후) - 프로세스 종료 전에 이벤트 루프 안에서 호출"""
+    await notifier.aclose(timeout)
+
+
 async def send_telegram_message(message: str, parse_mode: str = "HTML") -> bool:
     """텔레그램 메시지 직접 전송 (전역 함수)"""
     return await notifier.send_message(message, parse_mode)
@@ -0,0 +1,378 @@
+"""
+알림 전송 디스패처
+
+TelegramNotifier의 메시지를 프로세스 내 큐에 넣고 백그라운드 작업이 전송합니다.
+호출자(trading_job 등)는 큐에 넣은 즉시 반환하므로 Telegram API 지연이
+트레이딩 사이클 시간에 더해지지 않습니다.
+
+- 병합: 같은 채팅으로 coalesce_window 안에 들어온 메시지는 4096자 이내에서 한 메시지로 합침
+- 분할: 4096자를 넘는 메시지는 줄 단위로 나눠 전송
+- 속도 제한: 채팅별 최소 전송 간격 (Telegram 권장: 채팅당 초당 1건)
+- 재시도: 429(RetryAfter)는 서버가 알려준 시간만큼, 그 외 오류는 지수 백오프 후 재시도
+- 큐가 가득 차면 가장 오래된 메시지를 버림 (알림은 최신 상태가 더 중요)
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Telegram sendMessage 텍스트 최대 길이
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+# (chat_id, text, parse_mode) -> awaitable
+SendFunc = Callable[[str, str, Optional[str]], Awaitable[Any]]
+
+
+class NotificationRejected(Exception):
+    """재시도해도 성공할 수 없는 전송 실패 (잘못된 요청, 권한 없음 등)"""
+
+
+@dataclass
+class _OutboundMessage:
+    """전송 대기 메시지"""
+    chat_id: str
+    text: str
+    parse_mode: Optional[str]
+    enqueued_at: float
+
+
+def split_message(text: str, limit: int = TELEGRAM_MAX_MESSAGE_LENGTH) -> List[str]:
+    """
+    메시지를 limit 이하 조각으로 분할 (줄 경계 우선, 긴 줄은 강제 분할)
+
+    Args:
+        text: 원본 메시지
+        limit: 조각 최대 길이
+
+    Returns:
+        분할된 메시지 목록
+    """
+    if len(text) <= limit:
+        return [text]
+
+    parts: List[str] = []
+    current = ""
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(line[:limit])
+            line = line[limit:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) <= limit:
+            current = candidate
+        else:
+            parts.append(current)
+            current = line
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """429 응답(RetryAfter)의 대기 시간 (해당 없으면 None)"""
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is None:
+        return None
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class NotificationDispatcher:
+    """
+    큐 기반 알림 전송기
+
+    큐는 처음 사용한 이벤트 루프에 묶이며, 루프가 바뀌면(새 asyncio.run)
+    백그라운드 작업을 다시 만들고 대기 중인 메시지는 유지합니다.
+    """
+
+    def __init__(
+        self,
+        send: SendFunc,
+        coalesce_window: float = 1.0,
+        min_interval: float = 1.0,
+        max_queue_size: int = 1000,
+        max_attempts: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        separator: str = "\n\n",
+    ):
+        """
+        초기화
+
+        Args:
+            send: 실제 전송 함수 (실패 시 예외)
+            coalesce_window: 병합 대기 시간 (초, 첫 메시지 기준)
+            min_interval: 채팅별 최소 전송 간격 (초)
+            max_queue_size: 큐 최대 길이 (초과 시 가장 오래된 메시지 폐기)
+            max_attempts: 메시지당 전송 시도 횟수
+            backoff_base: 재시도 대기 기본값 (초, 시도마다 2배)
+            backoff_max: 재시도 대기 최대값 (초)
+            separator: 병합 메시지 구분자
+        """
+        self._send = send
+        self.coalesce_window = max(0.0, coalesce_window)
+        self.min_interval = max(0.0, min_interval)
+        self.max_queue_size = max(1, max_queue_size)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.separator = separator
+
+        self._pending: Deque[_OutboundMessage] = deque()
+        self._last_sent: Dict[str, float] = {}
+        self._in_flight = 0
+        self._flushing = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+
+        self._stats = {
+            "enqueued": 0,
+            "sent": 0,
+            "coalesced": 0,
+            "split": 0,
+            "retries": 0,
+            "failed": 0,
+            "dropped": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    @property
+    def depth(self) -> int:
+        """전송 대기 메시지 수"""
+        return len(self._pending)
+
+    def enqueue(self, chat_id: str, text: str, parse_mode: Optional[str] = "HTML") -> bool:
+        """
+        메시지를 큐에 추가 (즉시 반환)
+
+        Args:
+            chat_id: 대상 채팅 ID
+            text: 메시지
+            parse_mode: 파싱 모드 (HTML, Markdown, None)
+
+        Returns:
+            bool: 큐 추가 여부 (빈 메시지는 False)
+        """
+        if not text:
+            return False
+        if len(self._pending) >= self.max_queue_size:
+            dropped = self._pending.popleft()
+            self._stats["dropped"] += 1
+            self._export("dropped")
+            logger.warning(f"알림 큐 가득 참 - 가장 오래된 메시지 폐기 ({len(dropped.text)}자)")
+
+        self._pending.append(_OutboundMessage(
+            chat_id=str(chat_id), text=text, parse_mode=parse_mode, enqueued_at=time.monotonic(),
+        ))
+        self._stats["enqueued"] += 1
+        self._export_depth()
+
+        try:
+            self._ensure_worker()
+        except RuntimeError:
+            # 실행 중인 이벤트 루프 없음 → 다음 enqueue/flush에서 시작
+            return True
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 메시지를 모두 전송할 때까지 대기 (병합 대기 없이)
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            bool: 큐가 모두 비워졌는지 여부
+        """
+        if not self._pending and self._in_flight == 0:
+            return True
+        self._ensure_worker()
+        self._flushing = True
+        self._idle.clear()
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._flushing = False
+
+    async def aclose(self, timeout: Optional[float] = 10.0) -> None:
+        """남은 메시지를 전송(최대 timeout초)하고 백그라운드 작업 종료"""
+        try:
+            if not await self.flush(timeout):
+                logger.warning(f"알림 큐 종료 시 미전송 메시지 {self.depth}건")
+        finally:
+            if self._task is not None and not self._task.done():
+                self._task.cancel()
+                try:
+                    await self._task
+                except (asyncio.CancelledError, Exception):
+                    pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 통계"""
+        stats = dict(self._stats)
+        stats["depth"] = self.depth
+        stats["in_flight"] = self._in_flight
+        return stats
+
+    # ------------------------------------------------------------------
+    # 백그라운드 전송
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        """백그라운드 전송 작업 시작 (새 이벤트 루프면 재시작)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._task = loop.create_task(self._run(), name="telegram-notification-dispatcher")
+
+    async def _run(self) -> None:
+        """큐가 빌 때까지 병합 → 속도 제한 → 전송 반복"""
+        while True:
+            if not self._pending:
+                self._idle.set()
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            # 병합 대기: 첫 메시지 도착 후 coalesce_window 동안 같은 채팅 메시지를 모음
+            if not self._flushing:
+                remaining = self._pending[0].enqueued_at + self.coalesce_window - time.monotonic()
+                if remaining > 0:
+                    try:
+                        await asyncio.wait_for(self._wait_for_flush(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        pass
+
+            batch = self._take_batch()
+            if not batch:
+                continue
+            self._in_flight = len(batch)
+            try:
+                await self._deliver(batch)
+            except Exception as e:
+                # 예상하지 못한 오류에도 작업은 유지
+                logger.error(f"알림 전송 작업 오류: {e}")
+            finally:
+                self._in_flight = 0
+                self._export_depth()
+
+    async def _wait_for_flush(self) -> None:
+        """flush 요청이 올 때까지 대기 (병합 대기 조기 종료용)"""
+        while not self._flushing:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    def _take_batch(self) -> List[_OutboundMessage]:
+        """
+        큐 앞에서부터 같은 채팅/파싱 모드의 연속 메시지를 4096자 이내로 꺼냄
+
+        4096자를 넘는 단일 메시지는 단독으로 꺼내 전송 시 분할합니다.
+        """
+        if not self._pending:
+            return []
+        first = self._pending.popleft()
+        batch = [first]
+        length = len(first.text)
+        while self._pending:
+            candidate = self._pending[0]
+            if candidate.chat_id != first.chat_id or candidate.parse_mode != first.parse_mode:
+                break
+            combined = length + len(self.separator) + len(candidate.text)
+            if combined > TELEGRAM_MAX_MESSAGE_LENGTH:
+                break
+            batch.append(self._pending.popleft())
+            length = combined
+        return batch
+
+    async def _deliver(self, batch: List[_OutboundMessage]) -> None:
+        """병합/분할 후 속도 제한을 지켜 전송"""
+        first = batch[0]
+        text = self.separator.join(message.text for message in batch)
+        if len(batch) > 1:
+            self._stats["coalesced"] += len(batch) - 1
+            self._export("coalesced", len(batch) - 1)
+
+        parts = split_message(text)
+        if len(parts) > 1:
+            self._stats["split"] += len(parts) - 1
+        for part in parts:
+            await self._send_with_retry(first.chat_id, part, first.parse_mode)
+
+    async def _send_with_retry(self, chat_id: str, text: str, parse_mode: Optional[str]) -> bool:
+        """채팅별 최소 간격 + 재시도 전송"""
+        for attempt in range(1, self.max_attempts + 1):
+            await self._respect_rate_limit(chat_id)
+            try:
+                await self._send(chat_id, text, parse_mode)
+                self._last_sent[chat_id] = time.monotonic()
+                self._stats["sent"] += 1
+                self._export("sent")
+                return True
+            except NotificationRejected as e:
+                logger.error(f"Telegram 메시지 전송 거부 (재시도 안 함): {e}")
+                break
+            except Exception as e:
+                self._last_sent[chat_id] = time.monotonic()
+                if attempt >= self.max_attempts:
+                    logger.error(f"Telegram 메시지 전송 실패 ({attempt}회 시도): {e}")
+                    break
+                delay = _retry_after_seconds(e)
+                if delay is None:
+                    delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+                self._stats["retries"] += 1
+                self._export("retried")
+                logger.warning(f"Telegram 메시지 전송 재시도 {attempt}/{self.max_attempts - 1} ({delay:.1f}초 후): {e}")
+                await asyncio.sleep(delay)
+
+        self._stats["failed"] += 1
+        self._export("failed")
+        return False
+
+    async def _respect_rate_limit(self, chat_id: str) -> None:
+        last_sent = self._last_sent.get(chat_id)
+        if last_sent is None:
+            return
+        wait = last_sent + self.min_interval - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    # ------------------------------------------------------------------
+    # 메트릭
+    # ------------------------------------------------------------------
+
+    def _export_depth(self) -> None:
+        try:
+            from backend.app.services.metrics import record_notification_queue_depth
+            record_notification_queue_depth(self.depth)
+        except Exception:
+            pass
+
+    def _export(self, result: str, count: int = 1) -> None:
+        try:
+            from backend.app.services.metrics import record_notification_message
+            record_notification_message(result, count)
+        except Exception:
+            pass
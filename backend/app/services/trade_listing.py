@@ -0,0 +1,248 @@
+"""
+거래 목록 조회 서비스
+
+GET /trades 의 페이지네이션/카운트와 대량 내보내기를 담당합니다.
+
+- keyset(커서) 페이지네이션: (created_at, id) 내림차순 기준으로 마지막 행 다음부터 조회
+  → OFFSET 처럼 앞 페이지를 건너뛰며 읽지 않으므로 페이지 깊이와 무관하게 일정
+  (ix_trades_symbol_created_at / ix_trades_created_at 인덱스 사용)
+- 전체 건수: exact(count(*)) / estimated(플래너 추정치) / none(생략) 중 선택
+- 내보내기: 서버 측 커서로 배치 단위 스트리밍 (전체 행을 메모리에 올리지 않음)
+"""
+import base64
+import csv
+import io
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from sqlalchemy import and_, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.trade import Trade
+
+logger = logging.getLogger(__name__)
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATED = "estimated"
+COUNT_NONE = "none"
+
+EXPORT_COLUMNS = [
+    "id", "trade_id", "symbol", "side", "price", "amount",
+    "total", "fee", "status", "created_at", "updated_at",
+]
+EXPORT_BATCH_SIZE = 1000
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 페이지 커서"""
+
+
+@dataclass
+class TradeFilter:
+    """거래 목록 필터"""
+    symbol: Optional[str] = None
+    side: Optional[str] = None
+    status: Optional[str] = None
+    from_date: Optional[datetime] = None
+    to_date: Optional[datetime] = None
+
+    def conditions(self) -> List[Any]:
+        conditions = []
+        if self.symbol:
+            conditions.append(Trade.symbol == self.symbol)
+        if self.side:
+            conditions.append(Trade.side == self.side)
+        if self.status:
+            conditions.append(Trade.status == self.status)
+        if self.from_date:
+            conditions.append(Trade.created_at >= self.from_date)
+        if self.to_date:
+            conditions.append(Trade.created_at <= self.to_date)
+        return conditions
+
+    def apply(self, query):
+        conditions = self.conditions()
+        return query.where(and_(*conditions)) if conditions else query
+
+
+# ============================================================================
+# 커서
+# ============================================================================
+
+def encode_cursor(created_at: datetime, trade_pk: int) -> str:
+    """(created_at, id) → 불투명 커서 문자열"""
+    raw = f"{created_at.isoformat()}|{trade_pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열 → (created_at, id)
+
+    Raises:
+        InvalidCursorError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, trade_pk = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), int(trade_pk)
+    except Exception as e:
+        raise InvalidCursorError(f"잘못된 커서: {cursor}") from e
+
+
+# ============================================================================
+# 목록 / 카운트
+# ============================================================================
+
+def _ordered(query):
+    return query.order_by(Trade.created_at.desc(), Trade.id.desc())
+
+
+async def list_trades_page(
+    db: AsyncSession,
+    filters: TradeFilter,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+) -> Tuple[List[Trade], Optional[str]]:
+    """
+    거래 한 페이지 조회
+
+    cursor가 있으면 keyset, 없으면 skip(OFFSET) 방식으로 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        filters: 필터
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor
+        skip: 오프셋 (cursor 미사용 시)
+
+    Returns:
+        (거래 목록, 다음 페이지 커서 또는 None)
+    """
+    query = filters.apply(select(Trade))
+    if cursor:
+        created_at, trade_pk = decode_cursor(cursor)
+        query = query.where(tuple_(Trade.created_at, Trade.id) < tuple_(created_at, trade_pk))
+    query = _ordered(query)
+    if not cursor and skip:
+        query = query.offset(skip)
+
+    # 다음 페이지 존재 여부 확인용으로 1행 더 조회
+    trades = list((await db.execute(query.limit(limit + 1))).scalars().all())
+    next_cursor = None
+    if len(trades) > limit:
+        trades = trades[:limit]
+        last = trades[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return trades, next_cursor
+
+
+def _dialect_name(db: AsyncSession) -> Optional[str]:
+    try:
+        return db.get_bind().dialect.name
+    except Exception:
+        return None
+
+
+async def _estimate_count(db: AsyncSession, filters: TradeFilter) -> Optional[int]:
+    """PostgreSQL 플래너 추정 행 수 (다른 DB는 None)"""
+    if _dialect_name(db) != "postgresql":
+        return None
+
+    query = filters.apply(select(Trade.id))
+    compiled = query.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    try:
+        plan = (await db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.warning(f"거래 수 추정 실패, 정확한 카운트로 대체: {e}")
+        return None
+
+
+async def count_trades(
+    db: AsyncSession,
+    filters: TradeFilter,
+    mode: str = COUNT_EXACT,
+) -> Tuple[Optional[int], bool]:
+    """
+    필터에 해당하는 거래 수
+
+    Args:
+        db: 데이터베이스 세션
+        filters: 필터
+        mode: exact / estimated / none
+
+    Returns:
+        (건수 또는 None, 추정치 여부)
+    """
+    if mode == COUNT_NONE:
+        return None, False
+    if mode == COUNT_ESTIMATED:
+        estimate = await _estimate_count(db, filters)
+        if estimate is not None:
+            return estimate, True
+
+    total = (await db.execute(filters.apply(select(func.count(Trade.id))))).scalar()
+    return total or 0, False
+
+
+# ============================================================================
+# 내보내기
+# ============================================================================
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _export_row(trade: Trade) -> dict:
+    return {column: _export_value(getattr(trade, column)) for column in EXPORT_COLUMNS}
+
+
+async def _stream_trades(
+    db: AsyncSession,
+    filters: TradeFilter,
+    batch_size: int,
+) -> AsyncIterator[List[Trade]]:
+    query = _ordered(filters.apply(select(Trade))).execution_options(yield_per=batch_size)
+    result = await db.stream(query)
+    async for partition in result.scalars().partitions(batch_size):
+        yield partition
+
+
+async def export_trades_ndjson(
+    db: AsyncSession,
+    filters: TradeFilter,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[str]:
+    """거래를 NDJSON(한 줄에 JSON 1건)으로 배치 단위 스트리밍"""
+    async for batch in _stream_trades(db, filters, batch_size):
+        yield "".join(json.dumps(_export_row(trade), ensure_ascii=False) + "\n" for trade in batch)
+
+
+async def export_trades_csv(
+    db: AsyncSession,
+    filters: TradeFilter,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[str]:
+    """거래를 CSV(헤더 포함)로 배치 단위 스트리밍"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    async for batch in _stream_trades(db, filters, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_export_row(trade) for trade in batch)
+        yield buffer.getvalue()
@@ -0,0 +1,327 @@
+"""
+거래 통계 서비스
+
+/trades/statistics/summary 집계를 담당합니다.
+
+- 짧은 기간: trades 테이블을 조건부 집계(CASE) 단일 쿼리로 한 번만 스캔
+- 긴 기간: 온전한 날짜 구간은 trade_daily_stats(일별 rollup)에서,
+  시작일/오늘의 부분 구간만 trades 단일 스캔으로 합산
+  → 응답 시간이 trades 테이블 크기가 아닌 기간(일수)에만 비례
+
+rollup은 completed 거래 INSERT 시 같은 트랜잭션에서 apply_trade_rollup()으로
+증분 갱신합니다. 기존 데이터는 rebuild_trade_rollup()으로 한 번 채웁니다.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.trade import Trade
+from backend.app.models.trade_daily_stat import TradeDailyStat
+
+logger = logging.getLogger(__name__)
+
+# 이 일수 이상 조회는 rollup 경로 사용 (그 미만은 단일 스캔으로 충분)
+ROLLUP_MIN_DAYS = 7
+
+ROLLUP_STATUS = "completed"
+
+
+@dataclass
+class _StatisticsAccumulator:
+    """부분 집계(raw 스캔 / rollup) 합산기"""
+    total_trades: int = 0
+    total_volume: Decimal = Decimal("0")
+    total_fee: Decimal = Decimal("0")
+    buy_count: int = 0
+    buy_price_sum: Decimal = Decimal("0")
+    sell_count: int = 0
+    sell_price_sum: Decimal = Decimal("0")
+
+    def add(self, side: Optional[str], count, volume, fee, price_sum) -> None:
+        """부분 합계 추가 (side=None: 방향 무관 총계만)"""
+        count = int(count or 0)
+        self.total_trades += count
+        self.total_volume += Decimal(str(volume or 0))
+        self.total_fee += Decimal(str(fee or 0))
+        if side == "buy":
+            self.buy_count += count
+            self.buy_price_sum += Decimal(str(price_sum or 0))
+        elif side == "sell":
+            self.sell_count += count
+            self.sell_price_sum += Decimal(str(price_sum or 0))
+
+    def to_summary(self) -> Dict[str, Any]:
+        return {
+            "total_trades": self.total_trades,
+            "total_buy": self.buy_count,
+            "total_sell": self.sell_count,
+            "total_volume_krw": self.total_volume,
+            "total_fee": self.total_fee,
+            "avg_buy_price": self.buy_price_sum / self.buy_count if self.buy_count else None,
+            "avg_sell_price": self.sell_price_sum / self.sell_count if self.sell_count else None,
+        }
+
+
+# ============================================================================
+# 조회
+# ============================================================================
+
+async def _scan_trades(
+    db: AsyncSession,
+    acc: _StatisticsAccumulator,
+    symbol: Optional[str],
+    start: datetime,
+    end: Optional[datetime] = None,
+) -> None:
+    """trades 구간 [start, end) 조건부 집계 (단일 쿼리, 단일 스캔)"""
+    conditions = [Trade.created_at >= start, Trade.status == ROLLUP_STATUS]
+    if end is not None:
+        conditions.append(Trade.created_at < end)
+    if symbol:
+        conditions.append(Trade.symbol == symbol)
+
+    is_buy = Trade.side == "buy"
+    is_sell = Trade.side == "sell"
+    query = select(
+        func.count(Trade.id),
+        func.sum(Trade.total),
+        func.sum(Trade.fee),
+        func.count(case((is_buy, 1))),
+        func.sum(case((is_buy, Trade.price))),
+        func.count(case((is_sell, 1))),
+        func.sum(case((is_sell, Trade.price))),
+    ).where(and_(*conditions))
+
+    total, volume, fee, buy_count, buy_price_sum, sell_count, sell_price_sum = (
+        await db.execute(query)
+    ).one()
+    acc.add(None, total - buy_count - sell_count, volume, fee, 0)
+    acc.add("buy", buy_count, 0, 0, buy_price_sum)
+    acc.add("sell", sell_count, 0, 0, sell_price_sum)
+
+
+async def _read_rollup(
+    db: AsyncSession,
+    acc: _StatisticsAccumulator,
+    symbol: Optional[str],
+    first_day: date,
+    end_day: date,
+) -> None:
+    """rollup 일자 구간 [first_day, end_day) 합산 (방향별 1행)"""
+    conditions = [TradeDailyStat.day >= first_day, TradeDailyStat.day < end_day]
+    if symbol:
+        conditions.append(TradeDailyStat.symbol == symbol)
+
+    query = select(
+        TradeDailyStat.side,
+        func.sum(TradeDailyStat.trade_count),
+        func.sum(TradeDailyStat.volume_krw),
+        func.sum(TradeDailyStat.fee_sum),
+        func.sum(TradeDailyStat.price_sum),
+    ).where(and_(*conditions)).group_by(TradeDailyStat.side)
+
+    for side, count, volume, fee, price_sum in (await db.execute(query)).all():
+        acc.add(side, count, volume, fee, price_sum)
+
+
+async def get_trade_statistics_summary(
+    db: AsyncSession,
+    symbol: Optional[str] = None,
+    days: int = 30,
+    now: Optional[datetime] = None,
+    use_rollup: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    최근 N일 completed 거래 통계
+
+    Args:
+        db: 데이터베이스 세션
+        symbol: 심볼 필터
+        days: 기간 (일)
+        now: 기준 시각 (기본: 현재 UTC)
+        use_rollup: rollup 사용 여부 (기본: days >= ROLLUP_MIN_DAYS)
+
+    Returns:
+        TradeStatistics 필드 dict
+    """
+    now = now or datetime.utcnow()
+    from_date = now - timedelta(days=days)
+    if use_rollup is None:
+        use_rollup = days >= ROLLUP_MIN_DAYS
+
+    acc = _StatisticsAccumulator()
+    if not use_rollup:
+        await _scan_trades(db, acc, symbol, from_date)
+        return acc.to_summary()
+
+    # [from_date, 다음날 0시) raw + [다음날, 오늘) rollup + [오늘 0시, ∞) raw
+    first_full_day = from_date.date() + timedelta(days=1)
+    today = now.date()
+    if first_full_day >= today:
+        await _scan_trades(db, acc, symbol, from_date)
+        return acc.to_summary()
+
+    await _scan_trades(db, acc, symbol, from_date, datetime.combine(first_full_day, time.min))
+    await _read_rollup(db, acc, symbol, first_full_day, today)
+    await _scan_trades(db, acc, symbol, datetime.combine(today, time.min))
+    return acc.to_summary()
+
+
+# ============================================================================
+# rollup 갱신
+# ============================================================================
+
+def _field(trade: Any, name: str) -> Any:
+    if isinstance(trade, dict):
+        return trade.get(name)
+    return getattr(trade, name, None)
+
+
+def aggregate_trades(trades: Iterable[Any]) -> Dict[Tuple[date, str, str], List]:
+    """
+    거래 목록 → (일자, 심볼, 방향)별 증분
+
+    Args:
+        trades: Trade 모델 또는 컬럼 dict
+
+    Returns:
+        {(day, symbol, side): [count, volume, fee, price_sum]}
+    """
+    deltas: Dict[Tuple[date, str, str], List] = {}
+    for trade in trades:
+        if (_field(trade, "status") or ROLLUP_STATUS) != ROLLUP_STATUS:
+            continue
+        created_at = _field(trade, "created_at") or datetime.utcnow()
+        key = (created_at.date(), _field(trade, "symbol"), _field(trade, "side"))
+        delta = deltas.setdefault(key, [0, Decimal("0"), Decimal("0"), Decimal("0")])
+        delta[0] += 1
+        delta[1] += Decimal(str(_field(trade, "total") or 0))
+        delta[2] += Decimal(str(_field(trade, "fee") or 0))
+        delta[3] += Decimal(str(_field(trade, "price") or 0))
+    return deltas
+
+
+def _dialect_name(db: AsyncSession) -> Optional[str]:
+    """세션에 바인딩된 DB 방언 이름 (확인 불가 시 None)"""
+    try:
+        return db.get_bind().dialect.name
+    except Exception:
+        return None
+
+
+async def apply_trade_rollup(db: AsyncSession, trades: Iterable[Any]) -> int:
+    """
+    새 거래를 일별 rollup에 증분 반영 (커밋하지 않음 - 호출자 트랜잭션에 포함)
+
+    PostgreSQL/SQLite는 INSERT ... ON CONFLICT DO UPDATE 한 번으로 처리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        trades: 새로 INSERT된 거래 (Trade 모델 또는 컬럼 dict)
+
+    Returns:
+        갱신된 rollup 행 수
+    """
+    deltas = aggregate_trades(trades)
+    if not deltas:
+        return 0
+
+    rows = [
+        {
+            "day": day, "symbol": symbol, "side": side,
+            "trade_count": count, "volume_krw": volume, "fee_sum": fee, "price_sum": price_sum,
+            "updated_at": datetime.utcnow(),
+        }
+        for (day, symbol, side), (count, volume, fee, price_sum) in deltas.items()
+    ]
+
+    dialect = _dialect_name(db)
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(TradeDailyStat)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", "symbol", "side"],
+            set_={
+                "trade_count": TradeDailyStat.trade_count + stmt.excluded.trade_count,
+                "volume_krw": TradeDailyStat.volume_krw + stmt.excluded.volume_krw,
+                "fee_sum": TradeDailyStat.fee_sum + stmt.excluded.fee_sum,
+                "price_sum": TradeDailyStat.price_sum + stmt.excluded.price_sum,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await db.execute(stmt, rows)
+        return len(rows)
+
+    # 기타 DB: UPDATE 후 없으면 INSERT
+    for row in rows:
+        result = await db.execute(
+            update(TradeDailyStat)
+            .where(
+                TradeDailyStat.day == row["day"],
+                TradeDailyStat.symbol == row["symbol"],
+                TradeDailyStat.side == row["side"],
+            )
+            .values(
+                trade_count=TradeDailyStat.trade_count + row["trade_count"],
+                volume_krw=TradeDailyStat.volume_krw + row["volume_krw"],
+                fee_sum=TradeDailyStat.fee_sum + row["fee_sum"],
+                price_sum=TradeDailyStat.price_sum + row["price_sum"],
+                updated_at=row["updated_at"],
+            )
+        )
+        if result.rowcount == 0:
+            db.add(TradeDailyStat(**row))
+    return len(rows)
+
+
+async def rebuild_trade_rollup(db: AsyncSession) -> int:
+    """
+    trades 테이블에서 rollup 전체 재생성 (초기 백필/정합성 복구용, 커밋 포함)
+
+    Returns:
+        생성된 rollup 행 수
+    """
+    day = func.date(Trade.created_at)
+    query = select(
+        day,
+        Trade.symbol,
+        Trade.side,
+        func.count(Trade.id),
+        func.sum(Trade.total),
+        func.sum(Trade.fee),
+        func.sum(Trade.price),
+    ).where(Trade.status == ROLLUP_STATUS).group_by(day, Trade.symbol, Trade.side)
+
+    rows = (await db.execute(query)).all()
+    await db.execute(delete(TradeDailyStat))
+    now = datetime.utcnow()
+    for day_value, symbol, side, count, volume, fee, price_sum in rows:
+        if isinstance(day_value, str):
+            day_value = date.fromisoformat(day_value)
+        db.add(TradeDailyStat(
+            day=day_value, symbol=symbol, side=side, trade_count=count,
+            volume_krw=volume or Decimal("0"), fee_sum=fee or Decimal("0"),
+            price_sum=price_sum or Decimal("0"), updated_at=now,
+        ))
+    await db.commit()
+    logger.info(f"거래 일별 집계 재생성 완료: {len(rows)}행")
+    return len(rows)
+
+
+async def ensure_trade_rollup(db: AsyncSession) -> None:
+    """rollup이 비어 있고 거래가 있으면 백필 (기존 배포 최초 1회)"""
+    has_rollup = (await db.execute(select(TradeDailyStat.id).limit(1))).first() is not None
+    if has_rollup:
+        return
+    has_trades = (await db.execute(select(Trade.id).limit(1))).first() is not None
+    if has_trades:
+        await rebuild_trade_rollup(db)
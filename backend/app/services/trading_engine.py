@@ -14,6 +14,7 @@ from backend.app.models.trade import Trade
 from backend.app.models.ai_decision import AIDecision
 from backend.app.models.order import Order
 from backend.app.services.notification import notify_trade, notify_error
+from backend.app.services.trade_statistics import apply_trade_rollup
 
 logger = logging.getLogger(__name__)
 
@@ -189,6 +190,8 @@ class TradingEngine:
         )
         
         self.db.add(trade)
+        await self.db.flush()
+        await apply_trade_rollup(self.db, [trade])
         await self.db.commit()
         logger.debug(f"거래 결과 저장 완료: {trade_result['trade_id']}")
 
@@ -24,9 +24,10 @@ sys.path.insert(0, str(project_root))
 from backend.app.core.scheduler import (
     start_scheduler,
     stop_scheduler,
+    close_persistence,
     get_jobs
 )
-from backend.app.services.notification import notify_bot_status
+from backend.app.services.notification import notify_bot_status, close_notifier
 from backend.app.services.metrics import set_bot_running
 from src.utils.logger import Logger
 
@@ -156,7 +157,9 @@ async def main():
         except Exception as e:
             logger.warning(f"Telegram 알림 전송 실패: {e}")
         
-        # 스케줄러 정지
+        # 스케줄러 정지 (write-behind 큐 / 알림 큐 flush 후)
+        await close_persistence()
+        await close_notifier()
         stop_scheduler()
         
         logger.info("✅ 스케줄러가 안전하게 종료되었습니다.")
@@ -190,7 +193,9 @@ async def main():
         # 봇 상태 업데이트
         set_bot_running(False)
         
-        # 스케줄러 정지
+        # 스케줄러 정지 (write-behind 큐 / 알림 큐 flush 후)
+        await close_persistence()
+        await close_notifier()
         stop_scheduler()
         
         sys.exit(1)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+AI 판단 정확도 분석 부하 벤치마크
+
+목적: 프롬프트 A/B 대시보드 조회가 decision_records 크기와 무관하게 50ms 이내인지 확인
+
+decision_records 행 수를 단계적으로 늘리며
+1. 전체 집계 (기존 get_accuracy_stats 방식, decision_records 스캔)
+2. rollup 요약 (get_accuracy_summary)
+3. rollup 매트릭스 (버전 × 심볼 × 판단 × 일자, 최근 N일)
+경로를 반복 측정하고 p50/p95 지연 시간을 출력합니다.
+
+사용법:
+    python scripts/benchmark_decision_accuracy.py --sizes 100000 1000000
+    python scripts/benchmark_decision_accuracy.py --database-url postgresql+asyncpg://...  # 빈 DB 사용
+
+작성일: 2026-10-18
+"""
+import sys
+import asyncio
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from backend.app.models.decision_accuracy_stat import DecisionAccuracyStat
+from backend.app.models.decision_record import DecisionRecordModel
+from backend.app.services.decision_accuracy import (
+    get_accuracy_breakdown,
+    get_accuracy_summary,
+    rebuild_accuracy_rollup,
+)
+
+SYMBOLS = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL", "KRW-DOGE", "KRW-ADA"]
+VERSIONS = ["1.0.0", "1.1.0", "2.0.0"]
+DECISIONS = ["ALLOW", "BLOCK", "HOLD"]
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+def make_records(count: int, now: datetime, days: int) -> List[dict]:
+    """최근 days일에 고르게 분포한 PnL 연동 판단 기록 생성"""
+    rows = []
+    for _ in range(count):
+        pnl = Decimal(str(round(random.uniform(-5, 5), 2)))
+        rows.append({
+            "symbol": random.choice(SYMBOLS),
+            "decision": random.choice(DECISIONS),
+            "confidence": Decimal("70"),
+            "prompt_version": random.choice(VERSIONS),
+            "prompt_type": "ENTRY",
+            "pnl_percent": pnl,
+            "is_profitable": pnl > 0,
+            "exit_reason": "take_profit" if pnl > 0 else "stop_loss",
+            "created_at": now - timedelta(seconds=random.uniform(0, days * 86400)),
+        })
+    return rows
+
+
+async def seed(session_factory, target: int, current: int, now: datetime, days: int, batch: int) -> None:
+    """decision_records를 target 행까지 채우고 rollup 재생성"""
+    while current < target:
+        size = min(batch, target - current)
+        async with session_factory() as session:
+            await session.execute(insert(DecisionRecordModel), make_records(size, now, days))
+            await session.commit()
+        current += size
+
+    async with session_factory() as session:
+        await rebuild_accuracy_rollup(session)
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+
+
+async def full_scan(session) -> None:
+    """기존 방식: decision_records 전체 집계"""
+    Model = DecisionRecordModel
+    await session.execute(
+        select(func.count(Model.id), func.count(Model.id).filter(Model.is_profitable.is_(True)))
+        .where(Model.is_profitable.isnot(None))
+    )
+
+
+async def measure(session_factory, query: Callable[..., Awaitable], repeat: int) -> List[float]:
+    """조회 지연 시간(ms) 반복 측정"""
+    timings = []
+    for _ in range(repeat):
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await query(session)
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(args) -> None:
+    if args.database_url:
+        url = args.database_url
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix="decision_accuracy_bench_")
+        url = f"sqlite+aiosqlite:///{tmp_dir}/bench.db"
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        for model in (DecisionRecordModel, DecisionAccuracyStat):
+            await conn.run_sync(model.__table__.create, checkfirst=True)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    now = datetime.utcnow()
+    matrix_start = (now - timedelta(days=args.matrix_days)).date()
+    random.seed(42)
+    print(f"DB: {url}")
+    print(f"{'records':>10} | {'scan p50':>9} | {'summary p50':>11} {'p95':>7} | "
+          f"{'matrix p50':>10} {'p95':>7} {'rows':>6}  (ms, 매트릭스 {args.matrix_days}일)")
+    print("-" * 80)
+
+    current = 0
+    for size in sorted(args.sizes):
+        await seed(session_factory, size, current, now, args.days, args.batch)
+        current = size
+
+        async def matrix(session):
+            return await get_accuracy_breakdown(session, start_day=matrix_start)
+
+        scan = await measure(session_factory, full_scan, max(3, args.repeat // 5))
+        summary = await measure(session_factory, get_accuracy_summary, args.repeat)
+        breakdown = await measure(session_factory, matrix, args.repeat)
+        async with session_factory() as session:
+            rows = len(await matrix(session))
+        print(
+            f"{size:>10,} | {statistics.median(scan):>9.2f} | "
+            f"{statistics.median(summary):>11.2f} {percentile(summary, 95):>7.2f} | "
+            f"{statistics.median(breakdown):>10.2f} {percentile(breakdown, 95):>7.2f} {rows:>6}"
+        )
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AI 판단 정확도 분석 부하 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000],
+                        help='측정할 decision_records 행 수 (누적)')
+    parser.add_argument('--days', type=int, default=180, help='기록 분포 기간 (일)')
+    parser.add_argument('--matrix-days', type=int, default=30, help='매트릭스 조회 기간 (일)')
+    parser.add_argument('--repeat', type=int, default=20, help='측정 반복 횟수')
+    parser.add_argument('--batch', type=int, default=10_000, help='시딩 배치 크기')
+    parser.add_argument('--database-url', type=str, default=None,
+                        help='비동기 DB URL (기본: 임시 SQLite 파일)')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+리스크 상태 저장 벤치마크
+
+목적: 거래가 많은 날에도 상태 기록/조회 지연 시간이 평탄한지 확인
+
+하루 거래 수를 늘려가며
+1. 기존 방식 (JSON 전체 로드 → 수정 → 전체 재작성)
+2. RiskStateStore (이벤트 1행 INSERT + 메모리 캐시 조회)
+의 기록(record_trade) / 조회(load_state) 지연 시간 p50/p95를 출력합니다.
+
+사용법:
+    python scripts/benchmark_risk_state.py --trades 100 1000 5000
+
+작성일: 2026-10-18
+"""
+import sys
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.risk.state_store import RiskStateStore, default_state
+
+
+class LegacyJsonState:
+    """기존 RiskStateManager 저장 방식 (매 기록마다 파일 전체 재작성)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def _load_all(self) -> dict:
+        if not self.path.exists():
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load_state(self) -> dict:
+        return self._load_all().get(datetime.now().date().isoformat()) or default_state()
+
+    def record_trade(self, pnl_pct: float) -> None:
+        all_states = self._load_all()
+        today = datetime.now().date().isoformat()
+        state = all_states.get(today) or default_state()
+        state['daily_pnl'] += pnl_pct
+        state['daily_trade_count'] += 1
+        state['last_trade_time'] = datetime.now().isoformat()
+        state['updated_at'] = datetime.now().isoformat()
+        all_states[today] = state
+
+        # 7일 초과 데이터 정리 (기존 동작)
+        cutoff = (datetime.now() - timedelta(days=7)).date().isoformat()
+        all_states = {k: v for k, v in all_states.items() if k >= cutoff}
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(all_states, f, indent=2, ensure_ascii=False)
+
+
+def timed(fn: Callable[[], object], repeat: int) -> List[float]:
+    """지연 시간(ms) 반복 측정"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(args) -> None:
+    tmp_dir = Path(tempfile.mkdtemp(prefix="risk_state_bench_"))
+    legacy = LegacyJsonState(tmp_dir / "risk_state.json")
+    store = RiskStateStore(tmp_dir / "risk_state.db")
+
+    print(f"{'trades/day':>10} | {'json write':>10} {'p95':>7} {'read':>7} | "
+          f"{'store write':>11} {'p95':>7} {'read':>7}  (ms)")
+    print("-" * 76)
+
+    current = 0
+    for target in sorted(args.trades):
+        # 목표 거래 수까지 채움
+        for _ in range(target - current):
+            legacy.record_trade(-0.1)
+            store.record_trade(-0.1)
+        current = target
+
+        json_write = timed(lambda: legacy.record_trade(-0.1), args.repeat)
+        json_read = timed(legacy.load_state, args.repeat)
+        store_write = timed(lambda: store.record_trade(-0.1), args.repeat)
+        store_read = timed(store.get_state, args.repeat)
+        current += args.repeat
+
+        print(
+            f"{target:>10,} | {statistics.median(json_write):>10.3f} {percentile(json_write, 95):>7.3f} "
+            f"{statistics.median(json_read):>7.3f} | {statistics.median(store_write):>11.3f} "
+            f"{percentile(store_write, 95):>7.3f} {statistics.median(store_read):>7.3f}"
+        )
+
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='리스크 상태 저장 벤치마크')
+    parser.add_argument('--trades', type=int, nargs='+', default=[100, 1_000, 5_000],
+                        help='측정할 하루 거래 수 (누적)')
+    parser.add_argument('--repeat', type=int, default=50, help='측정 반복 횟수')
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
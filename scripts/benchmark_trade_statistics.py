@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+거래 통계(/trades/statistics/summary) 부하 벤치마크
+
+목적: 365일 조회 응답 시간이 trades 테이블 크기와 무관하게 평탄한지 확인
+
+trades 행 수를 단계적으로 늘리며 같은 365일 통계를
+1. 단일 스캔 (조건부 집계 1쿼리)
+2. rollup (trade_daily_stats + 부분 구간 스캔)
+경로로 각각 반복 측정하고 p50/p95 지연 시간을 출력합니다.
+
+사용법:
+    python scripts/benchmark_trade_statistics.py --sizes 10000 100000 1000000
+    python scripts/benchmark_trade_statistics.py --database-url postgresql+asyncpg://...  # 빈 DB 사용
+
+작성일: 2026-10-18
+"""
+import sys
+import asyncio
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.models.trade import Trade
+from backend.app.models.trade_daily_stat import TradeDailyStat
+from backend.app.services.trade_statistics import (
+    apply_trade_rollup,
+    get_trade_statistics_summary,
+)
+
+SYMBOLS = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL"]
+
+
+def make_trades(count: int, offset: int, now: datetime, days: int) -> List[dict]:
+    """최근 days일에 고르게 분포한 completed 거래 생성"""
+    rows = []
+    for i in range(count):
+        price = Decimal(str(round(random.uniform(1000, 100_000_000), 2)))
+        amount = Decimal(str(round(random.uniform(0.0001, 1), 6)))
+        rows.append({
+            "trade_id": f"bench-{offset + i}",
+            "symbol": random.choice(SYMBOLS),
+            "side": random.choice(["buy", "sell"]),
+            "price": price,
+            "amount": amount,
+            "total": price * amount,
+            "fee": (price * amount * Decimal("0.0005")).quantize(Decimal("0.01")),
+            "status": "completed",
+            "created_at": now - timedelta(seconds=random.uniform(0, days * 86400)),
+            "updated_at": now,
+        })
+    return rows
+
+
+async def seed(session_factory, target: int, current: int, now: datetime, days: int, batch: int) -> None:
+    """trades + rollup을 target 행까지 채움 (실제 INSERT 경로와 동일하게 rollup 증분 갱신)"""
+    while current < target:
+        size = min(batch, target - current)
+        rows = make_trades(size, current, now, days)
+        async with session_factory() as session:
+            await session.execute(insert(Trade), rows)
+            await apply_trade_rollup(session, rows)
+            await session.commit()
+        current += size
+
+    # 운영 DB(autovacuum)처럼 통계 갱신 → 부분 구간 스캔이 created_at 인덱스 사용
+    async with session_factory() as session:
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+
+
+async def measure(session_factory, use_rollup: bool, days: int, repeat: int) -> List[float]:
+    """통계 조회 지연 시간(ms) 반복 측정"""
+    timings = []
+    for _ in range(repeat):
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await get_trade_statistics_summary(session, days=days, use_rollup=use_rollup)
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(args) -> None:
+    if args.database_url:
+        url = args.database_url
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix="trade_stats_bench_")
+        url = f"sqlite+aiosqlite:///{tmp_dir}/bench.db"
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        for model in (Trade, TradeDailyStat):
+            await conn.run_sync(model.__table__.create, checkfirst=True)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    now = datetime.utcnow()
+    random.seed(42)
+    print(f"DB: {url}")
+    print(f"{'trades':>10} | {'scan p50':>9} {'scan p95':>9} | {'rollup p50':>10} {'rollup p95':>10}  (ms, {args.days}일)")
+    print("-" * 66)
+
+    current = 0
+    for size in sorted(args.sizes):
+        await seed(session_factory, size, current, now, args.days, args.batch)
+        current = size
+
+        scan = await measure(session_factory, False, args.days, args.repeat)
+        rollup = await measure(session_factory, True, args.days, args.repeat)
+        print(
+            f"{size:>10,} | {statistics.median(scan):>9.2f} {percentile(scan, 95):>9.2f} | "
+            f"{statistics.median(rollup):>10.2f} {percentile(rollup, 95):>10.2f}"
+        )
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='거래 통계 조회 부하 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 300_000],
+                        help='측정할 trades 행 수 (누적)')
+    parser.add_argument('--days', type=int, default=365, help='조회 기간 (일)')
+    parser.add_argument('--repeat', type=int, default=20, help='측정 반복 횟수')
+    parser.add_argument('--batch', type=int, default=5_000, help='시딩 배치 크기')
+    parser.add_argument('--database-url', type=str, default=None,
+                        help='비동기 DB URL (기본: 임시 SQLite 파일)')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
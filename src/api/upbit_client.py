@@ -53,7 +53,30 @@ class UpbitClient(IExchangeClient):
             return pyupbit.get_current_price(ticker)
         except Exception as e:
             raise DataCollectionError("Upbit API", f"현재가 조회 실패: {str(e)}")
-    
+
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        여러 티커 현재가 일괄 조회 (요청 1회)
+
+        Args:
+            tickers: 티커 리스트 (예: ["KRW-BTC", "KRW-ETH"])
+
+        Returns:
+            {티커: 현재가} (가격이 없는 티커는 제외)
+        """
+        if not tickers:
+            return {}
+        try:
+            prices = pyupbit.get_current_price(list(tickers))
+        except Exception as e:
+            raise DataCollectionError("Upbit API", f"현재가 일괄 조회 실패: {str(e)}")
+        if prices is None:
+            return {}
+        if not isinstance(prices, dict):
+            # 티커가 1개면 pyupbit는 float를 반환
+            prices = {tickers[0]: prices}
+        return {ticker: float(price) for ticker, price in prices.items() if price}
+
     def buy_market_order(self, ticker: str, amount: float) -> Optional[Dict[str, Any]]:
         """시장가 매수 주문"""
         try:
@@ -194,3 +194,42 @@ class TradingDecision:
     def is_high_confidence(self, threshold: Decimal = Decimal("0.7")) -> bool:
         """Check if decision has high confidence."""
         return self.confidence >= threshold
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (Decimal as str)."""
+        def opt(value: Optional[Decimal]) -> Optional[str]:
+            return str(value) if value is not None else None
+
+        return {
+            "decision": self.decision.value,
+            "confidence": str(self.confidence),
+            "reasoning": self.reasoning,
+            "target_price": opt(self.target_price),
+            "stop_loss_price": opt(self.stop_loss_price),
+            "take_profit_price": opt(self.take_profit_price),
+            "position_size_ratio": str(self.position_size_ratio),
+            "risk_assessment": self.risk_assessment,
+            "key_factors": list(self.key_factors),
+            "raw_response": self.raw_response,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> TradingDecision:
+        """Deserialize from to_dict() output."""
+        def opt(value: Optional[str]) -> Optional[Decimal]:
+            return Decimal(value) if value is not None else None
+
+        return cls(
+            decision=DecisionType(data["decision"]),
+            confidence=Decimal(data["confidence"]),
+            reasoning=data["reasoning"],
+            target_price=opt(data.get("target_price")),
+            stop_loss_price=opt(data.get("stop_loss_price")),
+            take_profit_price=opt(data.get("take_profit_price")),
+            position_size_ratio=Decimal(data.get("position_size_ratio", "0.3")),
+            risk_assessment=data.get("risk_assessment", "medium"),
+            key_factors=list(data.get("key_factors", [])),
+            raw_response=data.get("raw_response"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
@@ -1,6 +1,6 @@
 # Outbound ports (external system interfaces)
 from src.application.ports.outbound.idempotency_port import IdempotencyPort, make_idempotency_key
-from src.application.ports.outbound.lock_port import LockPort, LOCK_IDS, LockAcquisitionError
+from src.application.ports.outbound.lock_port import LockPort, LockLease, LOCK_IDS, LockAcquisitionError
 from src.application.ports.outbound.execution_port import (
     ExecutionPort,
     ExecutionResult,
@@ -8,6 +8,11 @@ from src.application.ports.outbound.execution_port import (
 )
 from src.application.ports.outbound.prompt_port import PromptPort
 from src.application.ports.outbound.validation_port import ValidationPort, ValidationResult
+from src.application.ports.outbound.decision_cache_port import (
+    DecisionCachePort,
+    make_decision_cache_key,
+    next_candle_close,
+)
 from src.application.ports.outbound.decision_record_port import (
     DecisionRecordPort,
     DecisionRecord,
@@ -18,6 +23,7 @@ __all__ = [
     "IdempotencyPort",
     "make_idempotency_key",
     "LockPort",
+    "LockLease",
     "LOCK_IDS",
     "LockAcquisitionError",
     "ExecutionPort",
@@ -26,6 +32,9 @@ __all__ = [
     "PromptPort",
     "ValidationPort",
     "ValidationResult",
+    "DecisionCachePort",
+    "make_decision_cache_key",
+    "next_candle_close",
     "DecisionRecordPort",
     "DecisionRecord",
     "PnLLabel",
@@ -0,0 +1,141 @@
+"""
+DecisionCachePort - Interface for candle-scoped AI decision caching.
+
+This port defines the contract for caching AI trading decisions so that
+the same (prompt, prompt version, candle) is sent to the LLM only once.
+
+Duplicate calls happen on timeout retries, manual /run in the same candle,
+or when the scheduler and the Telegram bot trigger at the same time.
+
+Key format: {ticker}:{sha256(prompt_version | candle_ts | analysis_type | prompt)}
+Entries expire at the next candle close.
+"""
+import hashlib
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.application.dto.analysis import TradingDecision
+from src.domain.value_objects.prompt_version import PromptVersion
+
+
+def make_decision_cache_key(
+    ticker: str,
+    rendered_prompt: str,
+    prompt_version: PromptVersion,
+    candle_ts: datetime,
+    analysis_type: str = "general",
+) -> str:
+    """
+    Generate a stable cache key for an AI decision.
+
+    Args:
+        ticker: Trading pair (e.g., "KRW-BTC")
+        rendered_prompt: Fully rendered prompt sent to the LLM
+        prompt_version: Prompt template version
+        candle_ts: Candle timestamp the decision refers to
+        analysis_type: Analysis kind (general/entry/exit)
+
+    Returns:
+        Cache key string
+
+    Example:
+        >>> make_decision_cache_key("KRW-BTC", "...", version, candle_ts)
+        'KRW-BTC:3f2a...'
+    """
+    material = "|".join([
+        prompt_version.to_tracking_id(),
+        candle_ts.isoformat(),
+        analysis_type,
+        rendered_prompt,
+    ])
+    digest = hashlib.sha256(material.encode("utf-8")).hexdigest()
+    return f"{ticker}:{digest}"
+
+
+def floor_to_candle(ts: datetime, interval: timedelta) -> datetime:
+    """
+    Floor a timestamp to the start of its candle.
+
+    Args:
+        ts: Timestamp
+        interval: Candle interval
+
+    Returns:
+        Candle open time
+    """
+    seconds = int(interval.total_seconds())
+    day_start = ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    elapsed = int((ts - day_start).total_seconds())
+    return day_start + timedelta(seconds=elapsed - elapsed % seconds)
+
+
+def next_candle_close(now: datetime, interval: timedelta) -> datetime:
+    """
+    Get the close time of the candle containing `now`.
+
+    Args:
+        now: Current time
+        interval: Candle interval
+
+    Returns:
+        Next candle close time (cache expiry)
+    """
+    return floor_to_candle(now, interval) + interval
+
+
+class DecisionCachePort(ABC):
+    """
+    Port interface for AI decision cache storage.
+
+    Usage:
+        key = make_decision_cache_key(ticker, prompt, version, candle_ts)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+        decision = await llm_call(...)
+        await cache.set(key, decision, next_candle_close(now, interval))
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[TradingDecision]:
+        """
+        Get a cached decision if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached TradingDecision or None
+        """
+        pass
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        decision: TradingDecision,
+        expires_at: datetime,
+        ticker: Optional[str] = None,
+    ) -> None:
+        """
+        Store a decision until expires_at.
+
+        Args:
+            key: Cache key
+            decision: Decision to cache
+            expires_at: Expiration time (next candle close)
+            ticker: Trading pair (for diagnostics)
+        """
+        pass
+
+    @abstractmethod
+    async def delete_expired(self) -> int:
+        """
+        Delete all expired entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        pass
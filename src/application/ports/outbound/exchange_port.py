@@ -166,7 +166,12 @@ class ExchangePort(ABC):
         Get all open positions.
 
         Returns:
-            List of PositionInfo for all positions
+            List of PositionInfo for all positions (coins whose per-coin
+            read fails are skipped, so a held coin may be missing)
+
+        Raises:
+            ExchangeError: If the balance list cannot be read (an empty list
+                means no holdings)
         """
         pass
 
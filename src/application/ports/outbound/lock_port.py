@@ -7,10 +7,19 @@ to prevent concurrent execution of critical sections.
 Lock IDs:
 - trading_cycle: 1001 - Main trading job lock
 - position_management: 1002 - Position management job lock
+
+Leases:
+    acquire_lease() returns a LockLease carrying a fencing token. Adapters
+    with lease support (SQLiteLeaseLockAdapter) hand out increasing tokens
+    and can tell whether a lease is still current (validate_lease), so work
+    done under a lease that has expired can be rejected downstream.
 """
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from dataclasses import dataclass
+from typing import AsyncGenerator, Optional
 
 # PostgreSQL Advisory Lock IDs
 # Must be unique across the application
@@ -20,6 +29,24 @@ LOCK_IDS = {
 }
 
 
+@dataclass(frozen=True)
+class LockLease:
+    """
+    A held lock.
+
+    Attributes:
+        lock_name: Name of the lock
+        token: Fencing token (increases with every grant; None if the
+            adapter does not support fencing)
+        holder: Holder identifier
+        acquired_at: Grant time (epoch seconds)
+    """
+    lock_name: str
+    token: Optional[int] = None
+    holder: str = ""
+    acquired_at: float = 0.0
+
+
 class LockPort(ABC):
     """
     Port interface for distributed locking.
@@ -89,6 +116,55 @@ class LockPort(ABC):
         """
         pass
 
+    async def acquire_lease(
+        self,
+        lock_name: str,
+        timeout_seconds: int = 300,
+        wait_seconds: float = 0.0
+    ) -> Optional[LockLease]:
+        """
+        Acquire a lock, waiting up to wait_seconds, and return its lease.
+
+        The default implementation polls acquire(); adapters with lease
+        support override this with fair (FIFO) waiting and fencing tokens.
+
+        Args:
+            lock_name: Name of the lock
+            timeout_seconds: Maximum time to hold the lock
+            wait_seconds: Maximum time to wait for the lock (0 = try once)
+
+        Returns:
+            LockLease if acquired, None otherwise
+        """
+        deadline = time.monotonic() + max(0.0, wait_seconds)
+        while True:
+            if await self.acquire(lock_name, timeout_seconds):
+                return LockLease(lock_name=lock_name, acquired_at=time.time())
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(min(1.0, max(0.0, deadline - time.monotonic())))
+
+    async def validate_lease(self, lease: LockLease) -> bool:
+        """
+        Check that a lease is still held (fencing check).
+
+        Args:
+            lease: Lease returned by acquire_lease()
+
+        Returns:
+            True if the lease is current (always True without fencing support)
+        """
+        return True
+
+    def get_lease(self, lock_name: str) -> Optional[LockLease]:
+        """
+        Lease currently held by this adapter for lock_name.
+
+        Returns:
+            LockLease or None (also None without lease support)
+        """
+        return None
+
     @asynccontextmanager
     async def lock(
         self,
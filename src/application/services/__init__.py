@@ -5,5 +5,6 @@ Application Services Layer
 UseCase를 조합하여 복잡한 워크플로우를 처리합니다.
 """
 from src.application.services.trading_orchestrator import TradingOrchestrator
+from src.application.services.trading_runtime import TradingRuntime
 
-__all__ = ['TradingOrchestrator']
+__all__ = ['TradingOrchestrator', 'TradingRuntime']
@@ -0,0 +1,311 @@
+"""
+거래 사이클 조율기 (Cycle Coordinator)
+
+스케줄러(scheduler_main.py)와 텔레그램 봇(telegram_bot.py)은 서로 다른 프로세스에서
+같은 거래 사이클을 실행할 수 있습니다. 조율기는 두 프로세스가 같은 캔들에 대해
+스캔/AI 호출을 중복 실행하지 않도록 합니다.
+
+run_or_attach() 흐름:
+1. 같은 캔들의 사이클이 reuse_window 안에 끝났으면 그 결과 재사용 (reused)
+   (그보다 오래된 결과는 재사용하지 않고 새로 실행 - 수동 /run은 항상 최신 판단)
+2. trading_cycle 락 획득 시 직접 실행하고 보드에 진행/결과 기록 (executed)
+3. 다른 프로세스가 실행 중이면 보드를 폴링하며 진행 단계를 전달하고 결과 반환 (attached)
+4. 락은 잡혀 있지만 실행 중인 사이클이 없으면(포지션 관리 등) LOCK_WAIT까지 재시도 후 포기 (busy)
+
+보드 조회가 실패하면(SQLite 잠금/손상 등) 기록이 없는 것으로 보고 락 기준으로만 진행합니다.
+
+요청 결과는 보드에 기록되어 프로세스 전체의 중복 실행 비율을 측정합니다
+(CycleRunBoard.get_stats, trading_cycle_duplicate_ratio 메트릭).
+"""
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from time import monotonic, time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.application.ports.outbound.lock_port import LockPort
+from src.utils.logger import Logger
+
+CYCLE_LOCK_NAME = "trading_cycle"
+
+# 보드에 남기는 결과 필드 (다른 프로세스가 결과 메시지를 만들 수 있는 만큼)
+RESULT_KEYS = (
+    'status', 'decision', 'confidence', 'reason', 'error', 'trade_success',
+    'price', 'amount', 'total', 'idempotency_key', 'pipeline_status',
+    'scan_summary', 'scan_result', 'selected_coin', 'all_backtest_results',
+)
+
+ProgressCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def current_cycle_key(now: Optional[datetime] = None) -> str:
+    """
+    현재 1시간 캔들 키 (TradingOrchestrator의 idempotency 키와 같은 정렬)
+
+    Returns:
+        예: "1h-1704067200"
+    """
+    now = now or datetime.now(timezone.utc)
+    aligned = now.replace(minute=0, second=0, microsecond=0)
+    return f"1h-{int(aligned.timestamp())}"
+
+
+def summarize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """보드에 기록할 결과 요약"""
+    return {key: result[key] for key in RESULT_KEYS if key in result}
+
+
+@dataclass
+class CycleOutcome:
+    """사이클 요청 결과"""
+    mode: str  # executed | attached | reused | busy
+    result: Dict[str, Any]
+    run: Optional[Dict[str, Any]] = None
+    waited_seconds: float = 0.0
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+class CycleCoordinator:
+    """
+    프로세스 간 거래 사이클 조율기
+
+    Args:
+        lock_port: 프로세스 간 공유 락 (FallbackLockAdapter 등)
+        board: 사이클 실행 보드 (CycleRunBoard)
+        owner: 요청 주체 이름 ('scheduler', 'telegram' 등)
+        poll_interval: 보드/락 폴링 간격 (초)
+        attach_timeout: 진행 중인 사이클 결과 대기 한도 (초)
+        lock_wait: 실행 중인 사이클 없이 락만 잡혀 있을 때 대기 한도 (초)
+        lock_timeout: 락 보유 한도 (LockPort.acquire의 timeout_seconds)
+        reuse_window: 완료된 사이클 결과를 재사용하는 한도 (완료 후 경과 초)
+    """
+
+    MODE_EXECUTED = "executed"
+    MODE_ATTACHED = "attached"
+    MODE_REUSED = "reused"
+    MODE_BUSY = "busy"
+
+    def __init__(
+        self,
+        lock_port: LockPort,
+        board,
+        owner: str,
+        poll_interval: float = 2.0,
+        attach_timeout: float = 660.0,
+        lock_wait: float = 60.0,
+        lock_timeout: int = 600,
+        reuse_window: float = 120.0,
+    ):
+        self.lock_port = lock_port
+        self.board = board
+        self.owner = owner
+        self.poll_interval = poll_interval
+        self.attach_timeout = attach_timeout
+        self.lock_wait = lock_wait
+        self.lock_timeout = lock_timeout
+        self.reuse_window = reuse_window
+
+    # ------------------------------------------------------------------
+    # 락을 직접 관리하는 호출자용 (스케줄러 trading_job)
+    # ------------------------------------------------------------------
+
+    def begin(self, cycle_key: Optional[str] = None) -> Optional[int]:
+        """
+        사이클 시작 기록 (호출자가 trading_cycle 락을 보유한 상태)
+
+        Returns:
+            run id (보드 기록 실패 시 None - 거래는 계속 진행)
+        """
+        cycle_key = cycle_key or current_cycle_key()
+        try:
+            run_id = self.board.begin(cycle_key, self.owner)
+        except Exception as e:
+            Logger.print_warning(f"사이클 보드 기록 실패: {e}")
+            return None
+        self._record_request(cycle_key, self.MODE_EXECUTED, run_id)
+        return run_id
+
+    def progress(self, run_id: Optional[int], stage: str, detail: Optional[Dict[str, Any]] = None) -> None:
+        """진행 단계 기록 (attach한 프로세스에 전달됨)"""
+        if run_id is None:
+            return
+        try:
+            self.board.update_stage(run_id, stage, detail)
+        except Exception as e:
+            Logger.print_warning(f"사이클 진행 기록 실패: {e}")
+
+    def finish(self, run_id: Optional[int], result: Dict[str, Any], failed: bool = False) -> None:
+        """사이클 결과 기록"""
+        if run_id is None:
+            return
+        try:
+            self.board.finish(run_id, summarize_result(result), failed=failed)
+        except Exception as e:
+            Logger.print_warning(f"사이클 결과 기록 실패: {e}")
+
+    def record_busy(self, cycle_key: Optional[str] = None) -> None:
+        """락을 얻지 못해 건너뛴 요청 기록"""
+        self._record_request(cycle_key or current_cycle_key(), self.MODE_BUSY)
+
+    # ------------------------------------------------------------------
+    # 실행 또는 합류 (텔레그램 /run)
+    # ------------------------------------------------------------------
+
+    async def run_or_attach(
+        self,
+        run: Callable[[Optional[int]], Awaitable[Dict[str, Any]]],
+        on_progress: Optional[ProgressCallback] = None,
+        reuse_finished: bool = True,
+    ) -> CycleOutcome:
+        """
+        사이클 실행, 또는 진행 중인 사이클에 합류
+
+        Args:
+            run: 락 획득 시 실행할 코루틴 함수 (인자: run id)
+            on_progress: 합류한 사이클의 단계가 바뀔 때마다 호출 (인자: 보드 run 레코드)
+            reuse_finished: 같은 캔들의 완료된 결과가 reuse_window 안에 있으면 재사용
+
+        Returns:
+            CycleOutcome
+        """
+        started = monotonic()
+        cycle_key = current_cycle_key()
+        lock_deadline = started + self.lock_wait
+
+        while True:
+            if reuse_finished:
+                finished = self._read_board('latest_finished', cycle_key)
+                if finished is not None and time() - finished['finished_at'] <= self.reuse_window:
+                    return self._outcome(self.MODE_REUSED, cycle_key, finished, started)
+
+            if await self.lock_port.acquire(CYCLE_LOCK_NAME, timeout_seconds=self.lock_timeout):
+                try:
+                    return await self._execute(run, cycle_key, started)
+                finally:
+                    await self.lock_port.release(CYCLE_LOCK_NAME)
+
+            current = self._read_board('current_run')
+            if current is not None:
+                outcome = await self._attach(current, cycle_key, on_progress, started)
+                if outcome is not None:
+                    return outcome
+                # 합류한 사이클이 중단됨 → 락 재시도
+                continue
+
+            if monotonic() >= lock_deadline:
+                self._record_request(cycle_key, self.MODE_BUSY)
+                return CycleOutcome(
+                    mode=self.MODE_BUSY,
+                    result={
+                        'status': 'skipped',
+                        'decision': 'hold',
+                        'reason': '다른 작업이 trading_cycle 락을 보유 중입니다',
+                    },
+                    waited_seconds=monotonic() - started,
+                    stats=self.get_stats(),
+                )
+            await asyncio.sleep(self.poll_interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """최근 24시간 조율 통계 (조회 실패 시 빈 dict)"""
+        try:
+            return self.board.get_stats()
+        except Exception:
+            return {}
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    async def _execute(self, run, cycle_key: str, started: float) -> CycleOutcome:
+        run_id = self.begin(cycle_key)
+        try:
+            result = await run(run_id)
+        except Exception as e:
+            self.finish(run_id, {'status': 'failed', 'decision': 'hold', 'error': str(e)}, failed=True)
+            raise
+        self.finish(run_id, result, failed=result.get('status') == 'failed')
+        return CycleOutcome(
+            mode=self.MODE_EXECUTED,
+            result=result,
+            run=self._read_board('get_run', run_id) if run_id is not None else None,
+            waited_seconds=monotonic() - started,
+            stats=self.get_stats(),
+        )
+
+    async def _attach(
+        self,
+        run: Dict[str, Any],
+        cycle_key: str,
+        on_progress: Optional[ProgressCallback],
+        started: float,
+    ) -> Optional[CycleOutcome]:
+        """진행 중인 사이클 결과 대기 (중단되면 None)"""
+        Logger.print_info(f"🔗 진행 중인 사이클에 합류: #{run['id']} ({run['owner']})")
+        deadline = monotonic() + self.attach_timeout
+        last_stage = None
+
+        while True:
+            if run['stage'] != last_stage and on_progress is not None:
+                last_stage = run['stage']
+                try:
+                    await on_progress(run)
+                except Exception as e:
+                    Logger.print_warning(f"사이클 진행 전달 실패: {e}")
+
+            if run['status'] != 'running':
+                if run['status'] == 'abandoned':
+                    return None
+                return self._outcome(self.MODE_ATTACHED, cycle_key, run, started)
+
+            if self._read_board('is_stale', run):
+                return None
+            if monotonic() >= deadline:
+                self._record_request(cycle_key, self.MODE_BUSY, run['id'])
+                return CycleOutcome(
+                    mode=self.MODE_BUSY,
+                    result={
+                        'status': 'failed',
+                        'decision': 'hold',
+                        'error': f'진행 중인 사이클 #{run["id"]} 대기 시간 초과',
+                    },
+                    run=run,
+                    waited_seconds=monotonic() - started,
+                    stats=self.get_stats(),
+                )
+
+            await asyncio.sleep(self.poll_interval)
+            run = self._read_board('get_run', run['id'])
+            if run is None:
+                return None
+
+    def _read_board(self, method: str, *args) -> Any:
+        """보드 조회 (실패 시 None - 기록이 없는 것으로 보고 락 기준으로 진행)"""
+        try:
+            return getattr(self.board, method)(*args)
+        except Exception as e:
+            Logger.print_warning(f"사이클 보드 조회 실패 ({method}): {e}")
+            return None
+
+    def _outcome(self, mode: str, cycle_key: str, run: Dict[str, Any], started: float) -> CycleOutcome:
+        self._record_request(cycle_key, mode, run['id'])
+        return CycleOutcome(
+            mode=mode,
+            result=run.get('result') or {},
+            run=run,
+            waited_seconds=monotonic() - started,
+            stats=self.get_stats(),
+        )
+
+    def _record_request(self, cycle_key: str, outcome: str, run_id: Optional[int] = None) -> None:
+        try:
+            self.board.record_request(cycle_key, self.owner, outcome, run_id)
+            duplicate_ratio = self.board.get_stats().get('duplicate_ratio', 0.0)
+        except Exception as e:
+            Logger.print_warning(f"사이클 요청 기록 실패: {e}")
+            return
+        try:
+            from backend.app.services.metrics import record_cycle_request
+            record_cycle_request(self.owner, outcome, duplicate_ratio)
+        except Exception:
+            pass
@@ -0,0 +1,299 @@
+"""
+시장 구조 서비스 (Market Structure Service)
+
+추적 중인 모든 코인 + BTC의 일봉 종가를 날짜 기준으로 정렬한 패널로 유지하고,
+롤링 윈도우 베타/알파/상관계수 행렬을 한 번의 벡터 연산으로 계산합니다.
+새 일봉이 추가되면 윈도우 합계만 갱신하므로 (O(N²)), 파이프라인의 단일 쌍 조회와
+리스크 스테이지의 상관관계 기반 진입 제한은 캐시된 행렬을 읽기만 합니다.
+
+갱신 정책:
+- 기존 날짜의 종가가 그대로이고 뒤에 날짜만 추가됨 → 증분 갱신 (push)
+- 마지막 날짜(진행 중인 일봉)의 종가만 바뀜 → 마지막 행 교체 (+ 추가된 날짜 push)
+- 코인 추가 / 과거 종가 수정 / 날짜 누락 → 전체 재계산 (행렬곱 1회)
+- loader로 불러온 티커는 reload_seconds가 지나면 track() 시 다시 로드
+
+사용 예시:
+    structure = MarketStructureService(window=30, loader=load_closes)
+    structure.update_closes("KRW-BTC", btc_df['close'])
+    structure.update_closes("KRW-ETH", eth_df['close'])
+    pair = structure.get_pair("KRW-ETH")  # {'beta': ..., 'alpha': ..., 'correlation': ...}
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.domain.services.market_analysis import assess_market_risk
+from src.domain.services.market_structure import RollingCrossMoments, StructureSnapshot
+
+logger = logging.getLogger(__name__)
+
+CloseLoader = Callable[[str], Optional[pd.Series]]
+
+
+class MarketStructureService:
+    """
+    코인 간 상관관계/베타 행렬 캐시
+
+    Args:
+        window: 롤링 윈도우 길이 (일, 기본 30)
+        market_ticker: 시장 기준 티커 (기본 KRW-BTC)
+        loader: 패널에 없는 티커의 일봉 종가 로더 (None이면 update_closes로만 공급)
+        min_observations: 값을 신뢰할 최소 쌍별 관측 수
+        reload_seconds: 마지막 공급 후 이 시간이 지난 티커는 track() 시 loader로 다시 로드 (초)
+    """
+
+    def __init__(
+        self,
+        window: int = 30,
+        market_ticker: str = "KRW-BTC",
+        loader: Optional[CloseLoader] = None,
+        min_observations: int = 10,
+        reload_seconds: float = 3600.0
+    ):
+        self.window = window
+        self.market_ticker = market_ticker
+        self.loader = loader
+        self.min_observations = min_observations
+        self.reload_seconds = reload_seconds
+
+        self._lock = threading.Lock()
+        self._closes: Dict[str, pd.Series] = {}
+        self._supplied_at: Dict[str, float] = {}
+        self._dirty = False
+
+        # 마지막으로 계산한 패널 (티커 순서는 시장 티커가 항상 0번)
+        self._tickers: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._panel: Optional[pd.DataFrame] = None
+        self._moments: Optional[RollingCrossMoments] = None
+        self._snapshot: Optional[StructureSnapshot] = None
+
+        # 통계
+        self.full_rebuilds = 0
+        self.incremental_updates = 0
+
+    # --- 데이터 공급 ---
+
+    def update_closes(self, ticker: str, closes: pd.Series) -> None:
+        """
+        티커의 일봉 종가 갱신
+
+        Args:
+            ticker: 코인 티커
+            closes: 날짜 인덱스의 종가 시리즈
+        """
+        if closes is None or len(closes) == 0:
+            return
+        series = pd.Series(
+            np.asarray(closes, dtype=float),
+            index=pd.to_datetime(closes.index).normalize()
+        )
+        series = series[~series.index.duplicated(keep='last')].sort_index()
+
+        with self._lock:
+            self._supplied_at[ticker] = time.monotonic()
+            previous = self._closes.get(ticker)
+            if previous is not None and previous.equals(series):
+                return
+            self._closes[ticker] = series
+            self._dirty = True
+
+    def track(self, tickers: Iterable[str]) -> None:
+        """
+        패널에 없거나 reload_seconds 동안 갱신되지 않은 티커를 loader로 불러옴
+
+        Args:
+            tickers: 추적할 티커 목록
+        """
+        if self.loader is None:
+            return
+        now = time.monotonic()
+        for ticker in tickers:
+            supplied_at = self._supplied_at.get(ticker)
+            if supplied_at is not None and now - supplied_at < self.reload_seconds:
+                continue
+            try:
+                closes = self.loader(ticker)
+            except Exception as e:
+                logger.warning(f"종가 로드 실패 ({ticker}): {e}")
+                continue
+            if closes is not None:
+                self.update_closes(ticker, closes)
+
+    # --- 계산 ---
+
+    def refresh(self) -> Optional[StructureSnapshot]:
+        """
+        변경된 종가를 반영해 행렬 갱신 (변경 없으면 캐시 반환)
+
+        Returns:
+            StructureSnapshot 또는 None (시장 티커 데이터 없음)
+        """
+        with self._lock:
+            if not self._dirty:
+                return self._snapshot
+            self._dirty = False
+
+            if self.market_ticker not in self._closes:
+                return None
+
+            tickers = [self.market_ticker] + sorted(
+                t for t in self._closes if t != self.market_ticker
+            )
+            panel = pd.concat([self._closes[t] for t in tickers], axis=1, keys=tickers).sort_index()
+
+            update = self._incremental_rows(tickers, panel)
+            if update is None:
+                returns = panel.pct_change(fill_method=None).to_numpy()
+                self._moments = RollingCrossMoments.from_returns(returns[1:], self.window)
+                self.full_rebuilds += 1
+            else:
+                last_row, new_rows = update
+                if last_row is not None:
+                    self._moments.replace_last(last_row)
+                for row in new_rows:
+                    self._moments.push(row)
+                self.incremental_updates += 1
+
+            self._tickers = tickers
+            self._index = {t: i for i, t in enumerate(tickers)}
+            self._panel = panel
+            self._snapshot = self._moments.snapshot(
+                market_index=0,
+                min_observations=self.min_observations
+            )
+            return self._snapshot
+
+    def _incremental_rows(
+        self,
+        tickers: List[str],
+        panel: pd.DataFrame
+    ) -> Optional[Tuple[Optional[np.ndarray], np.ndarray]]:
+        """
+        이전 패널 대비 증분 갱신 가능 여부 판단
+
+        마지막 날짜를 제외한 과거 종가가 그대로면 증분 갱신합니다.
+        (마지막 날짜는 진행 중인 일봉이라 사이클마다 종가가 바뀜)
+
+        Returns:
+            (마지막 행 교체 수익률 또는 None, 뒤에 추가된 수익률 행) 또는 None (전체 재계산)
+        """
+        old = self._panel
+        if old is None or self._moments is None or tickers != self._tickers:
+            return None
+        size = len(old)
+        if size < 2 or len(panel) < size or not panel.index[:size].equals(old.index):
+            return None
+        if not panel.iloc[:size - 1].equals(old.iloc[:size - 1]):
+            return None
+
+        returns = panel.iloc[size - 2:].pct_change(fill_method=None).to_numpy()[1:]
+        last_changed = not panel.iloc[size - 1:size].equals(old.iloc[size - 1:size])
+        return (returns[0] if last_changed else None), returns[1:]
+
+    # --- 조회 ---
+
+    def get_pair(self, ticker: str) -> Optional[Dict[str, float]]:
+        """
+        시장(BTC) 대비 베타/알파/상관계수 조회
+
+        Args:
+            ticker: 코인 티커
+
+        Returns:
+            {'beta', 'alpha', 'correlation', 'btc_return_1d', 'market_risk',
+             'risk_reason', 'observations'} 또는 None (데이터 부족)
+        """
+        self.track([self.market_ticker, ticker])
+        snapshot = self.refresh()
+        if snapshot is None or ticker not in self._index:
+            return None
+
+        i = self._index[ticker]
+        beta = snapshot.beta[i]
+        correlation = snapshot.correlation[i, 0]
+        if np.isnan(beta) or np.isnan(correlation):
+            return None
+
+        alpha = snapshot.alpha[i]
+        btc_return = snapshot.last_returns[0]
+        btc_return_1d = 0.0 if np.isnan(btc_return) else float(btc_return * 100)
+        market_risk = assess_market_risk(btc_return_1d, float(correlation))
+
+        return {
+            'beta': float(beta),
+            'alpha': 0.0 if np.isnan(alpha) else float(alpha),
+            'correlation': float(correlation),
+            'btc_return_1d': btc_return_1d,
+            'market_risk': market_risk,
+            'risk_reason': (
+                f"BTC 1일 {btc_return_1d:+.2f}%, 상관계수 {correlation:.2f} "
+                f"({self.window}일 윈도우)"
+            ),
+            'observations': int(snapshot.observations[i, 0]),
+        }
+
+    def correlation(self, ticker_a: str, ticker_b: str) -> Optional[float]:
+        """
+        두 코인의 롤링 상관계수 (데이터 부족 시 None)
+        """
+        self.track([self.market_ticker, ticker_a, ticker_b])
+        snapshot = self.refresh()
+        if snapshot is None or ticker_a not in self._index or ticker_b not in self._index:
+            return None
+        value = snapshot.correlation[self._index[ticker_a], self._index[ticker_b]]
+        return None if np.isnan(value) else float(value)
+
+    def max_correlation(
+        self,
+        ticker: str,
+        others: Iterable[str]
+    ) -> Optional[Tuple[str, float]]:
+        """
+        ticker와 가장 상관관계가 높은 코인 조회
+
+        Args:
+            ticker: 기준 코인
+            others: 비교할 코인 목록 (보유 포지션 등)
+
+        Returns:
+            (티커, 상관계수) 또는 None (비교 가능한 코인 없음)
+        """
+        others = [t for t in others if t != ticker]
+        if not others:
+            return None
+        self.track([self.market_ticker, ticker] + others)
+        snapshot = self.refresh()
+        if snapshot is None or ticker not in self._index:
+            return None
+
+        row = snapshot.correlation[self._index[ticker]]
+        best: Optional[Tuple[str, float]] = None
+        for other in others:
+            j = self._index.get(other)
+            if j is None or np.isnan(row[j]):
+                continue
+            if best is None or row[j] > best[1]:
+                best = (other, float(row[j]))
+        return best
+
+    def correlation_matrix(self) -> pd.DataFrame:
+        """
+        전체 상관계수 행렬 (티커 × 티커)
+        """
+        snapshot = self.refresh()
+        if snapshot is None:
+            return pd.DataFrame()
+        return pd.DataFrame(snapshot.correlation, index=self._tickers, columns=self._tickers)
+
+    def get_stats(self) -> Dict[str, int]:
+        """갱신 통계"""
+        return {
+            'tickers': len(self._closes),
+            'full_rebuilds': self.full_rebuilds,
+            'incremental_updates': self.incremental_updates,
+        }
@@ -0,0 +1,315 @@
+"""
+포트폴리오 스냅샷 캐시 (Portfolio Snapshot Cache)
+
+텔레그램 봇의 /status, /positions, /balance 명령이 공유하는 짧은 TTL 스냅샷입니다.
+명령마다 PortfolioManager를 새로 만들어 잔고 + 코인별 현재가를 조회하는 대신,
+잔고 1회 + 현재가 일괄 1회 조회로 스냅샷을 만들고 TTL 동안 재사용합니다.
+
+조회 정책 (stale-while-revalidate):
+- 신선 (age < ttl): 메모리에서 즉시 반환
+- 오래됨 (ttl ≤ age < max_stale): 기존 스냅샷을 즉시 반환하고 백그라운드에서 갱신
+- 스냅샷 없음 / max_stale 초과: 갱신 완료까지 대기
+- 동시 요청은 진행 중인 갱신 1건을 공유 (single-flight)
+- invalidate() 이전에 시작된 갱신 결과는 저장하지 않음 (거래 전 잔고 복원 방지)
+
+사용 예시:
+    cache = PortfolioSnapshotCache(exchange_client=upbit_client, ttl=15.0)
+    snapshot = await cache.get()
+    print(snapshot.status.total_current_value, snapshot.age_seconds)
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+from src.position.portfolio_manager import PortfolioManager, PortfolioStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Holding:
+    """잔고 1건 (현재가 포함)"""
+    currency: str
+    amount: float
+    avg_buy_price: float
+    current_price: Optional[float]
+
+    @property
+    def value(self) -> float:
+        """평가금액 (현재가가 없으면 0)"""
+        return self.amount * self.current_price if self.current_price else 0.0
+
+    @property
+    def profit_rate(self) -> float:
+        """수익률 (%)"""
+        if not self.current_price or self.avg_buy_price <= 0:
+            return 0.0
+        return (self.current_price - self.avg_buy_price) / self.avg_buy_price * 100
+
+
+@dataclass
+class PortfolioSnapshot:
+    """한 시점의 포트폴리오 조회 결과"""
+    status: PortfolioStatus
+    holdings: List[Holding]
+    fetched_at: datetime = field(default_factory=datetime.now)
+    fetched_monotonic: float = field(default_factory=monotonic, repr=False)
+
+    @property
+    def age_seconds(self) -> float:
+        """조회 후 경과 시간 (초)"""
+        return monotonic() - self.fetched_monotonic
+
+    @property
+    def total_value(self) -> float:
+        """KRW + 현재가가 있는 모든 코인 평가금액"""
+        return self.status.krw_balance + sum(h.value for h in self.holdings)
+
+
+class _PrefetchedExchange:
+    """
+    미리 조회한 잔고/시세로 PortfolioManager 조회에 응답하는 읽기 전용 거래소
+
+    PortfolioManager.get_portfolio_status()의 판단 로직(최소 포지션 가치, 거래 모드 등)을
+    그대로 쓰면서 API 호출은 스냅샷 생성 시의 2회로 제한합니다.
+    """
+
+    def __init__(self, balances: List[Dict[str, Any]], prices: Dict[str, float]):
+        self._balances = balances
+        self._prices = prices
+
+    def get_balances(self) -> List[Dict[str, Any]]:
+        return self._balances
+
+    def get_balance(self, currency: str) -> float:
+        for balance in self._balances:
+            if balance.get('currency') == currency:
+                return float(balance.get('balance', 0))
+        return 0.0
+
+    def get_current_price(self, ticker: str) -> Optional[float]:
+        return self._prices.get(ticker)
+
+
+def fetch_prices(exchange_client, tickers: List[str]) -> Dict[str, float]:
+    """
+    현재가 조회 (일괄 조회 지원 시 1회, 실패 시 티커별 조회)
+
+    Args:
+        exchange_client: 거래소 클라이언트
+        tickers: 티커 리스트
+
+    Returns:
+        {티커: 현재가} (조회 실패 티커 제외)
+    """
+    if not tickers:
+        return {}
+
+    batch = getattr(exchange_client, 'get_current_prices', None)
+    if batch is not None:
+        try:
+            return batch(tickers)
+        except Exception as e:
+            # 상장 폐지 티커 등 하나가 일괄 조회 전체를 실패시키는 경우
+            logger.warning(f"현재가 일괄 조회 실패, 개별 조회로 전환: {e}")
+
+    prices: Dict[str, float] = {}
+    for ticker in tickers:
+        try:
+            price = exchange_client.get_current_price(ticker)
+        except Exception as e:
+            logger.warning(f"{ticker} 현재가 조회 실패: {e}")
+            continue
+        if price:
+            prices[ticker] = float(price)
+    return prices
+
+
+def build_portfolio_snapshot(exchange_client) -> PortfolioSnapshot:
+    """
+    잔고 1회 + 현재가 일괄 1회 조회로 스냅샷 생성 (블로킹)
+
+    Args:
+        exchange_client: 거래소 클라이언트
+
+    Returns:
+        PortfolioSnapshot
+    """
+    balances = exchange_client.get_balances() or []
+
+    holdings_raw = []
+    for balance in balances:
+        currency = balance.get('currency', '')
+        if not currency or currency == 'KRW':
+            continue
+        free = float(balance.get('balance', 0))
+        locked = float(balance.get('locked', 0))
+        if free + locked <= 0:
+            continue
+        holdings_raw.append((currency, free, float(balance.get('avg_buy_price', 0))))
+
+    prices = fetch_prices(exchange_client, [f"KRW-{currency}" for currency, _, _ in holdings_raw])
+
+    status = PortfolioManager(
+        exchange_client=_PrefetchedExchange(balances, prices)
+    ).get_portfolio_status()
+
+    holdings = [
+        Holding(
+            currency=currency,
+            amount=amount,
+            avg_buy_price=avg_buy_price,
+            current_price=prices.get(f"KRW-{currency}"),
+        )
+        for currency, amount, avg_buy_price in holdings_raw
+        if amount > 0
+    ]
+    return PortfolioSnapshot(status=status, holdings=holdings)
+
+
+class PortfolioSnapshotCache:
+    """
+    TTL 포트폴리오 스냅샷 캐시
+
+    asyncio 이벤트 루프 1개에서 사용합니다. 거래소 조회는 블로킹이므로
+    asyncio.to_thread로 실행하여 루프(다른 명령 응답)를 막지 않습니다.
+
+    Args:
+        exchange_client: 거래소 클라이언트 (get_balances, get_current_price[s])
+        ttl: 스냅샷 유효 시간 (초)
+        max_stale: 이 시간보다 오래된 스냅샷은 반환하지 않고 갱신을 기다림 (초)
+    """
+
+    def __init__(self, exchange_client, ttl: float = 15.0, max_stale: float = 300.0):
+        self.exchange_client = exchange_client
+        self.ttl = float(ttl)
+        self.max_stale = max(float(max_stale), self.ttl)
+
+        self._snapshot: Optional[PortfolioSnapshot] = None
+        self._inflight: Optional[asyncio.Task] = None
+        # invalidate() 마다 증가, 시작 시점과 다른 갱신 결과는 버림
+        self._generation = 0
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._errors = 0
+        self._last_error: Optional[str] = None
+
+    @property
+    def snapshot(self) -> Optional[PortfolioSnapshot]:
+        """현재 보유 스냅샷 (없으면 None, 갱신하지 않음)"""
+        return self._snapshot
+
+    async def get(self) -> PortfolioSnapshot:
+        """
+        스냅샷 조회
+
+        Returns:
+            PortfolioSnapshot (신선하거나 max_stale 이내의 스냅샷)
+
+        Raises:
+            스냅샷이 없거나 너무 오래된 상태에서 갱신이 실패하면 거래소 예외
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            age = snapshot.age_seconds
+            if age < self.ttl:
+                self._hits += 1
+                return snapshot
+            if age < self.max_stale:
+                self._stale_hits += 1
+                self._start_refresh()
+                return snapshot
+
+        self._misses += 1
+        return await self.refresh()
+
+    async def refresh(self) -> PortfolioSnapshot:
+        """
+        즉시 갱신 (진행 중인 갱신이 있으면 그 결과를 공유)
+
+        Returns:
+            새 PortfolioSnapshot
+        """
+        task = self._start_refresh()
+        # 요청한 쪽이 취소되어도 공유 중인 갱신은 계속 진행
+        return await asyncio.shield(task)
+
+    def invalidate(self) -> None:
+        """
+        스냅샷 폐기 (거래 직후 등 잔고가 바뀐 것이 확실할 때)
+
+        진행 중인 갱신은 거래 전 잔고를 읽었을 수 있으므로 공유 대상에서 분리하고
+        완료되더라도 스냅샷으로 저장하지 않습니다.
+        """
+        self._generation += 1
+        self._snapshot = None
+        self._inflight = None
+
+    async def aclose(self) -> None:
+        """진행 중인 갱신 취소"""
+        task, self._inflight = self._inflight, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        snapshot = self._snapshot
+        return {
+            'ttl': self.ttl,
+            'max_stale': self.max_stale,
+            'age_seconds': snapshot.age_seconds if snapshot is not None else None,
+            'refreshing': self._inflight is not None and not self._inflight.done(),
+            'hits': self._hits,
+            'stale_hits': self._stale_hits,
+            'misses': self._misses,
+            'refreshes': self._refreshes,
+            'errors': self._errors,
+            'last_error': self._last_error,
+        }
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    def _start_refresh(self) -> asyncio.Task:
+        """갱신 태스크 시작 (이미 진행 중이면 기존 태스크 반환)"""
+        loop = asyncio.get_running_loop()
+        task = self._inflight
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return task
+        task = loop.create_task(self._refresh(self._generation))
+        task.add_done_callback(self._consume_error)
+        self._inflight = task
+        return task
+
+    async def _refresh(self, generation: int) -> PortfolioSnapshot:
+        try:
+            snapshot = await asyncio.to_thread(build_portfolio_snapshot, self.exchange_client)
+        except Exception as e:
+            self._errors += 1
+            self._last_error = str(e)
+            logger.warning(f"포트폴리오 스냅샷 갱신 실패: {e}")
+            raise
+        if generation != self._generation:
+            # 조회 도중 invalidate() 됨 - 이 결과는 요청한 쪽에만 반환
+            return snapshot
+        self._snapshot = snapshot
+        self._refreshes += 1
+        self._last_error = None
+        return snapshot
+
+    @staticmethod
+    def _consume_error(task: asyncio.Task) -> None:
+        """백그라운드 갱신 실패가 'exception was never retrieved'로 남지 않도록 소비"""
+        if not task.cancelled():
+            task.exception()
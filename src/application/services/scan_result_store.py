@@ -0,0 +1,145 @@
+"""
+스캔 결과 저장소 (Scan Result Store)
+
+스케줄러가 사이클마다 만든 멀티코인 스캔 결과를 파일 1개에 남겨
+다른 프로세스(텔레그램 봇)가 스캔을 다시 돌리지 않고 읽을 수 있게 합니다.
+
+- 저장: 임시 파일에 쓴 뒤 os.replace로 교체 (읽는 쪽은 항상 완전한 파일을 봄)
+- 조회: 파일 mtime이 바뀌었을 때만 다시 읽고, 그 외에는 메모리 캐시 반환
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCAN_RESULT_PATH = Path("data/last_scan.json")
+
+
+def _json_default(value: Any) -> Any:
+    """numpy 스칼라/datetime 등 JSON 비호환 값 변환"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class ScanResultStore:
+    """
+    마지막 스캔 결과 파일 저장소
+
+    Args:
+        path: JSON 파일 경로
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_SCAN_RESULT_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_mtime_ns: Optional[int] = None
+
+    def save(self, result: Dict[str, Any], saved_at: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        스캔 결과 저장
+
+        Args:
+            result: 스캔 콜백 데이터 또는 거래 사이클 결과
+                (scan_summary/scan_result, selected_coin, all_backtest_results/backtest_results)
+            saved_at: 저장 시각 (기본: 현재)
+
+        Returns:
+            저장된 레코드
+        """
+        record = {
+            'ticker': result.get('ticker'),
+            'scan_summary': result.get('scan_summary') or result.get('scan_result') or {},
+            'selected_coin': result.get('selected_coin'),
+            'all_backtest_results': (
+                result.get('all_backtest_results') or result.get('backtest_results') or []
+            ),
+            'saved_at': (saved_at or datetime.now()).isoformat(),
+        }
+        payload = json.dumps(record, ensure_ascii=False, default=_json_default)
+
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{self.path.name}.", suffix=".tmp", dir=str(self.path.parent)
+            )
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            # 방금 쓴 내용은 다시 읽지 않도록 캐시
+            self._cached = json.loads(payload)
+            self._cached_mtime_ns = self.path.stat().st_mtime_ns
+        return record
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        마지막 스캔 결과 조회
+
+        Returns:
+            저장된 레코드 (파일이 없거나 읽을 수 없으면 None).
+            'saved_at'은 ISO 문자열입니다.
+        """
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            if self._cached is not None and mtime_ns == self._cached_mtime_ns:
+                return self._cached
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    record = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"스캔 결과 파일 로드 실패: {e}")
+                return self._cached
+            self._cached = record
+            self._cached_mtime_ns = mtime_ns
+            return record
+
+    def age_seconds(self, record: Optional[Dict[str, Any]] = None) -> Optional[float]:
+        """저장 후 경과 시간 (초, 레코드가 없으면 None)"""
+        record = record if record is not None else self.load()
+        if not record or not record.get('saved_at'):
+            return None
+        try:
+            saved_at = datetime.fromisoformat(record['saved_at'])
+        except ValueError:
+            return None
+        return (datetime.now() - saved_at).total_seconds()
+
+
+_store: Optional[ScanResultStore] = None
+
+
+def get_scan_result_store() -> ScanResultStore:
+    """
+    프로세스 공용 ScanResultStore 반환
+
+    경로는 settings.SCAN_RESULT_PATH (backend 설정을 쓸 수 없으면 기본 경로)
+    """
+    global _store
+    if _store is None:
+        try:
+            from backend.app.core.config import settings
+            path = settings.SCAN_RESULT_PATH
+        except Exception:
+            path = DEFAULT_SCAN_RESULT_PATH
+        _store = ScanResultStore(path)
+    return _store
@@ -16,6 +16,8 @@ from datetime import datetime, timezone
 
 if TYPE_CHECKING:
     from src.container import Container
+    from src.application.services.trading_runtime import TradingRuntime
+    from src.application.ports.outbound.lock_port import LockLease
 
 from src.trading.pipeline import (
     create_hybrid_trading_pipeline,
@@ -55,14 +57,23 @@ class TradingOrchestrator:
 
         # 포지션 관리 실행
         result = await orchestrator.execute_position_management()
+
+        # 장기 실행 런타임 사용 (스케줄러)
+        orchestrator = TradingOrchestrator(container=container, runtime=runtime)
     """
 
-    def __init__(self, container: 'Container') -> None:
+    def __init__(
+        self,
+        container: 'Container',
+        runtime: Optional['TradingRuntime'] = None
+    ) -> None:
         """
         초기화
 
         Args:
             container: 의존성 컨테이너 (필수)
+            runtime: 장기 실행 런타임 (있으면 캐시된 파이프라인 재사용,
+                     None이면 사이클마다 파이프라인 생성)
 
         Raises:
             ValueError: container가 None인 경우
@@ -70,6 +81,7 @@ class TradingOrchestrator:
         if container is None:
             raise ValueError("Container is required")
         self._container = container
+        self._runtime = runtime
         self._on_backtest_complete: Optional[Callable] = None
 
     def set_on_backtest_complete(self, callback: Callable) -> None:
@@ -96,7 +108,8 @@ class TradingOrchestrator:
         liquidity_top_n: int = 10,
         min_volume_krw: float = 10_000_000_000,
         backtest_top_n: int = 5,
-        final_select_n: int = 2
+        final_select_n: int = 2,
+        lock_lease: Optional['LockLease'] = None
     ) -> Dict[str, Any]:
         """
         거래 사이클 실행 (하이브리드 파이프라인)
@@ -120,6 +133,8 @@ class TradingOrchestrator:
             min_volume_krw: 최소 거래대금 (기본 100억원)
             backtest_top_n: 백테스팅 통과 상위 N개 (기본 5)
             final_select_n: 최종 선택 N개 (기본 2)
+            lock_lease: 호출자가 보유한 trading_cycle 락 lease
+                        (주문 직전 fencing token 검증, None이면 검증 생략)
 
         Returns:
             {
@@ -187,8 +202,13 @@ class TradingOrchestrator:
                     f"거래 타입 '{trading_type}'는 아직 지원되지 않습니다."
                 )
 
-            # 3. 하이브리드 파이프라인 생성
-            pipeline = create_hybrid_trading_pipeline(
+            # 3. 하이브리드 파이프라인 획득 (런타임이 있으면 캐시 재사용)
+            pipeline_factory = (
+                self._runtime.get_trading_pipeline
+                if self._runtime is not None
+                else create_hybrid_trading_pipeline
+            )
+            pipeline = pipeline_factory(
                 # 리스크 관리 파라미터
                 stop_loss_pct=stop_loss_pct,
                 take_profit_pct=take_profit_pct,
@@ -219,11 +239,14 @@ class TradingOrchestrator:
                 data_collector=data_collector,
                 trading_service=trading_service,
                 ai_service=ai_service,
-                on_backtest_complete=self._on_backtest_complete
+                on_backtest_complete=self._on_backtest_complete,
+                lock_lease=lock_lease
             )
 
             # 4. 파이프라인 실행
             result = await pipeline.execute(context)
+            if self._runtime is not None:
+                self._runtime.record_cycle('trading')
 
             # 5. 성공 시 idempotency 키 마킹
             if result.get('status') in ['success', 'skipped']:
@@ -253,7 +276,8 @@ class TradingOrchestrator:
         # 리스크 관리 파라미터
         stop_loss_pct: float = -5.0,
         take_profit_pct: float = 10.0,
-        max_positions: int = 3
+        max_positions: int = 3,
+        lock_lease: Optional['LockLease'] = None
     ) -> Dict[str, Any]:
         """
         포지션 관리 전용 사이클 실행 (15분 주기용)
@@ -265,6 +289,7 @@ class TradingOrchestrator:
             stop_loss_pct: 손절 비율 (기본 -5%)
             take_profit_pct: 익절 비율 (기본 +10%)
             max_positions: 최대 동시 포지션 수 (기본 3)
+            lock_lease: 호출자가 보유한 trading_cycle 락 lease (fencing token 검증용)
 
         Returns:
             {
@@ -279,8 +304,13 @@ class TradingOrchestrator:
         try:
             Logger.print_header("🔄 포지션 관리 사이클 (15분)")
 
-            # 포지션 관리 전용 파이프라인 생성
-            pipeline = create_position_management_pipeline(
+            # 포지션 관리 전용 파이프라인 획득 (런타임이 있으면 캐시 재사용)
+            pipeline_factory = (
+                self._runtime.get_position_management_pipeline
+                if self._runtime is not None
+                else create_position_management_pipeline
+            )
+            pipeline = pipeline_factory(
                 stop_loss_pct=stop_loss_pct,
                 take_profit_pct=take_profit_pct,
                 max_positions=max_positions
@@ -299,11 +329,14 @@ class TradingOrchestrator:
                 upbit_client=upbit_client,
                 data_collector=data_collector,
                 trading_service=trading_service,
-                ai_service=None  # 포지션 관리는 AI 불필요
+                ai_service=None,  # 포지션 관리는 AI 불필요
+                lock_lease=lock_lease
             )
 
             # 파이프라인 실행
             result = await pipeline.execute(context)
+            if self._runtime is not None:
+                self._runtime.record_cycle('position_management')
 
             # 결과에 포지션 관리 정보 추가
             result['cycle_type'] = 'position_management'
@@ -0,0 +1,376 @@
+"""
+트레이딩 런타임 (Long-lived Trading Runtime)
+
+스케줄러 프로세스가 소유하는 장기 실행 런타임입니다.
+사이클마다 파이프라인/스캐너/스레드 풀을 새로 만드는 대신,
+한 번 생성한 컴포넌트를 프로세스 수명 동안 재사용합니다.
+
+주요 책임:
+- 파이프라인 캐싱 (파라미터 조합별 1회 생성)
+- 스캐너 컴포넌트 공유 (LiquidityScanner, HistoricalDataSync, MultiCoinBacktest)
+- 스캔 전용 Executor 유지 (사이클당 스레드 생성 0)
+- 명시적 수명 주기 관리 (start → health → shutdown)
+
+사용 예시:
+    runtime = TradingRuntime()
+    runtime.start()
+
+    orchestrator = TradingOrchestrator(container=container, runtime=runtime)
+    await orchestrator.execute_trading_cycle(ticker="KRW-BTC")
+
+    print(runtime.health())
+    runtime.shutdown()
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import monotonic
+from typing import Dict, Any, Optional, Tuple
+
+from src.trading.pipeline import (
+    TradingPipeline,
+    create_hybrid_trading_pipeline,
+    create_position_management_pipeline,
+)
+from src.utils.logger import Logger
+
+
+class TradingRuntime:
+    """
+    장기 실행 트레이딩 런타임
+
+    파이프라인 스테이지, 코인 선택기, 스레드 풀을 프로세스 수명 동안 유지합니다.
+    get_*_pipeline() 호출 시 시작되지 않은 상태라면 자동으로 start()합니다.
+
+    Args:
+        data_dir: 과거 데이터 저장 디렉토리 (HistoricalDataSync 공유)
+        scan_workers: 스캔 전용 Executor 워커 수
+    """
+
+    STATE_CREATED = "created"
+    STATE_RUNNING = "running"
+    STATE_STOPPED = "stopped"
+
+    def __init__(
+        self,
+        data_dir: str = "./data/historical",
+        scan_workers: int = 1
+    ) -> None:
+        self.data_dir = data_dir
+        self.scan_workers = scan_workers
+
+        self._state = self.STATE_CREATED
+        self._lock = threading.Lock()
+        self._started_at: Optional[datetime] = None
+        self._started_monotonic: Optional[float] = None
+
+        # 공유 컴포넌트 (start()에서 생성)
+        self._scan_executor: Optional[ThreadPoolExecutor] = None
+        self._data_sync = None
+        self._multi_backtest = None
+        self._universe_prefilter = None
+        self._market_structure = None
+
+        # 캐시
+        self._pipelines: Dict[Tuple, TradingPipeline] = {}
+        self._coin_selectors: Dict[Tuple, Any] = {}
+
+        # 사이클 통계
+        self._cycle_counts: Dict[str, int] = {}
+        self._last_cycle_at: Optional[datetime] = None
+
+    # --- Lifecycle ---
+
+    @property
+    def is_running(self) -> bool:
+        """런타임 실행 여부"""
+        return self._state == self.STATE_RUNNING
+
+    def start(self) -> None:
+        """
+        런타임 시작
+
+        스캔 Executor와 공유 스캐너 컴포넌트를 생성합니다.
+        이미 실행 중이면 아무 작업도 하지 않습니다.
+        """
+        with self._lock:
+            if self._state == self.STATE_RUNNING:
+                return
+
+            self._scan_executor = ThreadPoolExecutor(
+                max_workers=self.scan_workers,
+                thread_name_prefix="trading_scan"
+            )
+            self._state = self.STATE_RUNNING
+            self._started_at = datetime.now()
+            self._started_monotonic = monotonic()
+
+        Logger.print_info("✅ TradingRuntime 시작")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        런타임 종료
+
+        캐시된 파이프라인을 해제하고 모든 Executor를 종료합니다.
+        shutdown() 이후 start()로 다시 시작할 수 있습니다.
+
+        Args:
+            wait: True면 실행 중인 스캔이 끝날 때까지 대기
+        """
+        with self._lock:
+            if self._state != self.STATE_RUNNING:
+                return
+
+            self._pipelines.clear()
+            self._coin_selectors.clear()
+
+            if self._multi_backtest is not None:
+                self._multi_backtest.close()
+                self._multi_backtest = None
+            if self._data_sync is not None:
+                self._data_sync.close()
+                self._data_sync = None
+            self._universe_prefilter = None
+            self._market_structure = None
+            if self._scan_executor is not None:
+                self._scan_executor.shutdown(wait=wait)
+                self._scan_executor = None
+
+            self._state = self.STATE_STOPPED
+
+        Logger.print_info("✅ TradingRuntime 종료")
+
+    def health(self) -> Dict[str, Any]:
+        """
+        런타임 상태 조회
+
+        Returns:
+            {
+                'status': 'created' | 'running' | 'stopped',
+                'started_at': str | None,
+                'uptime_seconds': float,
+                'cycles': Dict[str, int],
+                'last_cycle_at': str | None,
+                'cached_pipelines': int,
+                'cached_coin_selectors': int,
+                'scan_executor_alive': bool,
+                'thread_count': int
+            }
+        """
+        uptime = 0.0
+        if self.is_running and self._started_monotonic is not None:
+            uptime = monotonic() - self._started_monotonic
+
+        return {
+            'status': self._state,
+            'started_at': self._started_at.isoformat() if self._started_at else None,
+            'uptime_seconds': uptime,
+            'cycles': dict(self._cycle_counts),
+            'last_cycle_at': self._last_cycle_at.isoformat() if self._last_cycle_at else None,
+            'cached_pipelines': len(self._pipelines),
+            'cached_coin_selectors': len(self._coin_selectors),
+            'scan_executor_alive': self._scan_executor is not None,
+            'thread_count': threading.active_count(),
+        }
+
+    def record_cycle(self, cycle_type: str) -> None:
+        """
+        사이클 완료 기록
+
+        Args:
+            cycle_type: 사이클 종류 ('trading', 'position_management')
+        """
+        self._cycle_counts[cycle_type] = self._cycle_counts.get(cycle_type, 0) + 1
+        self._last_cycle_at = datetime.now()
+
+    # --- Pipelines ---
+
+    def get_trading_pipeline(
+        self,
+        stop_loss_pct: float = -5.0,
+        take_profit_pct: float = 10.0,
+        daily_loss_limit_pct: float = -10.0,
+        min_trade_interval_hours: int = 4,
+        max_positions: int = 3,
+        enable_scanning: bool = True,
+        fallback_ticker: str = "KRW-ETH",
+        liquidity_top_n: int = 10,
+        min_volume_krw: float = 10_000_000_000,
+        backtest_top_n: int = 5,
+        final_select_n: int = 2
+    ) -> TradingPipeline:
+        """
+        하이브리드 트레이딩 파이프라인 반환 (파라미터 조합별 캐싱)
+
+        인자는 create_hybrid_trading_pipeline()과 동일합니다.
+        스캔이 활성화된 경우 공유 코인 선택기와 스캔 Executor를 주입합니다.
+
+        Returns:
+            TradingPipeline: 캐시된 하이브리드 파이프라인
+        """
+        self._ensure_started()
+
+        key = (
+            'hybrid', stop_loss_pct, take_profit_pct, daily_loss_limit_pct,
+            min_trade_interval_hours, max_positions, enable_scanning, fallback_ticker,
+            liquidity_top_n, min_volume_krw, backtest_top_n, final_select_n
+        )
+        pipeline = self._pipelines.get(key)
+        if pipeline is not None:
+            return pipeline
+
+        coin_selector = None
+        if enable_scanning:
+            coin_selector = self.get_coin_selector(
+                liquidity_top_n=liquidity_top_n,
+                min_volume_krw=min_volume_krw,
+                backtest_top_n=backtest_top_n,
+                final_select_n=final_select_n
+            )
+
+        pipeline = create_hybrid_trading_pipeline(
+            stop_loss_pct=stop_loss_pct,
+            take_profit_pct=take_profit_pct,
+            daily_loss_limit_pct=daily_loss_limit_pct,
+            min_trade_interval_hours=min_trade_interval_hours,
+            max_positions=max_positions,
+            enable_scanning=enable_scanning,
+            fallback_ticker=fallback_ticker,
+            liquidity_top_n=liquidity_top_n,
+            min_volume_krw=min_volume_krw,
+            backtest_top_n=backtest_top_n,
+            final_select_n=final_select_n,
+            coin_selector=coin_selector,
+            scan_executor=self._scan_executor,
+            market_structure=self._get_market_structure()
+        )
+        self._pipelines[key] = pipeline
+        return pipeline
+
+    def get_position_management_pipeline(
+        self,
+        stop_loss_pct: float = -5.0,
+        take_profit_pct: float = 10.0,
+        max_positions: int = 3
+    ) -> TradingPipeline:
+        """
+        포지션 관리 파이프라인 반환 (파라미터 조합별 캐싱)
+
+        Returns:
+            TradingPipeline: 캐시된 포지션 관리 파이프라인
+        """
+        self._ensure_started()
+
+        key = ('position_management', stop_loss_pct, take_profit_pct, max_positions)
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            pipeline = create_position_management_pipeline(
+                stop_loss_pct=stop_loss_pct,
+                take_profit_pct=take_profit_pct,
+                max_positions=max_positions
+            )
+            self._pipelines[key] = pipeline
+        return pipeline
+
+    # --- Scanner ---
+
+    def get_coin_selector(
+        self,
+        liquidity_top_n: int = 10,
+        min_volume_krw: float = 10_000_000_000,
+        backtest_top_n: int = 5,
+        final_select_n: int = 2
+    ):
+        """
+        코인 선택기 반환 (스캔 설정별 캐싱)
+
+        HistoricalDataSync와 MultiCoinBacktest는 모든 선택기가 공유합니다.
+
+        Returns:
+            CoinSelector: 캐시된 코인 선택기
+        """
+        self._ensure_started()
+
+        key = (liquidity_top_n, min_volume_krw, backtest_top_n, final_select_n)
+        selector = self._coin_selectors.get(key)
+        if selector is None:
+            selector = self._build_coin_selector(
+                liquidity_top_n=liquidity_top_n,
+                min_volume_krw=min_volume_krw,
+                backtest_top_n=backtest_top_n,
+                final_select_n=final_select_n
+            )
+            self._coin_selectors[key] = selector
+        return selector
+
+    def _get_market_structure(self):
+        """공유 시장 구조 서비스 반환 (패널에 없는 코인은 저장된 일봉에서 로드)"""
+        if self._market_structure is None:
+            from src.application.services.market_structure import MarketStructureService
+            from src.scanner.data_sync import HistoricalDataSync
+            from src.config.settings import TradingConfig
+
+            if self._data_sync is None:
+                self._data_sync = HistoricalDataSync(data_dir=self.data_dir)
+            data_sync = self._data_sync
+
+            def load_closes(ticker: str):
+                df = data_sync.load_data(ticker)
+                return df['close'] if df is not None and 'close' in df else None
+
+            self._market_structure = MarketStructureService(
+                window=TradingConfig.CORRELATION_WINDOW_DAYS,
+                loader=load_closes
+            )
+        return self._market_structure
+
+    def _build_coin_selector(
+        self,
+        liquidity_top_n: int,
+        min_volume_krw: float,
+        backtest_top_n: int,
+        final_select_n: int
+    ):
+        """공유 컴포넌트로 CoinSelector 생성"""
+        from src.scanner.coin_selector import CoinSelector
+        from src.scanner.liquidity_scanner import LiquidityScanner
+        from src.scanner.data_sync import HistoricalDataSync
+        from src.scanner.multi_backtest import MultiCoinBacktest
+        from src.scanner.universe_prefilter import create_universe_prefilter
+        from src.backtesting.monte_carlo import create_monte_carlo_simulator
+        from src.config.settings import ScannerConfig
+
+        if self._data_sync is None:
+            self._data_sync = HistoricalDataSync(data_dir=self.data_dir)
+        if self._multi_backtest is None:
+            self._multi_backtest = MultiCoinBacktest(data_sync=self._data_sync)
+
+        liquidity_scanner = LiquidityScanner(min_volume_krw=min_volume_krw)
+        universe_prefilter = None
+        if ScannerConfig.PREFILTER_ENABLED:
+            # 일봉 캐시는 선택기 간 공유 (하루 한 번만 수집)
+            if self._universe_prefilter is None:
+                self._universe_prefilter = create_universe_prefilter(
+                    liquidity_scanner=LiquidityScanner(),
+                    data_dir=self.data_dir
+                )
+            universe_prefilter = self._universe_prefilter
+
+        return CoinSelector(
+            liquidity_scanner=liquidity_scanner,
+            data_sync=self._data_sync,
+            multi_backtest=self._multi_backtest,
+            entry_analyzer=None,  # AI 분석은 AnalysisStage에서
+            liquidity_top_n=liquidity_top_n,
+            min_volume_krw=min_volume_krw,
+            backtest_top_n=backtest_top_n,
+            ai_top_n=0,
+            final_select_n=final_select_n,
+            universe_prefilter=universe_prefilter,
+            monte_carlo=create_monte_carlo_simulator() if ScannerConfig.MONTE_CARLO_GATE else None
+        )
+
+    def _ensure_started(self) -> None:
+        """시작되지 않았으면 자동 시작"""
+        if not self.is_running:
+            self.start()
@@ -6,16 +6,21 @@ with proper validation, fee calculation, and trade recording.
 """
 from decimal import Decimal
 from datetime import datetime
+from typing import Optional, TYPE_CHECKING
 import re
 from uuid import uuid4
 
 from src.application.ports.outbound.exchange_port import ExchangePort
+from src.application.ports.outbound.lock_port import LockLease, LockPort
 from src.application.ports.outbound.persistence_port import PersistencePort
 from src.application.dto.trading import OrderResponse
 from src.domain.entities.trade import Trade, OrderSide, TradeStatus
 from src.domain.value_objects.money import Money, Currency
 from src.config.settings import TradingConfig
 
+if TYPE_CHECKING:
+    from src.application.use_cases.manage_position import ManagePositionUseCase
+
 
 # Minimum order amount in KRW
 MIN_ORDER_AMOUNT = Decimal("5000")
@@ -35,6 +40,8 @@ class ExecuteTradeUseCase:
         self,
         exchange: ExchangePort,
         persistence: PersistencePort,
+        position_manager: Optional["ManagePositionUseCase"] = None,
+        lock_port: Optional[LockPort] = None,
     ):
         """
         Initialize with required ports.
@@ -42,14 +49,51 @@ class ExecuteTradeUseCase:
         Args:
             exchange: Exchange port for order execution
             persistence: Persistence port for trade recording
+            position_manager: Keeps persisted positions in sync with executed trades
+            lock_port: Validates fencing tokens of leases passed to execute_*
         """
         self.exchange = exchange
         self.persistence = persistence
+        self.position_manager = position_manager
+        self.lock_port = lock_port
+
+    async def _check_lease(
+        self,
+        lease: Optional[LockLease],
+        ticker: str,
+        side: OrderSide,
+    ) -> Optional[OrderResponse]:
+        """
+        Fencing check before an order is sent.
+
+        Returns:
+            Failure response if the lease is no longer current, else None
+        """
+        if lease is None or self.lock_port is None:
+            return None
+        if await self.lock_port.validate_lease(lease):
+            return None
+        return OrderResponse.failure_response(
+            ticker=ticker,
+            side=side,
+            error_message=(
+                f"Lock lease {lease.lock_name} expired (fencing token {lease.token}); "
+                "order not sent"
+            ),
+        )
+
+    async def _record_trade(self, trade: Trade) -> None:
+        """Persist an executed trade and apply it to the stored position."""
+        await self.persistence.save_trade(trade)
+        # Fills without a reported volume are left to periodic reconciliation
+        if self.position_manager is not None and trade.volume > 0:
+            await self.position_manager.update_position_from_trade(trade)
 
     async def execute_buy(
         self,
         ticker: str,
         amount: Money,
+        lease: Optional[LockLease] = None,
     ) -> OrderResponse:
         """
         Execute a market buy order.
@@ -57,6 +101,7 @@ class ExecuteTradeUseCase:
         Args:
             ticker: Trading pair (e.g., "KRW-BTC")
             amount: Amount to spend in KRW
+            lease: Lock lease the caller runs under (fencing-checked before the order)
 
         Returns:
             OrderResponse with execution result
@@ -94,13 +139,18 @@ class ExecuteTradeUseCase:
                 error_message=f"Insufficient balance. Available: {balance.available.amount}, Required: {amount.amount}",
             )
 
+        # Reject if the caller's lock lease has lapsed
+        fenced = await self._check_lease(lease, ticker, OrderSide.BUY)
+        if fenced is not None:
+            return fenced
+
         # Execute the order
         response = await self.exchange.execute_market_buy(ticker, amount)
 
         # Record trade if successful
         if response.success:
             trade = self._create_trade_from_response(response, OrderSide.BUY)
-            await self.persistence.save_trade(trade)
+            await self._record_trade(trade)
 
         return response
 
@@ -108,6 +158,7 @@ class ExecuteTradeUseCase:
         self,
         ticker: str,
         volume: Decimal,
+        lease: Optional[LockLease] = None,
     ) -> OrderResponse:
         """
         Execute a market sell order.
@@ -115,6 +166,7 @@ class ExecuteTradeUseCase:
         Args:
             ticker: Trading pair (e.g., "KRW-BTC")
             volume: Volume to sell
+            lease: Lock lease the caller runs under (fencing-checked before the order)
 
         Returns:
             OrderResponse with execution result
@@ -151,22 +203,32 @@ class ExecuteTradeUseCase:
                 error_message=f"Insufficient holdings. Available: {position.volume}, Requested: {volume}",
             )
 
+        # Reject if the caller's lock lease has lapsed
+        fenced = await self._check_lease(lease, ticker, OrderSide.SELL)
+        if fenced is not None:
+            return fenced
+
         # Execute the order
         response = await self.exchange.execute_market_sell(ticker, volume)
 
         # Record trade if successful
         if response.success:
             trade = self._create_trade_from_response(response, OrderSide.SELL)
-            await self.persistence.save_trade(trade)
+            await self._record_trade(trade)
 
         return response
 
-    async def execute_sell_all(self, ticker: str) -> OrderResponse:
+    async def execute_sell_all(
+        self,
+        ticker: str,
+        lease: Optional[LockLease] = None,
+    ) -> OrderResponse:
         """
         Sell entire position for a ticker.
 
         Args:
             ticker: Trading pair
+            lease: Lock lease the caller runs under (fencing-checked before the order)
 
         Returns:
             OrderResponse with execution result
@@ -189,7 +251,7 @@ class ExecuteTradeUseCase:
             )
 
         # Sell entire position
-        return await self.execute_sell(ticker, position.volume)
+        return await self.execute_sell(ticker, position.volume, lease=lease)
 
     def _validate_ticker(self, ticker: str) -> bool:
         """Validate ticker format."""
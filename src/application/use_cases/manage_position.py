@@ -4,8 +4,9 @@ ManagePositionUseCase - Business logic for position management.
 This use case handles position tracking, P&L calculation,
 and stop loss / take profit evaluation.
 """
+import asyncio
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple
 import re
 
 from src.application.ports.outbound.exchange_port import ExchangePort
@@ -30,6 +31,8 @@ class ManagePositionUseCase:
         self,
         exchange: ExchangePort,
         persistence: PersistencePort,
+        use_local_positions: bool = False,
+        empty_read_confirm_seconds: float = 2.0,
     ):
         """
         Initialize with required ports.
@@ -37,9 +40,28 @@ class ManagePositionUseCase:
         Args:
             exchange: Exchange port for position data
             persistence: Persistence port for position storage
+            use_local_positions: Read positions from persistence (kept in sync
+                by update_position_from_trade and reconcile_positions) instead
+                of querying exchange balances on every call
+            empty_read_confirm_seconds: Delay before re-reading exchange
+                positions when they suddenly come back empty during reconcile
         """
         self.exchange = exchange
         self.persistence = persistence
+        self.use_local_positions = use_local_positions
+        self.empty_read_confirm_seconds = empty_read_confirm_seconds
+
+    async def _fetch_position(self, ticker: str):
+        """Position from the configured source (persistence or exchange)."""
+        if self.use_local_positions:
+            return await self.persistence.get_position(ticker)
+        return await self.exchange.get_position(ticker)
+
+    async def _fetch_all_positions(self) -> list:
+        """All positions from the configured source (persistence or exchange)."""
+        if self.use_local_positions:
+            return await self.persistence.get_all_positions()
+        return await self.exchange.get_all_positions()
 
     async def get_position(
         self,
@@ -58,7 +80,7 @@ class ManagePositionUseCase:
             return None
 
         try:
-            position = await self.exchange.get_position(ticker)
+            position = await self._fetch_position(ticker)
             if position is None:
                 return None
 
@@ -101,7 +123,7 @@ class ManagePositionUseCase:
         if not self._validate_ticker(ticker):
             return {"unrealized_pnl": Decimal("0"), "profit_rate": Decimal("0")}
 
-        position = await self.exchange.get_position(ticker)
+        position = await self._fetch_position(ticker)
         if position is None:
             return {"unrealized_pnl": Decimal("0"), "profit_rate": Decimal("0")}
 
@@ -190,7 +212,7 @@ class ManagePositionUseCase:
             Portfolio summary with all positions
         """
         try:
-            positions = await self.exchange.get_all_positions()
+            positions = await self._fetch_all_positions()
 
             if not positions:
                 return {
@@ -311,6 +333,85 @@ class ManagePositionUseCase:
         except Exception:
             return None
 
+    async def reconcile_positions(self) -> Dict[str, Any]:
+        """
+        Reconcile persisted positions against exchange balances.
+
+        The exchange is the source of truth: missing positions are created,
+        volume/average price drift is corrected, and positions no longer
+        held on the exchange are closed.
+
+        Exchange read errors propagate before anything is changed, so a
+        failed balance call skips the run instead of closing positions.
+        A coin that is still in the balance list but whose position could
+        not be read (e.g. fully locked in open orders) is reported as
+        unreadable and left untouched. If the exchange suddenly reports no
+        holdings while positions are stored, the read is repeated once and
+        positions are closed only when the second read is also empty.
+
+        Returns:
+            Dict with created/updated/closed/unreadable tickers
+
+        Raises:
+            Exception: From the exchange port when balances cannot be read
+        """
+        local_positions = {p.ticker: p for p in await self.persistence.get_all_positions()}
+        held, exchange_positions = await self._read_exchange_holdings()
+        if local_positions and not held:
+            await asyncio.sleep(self.empty_read_confirm_seconds)
+            held, exchange_positions = await self._read_exchange_holdings()
+        report: Dict[str, Any] = {"created": [], "updated": [], "closed": [], "unreadable": []}
+
+        for ticker, remote in exchange_positions.items():
+            avg_price = Money(self._get_avg_price(remote), Currency.KRW)
+            local = local_positions.get(ticker)
+
+            if local is None:
+                await self.persistence.save_position(Position.create(
+                    ticker=ticker,
+                    symbol=remote.symbol,
+                    volume=remote.volume,
+                    avg_entry_price=avg_price,
+                ))
+                report["created"].append(ticker)
+            elif local.volume != remote.volume or local.avg_entry_price.amount != avg_price.amount:
+                await self.persistence.save_position(Position(
+                    id=local.id,
+                    ticker=ticker,
+                    symbol=local.symbol,
+                    volume=remote.volume,
+                    avg_entry_price=avg_price,
+                    entry_time=local.entry_time,
+                ))
+                report["updated"].append(ticker)
+
+        for ticker in local_positions:
+            if ticker in exchange_positions:
+                continue
+            if ticker in held:
+                # Still held but unreadable this run; leave it for the next one
+                report["unreadable"].append(ticker)
+                continue
+            await self.persistence.close_position(ticker)
+            report["closed"].append(ticker)
+
+        return report
+
+    async def _read_exchange_holdings(self) -> Tuple[Set[str], Dict[str, Any]]:
+        """
+        Tickers held on the exchange (including locked balances) and the
+        readable positions with a positive volume, keyed by ticker.
+        """
+        held = {
+            f"KRW-{b.currency}" for b in await self.exchange.get_all_balances()
+            if b.currency != "KRW" and b.total.amount > 0
+        }
+        positions = {
+            p.ticker: p for p in await self.exchange.get_all_positions()
+            if p.volume > 0
+        }
+        return held, positions
+
     def _validate_ticker(self, ticker: str) -> bool:
         """Validate ticker format."""
         return bool(TICKER_PATTERN.match(ticker))
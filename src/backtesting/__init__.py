@@ -4,8 +4,19 @@
 from .strategy import Strategy, Signal
 from .portfolio import Portfolio, Position, Trade
 from .backtester import Backtester, BacktestResult
+from .portfolio_backtester import PortfolioBacktester, PortfolioBacktestResult
 from .performance import PerformanceAnalyzer
 from .runner import BacktestRunner
+from .stopping_rules import (
+    BacktestProgress,
+    StoppingRule,
+    MaxDrawdownRule,
+    MaxConsecutiveLossesRule,
+    MinTradesRule,
+    MinWinRateRule,
+    stopping_rules_from_criteria,
+)
+from .monte_carlo import MonteCarloSimulator, MonteCarloConfig, MonteCarloResult
 from .quick_filter import QuickBacktestFilter, QuickBacktestConfig, QuickBacktestResult
 
 __all__ = [
@@ -16,8 +27,20 @@ __all__ = [
     'Trade',
     'Backtester',
     'BacktestResult',
+    'PortfolioBacktester',
+    'PortfolioBacktestResult',
     'PerformanceAnalyzer',
     'BacktestRunner',
+    'BacktestProgress',
+    'StoppingRule',
+    'MaxDrawdownRule',
+    'MaxConsecutiveLossesRule',
+    'MinTradesRule',
+    'MinWinRateRule',
+    'stopping_rules_from_criteria',
+    'MonteCarloSimulator',
+    'MonteCarloConfig',
+    'MonteCarloResult',
     'QuickBacktestFilter',
     'QuickBacktestConfig',
     'QuickBacktestResult'
@@ -4,18 +4,21 @@ AI 기반 거래 전략
 Clean Architecture (2026-01-03):
 - Container/AIPort를 통한 AI 분석
 - AIService 삭제됨
+- DecisionStore를 통한 AI 결정 기록/재생 (record / replay 모드)
 """
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Union, TYPE_CHECKING
 import pandas as pd
 from decimal import Decimal
 from .strategy import Strategy, Signal
 from .portfolio import Portfolio
 from .rule_based_strategy import RuleBasedBreakoutStrategy
+from .decision_store import DecisionStore, DecisionMode, MissPolicy, compute_prompt_hash, is_recordable
 from ..trading.indicators import TechnicalIndicators
 
 if TYPE_CHECKING:
     from ..container import Container
     from ..application.ports.outbound.ai_port import AIPort
+    from ..application.dto.analysis import AnalysisRequest, TradingDecision
 
 
 class AITradingStrategy(Strategy):
@@ -28,12 +31,38 @@ class AITradingStrategy(Strategy):
         max_position_size: float = 0.3,
         container: 'Container' = None,
         ai_port: 'AIPort' = None,
+        decision_store: Optional[DecisionStore] = None,
+        decision_mode: Union[DecisionMode, str] = DecisionMode.LIVE,
+        miss_policy: Union[MissPolicy, str] = MissPolicy.HOLD,
     ):
+        """
+        Args:
+            ticker: 거래 쌍
+            risk_per_trade: 거래당 리스크 비율
+            max_position_size: 최대 포지션 비율
+            container: 의존성 컨테이너 (ai_port 미지정 시 사용)
+            ai_port: AI 포트
+            decision_store: AI 결정 기록/재생 저장소 (record/replay 모드 필수)
+            decision_mode: 'live' | 'record' | 'replay'
+            miss_policy: 재생 미스 처리 'hold' | 'rule_based' | 'call_and_record'
+        """
         self.ticker = ticker
         self.risk_per_trade = risk_per_trade
         self.max_position_size = max_position_size
         self._container = container
         self._ai_port = ai_port
+        self.decision_store = decision_store
+        self.decision_mode = DecisionMode(decision_mode)
+        self.miss_policy = MissPolicy(miss_policy)
+
+        if self.decision_mode != DecisionMode.LIVE and decision_store is None:
+            raise ValueError(f"decision_mode={self.decision_mode.value}에는 decision_store가 필요합니다")
+
+        self._rule_strategy = RuleBasedBreakoutStrategy(
+            ticker=ticker,
+            risk_per_trade=risk_per_trade,
+            max_position_size=max_position_size
+        )
 
     def generate_signal(self, data: pd.DataFrame, portfolio: Optional[Portfolio] = None) -> Optional[Signal]:
         """AI 분석 기반 신호 생성"""
@@ -41,33 +70,37 @@ class AITradingStrategy(Strategy):
             return None
 
         # 1단계: 룰 기반 필터링
-        rule_strategy = RuleBasedBreakoutStrategy(
-            ticker=self.ticker,
-            risk_per_trade=self.risk_per_trade,
-            max_position_size=self.max_position_size
-        )
-        rule_signal = rule_strategy.generate_signal(data)
+        rule_signal = self._rule_strategy.generate_signal(data)
 
         if rule_signal is None:
             return None
 
-        # 2단계: AI 분석
+        # 2단계: AI 결정 (기록/재생 저장소 경유)
         current_price = data['close'].iloc[-1]
-        current_date = data.index[-1] if hasattr(data.index[-1], 'strftime') else str(data.index[-1])
-
-        if not hasattr(AITradingStrategy, '_ai_call_count'):
-            AITradingStrategy._ai_call_count = 0
-        AITradingStrategy._ai_call_count += 1
-
-        if AITradingStrategy._ai_call_count <= 5 or AITradingStrategy._ai_call_count % 10 == 0:
-            print(f"\n[AI 분석 {AITradingStrategy._ai_call_count}회] {current_date} - 룰 통과, AI 검증 중...")
+        bar_ts = data.index[-1]
+        current_date = bar_ts if hasattr(bar_ts, 'strftime') else str(bar_ts)
 
         try:
             technical_indicators = TechnicalIndicators.get_latest_indicators(data)
-            ai_decision = self._analyze_with_ai(current_price, technical_indicators, rule_signal)
+            request = self.build_request(current_price, technical_indicators, rule_signal)
+
+            if self.decision_mode == DecisionMode.REPLAY:
+                prompt_hash = compute_prompt_hash(request)
+                decision = self.decision_store.get(self.ticker, bar_ts, prompt_hash)
+                if decision is None:
+                    if self.miss_policy == MissPolicy.HOLD:
+                        return None
+                    if self.miss_policy == MissPolicy.RULE_BASED:
+                        return rule_signal
+                    decision = self._call_ai(request, current_date)
+                    if is_recordable(decision):
+                        self.decision_store.put(self.ticker, bar_ts, prompt_hash, decision)
+            else:
+                decision = self._call_ai(request, current_date)
+                if self.decision_mode == DecisionMode.RECORD and is_recordable(decision):
+                    self.decision_store.put(self.ticker, bar_ts, compute_prompt_hash(request), decision)
 
-            if not ai_decision:
-                return None
+            ai_decision = self._to_signal_reason(decision)
         except Exception as e:
             print(f"\n⚠️  AI 분석 오류 (시점 {current_date}): {str(e)}")
             return None
@@ -95,22 +128,29 @@ class AITradingStrategy(Strategy):
 
         return None
 
-    def _analyze_with_ai(
+    def prepare_indicators(self, data: pd.DataFrame) -> None:
+        """룰 필터 지표 사전 계산 (Backtester가 시작 전 한 번 호출)"""
+        self._rule_strategy.prepare_indicators(data)
+
+    def rule_signal(self, data: pd.DataFrame) -> Optional[Signal]:
+        """1단계 룰 기반 필터 신호 (일괄 라벨링에서 재사용)"""
+        return self._rule_strategy.generate_signal(data)
+
+    def build_request(
         self,
         current_price: float,
         technical_indicators: dict,
         rule_signal: Signal,
-    ) -> Optional[dict]:
-        """AIPort를 통한 AI 분석"""
-        import asyncio
-        from ..application.dto.analysis import AnalysisRequest, TechnicalIndicators as TechIndicatorsDTO
+    ) -> 'AnalysisRequest':
+        """
+        AI 분석 요청 생성
 
-        ai_port = self._get_ai_port()
-        if ai_port is None:
-            raise RuntimeError("Container 또는 ai_port가 필요합니다")
+        백테스트/기록/일괄 라벨링이 같은 요청(=같은 프롬프트 해시)을 만들도록
+        요청 생성을 한 곳에 둔다.
+        """
+        from ..application.dto.analysis import AnalysisRequest, TechnicalIndicators as TechIndicatorsDTO
 
-        # AnalysisRequest 생성
-        request = AnalysisRequest(
+        return AnalysisRequest(
             ticker=self.ticker,
             current_price=Decimal(str(current_price)),
             indicators=TechIndicatorsDTO(
@@ -133,20 +173,50 @@ class AITradingStrategy(Strategy):
             },
         )
 
+    def _call_ai(self, request: 'AnalysisRequest', current_date) -> 'TradingDecision':
+        """AIPort를 통한 AI 분석 (동기 래퍼)"""
+        import asyncio
+
+        ai_port = self._get_ai_port()
+        if ai_port is None:
+            raise RuntimeError("Container 또는 ai_port가 필요합니다")
+
+        if not hasattr(AITradingStrategy, '_ai_call_count'):
+            AITradingStrategy._ai_call_count = 0
+        AITradingStrategy._ai_call_count += 1
+
+        if AITradingStrategy._ai_call_count <= 5 or AITradingStrategy._ai_call_count % 10 == 0:
+            print(f"\n[AI 분석 {AITradingStrategy._ai_call_count}회] {current_date} - 룰 통과, AI 검증 중...")
+
         # async 호출
         try:
             loop = asyncio.get_event_loop()
             if loop.is_running():
                 import concurrent.futures
                 with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, ai_port.analyze(request))
-                    decision = future.result(timeout=60)
-            else:
-                decision = loop.run_until_complete(ai_port.analyze(request))
+                    future = executor.submit(asyncio.run, self._analyze_once(ai_port, request))
+                    return future.result(timeout=60)
+            return loop.run_until_complete(ai_port.analyze(request))
         except RuntimeError:
-            decision = asyncio.run(ai_port.analyze(request))
+            return asyncio.run(self._analyze_once(ai_port, request))
 
-        # 결과 변환
+    @staticmethod
+    async def _analyze_once(ai_port, request: 'AnalysisRequest') -> 'TradingDecision':
+        """
+        1회용 이벤트 루프(asyncio.run)에서 분석 후 HTTP 연결 풀 정리
+
+        루프가 닫힌 뒤 keep-alive 연결이 남지 않도록 루프 안에서 닫습니다.
+        """
+        try:
+            return await ai_port.analyze(request)
+        finally:
+            aclose = getattr(ai_port, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+
+    @staticmethod
+    def _to_signal_reason(decision: 'TradingDecision') -> dict:
+        """TradingDecision → Signal.reason 변환"""
         decision_map = {'BUY': 'buy', 'SELL': 'sell', 'HOLD': 'hold'}
         return {
             'decision': decision_map.get(decision.decision.name, 'hold'),
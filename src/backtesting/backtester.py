@@ -5,14 +5,19 @@ Clean Architecture 통합:
 - ExecutionPort를 통한 체결 시뮬레이션
 - use_intrabar_stops 옵션으로 현실적인 스탑/익절 시뮬레이션
 """
-from typing import List, Optional
+import inspect
+import time
+from typing import List, Optional, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+import numpy as np
 import pandas as pd
 
 from .strategy import Strategy
 from .portfolio import Portfolio
+from .performance import StreamingMetrics
+from .stopping_rules import BacktestProgress, StoppingRule
 from src.application.ports.outbound.execution_port import (
     ExecutionPort,
     CandleData,
@@ -29,10 +34,23 @@ class BacktestResult:
     """백테스트 결과"""
     initial_capital: float
     final_equity: float
-    equity_curve: List[float]
+    equity_curve: np.ndarray  # 봉별 자산 (float64 배열)
     trades: List
     metrics: dict
     execution_mode: str = 'close'  # 'close' 또는 'next_open'
+    # 조기 종료 (stopping_rules): True면 equity_curve/trades/metrics는 bars_processed까지의 부분 결과
+    terminated: bool = False
+    termination_reason: Optional[str] = None
+    bars_processed: int = 0
+    total_bars: int = 0
+    cpu_seconds: float = 0.0  # 실행 스레드 CPU 시간
+
+    @property
+    def cpu_saved_seconds(self) -> float:
+        """조기 종료로 생략한 봉의 CPU 시간 추정 (처리한 봉의 평균 비용 기준)"""
+        if not self.terminated or self.bars_processed <= 0:
+            return 0.0
+        return self.cpu_seconds / self.bars_processed * (self.total_bars - self.bars_processed)
 
 
 class Backtester:
@@ -53,7 +71,8 @@ class Backtester:
         execute_on_next_open: bool = True,  # True: 다음 봉 시가 체결 (현실적), False: 현재 봉 종가 체결
         data_interval: str = 'day',   # 데이터 간격 ('day', 'minute60', 'minute15', 등) - 연율화 계산용
         use_intrabar_stops: bool = False,  # True: 봉 내 스탑/익절 체크 (현실적), False: 종가 기준
-        execution_adapter: Optional[ExecutionPort] = None  # 커스텀 어댑터 (테스트용)
+        execution_adapter: Optional[ExecutionPort] = None,  # 커스텀 어댑터 (테스트용)
+        stopping_rules: Optional[Sequence[StoppingRule]] = None  # 조기 종료 규칙 (확정 실패 시 중단)
     ):
         self.strategy = strategy
         self.data = data
@@ -88,8 +107,16 @@ class Backtester:
         self.portfolio = Portfolio(initial_capital)
         self.orders = []
         self.trades = []
-        self.equity_curve = []
+        self.equity_curve = np.empty(0, dtype=np.float64)  # run()에서 봉 수만큼 미리 할당
         self.slippage_statistics = []  # 슬리피지 통계
+        # 봉 단위 온라인 지표 (백테스트 도중 낙폭/Sharpe 조회용)
+        self.live_metrics = StreamingMetrics(initial_capital, data_interval)
+
+        # 조기 종료
+        self.stopping_rules = list(stopping_rules or [])
+        self.termination_reason: Optional[str] = None
+        self._bars_processed = 0
+        self._cpu_seconds = 0.0
 
         # 현재 포지션의 스탑/익절 가격 추적
         self._current_stop_loss: Optional[float] = None
@@ -241,6 +268,16 @@ class Backtester:
 
         total_bars = len(self.data)
         pending_signal = None  # 다음 봉에서 실행할 대기 신호
+        self.equity_curve = np.empty(total_bars, dtype=np.float64)
+        cpu_started = time.thread_time()
+        progress_state = BacktestProgress(
+            bars_processed=0,
+            total_bars=total_bars,
+            metrics=self.live_metrics,
+            # 봉마다 주문은 최대 1건 → 다음 봉 체결이면 거래 1건에 최소 2봉
+            bars_per_trade=2 if self.execute_on_next_open else 1
+        )
+        processed = 0
 
         for i in range(total_bars):
             # 진행 상황 출력 (10% 단위)
@@ -293,12 +330,36 @@ class Backtester:
 
             # 5. 포트폴리오 업데이트
             self.portfolio.update(current_bar_data)
-            self.equity_curve.append(self.portfolio.total_value)
+            equity = self.portfolio.total_value
+            self.equity_curve[i] = equity
+            self.live_metrics.update(equity)
+            processed = i + 1
+
+            # 6. 조기 종료 규칙 (마지막 봉은 검사 불필요)
+            if self.stopping_rules and processed < total_bars:
+                progress_state.bars_processed = processed
+                progress_state.record_trades(self.portfolio.closed_trades)
+                progress_state.has_position = self.ticker in self.portfolio.positions
+                self.termination_reason = self._check_stopping_rules(progress_state)
+                if self.termination_reason:
+                    print(f"\n[조기 종료] {processed}/{total_bars}봉: {self.termination_reason}", end="")
+                    break
 
         print()  # 진행 상황 출력 후 줄바꿈
+        self.equity_curve = self.equity_curve[:processed]
+        self._bars_processed = processed
+        self._cpu_seconds = time.thread_time() - cpu_started
 
-        # 6. 결과 분석
+        # 7. 결과 분석
         return self._analyze_results()
+
+    def _check_stopping_rules(self, progress: BacktestProgress) -> Optional[str]:
+        """첫 번째로 확정 실패를 판정한 규칙의 사유"""
+        for rule in self.stopping_rules:
+            reason = rule.check(progress)
+            if reason:
+                return reason
+        return None
     
     def _execute_order(self, signal, current_bar: pd.Series, use_open_price: bool = False):
         """
@@ -433,7 +494,7 @@ class Backtester:
             orderbook_provider = self.slippage_model.get('orderbook_provider')
             
             if orderbook_provider and callable(orderbook_provider):
-                orderbook = orderbook_provider()
+                orderbook = self._fetch_orderbook(orderbook_provider, current_bar, expected_price)
                 if orderbook:
                     return self.strategy.calculate_slippage(
                         order_type=order_type,
@@ -472,6 +533,22 @@ class Backtester:
                 'slippage_pct': slippage_pct
             }
     
+    @staticmethod
+    def _fetch_orderbook(orderbook_provider, current_bar: pd.Series, reference_price: float):
+        """
+        오더북 조회
+
+        인자를 받는 provider(OrderbookReplay 등)에는 바 시각과 기준 가격을 전달하여
+        해당 시점의 기록된 호가를 재생하고, 인자 없는 provider는 그대로 호출합니다.
+        """
+        try:
+            takes_args = bool(inspect.signature(orderbook_provider).parameters)
+        except (TypeError, ValueError):
+            takes_args = False
+        if takes_args:
+            return orderbook_provider(current_bar.name, reference_price)
+        return orderbook_provider()
+
     def _execute_split_order(self, signal, current_bar: pd.Series, slippage_info: dict):
         """분할 주문 실행"""
         # 오더북 가져오기
@@ -479,7 +556,7 @@ class Backtester:
         if not orderbook_provider or not callable(orderbook_provider):
             return None
         
-        orderbook = orderbook_provider()
+        orderbook = self._fetch_orderbook(orderbook_provider, current_bar, current_bar['close'])
         if not orderbook:
             return None
         
@@ -570,10 +647,15 @@ class Backtester:
         
         return BacktestResult(
             initial_capital=self.initial_capital,
-            final_equity=self.equity_curve[-1] if self.equity_curve else self.initial_capital,
+            final_equity=float(self.equity_curve[-1]) if len(self.equity_curve) else self.initial_capital,
             equity_curve=self.equity_curve,
             trades=self.portfolio.closed_trades,
             metrics=metrics,
-            execution_mode='next_open' if self.execute_on_next_open else 'close'
+            execution_mode='next_open' if self.execute_on_next_open else 'close',
+            terminated=self.termination_reason is not None,
+            termination_reason=self.termination_reason,
+            bars_processed=self._bars_processed,
+            total_bars=len(self.data),
+            cpu_seconds=self._cpu_seconds
         )
 
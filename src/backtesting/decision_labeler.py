@@ -0,0 +1,168 @@
+"""
+AI 결정 일괄 라벨링
+
+차트 데이터를 훑어 룰 필터를 통과한 봉 중 DecisionStore에 기록이 없는 봉만
+AI 포트에 동시 요청하여 저장한다. 이후 백테스트는 replay 모드로 AI 호출 없이 실행된다.
+
+- 동시성: asyncio.Semaphore (max_concurrency)
+- 속도 제한: 분당 요청 수 (requests_per_minute) 기준 최소 시작 간격
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+import pandas as pd
+
+from .ai_strategy import AITradingStrategy
+from .decision_store import DecisionStore, compute_prompt_hash, is_recordable
+from ..trading.indicators import TechnicalIndicators
+
+
+@dataclass
+class LabelingReport:
+    """
+    일괄 라벨링 결과
+
+    Attributes:
+        total_bars: 검사한 봉 수
+        rule_passed: 룰 필터 통과 봉 수
+        cached: 이미 기록되어 있던 봉 수
+        labelled: 새로 라벨링한 봉 수
+        failed: AI 호출 실패 봉 수
+        duration_seconds: 소요 시간
+        errors: (봉 시각, 오류 메시지)
+    """
+    total_bars: int = 0
+    rule_passed: int = 0
+    cached: int = 0
+    labelled: int = 0
+    failed: int = 0
+    duration_seconds: float = 0.0
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+
+
+class _RateLimiter:
+    """요청 시작 간격을 일정하게 유지하는 속도 제한기"""
+
+    def __init__(self, requests_per_minute: Optional[float]):
+        self._interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self._interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class DecisionBatchLabeler:
+    """
+    AITradingStrategy 백테스트용 AI 결정 일괄 라벨러
+
+    사용 예:
+        store = DecisionStore("data/ai_decisions.sqlite")
+        strategy = AITradingStrategy("KRW-BTC", ai_port=ai_port,
+                                     decision_store=store, decision_mode="replay")
+        report = await DecisionBatchLabeler(strategy, max_concurrency=4).label(data)
+        Backtester(strategy, data, ...).run()  # AI 호출 없이 재생
+    """
+
+    def __init__(
+        self,
+        strategy: AITradingStrategy,
+        store: Optional[DecisionStore] = None,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[float] = 60,
+    ):
+        """
+        Args:
+            strategy: 요청 생성/AI 포트를 제공하는 전략
+            store: 저장소 (기본: strategy.decision_store)
+            max_concurrency: 동시 AI 요청 수
+            requests_per_minute: 분당 최대 요청 수 (None/0 = 제한 없음)
+        """
+        self.strategy = strategy
+        self.store = store or strategy.decision_store
+        if self.store is None:
+            raise ValueError("DecisionStore가 필요합니다")
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+
+    def collect_pending(self, data: pd.DataFrame, report: LabelingReport) -> List[Tuple[Any, str, Any]]:
+        """
+        라벨링이 필요한 봉 수집 (룰 통과 + 미기록)
+
+        Returns:
+            [(봉 시각, 프롬프트 해시, AnalysisRequest)]
+        """
+        strategy = self.strategy
+        strategy.prepare_indicators(data)
+
+        pending = []
+        for i in range(len(data)):
+            window = data.iloc[:i + 1]
+            report.total_bars += 1
+
+            rule_signal = strategy.rule_signal(window)
+            if rule_signal is None:
+                continue
+            report.rule_passed += 1
+
+            bar_ts = window.index[-1]
+            indicators = TechnicalIndicators.get_latest_indicators(window)
+            request = strategy.build_request(window['close'].iloc[-1], indicators, rule_signal)
+            prompt_hash = compute_prompt_hash(request)
+
+            if self.store.contains(strategy.ticker, bar_ts, prompt_hash):
+                report.cached += 1
+                continue
+            pending.append((bar_ts, prompt_hash, request))
+        return pending
+
+    async def label(self, data: pd.DataFrame) -> LabelingReport:
+        """
+        미기록 봉 일괄 라벨링
+
+        Args:
+            data: 백테스트와 동일한 차트 데이터
+
+        Returns:
+            LabelingReport
+        """
+        started = time.monotonic()
+        report = LabelingReport()
+        pending = self.collect_pending(data, report)
+
+        ai_port = self.strategy._get_ai_port()
+        if pending and ai_port is None:
+            raise RuntimeError("Container 또는 ai_port가 필요합니다")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limiter = _RateLimiter(self.requests_per_minute)
+
+        async def label_one(bar_ts, prompt_hash, request) -> None:
+            async with semaphore:
+                await limiter.acquire()
+                try:
+                    decision = await ai_port.analyze(request)
+                except Exception as e:
+                    report.failed += 1
+                    report.errors.append((str(bar_ts), str(e)))
+                    return
+            if not is_recordable(decision):
+                report.failed += 1
+                report.errors.append((str(bar_ts), decision.reasoning))
+                return
+            self.store.put(self.strategy.ticker, bar_ts, prompt_hash, decision)
+            report.labelled += 1
+
+        await asyncio.gather(*(label_one(*item) for item in pending))
+
+        report.duration_seconds = time.monotonic() - started
+        return report
@@ -0,0 +1,228 @@
+"""
+AI 결정 기록/재생 저장소
+
+AITradingStrategy 백테스트를 빠르고 재현 가능하게 만들기 위해
+(ticker, 봉 시각, 프롬프트 해시) → TradingDecision 을 로컬 SQLite 파일에 저장한다.
+
+- 기록(record): 라이브 실행 또는 일괄 라벨링 시 AI 결정을 저장
+- 재생(replay): 백테스트에서 AI 호출 없이 저장된 결정을 사용
+
+재생 시에는 티커별로 한 번에 메모리로 적재하므로 봉마다 DB를 조회하지 않는다.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from ..application.dto.analysis import AnalysisRequest, TradingDecision
+from ..domain.value_objects.prompt_version import PromptType, PromptVersion
+
+
+class DecisionMode(str, Enum):
+    """AI 결정 모드"""
+    LIVE = "live"      # 매 봉 AI 호출 (저장 안 함)
+    RECORD = "record"  # 매 봉 AI 호출 + 저장
+    REPLAY = "replay"  # 저장된 결정만 사용 (미스 시 MissPolicy)
+
+
+class MissPolicy(str, Enum):
+    """재생 모드에서 저장된 결정이 없을 때의 처리"""
+    HOLD = "hold"                        # 관망 (신호 없음)
+    RULE_BASED = "rule_based"            # 룰 기반 신호 그대로 사용
+    CALL_AND_RECORD = "call_and_record"  # AI 호출 후 저장
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "__dict__"):
+        return vars(value)
+    return str(value)
+
+
+def compute_prompt_hash(
+    request: AnalysisRequest,
+    prompt_version: Optional[PromptVersion] = None,
+) -> str:
+    """
+    AI 입력 해시 계산.
+
+    프롬프트 버전 + 요청의 입력 특징(가격, 지표, 포지션, 컨텍스트)을
+    정규화된 JSON으로 직렬화하여 SHA256 해시 앞 16자리를 사용한다.
+    입력이나 프롬프트 버전이 바뀌면 해시가 달라져 기존 기록을 재사용하지 않는다.
+
+    Args:
+        request: AI 분석 요청
+        prompt_version: 프롬프트 버전 (기본: GENERAL 현재 버전)
+
+    Returns:
+        16자리 16진수 해시
+    """
+    version = prompt_version or PromptVersion.current(PromptType.GENERAL)
+    payload = {
+        "version": version.to_tracking_id(),
+        "ticker": request.ticker,
+        "current_price": request.current_price,
+        "indicators": request.indicators,
+        "position_info": request.position_info,
+        "additional_context": request.additional_context,
+    }
+    material = json.dumps(payload, sort_keys=True, default=_json_default, ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def is_recordable(decision: TradingDecision) -> bool:
+    """
+    기록 가능한 결정인지 확인.
+
+    AI 어댑터는 호출 실패 시 예외 대신 confidence 0의 HOLD 결정
+    ("Analysis failed: ...")을 반환하므로, 이를 기록하면 재생 시 실패가 고정된다.
+    """
+    return not (decision.confidence == 0 and decision.reasoning.startswith("Analysis failed"))
+
+
+def _bar_key(bar_ts: Any) -> str:
+    """봉 시각을 저장용 문자열로 정규화"""
+    if hasattr(bar_ts, "isoformat"):
+        return bar_ts.isoformat()
+    return str(bar_ts)
+
+
+class DecisionStore:
+    """
+    AI 결정 로컬 저장소 (SQLite)
+
+    키: (ticker, bar_ts, prompt_hash)
+    값: TradingDecision JSON
+    """
+
+    def __init__(self, path: Union[str, Path] = "./data/ai_decisions.sqlite"):
+        """
+        Args:
+            path: SQLite 파일 경로 (':memory:' 가능)
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ai_decisions (
+                ticker TEXT NOT NULL,
+                bar_ts TEXT NOT NULL,
+                prompt_hash TEXT NOT NULL,
+                decision TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (ticker, bar_ts, prompt_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+        # 티커별 메모리 적재본: {ticker: {(bar_ts, prompt_hash): TradingDecision}}
+        self._loaded: Dict[str, Dict[Tuple[str, str], TradingDecision]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _load_ticker(self, ticker: str) -> Dict[Tuple[str, str], TradingDecision]:
+        """티커의 모든 기록을 한 번에 메모리로 적재"""
+        cached = self._loaded.get(ticker)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT bar_ts, prompt_hash, decision FROM ai_decisions WHERE ticker = ?",
+                (ticker,),
+            ).fetchall()
+
+        cached = {
+            (bar_ts, prompt_hash): TradingDecision.from_dict(json.loads(decision))
+            for bar_ts, prompt_hash, decision in rows
+        }
+        self._loaded[ticker] = cached
+        return cached
+
+    def get(self, ticker: str, bar_ts: Any, prompt_hash: str) -> Optional[TradingDecision]:
+        """
+        저장된 결정 조회
+
+        Args:
+            ticker: 거래 쌍
+            bar_ts: 봉 시각
+            prompt_hash: 입력 해시 (compute_prompt_hash)
+
+        Returns:
+            TradingDecision 또는 None
+        """
+        decision = self._load_ticker(ticker).get((_bar_key(bar_ts), prompt_hash))
+        if decision is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return decision
+
+    def contains(self, ticker: str, bar_ts: Any, prompt_hash: str) -> bool:
+        """기록 존재 여부 (통계 미반영)"""
+        return (_bar_key(bar_ts), prompt_hash) in self._load_ticker(ticker)
+
+    def put(self, ticker: str, bar_ts: Any, prompt_hash: str, decision: TradingDecision) -> None:
+        """
+        결정 저장 (같은 키는 덮어씀)
+
+        Args:
+            ticker: 거래 쌍
+            bar_ts: 봉 시각
+            prompt_hash: 입력 해시
+            decision: AI 결정
+        """
+        key = _bar_key(bar_ts)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_decisions "
+                "(ticker, bar_ts, prompt_hash, decision, created_at) VALUES (?, ?, ?, ?, ?)",
+                (ticker, key, prompt_hash, json.dumps(decision.to_dict(), ensure_ascii=False),
+                 datetime.now().isoformat()),
+            )
+            self._conn.commit()
+
+        if ticker in self._loaded:
+            self._loaded[ticker][(key, prompt_hash)] = decision
+
+    def count(self, ticker: Optional[str] = None) -> int:
+        """저장된 결정 수"""
+        with self._lock:
+            if ticker is None:
+                row = self._conn.execute("SELECT COUNT(*) FROM ai_decisions").fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM ai_decisions WHERE ticker = ?", (ticker,)
+                ).fetchone()
+        return row[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """조회 통계"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "stored": self.count(),
+        }
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,311 @@
+"""
+몬테카를로 강건성 분석 (Monte Carlo Robustness)
+
+Trading Pass와 기대값 필터는 과거 거래 순서 하나만 보고 판단합니다.
+같은 거래/봉 수익률을 수천 번 재표본하여, 순서가 달랐다면 낙폭/수익률이
+어떻게 분포했을지와 파산 확률을 추정합니다.
+
+재표본 방식 (MonteCarloConfig.method):
+- bootstrap: 거래 수익률 복원 추출 (승률/손익비 변동 반영)
+- shuffle: 거래 순서만 섞음 (최종 수익률은 동일, 낙폭 분포만 변함)
+- block: 봉 수익률 블록 부트스트랩 (변동성 군집 등 자기상관 보존)
+
+모든 경로를 (경로 수 × 단계 수) 2차원 배열 연산으로 한 번에 계산하고,
+max_chunk_elements 단위로 나눠 메모리를 제한합니다. block 방식은 시작 위치별
+블록 요약(합계/고점/저점/내부 낙폭)을 미리 계산해 (경로 수 × 블록 수) 배열만 다룹니다.
+
+사용 예시:
+    simulator = MonteCarloSimulator(MonteCarloConfig(n_paths=10_000, seed=42))
+    mc = simulator.evaluate(backtest_result)
+    if mc is not None:
+        print(mc.drawdown_percentiles[95], mc.probability_of_ruin)
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from ..config.settings import ScannerConfig
+from .backtester import BacktestResult
+from .performance import trade_records
+
+
+METHODS = ScannerConfig.MONTE_CARLO_METHODS
+
+
+@dataclass
+class MonteCarloConfig:
+    """몬테카를로 설정"""
+    n_paths: int = 10_000
+    method: str = 'bootstrap'             # bootstrap / shuffle / block
+    block_size: Optional[int] = None      # block 방식 블록 길이 (None이면 n^(1/3))
+    ruin_threshold: float = 50.0          # 초기 자본 대비 손실 (%) 도달 시 파산
+    max_ruin_probability: float = 0.05    # 게이트: 허용 파산 확률 (0~1)
+    min_samples: int = 5                  # 재표본할 최소 거래/봉 수 (미만이면 분석 생략)
+    percentiles: Tuple[int, ...] = (5, 25, 50, 75, 95)
+    max_chunk_elements: int = 2_000_000   # 청크당 배열 원소 수 (float64 16MB)
+    seed: Optional[int] = None
+
+
+@dataclass
+class MonteCarloResult:
+    """
+    몬테카를로 결과
+
+    Attributes:
+        method: 재표본 방식
+        n_paths: 경로 수
+        n_steps: 경로당 단계 수 (거래 수 또는 봉 수)
+        return_percentiles: 총 수익률 (%) 분위수 {백분위: 값}
+        drawdown_percentiles: 최대 낙폭 크기 (%, 양수) 분위수 {백분위: 값}
+        probability_of_ruin: 자산이 파산 기준 이하로 떨어진 경로 비율 (0~1)
+        probability_of_loss: 최종 수익률이 음수인 경로 비율 (0~1)
+        elapsed_ms: 계산 시간 (ms)
+    """
+    method: str
+    n_paths: int
+    n_steps: int
+    return_percentiles: Dict[int, float] = field(default_factory=dict)
+    drawdown_percentiles: Dict[int, float] = field(default_factory=dict)
+    probability_of_ruin: float = 0.0
+    probability_of_loss: float = 0.0
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """로그/저장용 딕셔너리"""
+        return {
+            'method': self.method,
+            'n_paths': self.n_paths,
+            'n_steps': self.n_steps,
+            'return_percentiles': dict(self.return_percentiles),
+            'drawdown_percentiles': dict(self.drawdown_percentiles),
+            'probability_of_ruin': self.probability_of_ruin,
+            'probability_of_loss': self.probability_of_loss,
+            'elapsed_ms': self.elapsed_ms,
+        }
+
+
+def trade_equity_returns(result: BacktestResult) -> np.ndarray:
+    """
+    거래별 자본 대비 수익률 (0~1)
+
+    pnl_percent는 포지션 가격 변화율이라 포지션 비중을 반영하지 못하므로,
+    거래 직전 실현 자본(초기 자본 + 이전 거래 손익 누적) 대비 손익을 사용합니다.
+    단일 종목 Backtester는 거래가 겹치지 않으므로 실현 손익 기준으로 정확합니다.
+    """
+    pnl = trade_records(result.trades)['pnl']
+    capital_before = result.initial_capital + np.concatenate(([0.0], np.cumsum(pnl)[:-1]))
+    return pnl / capital_before
+
+
+def bar_returns(result: BacktestResult) -> np.ndarray:
+    """자산 곡선 봉 수익률 (0~1)"""
+    equity = np.asarray(result.equity_curve, dtype=np.float64)
+    if len(equity) < 2:
+        return np.empty(0)
+    return np.diff(equity) / equity[:-1]
+
+
+class MonteCarloSimulator:
+    """
+    거래/봉 수익률 재표본 시뮬레이터
+
+    경로 i의 자산 = Π(1 + r_ij) (초기 자본 1.0 기준 복리)
+    """
+
+    def __init__(self, config: Optional[MonteCarloConfig] = None):
+        """
+        Args:
+            config: 몬테카를로 설정 (None이면 기본값)
+        """
+        self.config = config or MonteCarloConfig()
+        if self.config.method not in METHODS:
+            raise ValueError(f"method는 {METHODS} 중 하나여야 합니다: {self.config.method}")
+        self.rng = np.random.default_rng(self.config.seed)
+
+    def evaluate(self, result: BacktestResult) -> Optional[MonteCarloResult]:
+        """
+        백테스트 결과에 설정된 방식으로 몬테카를로 실행
+
+        Args:
+            result: 백테스트 결과
+
+        Returns:
+            MonteCarloResult (표본이 min_samples 미만이면 None)
+        """
+        if self.config.method == 'block':
+            return self.simulate(bar_returns(result), method='block')
+        if not result.trades:
+            return None
+        return self.simulate(trade_equity_returns(result), method=self.config.method)
+
+    def simulate(self, returns: np.ndarray, method: Optional[str] = None) -> Optional[MonteCarloResult]:
+        """
+        수익률 시퀀스 재표본
+
+        Args:
+            returns: 거래 또는 봉 수익률 (0~1)
+            method: 재표본 방식 (None이면 config.method)
+
+        Returns:
+            MonteCarloResult (표본이 min_samples 미만이면 None)
+        """
+        started = time.perf_counter()
+        method = method or self.config.method
+        if method not in METHODS:
+            raise ValueError(f"method는 {METHODS} 중 하나여야 합니다: {method}")
+        returns = np.asarray(returns, dtype=np.float64)
+        n_steps = len(returns)
+        if n_steps < self.config.min_samples:
+            return None
+
+        # 재표본 단위(구간): 거래 방식은 1단계, block 방식은 block_size 봉
+        block = 1
+        if method == 'block':
+            block = min(self.config.block_size or max(1, round(n_steps ** (1 / 3))), n_steps)
+        n_segments = -(-n_steps // block)  # 올림
+        tail = n_steps - (n_segments - 1) * block
+        with np.errstate(divide='ignore'):
+            log_returns = np.log1p(returns)
+        table = tail_table = None
+        if block > 1:
+            table = _segment_table(log_returns, block, n_steps - block + 1)
+            tail_table = _segment_table(log_returns, tail, n_steps - block + 1) if tail != block else None
+
+        n_paths = self.config.n_paths
+        chunk = max(1, self.config.max_chunk_elements // n_segments)
+        final_returns = np.empty(n_paths)
+        max_drawdowns = np.empty(n_paths)
+        min_equity = np.empty(n_paths)
+
+        for start in range(0, n_paths, chunk):
+            stop = min(start + chunk, n_paths)
+            segments = self._resample(n_steps, block, n_segments, stop - start, method)
+            if block > 1:
+                stats = _segment_path_statistics(table, tail_table, segments)
+            else:
+                stats = _step_path_statistics(log_returns[segments])
+            final_returns[start:stop], max_drawdowns[start:stop], min_equity[start:stop] = stats
+
+        percentiles = list(self.config.percentiles)
+        ruin_equity = 1.0 - self.config.ruin_threshold / 100
+        return MonteCarloResult(
+            method=method,
+            n_paths=n_paths,
+            n_steps=n_steps,
+            return_percentiles=dict(zip(percentiles, np.percentile(final_returns * 100, percentiles).tolist())),
+            drawdown_percentiles=dict(zip(percentiles, np.percentile(max_drawdowns * 100, percentiles).tolist())),
+            probability_of_ruin=float(np.mean(min_equity <= ruin_equity)),
+            probability_of_loss=float(np.mean(final_returns < 0)),
+            elapsed_ms=(time.perf_counter() - started) * 1000
+        )
+
+    def _resample(self, n_steps: int, block: int, n_segments: int, n_paths: int, method: str) -> np.ndarray:
+        """(n_paths × n_segments) 구간 시작 인덱스"""
+        if method == 'bootstrap':
+            return self.rng.integers(0, n_steps, size=(n_paths, n_steps))
+        if method == 'shuffle':
+            return self.rng.permuted(np.broadcast_to(np.arange(n_steps), (n_paths, n_steps)), axis=1)
+        return self.rng.integers(0, n_steps - block + 1, size=(n_paths, n_segments))
+
+
+def _segment_table(log_returns: np.ndarray, length: int, n_starts: int) -> np.ndarray:
+    """
+    시작 위치별 구간 요약 (4 × n_starts, 로그 수익률 기준)
+
+    행: [합계, 시작 대비 최고점(>=0), 시작 대비 최저점(<=0), 구간 내 최대 낙폭(>=0)]
+    경로 통계는 이 요약만으로 정확히 계산되므로 봉 단위 경로를 만들 필요가 없습니다.
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(log_returns, length)[:n_starts]
+    cumulative = np.cumsum(windows, axis=1)
+    peak = np.maximum(np.maximum.accumulate(cumulative, axis=1), 0.0)
+    with np.errstate(invalid='ignore'):
+        inner = (peak - cumulative).max(axis=1)
+    return np.stack([
+        cumulative[:, -1],
+        peak[:, -1],
+        np.minimum(cumulative.min(axis=1), 0.0),
+        inner,
+    ])
+
+
+def _step_path_statistics(log_paths: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    경로별 최종 수익률, 최대 낙폭 크기, 최저 자산 (모두 초기 자본 1.0 기준)
+
+    log_paths: (경로 × 단계) 로그 수익률, 누적합으로 덮어씀
+    """
+    level = np.cumsum(log_paths, axis=1, out=log_paths)
+    peak = np.maximum.accumulate(level, axis=1)
+    np.maximum(peak, 0.0, out=peak)  # 시작 자본 1.0도 고점 후보
+    with np.errstate(invalid='ignore'):
+        drawdown = np.subtract(peak, level, out=peak).max(axis=1)
+    min_level = np.minimum(level.min(axis=1), 0.0)
+    return np.expm1(level[:, -1]), -np.expm1(-drawdown), np.exp(min_level)
+
+
+def _segment_path_statistics(
+    table: np.ndarray,
+    tail_table: Optional[np.ndarray],
+    segments: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    구간 요약으로 계산한 _step_path_statistics와 같은 경로 통계
+
+    구간 j의 시작 수준 base_j = 이전 구간 합계 누적, 직전 고점 = max(0, base_k + 최고점_k, k < j)
+    최대 낙폭 = max_j(구간 내 낙폭_j, 직전 고점 - (base_j + 최저점_j))
+    """
+    total, rise, dip, inner = (row[segments] for row in table)  # 각 (경로 × 구간)
+    if tail_table is not None:
+        for column, row in zip((total, rise, dip, inner), tail_table):
+            column[:, -1] = row[segments[:, -1]]
+
+    level = np.cumsum(total, axis=1)
+    base = level - total
+    low = base + dip
+    peak_before = np.maximum.accumulate(base + rise, axis=1)
+    peak_before[:, 1:] = peak_before[:, :-1]
+    peak_before[:, 0] = 0.0
+    np.maximum(peak_before, 0.0, out=peak_before)
+
+    with np.errstate(invalid='ignore'):
+        drawdown = np.maximum(inner, peak_before - low).max(axis=1)
+    min_level = np.minimum(low.min(axis=1), 0.0)
+    return np.expm1(level[:, -1]), -np.expm1(-drawdown), np.exp(min_level)
+
+
+def check_ruin_filter(
+    mc_result: MonteCarloResult,
+    max_ruin_probability: float = 0.05
+) -> Tuple[bool, float]:
+    """
+    파산 확률 필터
+
+    Args:
+        mc_result: 몬테카를로 결과
+        max_ruin_probability: 허용 파산 확률 (0~1)
+
+    Returns:
+        (통과 여부, 파산 확률)
+    """
+    return mc_result.probability_of_ruin <= max_ruin_probability, mc_result.probability_of_ruin
+
+
+def create_monte_carlo_simulator() -> MonteCarloSimulator:
+    """ScannerConfig 기반 몬테카를로 게이트 생성 (알 수 없는 재표본 방식은 bootstrap으로 대체)"""
+    method = ScannerConfig.MONTE_CARLO_METHOD
+    if method not in METHODS:
+        from src.utils.logger import Logger
+        Logger.print_warning(
+            f"SCANNER_MONTE_CARLO_METHOD '{method}'는 지원하지 않는 방식입니다 "
+            f"({', '.join(METHODS)}) - bootstrap 사용"
+        )
+        method = 'bootstrap'
+
+    return MonteCarloSimulator(MonteCarloConfig(
+        n_paths=ScannerConfig.MONTE_CARLO_PATHS,
+        method=method,
+        ruin_threshold=ScannerConfig.MONTE_CARLO_RUIN_THRESHOLD,
+        max_ruin_probability=ScannerConfig.MONTE_CARLO_MAX_RUIN_PROBABILITY
+    ))
@@ -0,0 +1,373 @@
+"""
+오더북 기록/재생 저장소
+
+실거래 중 감시 티커의 호가창을 일정 주기로 기록하고,
+백테스트에서 바 시각에 맞는 스냅샷을 재생하여 오더북 기반 슬리피지를 계산합니다.
+
+저장 형식 (티커별 디렉토리, 열 단위 고정폭 바이너리):
+    {root}/{ticker}/meta.json     # levels, base_ts, last_ts, count
+    {root}/{ticker}/ts_delta.bin  # uint32 초 단위 델타 (직전 기록 대비, 첫 기록은 base_ts 기준 0)
+    {root}/{ticker}/prices.bin    # float64 (count, 2, levels)  [매도 호가, 매수 호가]
+    {root}/{ticker}/sizes.bin     # float32 (count, 2, levels)
+
+호가 단계가 levels보다 적으면 NaN으로 채웁니다 (깊이 계산 시 제외).
+meta.json은 데이터 기록 후 원자적으로 교체하므로, 중간에 중단되어도
+meta의 count까지만 유효하며 다음 기록 시 초과분을 잘라냅니다.
+
+재생은 np.memmap으로 읽으므로 1년치 분봉 규모도 필요한 행만 페이지 단위로 로드합니다.
+
+사용 예시:
+    store = OrderbookStore("data/orderbooks")
+    replay = store.open("KRW-BTC")  # 최대 지연은 SlippageConfig.ORDERBOOK_REPLAY_MAX_STALENESS
+    backtester = Backtester(..., slippage_model=replay.as_slippage_model())
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..trading.orderbook_depth import DepthLevels, OrderbookSnapshot
+from ..utils.logger import Logger
+
+META_FILE = "meta.json"
+TS_FILE = "ts_delta.bin"
+PRICES_FILE = "prices.bin"
+SIZES_FILE = "sizes.bin"
+
+TS_DTYPE = np.dtype('<u4')
+PRICE_DTYPE = np.dtype('<f8')
+SIZE_DTYPE = np.dtype('<f4')
+
+
+def _to_epoch_seconds(timestamp: Any, timezone: str) -> int:
+    """타임스탬프를 epoch 초로 변환 (tz 정보가 없으면 timezone으로 간주)"""
+    if isinstance(timestamp, (int, float, np.integer, np.floating)):
+        return int(timestamp)
+    ts = pd.Timestamp(timestamp)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(timezone)
+    return int(ts.timestamp())
+
+
+class OrderbookStore:
+    """
+    티커별 오더북 스냅샷 저장소
+
+    Args:
+        root: 저장 디렉토리
+        levels: 저장할 호가 단계 수 (고정폭)
+    """
+
+    def __init__(self, root: str = "data/orderbooks", levels: int = 15):
+        self.root = Path(root)
+        self.levels = levels
+        self._lock = threading.Lock()
+
+    def _ticker_dir(self, ticker: str) -> Path:
+        return self.root / ticker
+
+    def read_meta(self, ticker: str) -> Optional[Dict[str, int]]:
+        """티커 메타 정보 (기록 없으면 None)"""
+        path = self._ticker_dir(ticker) / META_FILE
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def _write_meta(self, ticker: str, meta: Dict[str, int]) -> None:
+        path = self._ticker_dir(ticker) / META_FILE
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, path)
+
+    def _encode_levels(self, units: List[Dict[str, float]], levels: int):
+        """orderbook_units → (2, levels) 가격/수량 배열"""
+        prices = np.full((2, levels), np.nan, dtype=PRICE_DTYPE)
+        sizes = np.full((2, levels), np.nan, dtype=SIZE_DTYPE)
+        for i, unit in enumerate(units[:levels]):
+            prices[0, i] = unit.get('ask_price', np.nan)
+            sizes[0, i] = unit.get('ask_size', np.nan)
+            prices[1, i] = unit.get('bid_price', np.nan)
+            sizes[1, i] = unit.get('bid_size', np.nan)
+        return prices, sizes
+
+    def append(self, ticker: str, timestamp: Any, orderbook: Dict[str, Any],
+               timezone: str = "Asia/Seoul") -> bool:
+        """
+        스냅샷 1건 추가
+
+        Args:
+            ticker: 코인 티커
+            timestamp: 스냅샷 시각 (epoch 초 또는 datetime)
+            orderbook: Upbit 오더북 응답 ({'orderbook_units': [...]})
+            timezone: tz 정보가 없는 timestamp의 시간대
+
+        Returns:
+            기록 여부 (직전 기록보다 이르거나 같은 시각이면 False)
+        """
+        ts = _to_epoch_seconds(timestamp, timezone)
+        units = orderbook.get('orderbook_units') or []
+
+        with self._lock:
+            directory = self._ticker_dir(ticker)
+            directory.mkdir(parents=True, exist_ok=True)
+            meta = self.read_meta(ticker) or {
+                'levels': self.levels, 'base_ts': ts, 'last_ts': ts, 'count': 0
+            }
+            count = meta['count']
+            if count and ts <= meta['last_ts']:
+                return False
+
+            levels = meta['levels']
+            self._truncate(directory, count, levels)
+
+            delta = 0 if count == 0 else ts - meta['last_ts']
+            prices, sizes = self._encode_levels(units, levels)
+            with open(directory / TS_FILE, 'ab') as f:
+                f.write(np.array([delta], dtype=TS_DTYPE).tobytes())
+            with open(directory / PRICES_FILE, 'ab') as f:
+                f.write(prices.tobytes())
+            with open(directory / SIZES_FILE, 'ab') as f:
+                f.write(sizes.tobytes())
+
+            meta.update(last_ts=ts, count=count + 1)
+            self._write_meta(ticker, meta)
+            return True
+
+    @staticmethod
+    def _truncate(directory: Path, count: int, levels: int) -> None:
+        """meta에 반영되지 않은 초과 기록 제거 (기록 중 중단 대비)"""
+        expected = {
+            TS_FILE: count * TS_DTYPE.itemsize,
+            PRICES_FILE: count * 2 * levels * PRICE_DTYPE.itemsize,
+            SIZES_FILE: count * 2 * levels * SIZE_DTYPE.itemsize,
+        }
+        for name, size in expected.items():
+            path = directory / name
+            if path.exists() and path.stat().st_size > size:
+                with open(path, 'r+b') as f:
+                    f.truncate(size)
+
+    def tickers(self) -> List[str]:
+        """기록이 있는 티커 목록"""
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / META_FILE).exists())
+
+    def open(self, ticker: str, **kwargs) -> Optional['OrderbookReplay']:
+        """
+        재생기 생성 (기록 없으면 None)
+
+        Args:
+            ticker: 코인 티커
+            **kwargs: OrderbookReplay 옵션
+                (max_staleness_seconds 생략 시 SlippageConfig.ORDERBOOK_REPLAY_MAX_STALENESS)
+        """
+        meta = self.read_meta(ticker)
+        if not meta or meta['count'] == 0:
+            return None
+        if 'max_staleness_seconds' not in kwargs:
+            from ..config.settings import SlippageConfig
+            kwargs['max_staleness_seconds'] = SlippageConfig.ORDERBOOK_REPLAY_MAX_STALENESS
+        return OrderbookReplay(self._ticker_dir(ticker), meta, **kwargs)
+
+
+class OrderbookReplay:
+    """
+    기록된 오더북 재생기 (Backtester의 orderbook_provider)
+
+    타임스탬프 인덱스는 델타를 누적해 한 번만 만들고, 조회는 searchsorted로 O(log N)입니다.
+    가격/수량은 memmap으로 열어 조회한 행만 읽습니다.
+
+    Args:
+        directory: 티커 저장 디렉토리
+        meta: 메타 정보
+        max_staleness_seconds: 바 시각과 이보다 멀리 떨어진 스냅샷은 무시 (None이면 제한 없음)
+        direction: 'backward' (바 시각 이전 중 가장 가까운 스냅샷, 미래 정보 차단) 또는
+                   'nearest' (앞뒤 중 가장 가까운 스냅샷)
+        timezone: tz 정보가 없는 바 시각의 시간대 (Upbit 캔들은 KST)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        meta: Dict[str, int],
+        max_staleness_seconds: Optional[float],
+        direction: str = 'backward',
+        timezone: str = "Asia/Seoul"
+    ):
+        if direction not in ('backward', 'nearest'):
+            raise ValueError(f"direction은 'backward' 또는 'nearest'여야 합니다: {direction}")
+
+        count, levels = meta['count'], meta['levels']
+        self.levels = levels
+        self.max_staleness_seconds = max_staleness_seconds
+        self.direction = direction
+        self.timezone = timezone
+
+        deltas = np.memmap(directory / TS_FILE, dtype=TS_DTYPE, mode='r', shape=(count,))
+        self.timestamps = meta['base_ts'] + np.cumsum(deltas, dtype=np.int64)
+        self._prices = np.memmap(directory / PRICES_FILE, dtype=PRICE_DTYPE, mode='r', shape=(count, 2, levels))
+        self._sizes = np.memmap(directory / SIZES_FILE, dtype=SIZE_DTYPE, mode='r', shape=(count, 2, levels))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def index_at(self, timestamp: Any) -> Optional[int]:
+        """
+        바 시각에 대응하는 스냅샷 인덱스
+
+        Args:
+            timestamp: 바 시각 (datetime/pd.Timestamp/epoch 초)
+
+        Returns:
+            인덱스 또는 None (범위 밖 / max_staleness 초과)
+        """
+        ts = _to_epoch_seconds(timestamp, self.timezone)
+        right = int(np.searchsorted(self.timestamps, ts, side='right'))
+        candidates = [right - 1] if self.direction == 'backward' else [right - 1, right]
+        candidates = [i for i in candidates if 0 <= i < len(self)]
+        if not candidates:
+            return None
+
+        index = min(candidates, key=lambda i: abs(int(self.timestamps[i]) - ts))
+        if (self.max_staleness_seconds is not None
+                and abs(int(self.timestamps[index]) - ts) > self.max_staleness_seconds):
+            return None
+        return index
+
+    def snapshot(self, index: int, reference_price: Optional[float] = None) -> OrderbookSnapshot:
+        """
+        인덱스의 스냅샷 반환
+
+        reference_price가 주어지면 중간가가 reference_price가 되도록 가격을 비례 조정하고
+        수량은 반비례로 조정합니다 (호가 간격 비율과 KRW 깊이 유지).
+        바 가격과 기록 시점 가격 차이가 슬리피지로 잘못 잡히는 것을 막습니다.
+        """
+        prices = np.asarray(self._prices[index], dtype=float)
+        sizes = np.asarray(self._sizes[index], dtype=float)
+
+        best = [p for p in (prices[0, 0], prices[1, 0]) if p > 0]
+        if reference_price and best:
+            mid = sum(best) / len(best)
+            if mid > 0:
+                factor = reference_price / mid
+                prices = prices * factor
+                sizes = sizes / factor
+
+        return OrderbookSnapshot(
+            asks=DepthLevels(prices[0], sizes[0], is_ask=True),
+            bids=DepthLevels(prices[1], sizes[1], is_ask=False),
+        )
+
+    def __call__(self, timestamp: Any = None, reference_price: Optional[float] = None
+                 ) -> Optional[OrderbookSnapshot]:
+        """
+        orderbook_provider 인터페이스
+
+        Args:
+            timestamp: 바 시각 (None이면 마지막 스냅샷)
+            reference_price: 가격 기준 (바 체결가)
+
+        Returns:
+            OrderbookSnapshot 또는 None (대응 스냅샷 없음 → Backtester 기본 슬리피지)
+        """
+        index = len(self) - 1 if timestamp is None else self.index_at(timestamp)
+        if index is None:
+            return None
+        return self.snapshot(index, reference_price)
+
+    def as_slippage_model(self, default_slippage: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Backtester slippage_model 딕셔너리 생성
+
+        Args:
+            default_slippage: 스냅샷이 없는 바에 적용할 슬리피지 (기본 SlippageConfig 값)
+        """
+        if default_slippage is None:
+            from ..config.settings import SlippageConfig
+            default_slippage = SlippageConfig.BACKTEST_DEFAULT_SLIPPAGE
+        return {
+            'type': 'orderbook',
+            'orderbook_provider': self,
+            'default_slippage': default_slippage,
+        }
+
+
+class OrderbookRecorder:
+    """
+    감시 티커의 오더북을 주기적으로 기록
+
+    스케줄러가 record_once()를 일정 주기로 호출합니다 (IntervalTrigger).
+
+    Args:
+        store: 저장소
+        tickers: 감시 티커 목록
+        fetcher: 오더북 조회 함수 (티커 목록 → Upbit 응답 리스트, 기본 pyupbit.get_orderbook)
+    """
+
+    def __init__(
+        self,
+        store: OrderbookStore,
+        tickers: Iterable[str],
+        fetcher: Optional[Callable[[List[str]], List[Dict[str, Any]]]] = None
+    ):
+        self.store = store
+        self.tickers = list(tickers)
+        self._fetcher = fetcher
+        self.recorded = 0
+        self.failures = 0
+
+    def _fetch(self) -> List[Dict[str, Any]]:
+        if self._fetcher is not None:
+            return self._fetcher(self.tickers)
+        import pyupbit
+        result = pyupbit.get_orderbook(self.tickers)
+        if isinstance(result, dict):
+            result = [result]
+        return result or []
+
+    def record_once(self) -> int:
+        """
+        감시 티커 스냅샷 1회 기록 (동기 함수, API 1회 호출)
+
+        Returns:
+            기록한 티커 수
+        """
+        try:
+            orderbooks = self._fetch()
+        except Exception as e:
+            self.failures += 1
+            Logger.print_warning(f"오더북 조회 실패: {str(e)}")
+            return 0
+
+        now = time.time()
+        written = 0
+        for orderbook in orderbooks:
+            ticker = orderbook.get('market')
+            if ticker not in self.tickers:
+                continue
+            # Upbit 응답 timestamp는 ms
+            raw_ts = orderbook.get('timestamp')
+            timestamp = raw_ts / 1000 if raw_ts else now
+            if self.store.append(ticker, timestamp, orderbook):
+                written += 1
+
+        self.recorded += written
+        return written
+
+
+def create_orderbook_recorder() -> OrderbookRecorder:
+    """SlippageConfig 기반 오더북 기록기 생성"""
+    from ..config.settings import SlippageConfig
+
+    tickers = [t.strip() for t in SlippageConfig.ORDERBOOK_RECORDER_TICKERS.split(",") if t.strip()]
+    store = OrderbookStore(
+        root=SlippageConfig.ORDERBOOK_RECORDER_DIR,
+        levels=SlippageConfig.ORDERBOOK_RECORDER_LEVELS
+    )
+    return OrderbookRecorder(store=store, tickers=tickers)
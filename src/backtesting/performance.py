@@ -1,12 +1,153 @@
 """
 성과 분석 클래스
+
+자산 곡선은 float64 배열로, 거래 목록은 구조화 배열(trade_records)로 한 번만 변환한 뒤
+모든 지표를 벡터 연산으로 계산합니다.
+백테스트 도중 지표가 필요하면 StreamingMetrics에 봉마다 자산을 넣어 O(1)로 읽습니다.
 """
-from typing import List, Dict, Any, Optional
-import pandas as pd
+import math
+from typing import List, Dict, Any, Optional, Sequence
 import numpy as np
 from .portfolio import Trade
 
 
+# 거래 구조화 배열 dtype (Trade 한 건 = 한 행)
+TRADE_DTYPE = np.dtype([
+    ('pnl', 'f8'),
+    ('entry_price', 'f8'),
+    ('exit_price', 'f8'),
+    ('size', 'f8'),
+    ('commission', 'f8'),
+    ('holding_hours', 'f8'),
+])
+
+
+def trade_records(trades: Sequence[Trade]) -> np.ndarray:
+    """
+    거래 목록 → 구조화 배열 (거래 순회는 여기서 한 번만)
+
+    Args:
+        trades: Trade 목록
+
+    Returns:
+        TRADE_DTYPE 구조화 배열
+    """
+    return np.fromiter(
+        (
+            (
+                t.pnl, t.entry_price, t.exit_price, t.size, t.commission,
+                t.holding_period.total_seconds() / 3600
+            )
+            for t in trades
+        ),
+        dtype=TRADE_DTYPE,
+        count=len(trades)
+    )
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """표본 표준편차 (ddof=1, pandas와 같이 2개 미만이면 NaN)"""
+    if len(values) < 2:
+        return float('nan')
+    return float(np.std(values, ddof=1))
+
+
+def _max_run(mask: np.ndarray) -> int:
+    """최대 연속 True 길이 (벡터 연산)"""
+    if not mask.any():
+        return 0
+    padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(padded))
+    return int((edges[1::2] - edges[::2]).max())
+
+
+class StreamingMetrics:
+    """
+    봉 단위 온라인 지표 누적기
+
+    자산을 봉마다 update()로 넣으면 전체 곡선을 다시 보지 않고
+    현재 낙폭/최대 낙폭/Sharpe/총 수익률을 O(1)로 제공합니다.
+    (수익률 평균/분산은 Welford 방식으로 누적)
+    백테스트 도중 가망 없는 파라미터 조합을 조기에 끊는 판단에 사용합니다.
+
+    Args:
+        initial_capital: 초기 자본
+        data_interval: 데이터 간격 (연율화용)
+        risk_free_rate: 무위험 수익률 (연율)
+    """
+
+    def __init__(
+        self,
+        initial_capital: float,
+        data_interval: str = 'day',
+        risk_free_rate: float = 0.02
+    ):
+        self.initial_capital = initial_capital
+        self.annualization_factor = PerformanceAnalyzer._get_annualization_factor(data_interval)
+        self._period_risk_free = risk_free_rate / self.annualization_factor
+        self.bars = 0
+        self.equity: Optional[float] = None
+        self.peak: Optional[float] = None
+        self.max_drawdown = 0.0  # % (음수)
+        self._count = 0          # 수익률 개수
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, equity: float) -> None:
+        """봉 마감 자산 반영"""
+        if self.equity is not None and self.equity != 0:
+            ret = equity / self.equity - 1
+            self._count += 1
+            delta = ret - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (ret - self._mean)
+
+        self.equity = equity
+        self.peak = equity if self.peak is None else max(self.peak, equity)
+        self.max_drawdown = min(self.max_drawdown, self.drawdown)
+        self.bars += 1
+
+    @property
+    def drawdown(self) -> float:
+        """현재 낙폭 (%, 음수)"""
+        if not self.peak:
+            return 0.0
+        return (self.equity - self.peak) / self.peak * 100
+
+    @property
+    def total_return(self) -> float:
+        """초기 자본 대비 수익률 (%)"""
+        if self.equity is None or not self.initial_capital:
+            return 0.0
+        return (self.equity - self.initial_capital) / self.initial_capital * 100
+
+    @property
+    def volatility(self) -> float:
+        """연율화 변동성 (%)"""
+        if self._count < 2:
+            return 0.0
+        return math.sqrt(self._m2 / (self._count - 1)) * math.sqrt(self.annualization_factor) * 100
+
+    @property
+    def sharpe_ratio(self) -> float:
+        """연율화 Sharpe (PerformanceAnalyzer와 같은 정의)"""
+        if self._count < 2 or self._m2 <= 0:
+            return 0.0
+        std = math.sqrt(self._m2 / (self._count - 1))
+        return (self._mean - self._period_risk_free) / std * math.sqrt(self.annualization_factor)
+
+    def snapshot(self) -> Dict[str, float]:
+        """현재 지표 딕셔너리"""
+        return {
+            'bars': self.bars,
+            'total_return': self.total_return,
+            'drawdown': self.drawdown,
+            'max_drawdown': self.max_drawdown,
+            'volatility': self.volatility,
+            'sharpe_ratio': self.sharpe_ratio,
+        }
+
+
 class PerformanceAnalyzer:
     """성과 분석"""
 
@@ -36,7 +177,7 @@ class PerformanceAnalyzer:
 
     @staticmethod
     def calculate_metrics(
-        equity_curve: List[float],
+        equity_curve: Sequence[float],
         trades: List[Trade],
         initial_capital: float,
         data_interval: str = 'day'  # 데이터 간격 파라미터 추가
@@ -45,7 +186,7 @@ class PerformanceAnalyzer:
         핵심 성과 지표 계산
 
         Args:
-            equity_curve: 자산 곡선
+            equity_curve: 자산 곡선 (리스트 또는 float64 배열)
             trades: 거래 목록
             initial_capital: 초기 자본
             data_interval: 데이터 간격 ('day', 'minute60', 'minute15', 등)
@@ -54,67 +195,55 @@ class PerformanceAnalyzer:
         Returns:
             성과 지표 딕셔너리
         """
-
-        if not equity_curve:
+        equity = np.asarray(equity_curve, dtype=np.float64)
+        if equity.size == 0:
             return {}
 
-        equity_series = pd.Series(equity_curve)
-        returns = equity_series.pct_change().dropna()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = equity[1:] / equity[:-1] - 1
 
         # 연율화 상수 (데이터 간격에 따라 동적 결정)
         annualization_factor = PerformanceAnalyzer._get_annualization_factor(data_interval)
 
         # 1. 수익 지표
-        total_return = (equity_curve[-1] - initial_capital) / initial_capital * 100
+        total_return = (equity[-1] - initial_capital) / initial_capital * 100
 
         # 2. 리스크 지표 (연율화 상수 적용)
-        volatility = returns.std() * np.sqrt(annualization_factor) * 100 if len(returns) > 0 else 0
-        max_drawdown = PerformanceAnalyzer._calculate_max_drawdown(equity_series)
-        
+        volatility = _sample_std(returns) * np.sqrt(annualization_factor) * 100 if len(returns) > 0 else 0
+        max_drawdown = PerformanceAnalyzer._calculate_max_drawdown(equity)
+
         # 3. 위험 조정 수익률 (연율화 상수 전달)
         sharpe_ratio = PerformanceAnalyzer._calculate_sharpe(returns, annualization_factor=annualization_factor) if len(returns) > 0 else 0
         sortino_ratio = PerformanceAnalyzer._calculate_sortino(returns, annualization_factor=annualization_factor) if len(returns) > 0 else 0
         calmar_ratio = total_return / abs(max_drawdown) if max_drawdown != 0 else 0
-        
-        # 4. 거래 통계
-        winning_trades = [t for t in trades if t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl < 0]
-        
-        win_rate = len(winning_trades) / len(trades) * 100 if trades else 0
-        
-        avg_win = np.mean([t.pnl for t in winning_trades]) if winning_trades else 0
-        avg_loss = np.mean([t.pnl for t in losing_trades]) if losing_trades else 0
-        
+
+        # 4~6. 거래 통계 (구조화 배열 한 번 변환 후 벡터 연산)
+        records = trade_records(trades)
+        pnl = records['pnl']
+        wins = pnl > 0
+        losses = pnl < 0
+        win_count = int(wins.sum())
+        loss_count = int(losses.sum())
+        win_sum = float(pnl[wins].sum())
+        loss_sum = float(pnl[losses].sum())
+
+        win_rate = win_count / len(pnl) * 100 if len(pnl) else 0
+        avg_win = win_sum / win_count if win_count else 0
+        avg_loss = loss_sum / loss_count if loss_count else 0
+
         profit_factor = (
-            abs(sum(t.pnl for t in winning_trades)) / 
-            abs(sum(t.pnl for t in losing_trades))
-            if losing_trades and sum(t.pnl for t in losing_trades) != 0 else float('inf')
-        )
-        
-        # 5. 최대 연속 손익
-        max_consecutive_wins = PerformanceAnalyzer._max_consecutive(
-            [t.pnl > 0 for t in trades]
+            abs(win_sum) / abs(loss_sum)
+            if loss_count and loss_sum != 0 else float('inf')
         )
-        max_consecutive_losses = PerformanceAnalyzer._max_consecutive(
-            [t.pnl < 0 for t in trades]
-        )
-        
-        # 6. 평균 보유 기간
-        avg_holding_period = np.mean([
-            t.holding_period.total_seconds() / 3600 
-            for t in trades
-        ]) if trades else 0
-        
+
         # 7. 손실 거래 분석 (P1 #5: 손실 날 메타데이터)
-        worst_loss_metadata = PerformanceAnalyzer._analyze_worst_loss_trades(
-            trades, losing_trades
-        )
+        worst_loss_metadata = PerformanceAnalyzer._analyze_worst_loss_trades(trades, records)
 
         return {
             # 수익 지표
-            'total_return': total_return,
+            'total_return': float(total_return),
             'total_trades': len(trades),
-            'final_equity': equity_curve[-1],
+            'final_equity': float(equity[-1]),
 
             # 리스크 지표
             'volatility': volatility,
@@ -125,17 +254,17 @@ class PerformanceAnalyzer:
 
             # 거래 통계
             'win_rate': win_rate,
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
+            'winning_trades': win_count,
+            'losing_trades': loss_count,
             'avg_win': avg_win,
             'avg_loss': avg_loss,
             'profit_factor': profit_factor,
-            'max_consecutive_wins': max_consecutive_wins,
-            'max_consecutive_losses': max_consecutive_losses,
+            'max_consecutive_wins': _max_run(wins),
+            'max_consecutive_losses': _max_run(losses),
 
             # 기타
-            'avg_holding_period_hours': avg_holding_period,
-            'total_commission': sum(t.commission for t in trades),
+            'avg_holding_period_hours': float(records['holding_hours'].mean()) if len(records) else 0,
+            'total_commission': float(records['commission'].sum()),
 
             # 메타 정보
             'data_interval': data_interval,
@@ -144,21 +273,22 @@ class PerformanceAnalyzer:
             # P1 #5: 손실 날 메타데이터 (AI 프롬프트에서 현재 상황과 비교용)
             'worst_loss_metadata': worst_loss_metadata
         }
-    
+
     @staticmethod
-    def _calculate_max_drawdown(equity_series: pd.Series) -> float:
+    def _calculate_max_drawdown(equity_series: Sequence[float]) -> float:
         """최대 낙폭 계산"""
-        if len(equity_series) == 0:
+        equity = np.asarray(equity_series, dtype=np.float64)
+        if len(equity) == 0:
             return 0.0
-        
-        cumulative_returns = equity_series / equity_series.iloc[0]
-        running_max = cumulative_returns.expanding().max()
+
+        cumulative_returns = equity / equity[0]
+        running_max = np.maximum.accumulate(cumulative_returns)
         drawdown = (cumulative_returns - running_max) / running_max * 100
-        return drawdown.min()
-    
+        return float(drawdown.min())
+
     @staticmethod
     def _calculate_sharpe(
-        returns: pd.Series,
+        returns: Sequence[float],
         risk_free_rate: float = 0.02,
         annualization_factor: int = 365
     ) -> float:
@@ -166,29 +296,31 @@ class PerformanceAnalyzer:
         샤프 비율 계산
 
         Args:
-            returns: 수익률 시리즈
+            returns: 수익률 시리즈 (Series 또는 배열)
             risk_free_rate: 무위험 수익률 (연율, 기본 2%)
             annualization_factor: 연율화 상수 (데이터 간격에 따라 다름)
 
         Returns:
             연율화된 샤프 비율
         """
-        if len(returns) == 0 or returns.std() == 0:
+        returns = np.asarray(returns, dtype=np.float64)
+        if len(returns) == 0 or _sample_std(returns) == 0:
             return 0
 
         # 무위험 수익률을 데이터 간격에 맞게 조정
         period_risk_free = risk_free_rate / annualization_factor
         excess_returns = returns - period_risk_free
 
-        if excess_returns.std() == 0:
+        excess_std = _sample_std(excess_returns)
+        if excess_std == 0:
             return 0
 
         # 연율화된 샤프 비율
-        return (excess_returns.mean() / excess_returns.std()) * np.sqrt(annualization_factor)
-    
+        return float(excess_returns.mean() / excess_std * np.sqrt(annualization_factor))
+
     @staticmethod
     def _calculate_sortino(
-        returns: pd.Series,
+        returns: Sequence[float],
         risk_free_rate: float = 0.02,
         annualization_factor: int = 365
     ) -> float:
@@ -196,13 +328,14 @@ class PerformanceAnalyzer:
         소르티노 비율 계산 (하방 리스크만 고려)
 
         Args:
-            returns: 수익률 시리즈
+            returns: 수익률 시리즈 (Series 또는 배열)
             risk_free_rate: 무위험 수익률 (연율, 기본 2%)
             annualization_factor: 연율화 상수 (데이터 간격에 따라 다름)
 
         Returns:
             연율화된 소르티노 비율
         """
+        returns = np.asarray(returns, dtype=np.float64)
         if len(returns) == 0:
             return 0
 
@@ -211,31 +344,22 @@ class PerformanceAnalyzer:
         excess_returns = returns - period_risk_free
         downside_returns = excess_returns[excess_returns < 0]
 
-        if len(downside_returns) == 0 or downside_returns.std() == 0:
+        downside_std = _sample_std(downside_returns)
+        if len(downside_returns) == 0 or downside_std == 0:
             return 0
 
         # 연율화된 소르티노 비율
-        return (excess_returns.mean() / downside_returns.std()) * np.sqrt(annualization_factor)
-    
+        return float(excess_returns.mean() / downside_std * np.sqrt(annualization_factor))
+
     @staticmethod
-    def _max_consecutive(boolean_list: List[bool]) -> int:
+    def _max_consecutive(boolean_list: Sequence[bool]) -> int:
         """최대 연속 True 개수"""
-        max_count = 0
-        current_count = 0
-
-        for val in boolean_list:
-            if val:
-                current_count += 1
-                max_count = max(max_count, current_count)
-            else:
-                current_count = 0
-
-        return max_count
+        return _max_run(np.asarray(boolean_list, dtype=bool))
 
     @staticmethod
     def _analyze_worst_loss_trades(
         all_trades: List[Trade],
-        losing_trades: List[Trade]
+        records: np.ndarray
     ) -> Dict[str, Any]:
         """
         P1 #5: 손실 거래 분석 - 최악의 손실 거래 메타데이터 추출
@@ -245,58 +369,34 @@ class PerformanceAnalyzer:
 
         Args:
             all_trades: 모든 거래 목록
-            losing_trades: 손실 거래 목록
+            records: all_trades의 구조화 배열 (trade_records)
 
         Returns:
             손실 거래 메타데이터 딕셔너리
         """
-        if not losing_trades:
+        pnl = records['pnl']
+        losses = pnl < 0
+        if not losses.any():
             return {
                 'has_losses': False,
                 'message': '손실 거래 없음 (양호)'
             }
 
-        # 최악의 손실 거래 찾기 (금액 기준)
-        worst_trade = min(losing_trades, key=lambda t: t.pnl)
-
-        # 손실률 기준 최악 거래
-        worst_by_pct = min(
-            losing_trades,
-            key=lambda t: t.pnl / (t.entry_price * t.size) if t.entry_price and t.size else 0
-        )
+        # 최악의 손실 거래 찾기 (금액 기준, 동률이면 먼저 발생한 거래)
+        loss_pnl = np.where(losses, pnl, np.inf)
+        worst_trade = all_trades[int(np.argmin(loss_pnl))]
 
         # 연속 손실 분석
-        consecutive_losses = []
-        current_streak = 0
-        for trade in all_trades:
-            if trade.pnl < 0:
-                current_streak += 1
-            else:
-                if current_streak > 0:
-                    consecutive_losses.append(current_streak)
-                current_streak = 0
-        if current_streak > 0:
-            consecutive_losses.append(current_streak)
-
-        max_consecutive = max(consecutive_losses) if consecutive_losses else 0
+        max_consecutive = _max_run(losses)
 
         # 손실 거래의 평균 보유 기간
-        avg_loss_holding_hours = np.mean([
-            t.holding_period.total_seconds() / 3600
-            for t in losing_trades
-        ]) if losing_trades else 0
-
-        # 손실 거래 발생 시간대 분석 (있으면)
-        loss_timestamps = []
-        for t in losing_trades:
-            if hasattr(t, 'exit_time') and t.exit_time:
-                loss_timestamps.append(t.exit_time)
+        avg_loss_holding_hours = float(records['holding_hours'][losses].mean())
 
         return {
             'has_losses': True,
-            'total_loss_count': len(losing_trades),
-            'total_loss_amount': sum(t.pnl for t in losing_trades),
-            'avg_loss_per_trade': np.mean([t.pnl for t in losing_trades]),
+            'total_loss_count': int(losses.sum()),
+            'total_loss_amount': float(pnl[losses].sum()),
+            'avg_loss_per_trade': float(pnl[losses].mean()),
 
             # 최악의 손실 거래 상세
             'worst_loss': {
@@ -322,7 +422,3 @@ class PerformanceAnalyzer:
                 f"손실 거래 평균 보유: {avg_loss_holding_hours:.1f}시간."
             )
         }
-
-
-
-
@@ -197,6 +197,17 @@ class Portfolio:
 
         return trade
     
+    def mark_price(self, symbol: str, price: float):
+        """
+        단일 종목 가격 업데이트 (다중 종목 백테스트용)
+
+        update()는 한 종목만 보유한다고 가정하고 모든 포지션에 같은 종가를 적용하므로,
+        여러 종목을 동시에 보유할 때는 종목별로 이 메서드를 사용합니다.
+        """
+        position = self.positions.get(symbol)
+        if position is not None:
+            position.update_price(price)
+
     def update(self, current_bar: pd.Series):
         """포트폴리오 업데이트 (미실현 손익)"""
         current_price = current_bar['close']
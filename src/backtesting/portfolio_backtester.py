@@ -0,0 +1,339 @@
+"""
+다중 종목 포트폴리오 백테스팅 엔진 (공유 시계)
+
+Backtester는 한 종목만 다루므로 실거래처럼 여러 코인을 공유 자본으로
+동시에 보유하는 상황을 재현할 수 없습니다.
+PortfolioBacktester는 N개 종목의 봉을 하나의 합집합 타임라인으로 한 번에 진행합니다.
+
+- 종목별 NumPy 배열 + 커서 (다음에 처리할 봉 위치)
+- 다음 봉 시각 힙 (heapq): 같은 시각의 종목들을 묶어서 처리
+- 공유 Portfolio + PortfolioManager 사이징 (최대 포지션 수, 코인당 최대 비율, 예비 자금)
+- 포트폴리오 지표는 PerformanceAnalyzer 재사용
+
+시각 하나를 처리할 때 그 시각에 봉이 있는 종목만 건드리므로
+전체 비용은 총 봉 수에 대략 선형입니다 (힙 연산은 O(log 종목수)).
+
+사용 예시:
+    engine = PortfolioBacktester(
+        strategy_factory=lambda ticker: RuleBasedBreakoutStrategy(ticker=ticker),
+        data={"KRW-BTC": btc_df, "KRW-ETH": eth_df},
+        initial_capital=10_000_000,
+        max_positions=3,
+        data_interval='minute60',
+    )
+    result = engine.run()
+"""
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .backtester import BacktestResult
+from .performance import StreamingMetrics
+from .portfolio import Portfolio
+from .strategy import Signal, Strategy
+from ..exceptions import InsufficientFundsError
+from ..position.portfolio_manager import PortfolioManager
+
+
+@dataclass
+class PortfolioBacktestResult(BacktestResult):
+    """
+    포트폴리오 백테스트 결과
+
+    equity_curve는 합집합 타임라인의 시각마다 한 번씩 기록됩니다.
+    """
+    timestamps: List = field(default_factory=list)
+    ticker_stats: Dict[str, dict] = field(default_factory=dict)
+    skipped_entries: int = 0  # 슬롯/자본 부족으로 건너뛴 매수 신호 수
+
+
+class _TickerCursor:
+    """종목별 봉 배열과 현재 위치"""
+
+    __slots__ = (
+        'ticker', 'data', 'strategy', 'times', 'open', 'high', 'low', 'close',
+        'position', 'pending', 'stop_loss', 'take_profit'
+    )
+
+    def __init__(self, ticker: str, data: pd.DataFrame, strategy: Strategy):
+        self.ticker = ticker
+        self.data = data
+        self.strategy = strategy
+        self.times = data.index.values
+        self.open = data['open'].to_numpy(dtype=float)
+        self.high = data['high'].to_numpy(dtype=float)
+        self.low = data['low'].to_numpy(dtype=float)
+        self.close = data['close'].to_numpy(dtype=float)
+        self.position = -1  # 마지막으로 처리한 봉 위치
+        self.pending: Optional[Signal] = None
+        self.stop_loss: Optional[float] = None
+        self.take_profit: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+
+class PortfolioBacktester:
+    """
+    다중 종목 포트폴리오 백테스팅 엔진
+
+    Args:
+        strategy_factory: 종목별 전략 생성 함수 (ticker -> Strategy)
+        data: 종목별 OHLCV 데이터 (DatetimeIndex 오름차순)
+        initial_capital: 초기 자본
+        commission: 수수료율
+        slippage: 슬리피지율
+        max_positions: 최대 동시 보유 종목 수
+        max_allocation_per_coin: 코인당 최대 자본 비율
+        execute_on_next_open: True면 t 종가 신호를 해당 종목의 다음 봉 시가에 체결
+        use_intrabar_stops: True면 봉 고가/저가로 신호의 스탑/익절 체크 (둘 다 닿으면 스탑 우선)
+        data_interval: 데이터 간격 (연율화 계산용)
+        portfolio_manager: 사이징에 사용할 PortfolioManager (None이면 위 설정으로 생성)
+    """
+
+    def __init__(
+        self,
+        strategy_factory: Callable[[str], Strategy],
+        data: Dict[str, pd.DataFrame],
+        initial_capital: float,
+        commission: float = 0.0005,
+        slippage: float = 0.0001,
+        max_positions: int = PortfolioManager.MAX_POSITIONS,
+        max_allocation_per_coin: float = PortfolioManager.MAX_ALLOCATION_PER_COIN,
+        execute_on_next_open: bool = True,
+        use_intrabar_stops: bool = False,
+        data_interval: str = 'day',
+        portfolio_manager: Optional[PortfolioManager] = None
+    ):
+        self.initial_capital = initial_capital
+        self.commission = commission
+        self.slippage = slippage
+        self.execute_on_next_open = execute_on_next_open
+        self.use_intrabar_stops = use_intrabar_stops
+        self.data_interval = data_interval
+        # 사이징 계산만 사용하므로 거래소 클라이언트 불필요
+        self.portfolio_manager = portfolio_manager or PortfolioManager(
+            exchange_client=None,
+            max_positions=max_positions,
+            max_allocation_per_coin=max_allocation_per_coin
+        )
+
+        self.cursors: List[_TickerCursor] = [
+            _TickerCursor(ticker, frame, strategy_factory(ticker))
+            for ticker, frame in data.items()
+            if frame is not None and len(frame) > 0
+        ]
+
+        self.portfolio = Portfolio(initial_capital)
+        self.orders: List[dict] = []
+        self.equity_curve = np.empty(0, dtype=np.float64)  # run()에서 미리 할당
+        self.timestamps: List = []
+        self.live_metrics = StreamingMetrics(initial_capital, data_interval)
+        self.skipped_entries = 0
+
+    def run(self) -> PortfolioBacktestResult:
+        """
+        백테스트 실행
+
+        같은 시각에 봉이 있는 종목들을 한 묶음으로 처리합니다.
+        묶음 안에서는 매도 체결 → 매수 체결 → 가격 반영 → 신호 생성 순서이며,
+        매수는 종목 입력 순서대로 슬롯/자본이 허락하는 만큼만 체결합니다.
+        """
+        for cursor in self.cursors:
+            cursor.strategy.prepare_indicators(cursor.data)
+
+        heap = [(cursor.times[0], i) for i, cursor in enumerate(self.cursors)]
+        heapq.heapify(heap)
+        # 합집합 시각 수 <= 전체 봉 수 → 상한만큼 할당 후 잘라냄
+        equity = np.empty(sum(len(cursor) for cursor in self.cursors), dtype=np.float64)
+        steps = 0
+
+        while heap:
+            timestamp = heap[0][0]
+            group: List[_TickerCursor] = []
+            while heap and heap[0][0] == timestamp:
+                _, i = heapq.heappop(heap)
+                cursor = self.cursors[i]
+                cursor.position += 1
+                group.append(cursor)
+                if cursor.position + 1 < len(cursor):
+                    heapq.heappush(heap, (cursor.times[cursor.position + 1], i))
+
+            self._step(group)
+            self.timestamps.append(pd.Timestamp(timestamp))
+            equity[steps] = self.portfolio.total_value
+            self.live_metrics.update(equity[steps])
+            steps += 1
+
+        self.equity_curve = equity[:steps]
+        return self._analyze_results()
+
+    def _step(self, group: List[_TickerCursor]) -> None:
+        """한 시각의 종목 묶음 처리"""
+        if self.use_intrabar_stops:
+            for cursor in group:
+                self._check_intrabar_exit(cursor)
+
+        if self.execute_on_next_open:
+            pending = [cursor for cursor in group if cursor.pending is not None]
+            # 매도를 먼저 체결해 같은 시각 매수에 슬롯/현금을 돌려줌
+            pending.sort(key=lambda cursor: cursor.pending.action == 'buy')
+            for cursor in pending:
+                signal, cursor.pending = cursor.pending, None
+                self._execute(cursor, signal, cursor.open[cursor.position])
+
+        for cursor in group:
+            self.portfolio.mark_price(cursor.ticker, cursor.close[cursor.position])
+
+        for cursor in group:
+            signal = self._generate_signal(cursor)
+            if signal is None:
+                continue
+            if not self.execute_on_next_open:
+                self._execute(cursor, signal, cursor.close[cursor.position])
+            elif cursor.position + 1 < len(cursor):
+                cursor.pending = signal
+            # else: 해당 종목 마지막 봉의 신호는 체결할 다음 봉이 없으므로 무시
+
+    def _generate_signal(self, cursor: _TickerCursor) -> Optional[Signal]:
+        try:
+            return cursor.strategy.generate_signal(
+                cursor.data.iloc[:cursor.position + 1],
+                portfolio=self.portfolio
+            )
+        except Exception as e:
+            print(f"\n⚠️  {cursor.ticker} 시점 {cursor.position + 1}에서 신호 생성 오류: {str(e)}")
+            return None
+
+    def _bar_time(self, cursor: _TickerCursor) -> datetime:
+        return pd.Timestamp(cursor.times[cursor.position]).to_pydatetime()
+
+    def _execute(self, cursor: _TickerCursor, signal: Signal, price: float) -> None:
+        """주문 체결 (공유 포트폴리오)"""
+        if signal.action == 'buy':
+            self._open(cursor, signal, price)
+        elif signal.action in ('sell', 'close'):
+            self._close(cursor, price, exit_reason='signal')
+
+    def _open(self, cursor: _TickerCursor, signal: Signal, price: float) -> None:
+        if cursor.ticker in self.portfolio.positions:
+            return
+
+        budget = self.portfolio_manager.calculate_entry_capital(
+            krw_balance=self.portfolio.cash,
+            total_capital=self.portfolio.total_value,
+            position_count=len(self.portfolio.positions)
+        )
+        execution_price = price * (1 + self.slippage)
+        size = signal.size
+        if size is None:
+            size = cursor.strategy.calculate_position_size(signal, self.portfolio)
+        # 수수료까지 예산 안에 들어오도록 제한
+        size = min(size or 0.0, budget / (execution_price * (1 + self.commission)))
+
+        if budget <= 0 or size * execution_price < PortfolioManager.MIN_POSITION_VALUE:
+            self.skipped_entries += 1
+            return
+
+        try:
+            self.portfolio.open_position(
+                symbol=cursor.ticker,
+                size=size,
+                price=price,
+                commission=self.commission,
+                slippage=self.slippage,
+                timestamp=self._bar_time(cursor)
+            )
+        except InsufficientFundsError:
+            self.skipped_entries += 1
+            return
+
+        cursor.stop_loss = signal.stop_loss
+        cursor.take_profit = signal.take_profit
+        self.orders.append({
+            'ticker': cursor.ticker,
+            'action': 'buy',
+            'price': price,
+            'actual_price': execution_price,
+            'size': size,
+            'timestamp': cursor.times[cursor.position]
+        })
+
+    def _close(self, cursor: _TickerCursor, price: float, exit_reason: str) -> None:
+        trade = self.portfolio.close_position(
+            symbol=cursor.ticker,
+            price=price,
+            commission=self.commission,
+            slippage=self.slippage,
+            timestamp=self._bar_time(cursor)
+        )
+        if trade is None:
+            return
+
+        cursor.stop_loss = None
+        cursor.take_profit = None
+        self.orders.append({
+            'ticker': cursor.ticker,
+            'action': 'sell',
+            'price': price,
+            'actual_price': trade.exit_price,
+            'size': trade.size,
+            'timestamp': cursor.times[cursor.position],
+            'exit_reason': exit_reason
+        })
+
+    def _check_intrabar_exit(self, cursor: _TickerCursor) -> None:
+        """
+        봉 내 스탑/익절 체크
+
+        갭으로 시가가 이미 스탑 아래(익절 위)면 시가에 체결합니다.
+        """
+        if cursor.ticker not in self.portfolio.positions:
+            return
+
+        i = cursor.position
+        if cursor.stop_loss is not None and cursor.low[i] <= cursor.stop_loss:
+            self._close(cursor, min(cursor.open[i], cursor.stop_loss), exit_reason='stop_loss')
+            cursor.pending = None
+        elif cursor.take_profit is not None and cursor.high[i] >= cursor.take_profit:
+            self._close(cursor, max(cursor.open[i], cursor.take_profit), exit_reason='take_profit')
+            cursor.pending = None
+
+    def _analyze_results(self) -> PortfolioBacktestResult:
+        """결과 분석"""
+        from .performance import PerformanceAnalyzer
+
+        trades = self.portfolio.closed_trades
+        metrics = PerformanceAnalyzer.calculate_metrics(
+            equity_curve=self.equity_curve,
+            trades=trades,
+            initial_capital=self.initial_capital,
+            data_interval=self.data_interval
+        )
+
+        ticker_stats = {}
+        for cursor in self.cursors:
+            pnls = np.array([t.pnl for t in trades if t.symbol == cursor.ticker])
+            ticker_stats[cursor.ticker] = {
+                'bars': len(cursor),
+                'trades': len(pnls),
+                'total_pnl': float(pnls.sum()) if len(pnls) else 0.0,
+                'win_rate': float((pnls > 0).mean() * 100) if len(pnls) else 0.0,
+                'open_position': cursor.ticker in self.portfolio.positions,
+            }
+
+        return PortfolioBacktestResult(
+            initial_capital=self.initial_capital,
+            final_equity=float(self.equity_curve[-1]) if len(self.equity_curve) else self.initial_capital,
+            equity_curve=self.equity_curve,
+            trades=trades,
+            metrics=metrics,
+            execution_mode='next_open' if self.execute_on_next_open else 'close',
+            timestamps=self.timestamps,
+            ticker_stats=ticker_stats,
+            skipped_entries=self.skipped_entries
+        )
@@ -13,6 +13,7 @@ import numpy as np
 from .strategy import Strategy, Signal
 from .portfolio import Portfolio
 from ..trading.indicators import TechnicalIndicators
+from ..trading.orderbook_depth import OrderbookSnapshot
 from ..config.settings import StrategyConfig
 
 # 상수 정의
@@ -833,7 +834,8 @@ class RuleBasedBreakoutStrategy(Strategy):
             expected_price: 예상 가격 (현재가)
             order_size: 주문 수량
             orderbook: 오더북 정보 {'ask_prices': [...], 'ask_volumes': [...]} 또는
-                                  {'bid_prices': [...], 'bid_volumes': [...]}
+                                  {'bid_prices': [...], 'bid_volumes': [...]} 또는
+                                  OrderbookSnapshot (한 번 변환해 재사용)
         
         Returns:
             {
@@ -843,14 +845,9 @@ class RuleBasedBreakoutStrategy(Strategy):
                 'warning': 경고 메시지 (허용치 초과 시)
             }
         """
-        if order_type == 'buy':
-            prices = orderbook.get('ask_prices', [])
-            volumes = orderbook.get('ask_volumes', [])
-        else:  # sell
-            prices = orderbook.get('bid_prices', [])
-            volumes = orderbook.get('bid_volumes', [])
-        
-        if not prices or not volumes:
+        levels = OrderbookSnapshot.coerce(orderbook).side(order_type)
+
+        if levels.raw_levels == 0:
             # 오더북 정보 없으면 기본 슬리피지 가정 (0.1%)
             slippage_pct = 0.001
             actual_avg_price = expected_price * (1 + slippage_pct) if order_type == 'buy' else expected_price * (1 - slippage_pct)
@@ -861,24 +858,16 @@ class RuleBasedBreakoutStrategy(Strategy):
                 'warning': '오더북 정보 없음 - 기본 슬리피지 0.1% 가정'
             }
         
-        # 오더북 호가를 순회하며 체결 시뮬레이션
-        remaining_size = order_size
-        total_cost = 0.0
-        filled_size = 0.0
-        
-        for price, volume in zip(prices, volumes):
-            if remaining_size <= 0:
-                break
-            
-            # 이 호가에서 체결 가능한 수량
-            fill_size = min(remaining_size, volume)
-            total_cost += fill_size * price
-            filled_size += fill_size
-            remaining_size -= fill_size
+        # 누적 깊이에서 체결 시뮬레이션 (호가 순회 없음)
+        fill = levels.fill_size(order_size)
+        total_cost = fill.filled_notional
+        filled_size = fill.filled_size
         
         # 남은 수량이 있으면 마지막 가격으로 체결 (최악의 시나리오)
-        if remaining_size > 0 and prices:
-            total_cost += remaining_size * prices[-1]
+        remaining_size = order_size - filled_size
+        if remaining_size > 0:
+            last_price = float(levels.prices[-1]) if len(levels) else levels.best_price
+            total_cost += remaining_size * last_price
             filled_size += remaining_size
         
         # 평균 체결가 계산
@@ -962,26 +951,8 @@ class RuleBasedBreakoutStrategy(Strategy):
         Returns:
             최적 분할 개수 (1 이상)
         """
-        if order_type == 'buy':
-            volumes = orderbook.get('ask_volumes', [])
-        else:
-            volumes = orderbook.get('bid_volumes', [])
-        
-        if not volumes:
-            return 1
-        
-        # 상위 5개 호가의 평균 물량
-        top_volumes = volumes[:5]
-        avg_volume = sum(top_volumes) / len(top_volumes) if top_volumes else order_size
-        
-        # 주문량이 평균 호가 물량보다 크면 분할 권장
-        if order_size > avg_volume:
-            # 주문량을 평균 물량으로 나눈 값 (최소 2개, 최대 10개)
-            optimal_splits = int(order_size / avg_volume)
-            optimal_splits = max(2, min(optimal_splits, 10))
-            return optimal_splits
-        
-        return 1
+        # 상위 5개 호가의 평균 물량보다 주문량이 크면 분할 (최소 2개, 최대 10개)
+        return OrderbookSnapshot.coerce(orderbook).side(order_type).optimal_splits(order_size)
     
     def simulate_split_order_execution(
         self,
@@ -1007,25 +978,28 @@ class RuleBasedBreakoutStrategy(Strategy):
             }
         """
         split_orders = self.split_order(total_size, num_splits)
+        snapshot = OrderbookSnapshot.coerce(orderbook)
         
         filled_orders = []
         total_cost = 0.0
         total_filled = 0.0
         
         # 첫 번째 주문의 예상 가격 (슬리피지 계산용)
-        if order_type == 'buy':
-            expected_price = orderbook.get('ask_prices', [100000])[0]
-        else:
-            expected_price = orderbook.get('bid_prices', [100000])[0]
+        levels = snapshot.side(order_type)
+        expected_price = levels.best_price if levels.raw_levels else 100000
         
+        # 균등 분할이므로 각 분할 주문의 체결 결과는 동일 - 한 번만 계산
+        slippage_cache = {}
         for order in split_orders:
-            # 각 분할 주문의 슬리피지 계산
-            slippage_info = self.calculate_slippage(
-                order_type=order_type,
-                expected_price=expected_price,
-                order_size=order['size'],
-                orderbook=orderbook
-            )
+            slippage_info = slippage_cache.get(order['size'])
+            if slippage_info is None:
+                slippage_info = self.calculate_slippage(
+                    order_type=order_type,
+                    expected_price=expected_price,
+                    order_size=order['size'],
+                    orderbook=snapshot
+                )
+                slippage_cache[order['size']] = slippage_info
             
             filled_orders.append({
                 'order_num': order['order_num'],
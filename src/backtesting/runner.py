@@ -1,12 +1,13 @@
 """
 백테스트 실행 및 결과 관리
 """
-from typing import List
+from typing import List, Optional, Sequence
 import pandas as pd
 import numpy as np
 from .backtester import Backtester, BacktestResult
 from .strategy import Strategy
 from .performance import PerformanceAnalyzer
+from .stopping_rules import StoppingRule
 
 
 class BacktestRunner:
@@ -19,9 +20,10 @@ class BacktestRunner:
         ticker: str,
         initial_capital: float = 10_000_000,
         commission: float = 0.0005,
-        slippage: float = 0.0001
+        slippage: float = 0.0001,
+        stopping_rules: Optional[Sequence[StoppingRule]] = None
     ) -> BacktestResult:
-        """백테스트 실행"""
+        """백테스트 실행 (stopping_rules: 조기 종료 규칙)"""
         
         backtester = Backtester(
             strategy=strategy,
@@ -29,7 +31,8 @@ class BacktestRunner:
             ticker=ticker,
             initial_capital=initial_capital,
             commission=commission,
-            slippage=slippage
+            slippage=slippage,
+            stopping_rules=stopping_rules
         )
         
         result = backtester.run()
@@ -99,7 +102,7 @@ class BacktestRunner:
     @staticmethod
     def _calculate_drawdown_series(equity_curve: List[float]) -> List[float]:
         """낙폭 시리즈 계산"""
-        if not equity_curve:
+        if len(equity_curve) == 0:
             return []
         
         equity_series = pd.Series(equity_curve)
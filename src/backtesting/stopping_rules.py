@@ -0,0 +1,166 @@
+"""
+백테스트 조기 종료 규칙
+
+스캐너/파라미터 탐색 백테스트는 이미 필터 기준을 확정적으로 통과할 수 없게 된 뒤에도
+마지막 봉까지 돌아갑니다. Backtester에 규칙을 넘기면 봉마다 진행 상황(BacktestProgress)을
+검사하여, 남은 봉을 어떻게 써도 결과가 바뀌지 않는 시점에 멈춥니다.
+
+규칙은 "확정 실패"만 판단합니다 (남은 봉에서 최선의 경우를 가정해도 기준 미달).
+- MaxDrawdownRule: 진행 중 최대 낙폭은 줄어들지 않으므로 한도 초과 시 확정 실패
+- MaxConsecutiveLossesRule: 이미 발생한 최대 연속 손실도 줄어들지 않음
+- MinTradesRule: 남은 봉으로 만들 수 있는 최대 거래 수를 더해도 최소 거래 수 미달
+- MinWinRateRule: 남은 거래를 모두 이긴다고 가정해도 최소 승률 미달
+
+사용 예시:
+    rules = stopping_rules_from_criteria(multi_backtest._get_filter_criteria(None))
+    result = Backtester(strategy, data, ticker, 10_000_000, stopping_rules=rules).run()
+    if result.terminated:
+        print(result.termination_reason, result.bars_processed, result.total_bars)
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from .performance import StreamingMetrics
+
+
+@dataclass
+class BacktestProgress:
+    """
+    백테스트 진행 상황 (봉마다 같은 객체를 갱신)
+
+    Attributes:
+        bars_processed: 처리한 봉 수
+        total_bars: 전체 봉 수
+        metrics: 봉 단위 온라인 지표
+        bars_per_trade: 거래 1건(진입+청산)에 필요한 최소 봉 수 (체결 방식에 따라 결정)
+        closed_trades: 청산된 거래 수
+        winning_trades: 이익 거래 수
+        max_consecutive_losses: 지금까지의 최대 연속 손실
+        has_position: 현재 포지션 보유 여부
+    """
+    bars_processed: int
+    total_bars: int
+    metrics: StreamingMetrics
+    bars_per_trade: int = 2
+    closed_trades: int = 0
+    winning_trades: int = 0
+    max_consecutive_losses: int = 0
+    has_position: bool = False
+    _current_loss_streak: int = 0
+
+    @property
+    def remaining_bars(self) -> int:
+        return self.total_bars - self.bars_processed
+
+    @property
+    def max_possible_trades(self) -> int:
+        """남은 봉을 모두 거래에 쓴다고 가정한 최종 거래 수 상한"""
+        open_trade = 1 if self.has_position else 0
+        return self.closed_trades + open_trade + self.remaining_bars // self.bars_per_trade
+
+    def record_trades(self, trades: Sequence[Any]) -> None:
+        """새로 청산된 거래 반영 (closed_trades 이후 항목만 순회)"""
+        for trade in trades[self.closed_trades:]:
+            if trade.pnl > 0:
+                self.winning_trades += 1
+            if trade.pnl < 0:
+                self._current_loss_streak += 1
+                self.max_consecutive_losses = max(self.max_consecutive_losses, self._current_loss_streak)
+            else:
+                self._current_loss_streak = 0
+        self.closed_trades = len(trades)
+
+
+class StoppingRule(ABC):
+    """조기 종료 규칙 인터페이스"""
+
+    @abstractmethod
+    def check(self, progress: BacktestProgress) -> Optional[str]:
+        """
+        확정 실패 여부 검사
+
+        Returns:
+            종료 사유 (계속 진행이면 None)
+        """
+        pass
+
+
+class MaxDrawdownRule(StoppingRule):
+    """최대 낙폭 한도 초과 (%, 양수로 지정)"""
+
+    def __init__(self, max_drawdown: float):
+        self.max_drawdown = max_drawdown
+
+    def check(self, progress: BacktestProgress) -> Optional[str]:
+        drawdown = abs(progress.metrics.max_drawdown)
+        if drawdown > self.max_drawdown:
+            return f"최대 낙폭 {drawdown:.1f}% > {self.max_drawdown:.1f}%"
+        return None
+
+
+class MaxConsecutiveLossesRule(StoppingRule):
+    """최대 연속 손실 한도 초과"""
+
+    def __init__(self, max_consecutive_losses: int):
+        self.max_consecutive_losses = max_consecutive_losses
+
+    def check(self, progress: BacktestProgress) -> Optional[str]:
+        if progress.max_consecutive_losses > self.max_consecutive_losses:
+            return f"연속 손실 {progress.max_consecutive_losses}회 > {self.max_consecutive_losses}회"
+        return None
+
+
+class MinTradesRule(StoppingRule):
+    """남은 봉으로 최소 거래 수 도달 불가"""
+
+    def __init__(self, min_trades: int):
+        self.min_trades = min_trades
+
+    def check(self, progress: BacktestProgress) -> Optional[str]:
+        possible = progress.max_possible_trades
+        if possible < self.min_trades:
+            return f"최대 가능 거래 {possible}회 < 최소 {self.min_trades}회"
+        return None
+
+
+class MinWinRateRule(StoppingRule):
+    """남은 거래를 모두 이겨도 최소 승률(%) 도달 불가"""
+
+    def __init__(self, min_win_rate: float):
+        self.min_win_rate = min_win_rate
+
+    def check(self, progress: BacktestProgress) -> Optional[str]:
+        if progress.closed_trades == 0:
+            return None
+        # (승 + k) / (전체 + k)는 k에 대해 증가하므로 k = 최대 추가 거래에서 최대
+        extra = progress.max_possible_trades - progress.closed_trades
+        best = (progress.winning_trades + extra) / (progress.closed_trades + extra) * 100
+        if best < self.min_win_rate:
+            return f"최대 가능 승률 {best:.1f}% < {self.min_win_rate:.1f}%"
+        return None
+
+
+def stopping_rules_from_criteria(criteria: Dict[str, Any]) -> List[StoppingRule]:
+    """
+    필터 기준 딕셔너리(MultiCoinBacktest._get_filter_criteria 형식) → 조기 종료 규칙
+
+    모든 필터를 통과해야 하는 게이트(MultiCoinBacktest, Trading Pass)에만 사용합니다.
+    Research Pass처럼 일부 필터 실패를 허용하는 평가에는 쓰면 안 됩니다.
+
+    Args:
+        criteria: max_drawdown, max_consecutive_losses, min_trades, min_win_rate 키 (없는 키는 규칙 생략)
+
+    Returns:
+        규칙 목록
+    """
+    rules: List[StoppingRule] = []
+    if criteria.get('max_drawdown') is not None:
+        rules.append(MaxDrawdownRule(criteria['max_drawdown']))
+    if criteria.get('max_consecutive_losses') is not None:
+        rules.append(MaxConsecutiveLossesRule(criteria['max_consecutive_losses']))
+    if criteria.get('min_trades'):
+        rules.append(MinTradesRule(criteria['min_trades']))
+    if criteria.get('min_win_rate'):
+        rules.append(MinWinRateRule(criteria['min_win_rate']))
+    return rules
@@ -57,7 +57,11 @@ class TradingConfig:
     MIN_FEE = get_env_int("TRADING_MIN_FEE", 5000, min_value=0)
     BUY_PERCENTAGE = get_env_float("TRADING_BUY_PERCENTAGE", 0.3, min_value=0.0, max_value=1.0)  # 30%
     SELL_PERCENTAGE = get_env_float("TRADING_SELL_PERCENTAGE", 1.0, min_value=0.0, max_value=1.0)  # 100%
-    
+    # 시장 구조 (베타/상관계수) 롤링 윈도우 (일)
+    CORRELATION_WINDOW_DAYS = get_env_int("TRADING_CORRELATION_WINDOW_DAYS", 30, min_value=10, max_value=200)
+    # 보유 포지션과 상관계수가 이 값을 넘는 코인은 추가 진입하지 않음 (1.0이면 비활성화)
+    MAX_POSITION_CORRELATION = get_env_float("TRADING_MAX_POSITION_CORRELATION", 0.85, min_value=0.0, max_value=1.0)
+
     @classmethod
     def validate(cls):
         """거래 설정 검증"""
@@ -104,9 +108,25 @@ class AIConfig:
     MODEL = get_env_str("AI_MODEL", "gpt-5.2")
     TEMPERATURE = get_env_float("AI_TEMPERATURE", 0.7, min_value=0.0, max_value=2.0)
     MAX_TOKENS = get_env_int("AI_MAX_TOKENS", 1000, min_value=100, max_value=4096)
-    TIMEOUT_SECONDS = get_env_int("AI_TIMEOUT_SECONDS", 30)
+    TIMEOUT_SECONDS = get_env_int("AI_TIMEOUT_SECONDS", 30)  # 응답 읽기 타임아웃
+    CONNECT_TIMEOUT_SECONDS = get_env_float("AI_CONNECT_TIMEOUT_SECONDS", 5.0, min_value=0.1)
     MAX_RETRIES = get_env_int("AI_MAX_RETRIES", 3)
 
+    # Async client (connection pool / concurrency / retry backoff)
+    BASE_URL = get_env_str("OPENAI_BASE_URL", "")  # 비어 있으면 OpenAI 기본 엔드포인트
+    MAX_CONNECTIONS = get_env_int("AI_MAX_CONNECTIONS", 10, min_value=1)
+    MAX_CONCURRENCY = get_env_int("AI_MAX_CONCURRENCY", 3, min_value=1)  # 동시 분석 상한
+    RETRY_BASE_DELAY = get_env_float("AI_RETRY_BASE_DELAY", 1.0, min_value=0.0)
+    RETRY_MAX_DELAY = get_env_float("AI_RETRY_MAX_DELAY", 20.0, min_value=0.0)
+
+    # Decision cache (동일 캔들/프롬프트 중복 LLM 호출 방지)
+    DECISION_CACHE_ENABLED = os.getenv("AI_DECISION_CACHE_ENABLED", "true").lower() == "true"
+    DECISION_CACHE_MAX_ENTRIES = get_env_int("AI_DECISION_CACHE_MAX_ENTRIES", 256, min_value=1)
+    DECISION_CACHE_CANDLE_MINUTES = get_env_int("AI_DECISION_CACHE_CANDLE_MINUTES", 60, min_value=1)
+
+    # Prompt token budget (0 = 측정만, 제한 없음)
+    PROMPT_TOKEN_BUDGET = get_env_int("AI_PROMPT_TOKEN_BUDGET", 0, min_value=0)
+
     # Rate limiting
     RATE_LIMIT_PER_MINUTE = get_env_int("AI_RATE_LIMIT_PER_MINUTE", 20)
 
@@ -229,6 +249,15 @@ class SlippageConfig:
     # 분할 주문 임계값 (이 금액 이상이면 분할 주문 권장)
     SPLIT_ORDER_THRESHOLD_KRW = get_env_int("SLIPPAGE_SPLIT_THRESHOLD", 5000000, min_value=1000000)  # 500만원
 
+    # 오더북 기록 (백테스트 재생용) - 감시 티커의 호가창을 주기적으로 저장
+    ORDERBOOK_RECORDER_ENABLED = os.getenv("SLIPPAGE_ORDERBOOK_RECORDER_ENABLED", "false").lower() == "true"
+    ORDERBOOK_RECORDER_TICKERS = get_env_str("SLIPPAGE_ORDERBOOK_RECORDER_TICKERS", "KRW-BTC,KRW-ETH")
+    ORDERBOOK_RECORDER_INTERVAL_SECONDS = get_env_int("SLIPPAGE_ORDERBOOK_RECORDER_INTERVAL", 60, min_value=5, max_value=3600)
+    ORDERBOOK_RECORDER_LEVELS = get_env_int("SLIPPAGE_ORDERBOOK_RECORDER_LEVELS", 15, min_value=1, max_value=30)
+    ORDERBOOK_RECORDER_DIR = get_env_str("SLIPPAGE_ORDERBOOK_RECORDER_DIR", "data/orderbooks")
+    # 재생 시 바 시각과 이보다 멀리 떨어진 스냅샷은 사용하지 않음 (초)
+    ORDERBOOK_REPLAY_MAX_STALENESS = get_env_float("SLIPPAGE_ORDERBOOK_REPLAY_MAX_STALENESS", 300.0, min_value=1.0)
+
     @classmethod
     def validate(cls):
         """슬리피지 설정 검증"""
@@ -334,6 +363,52 @@ class SchedulerConfig:
             )
 
 
+class PersistenceConfig:
+    """
+    영속성(PostgreSQL) 쓰기 설정
+
+    write-behind 모드에서는 AI 판단/포트폴리오 스냅샷(설정 시 거래 포함)을 큐에 쌓아
+    배치 INSERT로 기록합니다. 주문과 거래는 기본적으로 즉시(durable) 기록됩니다.
+    """
+    WRITE_BEHIND_ENABLED = os.getenv("PERSISTENCE_WRITE_BEHIND_ENABLED", "true").lower() == "true"
+    WRITE_BEHIND_BATCH_SIZE = get_env_int("PERSISTENCE_WRITE_BEHIND_BATCH_SIZE", 100, min_value=1, max_value=5000)
+    WRITE_BEHIND_FLUSH_INTERVAL = get_env_float("PERSISTENCE_WRITE_BEHIND_FLUSH_INTERVAL", 0.5, min_value=0.01)  # 초
+    WRITE_BEHIND_MAX_QUEUE = get_env_int("PERSISTENCE_WRITE_BEHIND_MAX_QUEUE", 10000, min_value=1)
+    DURABLE_ORDERS = os.getenv("PERSISTENCE_DURABLE_ORDERS", "true").lower() == "true"
+    DURABLE_TRADES = os.getenv("PERSISTENCE_DURABLE_TRADES", "true").lower() == "true"
+
+    # 포지션 조회(ManagePositionUseCase, 스케줄러/파이프라인 PortfolioManager)를
+    # positions 테이블 인덱스에서 처리 (거래소 잔고 조회 생략, PostgreSQL 설정 시에만 적용)
+    LOCAL_POSITION_READS = os.getenv("PERSISTENCE_LOCAL_POSITION_READS", "true").lower() == "true"
+    # 거래소 잔고와 positions 테이블 대조 주기 (분, 0이면 비활성화)
+    POSITION_RECONCILE_MINUTES = get_env_int("PERSISTENCE_POSITION_RECONCILE_MINUTES", 30, min_value=0, max_value=1440)
+
+
+class CoordinationConfig:
+    """
+    프로세스 간 거래 사이클 조율 설정 (스케줄러 ↔ 텔레그램 봇)
+
+    같은 호스트의 프로세스는 DIR 아래 SQLite lease 락 + idempotency 키로 조율합니다.
+    PostgreSQL이 설정되어 있으면 advisory lock/idempotency 테이블을 함께 사용하고,
+    DB 장애 시 로컬 조율로 대체합니다.
+    """
+    DIR = os.getenv("COORDINATION_DIR", "data/coordination")
+    POLL_INTERVAL = get_env_float("COORDINATION_POLL_INTERVAL", 2.0, min_value=0.05)  # 초
+    # 진행 중인 사이클 결과 대기 한도 (스케줄러 사이클 타임아웃 600초보다 길게)
+    ATTACH_TIMEOUT = get_env_float("COORDINATION_ATTACH_TIMEOUT", 660.0, min_value=1.0)  # 초
+    # 락은 잡혀 있지만 진행 중인 사이클이 없을 때(포지션 관리 등) 대기 한도
+    LOCK_WAIT = get_env_float("COORDINATION_LOCK_WAIT", 60.0, min_value=0.0)  # 초
+    # 갱신이 이보다 오래 없는 running 기록은 중단된 것으로 간주
+    STALE_RUN_SECONDS = get_env_float("COORDINATION_STALE_RUN_SECONDS", 900.0, min_value=10.0)  # 초
+    # 완료된 사이클 결과를 재사용하는 한도 (이후의 수동 /run은 새로 실행)
+    REUSE_WINDOW = get_env_float("COORDINATION_REUSE_WINDOW", 120.0, min_value=0.0)  # 초
+    # 락 lease: 보유자가 하트비트로 갱신, 프로세스가 죽으면 LEASE_TTL 후 자동 해제
+    LEASE_TTL = get_env_float("COORDINATION_LEASE_TTL", 30.0, min_value=1.0)  # 초
+    HEARTBEAT_INTERVAL = get_env_float("COORDINATION_HEARTBEAT_INTERVAL", 10.0, min_value=0.1)  # 초
+    # 포지션 관리 작업이 거래 사이클 뒤에서 대기하는 한도 (15분 주기 내)
+    POSITION_LOCK_WAIT = get_env_float("COORDINATION_POSITION_LOCK_WAIT", 240.0, min_value=0.0)  # 초
+
+
 class ScannerConfig:
     """
     멀티코인 스캐닝 설정
@@ -364,6 +439,41 @@ class ScannerConfig:
     ONE_PER_SECTOR = os.getenv("SCANNER_ONE_PER_SECTOR", "true").lower() == "true"
     EXCLUDE_UNKNOWN_SECTOR = os.getenv("SCANNER_EXCLUDE_UNKNOWN_SECTOR", "true").lower() == "true"
 
+    # 2단 스캔: 1단계 전체 마켓 사전 필터 → 2단계 상위 생존 코인만 백테스팅
+    PREFILTER_ENABLED = os.getenv("SCANNER_PREFILTER_ENABLED", "true").lower() == "true"
+    # 1단계 최소 거래대금 (원) - 2단계보다 넓게 잡아 전체 마켓을 훑음
+    PREFILTER_MIN_VOLUME_KRW = get_env_int("SCANNER_PREFILTER_MIN_VOLUME_KRW", 1_000_000_000, min_value=0)  # 10억원
+    # 1단계 생존 코인 수 (섹터 분산 전, 2단계는 이 중 LIQUIDITY_TOP_N개)
+    PREFILTER_TOP_N = get_env_int("SCANNER_PREFILTER_TOP_N", 20, min_value=5, max_value=100)
+    # 일봉 이력 (캐시 보관 일수 / 최소 필요 일수)
+    PREFILTER_LOOKBACK_DAYS = get_env_int("SCANNER_PREFILTER_LOOKBACK_DAYS", 60, min_value=30, max_value=200)
+    PREFILTER_MIN_HISTORY_DAYS = get_env_int("SCANNER_PREFILTER_MIN_HISTORY_DAYS", 30, min_value=22, max_value=200)
+    # 일간 변동성 허용 범위 (%)
+    PREFILTER_MIN_VOLATILITY = get_env_float("SCANNER_PREFILTER_MIN_VOLATILITY", 1.0, min_value=0.0)
+    PREFILTER_MAX_VOLATILITY = get_env_float("SCANNER_PREFILTER_MAX_VOLATILITY", 15.0, min_value=1.0)
+    # 캐시에 없는 일봉 수집 시간 예산 (초) - 초과분은 다음 사이클로 연기
+    PREFILTER_FETCH_BUDGET = get_env_float("SCANNER_PREFILTER_FETCH_BUDGET", 60.0, min_value=5.0)
+    # 전체 스캔 시간 예산 (초) - 1시간 사이클 안에 끝나야 함
+    SCAN_BUDGET_SECONDS = get_env_float("SCANNER_SCAN_BUDGET_SECONDS", 600.0, min_value=60.0, max_value=3000.0)
+
+    # 증분 재채점: 새 일봉이 없고 유동성 순위 변화가 허용치 이내면 이전 백테스트/Trading Pass 결과 재사용
+    INCREMENTAL_RESCORING = os.getenv("SCANNER_INCREMENTAL_RESCORING", "true").lower() == "true"
+    RESCORE_RANK_TOLERANCE = get_env_int("SCANNER_RESCORE_RANK_TOLERANCE", 2, min_value=0, max_value=50)
+    # 캐시된 채점 결과 최대 보관 시간 (시간) - 초과 시 강제 재계산
+    RESCORE_MAX_AGE_HOURS = get_env_float("SCANNER_RESCORE_MAX_AGE_HOURS", 24.0, min_value=1.0)
+
+    # 몬테카를로 게이트: Trading Pass 통과 코인의 거래 순서를 재표본하여 파산 확률이 한도 이하인지 검증
+    MONTE_CARLO_GATE = os.getenv("SCANNER_MONTE_CARLO_GATE", "true").lower() == "true"
+    MONTE_CARLO_PATHS = get_env_int("SCANNER_MONTE_CARLO_PATHS", 10_000, min_value=100, max_value=100_000)
+    # 재표본 방식 (monte_carlo.METHODS가 이 값을 그대로 사용)
+    MONTE_CARLO_METHODS = ('bootstrap', 'shuffle', 'block')
+    MONTE_CARLO_METHOD = os.getenv("SCANNER_MONTE_CARLO_METHOD", "bootstrap")  # MONTE_CARLO_METHODS 중 하나
+    # 파산 기준: 초기 자본 대비 손실 (%)
+    MONTE_CARLO_RUIN_THRESHOLD = get_env_float("SCANNER_MONTE_CARLO_RUIN_THRESHOLD", 50.0, min_value=1.0, max_value=100.0)
+    MONTE_CARLO_MAX_RUIN_PROBABILITY = get_env_float(
+        "SCANNER_MONTE_CARLO_MAX_RUIN_PROBABILITY", 0.05, min_value=0.0, max_value=1.0
+    )
+
     @classmethod
     def validate(cls):
         """스캐너 설정 검증"""
@@ -377,6 +487,11 @@ class ScannerConfig:
                 "BACKTEST_TOP_N",
                 f"백테스팅 통과 개수({cls.BACKTEST_TOP_N})는 최종 선택 개수({cls.FINAL_SELECT_N})보다 커야 합니다"
             )
+        if cls.MONTE_CARLO_METHOD not in cls.MONTE_CARLO_METHODS:
+            raise ConfigurationError(
+                "MONTE_CARLO_METHOD",
+                f"재표본 방식({cls.MONTE_CARLO_METHOD})은 {', '.join(cls.MONTE_CARLO_METHODS)} 중 하나여야 합니다"
+            )
 
 
 # 설정 초기화 시 검증
@@ -25,6 +25,7 @@ from src.application.ports.outbound.lock_port import LockPort
 from src.application.ports.outbound.prompt_port import PromptPort
 from src.application.ports.outbound.validation_port import ValidationPort
 from src.application.ports.outbound.decision_record_port import DecisionRecordPort
+from src.application.ports.outbound.decision_cache_port import DecisionCachePort
 from src.application.use_cases.execute_trade import ExecuteTradeUseCase
 from src.application.use_cases.analyze_market import AnalyzeMarketUseCase
 from src.application.use_cases.manage_position import ManagePositionUseCase
@@ -50,7 +51,9 @@ class Container:
         prompt_port: Optional[PromptPort] = None,
         validation_port: Optional[ValidationPort] = None,
         decision_record_port: Optional[DecisionRecordPort] = None,
+        decision_cache_port: Optional[DecisionCachePort] = None,
         session_factory=None,
+        coordination_dir: Optional[str] = None,
     ):
         """
         Initialize container with optional port overrides.
@@ -65,7 +68,10 @@ class Container:
             prompt_port: Prompt port implementation (uses default if None)
             validation_port: Validation port implementation (uses default if None)
             decision_record_port: Decision record port implementation (uses default if None)
+            decision_cache_port: AI decision cache implementation (uses default if None)
             session_factory: SQLAlchemy async session factory for PostgreSQL adapters
+            coordination_dir: Directory for same-host coordination files
+                (file locks, SQLite idempotency keys, cycle board)
         """
         self._exchange_port = exchange_port
         self._ai_port = ai_port
@@ -76,7 +82,10 @@ class Container:
         self._prompt_port = prompt_port
         self._validation_port = validation_port
         self._decision_record_port = decision_record_port
+        self._decision_cache_port = decision_cache_port
         self._session_factory = session_factory
+        self._coordination_dir = coordination_dir
+        self._cycle_board = None
 
         # Cached use cases
         self._execute_trade_use_case: Optional[ExecuteTradeUseCase] = None
@@ -117,6 +126,7 @@ class Container:
         data_collector=None,
         session_factory=None,
         ai_service=None,  # DEPRECATED: 무시됨, Container.get_ai_port()가 OpenAIAdapter 반환
+        coordination_dir: Optional[str] = None,
     ) -> "Container":
         """
         Create container by wrapping legacy services.
@@ -132,6 +142,11 @@ class Container:
             data_collector: Existing DataCollector instance
             session_factory: SQLAlchemy async session factory (for PostgreSQL adapters)
             ai_service: DEPRECATED - 무시됨, 호환성을 위해 유지
+            coordination_dir: Same-host coordination directory. When set, lock and
+                idempotency go through a local SQLite lease lock / key store (wrapping
+                the PostgreSQL adapters if session_factory is also given), so
+                scheduler and Telegram bot processes exclude each other even
+                without a database.
 
         Returns:
             Container with legacy bridge adapters
@@ -170,7 +185,32 @@ class Container:
             idempotency_port = PostgresIdempotencyAdapter(session_factory)
             lock_port = PostgresAdvisoryLockAdapter(session_factory)
             decision_record_port = DecisionRecordAdapter(session_factory)
-        else:
+
+        if coordination_dir:
+            # Same-host coordination (wraps PostgreSQL adapters when present)
+            from pathlib import Path
+            from src.config.settings import CoordinationConfig
+            from src.infrastructure.adapters.persistence.local_coordination_adapter import (
+                COORDINATION_DB_NAME,
+                SQLiteIdempotencyAdapter,
+            )
+            from src.infrastructure.adapters.persistence.lease_lock_adapter import SQLiteLeaseLockAdapter
+            from src.infrastructure.adapters.persistence.fallback_coordination_adapter import (
+                FallbackIdempotencyAdapter,
+                FallbackLockAdapter,
+            )
+            lease_lock = SQLiteLeaseLockAdapter(
+                Path(coordination_dir) / COORDINATION_DB_NAME,
+                lease_ttl=CoordinationConfig.LEASE_TTL,
+                heartbeat_interval=CoordinationConfig.HEARTBEAT_INTERVAL,
+                max_wait_seconds=CoordinationConfig.LOCK_WAIT,
+            )
+            lock_port = FallbackLockAdapter(lock_port, lease_lock)
+            idempotency_port = FallbackIdempotencyAdapter(
+                idempotency_port,
+                SQLiteIdempotencyAdapter(Path(coordination_dir) / COORDINATION_DB_NAME),
+            )
+        elif not session_factory:
             # Fallback to in-memory adapters
             idempotency_port = InMemoryIdempotencyAdapter()
             lock_port = InMemoryLockAdapter()
@@ -185,6 +225,7 @@ class Container:
             lock_port=lock_port,
             decision_record_port=decision_record_port,
             session_factory=session_factory,  # Pass session_factory for PostgresPersistenceAdapter
+            coordination_dir=coordination_dir,
         )
 
     # --- Port Getters ---
@@ -200,7 +241,7 @@ class Container:
         """Get AI port implementation."""
         if self._ai_port is None:
             from src.infrastructure.adapters.ai.openai_adapter import OpenAIAdapter
-            self._ai_port = OpenAIAdapter()
+            self._ai_port = OpenAIAdapter(decision_cache=self.get_decision_cache_port())
         return self._ai_port
 
     def get_market_data_port(self) -> MarketDataPort:
@@ -215,7 +256,16 @@ class Container:
         if self._persistence_port is None:
             if self._session_factory is not None:
                 from src.infrastructure.adapters.persistence.postgres_persistence_adapter import PostgresPersistenceAdapter
-                self._persistence_port = PostgresPersistenceAdapter(session_factory=self._session_factory)
+                from src.config.settings import PersistenceConfig
+                self._persistence_port = PostgresPersistenceAdapter(
+                    session_factory=self._session_factory,
+                    write_behind=PersistenceConfig.WRITE_BEHIND_ENABLED,
+                    durable_orders=PersistenceConfig.DURABLE_ORDERS,
+                    durable_trades=PersistenceConfig.DURABLE_TRADES,
+                    max_batch_size=PersistenceConfig.WRITE_BEHIND_BATCH_SIZE,
+                    flush_interval=PersistenceConfig.WRITE_BEHIND_FLUSH_INTERVAL,
+                    max_queue_size=PersistenceConfig.WRITE_BEHIND_MAX_QUEUE,
+                )
             else:
                 from src.infrastructure.adapters.persistence.memory_adapter import InMemoryPersistenceAdapter
                 self._persistence_port = InMemoryPersistenceAdapter()
@@ -235,11 +285,53 @@ class Container:
             self._lock_port = InMemoryLockAdapter()
         return self._lock_port
 
+    def get_cycle_coordinator(self, owner: str) -> "CycleCoordinator":
+        """
+        Get a CycleCoordinator sharing this container's lock port.
+
+        The cycle board lives in coordination_dir (CoordinationConfig.DIR
+        if the container was created without one).
+
+        Args:
+            owner: Requesting process name (e.g. "scheduler", "telegram")
+
+        Returns:
+            CycleCoordinator instance
+        """
+        from pathlib import Path
+        from src.application.services.cycle_coordinator import CycleCoordinator
+        from src.config.settings import CoordinationConfig
+
+        if self._cycle_board is None:
+            from src.infrastructure.adapters.persistence.local_coordination_adapter import (
+                COORDINATION_DB_NAME,
+                CycleRunBoard,
+            )
+            coordination_dir = self._coordination_dir or CoordinationConfig.DIR
+            self._cycle_board = CycleRunBoard(
+                Path(coordination_dir) / COORDINATION_DB_NAME,
+                stale_after_seconds=CoordinationConfig.STALE_RUN_SECONDS,
+            )
+
+        return CycleCoordinator(
+            lock_port=self.get_lock_port(),
+            board=self._cycle_board,
+            owner=owner,
+            poll_interval=CoordinationConfig.POLL_INTERVAL,
+            attach_timeout=CoordinationConfig.ATTACH_TIMEOUT,
+            lock_wait=CoordinationConfig.LOCK_WAIT,
+            reuse_window=CoordinationConfig.REUSE_WINDOW,
+        )
+
     def get_prompt_port(self) -> PromptPort:
         """Get prompt port implementation."""
         if self._prompt_port is None:
-            from src.infrastructure.adapters.prompt import YAMLPromptAdapter
-            self._prompt_port = YAMLPromptAdapter()
+            from src.config.settings import AIConfig
+            from src.infrastructure.adapters.prompt import TokenBudgetPromptAdapter, YAMLPromptAdapter
+            self._prompt_port = TokenBudgetPromptAdapter(
+                inner=YAMLPromptAdapter(),
+                budget=AIConfig.PROMPT_TOKEN_BUDGET or None,
+            )
         return self._prompt_port
 
     def get_validation_port(self) -> ValidationPort:
@@ -258,6 +350,29 @@ class Container:
         """
         return self._decision_record_port
 
+    def get_decision_cache_port(self) -> Optional[DecisionCachePort]:
+        """
+        Get AI decision cache implementation.
+
+        In-memory LRU, backed by PostgreSQL when session_factory is configured.
+        Returns None if disabled (AIConfig.DECISION_CACHE_ENABLED=False).
+        """
+        if self._decision_cache_port is None:
+            from src.config.settings import AIConfig
+            if not AIConfig.DECISION_CACHE_ENABLED:
+                return None
+
+            from src.infrastructure.adapters.persistence.memory_decision_cache_adapter import InMemoryDecisionCacheAdapter
+            backing_store = None
+            if self._session_factory is not None:
+                from src.infrastructure.adapters.persistence.postgres_decision_cache_adapter import PostgresDecisionCacheAdapter
+                backing_store = PostgresDecisionCacheAdapter(session_factory=self._session_factory)
+            self._decision_cache_port = InMemoryDecisionCacheAdapter(
+                max_entries=AIConfig.DECISION_CACHE_MAX_ENTRIES,
+                backing_store=backing_store,
+            )
+        return self._decision_cache_port
+
     # --- Use Case Getters ---
 
     def get_execute_trade_use_case(self) -> ExecuteTradeUseCase:
@@ -266,6 +381,8 @@ class Container:
             self._execute_trade_use_case = ExecuteTradeUseCase(
                 exchange=self.get_exchange_port(),
                 persistence=self.get_persistence_port(),
+                position_manager=self.get_manage_position_use_case(),
+                lock_port=self.get_lock_port(),
             )
         return self._execute_trade_use_case
 
@@ -284,9 +401,20 @@ class Container:
             self._manage_position_use_case = ManagePositionUseCase(
                 exchange=self.get_exchange_port(),
                 persistence=self.get_persistence_port(),
+                use_local_positions=self.uses_local_positions(),
             )
         return self._manage_position_use_case
 
+    def uses_local_positions(self) -> bool:
+        """
+        Whether position reads should come from the persisted positions index.
+
+        Only enabled with a durable store (PostgreSQL); the in-memory adapter
+        starts empty and would report no holdings.
+        """
+        from src.config.settings import PersistenceConfig
+        return self._session_factory is not None and PersistenceConfig.LOCAL_POSITION_READS
+
     def get_analyze_breakout_use_case(self) -> Optional[AnalyzeBreakoutUseCase]:
         """
         Get AnalyzeBreakoutUseCase with wired dependencies.
@@ -342,15 +470,32 @@ class Container:
 
     # --- Application Services ---
 
-    def get_trading_orchestrator(self) -> "TradingOrchestrator":
+    def get_trading_orchestrator(self, runtime=None) -> "TradingOrchestrator":
         """
         Get TradingOrchestrator with this container.
 
         TradingOrchestrator는 Application Layer의 서비스로,
         거래 사이클의 비즈니스 로직을 조율합니다.
 
+        Args:
+            runtime: Optional long-lived TradingRuntime that caches pipelines
+                     and executors across cycles (scheduler process)
+
         Returns:
             TradingOrchestrator instance
         """
         from src.application.services.trading_orchestrator import TradingOrchestrator
-        return TradingOrchestrator(container=self)
+        return TradingOrchestrator(container=self, runtime=runtime)
+
+    # --- Lifecycle ---
+
+    async def close(self) -> None:
+        """
+        Release resources held by ports created so far.
+
+        Flushes and stops the persistence write-behind queue. Ports that
+        were never requested are not created just to be closed.
+        """
+        aclose = getattr(self._persistence_port, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -18,6 +18,10 @@ from src.domain.services.market_analysis import (
     calculate_correlation,
     assess_market_risk,
 )
+from src.domain.services.market_structure import (
+    RollingCrossMoments,
+    StructureSnapshot,
+)
 
 __all__ = [
     "FeeCalculator",
@@ -34,4 +38,6 @@ __all__ = [
     "calculate_alpha",
     "calculate_correlation",
     "assess_market_risk",
+    "RollingCrossMoments",
+    "StructureSnapshot",
 ]
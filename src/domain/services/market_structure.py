@@ -0,0 +1,196 @@
+"""
+시장 구조 도메인 서비스.
+
+여러 코인의 일간 수익률 패널에서 롤링 윈도우 공분산 구조
+(베타/알파/상관계수 행렬)를 한 번의 벡터 연산으로 계산하고,
+새 캔들이 들어오면 윈도우 합계만 갱신하여 증분 업데이트합니다.
+
+market_analysis.py의 쌍별 함수와 같은 정의를 사용합니다:
+- 베타: Cov(자산, 시장) / Var(시장)
+- 알파: 최근 1일 자산 수익률 - 베타 * 시장 수익률 (%)
+- 상관계수: 피어슨 상관계수
+
+결측(상장 전 등)은 쌍별 완전 관측(pairwise complete)으로 처리합니다.
+"""
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+import numpy as np
+
+
+@dataclass
+class StructureSnapshot:
+    """
+    롤링 윈도우 시장 구조 스냅샷
+
+    Attributes:
+        correlation: (N, N) 상관계수 행렬
+        beta: (N,) 시장 대비 베타
+        alpha: (N,) 최근 1일 알파 (%)
+        observations: (N, N) 쌍별 유효 관측 수
+        last_returns: (N,) 최근 1일 수익률 (NaN 가능)
+    """
+    correlation: np.ndarray
+    beta: np.ndarray
+    alpha: np.ndarray
+    observations: np.ndarray
+    last_returns: np.ndarray
+
+
+class RollingCrossMoments:
+    """
+    롤링 윈도우 교차 모멘트 (쌍별 완전 관측)
+
+    윈도우 안의 행(일자)에 대해 다음 합계를 (N, N) 행렬로 유지합니다.
+    z = 결측을 0으로 채운 수익률, v = 유효 마스크일 때
+    - count = Σ v vᵀ
+    - sum_x = Σ z vᵀ       (sum_x[i, j]: j가 유효한 날의 i 수익률 합)
+    - sum_xx = Σ z² vᵀ
+    - sum_xy = Σ z zᵀ
+
+    push()는 새 행을 더하고 윈도우 밖으로 나간 행을 빼므로 O(N²)입니다.
+    부동소수 오차 누적을 막기 위해 window번 갱신마다 버퍼에서 다시 계산합니다.
+    """
+
+    def __init__(self, size: int, window: int):
+        """
+        Args:
+            size: 코인 수 (N)
+            window: 롤링 윈도우 길이 (일)
+        """
+        self.size = size
+        self.window = window
+        self._rows: Deque[np.ndarray] = deque()
+        self._pushes_since_rebuild = 0
+        self._reset_sums()
+
+    @classmethod
+    def from_returns(cls, returns: np.ndarray, window: int) -> 'RollingCrossMoments':
+        """
+        수익률 패널의 최근 window개 행으로 생성 (행렬곱 1회)
+
+        Args:
+            returns: (일수, N) 수익률 패널 (결측은 NaN)
+            window: 롤링 윈도우 길이
+
+        Returns:
+            RollingCrossMoments
+        """
+        moments = cls(returns.shape[1], window)
+        for row in returns[-window:]:
+            moments._rows.append(np.asarray(row, dtype=float))
+        moments._rebuild()
+        return moments
+
+    def _reset_sums(self) -> None:
+        shape = (self.size, self.size)
+        self.count = np.zeros(shape)
+        self.sum_x = np.zeros(shape)
+        self.sum_xx = np.zeros(shape)
+        self.sum_xy = np.zeros(shape)
+
+    def _rebuild(self) -> None:
+        """버퍼 전체로 합계 재계산"""
+        self._reset_sums()
+        self._pushes_since_rebuild = 0
+        if not self._rows:
+            return
+        block = np.vstack(self._rows)
+        valid = (~np.isnan(block)).astype(float)
+        z = np.nan_to_num(block)
+        self.count = valid.T @ valid
+        self.sum_x = z.T @ valid
+        self.sum_xx = (z * z).T @ valid
+        self.sum_xy = z.T @ z
+
+    def _accumulate(self, row: np.ndarray, sign: float) -> None:
+        valid = (~np.isnan(row)).astype(float)
+        z = np.nan_to_num(row)
+        self.count += sign * np.outer(valid, valid)
+        self.sum_x += sign * np.outer(z, valid)
+        self.sum_xx += sign * np.outer(z * z, valid)
+        self.sum_xy += sign * np.outer(z, z)
+
+    def push(self, row: np.ndarray) -> None:
+        """
+        새 일자 수익률 추가 (윈도우 초과분 제거)
+
+        Args:
+            row: (N,) 수익률 (결측은 NaN)
+        """
+        row = np.asarray(row, dtype=float)
+        self._rows.append(row)
+        if len(self._rows) > self.window:
+            self._accumulate(self._rows.popleft(), -1.0)
+        self._accumulate(row, 1.0)
+
+        self._pushes_since_rebuild += 1
+        if self._pushes_since_rebuild >= self.window:
+            self._rebuild()
+
+    def replace_last(self, row: np.ndarray) -> None:
+        """
+        마지막 일자 수익률 교체 (진행 중인 일봉의 종가 변경)
+
+        Args:
+            row: (N,) 수익률 (결측은 NaN)
+        """
+        if not self._rows:
+            self.push(row)
+            return
+        row = np.asarray(row, dtype=float)
+        self._accumulate(self._rows.pop(), -1.0)
+        self._rows.append(row)
+        self._accumulate(row, 1.0)
+
+        self._pushes_since_rebuild += 1
+        if self._pushes_since_rebuild >= self.window:
+            self._rebuild()
+
+    @property
+    def last_row(self) -> Optional[np.ndarray]:
+        """윈도우의 마지막 행"""
+        return self._rows[-1] if self._rows else None
+
+    def snapshot(self, market_index: int = 0, min_observations: int = 2) -> StructureSnapshot:
+        """
+        현재 윈도우의 상관계수 행렬, 시장 베타, 알파 계산
+
+        Args:
+            market_index: 시장(BTC) 열 인덱스
+            min_observations: 최소 쌍별 관측 수 (미만이면 NaN)
+
+        Returns:
+            StructureSnapshot
+        """
+        n = self.count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 쌍별 (i, j) 관측일 기준 편차 제곱합/교차곱 (자유도 보정은 비율에서 상쇄)
+            cross = self.sum_xy - self.sum_x * self.sum_x.T / n
+            var_row = self.sum_xx - self.sum_x ** 2 / n           # [i, j]: i의 분산 (j와 겹치는 날)
+            var_col = var_row.T                                   # [i, j]: j의 분산 (i와 겹치는 날)
+
+            correlation = cross / np.sqrt(var_row * var_col)
+            correlation[n < min_observations] = np.nan
+            np.fill_diagonal(correlation, np.where(np.diag(n) >= min_observations, 1.0, np.nan))
+            correlation = np.clip(correlation, -1.0, 1.0)
+
+            market_var = var_col[:, market_index]
+            beta = np.where(
+                np.isclose(market_var, 0.0),
+                1.0,  # 시장 가격 변동이 없는 경우 (market_analysis와 동일)
+                cross[:, market_index] / market_var
+            )
+            beta[n[:, market_index] < min_observations] = np.nan
+
+        last = self.last_row if self.last_row is not None else np.full(self.size, np.nan)
+        alpha = (last - beta * last[market_index]) * 100
+
+        return StructureSnapshot(
+            correlation=correlation,
+            beta=beta,
+            alpha=alpha,
+            observations=n.copy(),
+            last_returns=last.copy(),
+        )
@@ -2,20 +2,80 @@
 OpenAIAdapter - OpenAI implementation of AIPort.
 
 This adapter wraps OpenAI API calls for AI-based trading analysis.
+
+All API calls go through an AsyncOpenAI client backed by a pooled
+httpx.AsyncClient, so the event loop (scheduler, notifications, lock
+heartbeats) keeps running during the LLM round trip.
+
+Call path:
+    semaphore (bounded concurrency)
+      → chat.completions.create (connect/read timeouts)
+      → jittered exponential backoff on 429/5xx/timeouts
+      → latency/token metrics per call
+
+Optional candle-scoped decision cache (DecisionCachePort) sits in front of
+the API call: the same rendered prompt, prompt version and candle return
+the cached TradingDecision, and concurrent identical requests share one call.
 """
+import asyncio
 import json
 import os
+import random
+import time
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional
-from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, timedelta
 
 from src.application.ports.outbound.ai_port import AIPort
+from src.application.ports.outbound.decision_cache_port import (
+    DecisionCachePort,
+    floor_to_candle,
+    make_decision_cache_key,
+    next_candle_close,
+)
 from src.application.dto.analysis import (
     AnalysisRequest,
     TradingDecision,
     DecisionType,
 )
 from src.config.settings import AIConfig
+from src.domain.value_objects.prompt_version import PromptType, PromptVersion
+from src.infrastructure.adapters.prompt.token_budget import PromptBudgeter, PromptTokenReport
+
+
+@dataclass
+class AICallStats:
+    """Aggregated per-adapter API call statistics."""
+
+    calls: int = 0
+    failures: int = 0
+    retries: int = 0
+    in_flight: int = 0
+    total_latency_seconds: float = 0.0
+    last_latency_seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def avg_latency_seconds(self) -> float:
+        """Average latency of completed calls."""
+        if self.calls == 0:
+            return 0.0
+        return self.total_latency_seconds / self.calls
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "avg_latency_seconds": self.avg_latency_seconds,
+            "last_latency_seconds": self.last_latency_seconds,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+        }
 
 
 class OpenAIAdapter(AIPort):
@@ -25,10 +85,34 @@ class OpenAIAdapter(AIPort):
     Uses OpenAI API for trading analysis and decision making.
     """
 
+    # HTTP status codes worth retrying (rate limit + transient server errors)
+    RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+    # Analysis prompt sections that may be compacted/dropped to fit the token
+    # budget (higher = lower value, trimmed first; 0 = compact only).
+    # Other sections are always kept.
+    PROMPT_SECTION_PRIORITIES = {
+        "시장 상관관계": 3,
+        "백테스팅 성과": 2,
+        "기술적 지표": 0,  # compact only, never dropped
+    }
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
+        base_url: Optional[str] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        retry_base_delay: Optional[float] = None,
+        retry_max_delay: Optional[float] = None,
+        decision_cache: Optional[DecisionCachePort] = None,
+        prompt_version: Optional[PromptVersion] = None,
+        candle_interval: Optional[timedelta] = None,
+        prompt_token_budget: Optional[int] = None,
     ):
         """
         Initialize OpenAI adapter.
@@ -36,22 +120,107 @@ class OpenAIAdapter(AIPort):
         Args:
             api_key: OpenAI API key (uses env OPENAI_API_KEY if not provided)
             model: Model to use (uses AIConfig.MODEL if not provided)
+            base_url: API base URL (uses AIConfig.BASE_URL, OpenAI default if empty)
+            connect_timeout: TCP connect timeout in seconds
+            read_timeout: Response read timeout in seconds
+            max_retries: Retries on 429/5xx/timeouts (0 disables retry)
+            max_concurrency: Maximum concurrent API calls per adapter
+            max_connections: HTTP connection pool size
+            retry_base_delay: Base delay for exponential backoff (seconds)
+            retry_max_delay: Upper bound for a single backoff delay (seconds)
+            decision_cache: Candle-scoped decision cache (disabled if None)
+            prompt_version: Prompt version used in cache keys
+            candle_interval: Candle interval for cache keys/TTL
+                (uses AIConfig.DECISION_CACHE_CANDLE_MINUTES if not provided)
+            prompt_token_budget: Token budget for the analysis prompt
+                (uses AIConfig.PROMPT_TOKEN_BUDGET if not provided, 0 = unlimited)
         """
         self._api_key = api_key or os.getenv("OPENAI_API_KEY", "")
         self._model = model or AIConfig.MODEL
+        self._base_url = base_url or AIConfig.BASE_URL or None
+        self._connect_timeout = connect_timeout if connect_timeout is not None else AIConfig.CONNECT_TIMEOUT_SECONDS
+        self._read_timeout = read_timeout if read_timeout is not None else float(AIConfig.TIMEOUT_SECONDS)
+        self._max_retries = max_retries if max_retries is not None else AIConfig.MAX_RETRIES
+        self._max_concurrency = max_concurrency or AIConfig.MAX_CONCURRENCY
+        self._max_connections = max_connections or AIConfig.MAX_CONNECTIONS
+        self._retry_base_delay = retry_base_delay if retry_base_delay is not None else AIConfig.RETRY_BASE_DELAY
+        self._retry_max_delay = retry_max_delay if retry_max_delay is not None else AIConfig.RETRY_MAX_DELAY
         self._client = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._stats = AICallStats()
+        self._decision_cache = decision_cache
+        self._prompt_version = prompt_version or PromptVersion.current(PromptType.GENERAL)
+        self._candle_interval = candle_interval or timedelta(minutes=AIConfig.DECISION_CACHE_CANDLE_MINUTES)
+        if prompt_token_budget is None:
+            prompt_token_budget = AIConfig.PROMPT_TOKEN_BUDGET
+        self._prompt_budgeter = PromptBudgeter(
+            budget=prompt_token_budget or None,
+            section_priorities=self.PROMPT_SECTION_PRIORITIES,
+            prompt_name="openai_analysis",
+        )
+        # Single-flight: cache key → in-flight analysis future
+        self._inflight: Dict[str, "asyncio.Future[TradingDecision]"] = {}
 
     @property
     def client(self):
-        """Lazy initialization of OpenAI client."""
+        """
+        Lazy initialization of AsyncOpenAI client with a pooled HTTP transport.
+
+        Pooled keep-alive connections belong to the event loop that opened
+        them, so the client is rebuilt when called from a different loop
+        (e.g. one asyncio.run per backtest bar) instead of reusing sockets
+        of a closed loop.
+        """
+        self._bind_event_loop()
         if self._client is None:
             try:
-                from openai import OpenAI
-                self._client = OpenAI(api_key=self._api_key)
+                import httpx
+                from openai import AsyncOpenAI
             except ImportError:
                 raise ImportError("openai package is required for OpenAIAdapter")
+
+            timeout = httpx.Timeout(self._read_timeout, connect=self._connect_timeout)
+            http_client = httpx.AsyncClient(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
+            self._client = AsyncOpenAI(
+                api_key=self._api_key,
+                base_url=self._base_url,
+                timeout=timeout,
+                max_retries=0,  # Retries are handled by _create_completion
+                http_client=http_client,
+            )
         return self._client
 
+    def _bind_event_loop(self) -> None:
+        """Drop the client and semaphore bound to a previous event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if loop is self._client_loop:
+            return
+        if self._client_loop is not None:
+            # The old pool cannot be closed from this loop; its sockets are released with it.
+            self._client = None
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._client_loop = loop
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def get_call_stats(self) -> Dict[str, Any]:
+        """Get aggregated call statistics (latency, tokens, retries)."""
+        return self._stats.to_dict()
+
     async def analyze(self, request: AnalysisRequest) -> TradingDecision:
         """Analyze market data and return a trading decision."""
         # Validate input type (contract enforcement)
@@ -62,23 +231,12 @@ class OpenAIAdapter(AIPort):
             )
 
         try:
-            # Build analysis prompt
-            prompt = self._build_analysis_prompt(request)
+            # Build analysis prompt (fitted to token budget)
+            prompt = self._prompt_budgeter.fit(self._build_analysis_prompt(request)).text
 
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=AIConfig.TEMPERATURE,
-                max_completion_tokens=AIConfig.MAX_TOKENS,
-            )
-
-            # Parse response
-            raw_response = response.choices[0].message.content
-            return self._parse_decision(raw_response, request.ticker)
+            if self._decision_cache is None:
+                return await self._request_decision(prompt, request.ticker)
+            return await self._cached_decision(request, prompt)
 
         except Exception as e:
             # Return HOLD on error
@@ -89,6 +247,82 @@ class OpenAIAdapter(AIPort):
                 raw_response=str(e),
             )
 
+    async def _request_decision(self, prompt: str, ticker: str) -> TradingDecision:
+        """Call OpenAI API and parse the decision (errors propagate)."""
+        response = await self._create_completion(
+            call_type="analyze",
+            messages=[
+                {"role": "system", "content": self._get_system_prompt()},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=AIConfig.TEMPERATURE,
+            max_completion_tokens=AIConfig.MAX_TOKENS,
+        )
+
+        raw_response = response.choices[0].message.content
+        return self._parse_decision(raw_response, ticker)
+
+    async def _cached_decision(self, request: AnalysisRequest, prompt: str) -> TradingDecision:
+        """
+        Return the cached decision for this candle, or analyze and cache it.
+
+        Concurrent callers with the same key await a single API call.
+        Failed calls are not cached.
+        """
+        key, expires_at = self._decision_cache_key(request, prompt)
+
+        cached = await self._decision_cache.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            decision = await self._request_decision(prompt, request.ticker)
+            await self._decision_cache.set(key, decision, expires_at, ticker=request.ticker)
+            future.set_result(decision)
+            return decision
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            del self._inflight[key]
+
+    def _decision_cache_key(self, request: AnalysisRequest, prompt: str) -> Tuple[str, datetime]:
+        """Build cache key and expiry (next candle close) for a request."""
+        now = datetime.now()
+        if request.market_data:
+            candle_ts = request.market_data[-1].timestamp
+        else:
+            candle_ts = floor_to_candle(now, self._candle_interval)
+
+        analysis_type = "general"
+        if request.additional_context:
+            analysis_type = str(request.additional_context.get("analysis_type", "general"))
+
+        key = make_decision_cache_key(
+            ticker=request.ticker,
+            rendered_prompt=prompt,
+            prompt_version=self._prompt_version,
+            candle_ts=candle_ts,
+            analysis_type=analysis_type,
+        )
+        return key, next_candle_close(now, self._candle_interval)
+
+    def get_last_prompt_report(self) -> Optional[PromptTokenReport]:
+        """Get per-section token report of the last analysis prompt."""
+        return self._prompt_budgeter.last_report
+
+    def get_decision_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get decision cache statistics (None if cache disabled or unsupported)."""
+        get_stats = getattr(self._decision_cache, "get_stats", None)
+        return get_stats() if get_stats else None
+
     async def analyze_entry(self, request: AnalysisRequest) -> TradingDecision:
         """Analyze whether to enter a new position."""
         # Add entry-specific context
@@ -133,8 +367,8 @@ class OpenAIAdapter(AIPort):
                 prompt += f"\n\nRecent news context:\n{news_context}"
             prompt += "\n\nRespond with only one word: bullish, bearish, or neutral."
 
-            response = self.client.chat.completions.create(
-                model=self._model,
+            response = await self._create_completion(
+                call_type="sentiment",
                 messages=[
                     {"role": "user", "content": prompt},
                 ],
@@ -172,10 +406,11 @@ class OpenAIAdapter(AIPort):
         """Check if AI service is available."""
         try:
             # Test with a simple request
-            response = self.client.chat.completions.create(
-                model=self._model,
+            response = await self._create_completion(
+                call_type="health_check",
                 messages=[{"role": "user", "content": "test"}],
                 max_completion_tokens=5,
+                retry=False,
             )
             return response is not None
         except Exception:
@@ -186,6 +421,142 @@ class OpenAIAdapter(AIPort):
         # OpenAI doesn't provide a direct quota check
         return None
 
+    async def _create_completion(
+        self,
+        call_type: str,
+        retry: bool = True,
+        **kwargs,
+    ):
+        """
+        Call chat.completions.create with concurrency limit, retry and metrics.
+
+        Args:
+            call_type: Label for metrics (analyze, sentiment, health_check)
+            retry: Whether to retry on retryable errors
+            **kwargs: Arguments forwarded to chat.completions.create
+
+        Returns:
+            ChatCompletion response
+
+        Raises:
+            Exception: The last error once retries are exhausted or not retryable
+        """
+        max_retries = self._max_retries if retry else 0
+
+        self._bind_event_loop()
+        async with self._semaphore:
+            self._stats.in_flight += 1
+            try:
+                attempt = 0
+                while True:
+                    started = time.perf_counter()
+                    try:
+                        response = await self.client.chat.completions.create(
+                            model=self._model,
+                            **kwargs,
+                        )
+                    except Exception as e:
+                        elapsed = time.perf_counter() - started
+                        reason = self._retry_reason(e)
+                        if reason is not None and attempt < max_retries:
+                            delay = self._backoff_delay(attempt, e)
+                            attempt += 1
+                            self._stats.retries += 1
+                            self._export_retry(reason)
+                            await asyncio.sleep(delay)
+                            continue
+
+                        self._record_call(call_type, "error", elapsed, None)
+                        raise
+
+                    elapsed = time.perf_counter() - started
+                    self._record_call(call_type, "success", elapsed, getattr(response, "usage", None))
+                    return response
+            finally:
+                self._stats.in_flight -= 1
+
+    def _retry_reason(self, error: Exception) -> Optional[str]:
+        """Return a retry reason label if the error is retryable, else None."""
+        try:
+            import openai
+        except ImportError:  # pragma: no cover - openai is a hard dependency
+            return None
+
+        if isinstance(error, openai.APITimeoutError) or isinstance(error, asyncio.TimeoutError):
+            return "timeout"
+        if isinstance(error, openai.APIConnectionError):
+            return "connection"
+        if isinstance(error, openai.APIStatusError):
+            if error.status_code in self.RETRYABLE_STATUS_CODES:
+                return str(error.status_code)
+        return None
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """
+        Full-jitter exponential backoff, honoring Retry-After when present.
+
+        Args:
+            attempt: Zero-based retry attempt
+            error: Error that triggered the retry
+
+        Returns:
+            Delay in seconds
+        """
+        retry_after = None
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            try:
+                retry_after = float(headers.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+
+        ceiling = min(self._retry_max_delay, self._retry_base_delay * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self._retry_max_delay))
+        return delay
+
+    def _record_call(self, call_type: str, outcome: str, elapsed: float, usage) -> None:
+        """Update in-process stats and export Prometheus metrics."""
+        prompt_tokens = self._usage_tokens(usage, "prompt_tokens")
+        completion_tokens = self._usage_tokens(usage, "completion_tokens")
+
+        self._stats.calls += 1
+        if outcome != "success":
+            self._stats.failures += 1
+        self._stats.total_latency_seconds += elapsed
+        self._stats.last_latency_seconds = elapsed
+        self._stats.prompt_tokens += prompt_tokens
+        self._stats.completion_tokens += completion_tokens
+
+        try:
+            from backend.app.services.metrics import record_ai_request
+            record_ai_request(
+                model=self._model,
+                call_type=call_type,
+                outcome=outcome,
+                duration=elapsed,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
+        except Exception:
+            pass  # Metrics must never break trading
+
+    @staticmethod
+    def _usage_tokens(usage, field: str) -> int:
+        """Read a token count from response.usage (0 if missing or malformed)."""
+        value = getattr(usage, field, None) if usage is not None else None
+        return value if isinstance(value, int) else 0
+
+    def _export_retry(self, reason: str) -> None:
+        """Export retry metric."""
+        try:
+            from backend.app.services.metrics import record_ai_retry
+            record_ai_retry(model=self._model, reason=reason)
+        except Exception:
+            pass
+
     def _get_system_prompt(self) -> str:
         """Get system prompt for trading analysis."""
         return """당신은 **리스크 헌터(Risk Hunter)** 역할의 암호화폐 트레이딩 검증자입니다.
@@ -3,6 +3,7 @@ UpbitExchangeAdapter - Upbit exchange implementation of ExchangePort.
 
 This adapter wraps the existing UpbitClient to implement the ExchangePort interface.
 """
+import logging
 from decimal import Decimal
 from typing import List, Optional, Dict, Any
 import pyupbit
@@ -17,6 +18,9 @@ from src.application.dto.trading import (
 from src.domain.entities.trade import OrderSide, OrderStatus
 from src.domain.value_objects.money import Money, Currency
 from src.config.settings import APIConfig, TradingConfig
+from src.exceptions import APIError
+
+logger = logging.getLogger(__name__)
 
 
 class UpbitExchangeAdapter(ExchangePort):
@@ -81,12 +85,20 @@ class UpbitExchangeAdapter(ExchangePort):
             )
 
     async def get_all_balances(self) -> List[BalanceInfo]:
-        """Get all non-zero balances."""
+        """
+        Get all non-zero balances.
+
+        Raises:
+            APIError: If the balance request fails. An empty list always
+                means the account holds nothing, never a failed call.
+        """
         try:
             balances = self.client.get_balances()
+            if not isinstance(balances, list):
+                raise APIError("get_balances", reason=f"unexpected response: {balances!r}")
             result = []
 
-            for bal in balances or []:
+            for bal in balances:
                 currency = bal.get("currency", "")
                 total = Decimal(str(bal.get("balance", 0)))
                 locked = Decimal(str(bal.get("locked", 0)))
@@ -105,8 +117,10 @@ class UpbitExchangeAdapter(ExchangePort):
                     ))
 
             return result
-        except Exception:
-            return []
+        except APIError:
+            raise
+        except Exception as e:
+            raise APIError("get_balances", reason=str(e)) from e
 
     # --- Order Operations ---
 
@@ -255,46 +269,59 @@ class UpbitExchangeAdapter(ExchangePort):
     # --- Position Operations ---
 
     async def get_position(self, ticker: str) -> Optional[PositionInfo]:
-        """Get current position for a ticker."""
+        """Get current position for a ticker (None on error)."""
         try:
-            # Extract symbol from ticker (e.g., "KRW-BTC" -> "BTC")
-            symbol = ticker.split("-")[-1] if "-" in ticker else ticker
-
-            balance = self.client.get_balance(symbol)
-            avg_price = self.client.get_avg_buy_price(symbol)
-
-            if not balance or float(balance) == 0:
-                return None
-
-            volume = Decimal(str(balance))
-            avg_buy_price = Decimal(str(avg_price or 0))
-            current_price = await self.get_current_price(ticker)
-
-            total_cost = avg_buy_price * volume
-            current_value = current_price.amount * volume
-            profit_loss = current_value - total_cost
-            profit_rate = (
-                ((current_price.amount - avg_buy_price) / avg_buy_price * 100)
-                if avg_buy_price > 0
-                else Decimal("0")
-            )
-
-            return PositionInfo(
-                ticker=ticker,
-                symbol=symbol,
-                volume=volume,
-                avg_buy_price=Money.krw(avg_buy_price),
-                current_price=current_price,
-                profit_loss=Money.krw(profit_loss),
-                profit_rate=profit_rate,
-                total_cost=Money.krw(total_cost),
-                current_value=Money.krw(current_value),
-            )
+            return await self._load_position(ticker)
         except Exception:
             return None
 
+    async def _load_position(self, ticker: str) -> Optional[PositionInfo]:
+        """Current position for a ticker; API errors propagate."""
+        # Extract symbol from ticker (e.g., "KRW-BTC" -> "BTC")
+        symbol = ticker.split("-")[-1] if "-" in ticker else ticker
+
+        balance = self.client.get_balance(symbol)
+        avg_price = self.client.get_avg_buy_price(symbol)
+
+        if not balance or float(balance) == 0:
+            return None
+
+        volume = Decimal(str(balance))
+        avg_buy_price = Decimal(str(avg_price or 0))
+        current_price = await self.get_current_price(ticker)
+
+        total_cost = avg_buy_price * volume
+        current_value = current_price.amount * volume
+        profit_loss = current_value - total_cost
+        profit_rate = (
+            ((current_price.amount - avg_buy_price) / avg_buy_price * 100)
+            if avg_buy_price > 0
+            else Decimal("0")
+        )
+
+        return PositionInfo(
+            ticker=ticker,
+            symbol=symbol,
+            volume=volume,
+            avg_buy_price=Money.krw(avg_buy_price),
+            current_price=current_price,
+            profit_loss=Money.krw(profit_loss),
+            profit_rate=profit_rate,
+            total_cost=Money.krw(total_cost),
+            current_value=Money.krw(current_value),
+        )
+
     async def get_all_positions(self) -> List[PositionInfo]:
-        """Get all open positions."""
+        """
+        Get all open positions.
+
+        Coins whose per-coin read fails or comes back empty (fully locked in
+        open orders, or a read racing a fill) are logged and skipped; the
+        remaining positions are still returned.
+
+        Raises:
+            APIError: If the account balance list cannot be read
+        """
         positions = []
         balances = await self.get_all_balances()
 
@@ -303,8 +330,16 @@ class UpbitExchangeAdapter(ExchangePort):
                 continue
 
             ticker = f"KRW-{balance.currency}"
-            position = await self.get_position(ticker)
-            if position and not position.is_empty():
+            try:
+                position = await self._load_position(ticker)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable position {ticker}: {e}")
+                continue
+            if position is None:
+                if balance.available.amount > 0:
+                    logger.warning(f"Skipping position {ticker}: balance read returned nothing")
+                continue
+            if not position.is_empty():
                 positions.append(position)
 
         return positions
@@ -17,6 +17,7 @@ Usage:
         ai_port=legacy_ai,
     )
 """
+import logging
 from decimal import Decimal
 from typing import List, Optional, Dict, Any
 
@@ -38,6 +39,9 @@ from src.application.dto.analysis import (
 )
 from src.domain.entities.trade import OrderSide, OrderStatus
 from src.domain.value_objects.money import Money, Currency
+from src.exceptions import APIError
+
+logger = logging.getLogger(__name__)
 
 
 class LegacyExchangeAdapter(ExchangePort):
@@ -78,23 +82,33 @@ class LegacyExchangeAdapter(ExchangePort):
             )
 
     async def get_all_balances(self) -> List[BalanceInfo]:
-        """Get all balances using legacy client."""
+        """
+        Get all balances using legacy client.
+
+        Raises:
+            APIError: If the balance request fails (never an empty list)
+        """
         try:
             balances = self._client.get_balances()
+            if not isinstance(balances, list):
+                raise APIError("get_balances", reason=f"unexpected response: {balances!r}")
             result = []
-            for bal in balances or []:
+            for bal in balances:
                 currency = bal.get("currency", "")
-                total = Decimal(str(bal.get("balance", 0)))
-                if total > 0:
+                available = Decimal(str(bal.get("balance", 0)))
+                locked = Decimal(str(bal.get("locked", 0)))
+                if available > 0 or locked > 0:
                     result.append(BalanceInfo(
                         currency=currency,
-                        total=Money.krw(total),
-                        available=Money.krw(total),
-                        locked=Money.zero(Currency.KRW),
+                        total=Money.krw(available + locked),
+                        available=Money.krw(available),
+                        locked=Money.krw(locked),
                     ))
             return result
-        except Exception:
-            return []
+        except APIError:
+            raise
+        except Exception as e:
+            raise APIError("get_balances", reason=str(e)) from e
 
     async def execute_order(self, request: OrderRequest) -> OrderResponse:
         """Execute order using legacy client."""
@@ -192,45 +206,64 @@ class LegacyExchangeAdapter(ExchangePort):
             )
 
     async def get_position(self, ticker: str) -> Optional[PositionInfo]:
-        """Get position using legacy client."""
+        """Get position using legacy client (None on error)."""
         try:
-            symbol = ticker.split("-")[-1] if "-" in ticker else ticker
-            balance = self._client.get_balance(symbol)
-            avg_price = self._client.get_avg_buy_price(symbol)
-
-            if not balance or float(balance) == 0:
-                return None
+            return await self._load_position(ticker)
+        except Exception:
+            return None
 
-            volume = Decimal(str(balance))
-            avg_buy_price = Decimal(str(avg_price or 0))
-            current_price = await self.get_current_price(ticker)
+    async def _load_position(self, ticker: str) -> Optional[PositionInfo]:
+        """Position using legacy client; API errors propagate."""
+        symbol = ticker.split("-")[-1] if "-" in ticker else ticker
+        balance = self._client.get_balance(symbol)
+        avg_price = self._client.get_avg_buy_price(symbol)
 
-            return PositionInfo(
-                ticker=ticker,
-                symbol=symbol,
-                volume=volume,
-                avg_buy_price=Money.krw(avg_buy_price),
-                current_price=current_price,
-                profit_loss=Money.krw((current_price.amount - avg_buy_price) * volume),
-                profit_rate=((current_price.amount - avg_buy_price) / avg_buy_price * 100)
-                    if avg_buy_price > 0 else Decimal("0"),
-                total_cost=Money.krw(avg_buy_price * volume),
-                current_value=Money.krw(current_price.amount * volume),
-            )
-        except Exception:
+        if not balance or float(balance) == 0:
             return None
 
+        volume = Decimal(str(balance))
+        avg_buy_price = Decimal(str(avg_price or 0))
+        current_price = await self.get_current_price(ticker)
+
+        return PositionInfo(
+            ticker=ticker,
+            symbol=symbol,
+            volume=volume,
+            avg_buy_price=Money.krw(avg_buy_price),
+            current_price=current_price,
+            profit_loss=Money.krw((current_price.amount - avg_buy_price) * volume),
+            profit_rate=((current_price.amount - avg_buy_price) / avg_buy_price * 100)
+                if avg_buy_price > 0 else Decimal("0"),
+            total_cost=Money.krw(avg_buy_price * volume),
+            current_value=Money.krw(current_price.amount * volume),
+        )
+
     async def get_all_positions(self) -> List[PositionInfo]:
-        """Get all positions using legacy client."""
+        """
+        Get all positions using legacy client.
+
+        Coins whose per-coin read fails or comes back empty are logged and
+        skipped (the legacy client reports per-coin failures as a zero
+        balance); the remaining positions are still returned.
+
+        Raises:
+            APIError: If the account balance list cannot be read
+        """
         positions = []
         balances = await self.get_all_balances()
         for balance in balances:
             if balance.currency == "KRW":
                 continue
             ticker = f"KRW-{balance.currency}"
-            position = await self.get_position(ticker)
-            if position:
-                positions.append(position)
+            try:
+                position = await self._load_position(ticker)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable position {ticker}: {e}")
+                continue
+            if position is None:
+                logger.warning(f"Skipping position {ticker}: balance read returned nothing")
+                continue
+            positions.append(position)
         return positions
 
     async def get_current_price(self, ticker: str) -> Money:
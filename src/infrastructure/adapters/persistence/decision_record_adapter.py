@@ -2,12 +2,14 @@
 DecisionRecordAdapter - PostgreSQL 기반 결정 기록 어댑터
 
 AI 결정 기록 저장 및 PnL 연동을 담당합니다.
+정확도 통계는 PnL 연동 시 증분 갱신되는 일별 rollup
+(decision_accuracy_daily)에서 조회합니다.
 """
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Sequence
 
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.outbound.decision_record_port import (
@@ -99,15 +101,24 @@ class DecisionRecordAdapter(DecisionRecordPort):
         """
         Model = _get_model()
 
+        from backend.app.services.decision_accuracy import apply_accuracy_rollup, link_delta
+
         db_record = await self._session.get(Model, int(record_id))
         if db_record is None:
             return False
 
+        # Re-linking replaces the previous outcome in the rollup
+        previous = None
+        if db_record.is_profitable is not None:
+            previous = (db_record.is_profitable, db_record.pnl_percent)
+
         db_record.pnl_percent = pnl_label.pnl_percent
         db_record.is_profitable = pnl_label.is_profitable
         db_record.exit_reason = pnl_label.exit_reason
         db_record.pnl_linked_at = datetime.utcnow()
 
+        await apply_accuracy_rollup(self._session, [link_delta(db_record, previous)])
+
         return True
 
     async def get_record(self, record_id: str) -> Optional[DecisionRecord]:
@@ -172,35 +183,52 @@ class DecisionRecordAdapter(DecisionRecordPort):
         Returns:
             Dict with accuracy, total, correct counts
         """
-        Model = _get_model()
+        from backend.app.services.decision_accuracy import get_accuracy_summary
 
-        # Build query for records with PnL linked
-        conditions = [Model.is_profitable.isnot(None)]
-
-        if prompt_version:
-            conditions.append(Model.prompt_version == prompt_version)
-
-        if start_date:
-            conditions.append(Model.created_at >= start_date)
+        return await get_accuracy_summary(
+            self._session, prompt_version=prompt_version, start_date=start_date
+        )
 
-        stmt = select(
-            func.count(Model.id),
-            func.sum(func.cast(Model.is_profitable, type_=None)),
-        ).where(*conditions)
+    async def get_accuracy_breakdown(
+        self,
+        start_day: Optional[date] = None,
+        end_day: Optional[date] = None,
+        prompt_versions: Optional[Sequence[str]] = None,
+        symbols: Optional[Sequence[str]] = None,
+        decisions: Optional[Sequence[str]] = None,
+        group_by: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get accuracy breakdown matrix for prompt A/B comparison.
 
-        result = await self._session.execute(stmt)
-        total, profitable = result.one()
+        Served from the daily rollup in a single GROUP BY query.
 
-        total = total or 0
-        profitable = int(profitable or 0)
+        Args:
+            start_day: First day (inclusive)
+            end_day: Last day (inclusive)
+            prompt_versions: Filter by prompt versions
+            symbols: Filter by symbols
+            decisions: Filter by decision types (ALLOW/BLOCK/HOLD)
+            group_by: Dimensions (default: prompt_version, symbol, decision, day)
 
-        accuracy = profitable / total if total > 0 else 0.0
+        Returns:
+            List of dicts with dimension values, total, correct, accuracy,
+            Wilson interval (ci_low, ci_high) and avg_pnl_percent
+        """
+        from backend.app.services.decision_accuracy import (
+            BREAKDOWN_DIMENSIONS,
+            get_accuracy_breakdown,
+        )
 
-        return {
-            "accuracy": accuracy,
-            "total": total,
-            "correct": profitable,
-        }
+        return await get_accuracy_breakdown(
+            self._session,
+            start_day=start_day,
+            end_day=end_day,
+            prompt_versions=prompt_versions,
+            symbols=symbols,
+            decisions=decisions,
+            group_by=BREAKDOWN_DIMENSIONS if group_by is None else group_by,
+        )
 
     def _to_domain(self, db_record: Any) -> DecisionRecord:
         """
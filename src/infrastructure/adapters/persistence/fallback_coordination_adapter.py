@@ -0,0 +1,217 @@
+"""
+Fallback coordination adapters - PostgreSQL with a local (same-host) fallback.
+
+Both the scheduler and the Telegram bot wrap their PostgreSQL lock and
+idempotency adapters with these, so:
+
+- same-host processes always exclude each other through the local
+  file lock / SQLite keys, even when the database is unreachable;
+- processes on other hosts are still excluded through PostgreSQL
+  whenever it is available.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from src.application.ports.outbound.idempotency_port import IdempotencyPort
+from src.application.ports.outbound.lock_port import LockLease, LockPort
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackLockAdapter(LockPort):
+    """
+    Lock held on the local lock first, then on the primary lock.
+
+    If the primary lock cannot be reached (its ``last_error`` is set after
+    a failed acquire), the local lock alone is used and a warning is logged.
+    Contention on the primary lock (another host holds it) still fails.
+
+    Waiting, leases and fencing tokens come from the local lock; the
+    primary is only ever tried without blocking once the local lock is held.
+    """
+
+    def __init__(self, primary: Optional[LockPort], local: LockPort):
+        """
+        Initialize the adapter.
+
+        Args:
+            primary: Cross-host lock (e.g. PostgresAdvisoryLockAdapter), optional
+            local: Same-host lock (e.g. SQLiteLeaseLockAdapter)
+        """
+        self._primary = primary
+        self._local = local
+        self._primary_held = set()
+
+    async def acquire(
+        self,
+        lock_name: str,
+        timeout_seconds: int = 300,
+        blocking: bool = False
+    ) -> bool:
+        """
+        Acquire the local lock, then the primary lock.
+
+        Returns:
+            True if the lock is held (primary may be skipped when unreachable)
+            False if another process holds it
+        """
+        if not await self._local.acquire(lock_name, timeout_seconds, blocking):
+            return False
+        if await self._acquire_primary(lock_name, timeout_seconds):
+            return True
+        await self._local.release(lock_name)
+        return False
+
+    async def acquire_lease(
+        self,
+        lock_name: str,
+        timeout_seconds: int = 300,
+        wait_seconds: float = 0.0
+    ) -> Optional[LockLease]:
+        """
+        Acquire the local lease (queueing up to wait_seconds), then the primary.
+
+        If another host holds the primary lock, the local lease is given
+        back and the attempt is retried until wait_seconds runs out.
+
+        Returns:
+            Local LockLease (with its fencing token), or None
+        """
+        deadline = time.monotonic() + max(0.0, wait_seconds)
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            lease = await self._local.acquire_lease(lock_name, timeout_seconds, remaining)
+            if lease is None:
+                return None
+            if await self._acquire_primary(lock_name, timeout_seconds):
+                return lease
+            await self._local.release(lock_name)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            await asyncio.sleep(min(1.0, remaining))
+
+    async def validate_lease(self, lease: LockLease) -> bool:
+        """Fencing check against the local lease."""
+        return await self._local.validate_lease(lease)
+
+    def get_lease(self, lock_name: str) -> Optional[LockLease]:
+        """Local lease held for lock_name."""
+        return self._local.get_lease(lock_name)
+
+    async def _acquire_primary(self, lock_name: str, timeout_seconds: int) -> bool:
+        """
+        Try the primary lock once (the local lock is already held).
+
+        Returns:
+            True if held on the primary, or the primary is absent/unreachable
+        """
+        if self._primary is None:
+            return True
+
+        try:
+            acquired = await self._primary.acquire(lock_name, timeout_seconds, blocking=False)
+            error = getattr(self._primary, "last_error", None)
+        except Exception as e:
+            acquired, error = False, e
+
+        if acquired:
+            self._primary_held.add(lock_name)
+            return True
+        if error is not None:
+            logger.warning(
+                f"Primary lock unavailable for {lock_name}, using local lock only: {error}"
+            )
+            return True
+        return False
+
+    async def release(self, lock_name: str) -> None:
+        """Release the primary (if held) and local locks."""
+        if lock_name in self._primary_held:
+            self._primary_held.discard(lock_name)
+            try:
+                await self._primary.release(lock_name)
+            except Exception as e:
+                logger.warning(f"Primary lock release failed for {lock_name}: {e}")
+        await self._local.release(lock_name)
+
+    async def is_locked(self, lock_name: str) -> bool:
+        """True if held locally or (when reachable) on the primary."""
+        if await self._local.is_locked(lock_name):
+            return True
+        if self._primary is None:
+            return False
+        try:
+            return await self._primary.is_locked(lock_name)
+        except Exception:
+            return False
+
+
+class FallbackIdempotencyAdapter(IdempotencyPort):
+    """
+    Idempotency keys checked against both stores and always marked locally.
+
+    A key counts as used if either store has it, so keys marked while the
+    database was down still prevent duplicates afterwards.
+    """
+
+    def __init__(self, primary: Optional[IdempotencyPort], local: IdempotencyPort):
+        """
+        Initialize the adapter.
+
+        Args:
+            primary: Shared key store (e.g. PostgresIdempotencyAdapter), optional
+            local: Same-host key store (e.g. SQLiteIdempotencyAdapter)
+        """
+        self._primary = primary
+        self._local = local
+
+    async def check_key(self, key: str) -> bool:
+        """True if the key is marked in the local or primary store."""
+        if await self._local.check_key(key):
+            return True
+        if self._primary is None:
+            return False
+        try:
+            return await self._primary.check_key(key)
+        except Exception as e:
+            logger.warning(f"Primary idempotency check failed, using local store: {e}")
+            return False
+
+    async def mark_key(self, key: str, ttl_hours: int = 24) -> None:
+        """Mark locally (always) and on the primary (best effort)."""
+        await self._local.mark_key(key, ttl_hours)
+        if self._primary is None:
+            return
+        try:
+            await self._primary.mark_key(key, ttl_hours)
+        except Exception as e:
+            logger.warning(f"Primary idempotency mark failed, kept in local store: {e}")
+
+    async def check_and_mark(self, key: str, ttl_hours: int = 24) -> bool:
+        """Atomic on the local store; the primary is consulted first."""
+        if self._primary is not None:
+            try:
+                if await self._primary.check_key(key):
+                    return True
+            except Exception as e:
+                logger.warning(f"Primary idempotency check failed, using local store: {e}")
+        existed = await self._local.check_and_mark(key, ttl_hours)
+        if not existed and self._primary is not None:
+            try:
+                await self._primary.mark_key(key, ttl_hours)
+            except Exception as e:
+                logger.warning(f"Primary idempotency mark failed, kept in local store: {e}")
+        return existed
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired keys from both stores."""
+        removed = await self._local.cleanup_expired()
+        if self._primary is not None:
+            try:
+                removed += await self._primary.cleanup_expired()
+            except Exception as e:
+                logger.warning(f"Primary idempotency cleanup failed: {e}")
+        return removed
@@ -0,0 +1,405 @@
+"""
+SQLiteLeaseLockAdapter - Lease-based LockPort for same-host processes.
+
+Each grant is a lease row with an expiry that a background heartbeat
+thread keeps pushing forward while the holder is alive:
+
+- A crashed holder stops renewing, so its lease lapses after lease_ttl
+  and the next waiter takes over (no dependency on a connection dying).
+- A lease is never renewed past the holder's timeout_seconds, which caps
+  how long one job can hold the lock.
+- Every grant gets a fencing token from a per-lock counter. Work done
+  under a lease can be checked with validate_lease() before it touches
+  the exchange, so a holder whose lease lapsed cannot place orders.
+- Blocking acquisition is bounded and fair: waiters enqueue in a FIFO
+  table and only the head of the queue may take a free lock. Waiters
+  refresh their row while polling; rows of dead waiters are pruned.
+
+Wait and hold times are exported as the lock_wait_seconds and
+lock_hold_seconds histograms when Prometheus metrics are available.
+"""
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Union
+from uuid import uuid4
+
+from src.application.ports.outbound.lock_port import LockLease, LockPort
+from src.infrastructure.adapters.persistence.local_coordination_adapter import _connect
+
+logger = logging.getLogger(__name__)
+
+
+def _observe_wait(lock_name: str, outcome: str, seconds: float) -> None:
+    try:
+        from backend.app.services.metrics import record_lock_wait
+        record_lock_wait(lock_name, outcome, seconds)
+    except Exception:
+        pass
+
+
+def _observe_hold(lock_name: str, seconds: float) -> None:
+    try:
+        from backend.app.services.metrics import record_lock_hold
+        record_lock_hold(lock_name, seconds)
+    except Exception:
+        pass
+
+
+class SQLiteLeaseLockAdapter(LockPort):
+    """
+    Lease lock backed by a WAL SQLite file shared by same-host processes.
+
+    Tables:
+        lock_leases: current lease per lock (holder, token, expiry)
+        lock_tokens: last fencing token issued per lock
+        lock_waiters: FIFO queue of blocked acquirers
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        lease_ttl: float = 30.0,
+        heartbeat_interval: float = 10.0,
+        poll_interval: float = 0.2,
+        max_wait_seconds: float = 60.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            path: SQLite file path (may be shared with the other coordination tables)
+            lease_ttl: Lease lifetime without a heartbeat (seconds)
+            heartbeat_interval: Renewal interval; keep well below lease_ttl
+            poll_interval: Retry interval while waiting in the queue
+            max_wait_seconds: Wait bound for acquire(blocking=True)
+            busy_timeout_ms: Wait time while another process is writing
+        """
+        self._path = Path(path)
+        self._lease_ttl = float(lease_ttl)
+        self._heartbeat_interval = float(heartbeat_interval)
+        self._poll_interval = poll_interval
+        self._max_wait = float(max_wait_seconds)
+        self._holder_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._lock = threading.Lock()
+        self._conn = _connect(self._path, busy_timeout_ms)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS lock_leases ("
+            " lock_name TEXT PRIMARY KEY,"
+            " holder TEXT NOT NULL,"
+            " token INTEGER NOT NULL,"
+            " acquired_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " hold_until REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS lock_tokens ("
+            " lock_name TEXT PRIMARY KEY,"
+            " last_token INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS lock_waiters ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " lock_name TEXT NOT NULL,"
+            " holder TEXT NOT NULL,"
+            " enqueued_at REAL NOT NULL,"
+            " seen_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_lock_waiters_name ON lock_waiters (lock_name, id)"
+        )
+
+        self._leases: Dict[str, LockLease] = {}
+        self._held_since: Dict[str, float] = {}
+        self._lost_tokens: Set[int] = set()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    # --- LockPort ---
+
+    async def acquire(
+        self,
+        lock_name: str,
+        timeout_seconds: int = 300,
+        blocking: bool = False
+    ) -> bool:
+        """
+        Attempt to acquire a lease.
+
+        Args:
+            lock_name: Name of the lock
+            timeout_seconds: Maximum time to hold the lock (lease is not
+                renewed past this)
+            blocking: If True, wait in the queue up to max_wait_seconds
+
+        Returns:
+            True if the lease was granted
+        """
+        wait_seconds = self._max_wait if blocking else 0.0
+        return await self.acquire_lease(lock_name, timeout_seconds, wait_seconds) is not None
+
+    async def acquire_lease(
+        self,
+        lock_name: str,
+        timeout_seconds: int = 300,
+        wait_seconds: float = 0.0
+    ) -> Optional[LockLease]:
+        """
+        Acquire a lease, waiting in FIFO order up to wait_seconds.
+
+        A non-waiting call does not overtake queued waiters.
+
+        Returns:
+            LockLease with a fencing token, or None
+        """
+        started = time.monotonic()
+        holder = f"{self._holder_prefix}:{uuid4().hex[:8]}"
+
+        lease = self._try_grant(lock_name, holder, None, timeout_seconds)
+        if lease is None and wait_seconds > 0:
+            lease = await self._wait_in_queue(
+                lock_name, holder, timeout_seconds, started + wait_seconds
+            )
+
+        waited = time.monotonic() - started
+        _observe_wait(lock_name, "acquired" if lease else "timeout", waited)
+        if lease is None:
+            logger.debug(f"Lease not available: {lock_name} (waited {waited:.1f}s)")
+            return None
+
+        self._leases[lock_name] = lease
+        self._held_since[lock_name] = time.monotonic()
+        self._ensure_heartbeat()
+        logger.debug(f"Lease acquired: {lock_name} token={lease.token} (waited {waited:.1f}s)")
+        return lease
+
+    async def release(self, lock_name: str) -> None:
+        """
+        Release the lease held by this adapter (no-op if not held).
+
+        Args:
+            lock_name: Name of the lock to release
+        """
+        lease = self._leases.pop(lock_name, None)
+        if lease is None:
+            return
+        self._lost_tokens.discard(lease.token)
+        held = time.monotonic() - self._held_since.pop(lock_name, time.monotonic())
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM lock_leases WHERE lock_name = ? AND token = ?",
+                (lock_name, lease.token),
+            )
+        _observe_hold(lock_name, held)
+        logger.debug(f"Lease released: {lock_name} token={lease.token} (held {held:.1f}s)")
+
+    async def is_locked(self, lock_name: str) -> bool:
+        """
+        Check if an unexpired lease exists for the lock.
+
+        Args:
+            lock_name: Name of the lock to check
+
+        Returns:
+            True if a live lease exists (held by any process)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM lock_leases WHERE lock_name = ? AND expires_at > ?",
+                (lock_name, time.time()),
+            ).fetchone()
+        return row is not None
+
+    async def validate_lease(self, lease: LockLease) -> bool:
+        """
+        Fencing check: True only while this exact grant is the live lease.
+
+        Args:
+            lease: Lease returned by acquire_lease()
+        """
+        if lease.token is None:
+            return True
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM lock_leases "
+                "WHERE lock_name = ? AND token = ? AND expires_at > ?",
+                (lease.lock_name, lease.token, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def get_lease(self, lock_name: str) -> Optional[LockLease]:
+        """Lease currently held by this adapter for lock_name."""
+        return self._leases.get(lock_name)
+
+    async def release_all(self) -> None:
+        """Release every lease held by this adapter."""
+        for lock_name in list(self._leases):
+            await self.release(lock_name)
+
+    def close(self) -> None:
+        """Stop the heartbeat, drop held leases and close the database."""
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=self._heartbeat_interval + 1)
+        with self._lock:
+            for lock_name, lease in list(self._leases.items()):
+                self._conn.execute(
+                    "DELETE FROM lock_leases WHERE lock_name = ? AND token = ?",
+                    (lock_name, lease.token),
+                )
+            self._leases.clear()
+            self._conn.close()
+
+    # --- Internal ---
+
+    def _try_grant(
+        self,
+        lock_name: str,
+        holder: str,
+        waiter_id: Optional[int],
+        timeout_seconds: float,
+    ) -> Optional[LockLease]:
+        """
+        Grant the lease if it is free and the caller is first in line.
+
+        Runs in one IMMEDIATE transaction so only one process can win.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                expired = self._conn.execute(
+                    "SELECT holder, token FROM lock_leases "
+                    "WHERE lock_name = ? AND expires_at <= ?",
+                    (lock_name, now),
+                ).fetchone()
+                if expired is not None:
+                    logger.warning(
+                        f"Lease {lock_name} token={expired[1]} expired without release "
+                        f"(holder {expired[0]}); taking over"
+                    )
+                    self._conn.execute(
+                        "DELETE FROM lock_leases WHERE lock_name = ? AND expires_at <= ?",
+                        (lock_name, now),
+                    )
+                self._conn.execute(
+                    "DELETE FROM lock_waiters WHERE lock_name = ? AND seen_at <= ?",
+                    (lock_name, now - self._lease_ttl),
+                )
+                if waiter_id is not None:
+                    self._conn.execute(
+                        "UPDATE lock_waiters SET seen_at = ? WHERE id = ?", (now, waiter_id)
+                    )
+
+                held = self._conn.execute(
+                    "SELECT 1 FROM lock_leases WHERE lock_name = ?", (lock_name,)
+                ).fetchone()
+                head = self._conn.execute(
+                    "SELECT id FROM lock_waiters WHERE lock_name = ? ORDER BY id LIMIT 1",
+                    (lock_name,),
+                ).fetchone()
+                if held is not None or (head is not None and head[0] != waiter_id):
+                    self._conn.execute("COMMIT")
+                    return None
+
+                self._conn.execute(
+                    "INSERT INTO lock_tokens (lock_name, last_token) VALUES (?, 1) "
+                    "ON CONFLICT(lock_name) DO UPDATE SET last_token = last_token + 1",
+                    (lock_name,),
+                )
+                token = self._conn.execute(
+                    "SELECT last_token FROM lock_tokens WHERE lock_name = ?", (lock_name,)
+                ).fetchone()[0]
+                self._conn.execute(
+                    "INSERT INTO lock_leases "
+                    "(lock_name, holder, token, acquired_at, expires_at, hold_until) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        lock_name, holder, token, now,
+                        now + min(self._lease_ttl, timeout_seconds),
+                        now + timeout_seconds,
+                    ),
+                )
+                if waiter_id is not None:
+                    self._conn.execute("DELETE FROM lock_waiters WHERE id = ?", (waiter_id,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return LockLease(lock_name=lock_name, token=token, holder=holder, acquired_at=now)
+
+    async def _wait_in_queue(
+        self,
+        lock_name: str,
+        holder: str,
+        timeout_seconds: float,
+        deadline: float,
+    ) -> Optional[LockLease]:
+        """Enqueue as a waiter and poll until granted or the deadline passes."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO lock_waiters (lock_name, holder, enqueued_at, seen_at) "
+                "VALUES (?, ?, ?, ?)",
+                (lock_name, holder, now, now),
+            )
+            waiter_id = cursor.lastrowid
+
+        granted = False
+        try:
+            while True:
+                lease = self._try_grant(lock_name, holder, waiter_id, timeout_seconds)
+                if lease is not None:
+                    granted = True
+                    return lease
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                await asyncio.sleep(min(self._poll_interval, remaining))
+        finally:
+            if not granted:
+                with self._lock:
+                    self._conn.execute("DELETE FROM lock_waiters WHERE id = ?", (waiter_id,))
+
+    def _ensure_heartbeat(self) -> None:
+        """Start the renewal thread (runs for the adapter's lifetime)."""
+        if self._heartbeat_thread is not None and self._heartbeat_thread.is_alive():
+            return
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name="lease-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self) -> None:
+        # A thread rather than an asyncio task: trading cycles run blocking
+        # exchange/backtest calls on the event loop, which must not starve
+        # lease renewal.
+        while not self._heartbeat_stop.wait(self._heartbeat_interval):
+            try:
+                self.renew()
+            except Exception as e:
+                logger.warning(f"Lease heartbeat failed: {e}")
+
+    def renew(self) -> None:
+        """Extend every held lease by lease_ttl (capped at its hold limit)."""
+        now = time.time()
+        for lock_name, lease in list(self._leases.items()):
+            with self._lock:
+                cursor = self._conn.execute(
+                    "UPDATE lock_leases SET expires_at = MIN(?, hold_until) "
+                    "WHERE lock_name = ? AND token = ? AND expires_at > ?",
+                    (now + self._lease_ttl, lock_name, lease.token, now),
+                )
+            if cursor.rowcount == 0 and lease.token not in self._lost_tokens:
+                self._lost_tokens.add(lease.token)
+                logger.error(
+                    f"Lease {lock_name} token={lease.token} lost "
+                    f"(expired or hold limit reached); orders under it will be rejected"
+                )
@@ -0,0 +1,410 @@
+"""
+Local coordination adapters - same-host idempotency and cycle board.
+
+These adapters let processes on one host (scheduler_main.py and
+telegram_bot.py) coordinate without PostgreSQL (the cycle lock itself is
+SQLiteLeaseLockAdapter in lease_lock_adapter.py):
+
+- SQLiteIdempotencyAdapter: IdempotencyPort backed by a WAL SQLite file.
+- CycleRunBoard: records in-flight and finished trading cycles so a
+  second process can attach to a running cycle and read its result,
+  plus every cycle request outcome for duplicate-work accounting.
+
+All processes must point at the same directory (CoordinationConfig.DIR).
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.application.ports.outbound.idempotency_port import IdempotencyPort
+
+logger = logging.getLogger(__name__)
+
+COORDINATION_DB_NAME = "coordination.db"
+
+RUN_RUNNING = "running"
+RUN_FINISHED = "finished"
+RUN_FAILED = "failed"
+RUN_ABANDONED = "abandoned"
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy scalars / datetimes for JSON encoding."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _connect(path: Path, busy_timeout_ms: int) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+    conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SQLiteIdempotencyAdapter(IdempotencyPort):
+    """
+    Idempotency keys in a local SQLite file shared by same-host processes.
+
+    check_and_mark() runs in a single IMMEDIATE transaction, so two
+    processes racing on the same key cannot both proceed.
+    """
+
+    def __init__(self, path: Union[str, Path], busy_timeout_ms: int = 5000):
+        """
+        Initialize the adapter.
+
+        Args:
+            path: SQLite file path
+            busy_timeout_ms: Wait time while another process is writing
+        """
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = _connect(self._path, busy_timeout_ms)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+            " key TEXT PRIMARY KEY,"
+            " expires_at REAL NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+
+    async def check_key(self, key: str) -> bool:
+        """
+        Check if an idempotency key exists and is not expired.
+
+        Args:
+            key: Idempotency key to check
+
+        Returns:
+            True if key exists and is valid
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM idempotency_keys WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row is not None
+
+    async def mark_key(self, key: str, ttl_hours: int = 24) -> None:
+        """
+        Mark an idempotency key as used.
+
+        Args:
+            key: Idempotency key to mark
+            ttl_hours: Time-to-live in hours
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO idempotency_keys (key, expires_at, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, now + ttl_hours * 3600, now),
+            )
+
+    async def check_and_mark(self, key: str, ttl_hours: int = 24) -> bool:
+        """
+        Atomically check and mark a key.
+
+        Returns:
+            True if key already existed (operation should be skipped)
+            False if key was newly marked (operation can proceed)
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT 1 FROM idempotency_keys WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO idempotency_keys (key, expires_at, created_at) "
+                        "VALUES (?, ?, ?)",
+                        (key, now + ttl_hours * 3600, now),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return row is not None
+
+    async def cleanup_expired(self) -> int:
+        """
+        Remove expired idempotency keys.
+
+        Returns:
+            Number of keys removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM idempotency_keys WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CycleRunBoard:
+    """
+    Shared record of trading cycles for cross-process attach.
+
+    Tables:
+        cycle_runs: one row per executed cycle (running → finished/failed)
+        cycle_requests: one row per cycle request and its outcome
+            (executed, attached, reused, busy)
+
+    Only a lock holder calls begin(); any process may read.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        stale_after_seconds: float = 900.0,
+        retention_days: int = 7,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Initialize the board.
+
+        Args:
+            path: SQLite file path (may be shared with SQLiteIdempotencyAdapter)
+            stale_after_seconds: A running row without updates for this long
+                is treated as abandoned (holder crashed)
+            retention_days: Rows older than this are pruned on begin()
+            busy_timeout_ms: Wait time while another process is writing
+        """
+        self._path = Path(path)
+        self._stale_after = float(stale_after_seconds)
+        self._retention_seconds = retention_days * 86400
+        self._lock = threading.Lock()
+        self._conn = _connect(self._path, busy_timeout_ms)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cycle_runs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " cycle_key TEXT NOT NULL,"
+            " owner TEXT NOT NULL,"
+            " pid INTEGER,"
+            " status TEXT NOT NULL,"
+            " stage TEXT,"
+            " detail TEXT,"
+            " result TEXT,"
+            " started_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " finished_at REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cycle_runs_key ON cycle_runs (cycle_key, status)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cycle_requests ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " cycle_key TEXT NOT NULL,"
+            " owner TEXT NOT NULL,"
+            " outcome TEXT NOT NULL,"
+            " run_id INTEGER,"
+            " requested_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cycle_requests_at ON cycle_requests (requested_at)"
+        )
+
+    # --- Writes ---
+
+    def begin(self, cycle_key: str, owner: str) -> int:
+        """
+        Record the start of a cycle (caller must hold the cycle lock).
+
+        Any other row still marked running is marked abandoned: its
+        holder no longer has the lock.
+
+        Returns:
+            run id
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE cycle_runs SET status = ?, finished_at = ?, updated_at = ? "
+                    "WHERE status = ?",
+                    (RUN_ABANDONED, now, now, RUN_RUNNING),
+                )
+                cursor = self._conn.execute(
+                    "INSERT INTO cycle_runs "
+                    "(cycle_key, owner, pid, status, stage, started_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (cycle_key, owner, os.getpid(), RUN_RUNNING, "started", now, now),
+                )
+                run_id = cursor.lastrowid
+                cutoff = now - self._retention_seconds
+                self._conn.execute("DELETE FROM cycle_runs WHERE started_at < ?", (cutoff,))
+                self._conn.execute("DELETE FROM cycle_requests WHERE requested_at < ?", (cutoff,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return run_id
+
+    def update_stage(self, run_id: int, stage: str, detail: Optional[Dict[str, Any]] = None) -> None:
+        """Record progress of a running cycle."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE cycle_runs SET stage = ?, detail = ?, updated_at = ? "
+                "WHERE id = ? AND status = ?",
+                (
+                    stage,
+                    json.dumps(detail, ensure_ascii=False, default=_json_default) if detail is not None else None,
+                    time.time(),
+                    run_id,
+                    RUN_RUNNING,
+                ),
+            )
+
+    def finish(self, run_id: int, result: Dict[str, Any], failed: bool = False) -> None:
+        """Record the final result of a cycle."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE cycle_runs SET status = ?, stage = ?, result = ?, "
+                "finished_at = ?, updated_at = ? WHERE id = ?",
+                (
+                    RUN_FAILED if failed else RUN_FINISHED,
+                    "finished",
+                    json.dumps(result, ensure_ascii=False, default=_json_default),
+                    now,
+                    now,
+                    run_id,
+                ),
+            )
+
+    def record_request(
+        self,
+        cycle_key: str,
+        owner: str,
+        outcome: str,
+        run_id: Optional[int] = None,
+    ) -> None:
+        """Record the outcome of one cycle request."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO cycle_requests (cycle_key, owner, outcome, run_id, requested_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (cycle_key, owner, outcome, run_id, time.time()),
+            )
+
+    # --- Reads ---
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch one run (None if unknown)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM cycle_runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        return self._row_to_run(row)
+
+    def current_run(self) -> Optional[Dict[str, Any]]:
+        """Most recent running cycle that is not stale (None if none)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM cycle_runs WHERE status = ? AND updated_at > ? "
+                "ORDER BY id DESC LIMIT 1",
+                (RUN_RUNNING, time.time() - self._stale_after),
+            ).fetchone()
+        return self._row_to_run(row)
+
+    def latest_finished(self, cycle_key: str) -> Optional[Dict[str, Any]]:
+        """Most recent successfully finished run for a cycle key."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM cycle_runs WHERE cycle_key = ? AND status = ? "
+                "ORDER BY id DESC LIMIT 1",
+                (cycle_key, RUN_FINISHED),
+            ).fetchone()
+        return self._row_to_run(row)
+
+    def is_stale(self, run: Dict[str, Any]) -> bool:
+        """True if a running row has not been updated within stale_after_seconds."""
+        return run["status"] == RUN_RUNNING and time.time() - run["updated_at"] > self._stale_after
+
+    def get_stats(self, window_seconds: float = 86400.0) -> Dict[str, Any]:
+        """
+        Duplicate-work statistics for a time window.
+
+        Returns:
+            {
+                'requests': total cycle requests,
+                'executed' / 'attached' / 'reused' / 'busy': requests by outcome,
+                'duplicate_executions': executed cycles whose cycle key had
+                    already been executed in the window,
+                'duplicate_ratio': duplicate_executions / executed cycles,
+                'avoided_ratio': (attached + reused) / requests,
+            }
+        """
+        since = time.time() - window_seconds
+        with self._lock:
+            outcomes = dict(self._conn.execute(
+                "SELECT outcome, COUNT(*) FROM cycle_requests "
+                "WHERE requested_at >= ? GROUP BY outcome",
+                (since,),
+            ).fetchall())
+            executed_runs, distinct_keys = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT cycle_key) FROM cycle_runs "
+                "WHERE started_at >= ? AND status != ?",
+                (since, RUN_ABANDONED),
+            ).fetchone()
+
+        requests = sum(outcomes.values())
+        duplicates = executed_runs - distinct_keys
+        attached = outcomes.get("attached", 0)
+        reused = outcomes.get("reused", 0)
+        return {
+            "requests": requests,
+            "executed": outcomes.get("executed", 0),
+            "attached": attached,
+            "reused": reused,
+            "busy": outcomes.get("busy", 0),
+            "duplicate_executions": duplicates,
+            "duplicate_ratio": duplicates / executed_runs if executed_runs else 0.0,
+            "avoided_ratio": (attached + reused) / requests if requests else 0.0,
+        }
+
+    def recent_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent runs, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM cycle_runs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._row_to_run(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # --- Internal ---
+
+    _COLUMNS = (
+        "id", "cycle_key", "owner", "pid", "status", "stage", "detail",
+        "result", "started_at", "updated_at", "finished_at",
+    )
+
+    def _row_to_run(self, row) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        run = dict(zip(self._COLUMNS, row))
+        for field in ("detail", "result"):
+            if run[field] is not None:
+                run[field] = json.loads(run[field])
+        return run
@@ -0,0 +1,156 @@
+"""
+InMemoryDecisionCacheAdapter - LRU implementation of DecisionCachePort.
+
+Hot tier of the AI decision cache. Optionally reads/writes through to a
+durable backing store (e.g., PostgresDecisionCacheAdapter), so a restart or
+a second process still finds decisions made earlier in the same candle.
+
+Hit/miss counts are kept per tier and exported to Prometheus.
+"""
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from src.application.ports.outbound.decision_cache_port import DecisionCachePort
+from src.application.dto.analysis import TradingDecision
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryDecisionCacheAdapter(DecisionCachePort):
+    """
+    In-memory LRU decision cache.
+
+    Stores (decision, expires_at) in an OrderedDict bounded by max_entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        backing_store: Optional[DecisionCachePort] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum entries kept in memory (LRU eviction)
+            backing_store: Optional durable store (read-through/write-through)
+        """
+        self._max_entries = max_entries
+        self._backing_store = backing_store
+        # OrderedDict[key, (decision, expires_at)]
+        self._entries: "OrderedDict[str, Tuple[TradingDecision, datetime]]" = OrderedDict()
+        self._hits_memory = 0
+        self._hits_store = 0
+        self._misses = 0
+
+    def clear(self):
+        """Clear all in-memory entries and stats. Useful for test cleanup."""
+        self._entries.clear()
+        self._hits_memory = 0
+        self._hits_store = 0
+        self._misses = 0
+
+    async def get(self, key: str) -> Optional[TradingDecision]:
+        """
+        Get a cached decision (memory first, then backing store).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached TradingDecision or None
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            decision, expires_at = entry
+            if datetime.now() < expires_at:
+                self._entries.move_to_end(key)
+                self._record("hit_memory")
+                return decision
+            del self._entries[key]
+
+        if self._backing_store is not None:
+            decision = await self._backing_store.get(key)
+            if decision is not None:
+                # Not promoted to memory: the durable tier owns the expiry
+                self._record("hit_store")
+                return decision
+
+        self._record("miss")
+        return None
+
+    async def set(
+        self,
+        key: str,
+        decision: TradingDecision,
+        expires_at: datetime,
+        ticker: Optional[str] = None,
+    ) -> None:
+        """
+        Store a decision in memory and the backing store.
+
+        Args:
+            key: Cache key
+            decision: Decision to cache
+            expires_at: Expiration time
+            ticker: Trading pair
+        """
+        self._put(key, decision, expires_at)
+        if self._backing_store is not None:
+            await self._backing_store.set(key, decision, expires_at, ticker=ticker)
+
+    async def delete_expired(self) -> int:
+        """
+        Delete expired entries from memory and the backing store.
+
+        Returns:
+            Number of entries deleted
+        """
+        now = datetime.now()
+        expired = [k for k, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+        deleted = len(expired)
+        if self._backing_store is not None:
+            deleted += await self._backing_store.delete_expired()
+        return deleted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entries, hits per tier, misses and hit_rate
+        """
+        hits = self._hits_memory + self._hits_store
+        total = hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits_memory": self._hits_memory,
+            "hits_store": self._hits_store,
+            "misses": self._misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def _put(self, key: str, decision: TradingDecision, expires_at: datetime) -> None:
+        self._entries[key] = (decision, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _record(self, result: str) -> None:
+        if result == "hit_memory":
+            self._hits_memory += 1
+        elif result == "hit_store":
+            self._hits_store += 1
+        else:
+            self._misses += 1
+
+        try:
+            from backend.app.services.metrics import record_ai_decision_cache
+            record_ai_decision_cache(result=result, hit_rate=self.get_stats()["hit_rate"])
+        except Exception:
+            pass  # Metrics must never break trading
@@ -0,0 +1,129 @@
+"""
+PostgresDecisionCacheAdapter - PostgreSQL implementation of DecisionCachePort.
+
+Uses the ai_decision_cache table as the durable tier of the AI decision
+cache, so cached decisions survive process restarts and are shared between
+the scheduler and the Telegram bot.
+"""
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from src.application.ports.outbound.decision_cache_port import DecisionCachePort
+from src.application.dto.analysis import TradingDecision
+from backend.app.models.ai_decision_cache import AIDecisionCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresDecisionCacheAdapter(DecisionCachePort):
+    """
+    PostgreSQL-based decision cache adapter.
+
+    Stores serialized decisions in the ai_decision_cache table with
+    expiration at the next candle close.
+    """
+
+    def __init__(self, session_factory):
+        """
+        Initialize the adapter.
+
+        Args:
+            session_factory: Async session factory (e.g., async_sessionmaker)
+        """
+        self._session_factory = session_factory
+
+    async def _get_session(self) -> AsyncSession:
+        """Get a new database session."""
+        return self._session_factory()
+
+    async def get(self, key: str) -> Optional[TradingDecision]:
+        """
+        Get a cached decision if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached TradingDecision or None (also on DB errors)
+        """
+        async with await self._get_session() as session:
+            try:
+                result = await session.execute(
+                    select(AIDecisionCacheEntry).where(
+                        AIDecisionCacheEntry.key == key,
+                        AIDecisionCacheEntry.expires_at > datetime.now()
+                    )
+                )
+                record = result.scalar_one_or_none()
+                if record is None:
+                    return None
+                return TradingDecision.from_dict(record.decision)
+            except Exception as e:
+                logger.error(f"Decision cache get failed: {e}")
+                # Fail open: treat as cache miss
+                return None
+
+    async def set(
+        self,
+        key: str,
+        decision: TradingDecision,
+        expires_at: datetime,
+        ticker: Optional[str] = None,
+    ) -> None:
+        """
+        Store a decision until expires_at.
+
+        Args:
+            key: Cache key
+            decision: Decision to cache
+            expires_at: Expiration time
+            ticker: Trading pair
+        """
+        async with await self._get_session() as session:
+            try:
+                record = AIDecisionCacheEntry(
+                    key=key,
+                    ticker=ticker,
+                    decision=decision.to_dict(),
+                    created_at=datetime.now(),
+                    expires_at=expires_at,
+                )
+                session.add(record)
+                await session.commit()
+                logger.debug(f"Decision cached: {key}")
+            except IntegrityError:
+                # Same key already stored by another process, which is fine
+                await session.rollback()
+                logger.debug(f"Decision cache key already exists: {key}")
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Decision cache set failed: {e}")
+
+    async def delete_expired(self) -> int:
+        """
+        Remove expired cache entries.
+
+        Returns:
+            Number of entries removed
+        """
+        async with await self._get_session() as session:
+            try:
+                result = await session.execute(
+                    delete(AIDecisionCacheEntry).where(
+                        AIDecisionCacheEntry.expires_at <= datetime.now()
+                    )
+                )
+                await session.commit()
+                deleted_count = result.rowcount
+                if deleted_count > 0:
+                    logger.info(f"Cleaned up {deleted_count} expired AI decision cache entries")
+                return deleted_count
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Decision cache cleanup failed: {e}")
+                return 0
@@ -35,6 +35,8 @@ class PostgresAdvisoryLockAdapter(LockPort):
         self._session_factory = session_factory
         self._held_locks: Set[str] = set()  # Track locks held by this adapter
         self._session: Optional[AsyncSession] = None
+        # Error from the last acquire() (None if the database answered)
+        self.last_error: Optional[Exception] = None
 
     async def _get_session(self) -> AsyncSession:
         """
@@ -85,9 +87,10 @@ class PostgresAdvisoryLockAdapter(LockPort):
             False if lock is held by another session
         """
         lock_id = self._get_lock_id(lock_name)
-        session = await self._get_session()
+        self.last_error = None
 
         try:
+            session = await self._get_session()
             if blocking:
                 # Blocking lock - waits until available
                 await session.execute(
@@ -113,6 +116,7 @@ class PostgresAdvisoryLockAdapter(LockPort):
 
         except Exception as e:
             logger.error(f"Lock acquisition failed for {lock_name}: {e}")
+            self.last_error = e
             return False
 
     async def release(self, lock_name: str) -> None:
@@ -3,6 +3,11 @@ PostgresPersistenceAdapter - PostgreSQL implementation of PersistencePort.
 
 This adapter implements data persistence using PostgreSQL database.
 It handles the mapping between Domain entities and DB models.
+
+Inserts go through a single INSERT without the follow-up refresh SELECT.
+With write_behind enabled, decision/snapshot inserts are queued and flushed
+in batches by WriteBehindQueue; order and trade inserts stay durable (written
+before save_order/save_trade returns) unless configured otherwise.
 """
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
@@ -10,19 +15,22 @@ from typing import List, Optional, Dict, Any, Callable
 from uuid import UUID
 import logging
 
-from sqlalchemy import select, and_, desc, delete
+from sqlalchemy import select, and_, desc, delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.outbound.persistence_port import PersistencePort
 from src.domain.entities.trade import Trade, Order, Position, OrderSide, OrderType, OrderStatus, TradeStatus
 from src.domain.value_objects.money import Money, Currency
 from src.application.dto.analysis import TradingDecision, DecisionType
+from src.infrastructure.adapters.persistence.write_behind import WriteBehindQueue
 
 # DB Models
 from backend.app.models.trade import Trade as TradeModel
 from backend.app.models.order import Order as OrderModel
 from backend.app.models.ai_decision import AIDecision as AIDecisionModel
 from backend.app.models.portfolio import PortfolioSnapshot as PortfolioModel
+from backend.app.models.position import Position as PositionModel
+from backend.app.services.trade_statistics import apply_trade_rollup
 
 logger = logging.getLogger(__name__)
 
@@ -46,55 +54,140 @@ class PostgresPersistenceAdapter(PersistencePort):
     and portfolio snapshots using SQLAlchemy async sessions.
     """
 
-    def __init__(self, session_factory: Callable[[], AsyncSession]):
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        write_behind: bool = False,
+        durable_orders: bool = True,
+        durable_trades: bool = True,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 10000,
+    ):
         """
         Initialize with SQLAlchemy async session factory.
 
         Args:
             session_factory: Callable that returns an AsyncSession
+            write_behind: Queue inserts and flush them in batches
+            durable_orders: Write orders synchronously even in write-behind mode
+            durable_trades: Write trades synchronously even in write-behind mode
+            max_batch_size: Rows per batched INSERT
+            flush_interval: Seconds before a partial batch is flushed
+            max_queue_size: Write-behind queue bound (backpressure)
         """
         self._session_factory = session_factory
-        # In-memory position cache (positions are volatile, not stored in DB separately)
+        # In-memory index over the positions table (write-through)
         self._positions: Dict[str, Position] = {}
+        self._positions_loaded = False
+        self._durable_orders = durable_orders
+        self._durable_trades = durable_trades
+        # Same-transaction side effects of inserts (trades daily rollup)
+        self._after_insert = {TradeModel: apply_trade_rollup}
+        self._writer: Optional[WriteBehindQueue] = None
+        if write_behind:
+            self._writer = WriteBehindQueue(
+                session_factory,
+                max_batch_size=max_batch_size,
+                flush_interval=flush_interval,
+                max_queue_size=max_queue_size,
+                after_insert=self._after_insert,
+            )
 
     async def _get_session(self) -> AsyncSession:
         """Get a new async session."""
         return self._session_factory()
 
-    # --- Trade Operations ---
+    # --- Write path ---
 
-    async def save_trade(self, trade: Trade) -> Trade:
-        """Save a trade record."""
-        async with self._session_factory() as session:
-            try:
-                # Map Domain Entity to DB Model
-                executed_dt = trade.executed_at or datetime.utcnow()
-                db_trade = TradeModel(
-                    trade_id=str(trade.id),
-                    symbol=trade.ticker,
-                    side=trade.side.value,
-                    price=trade.price.amount,
-                    amount=trade.volume,
-                    total=trade.price.amount * trade.volume,
-                    fee=trade.fee.amount if trade.fee else Decimal("0"),
-                    status=trade.status.value if trade.status else "completed",
-                    created_at=_to_naive_utc(executed_dt),
-                )
+    async def _insert(self, model: Any, values: Dict[str, Any], durable: bool) -> Optional[int]:
+        """
+        Insert a row, either immediately or through the write-behind queue.
 
-                session.add(db_trade)
-                await session.commit()
-                await session.refresh(db_trade)
+        Args:
+            model: DB model class
+            values: Column values
+            durable: Commit before returning
 
-                logger.info(f"Trade saved: {trade.id}")
-                return trade
+        Returns:
+            Primary key for immediate inserts, None when queued
+        """
+        if self._writer is not None:
+            if durable:
+                return await self._writer.write_now(model, values)
+            await self._writer.enqueue(model, values)
+            return None
 
-            except Exception as e:
+        async with self._session_factory() as session:
+            try:
+                result = await session.execute(insert(model).values(**values))
+                hook = self._after_insert.get(model)
+                if hook is not None:
+                    await hook(session, [values])
+                await session.commit()
+            except Exception:
                 await session.rollback()
-                logger.error(f"Failed to save trade: {e}")
                 raise
+        return result.inserted_primary_key[0] if result.inserted_primary_key else None
+
+    async def _sync_pending(self, *models: Any) -> None:
+        """Flush queued rows for these tables so reads see earlier writes."""
+        if self._writer is None:
+            return
+        if not any(self._writer.pending_for(model) for model in models):
+            return
+        try:
+            await self._writer.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush pending writes before read: {e}")
+
+    async def flush(self) -> int:
+        """Flush all queued writes. Returns the number of rows written."""
+        if self._writer is None:
+            return 0
+        return await self._writer.flush()
+
+    async def aclose(self) -> None:
+        """Flush queued writes and stop the background writer."""
+        if self._writer is not None:
+            await self._writer.aclose()
+
+    def get_write_stats(self) -> Dict[str, Any]:
+        """Write-behind queue statistics (empty when disabled)."""
+        return self._writer.get_stats() if self._writer is not None else {}
+
+    # --- Trade Operations ---
+
+    async def save_trade(self, trade: Trade, durable: Optional[bool] = None) -> Trade:
+        """Save a trade record (durable by default; queued only when durable_trades is off)."""
+        try:
+            # Map Domain Entity to DB Model columns
+            executed_dt = trade.executed_at or datetime.utcnow()
+            values = {
+                "trade_id": str(trade.id),
+                "symbol": trade.ticker,
+                "side": trade.side.value,
+                "price": trade.price.amount,
+                "amount": trade.volume,
+                "total": trade.price.amount * trade.volume,
+                "fee": trade.fee.amount if trade.fee else Decimal("0"),
+                "status": trade.status.value if trade.status else "completed",
+                "created_at": _to_naive_utc(executed_dt),
+            }
+            if durable is None:
+                durable = self._durable_trades
+            await self._insert(TradeModel, values, durable=durable)
+
+            logger.info(f"Trade saved: {trade.id}")
+            return trade
+
+        except Exception as e:
+            logger.error(f"Failed to save trade: {e}")
+            raise
 
     async def get_trade(self, trade_id: UUID) -> Optional[Trade]:
         """Get a trade by ID."""
+        await self._sync_pending(TradeModel)
         async with self._session_factory() as session:
             try:
                 result = await session.execute(
@@ -117,6 +210,7 @@ class PostgresPersistenceAdapter(PersistencePort):
         limit: int = 100,
     ) -> List[Trade]:
         """Get trades for a specific ticker."""
+        await self._sync_pending(TradeModel)
         async with self._session_factory() as session:
             try:
                 result = await session.execute(
@@ -140,6 +234,7 @@ class PostgresPersistenceAdapter(PersistencePort):
         ticker: Optional[str] = None,
     ) -> List[Trade]:
         """Get trades within a date range."""
+        await self._sync_pending(TradeModel)
         async with self._session_factory() as session:
             try:
                 query = select(TradeModel).where(
@@ -178,37 +273,35 @@ class PostgresPersistenceAdapter(PersistencePort):
 
     # --- Order Operations ---
 
-    async def save_order(self, order: Order) -> Order:
-        """Save an order record."""
-        async with self._session_factory() as session:
-            try:
-                created_dt = order.created_at or datetime.utcnow()
-                db_order = OrderModel(
-                    order_id=str(order.id),
-                    symbol=order.ticker,
-                    side=order.side.value,
-                    order_type=order.order_type.value if order.order_type else "market",
-                    price=order.price.amount if order.price else None,
-                    amount=order.volume,
-                    filled_amount=Decimal("0"),
-                    status=order.status.value if order.status else "pending",
-                    created_at=_to_naive_utc(created_dt),
-                )
-
-                session.add(db_order)
-                await session.commit()
-                await session.refresh(db_order)
-
-                logger.info(f"Order saved: {order.id}")
-                return order
+    async def save_order(self, order: Order, durable: Optional[bool] = None) -> Order:
+        """Save an order record (durable by default)."""
+        try:
+            created_dt = order.created_at or datetime.utcnow()
+            values = {
+                "order_id": str(order.id),
+                "symbol": order.ticker,
+                "side": order.side.value,
+                "order_type": order.order_type.value if order.order_type else "market",
+                "price": order.price.amount if order.price else None,
+                "amount": order.volume,
+                "filled_amount": Decimal("0"),
+                "status": order.status.value if order.status else "pending",
+                "created_at": _to_naive_utc(created_dt),
+            }
+            if durable is None:
+                durable = self._durable_orders
+            await self._insert(OrderModel, values, durable=durable)
+
+            logger.info(f"Order saved: {order.id}")
+            return order
 
-            except Exception as e:
-                await session.rollback()
-                logger.error(f"Failed to save order: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Failed to save order: {e}")
+            raise
 
     async def get_order(self, order_id: UUID) -> Optional[Order]:
         """Get an order by ID."""
+        await self._sync_pending(OrderModel)
         async with self._session_factory() as session:
             try:
                 result = await session.execute(
@@ -227,6 +320,7 @@ class PostgresPersistenceAdapter(PersistencePort):
 
     async def get_open_orders(self, ticker: Optional[str] = None) -> List[Order]:
         """Get all open orders."""
+        await self._sync_pending(OrderModel)
         async with self._session_factory() as session:
             try:
                 query = select(OrderModel).where(
@@ -252,6 +346,7 @@ class PostgresPersistenceAdapter(PersistencePort):
         **kwargs,
     ) -> Optional[Order]:
         """Update order status."""
+        await self._sync_pending(OrderModel)
         async with self._session_factory() as session:
             try:
                 result = await session.execute(
@@ -304,30 +399,100 @@ class PostgresPersistenceAdapter(PersistencePort):
         )
 
     # --- Position Operations ---
-    # Note: Positions are stored in memory for now (similar to InMemoryAdapter)
-    # A separate positions table could be added for persistence
+    # Positions are stored in the positions table (one row per open ticker)
+    # and fronted by an in-memory index: loaded once, then updated
+    # write-through so reads on the trading path never hit the database.
+
+    async def load_positions(self) -> int:
+        """
+        Load open positions from the database into the in-memory index.
+
+        Returns:
+            Number of positions loaded
+        """
+        async with self._session_factory() as session:
+            result = await session.execute(select(PositionModel))
+            rows = result.scalars().all()
+
+        self._positions = {row.symbol: self._position_model_to_entity(row) for row in rows}
+        self._positions_loaded = True
+        logger.info(f"Positions loaded: {len(self._positions)}")
+        return len(self._positions)
+
+    async def _ensure_positions_loaded(self) -> None:
+        if not self._positions_loaded:
+            await self.load_positions()
 
     async def save_position(self, position: Position) -> Position:
-        """Save or update a position."""
+        """Save or update a position (database first, then index)."""
+        await self._ensure_positions_loaded()
+        values = {
+            "position_id": str(position.id),
+            "currency": position.symbol,
+            "volume": position.volume,
+            "avg_entry_price": position.avg_entry_price.amount,
+            "entry_time": _to_naive_utc(position.entry_time),
+            "updated_at": datetime.utcnow(),
+        }
+
+        async with self._session_factory() as session:
+            try:
+                result = await session.execute(
+                    update(PositionModel)
+                    .where(PositionModel.symbol == position.ticker)
+                    .values(**values)
+                )
+                if result.rowcount == 0:
+                    await session.execute(
+                        insert(PositionModel).values(symbol=position.ticker, **values)
+                    )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
         self._positions[position.ticker] = position
         logger.info(f"Position saved: {position.ticker}")
         return position
 
     async def get_position(self, ticker: str) -> Optional[Position]:
         """Get current position for a ticker."""
+        await self._ensure_positions_loaded()
         return self._positions.get(ticker)
 
     async def get_all_positions(self) -> List[Position]:
         """Get all open positions."""
+        await self._ensure_positions_loaded()
         return list(self._positions.values())
 
     async def close_position(self, ticker: str) -> bool:
         """Close a position."""
-        if ticker in self._positions:
-            del self._positions[ticker]
+        await self._ensure_positions_loaded()
+        async with self._session_factory() as session:
+            try:
+                result = await session.execute(
+                    delete(PositionModel).where(PositionModel.symbol == ticker)
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        existed = self._positions.pop(ticker, None) is not None or result.rowcount > 0
+        if existed:
             logger.info(f"Position closed: {ticker}")
-            return True
-        return False
+        return existed
+
+    def _position_model_to_entity(self, db_position: PositionModel) -> Position:
+        """Convert DB model to domain Position entity."""
+        return Position(
+            id=UUID(db_position.position_id),
+            ticker=db_position.symbol,
+            symbol=db_position.currency,
+            volume=db_position.volume,
+            avg_entry_price=Money(db_position.avg_entry_price, Currency.KRW),
+            entry_time=db_position.entry_time,
+        )
 
     # --- AI Decision Operations ---
 
@@ -335,42 +500,38 @@ class PostgresPersistenceAdapter(PersistencePort):
         self,
         ticker: str,
         decision: TradingDecision,
+        durable: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Save an AI trading decision."""
-        async with self._session_factory() as session:
-            try:
-                db_decision = AIDecisionModel(
-                    symbol=ticker,
-                    decision=decision.decision.value,
-                    confidence=float(decision.confidence) * 100 if decision.confidence else None,
-                    reason=decision.reasoning,
-                    market_data={
-                        "risk_assessment": decision.risk_assessment,
-                        "key_factors": decision.key_factors,
-                    },
-                    created_at=datetime.utcnow(),
-                )
-
-                session.add(db_decision)
-                await session.commit()
-                await session.refresh(db_decision)
-
-                result = {
-                    "id": db_decision.id,
-                    "ticker": ticker,
-                    "decision": decision.decision.value,
-                    "confidence": float(decision.confidence) if decision.confidence else None,
-                    "reasoning": decision.reasoning,
-                    "timestamp": db_decision.created_at,
-                }
-
-                logger.info(f"Decision saved: {ticker} -> {decision.decision.value}")
-                return result
+        """Save an AI trading decision (id is None while queued)."""
+        try:
+            values = {
+                "symbol": ticker,
+                "decision": decision.decision.value,
+                "confidence": float(decision.confidence) * 100 if decision.confidence else None,
+                "reason": decision.reasoning,
+                "market_data": {
+                    "risk_assessment": decision.risk_assessment,
+                    "key_factors": decision.key_factors,
+                },
+                "created_at": datetime.utcnow(),
+            }
+            decision_id = await self._insert(AIDecisionModel, values, durable=bool(durable))
+
+            result = {
+                "id": decision_id,
+                "ticker": ticker,
+                "decision": decision.decision.value,
+                "confidence": float(decision.confidence) if decision.confidence else None,
+                "reasoning": decision.reasoning,
+                "timestamp": values["created_at"],
+            }
+
+            logger.info(f"Decision saved: {ticker} -> {decision.decision.value}")
+            return result
 
-            except Exception as e:
-                await session.rollback()
-                logger.error(f"Failed to save decision: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Failed to save decision: {e}")
+            raise
 
     async def get_recent_decisions(
         self,
@@ -378,6 +539,7 @@ class PostgresPersistenceAdapter(PersistencePort):
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
         """Get recent AI decisions for a ticker."""
+        await self._sync_pending(AIDecisionModel)
         async with self._session_factory() as session:
             try:
                 result = await session.execute(
@@ -412,40 +574,37 @@ class PostgresPersistenceAdapter(PersistencePort):
         self,
         total_value: Decimal,
         positions: Dict[str, Any],
+        durable: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Save a portfolio snapshot."""
-        async with self._session_factory() as session:
-            try:
-                db_snapshot = PortfolioModel(
-                    total_value_krw=total_value,
-                    positions=positions,
-                    created_at=datetime.utcnow(),
-                )
-
-                session.add(db_snapshot)
-                await session.commit()
-                await session.refresh(db_snapshot)
-
-                result = {
-                    "id": db_snapshot.id,
-                    "total_value": float(db_snapshot.total_value_krw),
-                    "positions": db_snapshot.positions,
-                    "timestamp": db_snapshot.created_at,
-                }
-
-                logger.info(f"Portfolio snapshot saved: {total_value:,.0f} KRW")
-                return result
+        """Save a portfolio snapshot (id is None while queued)."""
+        try:
+            values = {
+                "total_value_krw": total_value,
+                "positions": positions,
+                "created_at": datetime.utcnow(),
+            }
+            snapshot_id = await self._insert(PortfolioModel, values, durable=bool(durable))
+
+            result = {
+                "id": snapshot_id,
+                "total_value": float(total_value),
+                "positions": positions,
+                "timestamp": values["created_at"],
+            }
+
+            logger.info(f"Portfolio snapshot saved: {total_value:,.0f} KRW")
+            return result
 
-            except Exception as e:
-                await session.rollback()
-                logger.error(f"Failed to save portfolio snapshot: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Failed to save portfolio snapshot: {e}")
+            raise
 
     async def get_portfolio_history(
         self,
         days: int = 30,
     ) -> List[Dict[str, Any]]:
         """Get portfolio value history."""
+        await self._sync_pending(PortfolioModel)
         async with self._session_factory() as session:
             try:
                 cutoff = datetime.utcnow() - timedelta(days=days)
@@ -479,6 +638,7 @@ class PostgresPersistenceAdapter(PersistencePort):
         days: int = 30,
     ) -> Dict[str, Any]:
         """Get trading statistics."""
+        await self._sync_pending(TradeModel)
         async with self._session_factory() as session:
             try:
                 cutoff = datetime.utcnow() - timedelta(days=days)
@@ -547,6 +707,7 @@ class PostgresPersistenceAdapter(PersistencePort):
 
     async def cleanup_old_data(self, days: int = 90) -> int:
         """Clean up old data."""
+        await self._sync_pending(TradeModel, OrderModel, AIDecisionModel, PortfolioModel)
         async with self._session_factory() as session:
             try:
                 cutoff = datetime.utcnow() - timedelta(days=days)
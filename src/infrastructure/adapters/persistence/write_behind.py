@@ -0,0 +1,314 @@
+"""
+WriteBehindQueue - batched, asynchronous inserts for the persistence adapter.
+
+Records are appended to a bounded in-process queue and flushed by a
+background task in multi-row INSERT batches, either when the batch size is
+reached or after flush_interval seconds. Callers that need the row on disk
+before they continue (durable writes) flush synchronously instead.
+
+Rows are plain column dicts so a batch can be sent as a single executemany
+INSERT per table without per-row ORM refreshes. Per-table after_insert hooks
+run inside the same transaction (e.g. the trades daily rollup).
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# (session, inserted rows) -> awaitable, run before commit
+AfterInsertHook = Callable[[AsyncSession, List[Dict[str, Any]]], Awaitable[Any]]
+
+
+@dataclass
+class _PendingRow:
+    """A queued row waiting to be flushed."""
+    model: Any
+    values: Dict[str, Any]
+    attempts: int = 0
+
+
+class WriteBehindQueue:
+    """
+    Bounded write-behind queue with size/time triggered batch flushes.
+
+    The queue is bound to the event loop that first uses it. When the loop
+    changes (e.g. a new asyncio.run), the background task is recreated and
+    rows that were still queued are kept.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 10000,
+        max_attempts: int = 3,
+        after_insert: Optional[Dict[Any, AfterInsertHook]] = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            session_factory: Callable that returns an AsyncSession
+            max_batch_size: Rows per INSERT batch (size trigger)
+            flush_interval: Seconds before a partial batch is flushed (time trigger)
+            max_queue_size: Queue bound; enqueue flushes inline when reached
+            max_attempts: Attempts per row before it is dropped
+            after_insert: Per-model hooks run in the INSERT transaction
+        """
+        self._session_factory = session_factory
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval = flush_interval
+        self.max_queue_size = max(self.max_batch_size, max_queue_size)
+        self.max_attempts = max(1, max_attempts)
+        self._after_insert = after_insert or {}
+
+        self._pending: Deque[_PendingRow] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "durable_writes": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "dropped": 0,
+        }
+
+    # --- Lifecycle ---
+
+    def _ensure_worker(self) -> None:
+        """Start (or restart on a new event loop) the background flusher."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = loop.create_task(self._run(), name="persistence-write-behind")
+
+    async def _run(self) -> None:
+        """Background loop: flush on size trigger or every flush_interval."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._pending:
+                try:
+                    await self.flush()
+                except Exception as e:
+                    # Rows stay queued (up to max_attempts); keep the worker alive
+                    logger.error(f"Write-behind flush failed: {e}")
+
+    async def aclose(self) -> None:
+        """Flush remaining rows and stop the background task."""
+        self._closed = True
+        if self._pending:
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind final flush failed: {e}")
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        self._task = None
+
+    # --- Writes ---
+
+    async def enqueue(self, model: Any, values: Dict[str, Any]) -> None:
+        """
+        Queue a row for a batched INSERT.
+
+        Applies backpressure by flushing inline when the queue is full.
+
+        Args:
+            model: SQLAlchemy model class (target table)
+            values: Column values
+        """
+        if self._closed:
+            await self.write_now(model, values)
+            return
+
+        self._ensure_worker()
+        self._pending.append(_PendingRow(model, values))
+        self._stats["enqueued"] += 1
+        self._export_depth()
+
+        if len(self._pending) >= self.max_queue_size:
+            await self.flush()
+        elif len(self._pending) >= self.max_batch_size:
+            self._wakeup.set()
+
+    async def write_now(self, model: Any, values: Dict[str, Any]) -> Optional[Any]:
+        """
+        Durable write: INSERT and commit before returning.
+
+        Errors propagate to the caller.
+
+        Args:
+            model: SQLAlchemy model class (target table)
+            values: Column values
+
+        Returns:
+            Primary key of the inserted row
+        """
+        started = time.monotonic()
+        async with self._session_factory() as session:
+            try:
+                result = await session.execute(insert(model).values(**values))
+                await self._run_hooks(session, model, [values])
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+        self._stats["durable_writes"] += 1
+        self._export_flush(1, time.monotonic() - started)
+        return result.inserted_primary_key[0] if result.inserted_primary_key else None
+
+    async def flush(self) -> int:
+        """
+        Write every queued row, one transaction per batch.
+
+        When a batch fails, its rows are retried one per transaction so a
+        single bad row cannot take the rest of the batch down with it. Rows
+        that still fail go back to the head of the queue; rows that exceeded
+        max_attempts are dropped, counted and exported as a metric. The first
+        error is re-raised after the remaining batches have been attempted.
+
+        Returns:
+            Number of rows written
+        """
+        self._ensure_worker()
+
+        written = 0
+        error: Optional[Exception] = None
+        async with self._flush_lock:
+            # Only rows queued before this flush started; failed rows go back
+            # to the head of the queue and wait for the next trigger.
+            rows = [self._pending.popleft() for _ in range(len(self._pending))]
+            failed: List[_PendingRow] = []
+            for start in range(0, len(rows), self.max_batch_size):
+                batch = rows[start:start + self.max_batch_size]
+                try:
+                    await self._write_batch(batch)
+                    written += len(batch)
+                    continue
+                except Exception as e:
+                    self._stats["failed_batches"] += 1
+                    if len(batch) == 1:
+                        error = error or e
+                        failed.extend(batch)
+                        continue
+                # Isolate the failing rows
+                for row in batch:
+                    try:
+                        await self._write_batch([row])
+                        written += 1
+                    except Exception as e:
+                        error = error or e
+                        failed.append(row)
+            if failed:
+                self._requeue(failed, error)
+
+        self._export_depth()
+        if error is not None:
+            raise error
+        return written
+
+    async def _write_batch(self, batch: List[_PendingRow]) -> None:
+        """Insert a batch with one executemany INSERT per table."""
+        started = time.monotonic()
+        by_model: Dict[Any, List[Dict[str, Any]]] = {}
+        for row in batch:
+            by_model.setdefault(row.model, []).append(row.values)
+
+        async with self._session_factory() as session:
+            try:
+                for model, rows in by_model.items():
+                    await session.execute(insert(model), rows)
+                    await self._run_hooks(session, model, rows)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        self._stats["written"] += len(batch)
+        self._stats["batches"] += 1
+        self._export_flush(len(batch), time.monotonic() - started)
+
+    async def _run_hooks(self, session: AsyncSession, model: Any, rows: List[Dict[str, Any]]) -> None:
+        """Run the after_insert hook for a table, if any."""
+        hook = self._after_insert.get(model)
+        if hook is not None:
+            await hook(session, rows)
+
+    def _requeue(self, batch: List[_PendingRow], error: Exception) -> None:
+        """Put failed rows back at the head of the queue (bounded attempts)."""
+        for row in reversed(batch):
+            row.attempts += 1
+            if row.attempts >= self.max_attempts:
+                table = row.model.__tablename__
+                self._stats["dropped"] += 1
+                logger.error(f"Dropping {table} row after {row.attempts} attempts: {error}")
+                self._export_dropped(table)
+                continue
+            self._pending.appendleft(row)
+
+    # --- Introspection ---
+
+    @property
+    def depth(self) -> int:
+        """Number of queued rows."""
+        return len(self._pending)
+
+    def pending_for(self, model: Any) -> int:
+        """Number of queued rows for a table."""
+        return sum(1 for row in self._pending if row.model is model)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue statistics."""
+        stats = dict(self._stats)
+        stats["depth"] = self.depth
+        stats["avg_batch_size"] = (
+            stats["written"] / stats["batches"] if stats["batches"] else 0.0
+        )
+        return stats
+
+    # --- Metrics ---
+
+    def _export_depth(self) -> None:
+        try:
+            from backend.app.services.metrics import record_persistence_queue_depth
+            record_persistence_queue_depth(self.depth)
+        except Exception:
+            pass
+
+    def _export_flush(self, batch_size: int, duration: float) -> None:
+        try:
+            from backend.app.services.metrics import record_persistence_flush
+            record_persistence_flush(batch_size, duration)
+        except Exception:
+            pass
+
+    def _export_dropped(self, table: str) -> None:
+        try:
+            from backend.app.services.metrics import record_persistence_dropped
+            record_persistence_dropped(table)
+        except Exception:
+            pass
@@ -1,4 +1,16 @@
 """Prompt adapters."""
 from src.infrastructure.adapters.prompt.yaml_prompt_adapter import YAMLPromptAdapter
+from src.infrastructure.adapters.prompt.token_budget import (
+    PromptBudgeter,
+    PromptTokenReport,
+    TokenBudgetPromptAdapter,
+    TokenCounter,
+)
 
-__all__ = ["YAMLPromptAdapter"]
+__all__ = [
+    "YAMLPromptAdapter",
+    "PromptBudgeter",
+    "PromptTokenReport",
+    "TokenBudgetPromptAdapter",
+    "TokenCounter",
+]
@@ -0,0 +1,110 @@
+"""
+Prompt Budget Regression - 토큰 예산 축소 회귀 검증.
+
+기록된 입력(컨텍스트)들을 예산 없이 / 축소된 예산으로 각각 렌더링하고
+동일한 결정 함수에 넣어, 결정이 바뀐 비율이 임계값 이하인지 확인한다.
+
+결정 함수는 운영에서는 실제 LLM 호출(OpenAIAdapter 등),
+테스트에서는 결정적(rule-based) 함수가 될 수 있다.
+
+사용 예:
+    records = load_recorded_inputs("data/prompt_records.jsonl")
+    results = await run_budget_regression(
+        records,
+        render=lambda ctx, budget: adapter.render_prompt(PromptType.ENTRY, ctx, budget=budget),
+        decide=my_decider,
+        budgets=[800, 600, 400],
+        max_change_rate=0.05,
+    )
+"""
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+
+@dataclass
+class BudgetRegressionResult:
+    """
+    예산별 회귀 검증 결과.
+
+    Attributes:
+        budget: 토큰 예산
+        total: 비교한 입력 수
+        changed: 결정이 바뀐 입력 수
+        max_change_rate: 허용 변경 비율
+        changed_indices: 결정이 바뀐 입력 인덱스
+    """
+    budget: int
+    total: int
+    changed: int
+    max_change_rate: float
+    changed_indices: List[int] = field(default_factory=list)
+
+    @property
+    def change_rate(self) -> float:
+        """결정 변경 비율"""
+        return self.changed / self.total if self.total else 0.0
+
+    @property
+    def passed(self) -> bool:
+        """허용 비율 이내 여부"""
+        return self.change_rate <= self.max_change_rate
+
+
+def load_recorded_inputs(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    기록된 입력 로드 (JSONL, 한 줄에 컨텍스트 1개).
+
+    Args:
+        path: JSONL 파일 경로
+
+    Returns:
+        컨텍스트 리스트
+    """
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+async def run_budget_regression(
+    records: List[Dict[str, Any]],
+    render: Callable[[Dict[str, Any], Optional[int]], Awaitable[str]],
+    decide: Callable[[str], Awaitable[str]],
+    budgets: List[int],
+    max_change_rate: float = 0.05,
+) -> List[BudgetRegressionResult]:
+    """
+    예산 축소에 따른 결정 변경률 측정.
+
+    Args:
+        records: 기록된 입력 컨텍스트
+        render: (컨텍스트, 예산) → 프롬프트 (예산 None = 무제한 기준선)
+        decide: 프롬프트 → 결정 문자열
+        budgets: 검증할 예산 목록
+        max_change_rate: 허용 결정 변경 비율
+
+    Returns:
+        예산별 BudgetRegressionResult
+    """
+    baseline = [await decide(await render(record, None)) for record in records]
+
+    results = []
+    for budget in budgets:
+        changed_indices = []
+        for index, record in enumerate(records):
+            decision = await decide(await render(record, budget))
+            if decision != baseline[index]:
+                changed_indices.append(index)
+        results.append(BudgetRegressionResult(
+            budget=budget,
+            total=len(records),
+            changed=len(changed_indices),
+            max_change_rate=max_change_rate,
+            changed_indices=changed_indices,
+        ))
+    return results
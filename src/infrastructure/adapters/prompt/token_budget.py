@@ -0,0 +1,506 @@
+"""
+Token Budget - 토큰 예산 기반 프롬프트 조립.
+
+프롬프트 토큰 수는 LLM 지연 시간과 비용을 직접 결정한다.
+이 모듈은 렌더링된 프롬프트를 마크다운 헤딩 단위 섹션으로 나누고,
+오프라인 토크나이저로 섹션별 토큰 수를 측정한 뒤,
+설정된 예산을 넘으면 가치가 낮은 섹션부터 압축(표 형식) → 제거한다.
+
+구성:
+- TokenCounter: tiktoken(설치 시) 또는 오프라인 근사 토크나이저
+- encode_compact: 숫자/딕셔너리/리스트 컨텍스트 값을 압축 표기
+- PromptBudgeter: 섹션 분할 + 예산 맞춤 + 섹션별 토큰 리포트
+- TokenBudgetPromptAdapter: YAMLPromptAdapter.render_prompt 위의 PromptPort 래퍼
+"""
+import logging
+import math
+import re
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.application.ports.outbound.prompt_port import PromptPort
+from src.domain.value_objects.prompt_version import PromptType, PromptVersion
+
+logger = logging.getLogger(__name__)
+
+
+# 토큰 근사 분할: 숫자 묶음 / 영문 단어 / 한글·CJK 1자 / 기타 기호 1개
+_PIECE_PATTERN = re.compile(
+    r"\d+|[A-Za-z_]+|[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7a3]|[^\sA-Za-z0-9_]"
+)
+# 마크다운 헤딩
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.*)$")
+# 수평선 (섹션 경계, 뒤따르는 본문은 별도 섹션)
+_RULE_PATTERN = re.compile(r"^\s*(-{3,}|\*{3,}|_{3,})\s*$")
+# "- 키: 값" 형식의 글머리 라인
+_BULLET_KV_PATTERN = re.compile(r"^\s*[-*]\s*(?:\*\*)?([^:*]+?)(?:\*\*)?\s*:\s*(.+?)\s*$")
+
+
+class TokenCounter:
+    """
+    오프라인 토큰 카운터.
+
+    tiktoken이 설치되어 있고 인코딩을 로드할 수 있으면 정확한 값을,
+    그렇지 않으면 결정적(deterministic) 근사값을 사용한다.
+    근사: 숫자는 3자리당 1토큰, 영문 단어는 4자당 1토큰,
+    한글/CJK는 1자당 1토큰, 기호는 1개당 1토큰.
+    """
+
+    def __init__(self, encoding_name: str = "o200k_base", use_tiktoken: bool = True):
+        """
+        Args:
+            encoding_name: tiktoken 인코딩 이름
+            use_tiktoken: False면 항상 근사 토크나이저 사용 (테스트 재현성)
+        """
+        self._encoding = None
+        if use_tiktoken:
+            try:
+                import tiktoken
+                self._encoding = tiktoken.get_encoding(encoding_name)
+            except Exception:
+                # 미설치 또는 인코딩 파일 다운로드 불가 (오프라인)
+                self._encoding = None
+
+    @property
+    def backend(self) -> str:
+        """사용 중인 토크나이저 ('tiktoken' 또는 'approx')"""
+        return "tiktoken" if self._encoding is not None else "approx"
+
+    def count(self, text: str) -> int:
+        """
+        토큰 수 계산.
+
+        Args:
+            text: 문자열
+
+        Returns:
+            토큰 수
+        """
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+
+        tokens = 0
+        for piece in _PIECE_PATTERN.findall(text):
+            if piece[0].isdigit():
+                tokens += math.ceil(len(piece) / 3)
+            elif piece[0].isascii() and (piece[0].isalpha() or piece[0] == "_"):
+                tokens += math.ceil(len(piece) / 4)
+            else:
+                tokens += 1
+        # 줄바꿈도 토큰을 차지
+        tokens += text.count("\n")
+        return tokens
+
+
+def _format_number(value: float, decimals: int) -> str:
+    """숫자를 짧게 표기 (큰 수는 정수, 작은 수는 유효 자릿수 유지)"""
+    if value != value:  # NaN
+        return "nan"
+    if abs(value) >= 1000:
+        return f"{value:.0f}"
+    if value == int(value):
+        return str(int(value))
+    magnitude = abs(value)
+    digits = decimals if magnitude >= 1 else decimals + max(0, -int(math.floor(math.log10(magnitude))) - 1)
+    return f"{value:.{digits}f}".rstrip("0").rstrip(".")
+
+
+def encode_compact(value: Any, decimals: int = 2) -> str:
+    """
+    컨텍스트 값을 압축 표기로 변환.
+
+    - 숫자: 불필요한 자릿수 제거 (50000000.0 → 50000000, 0.001234 → 0.0012)
+    - dict: "k=v k=v" 한 줄
+    - 동일 키의 dict 리스트: "a|b|c" 헤더 + 값 행 (표)
+    - 스칼라 리스트: 쉼표 구분
+
+    Args:
+        value: 변환할 값
+        decimals: 소수 자릿수
+
+    Returns:
+        압축 문자열
+    """
+    if isinstance(value, bool):
+        return "Y" if value else "N"
+    if isinstance(value, (int, float, Decimal)):
+        return _format_number(float(value), decimals)
+    if isinstance(value, dict):
+        return " ".join(f"{k}={encode_compact(v, decimals)}" for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(v, dict) for v in value):
+            keys = list(value[0].keys())
+            if all(list(v.keys()) == keys for v in value):
+                rows = ["|".join(str(k) for k in keys)]
+                rows.extend("|".join(encode_compact(v[k], decimals) for k in keys) for v in value)
+                return "\n".join(rows)
+        return ",".join(encode_compact(v, decimals) for v in value)
+    return str(value)
+
+
+def compact_section(body: str) -> str:
+    """
+    섹션 본문을 표 형식으로 압축.
+
+    "- 키: 값" 글머리 라인들을 "키|키|...\\n값|값|..." 2행 표로 합친다.
+    나머지 라인은 빈 줄만 제거하고 유지.
+
+    Args:
+        body: 섹션 본문 (헤딩 제외)
+
+    Returns:
+        압축된 본문
+    """
+    keys: List[str] = []
+    values: List[str] = []
+    others: List[str] = []
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+        match = _BULLET_KV_PATTERN.match(line)
+        if match:
+            keys.append(match.group(1).strip())
+            values.append(match.group(2).strip())
+        else:
+            others.append(line.strip())
+
+    lines = list(others)
+    if len(keys) >= 2:
+        lines.append("|".join(keys))
+        lines.append("|".join(values))
+    elif keys:
+        lines.append(f"{keys[0]}: {values[0]}")
+    return "\n".join(lines)
+
+
+@dataclass
+class PromptSection:
+    """
+    프롬프트 섹션.
+
+    Attributes:
+        name: 헤딩 텍스트 (첫 헤딩 이전은 'preamble')
+        heading: 헤딩 라인 원문 (preamble은 빈 문자열)
+        body: 본문 (헤딩 다음 줄이 없으면 None)
+    """
+    name: str
+    heading: str
+    body: Optional[str]
+
+    def render(self) -> str:
+        """섹션 문자열"""
+        if not self.heading:
+            return self.body or ""
+        if self.body is None:
+            return self.heading
+        return f"{self.heading}\n{self.body}"
+
+
+@dataclass
+class PromptTokenReport:
+    """
+    섹션별 토큰 리포트.
+
+    Attributes:
+        prompt_name: 프롬프트 이름 (예: 'entry', 'openai_analysis')
+        budget: 토큰 예산 (None이면 무제한)
+        original_tokens: 예산 적용 전 토큰 수
+        total_tokens: 예산 적용 후 토큰 수
+        section_tokens: 섹션별 토큰 수 (예산 적용 후)
+        summarized: 압축된 섹션
+        dropped: 제거된 섹션
+        tokenizer: 사용한 토크나이저
+    """
+    prompt_name: str
+    budget: Optional[int]
+    original_tokens: int
+    total_tokens: int
+    section_tokens: Dict[str, int] = field(default_factory=dict)
+    summarized: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    tokenizer: str = "approx"
+
+    @property
+    def within_budget(self) -> bool:
+        """예산 이내 여부"""
+        return self.budget is None or self.total_tokens <= self.budget
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 변환"""
+        return {
+            "prompt_name": self.prompt_name,
+            "budget": self.budget,
+            "original_tokens": self.original_tokens,
+            "total_tokens": self.total_tokens,
+            "section_tokens": dict(self.section_tokens),
+            "summarized": list(self.summarized),
+            "dropped": list(self.dropped),
+            "within_budget": self.within_budget,
+            "tokenizer": self.tokenizer,
+        }
+
+
+@dataclass
+class BudgetedPrompt:
+    """예산 적용 결과 (프롬프트 + 리포트)"""
+    text: str
+    report: PromptTokenReport
+
+
+class PromptBudgeter:
+    """
+    토큰 예산 맞춤기.
+
+    section_priorities에 등록된 섹션만 선택(optional) 섹션이며,
+    값이 클수록 가치가 낮아 먼저 압축/제거된다. 우선순위 0 이하는
+    압축만 하고 제거하지 않는다.
+    등록되지 않은 섹션(시스템 규칙, 현재 상태, 요청 등)은 항상 유지된다.
+
+    예산 초과 시 단계:
+    1. 선택 섹션을 낮은 가치 순으로 표 형식 압축
+    2. 그래도 초과하면 낮은 가치 순으로 제거
+    """
+
+    def __init__(
+        self,
+        budget: Optional[int] = None,
+        section_priorities: Optional[Dict[str, int]] = None,
+        counter: Optional[TokenCounter] = None,
+        prompt_name: str = "prompt",
+    ):
+        """
+        Args:
+            budget: 토큰 예산 (None 또는 0이면 측정만 수행)
+            section_priorities: 섹션 이름 접두사 → 우선순위 (클수록 먼저 제거)
+            counter: 토큰 카운터 (기본: TokenCounter())
+            prompt_name: 리포트/메트릭용 프롬프트 이름
+        """
+        self.budget = budget or None
+        self.section_priorities = dict(section_priorities or {})
+        self.counter = counter or TokenCounter()
+        self.prompt_name = prompt_name
+        self.last_report: Optional[PromptTokenReport] = None
+
+    @staticmethod
+    def split_sections(text: str) -> List[PromptSection]:
+        """
+        마크다운 헤딩/수평선 기준 섹션 분할.
+
+        수평선(---) 뒤의 본문은 'separator' 섹션이 되어, 앞 섹션이 제거되어도
+        마무리 지시문은 유지된다.
+
+        Args:
+            text: 프롬프트
+
+        Returns:
+            섹션 리스트 (join하면 원문 복원)
+        """
+        sections: List[PromptSection] = []
+        name, heading, body = "preamble", "", []
+
+        def flush() -> None:
+            if heading or body:
+                sections.append(PromptSection(name, heading, "\n".join(body) if body else None))
+
+        for line in text.split("\n"):
+            match = _HEADING_PATTERN.match(line)
+            if match or _RULE_PATTERN.match(line):
+                flush()
+                name = match.group(1).strip().strip(":*").strip() if match else "separator"
+                heading, body = line, []
+            else:
+                body.append(line)
+        flush()
+        return sections
+
+    def _priority(self, section_name: str) -> Optional[int]:
+        for prefix, priority in self.section_priorities.items():
+            if section_name.startswith(prefix):
+                return priority
+        return None
+
+    def fit(self, text: str, budget: Optional[int] = None) -> BudgetedPrompt:
+        """
+        프롬프트를 예산에 맞춘다.
+
+        Args:
+            text: 렌더링된 프롬프트
+            budget: 이번 호출에만 적용할 예산 (기본: self.budget)
+
+        Returns:
+            BudgetedPrompt (텍스트 + 섹션별 토큰 리포트)
+        """
+        budget = budget or self.budget
+        sections = self.split_sections(text)
+        original_tokens = self.counter.count(text)
+        summarized: List[str] = []
+        dropped: List[str] = []
+
+        def assemble() -> str:
+            return "\n".join(s.render() for s in sections)
+
+        total = original_tokens
+        if budget is not None and total > budget:
+            optional: List[Tuple[int, int, PromptSection]] = []
+            for index, section in enumerate(sections):
+                priority = self._priority(section.name)
+                if priority is not None:
+                    optional.append((priority, index, section))
+            # 가치 낮은 순 (우선순위 큰 값 먼저, 같으면 뒤쪽 섹션 먼저)
+            optional.sort(key=lambda item: (-item[0], -item[1]))
+
+            for _, _, section in optional:
+                compacted = compact_section(section.body or "")
+                if compacted != section.body:
+                    section.body = compacted
+                    summarized.append(section.name)
+                    total = self.counter.count(assemble())
+                    if total <= budget:
+                        break
+
+            if total > budget:
+                for priority, _, section in optional:
+                    if priority <= 0:
+                        continue
+                    sections.remove(section)
+                    dropped.append(section.name)
+                    total = self.counter.count(assemble())
+                    if total <= budget:
+                        break
+
+        fitted = assemble() if (summarized or dropped) else text
+        report = PromptTokenReport(
+            prompt_name=self.prompt_name,
+            budget=budget,
+            original_tokens=original_tokens,
+            total_tokens=total,
+            section_tokens=self._section_tokens(sections),
+            summarized=summarized,
+            dropped=dropped,
+            tokenizer=self.counter.backend,
+        )
+        self.last_report = report
+        self._export(report)
+        return BudgetedPrompt(text=fitted, report=report)
+
+    def _section_tokens(self, sections: List[PromptSection]) -> Dict[str, int]:
+        """섹션별 토큰 수 (같은 이름은 합산)"""
+        tokens: Dict[str, int] = {}
+        for section in sections:
+            tokens[section.name] = tokens.get(section.name, 0) + self.counter.count(section.render())
+        return tokens
+
+    def _export(self, report: PromptTokenReport) -> None:
+        """리포트 로깅 + Prometheus 메트릭"""
+        if report.summarized or report.dropped:
+            logger.info(
+                f"프롬프트 예산 적용 [{report.prompt_name}]: "
+                f"{report.original_tokens} → {report.total_tokens} tokens "
+                f"(budget={report.budget}, 압축={report.summarized}, 제거={report.dropped})"
+            )
+        else:
+            logger.debug(
+                f"프롬프트 토큰 [{report.prompt_name}]: {report.total_tokens} tokens "
+                f"{report.section_tokens}"
+            )
+
+        try:
+            from backend.app.services.metrics import record_prompt_tokens
+            record_prompt_tokens(
+                prompt_name=report.prompt_name,
+                total_tokens=report.total_tokens,
+                section_tokens=report.section_tokens,
+            )
+        except Exception:
+            pass  # 메트릭 실패는 무시
+
+
+class TokenBudgetPromptAdapter(PromptPort):
+    """
+    토큰 예산 프롬프트 어댑터.
+
+    내부 PromptPort(기본 YAMLPromptAdapter)의 render_prompt 결과에
+    압축 표기 + 예산 맞춤을 적용한다 (예산이 있을 때만). 나머지 메서드는 위임.
+    """
+
+    # YAML 템플릿 섹션 우선순위 (클수록 먼저 압축/제거)
+    DEFAULT_SECTION_PRIORITIES = {
+        "Backtest Summary": 3,
+        "Risk Context": 2,
+        "Market Summary": 0,  # 압축만 (시장 국면)
+        "Technical Indicators": 0,  # 압축만 (핵심 지표)
+    }
+
+    def __init__(
+        self,
+        inner: PromptPort,
+        budget: Optional[int] = None,
+        section_priorities: Optional[Dict[str, int]] = None,
+        counter: Optional[TokenCounter] = None,
+        decimals: int = 2,
+    ):
+        """
+        Args:
+            inner: 실제 템플릿 렌더러 (YAMLPromptAdapter)
+            budget: 토큰 예산 (None이면 측정만)
+            section_priorities: 섹션 우선순위 (기본: DEFAULT_SECTION_PRIORITIES)
+            counter: 토큰 카운터
+            decimals: 압축 표기 소수 자릿수
+        """
+        self._inner = inner
+        self._decimals = decimals
+        self._budgeter = PromptBudgeter(
+            budget=budget,
+            section_priorities=section_priorities if section_priorities is not None else self.DEFAULT_SECTION_PRIORITIES,
+            counter=counter,
+        )
+
+    @property
+    def last_report(self) -> Optional[PromptTokenReport]:
+        """마지막 render_prompt 호출의 토큰 리포트"""
+        return self._budgeter.last_report
+
+    async def get_prompt(self, prompt_type: PromptType, version: Optional[str] = None) -> str:
+        return await self._inner.get_prompt(prompt_type, version)
+
+    async def get_current_version(self, prompt_type: PromptType) -> PromptVersion:
+        return await self._inner.get_current_version(prompt_type)
+
+    async def render_prompt(
+        self,
+        prompt_type: PromptType,
+        context: Dict[str, Any],
+        version: Optional[str] = None,
+        budget: Optional[int] = None,
+    ) -> str:
+        """
+        압축 표기 + 예산 맞춤 렌더링.
+
+        예산이 없으면(None/0) 압축 없이 내부 렌더러 결과를 그대로 반환하고 토큰만 측정한다.
+
+        Args:
+            prompt_type: 프롬프트 유형
+            context: 컨텍스트 데이터 (숫자/dict/list는 압축 표기)
+            version: 버전
+            budget: 이번 호출에만 적용할 예산
+
+        Returns:
+            예산에 맞춘 프롬프트
+        """
+        if (budget or self._budgeter.budget) is not None:
+            context = {
+                key: value if isinstance(value, str) else encode_compact(value, self._decimals)
+                for key, value in context.items()
+            }
+        rendered = await self._inner.render_prompt(prompt_type, context, version)
+        self._budgeter.prompt_name = prompt_type.value
+        return self._budgeter.fit(rendered, budget=budget).text
+
+    async def list_versions(self, prompt_type: PromptType) -> List[str]:
+        return await self._inner.list_versions(prompt_type)
+
+    async def validate_prompt(self, prompt: str) -> bool:
+        return await self._inner.validate_prompt(prompt)
@@ -109,15 +109,19 @@ class PortfolioManager:
         self,
         exchange_client: IExchangeClient,
         max_positions: int = MAX_POSITIONS,
-        max_allocation_per_coin: float = MAX_ALLOCATION_PER_COIN
+        max_allocation_per_coin: float = MAX_ALLOCATION_PER_COIN,
+        positions: Optional[List[Any]] = None
     ):
         """
         Args:
             exchange_client: 거래소 클라이언트
             max_positions: 최대 동시 포지션 수
             max_allocation_per_coin: 코인당 최대 자본 비율
+            positions: 영속 포지션 인덱스의 포지션 목록 (domain Position).
+                주어지면 거래소 잔고 조회 대신 사용하고 현재가는 일괄 1회 조회합니다.
         """
         self.exchange = exchange_client
+        self._local_positions = positions
         self.position_service = PositionService(exchange_client)
         self.max_positions = max_positions
         self.max_allocation_per_coin = max_allocation_per_coin
@@ -142,10 +146,16 @@ class PortfolioManager:
         if krw_balance is None:
             krw_balance = 0.0
 
-        # 전체 잔고 조회
-        balances = self.exchange.get_balances()
-        if not balances:
-            balances = []
+        # 전체 잔고 조회 (로컬 포지션이 있으면 거래소 잔고 대신 사용)
+        if self._local_positions is not None:
+            balances = self._local_balances()
+            prices = self._fetch_local_prices(balances, tickers)
+            get_price = prices.get
+        else:
+            balances = self.exchange.get_balances()
+            if not balances:
+                balances = []
+            get_price = self.exchange.get_current_price
 
         # 포지션 목록 구성
         positions: List[PortfolioPosition] = []
@@ -170,7 +180,7 @@ class PortfolioManager:
             if tickers and ticker not in tickers:
                 continue
 
-            current_price = self.exchange.get_current_price(ticker)
+            current_price = get_price(ticker)
             if current_price is None or current_price <= 0:
                 continue
 
@@ -207,8 +217,7 @@ class PortfolioManager:
         )
 
         # 포지션당 자본
-        remaining_slots = self.max_positions - len(positions)
-        capital_per_position = available_capital / remaining_slots if remaining_slots > 0 else 0
+        capital_per_position = self.split_available_capital(available_capital, len(positions))
 
         return PortfolioStatus(
             positions=positions,
@@ -224,6 +233,32 @@ class PortfolioManager:
             capital_per_position=capital_per_position
         )
 
+    def _local_balances(self) -> List[Dict[str, Any]]:
+        """로컬 포지션을 거래소 잔고 형식으로 변환"""
+        return [
+            {
+                'currency': position.symbol,
+                'balance': str(position.volume),
+                'locked': '0',
+                'avg_buy_price': str(position.avg_entry_price.amount),
+            }
+            for position in self._local_positions
+            if position.volume > 0
+        ]
+
+    def _fetch_local_prices(
+        self,
+        balances: List[Dict[str, Any]],
+        tickers: Optional[List[str]]
+    ) -> Dict[str, float]:
+        """로컬 포지션 티커의 현재가 일괄 조회"""
+        from src.application.services.portfolio_snapshot import fetch_prices
+
+        held = [f"KRW-{balance['currency']}" for balance in balances]
+        if tickers:
+            held = [ticker for ticker in held if ticker in tickers]
+        return fetch_prices(self.exchange, held)
+
     def _determine_trading_mode(
         self,
         positions: List[PortfolioPosition],
@@ -298,6 +333,45 @@ class PortfolioManager:
 
         return max(0, available)
 
+    def split_available_capital(self, available_capital: float, position_count: int) -> float:
+        """
+        가용 자본을 남은 슬롯 수로 나눈 포지션당 자본
+
+        Args:
+            available_capital: 신규 진입에 사용 가능한 자본
+            position_count: 현재 포지션 수
+
+        Returns:
+            포지션당 자본 (남은 슬롯 없으면 0)
+        """
+        remaining_slots = self.max_positions - position_count
+        return available_capital / remaining_slots if remaining_slots > 0 else 0
+
+    def calculate_entry_capital(
+        self,
+        krw_balance: float,
+        total_capital: float,
+        position_count: int
+    ) -> float:
+        """
+        잔고 값만으로 신규 진입 자본 계산 (거래소 조회 없음)
+
+        백테스트처럼 잔고를 직접 관리하는 곳에서 실거래와 같은 사이징을 쓰기 위한 진입점입니다.
+        서킷 브레이커는 반영하지 않습니다.
+
+        Args:
+            krw_balance: 현금 잔고
+            total_capital: 총 자본 (현금 + 포지션 평가액)
+            position_count: 현재 포지션 수
+
+        Returns:
+            진입에 사용할 자본 (KRW, 진입 불가 시 0)
+        """
+        if position_count >= self.max_positions or krw_balance < self.MIN_POSITION_VALUE:
+            return 0.0
+        available = self._calculate_available_capital(krw_balance, total_capital, position_count)
+        return self.split_available_capital(available, position_count)
+
     def get_position(self, ticker: str) -> Optional[PortfolioPosition]:
         """특정 코인의 포지션 조회"""
         status = self.get_portfolio_status([ticker])
@@ -308,11 +382,15 @@ class PortfolioManager:
 
     def has_position(self, ticker: str) -> bool:
         """특정 코인 포지션 보유 여부"""
+        if self._local_positions is not None:
+            return ticker in self.get_position_tickers()
         position = self.get_position(ticker)
         return position is not None
 
     def get_position_tickers(self) -> List[str]:
-        """보유 중인 코인 티커 리스트"""
+        """보유 중인 코인 티커 리스트 (로컬 포지션이 있으면 거래소 조회 없음)"""
+        if self._local_positions is not None:
+            return [position.ticker for position in self._local_positions if position.volume > 0]
         status = self.get_portfolio_status()
         return [pos.ticker for pos in status.positions]
 
@@ -387,9 +465,15 @@ class PortfolioManager:
             return f"주간 손실 한도 도달 ({self._weekly_pnl*100:.2f}% ≤ {self.PORTFOLIO_WEEKLY_LOSS_LIMIT*100:.2f}%)"
         return ""
 
-    def print_portfolio_summary(self) -> None:
-        """포트폴리오 요약 출력"""
-        status = self.get_portfolio_status()
+    def print_portfolio_summary(self, status: Optional[PortfolioStatus] = None) -> None:
+        """
+        포트폴리오 요약 출력
+
+        Args:
+            status: 이미 조회한 포트폴리오 상태 (None이면 새로 조회)
+        """
+        if status is None:
+            status = self.get_portfolio_status()
 
         Logger.print_header("📊 포트폴리오 현황")
         print(f"  거래 모드: {status.trading_mode.value}")
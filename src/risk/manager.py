@@ -58,31 +58,14 @@ class RiskManager:
 
         Args:
             limits: 리스크 한도 설정
-            persist_state: 상태 영속성 사용 여부 (True: JSON 파일로 저장/로드)
+            persist_state: 상태 영속성 사용 여부 (True: 리스크 상태 저장소로 저장/로드)
         """
         self.limits = limits or RiskLimits()
         self.persist_state = persist_state
 
         # 상태 로드
         if persist_state:
-            state = RiskStateManager.load_state()
-            self.daily_pnl = state.get('daily_pnl', 0.0)
-            self.daily_trade_count = state.get('daily_trade_count', 0)
-            self.safe_mode = state.get('safe_mode', False)
-            self.safe_mode_reason = state.get('safe_mode_reason', '')
-
-            # last_trade_time 파싱
-            last_trade_str = state.get('last_trade_time')
-            if last_trade_str:
-                try:
-                    self.last_trade_time = datetime.fromisoformat(last_trade_str)
-                except (ValueError, TypeError):
-                    self.last_trade_time = None
-            else:
-                self.last_trade_time = None
-
-            # weekly_pnl 계산 (최근 7일간 합계)
-            self.weekly_pnl = RiskStateManager.calculate_weekly_pnl()
+            self._load_persisted_state()
         else:
             # 영속성 사용 안 함 (테스트용)
             self.last_trade_time: Optional[datetime] = None
@@ -96,6 +79,35 @@ class RiskManager:
         self.trailing_stop_price: Optional[float] = None
         self.highest_price_since_entry: Optional[float] = None
 
+    def _load_persisted_state(self):
+        """저장소(메모리 캐시)에서 오늘 상태 로드"""
+        state = RiskStateManager.load_state()
+        self.daily_pnl = state.get('daily_pnl', 0.0)
+        self.daily_trade_count = state.get('daily_trade_count', 0)
+        self.safe_mode = state.get('safe_mode', False)
+        self.safe_mode_reason = state.get('safe_mode_reason', '')
+
+        # last_trade_time 파싱
+        last_trade_str = state.get('last_trade_time')
+        if last_trade_str:
+            try:
+                self.last_trade_time = datetime.fromisoformat(last_trade_str)
+            except (ValueError, TypeError):
+                self.last_trade_time = None
+        else:
+            self.last_trade_time = None
+
+        # weekly_pnl 계산 (최근 7일간 합계)
+        self.weekly_pnl = RiskStateManager.calculate_weekly_pnl()
+        self._state_version = RiskStateManager.get_store().version
+
+    def _sync_state(self):
+        """다른 프로세스(텔레그램 봇 등)의 상태 변경이 있으면 반영"""
+        if not self.persist_state:
+            return
+        if RiskStateManager.get_store().refresh() != self._state_version:
+            self._load_persisted_state()
+
     def check_position_limits(
         self,
         position: Optional[Dict[str, Any]],
@@ -153,6 +165,8 @@ class RiskManager:
                 'weekly_pnl': float
             }
         """
+        self._sync_state()
+
         # 일일 손실 한도 체크
         if self.daily_pnl <= self.limits.daily_loss_limit_pct:
             self.enable_safe_mode(f"일일 손실 한도 초과: {self.daily_pnl:.2f}%")
@@ -191,6 +205,8 @@ class RiskManager:
                 'hours_since_last_trade': float
             }
         """
+        self._sync_state()
+
         if not self.last_trade_time:
             return {
                 'allowed': True,
@@ -269,9 +285,12 @@ class RiskManager:
         self.safe_mode_reason = reason
         Logger.print_error(f"⛔ 안전 모드 활성화: {reason}")
 
-        # 상태 저장
+        # 상태 저장 (안전 모드 필드만)
         if self.persist_state:
-            self._save_state()
+            RiskStateManager.save_state({
+                'safe_mode': self.safe_mode,
+                'safe_mode_reason': self.safe_mode_reason,
+            })
 
     def disable_safe_mode(self):
         """안전 모드 해제"""
@@ -279,25 +298,42 @@ class RiskManager:
         self.safe_mode_reason = ""
         Logger.print_success("✅ 안전 모드 해제")
 
+        # 상태 저장 (저장하지 않으면 _sync_state/재시작 시 안전 모드가 되살아남)
+        if self.persist_state:
+            RiskStateManager.save_state({
+                'safe_mode': False,
+                'safe_mode_reason': '',
+            })
+            self._load_persisted_state()
+
     def record_trade(self, pnl_pct: float):
         """거래 기록 및 손익 업데이트"""
-        self.last_trade_time = datetime.now()
-        self.daily_trade_count += 1
-        self.daily_pnl += pnl_pct
-        self.weekly_pnl += pnl_pct
+        if self.persist_state:
+            # 증분 이벤트로 기록 후 저장소 상태(다른 프로세스 기록 포함) 반영
+            RiskStateManager.record_trade(pnl_pct)
+            self._load_persisted_state()
+        else:
+            self.last_trade_time = datetime.now()
+            self.daily_trade_count += 1
+            self.daily_pnl += pnl_pct
+            self.weekly_pnl += pnl_pct
 
         Logger.print_info(f"📝 거래 기록: 손익 {pnl_pct:+.2f}% | 일일 누적: {self.daily_pnl:+.2f}%")
 
-        # 상태 저장
-        if self.persist_state:
-            self._save_state()
-
     def reset_daily_stats(self):
         """일일 통계 초기화 (매일 자정 실행)"""
         self.daily_trade_count = 0
         self.daily_pnl = 0.0
         Logger.print_info("🔄 일일 통계 초기화")
 
+        # 상태 저장 (일일 필드만)
+        if self.persist_state:
+            RiskStateManager.save_state({
+                'daily_pnl': 0.0,
+                'daily_trade_count': 0,
+            })
+            self._load_persisted_state()
+
     def reset_weekly_stats(self):
         """주간 통계 초기화 (매주 월요일 실행)"""
         self.weekly_pnl = 0.0
@@ -307,18 +343,6 @@ class RiskManager:
         if self.persist_state:
             RiskStateManager.reset_weekly_state()
 
-    def _save_state(self):
-        """현재 상태를 JSON 파일에 저장"""
-        state = {
-            'daily_pnl': self.daily_pnl,
-            'daily_trade_count': self.daily_trade_count,
-            'last_trade_time': self.last_trade_time.isoformat() if self.last_trade_time else None,
-            'weekly_pnl': self.weekly_pnl,
-            'safe_mode': self.safe_mode,
-            'safe_mode_reason': self.safe_mode_reason
-        }
-        RiskStateManager.save_state(state)
-
     def calculate_stop_loss_price(
         self,
         entry_price: float,
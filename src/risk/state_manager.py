@@ -8,15 +8,17 @@
 - weekly_pnl: 주간 손익률 누적
 
 지원 스토리지:
-- PostgreSQL (RiskStateRepository 사용) - 권장
-- JSON 파일 (DEPRECATED, 하위 호환용)
+- PostgreSQL (RiskStateRepository 사용, async API) - 권장
+- 로컬 RiskStateStore (SQLite WAL, sync API) - 거래마다 이벤트 1행 추가,
+  조회는 메모리 캐시 (다른 프로세스 변경은 자동 반영)
+- JSON 파일 (DEPRECATED, 저장소 최초 생성 시 1회 가져옴)
 """
-import json
 from pathlib import Path
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 from decimal import Decimal
 from typing import Dict, Optional, TYPE_CHECKING
 from ..utils.logger import Logger
+from .state_store import RiskStateStore, default_state
 
 if TYPE_CHECKING:
     from src.infrastructure.adapters.persistence.risk_state_repository import RiskStateRepository
@@ -27,15 +29,18 @@ class RiskStateManager:
     리스크 상태 관리자
 
     PostgreSQL Repository 사용 권장 (set_repository로 설정)
-    JSON 파일은 DEPRECATED이며 하위 호환용으로만 유지됩니다.
+    동기 API는 로컬 RiskStateStore(SQLite WAL, append-only + 메모리 캐시)를 사용합니다.
     """
 
-    # DEPRECATED: JSON 파일 기반 저장 (하위 호환용)
+    # DEPRECATED: JSON 파일 기반 저장 (기존 파일은 저장소 최초 생성 시 가져옴)
     STATE_FILE = Path("data/risk_state.json")
 
     # Repository 인스턴스 (PostgreSQL 사용 시)
     _repository: Optional["RiskStateRepository"] = None
 
+    # 로컬 저장소 (STATE_FILE 옆 .db 파일, 경로별 1개)
+    _store: Optional[RiskStateStore] = None
+
     @classmethod
     def set_repository(cls, repository: "RiskStateRepository") -> None:
         """
@@ -47,10 +52,20 @@ class RiskStateManager:
         cls._repository = repository
         Logger.print_info("🗄️ RiskStateManager: PostgreSQL Repository 설정됨")
 
+    @classmethod
+    def get_store(cls) -> RiskStateStore:
+        """로컬 상태 저장소 (STATE_FILE 경로가 바뀌면 다시 엶)"""
+        path = cls.STATE_FILE.with_suffix(".db")
+        if cls._store is None or cls._store.path != path:
+            if cls._store is not None:
+                cls._store.close()
+            cls._store = RiskStateStore(path, legacy_json=cls.STATE_FILE)
+        return cls._store
+
     @staticmethod
     def save_state(state: Dict) -> None:
         """
-        상태 저장
+        상태 저장 (주어진 필드 덮어쓰기)
 
         Args:
             state: 저장할 상태 딕셔너리
@@ -63,31 +78,20 @@ class RiskStateManager:
                     'safe_mode_reason': str
                 }
         """
-        # 디렉토리 생성
-        RiskStateManager.STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-        # 기존 상태 로드
-        existing_state = RiskStateManager.load_all_states()
+        RiskStateManager.get_store().put_state(state)
+        Logger.print_info(f"📝 리스크 상태 저장 완료: {datetime.now().date().isoformat()}")
 
-        # 오늘 날짜 키로 저장
-        today = datetime.now().date().isoformat()
-        existing_state[today] = {
-            **state,
-            'updated_at': datetime.now().isoformat()
-        }
-
-        # 7일 이전 데이터 삭제 (주간 손실 계산용으로 최소 7일 유지)
-        cutoff = (datetime.now() - timedelta(days=7)).date().isoformat()
-        existing_state = {
-            k: v for k, v in existing_state.items()
-            if k >= cutoff
-        }
+    @staticmethod
+    def record_trade(pnl_pct: float) -> None:
+        """
+        거래 1건 증분 기록
 
-        # 파일에 저장
-        with open(RiskStateManager.STATE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(existing_state, f, indent=2, ensure_ascii=False, default=str)
+        전체 상태를 덮어쓰지 않으므로 다른 프로세스의 동시 기록과 충돌하지 않습니다.
 
-        Logger.print_info(f"📝 리스크 상태 저장 완료: {today}")
+        Args:
+            pnl_pct: 거래 손익률 (%)
+        """
+        RiskStateManager.get_store().record_trade(pnl_pct)
 
     @staticmethod
     def load_state() -> Dict:
@@ -97,26 +101,15 @@ class RiskStateManager:
         Returns:
             오늘 날짜의 상태 딕셔너리 (없으면 기본값)
         """
-        all_states = RiskStateManager.load_all_states()
         today = datetime.now().date().isoformat()
+        state = RiskStateManager.get_store().get_state(today)
 
-        if today in all_states:
-            state = all_states[today]
+        if state is not None:
             Logger.print_info(f"📂 리스크 상태 로드: {today}")
             return state
 
-        # 오늘 날짜 상태가 없으면 기본값 반환
-        default_state = {
-            'daily_pnl': 0.0,
-            'daily_trade_count': 0,
-            'last_trade_time': None,
-            'weekly_pnl': 0.0,
-            'safe_mode': False,
-            'safe_mode_reason': ''
-        }
-
         Logger.print_info(f"📂 리스크 상태 없음, 기본값 사용: {today}")
-        return default_state
+        return default_state()
 
     @staticmethod
     def load_all_states() -> Dict:
@@ -126,15 +119,7 @@ class RiskStateManager:
         Returns:
             날짜별 상태 딕셔너리 {날짜: 상태}
         """
-        if not RiskStateManager.STATE_FILE.exists():
-            return {}
-
-        try:
-            with open(RiskStateManager.STATE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            Logger.print_error(f"❌ 리스크 상태 파일 로드 실패: {e}")
-            return {}
+        return RiskStateManager.get_store().get_all_states()
 
     @staticmethod
     def reset_daily_state() -> None:
@@ -144,13 +129,12 @@ class RiskStateManager:
         daily_pnl과 daily_trade_count만 초기화하고,
         weekly_pnl은 유지합니다.
         """
-        state = RiskStateManager.load_state()
-        state['daily_pnl'] = 0.0
-        state['daily_trade_count'] = 0
-        state['safe_mode'] = False
-        state['safe_mode_reason'] = ''
-
-        RiskStateManager.save_state(state)
+        RiskStateManager.save_state({
+            'daily_pnl': 0.0,
+            'daily_trade_count': 0,
+            'safe_mode': False,
+            'safe_mode_reason': '',
+        })
         Logger.print_info("🔄 일일 리스크 상태 초기화 완료")
 
     @staticmethod
@@ -160,10 +144,7 @@ class RiskStateManager:
 
         weekly_pnl을 초기화합니다.
         """
-        state = RiskStateManager.load_state()
-        state['weekly_pnl'] = 0.0
-
-        RiskStateManager.save_state(state)
+        RiskStateManager.save_state({'weekly_pnl': 0.0})
         Logger.print_info("🔄 주간 리스크 상태 초기화 완료")
 
     @staticmethod
@@ -174,19 +155,7 @@ class RiskStateManager:
         Returns:
             주간 손익률 합계
         """
-        all_states = RiskStateManager.load_all_states()
-
-        # 최근 7일 날짜 생성
-        today = datetime.now().date()
-        week_dates = [(today - timedelta(days=i)).isoformat() for i in range(7)]
-
-        # 최근 7일간의 daily_pnl 합계
-        weekly_pnl = sum(
-            all_states.get(date, {}).get('daily_pnl', 0.0)
-            for date in week_dates
-        )
-
-        return weekly_pnl
+        return RiskStateManager.get_store().daily_pnl_sum(days=7)
 
     # --- Async 메서드 (PostgreSQL Repository 사용) ---
 
@@ -241,18 +210,8 @@ class RiskStateManager:
             Logger.print_info(f"📂 리스크 상태 로드 (DB): {today}")
             return record.to_dict()
 
-        # 기본값 반환
-        default_state = {
-            'daily_pnl': 0.0,
-            'daily_trade_count': 0,
-            'last_trade_time': None,
-            'weekly_pnl': 0.0,
-            'safe_mode': False,
-            'safe_mode_reason': ''
-        }
-
         Logger.print_info(f"📂 리스크 상태 없음 (DB), 기본값 사용: {today}")
-        return default_state
+        return default_state()
 
     @classmethod
     async def calculate_weekly_pnl_async(cls) -> float:
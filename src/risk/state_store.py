@@ -0,0 +1,302 @@
+"""
+리스크 상태 저장소 (SQLite WAL, append-only)
+
+RiskStateManager의 JSON 파일 전체 재작성을 대체합니다.
+
+- 저장: 상태 변경을 이벤트 1행으로 추가 (INSERT만, 파일 재작성 없음)
+  - set: 필드 덮어쓰기 (부분 갱신 가능)
+  - trade: 거래 1건의 손익 증분 (daily_pnl/daily_trade_count/last_trade_time)
+  증분 이벤트는 서로 덮어쓰지 않으므로 여러 프로세스(스케줄러/텔레그램 봇)가
+  동시에 거래를 기록해도 갱신이 유실되지 않습니다.
+- 조회: 날짜별 상태를 메모리에 캐시. 다른 프로세스의 변경은
+  PRAGMA data_version(다른 연결이 커밋하면 값이 바뀜)으로 감지하여
+  새 이벤트만 읽어 반영합니다. 변경이 없으면 조회는 메모리 읽기입니다.
+- 보관: 주간 손익 계산용으로 최근 RETENTION_DAYS일만 유지
+
+기존 data/risk_state.json이 있으면 최초 1회 가져옵니다.
+"""
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..utils.logger import Logger
+
+RETENTION_DAYS = 7
+
+DEFAULT_STATE: Dict[str, Any] = {
+    'daily_pnl': 0.0,
+    'daily_trade_count': 0,
+    'last_trade_time': None,
+    'weekly_pnl': 0.0,
+    'safe_mode': False,
+    'safe_mode_reason': '',
+}
+
+EVENT_SET = "set"
+EVENT_TRADE = "trade"
+
+
+def default_state() -> Dict[str, Any]:
+    """기본 상태 (새 dict)"""
+    return dict(DEFAULT_STATE)
+
+
+class RiskStateStore:
+    """
+    날짜별 리스크 상태 저장소
+
+    한 프로세스 안에서는 스레드 안전하며, 같은 파일을 여는
+    다른 프로세스와는 SQLite 잠금으로 쓰기가 직렬화됩니다.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        legacy_json: Optional[Path] = None,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로
+            legacy_json: 최초 생성 시 가져올 기존 JSON 상태 파일
+            busy_timeout_ms: 다른 프로세스가 쓰는 중일 때 대기 시간
+        """
+        self.path = Path(path)
+        self._legacy_json = Path(legacy_json) if legacy_json is not None else None
+        self._busy_timeout_ms = int(busy_timeout_ms)
+
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._last_seq = 0
+        self._data_version: Optional[int] = None
+        self._pruned_for: Optional[str] = None
+
+        # 파일이 없으면 첫 기록 시점까지 생성을 미룸 (조회만 하는 프로세스는 파일을 만들지 않음)
+        self._connect(create=False)
+
+    def _connect(self, create: bool) -> bool:
+        """연결 (create=False면 저장할 파일이 있을 때만)"""
+        if self._conn is not None:
+            return True
+        has_legacy = self._legacy_json is not None and self._legacy_json.exists()
+        if not create and not self.path.exists() and not has_legacy:
+            return False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS risk_state_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                state_date TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_risk_state_events_date "
+            "ON risk_state_events (state_date)"
+        )
+        self._conn = conn
+
+        if has_legacy:
+            self._import_legacy(self._legacy_json)
+        self._catch_up()
+        return True
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        """반영된 마지막 이벤트 번호 (변경 감지용)"""
+        return self._last_seq
+
+    def refresh(self) -> int:
+        """
+        다른 프로세스의 변경 반영
+
+        Returns:
+            반영 후 version
+        """
+        with self._lock:
+            if not self._connect(create=False):
+                return self._last_seq
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                self._catch_up()
+            return self._last_seq
+
+    def get_state(self, day: Optional[Union[str, date]] = None) -> Optional[Dict[str, Any]]:
+        """
+        날짜 상태 조회 (없으면 None)
+
+        Args:
+            day: 날짜 (기본: 오늘)
+        """
+        self.refresh()
+        state = self._states.get(self._key(day))
+        return dict(state) if state is not None else None
+
+    def get_all_states(self) -> Dict[str, Dict[str, Any]]:
+        """보관 중인 모든 날짜 상태 {날짜: 상태}"""
+        self.refresh()
+        return {key: dict(state) for key, state in self._states.items()}
+
+    def daily_pnl_sum(self, days: int = RETENTION_DAYS, today: Optional[date] = None) -> float:
+        """최근 days일 daily_pnl 합계"""
+        self.refresh()
+        today = today or datetime.now().date()
+        return sum(
+            self._states.get((today - timedelta(days=i)).isoformat(), {}).get('daily_pnl', 0.0)
+            for i in range(days)
+        )
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def put_state(self, state: Dict[str, Any], day: Optional[Union[str, date]] = None) -> int:
+        """
+        상태 필드 덮어쓰기 (주어진 키만)
+
+        Returns:
+            기록된 이벤트 번호
+        """
+        return self._append(self._key(day), EVENT_SET, state)
+
+    def record_trade(self, pnl_pct: float, at: Optional[datetime] = None) -> int:
+        """
+        거래 1건 증분 기록
+
+        Args:
+            pnl_pct: 거래 손익률 (%)
+            at: 거래 시각 (기본: 현재)
+
+        Returns:
+            기록된 이벤트 번호
+        """
+        at = at or datetime.now()
+        return self._append(
+            at.date().isoformat(),
+            EVENT_TRADE,
+            {'pnl_pct': float(pnl_pct), 'at': at.isoformat()},
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(day: Optional[Union[str, date]]) -> str:
+        if day is None:
+            return datetime.now().date().isoformat()
+        return day if isinstance(day, str) else day.isoformat()
+
+    def _append(self, key: str, kind: str, payload: Dict[str, Any]) -> int:
+        with self._lock:
+            self._connect(create=True)
+            cursor = self._conn.execute(
+                "INSERT INTO risk_state_events (state_date, kind, payload, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, kind, json.dumps(payload, ensure_ascii=False, default=str),
+                 datetime.now().isoformat()),
+            )
+            seq = cursor.lastrowid
+            self._prune()
+            # 다른 프로세스 이벤트까지 순서대로 반영
+            self._catch_up()
+            return seq
+
+    def _catch_up(self) -> None:
+        """last_seq 이후 이벤트를 순서대로 캐시에 반영"""
+        # SELECT 전에 읽어야 그 사이 커밋된 변경을 다음 refresh에서 놓치지 않음
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        rows = self._conn.execute(
+            "SELECT seq, state_date, kind, payload FROM risk_state_events "
+            "WHERE seq > ? ORDER BY seq",
+            (self._last_seq,),
+        ).fetchall()
+        for seq, key, kind, payload in rows:
+            self._apply(key, kind, json.loads(payload))
+            self._last_seq = seq
+
+        cutoff = self._cutoff()
+        for key in [k for k in self._states if k < cutoff]:
+            del self._states[key]
+
+    def _apply(self, key: str, kind: str, payload: Dict[str, Any]) -> None:
+        state = self._states.setdefault(key, default_state())
+        if kind == EVENT_TRADE:
+            state['daily_pnl'] = state.get('daily_pnl', 0.0) + payload['pnl_pct']
+            state['daily_trade_count'] = state.get('daily_trade_count', 0) + 1
+            state['weekly_pnl'] = state.get('weekly_pnl', 0.0) + payload['pnl_pct']
+            state['last_trade_time'] = payload['at']
+        else:
+            state.update(payload)
+        state['updated_at'] = datetime.now().isoformat()
+
+    @staticmethod
+    def _cutoff() -> str:
+        return (datetime.now() - timedelta(days=RETENTION_DAYS)).date().isoformat()
+
+    def _prune(self) -> None:
+        """보관 기간이 지난 이벤트 삭제 (하루 1회)"""
+        cutoff = self._cutoff()
+        if self._pruned_for == cutoff:
+            return
+        self._conn.execute("DELETE FROM risk_state_events WHERE state_date < ?", (cutoff,))
+        self._pruned_for = cutoff
+
+    def _import_legacy(self, legacy_json: Path) -> None:
+        """이벤트가 없을 때 기존 JSON 상태 파일 가져오기"""
+        if not legacy_json.exists():
+            return
+        try:
+            with open(legacy_json, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            Logger.print_error(f"❌ 리스크 상태 파일 로드 실패: {e}")
+            return
+
+        cutoff = self._cutoff()
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 다른 프로세스가 먼저 가져왔으면 생략
+                if self._conn.execute("SELECT 1 FROM risk_state_events LIMIT 1").fetchone():
+                    self._conn.execute("ROLLBACK")
+                    return
+                for key in sorted(legacy):
+                    if key < cutoff or not isinstance(legacy[key], dict):
+                        continue
+                    payload = {k: v for k, v in legacy[key].items() if k != 'updated_at'}
+                    self._conn.execute(
+                        "INSERT INTO risk_state_events (state_date, kind, payload, created_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, EVENT_SET, json.dumps(payload, ensure_ascii=False, default=str), now),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        Logger.print_info(f"📂 기존 리스크 상태 파일 가져옴: {legacy_json}")
@@ -9,6 +9,7 @@
 - HistoricalDataSync: 과거 데이터 동기화
 - MultiCoinBacktest: 병렬 백테스팅
 - CoinSelector: 최종 코인 선택
+- ScanPolicyReplay: 선택 정책의 과거 시점별 재생
 
 사용 예시:
     from src.scanner import CoinSelector
@@ -37,6 +38,11 @@ from src.scanner.coin_selector import (
     CoinCandidate,
     ScanResult
 )
+from src.scanner.scan_replay import (
+    ScanPolicyReplay,
+    ScanReplayResult,
+    RollingBacktestMetrics
+)
 
 __all__ = [
     # 유동성 스캐너
@@ -53,4 +59,8 @@ __all__ = [
     'CoinSelector',
     'CoinCandidate',
     'ScanResult',
+    # 시점별 스캔 재생
+    'ScanPolicyReplay',
+    'ScanReplayResult',
+    'RollingBacktestMetrics',
 ]
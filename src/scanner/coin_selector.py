@@ -4,20 +4,25 @@
 유동성 스캔 → Research Pass → Trading Pass 전체 흐름을 조율합니다.
 
 주요 기능:
-- 유동성 상위 코인 스캔
+- 유동성 상위 코인 스캔 (또는 2단 스캔: 전체 마켓 사전 필터 → 상위 생존 코인)
 - 섹터별 분산 선택 (포트폴리오 다양성 확보)
 - 병렬 백테스팅 필터링 (Research Pass - 느슨한 기준)
 - Trading Pass 최종 검증 (엄격한 기준 + Expectancy)
 - 최종 진입 코인 선택
+- 증분 재채점: 새 일봉이나 유동성 순위 변화가 있는 코인만 재평가, 나머지는 이전 결과 재사용
+- 몬테카를로 게이트: Trading Pass 통과 코인의 거래 순서 재표본 파산 확률 검증 (선택)
 
 ⚠️ 2026-01-04 변경: EntryAnalyzer 제거 (Clean Architecture 마이그레이션)
 - AI 진입 분석 단계 제거됨
 - 백테스팅 통과 코인을 직접 Trading Pass로 검증
 """
 import asyncio
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Set, Tuple, TYPE_CHECKING
+
+import pandas as pd
 
 if TYPE_CHECKING:
     # Type checking을 위한 임시 타입 (실제로는 사용되지 않음)
@@ -28,8 +33,9 @@ else:
     EntrySignal = None
 
 from src.scanner.liquidity_scanner import LiquidityScanner, CoinInfo
-from src.scanner.data_sync import HistoricalDataSync
+from src.scanner.data_sync import HistoricalDataSync, SyncStatus
 from src.scanner.multi_backtest import MultiCoinBacktest, BacktestScore, MultiBacktestConfig
+from src.scanner.universe_prefilter import UniversePrefilter
 from src.scanner.sector_mapping import (
     SectorDiversifier,
     get_coin_sector,
@@ -38,6 +44,8 @@ from src.scanner.sector_mapping import (
 )
 # EntryAnalyzer 제거됨 - Clean Architecture 마이그레이션
 # from src.ai.entry_analyzer import EntryAnalyzer, EntrySignal
+from src.backtesting.backtester import BacktestResult
+from src.backtesting.monte_carlo import MonteCarloSimulator, check_ruin_filter
 from src.backtesting.quick_filter import QuickBacktestFilter, TradingPassConfig  # 2단 게이트
 from src.config.settings import ScannerConfig
 from src.utils.logger import Logger
@@ -82,6 +90,20 @@ class CoinCandidate:
         return self.entry_signal.decision == 'buy'
 
 
+@dataclass
+class CoinScoreState:
+    """코인별 채점 상태 (사이클 간 재사용)"""
+    ticker: str
+    last_candle: pd.Timestamp               # 채점에 사용한 마지막 일봉 시각
+    liquidity_rank: int                     # 채점 당시 유동성 순위 (0부터)
+    backtest_score: BacktestScore           # 백테스팅 결과 (Research Pass)
+    trading_pass_evaluated: bool = False    # Trading Pass 평가 여부 (백테스팅 통과 코인만)
+    trading_pass_passed: bool = False
+    trading_pass_reason: str = ""
+    expectancy_R: float = 0.0
+    evaluated_at: datetime = field(default_factory=datetime.now)
+
+
 @dataclass
 class ScanResult:
     """스캔 결과 (전체 프로세스)"""
@@ -93,6 +115,8 @@ class ScanResult:
     selected_coins: List[CoinCandidate]   # 선택된 코인
     total_duration_seconds: float         # 전체 소요 시간
     all_backtest_results: Optional[List] = None  # 모든 백테스팅 결과 (통과 여부 무관)
+    universe_scanned: int = 0             # 1단계 사전 필터 대상 전체 마켓 수 (미사용 시 0)
+    tier_stats: Optional[Dict[str, Any]] = None  # 단계별 소요 시간/코인 수
 
 
 class CoinSelector:
@@ -101,6 +125,8 @@ class CoinSelector:
 
     전체 스캐닝 파이프라인을 조율합니다:
     1. 유동성 스캔 (상위 10개, ScannerConfig.LIQUIDITY_TOP_N 참조)
+       - universe_prefilter 주입 시 2단 스캔: 전체 KRW 마켓을 벡터 지표로 사전 필터(Tier 1)한 뒤
+         생존 코인만 아래 2~5단계(Tier 2)로 진행
     2. 데이터 동기화
     3. 병렬 백테스팅 (상위 5개 선별)
     4. AI 진입 분석 (상위 5개)
@@ -129,7 +155,17 @@ class CoinSelector:
         # 섹터 분산 파라미터
         enable_sector_diversification: bool = True,
         one_per_sector: bool = True,
-        exclude_unknown_sector: bool = ScannerConfig.EXCLUDE_UNKNOWN_SECTOR
+        exclude_unknown_sector: bool = ScannerConfig.EXCLUDE_UNKNOWN_SECTOR,
+        # 2단 스캔 파라미터
+        universe_prefilter: Optional[UniversePrefilter] = None,
+        prefilter_top_n: int = ScannerConfig.PREFILTER_TOP_N,
+        scan_budget_seconds: float = ScannerConfig.SCAN_BUDGET_SECONDS,
+        # 증분 재채점 파라미터
+        incremental_rescoring: bool = ScannerConfig.INCREMENTAL_RESCORING,
+        rescore_rank_tolerance: int = ScannerConfig.RESCORE_RANK_TOLERANCE,
+        rescore_max_age_hours: float = ScannerConfig.RESCORE_MAX_AGE_HOURS,
+        # 몬테카를로 게이트
+        monte_carlo: Optional[MonteCarloSimulator] = None
     ):
         """
         Args:
@@ -146,6 +182,13 @@ class CoinSelector:
             enable_sector_diversification: 섹터 분산 활성화 여부
             one_per_sector: True면 섹터당 1개만 선택
             exclude_unknown_sector: True면 미분류 섹터 코인 제외
+            universe_prefilter: 전체 마켓 사전 필터 (None이면 유동성 상위 N개만 스캔)
+            prefilter_top_n: 사전 필터 생존 코인 수 (섹터 분산 전)
+            scan_budget_seconds: 전체 스캔 시간 예산 (초과 시 경고)
+            incremental_rescoring: True면 변경 없는 코인의 이전 채점 결과 재사용
+            rescore_rank_tolerance: 재사용 허용 유동성 순위 변화 폭
+            rescore_max_age_hours: 채점 결과 최대 재사용 시간
+            monte_carlo: Trading Pass 추가 게이트 (None이면 몬테카를로 검증 생략)
         """
         import warnings
         if entry_analyzer is not None:
@@ -173,6 +216,20 @@ class CoinSelector:
         self.one_per_sector = one_per_sector
         self.exclude_unknown_sector = exclude_unknown_sector
 
+        # 2단 스캔 설정
+        self.universe_prefilter = universe_prefilter
+        self.prefilter_top_n = prefilter_top_n
+        self.scan_budget_seconds = scan_budget_seconds
+
+        # 증분 재채점 상태 (ticker -> CoinScoreState)
+        self.incremental_rescoring = incremental_rescoring
+        self.rescore_rank_tolerance = rescore_rank_tolerance
+        self.rescore_max_age = timedelta(hours=rescore_max_age_hours)
+        self._score_states: Dict[str, CoinScoreState] = {}
+
+        # 몬테카를로 게이트
+        self.monte_carlo = monte_carlo
+
     async def select_coins(
         self,
         exclude_tickers: Optional[List[str]] = None,
@@ -194,21 +251,42 @@ class CoinSelector:
         exclude_tickers = exclude_tickers or []
 
         # ========================================
-        # 1단계: 유동성 스캔
+        # 1단계: 유동성 스캔 (2단 스캔이면 전체 마켓 사전 필터)
         # ========================================
-        Logger.print_info("\n📊 1단계: 유동성 스캔")
-        top_coins = await self.liquidity_scanner.scan_top_coins(
-            min_volume_krw=self.min_volume_krw,
-            top_n=self.liquidity_top_n,
-            include_volatility=True
-        )
+        tier1_stats = None
+        filtered_coins: List[CoinInfo] = []
+        if self.universe_prefilter is not None:
+            Logger.print_info("\n📊 1단계: 전체 마켓 사전 필터 (Tier 1)")
+            prefilter_result = await self.universe_prefilter.run(
+                top_n=self.prefilter_top_n,
+                exclude_tickers=exclude_tickers,
+                survivor_min_volume_krw=self.min_volume_krw
+            )
+            tier1_stats = prefilter_result.to_stats()
+            filtered_coins = prefilter_result.survivors
+            Logger.print_info(
+                f"  전체 {prefilter_result.universe}개 → 적격 {prefilter_result.eligible}개 → "
+                f"지표 계산 {prefilter_result.scored}개 → 생존 {len(filtered_coins)}개 "
+                f"({prefilter_result.duration_seconds:.1f}초)"
+            )
+            if not filtered_coins:
+                Logger.print_warning("  사전 필터 생존 코인 없음 → 유동성 상위 스캔으로 대체")
+
+        if not filtered_coins:
+            if self.universe_prefilter is None:
+                Logger.print_info("\n📊 1단계: 유동성 스캔")
+            top_coins = await self.liquidity_scanner.scan_top_coins(
+                min_volume_krw=self.min_volume_krw,
+                top_n=self.liquidity_top_n,
+                include_volatility=True
+            )
 
-        # 이미 보유 중인 코인 제외
-        filtered_coins = [c for c in top_coins if c.ticker not in exclude_tickers]
-        Logger.print_info(f"  유동성 상위: {len(top_coins)}개 → 보유 제외: {len(filtered_coins)}개")
+            # 이미 보유 중인 코인 제외
+            filtered_coins = [c for c in top_coins if c.ticker not in exclude_tickers]
+            Logger.print_info(f"  유동성 상위: {len(top_coins)}개 → 보유 제외: {len(filtered_coins)}개")
 
         if not filtered_coins:
-            return self._empty_result(start_time)
+            return self._empty_result(start_time, tier_stats=self._build_tier_stats(start_time, tier1_stats))
 
         # ========================================
         # 1-1단계: 섹터별 분산 선택 (옵션)
@@ -228,8 +306,11 @@ class CoinSelector:
 
             filtered_coins = diversified_coins
 
+        # 2단계 대상은 최대 liquidity_top_n개 (사전 필터 생존 코인이 더 많을 수 있음)
+        filtered_coins = filtered_coins[:self.liquidity_top_n]
+
         if not filtered_coins:
-            return self._empty_result(start_time)
+            return self._empty_result(start_time, tier_stats=self._build_tier_stats(start_time, tier1_stats))
 
         # 유동성 결과 출력
         self.liquidity_scanner.print_scan_result(filtered_coins[:10])
@@ -238,8 +319,9 @@ class CoinSelector:
         # 2단계: 데이터 동기화
         # ========================================
         Logger.print_info("\n📥 2단계: 데이터 동기화")
+        tier2_started = time.monotonic()
         tickers = [c.ticker for c in filtered_coins]
-        await self.data_sync.sync_multiple_coins(
+        sync_statuses = await self.data_sync.sync_multiple_coins(
             tickers=tickers,
             years=1,  # 1년치 데이터
             interval="day",
@@ -247,15 +329,39 @@ class CoinSelector:
         )
 
         # ========================================
-        # 3단계: 병렬 백테스팅
+        # 3단계: 병렬 백테스팅 (변경된 코인만)
         # ========================================
         Logger.print_info("\n🔬 3단계: 병렬 백테스팅")
         coin_infos = {c.ticker: c for c in filtered_coins}
-        backtest_results = await self.multi_backtest.run_parallel_backtest(
-            coin_list=tickers,
-            coin_infos=coin_infos,
-            top_n=self.backtest_top_n
+        last_candles = self._last_candles(tickers, sync_statuses)
+        ranks = {ticker: rank for rank, ticker in enumerate(tickers)}
+        reused = self._reusable_tickers(tickers, ranks, last_candles)
+        stale = [t for t in tickers if t not in reused]
+
+        fresh_results: List[BacktestScore] = []
+        if stale:
+            fresh_results = await self.multi_backtest.run_parallel_backtest(
+                coin_list=stale,
+                coin_infos=coin_infos,
+                top_n=len(stale)  # 캐시 결과와 합친 뒤 상위 N개 선택
+            )
+        cached_results = [
+            replace(self._score_states[t].backtest_score, coin_info=coin_infos[t])
+            for t in tickers if t in reused
+        ]
+        backtest_results = sorted(fresh_results + cached_results, key=lambda r: r.score, reverse=True)
+        backtest_results = backtest_results[:self.backtest_top_n]
+
+        recompute_ratio = len(stale) / len(tickers)
+        Logger.print_info(
+            f"  재계산: {len(stale)}/{len(tickers)} ({recompute_ratio:.0%}), 캐시 재사용: {len(reused)}개"
         )
+        rescoring_stats = {
+            'recomputed': len(stale),
+            'reused': len(reused),
+            'recompute_ratio': round(recompute_ratio, 3),
+        }
+        self._remember_scores(fresh_results, ranks, last_candles)
 
         # 통과 코인만 필터링
         passed_backtests = [r for r in backtest_results if r.passed]
@@ -270,7 +376,14 @@ class CoinSelector:
                 ai_analyzed=0,
                 candidates=[],
                 selected_coins=[],
-                all_backtest_results=backtest_results  # 모든 결과 포함
+                all_backtest_results=backtest_results,  # 모든 결과 포함
+                tier_stats=self._build_tier_stats(
+                    start_time, tier1_stats, tier2_started,
+                    candidates=len(filtered_coins),
+                    backtested=len(backtest_results),
+                    passed=0,
+                    rescoring=rescoring_stats
+                )
             )
 
         self.multi_backtest.print_results(passed_backtests)
@@ -291,7 +404,7 @@ class CoinSelector:
         # 4-1단계: Trading Pass 검증 (2단 게이트)
         # ========================================
         Logger.print_info("\n🔐 4-1단계: Trading Pass 검증 (Expectancy 포함)")
-        candidates = self._apply_trading_pass(candidates)
+        candidates = self._apply_trading_pass(candidates, reuse=reused)
 
         # Trading Pass 통과 코인 수
         trading_passed = sum(1 for c in candidates if c.trading_pass_passed)
@@ -331,7 +444,14 @@ class CoinSelector:
             ai_analyzed=ai_analyzed,
             candidates=candidates,
             selected_coins=selected_coins,
-            all_backtest_results=enriched_backtest_results  # Trading Pass 포함
+            all_backtest_results=enriched_backtest_results,  # Trading Pass 포함
+            tier_stats=self._build_tier_stats(
+                start_time, tier1_stats, tier2_started,
+                candidates=len(filtered_coins),
+                backtested=len(backtest_results),
+                passed=len(passed_backtests),
+                rescoring=rescoring_stats
+            )
         )
 
         # 최종 결과 출력
@@ -495,7 +615,11 @@ class CoinSelector:
 
         return selected
 
-    def _empty_result(self, start_time: datetime) -> ScanResult:
+    def _empty_result(
+        self,
+        start_time: datetime,
+        tier_stats: Optional[Dict[str, Any]] = None
+    ) -> ScanResult:
         """빈 결과 생성"""
         return ScanResult(
             scan_time=start_time,
@@ -504,9 +628,49 @@ class CoinSelector:
             ai_analyzed=0,
             candidates=[],
             selected_coins=[],
-            total_duration_seconds=(datetime.now() - start_time).total_seconds()
+            total_duration_seconds=(datetime.now() - start_time).total_seconds(),
+            universe_scanned=((tier_stats or {}).get('tier1') or {}).get('universe', 0),
+            tier_stats=tier_stats
         )
 
+    def _build_tier_stats(
+        self,
+        start_time: datetime,
+        tier1_stats: Optional[Dict[str, Any]],
+        tier2_started: Optional[float] = None,
+        candidates: int = 0,
+        backtested: int = 0,
+        passed: int = 0,
+        rescoring: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        단계별 통계 생성
+
+        Returns:
+            {'tier1': 사전 필터 통계 또는 None, 'tier2': 백테스팅 단계 통계,
+             'total_seconds', 'budget_seconds', 'within_budget'}
+        """
+        total_seconds = (datetime.now() - start_time).total_seconds()
+        tier2_seconds = time.monotonic() - tier2_started if tier2_started is not None else 0.0
+        within_budget = total_seconds <= self.scan_budget_seconds
+        if not within_budget:
+            Logger.print_warning(
+                f"  스캔 시간 예산 초과: {total_seconds:.0f}초 > {self.scan_budget_seconds:.0f}초"
+            )
+        return {
+            'tier1': tier1_stats,
+            'tier2': {
+                'candidates': candidates,
+                'backtested': backtested,
+                'passed': passed,
+                'seconds': round(tier2_seconds, 2),
+                **(rescoring or {}),
+            },
+            'total_seconds': round(total_seconds, 2),
+            'budget_seconds': self.scan_budget_seconds,
+            'within_budget': within_budget,
+        }
+
     def _create_result(
         self,
         start_time: datetime,
@@ -515,7 +679,8 @@ class CoinSelector:
         ai_analyzed: int,
         candidates: List[CoinCandidate],
         selected_coins: List[CoinCandidate],
-        all_backtest_results: Optional[List] = None
+        all_backtest_results: Optional[List] = None,
+        tier_stats: Optional[Dict[str, Any]] = None
     ) -> ScanResult:
         """결과 생성"""
         return ScanResult(
@@ -526,7 +691,9 @@ class CoinSelector:
             candidates=candidates,
             selected_coins=selected_coins,
             total_duration_seconds=(datetime.now() - start_time).total_seconds(),
-            all_backtest_results=all_backtest_results
+            all_backtest_results=all_backtest_results,
+            universe_scanned=((tier_stats or {}).get('tier1') or {}).get('universe', 0),
+            tier_stats=tier_stats
         )
 
     def _print_final_result(self, result: ScanResult) -> None:
@@ -537,6 +704,12 @@ class CoinSelector:
         print(f"소요 시간: {result.total_duration_seconds:.1f}초")
         print()
         print("파이프라인 요약:")
+        tier1 = (result.tier_stats or {}).get('tier1')
+        if tier1:
+            print(
+                f"  0. 사전 필터: 전체 {tier1['universe']}개 → 생존 {tier1['survivors']}개 "
+                f"({tier1['seconds']:.1f}초)"
+            )
         print(f"  1. 유동성 스캔: {result.liquidity_scanned}개")
         print(f"  2. 백테스팅 통과: {result.backtest_passed}개")
         print(f"  3. AI 분석: {result.ai_analyzed}개")
@@ -565,7 +738,88 @@ class CoinSelector:
                 coins_str += f" (+{len(sector_coins) - 3})"
             print(f"    {get_sector_korean_name(sector):12}: {count}개 ({coins_str})")
 
-    def _apply_trading_pass(self, candidates: List[CoinCandidate]) -> List[CoinCandidate]:
+    def _last_candles(
+        self,
+        tickers: List[str],
+        sync_statuses: Optional[List[SyncStatus]]
+    ) -> Dict[str, Optional[pd.Timestamp]]:
+        """동기화 결과에서 코인별 마지막 일봉 시각 추출 (없으면 저장된 데이터에서 조회)"""
+        last_candles: Dict[str, Optional[pd.Timestamp]] = {}
+        for status in sync_statuses if isinstance(sync_statuses, list) else []:
+            if isinstance(status, SyncStatus) and status.date_range:
+                last_candles[status.ticker] = pd.Timestamp(status.date_range[1])
+
+        if self.incremental_rescoring:
+            for ticker in tickers:
+                if ticker in last_candles:
+                    continue
+                df = self.data_sync.load_data(ticker, "day")
+                last_candles[ticker] = pd.Timestamp(df.index[-1]) if df is not None and len(df) else None
+        return last_candles
+
+    def _reusable_tickers(
+        self,
+        tickers: List[str],
+        ranks: Dict[str, int],
+        last_candles: Dict[str, Optional[pd.Timestamp]]
+    ) -> Set[str]:
+        """
+        이전 채점 결과를 재사용할 코인
+
+        재사용 조건: 같은 마지막 일봉 + 유동성 순위 변화가 허용치 이내 + 최대 보관 시간 이내
+        """
+        if not self.incremental_rescoring:
+            return set()
+
+        now = datetime.now()
+        reusable = set()
+        for ticker in tickers:
+            state = self._score_states.get(ticker)
+            last_candle = last_candles.get(ticker)
+            if state is None or last_candle is None:
+                continue
+            if (
+                state.last_candle == last_candle
+                and abs(state.liquidity_rank - ranks[ticker]) <= self.rescore_rank_tolerance
+                and now - state.evaluated_at <= self.rescore_max_age
+            ):
+                reusable.add(ticker)
+        return reusable
+
+    def _remember_scores(
+        self,
+        results: List[BacktestScore],
+        ranks: Dict[str, int],
+        last_candles: Dict[str, Optional[pd.Timestamp]]
+    ) -> None:
+        """새로 계산한 백테스팅 결과 저장 (Trading Pass 결과는 평가 시 채움)"""
+        if not self.incremental_rescoring:
+            return
+
+        now = datetime.now()
+        for result in results:
+            last_candle = last_candles.get(result.ticker)
+            if last_candle is None or result.ticker not in ranks:
+                self._score_states.pop(result.ticker, None)
+                continue
+            self._score_states[result.ticker] = CoinScoreState(
+                ticker=result.ticker,
+                last_candle=last_candle,
+                liquidity_rank=ranks[result.ticker],
+                backtest_score=result,
+                evaluated_at=now
+            )
+
+        # 오래된 상태 정리
+        expired = [t for t, s in self._score_states.items() if now - s.evaluated_at > self.rescore_max_age]
+        for ticker in expired:
+            del self._score_states[ticker]
+
+    def _apply_trading_pass(
+        self,
+        candidates: List[CoinCandidate],
+        reuse: Optional[Set[str]] = None
+    ) -> List[CoinCandidate]:
         """
         Trading Pass 검증 적용 (2단 게이트)
 
@@ -575,11 +829,13 @@ class CoinSelector:
 
         Args:
             candidates: 후보 코인 리스트
+            reuse: 이전 Trading Pass 결과를 재사용할 티커 (증분 재채점)
 
         Returns:
             Trading Pass 결과가 업데이트된 후보 리스트
         """
         trading_filter = QuickBacktestFilter(TradingPassConfig())
+        reuse = reuse or set()
 
         for candidate in candidates:
             # 백테스트 결과가 없으면 스킵
@@ -588,28 +844,83 @@ class CoinSelector:
                 candidate.trading_pass_reason = "백테스트 결과 없음"
                 continue
 
-            # Trading Pass 평가
-            metrics = candidate.backtest_score.metrics
-            pass_result = trading_filter.evaluate_trading_pass(metrics)
-
-            # Expectancy 정보 추출
-            exp_result = trading_filter.check_expectancy_with_metrics(metrics)
-
-            # 결과 업데이트
-            candidate.trading_pass_passed = pass_result.passed
-            candidate.trading_pass_reason = pass_result.reason
-            candidate.expectancy_R = exp_result.get('net_expectancy', 0.0)
+            state = self._score_states.get(candidate.ticker)
+            if candidate.ticker in reuse and state is not None and state.trading_pass_evaluated:
+                # 변경 없는 코인: 이전 평가 결과 재사용
+                candidate.trading_pass_passed = state.trading_pass_passed
+                candidate.trading_pass_reason = state.trading_pass_reason
+                candidate.expectancy_R = state.expectancy_R
+            else:
+                # Trading Pass 평가
+                metrics = candidate.backtest_score.metrics
+                pass_result = trading_filter.evaluate_trading_pass(metrics)
+
+                # Expectancy 정보 추출
+                exp_result = trading_filter.check_expectancy_with_metrics(metrics)
+
+                # 결과 업데이트
+                candidate.trading_pass_passed = pass_result.passed
+                candidate.trading_pass_reason = pass_result.reason
+                candidate.expectancy_R = exp_result.get('net_expectancy', 0.0)
+
+                # 몬테카를로 게이트 (Trading Pass 통과 코인만)
+                if candidate.trading_pass_passed:
+                    mc_reason = self._check_monte_carlo(candidate)
+                    if mc_reason:
+                        candidate.trading_pass_passed = False
+                        candidate.trading_pass_reason = mc_reason
+
+                if state is not None:
+                    state.trading_pass_evaluated = True
+                    state.trading_pass_passed = candidate.trading_pass_passed
+                    state.trading_pass_reason = candidate.trading_pass_reason
+                    state.expectancy_R = candidate.expectancy_R
 
             # 로그 출력
-            status = "✅" if pass_result.passed else "❌"
+            status = "✅" if candidate.trading_pass_passed else "❌"
             Logger.print_info(
                 f"  [{candidate.symbol}] {status} Trading Pass "
                 f"(기대값: {candidate.expectancy_R:.3f}R)"
             )
 
             # Trading Pass 실패 시 selected=False로 변경
-            if not pass_result.passed:
+            if not candidate.trading_pass_passed:
                 candidate.selected = False
-                candidate.selection_reason = f"Trading Pass 미통과: {pass_result.reason}"
+                candidate.selection_reason = f"Trading Pass 미통과: {candidate.trading_pass_reason}"
 
         return candidates
+
+    def _check_monte_carlo(self, candidate: CoinCandidate) -> Optional[str]:
+        """
+        몬테카를로 파산 확률 게이트
+
+        백테스트 거래 순서를 재표본하여 파산 확률이 한도를 넘으면 실패 처리합니다.
+        거래 수가 적어 재표본할 수 없으면 판단을 생략합니다 (최소 거래 수는 기존 필터 담당).
+
+        Args:
+            candidate: Trading Pass를 통과한 후보
+
+        Returns:
+            실패 사유 (통과 또는 검증 생략 시 None)
+        """
+        if self.monte_carlo is None:
+            return None
+        backtest_result = candidate.backtest_score.backtest_result
+        if not isinstance(backtest_result, BacktestResult):
+            return None
+
+        mc_result = self.monte_carlo.evaluate(backtest_result)
+        if mc_result is None:
+            return None
+
+        max_ruin = self.monte_carlo.config.max_ruin_probability
+        passed, ruin = check_ruin_filter(mc_result, max_ruin)
+        low, high = min(mc_result.return_percentiles), max(mc_result.drawdown_percentiles)
+        Logger.print_info(
+            f"  [{candidate.symbol}] 몬테카를로 {mc_result.n_paths:,}경로 ({mc_result.elapsed_ms:.0f}ms): "
+            f"수익률 p{low} {mc_result.return_percentiles[low]:+.1f}%, "
+            f"MDD p{high} {mc_result.drawdown_percentiles[high]:.1f}%, 파산 확률 {ruin:.1%}"
+        )
+        if passed:
+            return None
+        return f"몬테카를로 파산 확률 {ruin:.1%} > {max_ruin:.1%}"
@@ -479,3 +479,7 @@ class HistoricalDataSync:
 
         print("-" * 70)
         print(f"{'총계':>20} {len(files)}개 파일, {total_size:.2f} MB")
+
+    def close(self) -> None:
+        """리소스 정리 (API 호출 스레드 풀 종료)"""
+        self._executor.shutdown(wait=False)
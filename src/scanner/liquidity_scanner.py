@@ -85,6 +85,7 @@ class LiquidityScanner:
         self.min_volume_krw = min_volume_krw
         self.rate_limit_delay = rate_limit_delay
         self._coin_names: Dict[str, str] = {}  # ticker -> korean_name 캐시
+        self.last_universe_size = 0  # 마지막 스캔의 전체 KRW 마켓 수
 
     async def scan_top_coins(
         self,
@@ -138,6 +139,43 @@ class LiquidityScanner:
             Logger.print_error(f"유동성 스캔 실패: {str(e)}")
             return []
 
+    async def scan_universe(self, min_volume_krw: Optional[float] = None) -> List[CoinInfo]:
+        """
+        전체 KRW 마켓 스캔 (상위 N개 제한 없음, 변동성 API 호출 없음)
+
+        멀티마켓 시세 조회 1회로 필터를 통과한 모든 코인을 반환합니다.
+        2단 스캔의 1단계(UniversePrefilter) 입력으로 사용됩니다.
+
+        Args:
+            min_volume_krw: 최소 24시간 거래대금 (None이면 초기 설정값 사용)
+
+        Returns:
+            CoinInfo 리스트 (거래대금 순 정렬)
+        """
+        min_vol = self.min_volume_krw if min_volume_krw is None else min_volume_krw
+
+        try:
+            all_tickers = await self._get_all_krw_tickers()
+            self.last_universe_size = len(all_tickers)
+            ticker_data = await self._get_ticker_data(all_tickers)
+
+            coins = []
+            for data in ticker_data:
+                coin_info = self._parse_ticker_data(data)
+                if coin_info and self._passes_filter(coin_info, min_vol):
+                    coins.append(coin_info)
+
+            coins.sort(key=lambda x: x.acc_trade_price_24h, reverse=True)
+            Logger.print_info(
+                f"  전체 KRW 마켓: {len(all_tickers)}개 → 필터 통과: {len(coins)}개 "
+                f"(최소 거래대금: {min_vol/1e8:.0f}억원)"
+            )
+            return coins
+
+        except Exception as e:
+            Logger.print_error(f"전체 마켓 스캔 실패: {str(e)}")
+            return []
+
     async def get_coin_details(self, ticker: str) -> Optional[CoinInfo]:
         """
         특정 코인 상세 정보 조회
@@ -23,6 +23,7 @@ import pandas as pd
 from src.backtesting.runner import BacktestRunner
 from src.backtesting.rule_based_strategy import RuleBasedBreakoutStrategy
 from src.backtesting.backtester import BacktestResult
+from src.backtesting.stopping_rules import stopping_rules_from_criteria
 from src.backtesting.quick_filter import ResearchPassConfig  # ⚠️ 통합된 Config 사용
 from src.scanner.data_sync import HistoricalDataSync
 from src.scanner.liquidity_scanner import CoinInfo
@@ -75,6 +76,9 @@ class MultiBacktestConfig:
     min_avg_win_loss_ratio: float = 1.0   # Research 기준 (연동 필터로 대체)
     max_avg_holding_hours: float = 336.0  # Research 기준
 
+    # 조기 종료: 필터 통과가 확정적으로 불가능해지면 백테스트 중단 (결과는 항상 FAIL)
+    early_termination: bool = True
+
     # 점수 가중치
     weight_return: float = 0.20
     weight_win_rate: float = 0.10
@@ -199,6 +203,7 @@ class MultiCoinBacktest:
         # 결과 요약
         passed_count = sum(1 for r in valid_results if r.passed)
         Logger.print_info(f"\n📊 백테스팅 완료: 통과 {passed_count}/{len(valid_results)}")
+        self._log_early_termination(valid_results)
 
         return top_results
 
@@ -238,41 +243,27 @@ class MultiCoinBacktest:
                 self._executor,
                 self._execute_backtest,
                 ticker,
-                df
+                df,
+                criteria if self.config.early_termination else None
             )
 
-            # 메트릭 추출
-            metrics = backtest_result.metrics
-
-            # 필터링
-            filter_results = self._check_filters(metrics, criteria)
-            passed = all(filter_results.values())
-
-            # 점수 계산
-            score = self._calculate_score(metrics)
-
-            # 등급 결정
-            grade = self._determine_grade(score, passed)
-
-            # 사유 생성
-            reason = self._generate_reason(metrics, filter_results, passed)
-
-            result = BacktestScore(
+            result = self.score_metrics(
                 ticker=ticker,
-                symbol=symbol,
-                passed=passed,
-                score=score,
-                grade=grade,
-                metrics=metrics,
-                filter_results=filter_results,
-                reason=reason,
-                backtest_result=backtest_result,
-                coin_info=coin_info
+                metrics=backtest_result.metrics,
+                coin_info=coin_info,
+                criteria=criteria
             )
+            result.backtest_result = backtest_result
+            if isinstance(backtest_result, BacktestResult) and backtest_result.terminated:
+                # 부분 구간 지표의 점수는 전체 구간과 비교 불가 → 통과 코인을 밀어내지 않도록 0점
+                result.passed = False
+                result.score = 0.0
+                result.grade = "FAIL"
+                result.reason = f"조기 종료: {backtest_result.termination_reason}"
 
             # 간단한 결과 로그
-            status = "✅" if passed else "❌"
-            Logger.print_info(f"  [{symbol}] {status} 점수: {score:.1f} ({grade})")
+            status = "✅" if result.passed else "❌"
+            Logger.print_info(f"  [{symbol}] {status} 점수: {result.score:.1f} ({result.grade})")
 
             return result
 
@@ -290,8 +281,59 @@ class MultiCoinBacktest:
                 coin_info=coin_info
             )
 
-    def _execute_backtest(self, ticker: str, df: pd.DataFrame) -> BacktestResult:
-        """백테스팅 실행 (동기 함수)"""
+    def score_metrics(
+        self,
+        ticker: str,
+        metrics: Dict[str, Any],
+        coin_info: Optional[CoinInfo] = None,
+        criteria: Optional[Dict] = None
+    ) -> BacktestScore:
+        """
+        성능 지표 → 필터/점수/등급 (백테스트 실행 없음)
+
+        시점별 재생(scan_replay)처럼 지표를 다른 방식으로 구한 경우에도
+        실시간 스캔과 같은 채점 기준을 적용합니다.
+
+        Args:
+            ticker: 코인 티커
+            metrics: PerformanceAnalyzer 형식 성능 지표
+            coin_info: 코인 정보 (유동성 데이터)
+            criteria: 필터 기준 (None이면 config 사용)
+
+        Returns:
+            BacktestScore (backtest_result 없음)
+        """
+        criteria = criteria or self._get_filter_criteria(None)
+        filter_results = self._check_filters(metrics, criteria)
+        passed = all(filter_results.values())
+        score = self._calculate_score(metrics)
+
+        return BacktestScore(
+            ticker=ticker,
+            symbol=ticker.replace("KRW-", ""),
+            passed=passed,
+            score=score,
+            grade=self._determine_grade(score, passed),
+            metrics=metrics,
+            filter_results=filter_results,
+            reason=self._generate_reason(metrics, filter_results, passed),
+            coin_info=coin_info
+        )
+
+    def _execute_backtest(
+        self,
+        ticker: str,
+        df: pd.DataFrame,
+        criteria: Optional[Dict] = None
+    ) -> BacktestResult:
+        """
+        백테스팅 실행 (동기 함수)
+
+        Args:
+            ticker: 코인 티커
+            df: OHLCV 데이터
+            criteria: 필터 기준 (주어지면 확정 실패 시 조기 종료, None이면 전체 구간 실행)
+        """
         strategy = RuleBasedBreakoutStrategy(
             ticker=ticker,
             risk_per_trade=0.02,
@@ -304,7 +346,26 @@ class MultiCoinBacktest:
             ticker=ticker,
             initial_capital=self.config.initial_capital,
             commission=self.config.commission,
-            slippage=self.config.slippage
+            slippage=self.config.slippage,
+            stopping_rules=stopping_rules_from_criteria(criteria) if criteria else None
+        )
+
+    @staticmethod
+    def _log_early_termination(results: List[BacktestScore]) -> None:
+        """조기 종료 통계 (생략한 봉 수, 절약한 CPU 시간 추정)"""
+        backtests = [r.backtest_result for r in results if isinstance(r.backtest_result, BacktestResult)]
+        terminated = [b for b in backtests if b.terminated]
+        if not terminated:
+            return
+
+        total_bars = sum(b.total_bars for b in backtests)
+        skipped_bars = sum(b.total_bars - b.bars_processed for b in terminated)
+        cpu_used = sum(b.cpu_seconds for b in backtests)
+        cpu_saved = sum(b.cpu_saved_seconds for b in terminated)
+        Logger.print_info(
+            f"  ⏱️ 조기 종료: {len(terminated)}/{len(backtests)}개 코인, "
+            f"생략 {skipped_bars:,}/{total_bars:,}봉 ({skipped_bars / max(total_bars, 1):.0%}), "
+            f"CPU 절약 약 {cpu_saved:.1f}초 (사용 {cpu_used:.1f}초)"
         )
 
     def _get_filter_criteria(self, custom_criteria: Optional[Dict]) -> Dict:
@@ -0,0 +1,490 @@
+"""
+스캔 정책 시점별 재생 (Point-in-Time Scan Replay)
+
+CoinSelector의 선택 정책(유동성 순위 → 섹터 분산 → 백테스트 게이트 → Trading Pass → 최종 선택)을
+과거 날짜마다 그대로 재생하여 정책 자체를 검증합니다.
+
+과거 날짜마다 CoinSelector를 실행하면 매 날짜 코인별 백테스트를 처음부터 다시 돌려야 하므로,
+대신 코인별로 전체 기간 백테스트를 한 번만 실행하고
+그 자산 곡선/거래 목록에서 날짜별 "직전 N일 창" 지표를 누적합/슬라이딩 창으로 미리 계산합니다.
+재생 단계는 이 배열을 날짜로 조회만 합니다.
+
+룩어헤드 방지:
+- 날짜 d의 결정에는 d 일봉(마감)까지의 데이터만 사용 (선택은 d+1에 적용되는 것으로 해석)
+- 지표 창은 [d - N + 1, d], 거래는 창 안에서 진입하고 d까지 청산된 거래만 포함
+- 아직 상장 전이거나 최소 기간 미달인 코인은 해당 날짜 후보에서 제외
+
+근사:
+- 창 시작 시점에 새로 시작한 백테스트와 달리 창 이전부터 이어진 포지션/복리 경로를 공유합니다.
+- 1단계 사전 필터(UniversePrefilter)는 실시간 시세가 필요하므로 재생에서는 유동성 순위 경로만 사용합니다.
+
+사용 예시:
+    replay = ScanPolicyReplay(selector=CoinSelector())
+    replay.prepare()  # 로컬 저장소의 일봉 전체
+    result = replay.replay(start="2024-01-01", end="2025-12-31")
+    print(result.selection_frequency().head())
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting.performance import PerformanceAnalyzer
+from src.backtesting.quick_filter import QuickBacktestFilter, TradingPassConfig
+from src.scanner.coin_selector import CoinCandidate, CoinSelector
+from src.scanner.liquidity_scanner import CoinInfo
+from src.utils.logger import Logger
+
+
+class RollingBacktestMetrics:
+    """
+    한 코인의 전체 기간 백테스트 → 날짜별 직전 window개 봉 성능 지표
+
+    지표 이름/정의는 PerformanceAnalyzer.calculate_metrics와 같습니다.
+    단일 종목 백테스트는 포지션이 겹치지 않으므로 진입/청산 시각이 모두 정렬되어 있고,
+    창 안의 거래는 거래 목록의 연속 구간 [lo, hi)가 됩니다.
+
+    Args:
+        index: 봉 시각 (백테스트 데이터 인덱스)
+        equity_curve: 봉별 자산
+        trades: 청산된 거래 목록 (Trade)
+        window: 지표 창 크기 (봉 수)
+        min_bars: 지표를 계산할 최소 봉 수 (미만이면 None)
+        data_interval: 연율화용 데이터 간격
+        risk_free_rate: 무위험 수익률 (연율)
+    """
+
+    def __init__(
+        self,
+        index: pd.DatetimeIndex,
+        equity_curve: List[float],
+        trades: List[Any],
+        window: int,
+        min_bars: int = 30,
+        data_interval: str = 'day',
+        risk_free_rate: float = 0.02
+    ):
+        self.index = pd.DatetimeIndex(index)
+        self.window = window
+        self.min_bars = min_bars
+        equity = np.asarray(equity_curve, dtype=float)
+        n = len(equity)
+        self._equity = equity
+
+        factor = PerformanceAnalyzer._get_annualization_factor(data_interval)
+        self._sqrt_factor = np.sqrt(factor)
+        self.data_interval = data_interval
+        self.annualization_factor = factor
+
+        # 창 시작 위치 (봉 p의 창은 [start[p], p])
+        positions = np.arange(n)
+        self._start = np.maximum(0, positions - window + 1)
+
+        # 수익률 창: start+1 ~ p (창 안의 봉 간 수익률)
+        returns = np.zeros(n)
+        returns[1:] = equity[1:] / equity[:-1] - 1
+        excess = returns - risk_free_rate / factor
+        excess[0] = 0.0
+        downside = np.where(excess < 0, excess, 0.0)
+        self._excess = self._prefix(excess)
+        self._excess_sq = self._prefix(excess ** 2)
+        self._down = self._prefix(downside)
+        self._down_sq = self._prefix(downside ** 2)
+        self._down_count = self._prefix((excess < 0).astype(float))
+        self._returns = self._prefix(returns)
+        self._returns_sq = self._prefix(returns ** 2)
+
+        self._max_drawdown = self._rolling_max_drawdown(equity, window)
+
+        # 거래 누적합
+        trades = sorted(trades, key=lambda t: t.entry_time)
+        pnl = np.array([t.pnl for t in trades], dtype=float)
+        self._entries = pd.DatetimeIndex([t.entry_time for t in trades]).values
+        self._exits = pd.DatetimeIndex([t.exit_time for t in trades]).values
+        self._wins = self._prefix((pnl > 0).astype(float))
+        self._losses = self._prefix((pnl < 0).astype(float))
+        self._win_pnl = self._prefix(np.where(pnl > 0, pnl, 0.0))
+        self._loss_pnl = self._prefix(np.where(pnl < 0, pnl, 0.0))
+        self._holding = self._prefix(np.array(
+            [t.holding_period.total_seconds() / 3600 for t in trades], dtype=float
+        ))
+        self._win_streak = self._streaks(pnl > 0)
+        self._loss_streak = self._streaks(pnl < 0)
+
+    @staticmethod
+    def _prefix(values: np.ndarray) -> np.ndarray:
+        """앞에 0을 붙인 누적합 (구간 합 = prefix[hi] - prefix[lo])"""
+        return np.concatenate(([0.0], np.cumsum(values)))
+
+    @staticmethod
+    def _streaks(flags: np.ndarray) -> np.ndarray:
+        """각 거래에서 끝나는 연속 True 길이"""
+        streak = np.zeros(len(flags), dtype=int)
+        run = 0
+        for i, flag in enumerate(flags):
+            run = run + 1 if flag else 0
+            streak[i] = run
+        return streak
+
+    @staticmethod
+    def _rolling_max_drawdown(equity: np.ndarray, window: int) -> np.ndarray:
+        """봉별 직전 window개 봉의 최대 낙폭 (%)"""
+        n = len(equity)
+        result = np.zeros(n)
+        if n == 0:
+            return result
+
+        # 창이 다 차기 전: 처음부터의 누적 낙폭
+        head = min(n, window)
+        running_max = np.maximum.accumulate(equity[:head])
+        result[:head] = np.minimum.accumulate((equity[:head] - running_max) / running_max * 100)
+
+        if n > window:
+            windows = np.lib.stride_tricks.sliding_window_view(equity, window)[1:]
+            peaks = np.maximum.accumulate(windows, axis=1)
+            result[window:] = ((windows - peaks) / peaks).min(axis=1) * 100
+        return result
+
+    @staticmethod
+    def _window_std(total: float, total_sq: float, count: float) -> float:
+        """표본 표준편차 (ddof=1)"""
+        if count < 2:
+            return 0.0
+        variance = (total_sq - total * total / count) / (count - 1)
+        return float(np.sqrt(variance)) if variance > 1e-18 else 0.0
+
+    def position_at(self, date) -> Optional[int]:
+        """date 이전(포함) 마지막 봉 위치"""
+        position = int(self.index.searchsorted(pd.Timestamp(date), side='right')) - 1
+        return position if position >= 0 else None
+
+    def as_of(self, date) -> Optional[Dict[str, Any]]:
+        """
+        date 시점까지의 데이터만으로 계산한 성능 지표
+
+        Args:
+            date: 기준 시각 (해당 봉 마감 기준)
+
+        Returns:
+            PerformanceAnalyzer 형식 지표 딕셔너리 (최소 봉 수 미달 시 None)
+        """
+        p = self.position_at(date)
+        if p is None:
+            return None
+        s = int(self._start[p])
+        bars = p - s + 1
+        if bars < self.min_bars:
+            return None
+
+        equity = self._equity
+        total_return = (equity[p] / equity[s] - 1) * 100
+
+        # 수익률 구간 [s+1, p] → prefix[p+1] - prefix[s+1]
+        lo, hi = s + 1, p + 1
+        count = hi - lo
+        volatility = self._window_std(
+            self._returns[hi] - self._returns[lo], self._returns_sq[hi] - self._returns_sq[lo], count
+        ) * self._sqrt_factor * 100
+
+        excess_sum = self._excess[hi] - self._excess[lo]
+        excess_std = self._window_std(excess_sum, self._excess_sq[hi] - self._excess_sq[lo], count)
+        excess_mean = excess_sum / count if count else 0.0
+        sharpe = excess_mean / excess_std * self._sqrt_factor if excess_std > 0 else 0
+        down_std = self._window_std(
+            self._down[hi] - self._down[lo],
+            self._down_sq[hi] - self._down_sq[lo],
+            self._down_count[hi] - self._down_count[lo]
+        )
+        sortino = excess_mean / down_std * self._sqrt_factor if down_std > 0 else 0
+
+        max_drawdown = float(self._max_drawdown[p])
+        calmar = total_return / abs(max_drawdown) if max_drawdown != 0 else 0
+
+        metrics = {
+            'total_return': total_return,
+            'final_equity': float(equity[p]),
+            'volatility': volatility,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe,
+            'sortino_ratio': sortino,
+            'calmar_ratio': calmar,
+            'data_interval': self.data_interval,
+            'annualization_factor': self.annualization_factor,
+        }
+        metrics.update(self._trade_stats(self.index.values[s], self.index.values[p]))
+        return metrics
+
+    def _trade_stats(self, window_start, window_end) -> Dict[str, Any]:
+        """창 안에서 진입하고 창 끝까지 청산된 거래 통계"""
+        lo = int(np.searchsorted(self._entries, window_start, side='left'))
+        hi = int(np.searchsorted(self._exits, window_end, side='right'))
+        total = max(0, hi - lo)
+        if total == 0:
+            return {
+                'total_trades': 0, 'win_rate': 0, 'winning_trades': 0, 'losing_trades': 0,
+                'avg_win': 0, 'avg_loss': 0, 'profit_factor': float('inf'),
+                'max_consecutive_wins': 0, 'max_consecutive_losses': 0,
+                'avg_holding_period_hours': 0,
+            }
+
+        wins = int(self._wins[hi] - self._wins[lo])
+        losses = int(self._losses[hi] - self._losses[lo])
+        win_pnl = self._win_pnl[hi] - self._win_pnl[lo]
+        loss_pnl = self._loss_pnl[hi] - self._loss_pnl[lo]
+        # 창 시작 전부터 이어진 연속 기록은 창 안 길이로 자름
+        offsets = np.arange(1, total + 1)
+
+        return {
+            'total_trades': total,
+            'win_rate': wins / total * 100,
+            'winning_trades': wins,
+            'losing_trades': losses,
+            'avg_win': win_pnl / wins if wins else 0,
+            'avg_loss': loss_pnl / losses if losses else 0,
+            'profit_factor': abs(win_pnl) / abs(loss_pnl) if losses and loss_pnl != 0 else float('inf'),
+            'max_consecutive_wins': int(np.minimum(self._win_streak[lo:hi], offsets).max()),
+            'max_consecutive_losses': int(np.minimum(self._loss_streak[lo:hi], offsets).max()),
+            'avg_holding_period_hours': (self._holding[hi] - self._holding[lo]) / total,
+        }
+
+
+@dataclass
+class ScanReplayResult:
+    """스캔 정책 재생 결과"""
+    selections: Dict[pd.Timestamp, List[str]]   # 날짜별 최종 선택 티커
+    daily_stats: pd.DataFrame                   # 날짜별 단계 통과 코인 수
+    prepared_tickers: List[str] = field(default_factory=list)
+    prepare_seconds: float = 0.0
+    replay_seconds: float = 0.0
+
+    def selection_frequency(self) -> pd.Series:
+        """티커별 선택 일수 (많은 순)"""
+        counts: Dict[str, int] = {}
+        for tickers in self.selections.values():
+            for ticker in tickers:
+                counts[ticker] = counts.get(ticker, 0) + 1
+        return pd.Series(counts, dtype=int).sort_values(ascending=False)
+
+
+class ScanPolicyReplay:
+    """
+    CoinSelector 선택 정책의 시점별 재생
+
+    Args:
+        selector: 재생할 정책 (파라미터, 섹터 분산기, 멀티 백테스터, 데이터 저장소를 그대로 사용)
+        data: 티커별 일봉 (None이면 selector.data_sync 로컬 저장소에서 로드)
+        interval: 데이터 간격
+    """
+
+    def __init__(
+        self,
+        selector: Optional[CoinSelector] = None,
+        data: Optional[Dict[str, pd.DataFrame]] = None,
+        interval: str = "day"
+    ):
+        self.selector = selector or CoinSelector()
+        self.interval = interval
+        self._data = data
+        self._trading_filter = QuickBacktestFilter(TradingPassConfig())
+        self.metrics: Dict[str, RollingBacktestMetrics] = {}
+        self._values: Optional[pd.DataFrame] = None   # 날짜 × 티커 거래대금
+        self._bars: Dict[str, pd.DataFrame] = {}
+        self.prepare_seconds = 0.0
+
+    def _load(self, tickers: Optional[List[str]]) -> Dict[str, pd.DataFrame]:
+        if self._data is not None:
+            return {t: df for t, df in self._data.items() if tickers is None or t in tickers}
+
+        data_sync = self.selector.data_sync
+        if tickers is None:
+            suffix = f"_{self.interval}.parquet"
+            tickers = sorted(
+                f"KRW-{path.name[:-len(suffix)]}"
+                for path in data_sync.data_dir.glob(f"*{suffix}")
+            )
+        loaded = {}
+        for ticker in tickers:
+            df = data_sync.load_data(ticker, self.interval)
+            if df is not None and len(df) > 0:
+                loaded[ticker] = df
+        return loaded
+
+    def prepare(self, tickers: Optional[List[str]] = None) -> List[str]:
+        """
+        코인별 전체 기간 백테스트 1회 + 날짜별 지표 배열 준비
+
+        Args:
+            tickers: 대상 티커 (None이면 로컬 저장소 전체)
+
+        Returns:
+            준비된 티커 목록
+        """
+        started = time.monotonic()
+        multi_backtest = self.selector.multi_backtest
+        window = multi_backtest.config.days
+        data = self._load(tickers)
+        Logger.print_info(f"📼 스캔 재생 준비: {len(data)}개 코인 전체 기간 백테스트")
+
+        values = {}
+        for ticker, df in data.items():
+            df = df.sort_index()
+            try:
+                result = multi_backtest._execute_backtest(ticker, df)
+            except Exception as e:
+                Logger.print_warning(f"  [{ticker}] 백테스트 실패, 재생에서 제외: {str(e)}")
+                continue
+            self.metrics[ticker] = RollingBacktestMetrics(
+                index=df.index,
+                equity_curve=result.equity_curve,
+                trades=result.trades,
+                window=window,
+                data_interval=multi_backtest.config.interval
+            )
+            self._bars[ticker] = df
+            value = df['value'] if 'value' in df else df['close'] * df['volume']
+            values[ticker] = value
+
+        self._values = pd.DataFrame(values).sort_index() if values else pd.DataFrame()
+        self.prepare_seconds = time.monotonic() - started
+        Logger.print_info(f"  준비 완료: {len(self.metrics)}개 ({self.prepare_seconds:.1f}초)")
+        return list(self.metrics)
+
+    def replay(
+        self,
+        start=None,
+        end=None,
+        exclude_tickers: Optional[List[str]] = None
+    ) -> ScanReplayResult:
+        """
+        날짜별 선택 정책 재생
+
+        Args:
+            start: 시작 날짜 (None이면 처음부터)
+            end: 종료 날짜 (None이면 끝까지)
+            exclude_tickers: 항상 제외할 티커 (보유 코인 가정)
+
+        Returns:
+            ScanReplayResult
+        """
+        if self._values is None:
+            self.prepare()
+
+        started = time.monotonic()
+        values = self._values.loc[start:end] if len(self._values) else self._values
+        tickers = np.array(values.columns)
+        exclude = set(exclude_tickers or [])
+
+        selections: Dict[pd.Timestamp, List[str]] = {}
+        rows = []
+        for date, row in zip(values.index, values.to_numpy(dtype=float)):
+            stats = self.select_as_of(date, tickers, row, exclude)
+            selections[date] = stats.pop('selected')
+            stats['date'] = date
+            rows.append(stats)
+
+        daily_stats = pd.DataFrame(rows).set_index('date') if rows else pd.DataFrame()
+        replay_seconds = time.monotonic() - started
+        Logger.print_info(f"📼 스캔 재생 완료: {len(selections)}일 ({replay_seconds:.1f}초)")
+
+        return ScanReplayResult(
+            selections=selections,
+            daily_stats=daily_stats,
+            prepared_tickers=list(self.metrics),
+            prepare_seconds=self.prepare_seconds,
+            replay_seconds=replay_seconds
+        )
+
+    def select_as_of(
+        self,
+        date: pd.Timestamp,
+        tickers: np.ndarray,
+        values: np.ndarray,
+        exclude: set
+    ) -> Dict[str, Any]:
+        """
+        한 날짜의 선택 (CoinSelector.select_coins와 같은 단계, 로그/외부 조회 없음)
+
+        Returns:
+            단계별 코인 수와 선택 티커 ('selected')
+        """
+        selector = self.selector
+        scanner = selector.liquidity_scanner
+
+        # 1. 유동성 상위 N개 (해당 날짜 일봉 거래대금) → 보유 코인 제외
+        order = np.argsort(-np.nan_to_num(values, nan=-1.0), kind='stable')
+        top_coins: List[CoinInfo] = []
+        for i in order:
+            if len(top_coins) >= selector.liquidity_top_n or not values[i] >= selector.min_volume_krw:
+                break
+            coin = self._coin_info(tickers[i], date, values[i])
+            if coin is not None and scanner._passes_filter(coin, selector.min_volume_krw):
+                top_coins.append(coin)
+        coins = [c for c in top_coins if c.ticker not in exclude]
+        liquidity = len(coins)
+
+        # 1-1. 섹터 분산
+        if selector.enable_sector_diversification:
+            coins = selector.sector_diversifier.select_diversified(
+                coins=coins,
+                max_coins=selector.liquidity_top_n,
+                one_per_sector=selector.one_per_sector,
+                exclude_unknown=selector.exclude_unknown_sector
+            )
+        coins = coins[:selector.liquidity_top_n]
+
+        # 3. 백테스트 게이트 (시점별 지표)
+        scores = []
+        for coin in coins:
+            metrics = self.metrics[coin.ticker].as_of(date)
+            if metrics is not None:
+                scores.append(selector.multi_backtest.score_metrics(coin.ticker, metrics, coin_info=coin))
+        scores.sort(key=lambda r: r.score, reverse=True)
+        scores = scores[:selector.backtest_top_n]
+        passed = [r for r in scores if r.passed]
+
+        # 4. 후보 생성 + Trading Pass
+        candidates: List[CoinCandidate] = []
+        for bt_result in passed:
+            candidate = selector._create_candidate(bt_result=bt_result, entry_signal=None)
+            pass_result = self._trading_filter.evaluate_trading_pass(bt_result.metrics)
+            candidate.trading_pass_passed = pass_result.passed
+            candidate.trading_pass_reason = pass_result.reason
+            if not pass_result.passed:
+                candidate.selected = False
+            candidates.append(candidate)
+
+        # 5. 최종 선택
+        selectable = sorted((c for c in candidates if c.selected), key=lambda c: c.final_score, reverse=True)
+        selected = [c.ticker for c in selectable[:selector.final_select_n]]
+
+        return {
+            'liquidity': liquidity,
+            'diversified': len(coins),
+            'backtested': len(scores),
+            'research_passed': len(passed),
+            'trading_passed': sum(1 for c in candidates if c.trading_pass_passed),
+            'selected': selected,
+        }
+
+    def _coin_info(self, ticker: str, date: pd.Timestamp, value: float) -> Optional[CoinInfo]:
+        """해당 날짜 일봉으로 CoinInfo 구성 (24시간 지표 = 당일 일봉)"""
+        df = self._bars[ticker]
+        position = self.metrics[ticker].position_at(date)
+        if position is None:
+            return None
+        bar = df.iloc[position]
+        open_price = float(bar['open'])
+        return CoinInfo(
+            ticker=ticker,
+            symbol=ticker.replace("KRW-", ""),
+            korean_name=ticker,
+            current_price=float(bar['close']),
+            volume_24h=float(bar['volume']),
+            acc_trade_price_24h=float(value),
+            signed_change_rate=float(bar['close']) / open_price - 1 if open_price > 0 else 0.0,
+            high_price=float(bar['high']),
+            low_price=float(bar['low']),
+            scan_time=pd.Timestamp(date).to_pydatetime()
+        )
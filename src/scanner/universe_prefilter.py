@@ -0,0 +1,488 @@
+"""
+전체 마켓 사전 필터 (Universe Prefilter) - 2단 스캔의 1단계
+
+업비트 KRW 전체 마켓(~200개)을 매 사이클 저비용으로 훑어
+백테스팅(2단계)에 넘길 상위 후보만 추립니다.
+
+■ 입력 (API 호출 최소화):
+  - 멀티마켓 시세 응답 1회 (현재가, 24시간 거래대금)
+  - 캐시된 일봉 (OHLCV + 거래대금) - 하루 한 번만 갱신
+
+■ 지표 (코인 × 일자 패널 배열에서 벡터 연산):
+  - 모멘텀: N일 수익률
+  - 변동성: 일간 로그수익률 표준편차 (범위 밖이면 제외)
+  - BB 스퀴즈: 현재 밴드폭의 최근 밴드폭 대비 백분위 (낮을수록 수축)
+  - 거래대금 z-score: 24시간 거래대금의 최근 일별 거래대금 대비 편차
+
+■ 점수:
+  - 지표별 횡단면 백분위 순위의 가중합
+  - 이력이 부족한 코인(신규 상장 등)은 제외
+
+■ 시간 예산:
+  - 캐시에 없는 일봉은 fetch_budget_seconds 안에서만 수집
+  - 예산 안에 못 받은 코인은 이번 사이클 제외, 다음 사이클에 캐시가 채워짐
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, timedelta, date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyupbit
+
+from src.scanner.liquidity_scanner import CoinInfo, LiquidityScanner
+from src.utils.logger import Logger
+
+
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'value')
+
+
+@dataclass
+class PrefilterResult:
+    """사전 필터 결과"""
+    survivors: List[CoinInfo]                       # 점수 순 상위 코인
+    scores: Dict[str, float]                        # ticker -> 종합 점수
+    features: Dict[str, Dict[str, float]]           # ticker -> 지표값
+    universe: int = 0                               # 전체 KRW 마켓 수
+    eligible: int = 0                               # 유동성/제외 필터 통과 수
+    scored: int = 0                                 # 지표 계산 대상 수 (이력 충분)
+    history_cached: int = 0                         # 캐시로 처리한 일봉 수
+    history_fetched: int = 0                        # 이번에 수집한 일봉 수
+    history_missing: int = 0                        # 예산 초과/실패로 누락된 수
+    duration_seconds: float = 0.0
+    scan_time: datetime = field(default_factory=datetime.now)
+
+    def to_stats(self) -> Dict[str, float]:
+        """스캔 요약용 통계"""
+        return {
+            'universe': self.universe,
+            'eligible': self.eligible,
+            'scored': self.scored,
+            'survivors': len(self.survivors),
+            'history_cached': self.history_cached,
+            'history_fetched': self.history_fetched,
+            'history_missing': self.history_missing,
+            'seconds': round(self.duration_seconds, 2),
+        }
+
+
+class DailyBarCache:
+    """
+    전체 마켓 일봉 캐시
+
+    완료된 일봉만 보관하며 (당일 진행 중 캔들 제외),
+    마지막 완료 일봉이 어제(UTC, 업비트 일봉 기준 09:00 KST)면 최신으로 간주합니다.
+    하루 한 번만 코인별 수집이 필요하고, 이후 사이클은 캐시만 사용합니다.
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = None,
+        lookback_days: int = 60,
+        max_concurrent: int = 4,
+        rate_limit_delay: float = 0.1
+    ):
+        """
+        Args:
+            cache_path: 디스크 캐시 경로 (None이면 메모리만 사용)
+            lookback_days: 보관할 완료 일봉 수
+            max_concurrent: 동시 수집 수
+            rate_limit_delay: 코인별 수집 후 지연 (초)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.lookback_days = lookback_days
+        self.max_concurrent = max_concurrent
+        self.rate_limit_delay = rate_limit_delay
+        self._bars: Dict[str, pd.DataFrame] = {}
+        self._loaded = False
+
+    @staticmethod
+    def last_completed_day(now: Optional[datetime] = None) -> date:
+        """마지막 완료 일봉 날짜 (업비트 일봉은 UTC 00:00 = KST 09:00 시작)"""
+        now = now or datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        return (now.astimezone(timezone.utc) - timedelta(days=1)).date()
+
+    def is_fresh(self, ticker: str, as_of: date) -> bool:
+        """캐시된 일봉이 as_of 날짜까지 있는지"""
+        bars = self._bars.get(ticker)
+        return bars is not None and len(bars) > 0 and bars.index[-1].date() >= as_of
+
+    def get(self, ticker: str) -> Optional[pd.DataFrame]:
+        """캐시된 일봉 반환"""
+        return self._bars.get(ticker)
+
+    def put(self, ticker: str, df: pd.DataFrame, as_of: date) -> None:
+        """일봉 저장 (as_of 이후의 진행 중 캔들 제외, lookback 만큼만 보관)"""
+        bars = df[[c for c in BAR_FIELDS if c in df.columns]].copy()
+        bars.index = pd.DatetimeIndex(bars.index).normalize()
+        bars = bars[bars.index.date <= as_of]
+        self._bars[ticker] = bars.tail(self.lookback_days)
+
+    async def refresh(
+        self,
+        tickers: List[str],
+        as_of: Optional[date] = None,
+        budget_seconds: Optional[float] = None
+    ) -> Tuple[int, int, int]:
+        """
+        오래된 코인만 일봉 수집
+
+        Args:
+            tickers: 대상 티커
+            as_of: 기준 완료 일봉 날짜 (None이면 어제)
+            budget_seconds: 수집 시간 예산 (None이면 제한 없음)
+
+        Returns:
+            (캐시 사용 수, 수집 수, 누락 수)
+        """
+        as_of = as_of or self.last_completed_day()
+        self._load()
+
+        stale = [t for t in tickers if not self.is_fresh(t, as_of)]
+        cached = len(tickers) - len(stale)
+        if not stale:
+            return cached, 0, 0
+
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        # 신규 상장일 등으로 과거가 짧아도 진행 중 캔들 1개를 더 받음
+        count = self.lookback_days + 1
+
+        async def fetch(ticker: str) -> bool:
+            async with semaphore:
+                try:
+                    df = await loop.run_in_executor(
+                        None,
+                        lambda: pyupbit.get_ohlcv(ticker, interval="day", count=count)
+                    )
+                    await asyncio.sleep(self.rate_limit_delay)
+                except Exception as e:
+                    Logger.print_warning(f"  일봉 수집 실패 ({ticker}): {str(e)}")
+                    return False
+                if df is None or len(df) == 0:
+                    return False
+                self.put(ticker, df, as_of)
+                return True
+
+        tasks = [asyncio.ensure_future(fetch(t)) for t in stale]
+        done, pending = await asyncio.wait(tasks, timeout=budget_seconds)
+        for task in pending:
+            task.cancel()
+
+        fetched = sum(1 for task in done if not task.cancelled() and task.exception() is None and task.result())
+        if pending:
+            Logger.print_warning(
+                f"  일봉 수집 예산 초과: {len(pending)}개 다음 사이클로 연기"
+            )
+        if fetched:
+            self._save()
+        return cached, fetched, len(stale) - fetched
+
+    def _load(self) -> None:
+        """디스크 캐시 로드 (최초 1회)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            stored = pd.read_parquet(self.cache_path)
+            for ticker, bars in stored.groupby('ticker'):
+                self._bars[ticker] = bars.drop(columns='ticker').set_index('date').sort_index()
+        except Exception as e:
+            Logger.print_warning(f"일봉 캐시 로드 실패: {str(e)}")
+
+    def _save(self) -> None:
+        """디스크 캐시 저장 (long format: ticker, date, OHLC, value)"""
+        if self.cache_path is None or not self._bars:
+            return
+        try:
+            frames = [
+                bars.rename_axis('date').reset_index().assign(ticker=ticker)
+                for ticker, bars in self._bars.items()
+            ]
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            pd.concat(frames, ignore_index=True).to_parquet(self.cache_path)
+        except Exception as e:
+            Logger.print_warning(f"일봉 캐시 저장 실패: {str(e)}")
+
+
+def _nan_rank(values: np.ndarray) -> np.ndarray:
+    """횡단면 백분위 순위 (0~1, NaN은 0)"""
+    ranks = np.zeros(len(values))
+    valid = ~np.isnan(values)
+    count = int(valid.sum())
+    if count == 0:
+        return ranks
+    if count == 1:
+        ranks[valid] = 1.0
+        return ranks
+    order = values[valid].argsort().argsort()
+    ranks[valid] = order / (count - 1)
+    return ranks
+
+
+def compute_panel_features(
+    closes: np.ndarray,
+    values: np.ndarray,
+    current_value: np.ndarray,
+    momentum_window: int = 20,
+    volatility_window: int = 20,
+    bb_window: int = 20,
+    volume_window: int = 20
+) -> Dict[str, np.ndarray]:
+    """
+    패널 배열에서 지표 벡터 계산
+
+    Args:
+        closes: (코인 수, 일수) 종가 패널, 마지막 열은 현재가 (이력 부족분은 앞쪽 NaN)
+        values: (코인 수, 일수-1) 완료 일봉 거래대금 패널
+        current_value: (코인 수,) 24시간 거래대금
+        momentum_window: 모멘텀 기간
+        volatility_window: 변동성 기간
+        bb_window: 볼린저 밴드 기간
+        volume_window: 거래대금 z-score 기간
+
+    Returns:
+        지표명 -> (코인 수,) 배열
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        momentum = closes[:, -1] / closes[:, -1 - momentum_window] - 1
+
+        log_returns = np.diff(np.log(closes), axis=1)
+        volatility = np.std(log_returns[:, -volatility_window:], axis=1, ddof=1) * 100
+
+        # 볼린저 밴드폭 시계열: (코인, 윈도우 수, bb_window)
+        windows = np.lib.stride_tricks.sliding_window_view(closes, bb_window, axis=1)
+        bandwidth = 4 * windows.std(axis=2, ddof=0) / windows.mean(axis=2)
+        history = bandwidth[:, :-1]
+        valid_history = ~np.isnan(history)
+        below = np.where(valid_history, history <= bandwidth[:, -1:], False).sum(axis=1)
+        squeeze = below / valid_history.sum(axis=1)
+        squeeze[np.isnan(bandwidth[:, -1])] = np.nan
+
+        recent = values[:, -volume_window:]
+        spread = recent.std(axis=1, ddof=1)
+        volume_z = np.where(spread > 0, (current_value - recent.mean(axis=1)) / spread, np.nan)
+
+    return {
+        'momentum': momentum,
+        'volatility': volatility,
+        'bb_squeeze': squeeze,
+        'volume_z': volume_z,
+    }
+
+
+class UniversePrefilter:
+    """
+    전체 마켓 사전 필터 (2단 스캔의 1단계)
+
+    사용 예시:
+        prefilter = UniversePrefilter(liquidity_scanner, cache=DailyBarCache(path))
+        result = await prefilter.run(top_n=20)
+        tickers = [c.ticker for c in result.survivors]
+    """
+
+    def __init__(
+        self,
+        liquidity_scanner: LiquidityScanner,
+        cache: Optional[DailyBarCache] = None,
+        min_volume_krw: float = 1_000_000_000,
+        min_history_days: int = 30,
+        min_volatility: float = 1.0,
+        max_volatility: float = 15.0,
+        fetch_budget_seconds: float = 60.0,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            liquidity_scanner: 멀티마켓 시세 조회용 스캐너
+            cache: 일봉 캐시 (None이면 메모리 캐시)
+            min_volume_krw: 1단계 최소 24시간 거래대금
+            min_history_days: 지표 계산에 필요한 최소 완료 일봉 수
+            min_volatility: 일간 변동성 하한 (%), 미만이면 제외
+            max_volatility: 일간 변동성 상한 (%), 초과면 제외
+            fetch_budget_seconds: 일봉 수집 시간 예산 (초)
+            weights: 지표별 가중치 (momentum, volume_z, bb_squeeze)
+        """
+        self.liquidity_scanner = liquidity_scanner
+        self.cache = cache or DailyBarCache()
+        self.min_volume_krw = min_volume_krw
+        self.min_history_days = min_history_days
+        self.min_volatility = min_volatility
+        self.max_volatility = max_volatility
+        self.fetch_budget_seconds = fetch_budget_seconds
+        self.weights = weights or {'momentum': 0.4, 'volume_z': 0.3, 'bb_squeeze': 0.3}
+
+    async def run(
+        self,
+        top_n: int,
+        exclude_tickers: Optional[List[str]] = None,
+        survivor_min_volume_krw: float = 0.0
+    ) -> PrefilterResult:
+        """
+        전체 마켓 사전 필터 실행
+
+        Args:
+            top_n: 2단계로 넘길 코인 수
+            exclude_tickers: 제외할 티커 (보유 코인)
+            survivor_min_volume_krw: 생존 코인 최소 24시간 거래대금 (2단계 적격 기준).
+                지표 순위는 min_volume_krw 전체 마켓 기준으로 계산합니다.
+
+        Returns:
+            PrefilterResult
+        """
+        started = time.monotonic()
+        exclude = set(exclude_tickers or [])
+
+        coins = await self.liquidity_scanner.scan_universe(min_volume_krw=self.min_volume_krw)
+        universe = self.liquidity_scanner.last_universe_size
+        coins = [c for c in coins if c.ticker not in exclude]
+
+        result = PrefilterResult(survivors=[], scores={}, features={}, universe=universe, eligible=len(coins))
+        if not coins:
+            result.duration_seconds = time.monotonic() - started
+            return result
+
+        as_of = self.cache.last_completed_day()
+        cached, fetched, missing = await self.cache.refresh(
+            [c.ticker for c in coins],
+            as_of=as_of,
+            budget_seconds=self.fetch_budget_seconds
+        )
+        result.history_cached = cached
+        result.history_fetched = fetched
+        result.history_missing = missing
+
+        scored_coins, panels = self._build_panel(coins)
+        result.scored = len(scored_coins)
+        if scored_coins:
+            self._score(scored_coins, panels, result, top_n, survivor_min_volume_krw)
+
+        result.duration_seconds = time.monotonic() - started
+        return result
+
+    def _build_panel(self, coins: List[CoinInfo]) -> Tuple[List[CoinInfo], Dict[str, np.ndarray]]:
+        """이력이 충분한 코인으로 (코인 × 일자) 패널 구성, 최근 일자 기준 오른쪽 정렬"""
+        days = self.cache.lookback_days
+        selected: List[CoinInfo] = []
+        rows: Dict[str, List[np.ndarray]] = {f: [] for f in BAR_FIELDS}
+
+        for coin in coins:
+            bars = self.cache.get(coin.ticker)
+            if bars is None or len(bars) < self.min_history_days:
+                continue
+            selected.append(coin)
+            for name in BAR_FIELDS:
+                column = bars[name].to_numpy(dtype=float)[-days:]
+                padded = np.full(days, np.nan)
+                padded[days - len(column):] = column
+                rows[name].append(padded)
+
+        if not selected:
+            return [], {}
+
+        panels = {name: np.vstack(rows[name]) for name in BAR_FIELDS}
+        price = np.array([c.current_price for c in selected], dtype=float)
+        panels['closes'] = np.column_stack([panels['close'], price])
+        panels['current_value'] = np.array([c.acc_trade_price_24h for c in selected], dtype=float)
+        return selected, panels
+
+    def _score(
+        self,
+        coins: List[CoinInfo],
+        panels: Dict[str, np.ndarray],
+        result: PrefilterResult,
+        top_n: int,
+        survivor_min_volume_krw: float = 0.0
+    ) -> None:
+        """지표 계산 → 변동성 범위 필터 → 가중 순위 → 2단계 적격 코인 중 상위 N개"""
+        features = compute_panel_features(
+            closes=panels['closes'],
+            values=panels['value'],
+            current_value=panels['current_value']
+        )
+
+        ranked = (
+            self.weights.get('momentum', 0.0) * _nan_rank(features['momentum'])
+            + self.weights.get('volume_z', 0.0) * _nan_rank(features['volume_z'])
+            # 밴드폭이 과거 대비 좁을수록(백분위 낮을수록) 높은 점수
+            + self.weights.get('bb_squeeze', 0.0) * _nan_rank(-features['bb_squeeze'])
+        )
+        score = ranked / max(sum(self.weights.values()), 1e-9) * 100
+
+        volatility = features['volatility']
+        in_range = (volatility >= self.min_volatility) & (volatility <= self.max_volatility)
+        score = np.where(in_range, score, np.nan)
+
+        atr_7d, avg_value_7d = self._weekly_stats(panels)
+
+        for i, coin in enumerate(coins):
+            result.features[coin.ticker] = {name: float(values[i]) for name, values in features.items()}
+            if not np.isnan(score[i]):
+                result.scores[coin.ticker] = round(float(score[i]), 1)
+
+        order = [
+            i for i in np.argsort(-np.nan_to_num(score, nan=-1.0))
+            if not np.isnan(score[i]) and coins[i].acc_trade_price_24h >= survivor_min_volume_krw
+        ]
+        for i in order[:top_n]:
+            coin = coins[i]
+            # 1단계에서 이미 가진 일봉으로 7일 변동성 채움 (코인별 추가 API 호출 불필요)
+            if not np.isnan(atr_7d[i]):
+                coin.volatility_7d = float(atr_7d[i])
+            if not np.isnan(avg_value_7d[i]):
+                coin.avg_volume_7d = float(avg_value_7d[i])
+            result.survivors.append(coin)
+
+    @staticmethod
+    def _weekly_stats(panels: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """7일 ATR(%)과 7일 평균 거래대금"""
+        high = panels['high'][:, -7:]
+        low = panels['low'][:, -7:]
+        prev_close = panels['close'][:, -8:-1]
+        true_range = np.maximum.reduce([
+            high - low,
+            np.abs(high - prev_close),
+            np.abs(low - prev_close),
+        ])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            atr_pct = true_range.mean(axis=1) / panels['close'][:, -1] * 100
+        return atr_pct, panels['value'][:, -7:].mean(axis=1)
+
+
+def create_universe_prefilter(
+    liquidity_scanner: LiquidityScanner,
+    data_dir: str = "./data/historical"
+) -> UniversePrefilter:
+    """
+    ScannerConfig 기반 사전 필터 생성
+
+    Args:
+        liquidity_scanner: 멀티마켓 시세 조회용 스캐너
+        data_dir: HistoricalDataSync 데이터 디렉토리 (일봉 캐시는 하위 universe/에 저장,
+            코인별 parquet 정리/요약 대상에서 제외)
+
+    Returns:
+        UniversePrefilter
+    """
+    from src.config.settings import ScannerConfig
+
+    cache = DailyBarCache(
+        cache_path=Path(data_dir) / "universe" / "universe_daily.parquet",
+        lookback_days=ScannerConfig.PREFILTER_LOOKBACK_DAYS
+    )
+    return UniversePrefilter(
+        liquidity_scanner=liquidity_scanner,
+        cache=cache,
+        min_volume_krw=ScannerConfig.PREFILTER_MIN_VOLUME_KRW,
+        min_history_days=ScannerConfig.PREFILTER_MIN_HISTORY_DAYS,
+        min_volatility=ScannerConfig.PREFILTER_MIN_VOLATILITY,
+        max_volatility=ScannerConfig.PREFILTER_MAX_VOLATILITY,
+        fetch_budget_seconds=ScannerConfig.PREFILTER_FETCH_BUDGET
+    )
@@ -1,12 +1,14 @@
 """
 유동성 분석기 - 오더북 기반 슬리피지 계산
 
+호가창은 OrderbookSnapshot(누적 깊이 배열)으로 한 번만 변환하여 계산합니다.
 실전 거래에서 호가창 데이터를 기반으로 슬리피지를 사전 계산합니다.
 대량 매수/매도 시 슬리피지를 예측하여 거래 차단 또는 분할 주문을 결정합니다.
 """
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 from ..utils.logger import Logger
 from ..config.settings import SlippageConfig
+from .orderbook_depth import DepthLevels, OrderbookSnapshot
 
 
 class LiquidityAnalyzer:
@@ -22,7 +24,7 @@ class LiquidityAnalyzer:
         오더북 기반 슬리피지 계산
 
         Args:
-            orderbook: 호가창 데이터 (Upbit API 응답)
+            orderbook: 호가창 데이터 (Upbit API 응답 또는 OrderbookSnapshot)
                 {
                     'orderbook_units': [
                         {
@@ -57,8 +59,8 @@ class LiquidityAnalyzer:
             }
 
         # 엣지 케이스: 호가창이 비어있음
-        orderbook_units = orderbook.get('orderbook_units', [])
-        if not orderbook_units:
+        snapshot = OrderbookSnapshot.coerce(orderbook)
+        if snapshot.is_empty:
             return {
                 'expected_slippage_pct': float('inf'),
                 'expected_avg_price': 0,
@@ -69,13 +71,40 @@ class LiquidityAnalyzer:
 
         if order_side == 'buy':
             # 매수 시: 매도 호가창 확인
-            return LiquidityAnalyzer._calculate_buy_slippage(orderbook_units, order_krw_amount)
+            return LiquidityAnalyzer._calculate_buy_slippage(snapshot.asks, order_krw_amount)
         else:
             # 매도 시: 매수 호가창 확인
-            return LiquidityAnalyzer._calculate_sell_slippage(orderbook_units, order_krw_amount)
+            return LiquidityAnalyzer._calculate_sell_slippage(snapshot.bids, order_krw_amount)
 
     @staticmethod
-    def _calculate_buy_slippage(asks: List[Dict], order_krw_amount: float) -> Dict:
+    def _invalid_book(asks_or_bids: DepthLevels) -> Optional[Dict]:
+        """호가 데이터가 없거나 최우선 호가가 유효하지 않으면 결과 반환"""
+        if asks_or_bids.raw_levels == 0:
+            warning = '오더북 데이터 없음'
+        elif asks_or_bids.best_price <= 0:
+            warning = '유효하지 않은 호가'
+        else:
+            return None
+        return {
+            'expected_slippage_pct': 0.0,
+            'expected_avg_price': 0,
+            'liquidity_available': False,
+            'required_levels': 0,
+            'warning': warning
+        }
+
+    @staticmethod
+    def _slippage_warning(slippage_pct: float, levels_used: int) -> str:
+        """경고 메시지 (설정값 사용)"""
+        warning_threshold = SlippageConfig.WARNING_SLIPPAGE_PCT
+        if abs(slippage_pct) > warning_threshold:
+            return f"⚠️ 높은 슬리피지 예상: {abs(slippage_pct):.2f}%"
+        if levels_used > 5:
+            return f"⚠️ 많은 호가 단계 사용: {levels_used}단계"
+        return ""
+
+    @staticmethod
+    def _calculate_buy_slippage(asks: DepthLevels, order_krw_amount: float) -> Dict:
         """
         매수 슬리피지 계산
 
@@ -83,92 +112,42 @@ class LiquidityAnalyzer:
         주문 금액이 클수록 더 높은 가격에 체결됩니다.
 
         Args:
-            asks: 매도 호가창 리스트
+            asks: 매도 호가 누적 깊이
             order_krw_amount: 주문 금액 (KRW)
 
         Returns:
             슬리피지 정보 딕셔너리
         """
-        if not asks:
-            return {
-                'expected_slippage_pct': 0.0,
-                'expected_avg_price': 0,
-                'liquidity_available': False,
-                'required_levels': 0,
-                'warning': '오더북 데이터 없음'
-            }
+        invalid = LiquidityAnalyzer._invalid_book(asks)
+        if invalid:
+            return invalid
 
-        best_ask = asks[0].get('ask_price', 0)
-        if best_ask <= 0:
-            return {
-                'expected_slippage_pct': 0.0,
-                'expected_avg_price': 0,
-                'liquidity_available': False,
-                'required_levels': 0,
-                'warning': '유효하지 않은 호가'
-            }
+        best_ask = asks.best_price
+        fill = asks.fill_notional(order_krw_amount)
 
-        total_krw = 0.0
-        total_volume = 0.0
-        levels_used = 0
-
-        for level in asks:
-            ask_price = level.get('ask_price', 0)
-            ask_size = level.get('ask_size', 0)
-
-            if ask_price <= 0 or ask_size <= 0:
-                continue
-
-            ask_krw = ask_price * ask_size
-
-            if total_krw + ask_krw >= order_krw_amount:
-                # 마지막 단계: 부분 체결
-                remaining_krw = order_krw_amount - total_krw
-                partial_volume = remaining_krw / ask_price
-                total_volume += partial_volume
-                total_krw += remaining_krw
-                levels_used += 1
-                break
-            else:
-                # 전체 체결
-                total_volume += ask_size
-                total_krw += ask_krw
-                levels_used += 1
-
-        if total_krw < order_krw_amount:
+        if not fill.complete:
             # 유동성 부족
             return {
                 'expected_slippage_pct': float('inf'),
                 'expected_avg_price': 0,
                 'liquidity_available': False,
-                'required_levels': len(asks),
-                'warning': f'⚠️ 유동성 부족: 호가창에 {total_krw:,.0f}원만 가능 (주문: {order_krw_amount:,.0f}원)'
+                'required_levels': asks.raw_levels,
+                'warning': f'⚠️ 유동성 부족: 호가창에 {asks.total_notional:,.0f}원만 가능 (주문: {order_krw_amount:,.0f}원)'
             }
 
-        # 평균 체결가 계산
-        avg_price = total_krw / total_volume if total_volume > 0 else best_ask
-
-        # 슬리피지 계산
-        slippage_pct = ((avg_price - best_ask) / best_ask) * 100 if best_ask > 0 else 0
-
-        # 경고 메시지 (설정값 사용)
-        warning = ""
-        warning_threshold = SlippageConfig.WARNING_SLIPPAGE_PCT
-        if slippage_pct > warning_threshold:
-            warning = f"⚠️ 높은 슬리피지 예상: {slippage_pct:.2f}%"
-        elif levels_used > 5:
-            warning = f"⚠️ 많은 호가 단계 사용: {levels_used}단계"
+        avg_price = fill.avg_price if fill.filled_size > 0 else best_ask
+        slippage_pct = ((avg_price - best_ask) / best_ask) * 100
 
         return {
             'expected_slippage_pct': slippage_pct,
             'expected_avg_price': avg_price,
             'liquidity_available': True,
-            'required_levels': levels_used,
-            'warning': warning
+            'required_levels': fill.levels,
+            'warning': LiquidityAnalyzer._slippage_warning(slippage_pct, fill.levels)
         }
 
     @staticmethod
-    def _calculate_sell_slippage(bids: List[Dict], coin_amount: float) -> Dict:
+    def _calculate_sell_slippage(bids: DepthLevels, coin_amount: float) -> Dict:
         """
         매도 슬리피지 계산
 
@@ -176,91 +155,71 @@ class LiquidityAnalyzer:
         주문 수량이 클수록 더 낮은 가격에 체결됩니다.
 
         Args:
-            bids: 매수 호가창 리스트
+            bids: 매수 호가 누적 깊이
             coin_amount: 매도할 코인 수량
 
         Returns:
             슬리피지 정보 딕셔너리
         """
-        if not bids:
-            return {
-                'expected_slippage_pct': 0.0,
-                'expected_avg_price': 0,
-                'liquidity_available': False,
-                'required_levels': 0,
-                'warning': '오더북 데이터 없음'
-            }
+        invalid = LiquidityAnalyzer._invalid_book(bids)
+        if invalid:
+            return invalid
 
-        best_bid = bids[0].get('bid_price', 0)
-        if best_bid <= 0:
-            return {
-                'expected_slippage_pct': 0.0,
-                'expected_avg_price': 0,
-                'liquidity_available': False,
-                'required_levels': 0,
-                'warning': '유효하지 않은 호가'
-            }
+        best_bid = bids.best_price
+        fill = bids.fill_size(coin_amount)
 
-        total_krw = 0.0
-        total_volume = 0.0
-        levels_used = 0
-
-        remaining_coin = coin_amount
-
-        for level in bids:
-            bid_price = level.get('bid_price', 0)
-            bid_size = level.get('bid_size', 0)
-
-            if bid_price <= 0 or bid_size <= 0:
-                continue
-
-            if remaining_coin <= 0:
-                break
-
-            if remaining_coin >= bid_size:
-                # 전체 체결
-                total_volume += bid_size
-                total_krw += bid_price * bid_size
-                remaining_coin -= bid_size
-                levels_used += 1
-            else:
-                # 부분 체결
-                total_volume += remaining_coin
-                total_krw += bid_price * remaining_coin
-                remaining_coin = 0
-                levels_used += 1
-                break
-
-        if remaining_coin > 0:
+        if not fill.complete:
             # 유동성 부족
             return {
                 'expected_slippage_pct': float('inf'),
                 'expected_avg_price': 0,
                 'liquidity_available': False,
-                'required_levels': len(bids),
-                'warning': f'⚠️ 유동성 부족: 호가창에 {total_volume:.8f}개만 가능 (주문: {coin_amount:.8f}개)'
+                'required_levels': bids.raw_levels,
+                'warning': f'⚠️ 유동성 부족: 호가창에 {bids.total_size:.8f}개만 가능 (주문: {coin_amount:.8f}개)'
             }
 
-        # 평균 체결가 계산
-        avg_price = total_krw / total_volume if total_volume > 0 else best_bid
+        avg_price = fill.avg_price if fill.filled_size > 0 else best_bid
 
         # 슬리피지 계산 (매도는 음수)
-        slippage_pct = ((avg_price - best_bid) / best_bid) * 100 if best_bid > 0 else 0
-
-        # 경고 메시지 (설정값 사용)
-        warning = ""
-        warning_threshold = SlippageConfig.WARNING_SLIPPAGE_PCT
-        if abs(slippage_pct) > warning_threshold:
-            warning = f"⚠️ 높은 슬리피지 예상: {abs(slippage_pct):.2f}%"
-        elif levels_used > 5:
-            warning = f"⚠️ 많은 호가 단계 사용: {levels_used}단계"
+        slippage_pct = ((avg_price - best_bid) / best_bid) * 100
 
         return {
             'expected_slippage_pct': abs(slippage_pct),  # 절대값 반환
             'expected_avg_price': avg_price,
             'liquidity_available': True,
-            'required_levels': levels_used,
-            'warning': warning
+            'required_levels': fill.levels,
+            'warning': LiquidityAnalyzer._slippage_warning(slippage_pct, fill.levels)
+        }
+
+    @staticmethod
+    def max_order_within_slippage(
+        orderbook: Dict,
+        order_side: str,
+        max_slippage_pct: float = None
+    ) -> Dict:
+        """
+        허용 슬리피지 이내로 체결 가능한 최대 주문 규모
+
+        Args:
+            orderbook: 호가창 데이터 (Upbit API 응답 또는 OrderbookSnapshot)
+            order_side: 'buy' 또는 'sell'
+            max_slippage_pct: 최대 허용 슬리피지 (%, 기본 SlippageConfig.MAX_SLIPPAGE_PCT)
+
+        Returns:
+            {
+                'max_size': float,      # 최대 수량 (코인)
+                'max_krw_amount': float # 최대 금액 (KRW)
+            }
+        """
+        if max_slippage_pct is None:
+            max_slippage_pct = SlippageConfig.MAX_SLIPPAGE_PCT
+
+        levels = OrderbookSnapshot.coerce(orderbook).side(order_side)
+        max_size = levels.max_size_within(max_slippage_pct)
+        fill = levels.fill_size(max_size)
+        return {
+            'max_size': max_size,
+            'max_krw_amount': fill.filled_notional
         }
 
     @staticmethod
@@ -0,0 +1,293 @@
+"""
+오더북 깊이 인덱스 - 누적 배열 기반 체결 시뮬레이션
+
+Upbit `orderbook_units`(또는 백테스트용 요약 호가)를 한 번만 변환하여
+호가별 누적 수량/누적 금액 NumPy 배열로 보관합니다.
+이후 질의는 호가를 다시 순회하지 않고 `searchsorted`로 O(log 호가수)에 답합니다.
+
+- X원 매수 시 평균 체결가 (fill_notional)
+- X개 매매 시 평균 체결가 (fill_size)
+- 슬리피지 Y% 이내로 체결 가능한 최대 수량 (max_size_within)
+- 최적 분할 개수 (optimal_splits)
+
+사용 예시:
+    snapshot = OrderbookSnapshot.coerce(upbit.get_orderbook("KRW-BTC"))
+    fill = snapshot.side('buy').fill_notional(5_000_000)
+    print(fill.avg_price, fill.levels)
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class DepthFill:
+    """
+    체결 시뮬레이션 결과
+
+    Attributes:
+        avg_price: 평균 체결가 (체결 수량 없으면 0)
+        filled_size: 체결 수량
+        filled_notional: 체결 금액 (KRW)
+        levels: 사용한 호가 단계 수
+        complete: 요청량 전체 체결 여부 (False면 호가창 전체 소진)
+    """
+    avg_price: float
+    filled_size: float
+    filled_notional: float
+    levels: int
+    complete: bool
+
+
+class DepthLevels:
+    """
+    호가창 한쪽(매도 호가 또는 매수 호가)의 누적 깊이
+
+    가격/수량이 0 이하인 호가는 변환 시 한 번만 제외합니다.
+    best_price는 원본 첫 호가 가격이며 (유효성 판단용), raw_levels는 원본 호가 수입니다.
+
+    Args:
+        prices: 호가 가격 (체결 순서: 매도 호가 오름차순, 매수 호가 내림차순)
+        sizes: 호가별 수량
+        is_ask: 매도 호가(매수 주문이 소진) 여부
+    """
+
+    def __init__(self, prices: Sequence[float], sizes: Sequence[float], is_ask: bool):
+        raw_prices = np.asarray(prices, dtype=float)
+        raw_sizes = np.asarray(sizes, dtype=float)
+        count = min(len(raw_prices), len(raw_sizes))
+        raw_prices, raw_sizes = raw_prices[:count], raw_sizes[:count]
+        # 고정폭 기록의 빈 호가(NaN)는 원본 호가로 세지 않음
+        present = ~np.isnan(raw_prices)
+        raw_prices, raw_sizes = raw_prices[present], raw_sizes[present]
+
+        self.is_ask = is_ask
+        self.raw_levels = len(raw_prices)
+        self.best_price = float(raw_prices[0]) if self.raw_levels else 0.0
+
+        valid = (raw_prices > 0) & (raw_sizes > 0)  # NaN 수량도 제외
+        self.prices = raw_prices[valid]
+        self.sizes = raw_sizes[valid]
+        self.cum_size = np.cumsum(self.sizes)
+        self.cum_notional = np.cumsum(self.prices * self.sizes)
+        # 해당 호가까지 전부 소진했을 때의 평균 체결가 (매도 호가는 비감소, 매수 호가는 비증가)
+        self.cum_avg_price = (
+            self.cum_notional / self.cum_size if len(self.prices) else np.empty(0)
+        )
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def total_size(self) -> float:
+        """호가창 전체 수량"""
+        return float(self.cum_size[-1]) if len(self) else 0.0
+
+    @property
+    def total_notional(self) -> float:
+        """호가창 전체 금액 (KRW)"""
+        return float(self.cum_notional[-1]) if len(self) else 0.0
+
+    def _fill(self, cumulative: np.ndarray, amount: float, by_notional: bool) -> DepthFill:
+        n = len(self)
+        if n == 0 or amount <= 0:
+            return DepthFill(0.0, 0.0, 0.0, 0, complete=amount <= 0)
+
+        k = int(np.searchsorted(cumulative, amount, side='left'))
+        if k >= n:
+            return DepthFill(
+                avg_price=self.total_notional / self.total_size,
+                filled_size=self.total_size,
+                filled_notional=self.total_notional,
+                levels=n,
+                complete=False
+            )
+
+        prev_size = float(self.cum_size[k - 1]) if k > 0 else 0.0
+        prev_notional = float(self.cum_notional[k - 1]) if k > 0 else 0.0
+        price = float(self.prices[k])
+        if by_notional:
+            notional = float(amount)
+            size = prev_size + (notional - prev_notional) / price
+        else:
+            size = float(amount)
+            notional = prev_notional + (size - prev_size) * price
+
+        return DepthFill(
+            avg_price=notional / size,
+            filled_size=size,
+            filled_notional=notional,
+            levels=k + 1,
+            complete=True
+        )
+
+    def fill_notional(self, krw_amount: float) -> DepthFill:
+        """
+        금액(KRW) 기준 체결 시뮬레이션
+
+        Args:
+            krw_amount: 주문 금액 (KRW)
+
+        Returns:
+            DepthFill
+        """
+        return self._fill(self.cum_notional, krw_amount, by_notional=True)
+
+    def fill_size(self, size: float) -> DepthFill:
+        """
+        수량 기준 체결 시뮬레이션
+
+        Args:
+            size: 주문 수량
+
+        Returns:
+            DepthFill
+        """
+        return self._fill(self.cum_size, size, by_notional=False)
+
+    def max_size_within(self, slippage_pct: float) -> float:
+        """
+        평균 체결가 슬리피지가 slippage_pct% 이내인 최대 주문 수량
+
+        누적 평균 체결가가 단조이므로 한계 가격을 넘는 첫 호가를 searchsorted로 찾고,
+        그 호가 안에서 평균이 정확히 한계 가격이 되는 수량을 닫힌 식으로 계산합니다.
+
+        Args:
+            slippage_pct: 허용 슬리피지 (%)
+
+        Returns:
+            최대 주문 수량 (호가창 전체가 허용 범위 안이면 전체 수량)
+        """
+        if len(self) == 0:
+            return 0.0
+
+        best = float(self.prices[0])
+        sign = 1.0 if self.is_ask else -1.0
+        limit = best * (1 + sign * slippage_pct / 100)
+
+        k = int(np.searchsorted(sign * self.cum_avg_price, sign * limit, side='right'))
+        if k >= len(self):
+            return self.total_size
+
+        # k >= 1 (첫 호가의 평균은 best이므로 항상 허용 범위 안)
+        prev_size = float(self.cum_size[k - 1])
+        prev_notional = float(self.cum_notional[k - 1])
+        price = float(self.prices[k])
+        partial = (limit * prev_size - prev_notional) / (price - limit)
+        return prev_size + max(0.0, partial)
+
+    def optimal_splits(
+        self,
+        size: float,
+        top_levels: int = 5,
+        min_splits: int = 2,
+        max_splits: int = 10
+    ) -> int:
+        """
+        상위 호가 평균 물량 기준 분할 개수
+
+        주문 수량이 상위 top_levels개 호가의 평균 물량보다 크면
+        (주문 수량 / 평균 물량)개로 분할합니다 (min_splits ~ max_splits).
+
+        Args:
+            size: 주문 수량
+            top_levels: 평균 물량 계산에 사용할 상위 호가 수
+            min_splits: 분할 시 최소 개수
+            max_splits: 최대 분할 개수
+
+        Returns:
+            분할 개수 (1이면 분할 불필요)
+        """
+        if len(self) == 0:
+            return 1
+        top = min(top_levels, len(self))
+        avg_volume = float(self.cum_size[top - 1]) / top
+        if size > avg_volume:
+            return max(min_splits, min(int(size / avg_volume), max_splits))
+        return 1
+
+
+class OrderbookSnapshot:
+    """
+    오더북 스냅샷 (매도/매수 호가 누적 깊이)
+
+    Args:
+        asks: 매도 호가 깊이 (매수 주문이 소진)
+        bids: 매수 호가 깊이 (매도 주문이 소진)
+    """
+
+    def __init__(self, asks: DepthLevels, bids: DepthLevels):
+        self.asks = asks
+        self.bids = bids
+
+    @classmethod
+    def from_upbit(cls, orderbook: Dict[str, Any]) -> 'OrderbookSnapshot':
+        """
+        Upbit 오더북 응답(orderbook_units)에서 생성
+
+        Args:
+            orderbook: {'orderbook_units': [{'ask_price', 'ask_size', 'bid_price', 'bid_size'}, ...]}
+        """
+        units = orderbook.get('orderbook_units') or []
+        return cls(
+            asks=DepthLevels(
+                [u.get('ask_price', 0) for u in units],
+                [u.get('ask_size', 0) for u in units],
+                is_ask=True
+            ),
+            bids=DepthLevels(
+                [u.get('bid_price', 0) for u in units],
+                [u.get('bid_size', 0) for u in units],
+                is_ask=False
+            ),
+        )
+
+    @classmethod
+    def from_summary(cls, orderbook: Dict[str, Any]) -> 'OrderbookSnapshot':
+        """
+        백테스트용 요약 호가에서 생성
+
+        Args:
+            orderbook: {'ask_prices', 'ask_volumes', 'bid_prices', 'bid_volumes'} (일부만 있어도 됨)
+        """
+        return cls(
+            asks=DepthLevels(
+                orderbook.get('ask_prices') or [],
+                orderbook.get('ask_volumes') or [],
+                is_ask=True
+            ),
+            bids=DepthLevels(
+                orderbook.get('bid_prices') or [],
+                orderbook.get('bid_volumes') or [],
+                is_ask=False
+            ),
+        )
+
+    @classmethod
+    def coerce(cls, orderbook: Any) -> 'OrderbookSnapshot':
+        """
+        스냅샷 / Upbit 응답 / 요약 호가 어느 형식이든 스냅샷으로 변환
+
+        이미 스냅샷이면 그대로 반환하므로 호출 측에서 한 번 변환해 여러 질의에 재사용합니다.
+        """
+        if isinstance(orderbook, cls):
+            return orderbook
+        orderbook = orderbook or {}
+        if 'orderbook_units' in orderbook:
+            return cls.from_upbit(orderbook)
+        return cls.from_summary(orderbook)
+
+    def side(self, order_side: str) -> DepthLevels:
+        """
+        주문 방향이 소진하는 호가 반환
+
+        Args:
+            order_side: 'buy' (매도 호가 소진) 또는 'sell' (매수 호가 소진)
+        """
+        return self.asks if order_side == 'buy' else self.bids
+
+    @property
+    def is_empty(self) -> bool:
+        """원본 호가가 하나도 없는지 여부"""
+        return self.asks.raw_levels == 0 and self.bids.raw_levels == 0
@@ -36,8 +36,24 @@ class AnalysisStage(BasePipelineStage):
     없으면 레거시 ai_service를 사용합니다 (호환성 유지).
     """
 
-    def __init__(self):
+    def __init__(self, market_structure=None):
+        """
+        Args:
+            market_structure: 공유 MarketStructureService (None이면 스테이지 전용으로 지연 생성)
+        """
         super().__init__(name="Analysis")
+        self._market_structure = market_structure
+
+    def _get_market_structure(self):
+        """시장 구조 서비스 반환 (지연 초기화)"""
+        if self._market_structure is None:
+            from src.application.services.market_structure import MarketStructureService
+            from src.config.settings import TradingConfig
+
+            self._market_structure = MarketStructureService(
+                window=TradingConfig.CORRELATION_WINDOW_DAYS
+            )
+        return self._market_structure
 
     def _get_ai_service(self, context: PipelineContext) -> Any:
         """
@@ -104,26 +120,40 @@ class AnalysisStage(BasePipelineStage):
         """
         시장 상관관계 분석 (BTC vs 현재 코인)
 
-        ⚠️ DEPRECATED: calculate_market_risk 제거됨
-        TODO: MarketAnalysisService (domain/services/market_analysis.py) 사용
+        수집된 일봉 종가를 MarketStructureService 패널에 반영하고
+        캐시된 롤링 베타/알파/상관계수 행렬에서 현재 코인 값을 읽습니다.
+        데이터가 부족하면 중립 기본값을 사용합니다.
 
         Args:
             context: 파이프라인 컨텍스트
         """
-        # Stub: 레거시 AI 함수 제거됨 - 기본값 반환
         context.market_correlation = {
             'beta': 1.0,
             'alpha': 0.0,
             'correlation': 0.0,
             'market_risk': 'unknown',
-            'risk_reason': 'Legacy calculate_market_risk removed - use MarketAnalysisService'
+            'risk_reason': '시장 구조 데이터 부족'
         }
 
+        structure = self._get_market_structure()
+        try:
+            btc_day = (context.btc_chart_data or {}).get('day')
+            coin_day = (context.chart_data or {}).get('day')
+            if btc_day is not None and 'close' in btc_day:
+                structure.update_closes(structure.market_ticker, btc_day['close'])
+            if context.ticker and coin_day is not None and 'close' in coin_day:
+                structure.update_closes(context.ticker, coin_day['close'])
+
+            pair = structure.get_pair(context.ticker) if context.ticker else None
+            if pair:
+                context.market_correlation = pair
+        except Exception as e:
+            Logger.print_warning(f"시장 구조 계산 실패: {str(e)}")
+
         # 현재 코인 심볼 추출 (KRW-ETH -> ETH)
         coin_symbol = context.ticker.replace('KRW-', '') if context.ticker else 'COIN'
 
-        Logger.print_header("📊 시장 상관관계 분석 (STUB)")
-        print(f"⚠️ Legacy calculate_market_risk 제거됨")
+        Logger.print_header("📊 시장 상관관계 분석")
         print(f"BTC-{coin_symbol} 베타: {context.market_correlation.get('beta', 1.0):.2f}")
         print(f"BTC-{coin_symbol} 알파: {context.market_correlation.get('alpha', 0.0):.4f}")
         print(f"상관계수: {context.market_correlation.get('correlation', 0.0):.2f}")
@@ -35,6 +35,9 @@ class PipelineContext:
     # 예: context.container.get_execute_trade_use_case()
     container: Any = None
 
+    # 거래 사이클 락 lease (LockLease) - 주문 직전 fencing token 검증에 사용
+    lock_lease: Any = None
+
     # 레거시 서비스 인스턴스 (DEPRECATED - 향후 제거 예정)
     # Container와 UseCase 사용을 권장합니다.
     # 마이그레이션 완료 후 이 필드들은 제거됩니다.
@@ -182,6 +185,24 @@ class BasePipelineStage(ABC):
         """
         pass
 
+    def unfenced_order_error(self, context: PipelineContext) -> Optional[str]:
+        """
+        레거시 trading_service 주문 거부 사유 (lease 펜싱 불가)
+
+        레거시 서비스는 lease를 검증하지 않으므로, lease를 보유한 조율 실행에서는
+        주문을 보내지 않습니다 (만료된 lease로 새 보유자와 중복 주문 방지).
+        주문은 Container의 ExecuteTradeUseCase(lease 검증)로 실행해야 합니다.
+
+        Args:
+            context: 파이프라인 컨텍스트
+
+        Returns:
+            거부 사유 (lease 없이 실행 중이면 None)
+        """
+        if context.lock_lease is None:
+            return None
+        return "lease 검증 불가 (레거시 주문 경로) - Container 없이 주문하지 않음"
+
     def handle_error(self, context: PipelineContext, error: Exception) -> StageResult:
         """
         에러 핸들링 (오버라이드 가능)
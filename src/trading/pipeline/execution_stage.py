@@ -135,13 +135,17 @@ class ExecutionStage(BasePipelineStage):
         amount = Money(Decimal(str(buy_amount)), Currency.KRW)
 
         # UseCase 실행
-        response = await use_case.execute_buy(context.ticker, amount)
+        response = await use_case.execute_buy(context.ticker, amount, lease=context.lock_lease)
 
         # OrderResponse를 레거시 dict 형식으로 변환
         context.trade_result = self._convert_order_response_to_dict(response)
 
     def _execute_buy_legacy(self, context: PipelineContext) -> None:
         """레거시 서비스를 통한 매수 실행"""
+        error = self.unfenced_order_error(context)
+        if error:
+            context.trade_result = {'success': False, 'error': error}
+            return
         # 레거시 서비스 직접 사용 (하위 호환성)
         trading_service = context.trading_service
         if trading_service:
@@ -184,13 +188,17 @@ class ExecutionStage(BasePipelineStage):
         use_case = context.container.get_execute_trade_use_case()
 
         # 전량 매도
-        response = await use_case.execute_sell_all(context.ticker)
+        response = await use_case.execute_sell_all(context.ticker, lease=context.lock_lease)
 
         # OrderResponse를 레거시 dict 형식으로 변환
         context.trade_result = self._convert_order_response_to_dict(response)
 
     def _execute_sell_legacy(self, context: PipelineContext) -> None:
         """레거시 서비스를 통한 매도 실행"""
+        error = self.unfenced_order_error(context)
+        if error:
+            context.trade_result = {'success': False, 'error': error}
+            return
         # 레거시 서비스 직접 사용 (하위 호환성)
         trading_service = context.trading_service
         if trading_service:
@@ -16,20 +16,15 @@ Mode 2(적응형)와 Mode 3(멀티코인)를 통합한 통합 스테이지입니
     # 스캔 비활성화 (단일 코인)
     stage = HybridRiskCheckStage(enable_scanning=False, fallback_ticker="KRW-BTC")
 """
-from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
+from concurrent.futures import Executor
+from typing import Dict, Any, Optional, List, Tuple
 
 from src.trading.pipeline.base_stage import BasePipelineStage, PipelineContext, StageResult
 from src.position.portfolio_manager import PortfolioManager, TradingMode, PortfolioPosition
 # PositionAnalyzer 제거됨 - Clean Architecture 마이그레이션 완료
-# TODO: MANAGEMENT 모드는 ManagePositionUseCase + ValidationPort로 재구현 필요
+# TODO: AI 기반 부분 청산은 ManagePositionUseCase + ValidationPort로 재구현 필요
 from src.utils.logger import Logger
 
-# TYPE_CHECKING: 타입 힌트만 필요한 레거시 타입들 (런타임에는 사용 안 함)
-if TYPE_CHECKING:
-    from typing import Any as PositionAction
-else:
-    PositionAction = None
-
 
 class HybridRiskCheckStage(BasePipelineStage):
     """
@@ -47,6 +42,10 @@ class HybridRiskCheckStage(BasePipelineStage):
         enable_scanning: 코인 스캔 활성화 여부
         fallback_ticker: 스캔 비활성화 또는 실패 시 사용할 티커
         scanner_config: 스캐너 설정 딕셔너리
+        coin_selector: 외부에서 주입하는 코인 선택기 (TradingRuntime 공유용, None이면 지연 생성)
+        scan_executor: 스캔 실행용 장기 실행 Executor (None이면 스캔마다 임시 스레드 생성)
+        market_structure: 공유 MarketStructureService (None이면 상관관계 진입 제한 미적용)
+        max_position_correlation: 보유 포지션과의 최대 허용 상관계수 (None이면 TradingConfig 값)
     """
 
     # 기본 스캐너 설정
@@ -66,7 +65,11 @@ class HybridRiskCheckStage(BasePipelineStage):
         max_positions: int = 3,
         enable_scanning: bool = True,
         fallback_ticker: str = "KRW-ETH",
-        scanner_config: Optional[Dict[str, Any]] = None
+        scanner_config: Optional[Dict[str, Any]] = None,
+        coin_selector=None,
+        scan_executor: Optional[Executor] = None,
+        market_structure=None,
+        max_position_correlation: Optional[float] = None
     ):
         super().__init__(name="HybridRiskCheck")
 
@@ -82,8 +85,16 @@ class HybridRiskCheckStage(BasePipelineStage):
         self.fallback_ticker = fallback_ticker
         self.scanner_config = scanner_config or self.DEFAULT_SCANNER_CONFIG.copy()
 
-        # 내부 컴포넌트 (지연 초기화)
-        self._coin_selector = None
+        # 내부 컴포넌트 (주입되지 않으면 지연 초기화)
+        self._coin_selector = coin_selector
+        self._scan_executor = scan_executor
+
+        # 상관관계 기반 진입 제한
+        if max_position_correlation is None:
+            from src.config.settings import TradingConfig
+            max_position_correlation = TradingConfig.MAX_POSITION_CORRELATION
+        self._market_structure = market_structure
+        self.max_position_correlation = max_position_correlation
 
     async def execute(self, context: PipelineContext) -> StageResult:
         """
@@ -117,7 +128,8 @@ class HybridRiskCheckStage(BasePipelineStage):
                 )
             portfolio_manager = PortfolioManager(
                 exchange_client=upbit_client,
-                max_positions=self.max_positions
+                max_positions=self.max_positions,
+                positions=await self._load_local_positions(context)
             )
             context.portfolio_manager = portfolio_manager
 
@@ -126,7 +138,7 @@ class HybridRiskCheckStage(BasePipelineStage):
             context.portfolio_status = portfolio_status
 
             # 포트폴리오 요약 출력
-            portfolio_manager.print_portfolio_summary()
+            portfolio_manager.print_portfolio_summary(portfolio_status)
 
             # 3. 포트폴리오 레벨 리스크 체크
             risk_check = portfolio_manager.check_portfolio_risk()
@@ -155,7 +167,7 @@ class HybridRiskCheckStage(BasePipelineStage):
 
             # MANAGEMENT 모드 또는 포지션 있음
             if trading_mode == TradingMode.MANAGEMENT or len(portfolio_status.positions) > 0:
-                management_result = self._handle_management_mode(context, portfolio_status)
+                management_result = await self._handle_management_mode(context, portfolio_status)
 
                 # 청산 실행된 경우
                 if management_result.action == 'exit':
@@ -183,6 +195,22 @@ class HybridRiskCheckStage(BasePipelineStage):
         except Exception as e:
             return self.handle_error(context, e)
 
+    async def _load_local_positions(self, context: PipelineContext) -> Optional[List[Any]]:
+        """
+        영속 포지션 인덱스 조회 (거래소 잔고 조회 대체)
+
+        Returns:
+            포지션 목록 (로컬 조회 비활성화 또는 조회 실패 시 None → 거래소 잔고 사용)
+        """
+        uses_local_positions = getattr(context.container, 'uses_local_positions', None)
+        if uses_local_positions is None or not uses_local_positions():
+            return None
+        try:
+            return await context.container.get_persistence_port().get_all_positions()
+        except Exception as e:
+            Logger.print_warning(f"로컬 포지션 조회 실패, 거래소 잔고로 대체: {e}")
+            return None
+
     def _handle_blocked_mode(
         self,
         context: PipelineContext,
@@ -203,41 +231,72 @@ class HybridRiskCheckStage(BasePipelineStage):
             message="거래 차단 상태"
         )
 
-    def _handle_management_mode(
+    async def _handle_management_mode(
         self,
         context: PipelineContext,
         portfolio_status
     ) -> StageResult:
         """
-        MANAGEMENT 모드 처리 (포지션 관리)
+        MANAGEMENT 모드 처리 (포지션 손절/익절)
 
-        ⚠️ PositionAnalyzer 제거됨 - Clean Architecture 마이그레이션 완료
-        포지션 관리는 position_management_job (15분 간격)에서 처리됩니다.
-        이 스테이지에서는 포지션이 있는지만 확인하고 스킵합니다.
-
-        TODO: ManagePositionUseCase + ValidationPort로 재구현 필요
+        보유 포지션 수익률이 stop_loss_pct 이하이면 손절, take_profit_pct 이상이면 익절합니다.
+        청산은 _execute_exit(ExecuteTradeUseCase)를 거쳐 거래 기록과 positions 테이블이
+        함께 갱신됩니다.
         """
         Logger.print_info(f"📋 포지션 관리 모드: {len(portfolio_status.positions)}개 포지션")
-        Logger.print_info("  포지션 관리는 position_management_job에서 처리됩니다.")
 
-        # 포지션 관리는 별도 job에서 처리
-        # 여기서는 추가 진입 가능 여부만 판단
         actions_taken = []
         for portfolio_pos in portfolio_status.positions:
-            Logger.print_info(f"  [{portfolio_pos.symbol}] 보유 중 (관리는 별도 job)")
+            profit_rate = portfolio_pos.profit_rate
+            trigger = self._exit_trigger(profit_rate)
+            if trigger is None:
+                Logger.print_info(f"  [{portfolio_pos.symbol}] 보유 유지 ({profit_rate:+.2f}%)")
+                actions_taken.append({
+                    'ticker': portfolio_pos.ticker,
+                    'action': 'hold',
+                    'profit_rate': profit_rate
+                })
+                continue
+
+            label = '손절' if trigger == 'stop_loss' else '익절'
+            Logger.print_warning(f"  [{portfolio_pos.symbol}] {label} 발동 ({profit_rate:+.2f}%)")
+            result = await self._execute_exit(context, portfolio_pos, trigger)
             actions_taken.append({
                 'ticker': portfolio_pos.ticker,
-                'action': 'hold',
-                'reason': 'position_management_job에서 관리'
+                'action': 'exit' if result.get('success') else 'exit_failed',
+                'trigger': trigger,
+                'profit_rate': profit_rate,
+                'result': result
             })
 
+        exits = [a for a in actions_taken if a['action'] == 'exit']
+        if exits:
+            return StageResult(
+                success=True,
+                action='exit',
+                data={
+                    'status': 'success',
+                    'decision': 'sell',
+                    'actions': actions_taken
+                },
+                message=f"{len(exits)}개 포지션 청산"
+            )
+
         return StageResult(
             success=True,
             action='continue',
             data={'actions': actions_taken},
-            message="포지션 확인 완료 (관리는 별도 job)"
+            message="포지션 확인 완료"
         )
 
+    def _exit_trigger(self, profit_rate: float) -> Optional[str]:
+        """수익률 기준 청산 트리거 ('stop_loss' / 'take_profit', 해당 없으면 None)"""
+        if profit_rate <= self.stop_loss_pct:
+            return 'stop_loss'
+        if profit_rate >= self.take_profit_pct:
+            return 'take_profit'
+        return None
+
     def _handle_entry_mode(
         self,
         context: PipelineContext,
@@ -321,6 +380,12 @@ class HybridRiskCheckStage(BasePipelineStage):
         # 동기 래퍼로 비동기 스캔 실행
         scan_result = self._run_coin_scan_sync(selector, exclude_tickers)
 
+        # 보유 포지션과 상관관계가 과도한 코인 제외
+        if scan_result and scan_result.selected_coins and exclude_tickers:
+            scan_result.selected_coins = self._filter_correlated_coins(
+                scan_result.selected_coins, exclude_tickers
+            )
+
         # 결과 처리
         if not scan_result or not scan_result.selected_coins:
             Logger.print_warning("선택된 코인 없음")
@@ -403,7 +468,9 @@ class HybridRiskCheckStage(BasePipelineStage):
                     'ai_analyzed': 0,
                     'selected': 0,
                     'best_score': best_score_value,
-                    'duration_seconds': getattr(scan_result, 'total_duration_seconds', 0) if scan_result else 0
+                    'duration_seconds': getattr(scan_result, 'total_duration_seconds', 0) if scan_result else 0,
+                    'universe_scanned': getattr(scan_result, 'universe_scanned', 0) if scan_result else 0,
+                    'tier_stats': getattr(scan_result, 'tier_stats', None) if scan_result else None
                 },
                 'selected_coin': None,
                 'all_backtest_results': all_bt_results_for_telegram,
@@ -432,7 +499,9 @@ class HybridRiskCheckStage(BasePipelineStage):
                         'trading_pass_passed': sum(1 for c in getattr(scan_result, 'candidates', []) if c.trading_pass_passed) if scan_result else 0,
                         'ai_analyzed': 0,
                         'selected': 0,
-                        'duration_seconds': getattr(scan_result, 'total_duration_seconds', 0) if scan_result else 0
+                        'duration_seconds': getattr(scan_result, 'total_duration_seconds', 0) if scan_result else 0,
+                        'universe_scanned': getattr(scan_result, 'universe_scanned', 0) if scan_result else 0,
+                        'tier_stats': getattr(scan_result, 'tier_stats', None) if scan_result else None
                     },
                     'selected_coin': None,
                     'all_backtest_results': all_bt_results_for_telegram
@@ -499,7 +568,9 @@ class HybridRiskCheckStage(BasePipelineStage):
                 'ai_analyzed': scan_result.ai_analyzed,
                 'selected': len(scan_result.selected_coins),
                 'best_score': selected_coin.final_score,
-                'duration_seconds': scan_result.total_duration_seconds
+                'duration_seconds': scan_result.total_duration_seconds,
+                'universe_scanned': scan_result.universe_scanned,
+                'tier_stats': scan_result.tier_stats
             },
             'selected_coin': {
                 'ticker': selected_coin.ticker,
@@ -533,7 +604,9 @@ class HybridRiskCheckStage(BasePipelineStage):
                     'trading_pass_passed': sum(1 for c in scan_result.candidates if c.trading_pass_passed),
                     'ai_analyzed': scan_result.ai_analyzed,
                     'selected': len(scan_result.selected_coins),
-                    'duration_seconds': scan_result.total_duration_seconds
+                    'duration_seconds': scan_result.total_duration_seconds,
+                    'universe_scanned': scan_result.universe_scanned,
+                    'tier_stats': scan_result.tier_stats
                 },
                 'all_backtest_results': all_bt_results_for_telegram
             },
@@ -552,6 +625,11 @@ class HybridRiskCheckStage(BasePipelineStage):
             return await selector.select_coins(exclude_tickers=exclude_tickers)
 
         try:
+            # 장기 실행 Executor가 주입된 경우 재사용 (사이클마다 스레드 생성 방지)
+            if self._scan_executor is not None:
+                future = self._scan_executor.submit(asyncio.run, _scan())
+                return future.result(timeout=120)  # 2분 타임아웃
+
             # 이미 실행 중인 루프가 있는지 확인
             try:
                 loop = asyncio.get_running_loop()
@@ -567,6 +645,40 @@ class HybridRiskCheckStage(BasePipelineStage):
             Logger.print_error(f"코인 스캔 실행 오류: {str(e)}")
             raise
 
+    def _filter_correlated_coins(self, coins: List[Any], held_tickers: List[str]) -> List[Any]:
+        """
+        보유 포지션과 상관계수가 max_position_correlation을 넘는 코인 제외
+
+        상관계수는 MarketStructureService의 캐시된 행렬에서 읽기만 하며,
+        데이터가 없어 계산할 수 없는 코인은 통과시킵니다.
+
+        Args:
+            coins: 선택된 코인 목록 (점수 순)
+            held_tickers: 보유 중인 티커 목록
+
+        Returns:
+            상관관계 제한을 통과한 코인 목록 (순서 유지)
+        """
+        if self._market_structure is None or self.max_position_correlation >= 1.0:
+            return coins
+
+        allowed = []
+        for coin in coins:
+            try:
+                match = self._market_structure.max_correlation(coin.ticker, held_tickers)
+            except Exception as e:
+                Logger.print_warning(f"상관관계 조회 실패 ({coin.ticker}): {str(e)}")
+                match = None
+
+            if match is not None and match[1] > self.max_position_correlation:
+                Logger.print_warning(
+                    f"⛔ {coin.ticker} 제외: 보유 {match[0]}와 상관계수 {match[1]:.2f} "
+                    f"> {self.max_position_correlation:.2f}"
+                )
+                continue
+            allowed.append(coin)
+        return allowed
+
     def _get_held_tickers(self, context: PipelineContext) -> List[str]:
         """보유 중인 코인 티커 목록 조회"""
         exclude = []
@@ -585,6 +697,9 @@ class HybridRiskCheckStage(BasePipelineStage):
             from src.scanner.liquidity_scanner import LiquidityScanner
             from src.scanner.data_sync import HistoricalDataSync
             from src.scanner.multi_backtest import MultiCoinBacktest
+            from src.scanner.universe_prefilter import create_universe_prefilter
+            from src.backtesting.monte_carlo import create_monte_carlo_simulator
+            from src.config.settings import ScannerConfig
 
             liquidity_scanner = LiquidityScanner(
                 min_volume_krw=self.scanner_config.get('min_volume_krw', 10_000_000_000)
@@ -601,7 +716,12 @@ class HybridRiskCheckStage(BasePipelineStage):
                 min_volume_krw=self.scanner_config.get('min_volume_krw', 10_000_000_000),
                 backtest_top_n=self.scanner_config.get('backtest_top_n', 5),
                 ai_top_n=0,  # 이 스테이지에서는 AI 분석 안함
-                final_select_n=self.scanner_config.get('final_select_n', 2)
+                final_select_n=self.scanner_config.get('final_select_n', 2),
+                universe_prefilter=(
+                    create_universe_prefilter(LiquidityScanner(), data_dir=str(data_sync.data_dir))
+                    if ScannerConfig.PREFILTER_ENABLED else None
+                ),
+                monte_carlo=create_monte_carlo_simulator() if ScannerConfig.MONTE_CARLO_GATE else None
             )
 
         return self._coin_selector
@@ -658,96 +778,59 @@ class HybridRiskCheckStage(BasePipelineStage):
 
         return market_data
 
-    def _execute_exit(
+    async def _execute_exit(
         self,
         context: PipelineContext,
         position: PortfolioPosition,
-        action: PositionAction
+        trigger: str
     ) -> Dict[str, Any]:
         """
         청산 실행
 
+        Container가 있으면 ExecuteTradeUseCase로 매도해 거래/포지션 기록을 남기고
+        (lease 펜싱 포함), 없으면 lease 없는 실행에서만 레거시 서비스를 사용합니다.
+
         Args:
             context: 파이프라인 컨텍스트
             position: 포지션 정보
-            action: 액션 정보
+            trigger: 청산 사유 ('stop_loss' / 'take_profit')
 
         Returns:
             실행 결과
         """
         try:
-            # 레거시 서비스 직접 사용 (하위 호환성)
-            trading_service = context.trading_service
-
-            if trading_service:
-                result = trading_service.execute_sell(position.ticker)
-
-                # 손익 기록
-                if context.portfolio_manager:
-                    context.portfolio_manager.record_trade_result(
-                        position.ticker,
-                        position.profit_loss,
-                        position.profit_rate
-                    )
-
-                return {
-                    'success': True,
-                    'ticker': position.ticker,
-                    'amount': position.amount,
-                    'price': position.current_price,
-                    'pnl': position.profit_loss,
-                    'pnl_pct': position.profit_rate,
-                    'trigger': action.trigger,
-                    'ai_used': action.ai_used
-                }
+            if context.container is not None:
+                use_case = context.container.get_execute_trade_use_case()
+                response = await use_case.execute_sell_all(position.ticker, lease=context.lock_lease)
+                if not response.success:
+                    return {'success': False, 'error': response.error_message or 'Unknown error'}
+            elif self.unfenced_order_error(context):
+                return {'success': False, 'error': self.unfenced_order_error(context)}
+            elif context.trading_service:
+                # 레거시 서비스 직접 사용 (하위 호환성)
+                context.trading_service.execute_sell(position.ticker)
             else:
                 return {'success': False, 'error': 'trading_service not available'}
 
-        except Exception as e:
-            Logger.print_error(f"청산 실행 실패: {str(e)}")
-            return {'success': False, 'error': str(e)}
-
-    def _execute_partial_exit(
-        self,
-        context: PipelineContext,
-        position: PortfolioPosition,
-        action: PositionAction
-    ) -> Dict[str, Any]:
-        """
-        부분 청산 실행
-
-        Args:
-            context: 파이프라인 컨텍스트
-            position: 포지션 정보
-            action: 액션 정보 (exit_ratio 포함)
-
-        Returns:
-            실행 결과
-        """
-        try:
-            sell_amount = position.amount * action.exit_ratio
-
-            # 레거시 서비스 직접 사용 (하위 호환성)
-            trading_service = context.trading_service
-
-            if trading_service:
-                # 부분 매도 (수량 지정)
-                result = trading_service.execute_sell(
+            # 손익 기록
+            portfolio_manager = getattr(context, 'portfolio_manager', None)
+            if portfolio_manager:
+                portfolio_manager.record_trade_result(
                     position.ticker,
-                    amount=sell_amount
+                    position.profit_loss,
+                    position.profit_rate
                 )
 
-                return {
-                    'success': True,
-                    'ticker': position.ticker,
-                    'sold_amount': sell_amount,
-                    'remaining_amount': position.amount - sell_amount,
-                    'exit_ratio': action.exit_ratio,
-                    'ai_used': action.ai_used
-                }
-            else:
-                return {'success': False, 'error': 'trading_service not available'}
+            return {
+                'success': True,
+                'ticker': position.ticker,
+                'amount': position.amount,
+                'price': position.current_price,
+                'pnl': position.profit_loss,
+                'pnl_pct': position.profit_rate,
+                'trigger': trigger
+            }
 
         except Exception as e:
-            Logger.print_error(f"부분 청산 실패: {str(e)}")
+            Logger.print_error(f"청산 실행 실패: {str(e)}")
             return {'success': False, 'error': str(e)}
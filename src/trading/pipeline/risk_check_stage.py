@@ -10,7 +10,7 @@ Clean Architecture Migration (2026-01-03):
 - Container가 있으면 Port를 통해 서비스 접근
 - Container가 없으면 context의 레거시 서비스 사용 (하위 호환성)
 """
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 from src.trading.pipeline.base_stage import BasePipelineStage, PipelineContext, StageResult
 from src.risk.manager import RiskManager, RiskLimits
 from src.position.service import PositionService
@@ -69,7 +69,7 @@ class RiskCheckStage(BasePipelineStage):
             )
 
             # 1. 포지션 손익 체크
-            position_result = self._check_position_limits(context)
+            position_result = await self._check_position_limits(context)
             if position_result.action == 'exit':
                 return position_result
 
@@ -94,7 +94,7 @@ class RiskCheckStage(BasePipelineStage):
         except Exception as e:
             return self.handle_error(context, e)
 
-    def _check_position_limits(self, context: PipelineContext) -> StageResult:
+    async def _check_position_limits(self, context: PipelineContext) -> StageResult:
         """
         포지션 손익 체크 (손절/익절)
 
@@ -106,7 +106,6 @@ class RiskCheckStage(BasePipelineStage):
         """
         # 레거시 서비스 직접 사용 (하위 호환성)
         upbit_client = context.upbit_client
-        trading_service = context.trading_service
 
         if not upbit_client:
             return StageResult(
@@ -127,9 +126,7 @@ class RiskCheckStage(BasePipelineStage):
         # 손절 발동
         if position_check['action'] == 'stop_loss':
             Logger.print_error(f"🚨 손절 발동: {position_check['reason']}")
-            sell_result = None
-            if trading_service:
-                sell_result = trading_service.execute_sell(context.ticker)
+            sell_result = await self._sell_position(context)
             context.risk_manager.record_trade(position_check['pnl_pct'])
 
             return StageResult(
@@ -148,9 +145,7 @@ class RiskCheckStage(BasePipelineStage):
         # 익절 발동
         elif position_check['action'] == 'take_profit':
             Logger.print_success(f"💰 익절 발동: {position_check['reason']}")
-            sell_result = None
-            if trading_service:
-                sell_result = trading_service.execute_sell(context.ticker)
+            sell_result = await self._sell_position(context)
             context.risk_manager.record_trade(position_check['pnl_pct'])
 
             return StageResult(
@@ -172,6 +167,31 @@ class RiskCheckStage(BasePipelineStage):
             message="포지션 손익 체크 통과"
         )
 
+    async def _sell_position(self, context: PipelineContext) -> Optional[Dict[str, Any]]:
+        """
+        손절/익절 전량 매도
+
+        Container가 있으면 ExecuteTradeUseCase로 lease를 검증한 뒤 매도하고,
+        없으면 lease 없는 실행에서만 레거시 서비스를 사용합니다.
+
+        Returns:
+            매도 결과 (매도 수단 없으면 None)
+        """
+        if context.container is not None:
+            use_case = context.container.get_execute_trade_use_case()
+            response = await use_case.execute_sell_all(context.ticker, lease=context.lock_lease)
+            if not response.success:
+                return {'success': False, 'error': response.error_message or 'Unknown error'}
+            return {'success': True, 'trade_id': response.order_id}
+
+        error = self.unfenced_order_error(context)
+        if error:
+            Logger.print_error(f"매도 거부: {error}")
+            return {'success': False, 'error': error}
+        if context.trading_service:
+            return context.trading_service.execute_sell(context.ticker)
+        return None
+
     def _check_circuit_breaker(self, context: PipelineContext) -> StageResult:
         """
         Circuit Breaker 체크 (일일/주간 손실 한도)
@@ -237,7 +237,11 @@ def create_hybrid_trading_pipeline(
     liquidity_top_n: int = 10,
     min_volume_krw: float = 10_000_000_000,
     backtest_top_n: int = 5,
-    final_select_n: int = 2
+    final_select_n: int = 2,
+    # 장기 실행 런타임 공유 컴포넌트
+    coin_selector=None,
+    scan_executor=None,
+    market_structure=None
 ) -> TradingPipeline:
     """
     통합 하이브리드 트레이딩 파이프라인 생성
@@ -268,6 +272,9 @@ def create_hybrid_trading_pipeline(
         min_volume_krw: 최소 거래대금 (기본 100억원)
         backtest_top_n: 백테스팅 통과 상위 N개 (기본 5)
         final_select_n: 최종 선택 N개 (기본 2)
+        coin_selector: 공유 코인 선택기 (TradingRuntime에서 주입, None이면 지연 생성)
+        scan_executor: 공유 스캔 Executor (TradingRuntime에서 주입)
+        market_structure: 공유 시장 구조 서비스 (베타/상관계수 행렬, TradingRuntime에서 주입)
 
     Returns:
         TradingPipeline: 통합 하이브리드 트레이딩 파이프라인
@@ -294,10 +301,13 @@ def create_hybrid_trading_pipeline(
             max_positions=max_positions,
             enable_scanning=enable_scanning,
             fallback_ticker=fallback_ticker,
-            scanner_config=scanner_config
+            scanner_config=scanner_config,
+            coin_selector=coin_selector,
+            scan_executor=scan_executor,
+            market_structure=market_structure
         ),
         DataCollectionStage(),
-        AnalysisStage(),
+        AnalysisStage(market_structure=market_structure),
         ExecutionStage(),
     ]
 
@@ -7,8 +7,13 @@ Telegram을 통한 수동 트레이딩 제어 및 상태 확인 기능을 제공
     /run - 트레이딩 사이클 수동 실행
     /status - 현재 봇 상태 및 포트폴리오 확인
     /positions - 보유 포지션 목록
+    /balance - 잔고 확인
+    /scan - 마지막 스캔 결과 (스케줄러와 공유)
     /help - 도움말
 
+/status, /positions, /balance는 짧은 TTL의 포트폴리오 스냅샷으로 응답하며,
+스냅샷이 오래되면 응답 후 백그라운드에서 갱신합니다.
+
 사용법:
     python telegram_bot.py
 
@@ -54,12 +59,101 @@ from src.scanner.sector_mapping import get_coin_sector, get_sector_korean_name
 class TelegramBotService:
     """Telegram 봇 명령어 처리 서비스"""
 
-    def __init__(self):
+    def __init__(self, exchange_client=None, scan_store=None):
+        """
+        Args:
+            exchange_client: 거래소 클라이언트 (None이면 첫 사용 시 UpbitClient 생성)
+            scan_store: 스캔 결과 저장소 (None이면 스케줄러와 공유하는 기본 저장소)
+        """
         self.bot_token = settings.TELEGRAM_BOT_TOKEN
         self.allowed_chat_ids = self._parse_allowed_chat_ids()
         self._application = None
         self._is_running_cycle = False  # 중복 실행 방지
 
+        # 프로세스 수명 동안 재사용 (명령마다 생성하지 않음)
+        self._exchange_client = exchange_client
+        self._scan_store = scan_store
+        self._container = None
+        self._runtime = None
+        self._snapshot_cache = None
+        self._coordinator = None
+
+    # =========================================================================
+    # 공유 런타임 (지연 생성)
+    # =========================================================================
+
+    def _get_exchange_client(self):
+        """거래소 클라이언트 (1회 생성)"""
+        if self._exchange_client is None:
+            from src.api.upbit_client import UpbitClient
+            self._exchange_client = UpbitClient()
+        return self._exchange_client
+
+    def _get_container(self):
+        """
+        Container (1회 생성, /run에서 재사용)
+
+        스케줄러와 같은 PostgreSQL advisory lock/idempotency 테이블과
+        로컬 조율 디렉토리(SQLite lease 락 + 사이클 보드)를 사용합니다.
+        """
+        if self._container is None:
+            from src.container import Container
+            from src.data.collector import DataCollector
+            from src.config.settings import CoordinationConfig
+
+            try:
+                from backend.app.db.session import AsyncSessionLocal
+                session_factory = AsyncSessionLocal
+            except Exception as e:
+                logger.warning(f"DB 세션 생성 불가, 로컬 조율만 사용: {e}")
+                session_factory = None
+
+            # AIService, TradingService 불필요
+            self._container = Container.create_from_legacy(
+                upbit_client=self._get_exchange_client(),
+                data_collector=DataCollector(),
+                session_factory=session_factory,
+                coordination_dir=CoordinationConfig.DIR,
+            )
+            logger.info("✅ 봇 Container 초기화 완료")
+        return self._container
+
+    def _get_cycle_coordinator(self):
+        """스케줄러와 공유하는 거래 사이클 조율기"""
+        if self._coordinator is None:
+            self._coordinator = self._get_container().get_cycle_coordinator(owner="telegram")
+        return self._coordinator
+
+    def _get_trading_runtime(self):
+        """TradingRuntime (1회 생성, 파이프라인/스캔 Executor 재사용)"""
+        if self._runtime is None:
+            from src.application.services.trading_runtime import TradingRuntime
+            self._runtime = TradingRuntime()
+        return self._runtime
+
+    def _get_snapshot_cache(self):
+        """포트폴리오 스냅샷 캐시 (/status, /positions, /balance 공유)"""
+        if self._snapshot_cache is None:
+            from src.application.services.portfolio_snapshot import PortfolioSnapshotCache
+            self._snapshot_cache = PortfolioSnapshotCache(
+                exchange_client=self._get_exchange_client(),
+                ttl=settings.TELEGRAM_SNAPSHOT_TTL,
+                max_stale=settings.TELEGRAM_SNAPSHOT_MAX_STALE,
+            )
+        return self._snapshot_cache
+
+    def _get_scan_store(self):
+        """스케줄러와 공유하는 스캔 결과 저장소"""
+        if self._scan_store is None:
+            from src.application.services.scan_result_store import get_scan_result_store
+            self._scan_store = get_scan_result_store()
+        return self._scan_store
+
+    @staticmethod
+    def _format_snapshot_time(snapshot) -> str:
+        """스냅샷 기준 시각 (경과 시간 포함)"""
+        return f"{snapshot.fetched_at.strftime('%Y-%m-%d %H:%M:%S')} ({snapshot.age_seconds:.0f}초 전)"
+
     def _parse_allowed_chat_ids(self) -> set:
         """허용된 채팅 ID 목록 파싱"""
         chat_id = settings.TELEGRAM_CHAT_ID
@@ -96,6 +190,7 @@ class TelegramBotService:
         self._application.add_handler(CommandHandler("status", self._cmd_status))
         self._application.add_handler(CommandHandler("positions", self._cmd_positions))
         self._application.add_handler(CommandHandler("balance", self._cmd_balance))
+        self._application.add_handler(CommandHandler("scan", self._cmd_scan))
 
         # 봇 정보 출력
         logger.info("=" * 60)
@@ -119,6 +214,11 @@ class TelegramBotService:
             await self._application.shutdown()
             logger.info("✅ Telegram 봇이 안전하게 종료되었습니다.")
 
+        if self._snapshot_cache is not None:
+            await self._snapshot_cache.aclose()
+        if self._runtime is not None:
+            self._runtime.shutdown()
+
     # =========================================================================
     # 명령어 핸들러
     # =========================================================================
@@ -139,6 +239,7 @@ class TelegramBotService:
 /status - 현재 봇 상태 확인
 /positions - 보유 포지션 목록
 /balance - 잔고 확인
+/scan - 마지막 스캔 결과
 /help - 도움말
 
 🕐 <b>현재 시각:</b> {time}
@@ -168,6 +269,7 @@ class TelegramBotService:
 /status - 봇 및 시스템 상태 확인
 /positions - 현재 보유 포지션 목록
 /balance - KRW 및 코인 잔고 확인
+/scan - 스케줄러의 마지막 스캔 결과
 
 ━━━━━━━━━━━━━━━━━━━━
 <b>ℹ️ 기타</b>
@@ -303,6 +405,12 @@ class TelegramBotService:
             lines.append("━━━━━━━━━━━━━━━━━━━━")
             lines.append("<b>📊 스캔 요약</b>")
             lines.append("━━━━━━━━━━━━━━━━━━━━")
+            tier1 = (scan_summary.get('tier_stats') or {}).get('tier1')
+            if tier1:
+                lines.append(
+                    f"🌐 <b>전체 마켓 필터:</b> {tier1.get('universe', 0)}개 → "
+                    f"{tier1.get('survivors', 0)}개 ({tier1.get('seconds', 0):.1f}초)"
+                )
             lines.append(f"📈 <b>유동성 스캔:</b> {liquidity_scanned}개 코인")
             lines.append(f"🔬 <b>백테스팅 통과:</b> {backtest_passed}개 코인")
             if ai_analyzed:
@@ -416,6 +524,90 @@ class TelegramBotService:
 
         return "\n".join(lines)
 
+    async def _run_cycle(self, run_id):
+        """
+        이 프로세스에서 거래 사이클 실행 (CycleCoordinator가 락 획득 후 호출)
+
+        Args:
+            run_id: 사이클 보드 run id (스캔 진행 기록용)
+        """
+        from src.config.settings import TradingConfig
+        from src.application.services.cycle_coordinator import CYCLE_LOCK_NAME
+
+        coordinator = self._get_cycle_coordinator()
+        orchestrator = self._get_container().get_trading_orchestrator(
+            runtime=self._get_trading_runtime()
+        )
+
+        async def on_backtest_complete(backtest_data: dict):
+            coordinator.progress(run_id, "scanned", {
+                'scan_summary': backtest_data.get('scan_summary', {}),
+                'selected_coin': backtest_data.get('selected_coin'),
+                'all_backtest_results': backtest_data.get('all_backtest_results', []),
+            })
+
+        orchestrator.set_on_backtest_complete(on_backtest_complete)
+        try:
+            return await orchestrator.execute_trading_cycle(
+                ticker=TradingConfig.TICKER,
+                trading_type='spot',
+                enable_scanning=True,
+                max_positions=3,
+                # 조율기가 획득한 trading_cycle lease (주문 직전 fencing 검증)
+                lock_lease=coordinator.lock_port.get_lease(CYCLE_LOCK_NAME)
+            )
+        finally:
+            # 거래가 있었을 수 있으므로 다음 조회는 새 잔고로
+            self._get_snapshot_cache().invalidate()
+
+    async def _send_cycle_progress(self, update, run: dict):
+        """합류한 사이클의 진행 단계 전달"""
+        if run['stage'] == 'started':
+            owner = '스케줄러' if run['owner'] == 'scheduler' else run['owner']
+            await update.message.reply_text(
+                f"🔗 <b>진행 중인 사이클에 합류</b>\n\n"
+                f"{owner}가 실행 중인 사이클 #{run['id']}의 결과를 기다립니다.\n"
+                f"(중복 스캔/AI 분석 없이 같은 결과를 전달합니다)",
+                parse_mode="HTML"
+            )
+        elif run['stage'] == 'scanned':
+            detail = run.get('detail') or {}
+            scan_summary = detail.get('scan_summary') or {}
+            selected_coin = detail.get('selected_coin') or {}
+            selected = selected_coin.get('symbol') or (selected_coin.get('ticker') or '').replace('KRW-', '')
+            await update.message.reply_text(
+                f"🔍 <b>스캔 완료</b> (사이클 #{run['id']})\n"
+                f"유동성 {scan_summary.get('liquidity_scanned', 0)}개 → "
+                f"통과 {scan_summary.get('backtest_passed', 0)}개, "
+                f"선택: {selected or '없음'}\n⏳ AI 분석 진행 중...",
+                parse_mode="HTML"
+            )
+
+    @staticmethod
+    def _format_cycle_origin(outcome) -> str:
+        """다른 프로세스의 사이클 결과인 경우 출처 표시"""
+        if outcome.run is None or outcome.mode == 'executed':
+            return ""
+        run = outcome.run
+        owner = '스케줄러' if run['owner'] == 'scheduler' else run['owner']
+        if outcome.mode == 'reused':
+            finished = datetime.fromtimestamp(run['finished_at']).strftime('%H:%M:%S')
+            return f"♻️ <b>이번 캔들 사이클은 이미 완료됨</b> ({owner} #{run['id']}, {finished})\n\n"
+        if outcome.mode == 'attached':
+            return f"🔗 <b>{owner} 사이클 #{run['id']} 결과</b>\n\n"
+        return ""
+
+    @staticmethod
+    def _format_coordination_stats(stats: dict) -> str:
+        """최근 24시간 사이클 중복 실행 통계"""
+        if not stats or not stats.get('requests'):
+            return ""
+        return (
+            f"\n📎 <b>24h 사이클 요청:</b> {stats['requests']}회 "
+            f"(합류 {stats.get('attached', 0)} · 재사용 {stats.get('reused', 0)}), "
+            f"중복 실행 {stats.get('duplicate_ratio', 0.0) * 100:.0f}%"
+        )
+
     async def _cmd_run(self, update, context):
         """트레이딩 사이클 수동 실행"""
         if not self._is_authorized(update.effective_chat.id):
@@ -441,35 +633,31 @@ class TelegramBotService:
 
             start_time = datetime.now()
 
-            # Clean Architecture: Container를 통한 트레이딩 사이클 실행
-            from src.container import Container
-            from src.api.upbit_client import UpbitClient
-            from src.data.collector import DataCollector
-            from src.config.settings import TradingConfig
-
-            ticker = TradingConfig.TICKER
-            upbit_client = UpbitClient()
-            data_collector = DataCollector()
+            # 스케줄러와 같은 trading_cycle 락/사이클 보드를 통해 실행 (중복 사이클 방지)
+            coordinator = self._get_cycle_coordinator()
 
-            # Container 초기화 (AIService, TradingService 불필요)
-            container = Container.create_from_legacy(
-                upbit_client=upbit_client,
-                data_collector=data_collector
-            )
+            async def on_progress(run):
+                await self._send_cycle_progress(update, run)
 
-            # TradingOrchestrator를 통한 거래 사이클 실행
-            orchestrator = container.get_trading_orchestrator()
-            result = await orchestrator.execute_trading_cycle(
-                ticker=ticker,
-                trading_type='spot',
-                enable_scanning=True,
-                max_positions=3
-            )
+            outcome = await coordinator.run_or_attach(self._run_cycle, on_progress=on_progress)
+            result = outcome.result
 
             duration = (datetime.now() - start_time).total_seconds()
 
+            if outcome.mode == coordinator.MODE_ATTACHED:
+                # 다른 프로세스의 사이클이 거래했을 수 있음
+                self._get_snapshot_cache().invalidate()
+
+            if outcome.mode == coordinator.MODE_EXECUTED and (
+                result.get('scan_summary') or result.get('scan_result')
+            ):
+                try:
+                    self._get_scan_store().save(result)
+                except Exception as store_error:
+                    logger.warning(f"스캔 결과 저장 실패: {store_error}")
+
             # 스캔/백테스트 결과 추출
-            scan_info = self._format_scan_result(result)
+            scan_info = self._format_cycle_origin(outcome) + self._format_scan_result(result)
 
             # 결과 메시지 생성
             if result.get('status') == 'success':
@@ -516,6 +704,8 @@ class TelegramBotService:
 ⚠️ <b>오류:</b> {error_msg}
                 """
 
+            message += self._format_coordination_stats(outcome.stats)
+
             await update.message.reply_text(message, parse_mode="HTML")
 
         except Exception as e:
@@ -528,18 +718,14 @@ class TelegramBotService:
             self._is_running_cycle = False
 
     async def _cmd_status(self, update, context):
-        """봇 상태 확인"""
+        """봇 상태 확인 (포트폴리오 스냅샷 + 마지막 스캔)"""
         if not self._is_authorized(update.effective_chat.id):
             await update.message.reply_text("⛔ 권한이 없습니다.")
             return
 
         try:
-            from src.api.upbit_client import UpbitClient
-            from src.position.portfolio_manager import PortfolioManager
-
-            upbit_client = UpbitClient()
-            pm = PortfolioManager(exchange_client=upbit_client)
-            status = pm.get_portfolio_status()
+            snapshot = await self._get_snapshot_cache().get()
+            status = snapshot.status
 
             running_status = "🔴 중지됨" if not self._is_running_cycle else "🟢 실행 중"
 
@@ -560,8 +746,8 @@ class TelegramBotService:
 💵 <b>총 자산:</b> {status.total_current_value:,.0f} KRW
 💴 <b>가용 현금:</b> {status.krw_balance:,.0f} KRW
 📈 <b>투자 금액:</b> {status.total_invested:,.0f} KRW
-
-🕐 <b>확인 시각:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+{self._format_last_scan_line()}
+🕐 <b>기준 시각:</b> {self._format_snapshot_time(snapshot)}
             """
 
             await update.message.reply_text(message, parse_mode="HTML")
@@ -573,20 +759,40 @@ class TelegramBotService:
                 parse_mode="HTML"
             )
 
+    def _format_last_scan_line(self) -> str:
+        """/status용 마지막 스캔 요약 (없으면 빈 문자열)"""
+        try:
+            record = self._get_scan_store().load()
+        except Exception as e:
+            logger.warning(f"스캔 결과 조회 실패: {e}")
+            return ""
+        if not record:
+            return ""
+
+        scan_summary = record.get('scan_summary') or {}
+        selected_coin = record.get('selected_coin') or {}
+        selected = selected_coin.get('symbol') or (selected_coin.get('ticker') or '').replace('KRW-', '')
+        age = self._get_scan_store().age_seconds(record)
+        age_text = f" ({age / 60:.0f}분 전)" if age is not None else ""
+
+        return (
+            "\n━━━━━━━━━━━━━━━━━━━━\n"
+            "<b>🔍 마지막 스캔</b>\n"
+            "━━━━━━━━━━━━━━━━━━━━\n"
+            f"📈 <b>유동성 스캔:</b> {scan_summary.get('liquidity_scanned', 0)}개 → "
+            f"<b>통과:</b> {scan_summary.get('backtest_passed', 0)}개\n"
+            f"🎯 <b>선택 코인:</b> {selected or '없음'}{age_text}\n"
+        )
+
     async def _cmd_positions(self, update, context):
-        """보유 포지션 목록"""
+        """보유 포지션 목록 (포트폴리오 스냅샷)"""
         if not self._is_authorized(update.effective_chat.id):
             await update.message.reply_text("⛔ 권한이 없습니다.")
             return
 
         try:
-            from src.api.upbit_client import UpbitClient
-            from src.position.portfolio_manager import PortfolioManager
-            from src.scanner.sector_mapping import get_coin_sector, get_sector_korean_name
-
-            upbit_client = UpbitClient()
-            pm = PortfolioManager(exchange_client=upbit_client)
-            status = pm.get_portfolio_status()
+            snapshot = await self._get_snapshot_cache().get()
+            status = snapshot.status
 
             if not status.positions:
                 await update.message.reply_text(
@@ -601,8 +807,8 @@ class TelegramBotService:
                 sector = get_coin_sector(pos.symbol)
                 sector_name = get_sector_korean_name(sector)
 
-                pnl_emoji = "📈" if pos.unrealized_pnl >= 0 else "📉"
-                pnl_sign = "+" if pos.unrealized_pnl >= 0 else ""
+                pnl_emoji = "📈" if pos.profit_loss >= 0 else "📉"
+                pnl_sign = "+" if pos.profit_loss >= 0 else ""
 
                 message += f"""
 ━━━━━━━━━━━━━━━━━━━━
@@ -610,12 +816,12 @@ class TelegramBotService:
 ━━━━━━━━━━━━━━━━━━━━
 💵 <b>평균 단가:</b> {pos.avg_buy_price:,.0f} KRW
 💴 <b>현재가:</b> {pos.current_price:,.0f} KRW
-📦 <b>수량:</b> {pos.balance:.8f}
+📦 <b>수량:</b> {pos.amount:.8f}
 💰 <b>평가금액:</b> {pos.current_value:,.0f} KRW
 {pnl_emoji} <b>수익률:</b> {pnl_sign}{pos.profit_rate:.2f}%
 """
 
-            message += f"\n🕐 <b>확인 시각:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            message += f"\n🕐 <b>기준 시각:</b> {self._format_snapshot_time(snapshot)}"
 
             await update.message.reply_text(message, parse_mode="HTML")
 
@@ -627,44 +833,32 @@ class TelegramBotService:
             )
 
     async def _cmd_balance(self, update, context):
-        """잔고 확인"""
+        """잔고 확인 (포트폴리오 스냅샷)"""
         if not self._is_authorized(update.effective_chat.id):
             await update.message.reply_text("⛔ 권한이 없습니다.")
             return
 
         try:
-            from src.api.upbit_client import UpbitClient
-
-            upbit_client = UpbitClient()
-            balances = upbit_client.get_balances()
+            snapshot = await self._get_snapshot_cache().get()
 
             message = "💰 <b>잔고 현황</b>\n\n"
 
-            total_krw = 0
-
-            for bal in balances:
-                currency = bal.get('currency', '')
-                balance = float(bal.get('balance', 0))
-                avg_buy_price = float(bal.get('avg_buy_price', 0))
+            krw_balance = snapshot.status.krw_balance
+            if krw_balance > 0:
+                message += f"💵 <b>KRW:</b> {krw_balance:,.0f}\n"
 
-                if balance <= 0:
+            for holding in snapshot.holdings:
+                if not holding.current_price:
                     continue
-
-                if currency == 'KRW':
-                    total_krw += balance
-                    message += f"💵 <b>KRW:</b> {balance:,.0f}\n"
-                else:
-                    current_price = upbit_client.get_current_price(f"KRW-{currency}")
-                    if current_price:
-                        value = balance * current_price
-                        total_krw += value
-                        pnl = ((current_price - avg_buy_price) / avg_buy_price * 100) if avg_buy_price > 0 else 0
-                        pnl_sign = "+" if pnl >= 0 else ""
-                        message += f"🪙 <b>{currency}:</b> {balance:.8f} (≈{value:,.0f} KRW, {pnl_sign}{pnl:.2f}%)\n"
+                pnl_sign = "+" if holding.profit_rate >= 0 else ""
+                message += (
+                    f"🪙 <b>{holding.currency}:</b> {holding.amount:.8f} "
+                    f"(≈{holding.value:,.0f} KRW, {pnl_sign}{holding.profit_rate:.2f}%)\n"
+                )
 
             message += f"\n━━━━━━━━━━━━━━━━━━━━\n"
-            message += f"💎 <b>총 자산:</b> {total_krw:,.0f} KRW\n"
-            message += f"\n🕐 <b>확인 시각:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            message += f"💎 <b>총 자산:</b> {snapshot.total_value:,.0f} KRW\n"
+            message += f"\n🕐 <b>기준 시각:</b> {self._format_snapshot_time(snapshot)}"
 
             await update.message.reply_text(message, parse_mode="HTML")
 
@@ -675,6 +869,36 @@ class TelegramBotService:
                 parse_mode="HTML"
             )
 
+    async def _cmd_scan(self, update, context):
+        """마지막 스캔 결과 (스케줄러가 저장한 결과, 재스캔 없음)"""
+        if not self._is_authorized(update.effective_chat.id):
+            await update.message.reply_text("⛔ 권한이 없습니다.")
+            return
+
+        try:
+            store = self._get_scan_store()
+            record = store.load()
+            if not record:
+                await update.message.reply_text(
+                    "📭 <b>스캔 결과 없음</b>\n\n아직 완료된 스캔이 없습니다.",
+                    parse_mode="HTML"
+                )
+                return
+
+            message = self._format_scan_result(record)
+            age = store.age_seconds(record)
+            if age is not None:
+                message += f"\n\n🕐 <b>스캔 시각:</b> {record['saved_at'][:19].replace('T', ' ')} ({age / 60:.0f}분 전)"
+
+            await update.message.reply_text(message, parse_mode="HTML")
+
+        except Exception as e:
+            logger.error(f"스캔 결과 조회 중 오류: {e}", exc_info=True)
+            await update.message.reply_text(
+                f"❌ 스캔 결과 조회 실패: {str(e)[:100]}",
+                parse_mode="HTML"
+            )
+
 
 class GracefulKiller:
     """Graceful Shutdown 핸들러"""
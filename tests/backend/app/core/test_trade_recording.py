@@ -169,7 +169,7 @@ class TestTradeRecordingSaveToPostgreSQL:
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_failed_trade_does_not_save(self):
+    async def test_failed_trade_does_not_save(self, tmp_path, monkeypatch):
         """
         거래 사이클 실패 시 DB에 저장하지 않는지 확인
         
@@ -177,6 +177,12 @@ class TestTradeRecordingSaveToPostgreSQL:
         When: trading_job이 실행됨
         Then: PostgreSQL에 거래 내역이 저장되지 않음
         """
+        # 조율 파일(락/사이클 보드)은 임시 디렉토리에
+        import backend.app.core.scheduler as scheduler_module
+        from src.config.settings import CoordinationConfig
+        monkeypatch.setattr(CoordinationConfig, 'DIR', str(tmp_path / "coordination"))
+        monkeypatch.setattr(scheduler_module, '_container', None)
+
         # Given: 거래 사이클 실패 결과
         mock_result = {
             'status': 'failed',
@@ -0,0 +1,211 @@
+"""
+AI 판단 정확도 분석 서비스 테스트
+
+SQLite(aiosqlite)에서 link_pnl 증분 rollup 결과가
+decision_records 직접 집계 / 전체 재생성 결과와 일치하는지 검증합니다.
+"""
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+
+from backend.app.models.decision_accuracy_stat import DecisionAccuracyStat
+from backend.app.models.decision_record import DecisionRecordModel
+from backend.app.services.decision_accuracy import (
+    get_accuracy_breakdown,
+    rebuild_accuracy_rollup,
+    wilson_interval,
+)
+from src.application.ports.outbound.decision_record_port import PnLLabel
+from src.infrastructure.adapters.persistence.decision_record_adapter import DecisionRecordAdapter
+
+NOW = datetime(2026, 10, 18, 15, 30, 0)
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'accuracy.db'}")
+    async with engine.begin() as conn:
+        for model in (DecisionRecordModel, DecisionAccuracyStat):
+            await conn.run_sync(model.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def make_records(count, seed=11):
+    rng = random.Random(seed)
+    return [
+        {
+            "symbol": rng.choice(["KRW-BTC", "KRW-ETH", "KRW-XRP"]),
+            "decision": rng.choice(["ALLOW", "BLOCK"]),
+            "confidence": Decimal("70"),
+            "prompt_version": rng.choice(["1.0.0", "2.0.0"]),
+            "prompt_type": "ENTRY",
+            "created_at": NOW - timedelta(seconds=rng.uniform(0, 10 * 86400)),
+        }
+        for _ in range(count)
+    ]
+
+
+async def seed_and_link(session_factory, count, seed=11):
+    """기록 생성 후 adapter.link_pnl로 PnL 연동 (일부는 미연동)"""
+    async with session_factory() as session:
+        await session.execute(insert(DecisionRecordModel), make_records(count, seed))
+        await session.commit()
+
+    rng = random.Random(seed)
+    async with session_factory() as session:
+        adapter = DecisionRecordAdapter(db_session=session)
+        ids = (await session.execute(select(DecisionRecordModel.id))).scalars().all()
+        for record_id in ids:
+            if rng.random() < 0.2:
+                continue
+            pnl = Decimal(str(round(rng.uniform(-5, 5), 2)))
+            await adapter.link_pnl(str(record_id), PnLLabel(
+                pnl_percent=pnl, is_profitable=pnl > 0, exit_reason="take_profit"))
+        await session.commit()
+
+
+async def brute_force(session_factory):
+    """decision_records 직접 집계 {(버전, 심볼, 판단, 일자): [total, correct]}"""
+    expected = defaultdict(lambda: [0, 0])
+    async with session_factory() as session:
+        records = (await session.execute(select(DecisionRecordModel))).scalars().all()
+    for r in records:
+        if r.is_profitable is None:
+            continue
+        key = (r.prompt_version, r.symbol, r.decision, r.created_at.date())
+        expected[key][0] += 1
+        expected[key][1] += int(r.is_profitable)
+    return expected
+
+
+def as_matrix(breakdown):
+    return {
+        (row["prompt_version"], row["symbol"], row["decision"], row["day"]): [row["total"], row["correct"]]
+        for row in breakdown
+    }
+
+
+class TestWilsonInterval:
+    """Wilson 신뢰구간"""
+
+    def test_known_values(self):
+        """8/10 → 약 (0.490, 0.943)"""
+        low, high = wilson_interval(8, 10)
+        assert low == pytest.approx(0.4902, abs=1e-3)
+        assert high == pytest.approx(0.9433, abs=1e-3)
+
+    def test_empty_and_bounds(self):
+        """표본 없음은 (0, 1), 극단값도 [0, 1] 범위"""
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+        low, high = wilson_interval(5, 5)
+        assert 0.0 < low < 1.0 and high == pytest.approx(1.0)
+
+
+class TestAccuracyRollup:
+    """link_pnl 증분 rollup"""
+
+    @pytest.mark.asyncio
+    async def test_breakdown_matches_brute_force(self, session_factory):
+        """버전 × 심볼 × 판단 × 일자 매트릭스가 직접 집계와 일치"""
+        await seed_and_link(session_factory, 400)
+
+        async with session_factory() as session:
+            breakdown = await get_accuracy_breakdown(session)
+
+        expected = await brute_force(session_factory)
+        assert as_matrix(breakdown) == dict(expected)
+        for row in breakdown:
+            assert row["ci_low"] <= row["accuracy"] <= row["ci_high"]
+
+    @pytest.mark.asyncio
+    async def test_relink_replaces_previous_outcome(self, session_factory):
+        """PnL 재연동 시 이전 결과를 대체 (중복 집계 없음)"""
+        async with session_factory() as session:
+            await session.execute(insert(DecisionRecordModel), make_records(1))
+            await session.commit()
+
+        async with session_factory() as session:
+            adapter = DecisionRecordAdapter(db_session=session)
+            await adapter.link_pnl("1", PnLLabel(Decimal("-2"), False, "stop_loss"))
+            await adapter.link_pnl("1", PnLLabel(Decimal("3"), True, "manual"))
+            await session.commit()
+
+            [row] = await get_accuracy_breakdown(session)
+            stats = await adapter.get_accuracy_stats()
+
+        assert (row["total"], row["correct"]) == (1, 1)
+        assert row["avg_pnl_percent"] == pytest.approx(3.0)
+        assert stats == {"accuracy": 1.0, "total": 1, "correct": 1}
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self, session_factory):
+        """전체 재생성 결과가 증분 결과와 일치"""
+        await seed_and_link(session_factory, 300, seed=3)
+
+        async with session_factory() as session:
+            incremental = as_matrix(await get_accuracy_breakdown(session))
+            await rebuild_accuracy_rollup(session)
+            rebuilt = as_matrix(await get_accuracy_breakdown(session))
+
+        assert rebuilt == incremental
+
+    @pytest.mark.asyncio
+    async def test_grouping_and_filters(self, session_factory):
+        """차원 부분집합 + 필터 조합"""
+        await seed_and_link(session_factory, 300, seed=5)
+        expected = await brute_force(session_factory)
+        start_day = (NOW - timedelta(days=3)).date()
+
+        async with session_factory() as session:
+            by_version = await get_accuracy_breakdown(
+                session, start_day=start_day, symbols=["KRW-BTC"], group_by=["prompt_version"])
+            overall = await get_accuracy_breakdown(session, group_by=[])
+
+        for row in by_version:
+            totals = [
+                v for (version, symbol, _, day), v in expected.items()
+                if version == row["prompt_version"] and symbol == "KRW-BTC" and day >= start_day
+            ]
+            assert row["total"] == sum(t for t, _ in totals)
+            assert row["correct"] == sum(c for _, c in totals)
+        assert overall[0]["total"] == sum(t for t, _ in expected.values())
+
+        with pytest.raises(ValueError):
+            async with session_factory() as session:
+                await get_accuracy_breakdown(session, group_by=["confidence"])
+
+    @pytest.mark.asyncio
+    async def test_accuracy_stats_with_partial_start_day(self, session_factory):
+        """start_date가 자정이 아니어도 직접 집계와 일치"""
+        await seed_and_link(session_factory, 300, seed=9)
+        start_date = NOW - timedelta(days=4, hours=5)
+
+        async with session_factory() as session:
+            adapter = DecisionRecordAdapter(db_session=session)
+            stats = await adapter.get_accuracy_stats(prompt_version="2.0.0", start_date=start_date)
+            records = (await session.execute(
+                select(DecisionRecordModel).where(
+                    DecisionRecordModel.prompt_version == "2.0.0",
+                    DecisionRecordModel.created_at >= start_date,
+                    DecisionRecordModel.is_profitable.isnot(None),
+                )
+            )).scalars().all()
+
+        assert stats["total"] == len(records)
+        assert stats["correct"] == sum(1 for r in records if r.is_profitable)
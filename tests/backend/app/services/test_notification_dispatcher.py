@@ -0,0 +1,341 @@
+"""
+알림 전송 디스패처 테스트
+
+- 메시지 분할 (4096자)
+- 큐 + 병합 + 속도 제한 + 재시도 (가짜 전송 함수)
+- TelegramNotifier → 로컬 가짜 Bot API 서버 전송 (python-telegram-bot 실제 요청 경로)
+"""
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs
+
+import pytest
+import pytest_asyncio
+
+from backend.app.services.notification_dispatcher import (
+    TELEGRAM_MAX_MESSAGE_LENGTH,
+    NotificationDispatcher,
+    NotificationRejected,
+    split_message,
+)
+
+
+class RecordingSender:
+    """전송 기록용 가짜 전송 함수"""
+
+    def __init__(self, failures=0, error=None, delay=0.0):
+        self.calls = []
+        self.failures = failures
+        self.error = error or ConnectionError("network down")
+        self.delay = delay
+
+    async def __call__(self, chat_id, text, parse_mode):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.failures > 0:
+            self.failures -= 1
+            raise self.error
+        self.calls.append((chat_id, text, parse_mode, time.monotonic()))
+
+
+class FakeBotApi:
+    """
+    로컬 가짜 Telegram Bot API 서버
+
+    /bot<token>/sendMessage 요청을 기록하고, rate_limited 횟수만큼 429를 응답합니다.
+    """
+
+    def __init__(self, rate_limited=0):
+        self.messages = []
+        self.rate_limited = rate_limited
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                path = request_line.decode().split(" ")[1]
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode().strip()
+                    if not line:
+                        break
+                    key, value = line.split(":", 1)
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                status, payload = self._respond(path, headers.get("content-type", ""), body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, path, content_type, body):
+        if "json" in content_type:
+            params = json.loads(body or b"{}")
+        else:
+            params = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+
+        if path.endswith("/sendMessage"):
+            if self.rate_limited > 0:
+                self.rate_limited -= 1
+                return "429 Too Many Requests", {
+                    "ok": False, "error_code": 429,
+                    "description": "Too Many Requests: retry after 1",
+                    "parameters": {"retry_after": 1},
+                }
+            self.messages.append(params)
+            return "200 OK", {"ok": True, "result": {
+                "message_id": len(self.messages), "date": int(time.time()),
+                "chat": {"id": int(params["chat_id"]), "type": "private"},
+                "text": params.get("text", ""),
+            }}
+        if path.endswith("/getMe"):
+            return "200 OK", {"ok": True, "result": {
+                "id": 1, "is_bot": True, "first_name": "fake", "username": "fake_bot",
+            }}
+        return "404 Not Found", {"ok": False, "error_code": 404, "description": "Not Found"}
+
+
+class TestSplitMessage:
+    """4096자 분할"""
+
+    def test_short_message_unchanged(self):
+        assert split_message("hello") == ["hello"]
+
+    def test_splits_on_line_boundaries(self):
+        """줄 경계에서 분할, 모든 조각 4096자 이하, 내용 보존"""
+        lines = [f"line {i} " + "x" * 90 for i in range(200)]
+        text = "\n".join(lines)
+
+        parts = split_message(text)
+
+        assert len(parts) > 1
+        assert all(len(part) <= TELEGRAM_MAX_MESSAGE_LENGTH for part in parts)
+        assert "\n".join(parts) == text
+
+    def test_hard_splits_long_line(self):
+        """한 줄이 4096자를 넘으면 강제 분할"""
+        text = "a" * 10000
+
+        parts = split_message(text)
+
+        assert [len(part) for part in parts] == [4096, 4096, 1808]
+        assert "".join(parts) == text
+
+
+class TestNotificationDispatcher:
+    """큐 기반 전송"""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_returns_immediately(self):
+        """전송이 느려도 enqueue는 즉시 반환"""
+        sender = RecordingSender(delay=0.5)
+        dispatcher = NotificationDispatcher(sender, coalesce_window=0, min_interval=0)
+
+        started = time.perf_counter()
+        assert dispatcher.enqueue("42", "cycle start") is True
+        assert time.perf_counter() - started < 0.05
+
+        assert await dispatcher.flush(timeout=5)
+        assert len(sender.calls) == 1
+        await dispatcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self):
+        """병합 대기 시간 안의 메시지는 한 메시지로 전송"""
+        sender = RecordingSender()
+        dispatcher = NotificationDispatcher(sender, coalesce_window=0.2, min_interval=0)
+
+        for text in ("scan", "ai decision", "portfolio"):
+            dispatcher.enqueue("42", text)
+        await asyncio.sleep(0.4)
+
+        assert [call[1] for call in sender.calls] == ["scan\n\nai decision\n\nportfolio"]
+        assert dispatcher.get_stats()["coalesced"] == 2
+        await dispatcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_coalescing_respects_chat_and_length(self):
+        """다른 채팅/4096자 초과는 합치지 않음, 긴 메시지는 분할"""
+        sender = RecordingSender()
+        dispatcher = NotificationDispatcher(sender, coalesce_window=0.1, min_interval=0)
+
+        dispatcher.enqueue("42", "a" * 3000)
+        dispatcher.enqueue("42", "b" * 3000)
+        dispatcher.enqueue("7", "other chat")
+        dispatcher.enqueue("42", "c" * 5000)
+        await dispatcher.flush(timeout=5)
+
+        sent = [(chat, len(text)) for chat, text, _, _ in sender.calls]
+        assert sent == [("42", 3000), ("42", 3000), ("7", 10), ("42", 4096), ("42", 904)]
+        assert dispatcher.get_stats()["split"] == 1
+        await dispatcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_chat_rate_limit(self):
+        """같은 채팅은 min_interval 간격으로 전송"""
+        sender = RecordingSender()
+        dispatcher = NotificationDispatcher(sender, coalesce_window=0, min_interval=0.2)
+
+        dispatcher.enqueue("42", "x" * 4000)
+        dispatcher.enqueue("42", "y" * 4000)
+        await dispatcher.flush(timeout=5)
+
+        assert len(sender.calls) == 2
+        assert sender.calls[1][3] - sender.calls[0][3] >= 0.19
+        await dispatcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retry_with_backoff(self):
+        """일시 오류는 백오프 후 재시도"""
+        sender = RecordingSender(failures=2)
+        dispatcher = NotificationDispatcher(
+            sender, coalesce_window=0, min_interval=0, max_attempts=3, backoff_base=0.01)
+
+        dispatcher.enqueue("42", "trade")
+        await dispatcher.flush(timeout=5)
+
+        stats = dispatcher.get_stats()
+        assert len(sender.calls) == 1
+        assert stats["retries"] == 2
+        assert stats["failed"] == 0
+        await dispatcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_rejected_and_exhausted_messages_fail(self):
+        """거부된 메시지는 재시도 없이 실패, 시도 초과도 실패 처리 후 계속 동작"""
+        rejected = RecordingSender(failures=1, error=NotificationRejected("can't parse entities"))
+        dispatcher = NotificationDispatcher(rejected, coalesce_window=0, min_interval=0, backoff_base=0.01)
+        dispatcher.enqueue("42", "<b>broken")
+        await dispatcher.flush(timeout=5)
+        assert dispatcher.get_stats()["retries"] == 0
+        assert dispatcher.get_stats()["failed"] == 1
+
+        flaky = RecordingSender(failures=5)
+        dispatcher = NotificationDispatcher(
+            flaky, coalesce_window=0, min_interval=0, max_attempts=2, backoff_base=0.01)
+        dispatcher.enqueue("42", "lost")
+        await dispatcher.flush(timeout=5)
+        flaky.failures = 0
+        dispatcher.enqueue("42", "next")
+        await dispatcher.flush(timeout=5)
+
+        assert [call[1] for call in flaky.calls] == ["next"]
+        assert dispatcher.get_stats()["failed"] == 1
+        await dispatcher.aclose()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        """큐가 가득 차면 가장 오래된 메시지 폐기"""
+        sender = RecordingSender()
+        dispatcher = NotificationDispatcher(sender, coalesce_window=10, min_interval=0, max_queue_size=2)
+
+        for text in ("old", "mid", "new"):
+            dispatcher.enqueue("42", text)
+
+        assert dispatcher.get_stats()["dropped"] == 1
+        assert dispatcher.depth == 2
+        await dispatcher.flush(timeout=5)
+        assert [call[1] for call in sender.calls] == ["mid\n\nnew"]
+        await dispatcher.aclose()
+
+
+@pytest_asyncio.fixture
+async def fake_bot_api():
+    server = FakeBotApi()
+    port = await server.start()
+    server.base_url = f"http://127.0.0.1:{port}/bot"
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+def telegram_settings(monkeypatch):
+    from backend.app.services import notification
+
+    def configure(base_url, **overrides):
+        values = {
+            "TELEGRAM_ENABLED": True,
+            "TELEGRAM_BOT_TOKEN": "123456:TEST",
+            "TELEGRAM_CHAT_ID": "42",
+            "TELEGRAM_API_BASE_URL": base_url,
+            "TELEGRAM_ASYNC_DISPATCH": True,
+            "TELEGRAM_COALESCE_WINDOW": 0.1,
+            "TELEGRAM_MIN_INTERVAL": 0.0,
+        }
+        values.update(overrides)
+        for key, value in values.items():
+            monkeypatch.setattr(notification.settings, key, value)
+
+    return configure
+
+
+class TestTelegramNotifierWithFakeBotApi:
+    """TelegramNotifier → 가짜 Bot API 서버"""
+
+    @pytest.mark.asyncio
+    async def test_notifications_are_queued_and_coalesced(self, fake_bot_api, telegram_settings):
+        """사이클 알림은 즉시 반환되고 한 메시지로 전송"""
+        from backend.app.services.notification import TelegramNotifier
+
+        telegram_settings(fake_bot_api.base_url)
+        notifier = TelegramNotifier()
+
+        assert await notifier.notify_bot_status("started", "KRW-BTC - 트레이딩 사이클을 시작합니다")
+        assert await notifier.notify_error("TimeoutError", "scan timeout", {"job": "trading_job"})
+        assert fake_bot_api.messages == []
+
+        assert await notifier.flush(timeout=5)
+
+        assert len(fake_bot_api.messages) == 1
+        message = fake_bot_api.messages[0]
+        assert message["chat_id"] == "42"
+        assert message["parse_mode"] == "HTML"
+        assert "KRW-BTC" in message["text"] and "scan timeout" in message["text"]
+        assert notifier.get_queue_stats()["sent"] == 1
+        await notifier.aclose()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_response_is_retried(self, fake_bot_api, telegram_settings):
+        """429 응답은 retry_after 만큼 대기 후 재전송"""
+        from backend.app.services.notification import TelegramNotifier
+
+        fake_bot_api.rate_limited = 1
+        telegram_settings(fake_bot_api.base_url)
+        notifier = TelegramNotifier()
+
+        await notifier.send_message("x" * 5000)
+        assert await notifier.flush(timeout=10)
+
+        assert [len(m["text"]) for m in fake_bot_api.messages] == [4096, 904]
+        assert notifier.get_queue_stats()["retries"] == 1
+        await notifier.aclose()
+
+    @pytest.mark.asyncio
+    async def test_direct_mode_sends_inline(self, fake_bot_api, telegram_settings):
+        """TELEGRAM_ASYNC_DISPATCH=False면 호출 시 직접 전송"""
+        from backend.app.services.notification import TelegramNotifier
+
+        telegram_settings(fake_bot_api.base_url, TELEGRAM_ASYNC_DISPATCH=False)
+        notifier = TelegramNotifier()
+
+        assert await notifier.send_message("direct") is True
+        assert [m["text"] for m in fake_bot_api.messages] == ["direct"]
+        assert notifier.get_queue_stats() == {}
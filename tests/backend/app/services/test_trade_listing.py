@@ -0,0 +1,222 @@
+"""
+거래 목록 조회 서비스 테스트
+
+SQLite(aiosqlite)에서 keyset 페이지네이션, 카운트 모드, 스트리밍 내보내기를 검증합니다.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import insert
+
+from backend.app.models.trade import Trade
+from backend.app.services.trade_listing import (
+    COUNT_ESTIMATED,
+    COUNT_NONE,
+    InvalidCursorError,
+    TradeFilter,
+    count_trades,
+    decode_cursor,
+    encode_cursor,
+    export_trades_csv,
+    export_trades_ndjson,
+    list_trades_page,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'trades.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Trade.__table__.create)
+
+    rows = []
+    for i in range(53):
+        rows.append({
+            "trade_id": f"t-{i}",
+            "symbol": "KRW-BTC" if i % 2 else "KRW-ETH",
+            "side": "buy" if i % 3 else "sell",
+            "price": Decimal("1000"),
+            "amount": Decimal("1"),
+            "total": Decimal("1000"),
+            "fee": Decimal("0.5"),
+            "status": "completed",
+            # 같은 시각 거래가 여러 건 (id로 순서 결정)
+            "created_at": NOW - timedelta(minutes=i // 4),
+            "updated_at": NOW,
+        })
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db:
+        await db.execute(insert(Trade), rows)
+        await db.commit()
+    yield factory
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(session_factory):
+    async with session_factory() as db:
+        yield db
+
+
+async def collect_pages(db, filters, limit):
+    seen, cursor = [], None
+    while True:
+        trades, cursor = await list_trades_page(db, filters, limit=limit, cursor=cursor)
+        seen.extend(trades)
+        if cursor is None:
+            return seen
+
+
+class TestCursor:
+    """커서 인코딩"""
+
+    def test_round_trip(self):
+        """인코딩 후 디코딩하면 원래 값"""
+        cursor = encode_cursor(NOW, 42)
+        assert decode_cursor(cursor) == (NOW, 42)
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor")
+
+
+class TestKeysetPagination:
+    """keyset 페이지네이션"""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_rows_in_order(self, session):
+        """동일 created_at이 있어도 중복/누락 없이 최신순으로 모든 행 반환"""
+        trades = await collect_pages(session, TradeFilter(), limit=10)
+
+        keys = [(t.created_at, t.id) for t in trades]
+        assert len(trades) == 53
+        assert len(set(keys)) == 53
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_keyset_matches_offset(self, session):
+        """keyset 결과가 OFFSET 결과와 같음 (필터 포함)"""
+        filters = TradeFilter(symbol="KRW-BTC")
+        keyset = await collect_pages(session, filters, limit=7)
+
+        offset = []
+        for skip in range(0, 53, 7):
+            page, _ = await list_trades_page(session, filters, limit=7, skip=skip)
+            offset.extend(page)
+
+        assert [t.id for t in keyset] == [t.id for t in offset]
+        assert all(t.symbol == "KRW-BTC" for t in keyset)
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self, session):
+        """마지막 페이지는 next_cursor 없음"""
+        trades, cursor = await list_trades_page(session, TradeFilter(), limit=100)
+        assert len(trades) == 53
+        assert cursor is None
+
+
+class TestCountTrades:
+    """카운트 모드"""
+
+    @pytest.mark.asyncio
+    async def test_exact_and_none(self, session):
+        assert await count_trades(session, TradeFilter(side="sell")) == (18, False)
+        assert await count_trades(session, TradeFilter(), mode=COUNT_NONE) == (None, False)
+
+    @pytest.mark.asyncio
+    async def test_estimated_falls_back_to_exact_without_postgres(self, session):
+        """PostgreSQL이 아니면 추정 대신 정확한 카운트"""
+        assert await count_trades(session, TradeFilter(), mode=COUNT_ESTIMATED) == (53, False)
+
+
+class TestExport:
+    """스트리밍 내보내기"""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_streams_in_batches(self, session):
+        """배치 단위 청크로 모든 행 출력"""
+        chunks = [c async for c in export_trades_ndjson(session, TradeFilter(), batch_size=20)]
+        lines = "".join(chunks).splitlines()
+
+        assert len(chunks) == 3
+        assert len(lines) == 53
+        first = json.loads(lines[0])
+        assert Decimal(first["price"]) == Decimal("1000")
+        assert datetime.fromisoformat(first["created_at"]) == NOW
+
+    @pytest.mark.asyncio
+    async def test_csv_has_header_and_filtered_rows(self, session):
+        """CSV 헤더 + 필터된 행"""
+        chunks = [c async for c in export_trades_csv(session, TradeFilter(symbol="KRW-ETH"))]
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+
+        assert len(rows) == 27
+        assert {row["symbol"] for row in rows} == {"KRW-ETH"}
+
+
+class TestTradesEndpoint:
+    """GET /trades 파라미터 처리"""
+
+    @pytest.mark.asyncio
+    async def test_cursor_response(self, session):
+        """next_cursor로 다음 페이지 조회, count=none이면 total 생략"""
+        from backend.app.api.v1.endpoints.trades import get_trades
+
+        params = dict(symbol=None, side=None, status=None, from_date=None, to_date=None)
+        first = await get_trades(skip=0, limit=50, cursor=None, count="exact", db=session, **params)
+        second = await get_trades(skip=0, limit=50, cursor=first.next_cursor, count="none",
+                                  db=session, **params)
+
+        assert first.total == 53
+        assert len(first.trades) == 50
+        assert second.total is None
+        assert len(second.trades) == 3
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_with_skip_rejected(self, session):
+        from backend.app.api.v1.endpoints.trades import get_trades
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_trades(skip=10, limit=50, cursor=encode_cursor(NOW, 1), count="none",
+                             symbol=None, side=None, status=None, from_date=None, to_date=None,
+                             db=session)
+        assert exc_info.value.status_code == 400
+
+
+class TestExportEndpoint:
+    """GET /trades/export 세션 수명"""
+
+    @pytest.mark.asyncio
+    async def test_session_opened_inside_stream(self, session_factory):
+        """세션은 본문 스트리밍 중에 열리고 전송이 끝난 뒤 닫힘"""
+        from backend.app.api.v1.endpoints.trades import export_trades
+
+        opened = []
+
+        def tracking_factory():
+            db = session_factory()
+            opened.append(db)
+            return db
+
+        response = await export_trades(format="ndjson", symbol=None, side=None, status=None,
+                                       from_date=None, to_date=None, session_factory=tracking_factory)
+        assert opened == []
+
+        body = "".join([chunk async for chunk in response.body_iterator])
+
+        assert len(body.splitlines()) == 53
+        assert len(opened) == 1
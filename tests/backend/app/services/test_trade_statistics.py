@@ -0,0 +1,142 @@
+"""
+거래 통계 서비스 테스트
+
+SQLite(aiosqlite)에서 rollup 경로와 단일 스캔 경로의 결과 일치,
+증분 rollup / 전체 재생성 일치를 검증합니다.
+"""
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert
+
+from backend.app.models.trade import Trade
+from backend.app.models.trade_daily_stat import TradeDailyStat
+from backend.app.services.trade_statistics import (
+    apply_trade_rollup,
+    get_trade_statistics_summary,
+    rebuild_trade_rollup,
+)
+
+NOW = datetime(2026, 10, 18, 15, 30, 0)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+    async with engine.begin() as conn:
+        for model in (Trade, TradeDailyStat):
+            await conn.run_sync(model.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def make_rows(count, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        price = Decimal(str(rng.randint(1000, 90_000_000)))
+        amount = Decimal("0.01")
+        rows.append({
+            "trade_id": f"t-{i}",
+            "symbol": rng.choice(["KRW-BTC", "KRW-ETH"]),
+            "side": rng.choice(["buy", "sell"]),
+            "price": price,
+            "amount": amount,
+            "total": price * amount,
+            "fee": Decimal("5"),
+            "status": "completed" if i % 10 else "pending",
+            "created_at": NOW - timedelta(seconds=rng.uniform(0, 400 * 86400)),
+            "updated_at": NOW,
+        })
+    return rows
+
+
+async def seed(session_factory, rows):
+    async with session_factory() as session:
+        await session.execute(insert(Trade), rows)
+        await apply_trade_rollup(session, rows)
+        await session.commit()
+
+
+def assert_same(actual, expected):
+    for key in ("total_trades", "total_buy", "total_sell"):
+        assert actual[key] == expected[key], key
+    for key in ("total_volume_krw", "total_fee", "avg_buy_price", "avg_sell_price"):
+        if expected[key] is None:
+            assert actual[key] is None, key
+        else:
+            assert abs(Decimal(actual[key]) - Decimal(expected[key])) < Decimal("0.0001"), key
+
+
+class TestTradeStatisticsSummary:
+    """rollup 경로 vs 단일 스캔 경로"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("days", [1, 7, 30, 365])
+    @pytest.mark.parametrize("symbol", [None, "KRW-BTC"])
+    async def test_rollup_matches_scan(self, session_factory, days, symbol):
+        """기간/심볼별로 두 경로 결과가 같음"""
+        await seed(session_factory, make_rows(600))
+
+        async with session_factory() as session:
+            scan = await get_trade_statistics_summary(
+                session, symbol=symbol, days=days, now=NOW, use_rollup=False)
+            rollup = await get_trade_statistics_summary(
+                session, symbol=symbol, days=days, now=NOW, use_rollup=True)
+
+        assert scan["total_trades"] > 0
+        assert_same(rollup, scan)
+
+    @pytest.mark.asyncio
+    async def test_pending_trades_excluded(self, session_factory):
+        """completed 외 거래는 집계 제외"""
+        rows = make_rows(1)
+        rows[0]["status"] = "pending"
+        rows[0]["created_at"] = NOW - timedelta(days=3)
+        await seed(session_factory, rows)
+
+        async with session_factory() as session:
+            summary = await get_trade_statistics_summary(session, days=30, now=NOW)
+
+        assert summary["total_trades"] == 0
+        assert summary["avg_buy_price"] is None
+
+    @pytest.mark.asyncio
+    async def test_rollup_serves_full_days(self, session_factory):
+        """온전한 날짜 구간은 trades가 아닌 rollup에서 읽음"""
+        await seed(session_factory, make_rows(300))
+        async with session_factory() as session:
+            before = await get_trade_statistics_summary(session, days=365, now=NOW)
+            # 중간 구간 raw 거래 삭제 → rollup 결과는 유지
+            await session.execute(delete(Trade).where(
+                Trade.created_at < NOW - timedelta(days=30),
+                Trade.created_at > NOW - timedelta(days=300),
+            ))
+            await session.commit()
+            after = await get_trade_statistics_summary(session, days=365, now=NOW)
+
+        assert_same(after, before)
+
+
+class TestRollupMaintenance:
+    """증분 rollup / 재생성"""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self, session_factory):
+        """전체 재생성 결과가 증분 갱신 결과와 같음"""
+        rows = make_rows(400)
+        await seed(session_factory, rows[:200])
+        await seed(session_factory, rows[200:])
+
+        async with session_factory() as session:
+            incremental = await get_trade_statistics_summary(session, days=365, now=NOW)
+            await rebuild_trade_rollup(session)
+            rebuilt = await get_trade_statistics_summary(session, days=365, now=NOW)
+
+        assert_same(rebuilt, incremental)
@@ -191,3 +191,55 @@ class TestPerformanceAnalyzer:
         # Then
         assert metrics['profit_factor'] == 2.0  # 10 / 5
 
+
+
+class TestVectorizedMetrics:
+    """구조화 배열 / 스트리밍 지표 테스트"""
+
+    @staticmethod
+    def _trades(pnls):
+        entry_time = datetime(2024, 1, 1, 10, 0, 0)
+        return [
+            Trade('KRW-BTC', 100.0, 100.0, 1.0, entry_time, entry_time + timedelta(hours=i + 1), pnl, pnl, 1.0)
+            for i, pnl in enumerate(pnls)
+        ]
+
+    @pytest.mark.unit
+    def test_trade_records_and_streaks(self):
+        """거래 → 구조화 배열 한 번 변환, 연속/보유시간/손실 메타데이터 계산"""
+        from src.backtesting.performance import trade_records
+
+        trades = self._trades([5.0, -1.0, -3.0, 0.0, -2.0, -3.0, -1.0, 4.0])
+        records = trade_records(trades)
+        assert list(records['holding_hours']) == [1, 2, 3, 4, 5, 6, 7, 8]
+
+        metrics = PerformanceAnalyzer.calculate_metrics(
+            equity_curve=[100.0, 101.0], trades=trades, initial_capital=100.0
+        )
+        assert metrics['max_consecutive_losses'] == 3  # 0 손익은 연속을 끊음
+        assert metrics['max_consecutive_wins'] == 1
+        assert metrics['total_commission'] == 8.0
+        worst = metrics['worst_loss_metadata']
+        assert worst['worst_loss']['exit_time'] == str(trades[2].exit_time)  # 동률이면 먼저 발생한 거래
+        assert worst['avg_loss_holding_hours'] == pytest.approx((2 + 3 + 5 + 6 + 7) / 5)
+
+    @pytest.mark.unit
+    def test_streaming_metrics_match_batch(self):
+        """봉마다 누적한 온라인 지표 == 전체 곡선 배치 계산"""
+        import numpy as np
+        from src.backtesting.performance import StreamingMetrics
+
+        rng = np.random.default_rng(11)
+        equity = 10000.0 * np.cumprod(1 + rng.normal(0.001, 0.02, 300))
+        stream = StreamingMetrics(initial_capital=10000.0, data_interval='minute60')
+        for value in equity:
+            stream.update(value)
+
+        batch = PerformanceAnalyzer.calculate_metrics(
+            equity_curve=equity, trades=[], initial_capital=10000.0, data_interval='minute60'
+        )
+        assert stream.total_return == pytest.approx(batch['total_return'])
+        assert stream.max_drawdown == pytest.approx(batch['max_drawdown'])
+        assert stream.sharpe_ratio == pytest.approx(batch['sharpe_ratio'])
+        assert stream.volatility == pytest.approx(batch['volatility'])
+        assert stream.drawdown == pytest.approx((equity[-1] / equity.max() - 1) * 100)
@@ -48,7 +48,7 @@ class TestOpenAIAPICompatibility:
         mock_client = Mock()
         mock_response = Mock()
         mock_response.choices = [Mock(message=Mock(content='{"decision": "hold", "reason": "test", "confidence": "medium"}'))]
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
         adapter._client = mock_client
 
@@ -69,7 +69,7 @@ class TestOpenAIAPICompatibility:
         mock_client = Mock()
         mock_response = Mock()
         mock_response.choices = [Mock(message=Mock(content='{"decision": "hold", "reason": "test", "confidence": "medium"}'))]
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
         adapter._client = mock_client
 
@@ -86,7 +86,7 @@ class TestOpenAIAPICompatibility:
         """Test OpenAIAdapter returns HOLD on OpenAI API errors."""
         # Mock OpenAI client to raise error
         mock_client = Mock()
-        mock_client.chat.completions.create = Mock(side_effect=Exception("API Error"))
+        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
 
         adapter._client = mock_client
 
@@ -107,7 +107,7 @@ class TestOpenAIAPICompatibility:
         mock_client = Mock()
         mock_response = Mock()
         mock_response.choices = [Mock(message=Mock(content="This is not JSON"))]
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
         adapter._client = mock_client
 
@@ -135,7 +135,7 @@ class TestOpenAIAPICompatibility:
         mock_client = Mock()
         mock_response = Mock()
         mock_response.choices = [Mock(message=Mock(content=korean_response))]
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
         adapter._client = mock_client
 
@@ -154,7 +154,7 @@ class TestOpenAIAPICompatibility:
         # Mock successful API call
         mock_client = Mock()
         mock_response = Mock()
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
         adapter._client = mock_client
 
@@ -170,7 +170,7 @@ class TestOpenAIAPICompatibility:
         """Test is_available() returns False on API errors."""
         # Mock API error
         mock_client = Mock()
-        mock_client.chat.completions.create = Mock(side_effect=Exception("API Down"))
+        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Down"))
 
         adapter._client = mock_client
 
@@ -0,0 +1,290 @@
+"""
+Integration tests for async OpenAIAdapter against a local fake server.
+
+A stdlib HTTP server speaks the /v1/chat/completions protocol with
+scripted responses (429, 500, slow replies) so that the real AsyncOpenAI
++ httpx stack is exercised without network access.
+"""
+import asyncio
+import json
+import threading
+import time
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.backtesting.ai_strategy import AITradingStrategy
+from src.infrastructure.adapters.ai.openai_adapter import OpenAIAdapter
+from src.application.dto.analysis import AnalysisRequest, DecisionType
+
+
+DECISION_JSON = '{"decision": "buy", "reason": "test", "confidence": "high"}'
+
+
+class FakeOpenAIServer:
+    """Scripted OpenAI-compatible server."""
+
+    def __init__(self, keep_alive: bool = False):
+        self.keep_alive = keep_alive
+        self.script = []  # list of (status, delay_seconds)
+        self.requests = 0
+        self.connections = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}/v1"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _next(self):
+        with self._lock:
+            self.requests += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            if self.script:
+                return self.script.pop(0)
+            return (200, 0.0)
+
+    def _done(self):
+        with self._lock:
+            self.active -= 1
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps connections open between requests (pooled reuse)
+            protocol_version = "HTTP/1.1" if server.keep_alive else "HTTP/1.0"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                server.connections.add(self.client_address)
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                status, delay = server._next()
+                try:
+                    if delay:
+                        time.sleep(delay)
+                    if status == 200:
+                        body = {
+                            "id": "chatcmpl-test",
+                            "object": "chat.completion",
+                            "created": int(time.time()),
+                            "model": "fake-model",
+                            "choices": [{
+                                "index": 0,
+                                "message": {"role": "assistant", "content": DECISION_JSON},
+                                "finish_reason": "stop",
+                            }],
+                            "usage": {
+                                "prompt_tokens": 100,
+                                "completion_tokens": 20,
+                                "total_tokens": 120,
+                            },
+                        }
+                    else:
+                        body = {"error": {"message": f"status {status}", "type": "server_error"}}
+                    payload = json.dumps(body).encode()
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    server._done()
+
+        return Handler
+
+
+@pytest.fixture
+def fake_server():
+    server = FakeOpenAIServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def keep_alive_server():
+    server = FakeOpenAIServer(keep_alive=True)
+    server.start()
+    yield server
+    server.stop()
+
+
+def make_adapter(server, **kwargs):
+    params = dict(
+        api_key="test-key",
+        model="fake-model",
+        base_url=server.base_url,
+        connect_timeout=1.0,
+        read_timeout=2.0,
+        max_retries=3,
+        retry_base_delay=0.01,
+        retry_max_delay=0.05,
+    )
+    params.update(kwargs)
+    return OpenAIAdapter(**params)
+
+
+def make_request():
+    return AnalysisRequest(ticker="KRW-BTC", current_price=Decimal("50000000"))
+
+
+class TestOpenAIAdapterRetry:
+    """Retry behavior on transient errors."""
+
+    @pytest.mark.asyncio
+    async def test_retries_429_and_5xx_then_succeeds(self, fake_server):
+        fake_server.script = [(429, 0.0), (500, 0.0)]
+        adapter = make_adapter(fake_server)
+
+        decision = await adapter.analyze(make_request())
+        await adapter.aclose()
+
+        assert decision.decision == DecisionType.BUY
+        assert fake_server.requests == 3
+        stats = adapter.get_call_stats()
+        assert stats["retries"] == 2
+        assert stats["calls"] == 1
+        assert stats["failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, fake_server):
+        fake_server.script = [(503, 0.0)] * 5
+        adapter = make_adapter(fake_server, max_retries=2)
+
+        decision = await adapter.analyze(make_request())
+        await adapter.aclose()
+
+        assert decision.decision == DecisionType.HOLD
+        assert "Analysis failed" in decision.reasoning
+        assert fake_server.requests == 3
+        assert adapter.get_call_stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_is_not_retried(self, fake_server):
+        fake_server.script = [(400, 0.0)]
+        adapter = make_adapter(fake_server)
+
+        decision = await adapter.analyze(make_request())
+        await adapter.aclose()
+
+        assert decision.decision == DecisionType.HOLD
+        assert fake_server.requests == 1
+
+
+class TestOpenAIAdapterTimeout:
+    """Read timeout handling."""
+
+    @pytest.mark.asyncio
+    async def test_read_timeout_returns_hold(self, fake_server):
+        fake_server.script = [(200, 1.0)]
+        adapter = make_adapter(fake_server, read_timeout=0.2, max_retries=0)
+
+        started = time.perf_counter()
+        decision = await adapter.analyze(make_request())
+        elapsed = time.perf_counter() - started
+        await adapter.aclose()
+
+        assert decision.decision == DecisionType.HOLD
+        assert elapsed < 0.9
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked_during_call(self, fake_server):
+        fake_server.script = [(200, 0.3)]
+        adapter = make_adapter(fake_server)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        decision = await adapter.analyze(make_request())
+        task.cancel()
+        await adapter.aclose()
+
+        assert decision.decision == DecisionType.BUY
+        assert ticks >= 10
+
+
+class TestOpenAIAdapterConcurrency:
+    """Concurrency limit and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_semaphore(self, fake_server):
+        fake_server.script = [(200, 0.1)] * 8
+        adapter = make_adapter(fake_server, max_concurrency=2)
+
+        decisions = await asyncio.gather(*[adapter.analyze(make_request()) for _ in range(8)])
+        await adapter.aclose()
+
+        assert all(d.decision == DecisionType.BUY for d in decisions)
+        assert fake_server.max_active <= 2
+        assert adapter.get_call_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_token_usage_and_latency_recorded(self, fake_server):
+        adapter = make_adapter(fake_server)
+
+        await adapter.analyze(make_request())
+        await adapter.analyze(make_request())
+        await adapter.aclose()
+
+        stats = adapter.get_call_stats()
+        assert stats["calls"] == 2
+        assert stats["prompt_tokens"] == 200
+        assert stats["completion_tokens"] == 40
+        assert stats["avg_latency_seconds"] > 0
+
+
+class TestOpenAIAdapterEventLoops:
+    """Client reuse across event loops (one asyncio.run per call, e.g. backtests)."""
+
+    def test_sequential_event_loops_with_keep_alive(self, keep_alive_server):
+        adapter = make_adapter(keep_alive_server, max_retries=0)
+
+        decisions = [asyncio.run(adapter.analyze(make_request())) for _ in range(3)]
+
+        assert [d.decision for d in decisions] == [DecisionType.BUY] * 3, [d.reasoning for d in decisions]
+        assert keep_alive_server.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_connection_reused_within_loop(self, keep_alive_server):
+        adapter = make_adapter(keep_alive_server)
+
+        await adapter.analyze(make_request())
+        await adapter.analyze(make_request())
+        await adapter.aclose()
+
+        assert keep_alive_server.requests == 2
+        assert len(keep_alive_server.connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_backtest_call_closes_pool_per_temporary_loop(self, keep_alive_server):
+        """AITradingStrategy._call_ai closes the pool inside each asyncio.run loop."""
+        adapter = make_adapter(keep_alive_server, max_retries=0)
+        strategy = AITradingStrategy("KRW-BTC", ai_port=adapter)
+
+        decisions = [strategy._call_ai(make_request(), "2025-01-01") for _ in range(2)]
+
+        assert [d.decision for d in decisions] == [DecisionType.BUY] * 2
+        assert adapter._client is None
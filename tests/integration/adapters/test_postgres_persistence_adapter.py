@@ -7,6 +7,7 @@ implements the PersistencePort interface with PostgreSQL.
 Requires a running PostgreSQL database for testing.
 """
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
 from decimal import Decimal
 from uuid import uuid4
@@ -191,13 +192,31 @@ class TestPostgresPersistenceAdapterOrder:
 class TestPostgresPersistenceAdapterPosition:
     """Test Position CRUD operations."""
 
+    @pytest_asyncio.fixture
+    async def positions_session(self, tmp_path):
+        """
+        Session factory over a SQLite positions table.
+
+        Position reads and writes go through the positions table, so these
+        tests run against aiosqlite instead of requiring a live PostgreSQL.
+        """
+        pytest.importorskip("aiosqlite")
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from backend.app.models.position import Position as PositionModel
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'positions.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(PositionModel.__table__.create)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
     @pytest.fixture
-    def adapter(self, db_session):
-        """Create adapter with test database session."""
+    def adapter(self, positions_session):
+        """Create adapter with a SQLite-backed session factory."""
         from src.infrastructure.adapters.persistence.postgres_persistence_adapter import (
             PostgresPersistenceAdapter
         )
-        return PostgresPersistenceAdapter(session_factory=db_session)
+        return PostgresPersistenceAdapter(session_factory=positions_session)
 
     @pytest.fixture
     def sample_position(self):
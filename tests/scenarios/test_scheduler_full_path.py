@@ -225,11 +225,12 @@ class TestSchedulerFullPath:
 
         Given: 스케줄러 설정이 활성화됨
         When: add_jobs() 호출
-        Then: 4개 작업이 등록됨
+        Then: 5개 작업이 등록됨
             1. trading_job (매시 01분)
             2. position_management_job (:01,:16,:31,:46)
-            3. portfolio_snapshot_job (매시 01분)
-            4. daily_report_job (09:00)
+            3. position_reconcile_job (시작 직후 + 30분 주기)
+            4. portfolio_snapshot_job (매시 01분)
+            5. daily_report_job (09:00)
         """
         with patch('backend.app.core.scheduler.scheduler') as mock_scheduler:
             mock_scheduler.add_job = Mock()
@@ -239,14 +240,15 @@ class TestSchedulerFullPath:
             # When: 작업 등록
             add_jobs()
 
-            # Then: 4개 작업이 등록됨
-            assert mock_scheduler.add_job.call_count == 4
+            # Then: 5개 작업이 등록됨
+            assert mock_scheduler.add_job.call_count == 5
 
             # 등록된 작업 ID 확인
             job_ids = [call[1]['id'] for call in mock_scheduler.add_job.call_args_list]
             expected_job_ids = [
                 'trading_job',
                 'position_management_job',
+                'position_reconcile_job',
                 'portfolio_snapshot_job',
                 'daily_report_job'
             ]
@@ -39,6 +39,7 @@ class TestTradingJobScenarios:
         lock_port = AsyncMock()
         lock_port.acquire = AsyncMock(return_value=True)
         lock_port.release = AsyncMock(return_value=None)
+        lock_port.get_lease = Mock(return_value=None)  # 동기 메서드
         return lock_port
 
     @pytest.fixture
@@ -47,6 +48,7 @@ class TestTradingJobScenarios:
         lock_port = AsyncMock()
         lock_port.acquire = AsyncMock(return_value=False)
         lock_port.release = AsyncMock(return_value=None)
+        lock_port.get_lease = Mock(return_value=None)  # 동기 메서드
         return lock_port
 
     @pytest.fixture
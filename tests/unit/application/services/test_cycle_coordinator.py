@@ -0,0 +1,225 @@
+"""
+CycleCoordinator 테스트
+
+- 락 획득 시 직접 실행 (executed)
+- 같은 캔들의 완료 결과 재사용 (reused) - reuse_window 이내만
+- 진행 중인 사이클 합류 + 진행 단계 전달 (attached)
+- 락만 잡혀 있는 경우 포기 (busy)
+- 중단된 사이클 이후 재실행
+- 보드 조회 실패 시 락 기준으로 진행
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from src.application.services.cycle_coordinator import (
+    CYCLE_LOCK_NAME,
+    CycleCoordinator,
+    current_cycle_key,
+)
+from src.infrastructure.adapters.persistence.lease_lock_adapter import SQLiteLeaseLockAdapter
+from src.infrastructure.adapters.persistence.local_coordination_adapter import CycleRunBoard
+
+
+def _coordinator(tmp_path, owner, board=None, **kwargs):
+    options = {'poll_interval': 0.01, 'attach_timeout': 5.0, 'lock_wait': 0.05}
+    options.update(kwargs)
+    return CycleCoordinator(
+        lock_port=SQLiteLeaseLockAdapter(tmp_path / "coordination.db", poll_interval=0.01),
+        board=board or CycleRunBoard(tmp_path / "coordination.db"),
+        owner=owner,
+        **options,
+    )
+
+
+def _result(decision='hold'):
+    return {'status': 'success', 'decision': decision, 'confidence': 'medium', 'reason': '테스트'}
+
+
+class TestCycleKey:
+    """사이클 키 테스트"""
+
+    def test_cycle_key_aligned_to_hour(self):
+        """같은 시간대는 같은 키"""
+        first = datetime(2024, 1, 1, 9, 0, 5, tzinfo=timezone.utc)
+        later = datetime(2024, 1, 1, 9, 59, 59, tzinfo=timezone.utc)
+        next_hour = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+        assert current_cycle_key(first) == current_cycle_key(later)
+        assert current_cycle_key(first) != current_cycle_key(next_hour)
+        assert current_cycle_key(first).startswith("1h-")
+
+
+class TestCycleCoordinator:
+    """CycleCoordinator 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_executes_when_lock_free(self, tmp_path):
+        """락이 비어 있으면 직접 실행하고 결과 기록"""
+        coordinator = _coordinator(tmp_path, "telegram")
+        calls = []
+
+        async def run(run_id):
+            calls.append(run_id)
+            return _result('buy')
+
+        outcome = await coordinator.run_or_attach(run)
+
+        assert outcome.mode == CycleCoordinator.MODE_EXECUTED
+        assert outcome.result['decision'] == 'buy'
+        assert outcome.run['status'] == 'finished'
+        assert len(calls) == 1 and calls[0] is not None
+        assert await coordinator.lock_port.is_locked(CYCLE_LOCK_NAME) is False
+
+    @pytest.mark.asyncio
+    async def test_reuses_finished_cycle(self, tmp_path):
+        """같은 캔들의 완료 결과가 있으면 재실행 없이 재사용"""
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        scheduler = _coordinator(tmp_path, "scheduler", board=board)
+        telegram = _coordinator(tmp_path, "telegram", board=board)
+
+        run_id = scheduler.begin()
+        scheduler.finish(run_id, _result('sell'))
+
+        async def run(run_id):
+            raise AssertionError("재실행되면 안 됨")
+
+        outcome = await telegram.run_or_attach(run)
+
+        assert outcome.mode == CycleCoordinator.MODE_REUSED
+        assert outcome.result['decision'] == 'sell'
+        assert outcome.stats['reused'] == 1
+        assert outcome.stats['duplicate_ratio'] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_runs_again_after_reuse_window(self, tmp_path):
+        """reuse_window가 지난 완료 결과는 재사용하지 않고 새로 실행 (스케줄 후 수동 /run)"""
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        scheduler = _coordinator(tmp_path, "scheduler", board=board)
+        telegram = _coordinator(tmp_path, "telegram", board=board, reuse_window=0.0)
+
+        run_id = scheduler.begin()
+        scheduler.finish(run_id, _result('sell'))
+        await asyncio.sleep(0.01)
+
+        async def run(run_id):
+            return _result('hold')
+
+        outcome = await telegram.run_or_attach(run)
+
+        assert outcome.mode == CycleCoordinator.MODE_EXECUTED
+        assert outcome.result['decision'] == 'hold'
+
+    @pytest.mark.asyncio
+    async def test_attaches_to_running_cycle(self, tmp_path):
+        """다른 프로세스가 실행 중이면 진행 단계를 받으며 결과 대기"""
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        scheduler = _coordinator(tmp_path, "scheduler", board=board)
+        telegram = _coordinator(tmp_path, "telegram", board=board)
+
+        assert await scheduler.lock_port.acquire(CYCLE_LOCK_NAME)
+        run_id = scheduler.begin()
+
+        async def scheduler_cycle():
+            await asyncio.sleep(0.05)
+            scheduler.progress(run_id, "scanned", {'selected_coin': {'symbol': 'ETH'}})
+            await asyncio.sleep(0.05)
+            scheduler.finish(run_id, {**_result('buy'), 'internal': object()})
+            await scheduler.lock_port.release(CYCLE_LOCK_NAME)
+
+        stages = []
+
+        async def on_progress(run):
+            stages.append(run['stage'])
+
+        async def run(run_id):
+            raise AssertionError("재실행되면 안 됨")
+
+        task = asyncio.create_task(scheduler_cycle())
+        outcome = await telegram.run_or_attach(run, on_progress=on_progress)
+        await task
+
+        assert outcome.mode == CycleCoordinator.MODE_ATTACHED
+        assert outcome.run['id'] == run_id
+        assert outcome.result['decision'] == 'buy'
+        assert 'internal' not in outcome.result
+        assert stages == ['started', 'scanned', 'finished']
+        assert outcome.stats['attached'] == 1
+        assert outcome.stats['duplicate_executions'] == 0
+
+    @pytest.mark.asyncio
+    async def test_busy_when_lock_held_without_cycle(self, tmp_path):
+        """사이클 없이 락만 잡혀 있으면(포지션 관리 등) lock_wait 후 busy"""
+        holder = SQLiteLeaseLockAdapter(tmp_path / "coordination.db")
+        await holder.acquire(CYCLE_LOCK_NAME)
+        coordinator = _coordinator(tmp_path, "telegram")
+
+        async def run(run_id):
+            raise AssertionError("실행되면 안 됨")
+
+        outcome = await coordinator.run_or_attach(run)
+        await holder.release(CYCLE_LOCK_NAME)
+
+        assert outcome.mode == CycleCoordinator.MODE_BUSY
+        assert outcome.result['status'] == 'skipped'
+        assert outcome.stats['busy'] == 1
+
+    @pytest.mark.asyncio
+    async def test_executes_after_abandoned_cycle(self, tmp_path):
+        """보유자가 죽어 중단된 사이클(stale)은 기다리지 않고 락 재시도"""
+        board = CycleRunBoard(tmp_path / "coordination.db", stale_after_seconds=0)
+        crashed = _coordinator(tmp_path, "scheduler", board=board)
+        crashed.begin()  # 락 없이 running 행만 남음 (프로세스 종료 상황)
+
+        coordinator = _coordinator(tmp_path, "telegram", board=board)
+
+        async def run(run_id):
+            return _result()
+
+        outcome = await coordinator.run_or_attach(run)
+
+        assert outcome.mode == CycleCoordinator.MODE_EXECUTED
+        assert outcome.run['owner'] == "telegram"
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_recorded_and_lock_released(self, tmp_path):
+        """실행 중 예외 → failed 기록 + 락 해제 + 예외 전파"""
+        coordinator = _coordinator(tmp_path, "telegram")
+
+        async def run(run_id):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await coordinator.run_or_attach(run)
+
+        assert coordinator.board.recent_runs()[0]['status'] == 'failed'
+        assert await coordinator.lock_port.is_locked(CYCLE_LOCK_NAME) is False
+
+    @pytest.mark.asyncio
+    async def test_board_read_errors_fall_back_to_lock(self, tmp_path):
+        """보드 조회 실패는 기록 없음으로 처리하고 락을 잡아 실행"""
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        board.close()
+        coordinator = _coordinator(tmp_path, "telegram", board=board)
+
+        async def run(run_id):
+            return _result('buy')
+
+        outcome = await coordinator.run_or_attach(run)
+
+        assert outcome.mode == CycleCoordinator.MODE_EXECUTED
+        assert outcome.result['decision'] == 'buy'
+        assert outcome.run is None
+        assert await coordinator.lock_port.is_locked(CYCLE_LOCK_NAME) is False
+
+    def test_board_errors_do_not_block_trading(self, tmp_path):
+        """보드 기록 실패는 경고만 (거래 진행)"""
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        board.close()
+        coordinator = _coordinator(tmp_path, "scheduler", board=board)
+
+        assert coordinator.begin() is None
+        coordinator.progress(1, "scanned")
+        coordinator.finish(1, _result())
+        assert coordinator.get_stats() == {}
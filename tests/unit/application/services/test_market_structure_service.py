@@ -0,0 +1,200 @@
+"""
+Tests for MarketStructureService - 코인 간 베타/상관계수 행렬 캐시
+
+검증 항목:
+- 단일 쌍 조회 (베타/알파/상관계수/시장 리스크)
+- 새 일봉 추가 / 진행 중 일봉 종가 변경 시 증분 갱신, 과거 수정/코인 추가 시 전체 재계산
+- loader로 보유 코인 로드 후 최대 상관계수 조회, 오래된 티커 재로드
+- AnalysisStage / HybridRiskCheckStage 연동
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from src.application.services.market_structure import MarketStructureService
+from src.domain.services.market_analysis import calculate_correlation
+from src.trading.pipeline.analysis_stage import AnalysisStage
+from src.trading.pipeline.hybrid_stage import HybridRiskCheckStage
+
+
+def _closes(days: int = 60, seed: int = 3) -> pd.DataFrame:
+    """BTC + 동행 코인(ETH) + 독립 코인(XRP) 종가"""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.03, days)
+    returns = {
+        'KRW-BTC': market,
+        'KRW-ETH': 1.2 * market + rng.normal(0, 0.005, days),
+        'KRW-XRP': rng.normal(0, 0.03, days),
+    }
+    dates = pd.date_range('2024-01-01 09:00', periods=days, freq='D')
+    return pd.DataFrame({t: 1000 * np.cumprod(1 + r) for t, r in returns.items()}, index=dates)
+
+
+class TestMarketStructureService:
+    """MarketStructureService 테스트"""
+
+    def test_get_pair_matches_pairwise_correlation(self):
+        """단일 쌍 조회가 market_analysis 상관계수와 일치"""
+        closes = _closes()
+        service = MarketStructureService(window=30)
+        for ticker in closes:
+            service.update_closes(ticker, closes[ticker])
+
+        pair = service.get_pair('KRW-ETH')
+
+        expected = calculate_correlation(
+            closes[['KRW-BTC']].rename(columns={'KRW-BTC': 'close'}),
+            closes[['KRW-ETH']].rename(columns={'KRW-ETH': 'close'}),
+            lookback_days=30
+        )
+        assert np.isclose(pair['correlation'], expected)
+        assert 1.0 < pair['beta'] < 1.4
+        assert pair['market_risk'] in ('low', 'medium', 'high')
+        assert pair['observations'] == 30
+        assert service.get_pair('KRW-DOGE') is None
+
+    def test_new_candle_updates_incrementally(self):
+        """새 일봉은 증분 갱신, 결과는 전체 재계산과 동일"""
+        closes = _closes(days=61)
+        service = MarketStructureService(window=30)
+        for ticker in closes:
+            service.update_closes(ticker, closes[ticker].iloc[:-1])
+        service.refresh()
+
+        for ticker in closes:
+            service.update_closes(ticker, closes[ticker])
+        incremental = service.correlation_matrix()
+
+        rebuilt = MarketStructureService(window=30)
+        for ticker in closes:
+            rebuilt.update_closes(ticker, closes[ticker])
+
+        assert service.get_stats()['incremental_updates'] == 1
+        assert service.get_stats()['full_rebuilds'] == 1
+        assert np.allclose(incremental.values, rebuilt.correlation_matrix().values)
+
+    def _rebuilt_matrix(self, closes):
+        rebuilt = MarketStructureService(window=30)
+        for ticker in closes:
+            rebuilt.update_closes(ticker, closes[ticker])
+        return rebuilt.correlation_matrix().values
+
+    def test_live_candle_close_replaces_last_row(self):
+        """진행 중인 일봉 종가만 바뀌면 마지막 행 교체 (전체 재계산 없음)"""
+        closes = _closes()
+        service = MarketStructureService(window=30)
+        for ticker in closes:
+            service.update_closes(ticker, closes[ticker])
+        service.refresh()
+
+        live = closes.copy()
+        live.iloc[-1] *= [1.02, 0.97, 1.01]
+        for ticker in live:
+            service.update_closes(ticker, live[ticker])
+        incremental = service.correlation_matrix()
+
+        assert service.get_stats()['full_rebuilds'] == 1
+        assert service.get_stats()['incremental_updates'] == 1
+        assert np.allclose(incremental.values, self._rebuilt_matrix(live))
+
+    def test_live_candle_closed_and_new_day_appended(self):
+        """마지막 일봉 확정(종가 변경) + 다음 날 추가도 증분 갱신"""
+        closes = _closes(days=61)
+        service = MarketStructureService(window=30)
+        partial = closes.iloc[:-1].copy()
+        partial.iloc[-1] *= 0.99  # 이전 사이클의 진행 중 종가
+        for ticker in partial:
+            service.update_closes(ticker, partial[ticker])
+        service.refresh()
+
+        for ticker in closes:
+            service.update_closes(ticker, closes[ticker])
+        incremental = service.correlation_matrix()
+
+        assert service.get_stats()['full_rebuilds'] == 1
+        assert np.allclose(incremental.values, self._rebuilt_matrix(closes))
+
+    def test_tracked_tickers_reload_after_interval(self):
+        """loader로 불러온 티커는 reload_seconds 이후 다시 로드"""
+        closes = _closes()
+        calls = []
+
+        def loader(ticker):
+            calls.append(ticker)
+            return closes.get(ticker)
+
+        service = MarketStructureService(window=30, loader=loader, reload_seconds=60)
+        service.track(['KRW-BTC', 'KRW-ETH'])
+        service.track(['KRW-BTC', 'KRW-ETH'])
+        assert calls == ['KRW-BTC', 'KRW-ETH']
+
+        service.reload_seconds = 0
+        service.track(['KRW-ETH'])
+        assert calls == ['KRW-BTC', 'KRW-ETH', 'KRW-ETH']
+
+    def test_revised_history_triggers_rebuild(self):
+        """과거 종가 수정 시 전체 재계산"""
+        closes = _closes()
+        service = MarketStructureService(window=30)
+        for ticker in closes:
+            service.update_closes(ticker, closes[ticker])
+        service.refresh()
+
+        revised = closes['KRW-XRP'].copy()
+        revised.iloc[-5] *= 1.1
+        service.update_closes('KRW-XRP', revised)
+        service.refresh()
+
+        assert service.get_stats()['full_rebuilds'] == 2
+
+    def test_max_correlation_loads_held_tickers(self):
+        """loader로 보유 코인 종가를 불러와 최대 상관계수 조회"""
+        closes = _closes()
+        service = MarketStructureService(window=30, loader=lambda t: closes.get(t))
+
+        ticker, value = service.max_correlation('KRW-ETH', ['KRW-BTC', 'KRW-XRP'])
+
+        assert ticker == 'KRW-BTC'
+        assert value > 0.9
+        assert service.max_correlation('KRW-ETH', ['KRW-DOGE']) is None
+
+
+class TestMarketStructureStages:
+    """파이프라인 스테이지 연동 테스트"""
+
+    def test_analysis_stage_reads_pair(self):
+        """AnalysisStage가 수집된 일봉으로 베타/상관계수 설정"""
+        closes = _closes()
+        stage = AnalysisStage(market_structure=MarketStructureService(window=30))
+        context = SimpleNamespace(
+            ticker='KRW-ETH',
+            chart_data={'day': closes[['KRW-ETH']].rename(columns={'KRW-ETH': 'close'})},
+            btc_chart_data={'day': closes[['KRW-BTC']].rename(columns={'KRW-BTC': 'close'})},
+        )
+
+        stage._analyze_market_correlation(context)
+
+        assert context.market_correlation['correlation'] > 0.9
+        assert context.market_correlation['market_risk'] != 'unknown'
+
+    def test_analysis_stage_defaults_without_data(self):
+        """데이터가 없으면 중립 기본값"""
+        stage = AnalysisStage(market_structure=MarketStructureService(window=30))
+        context = SimpleNamespace(ticker='KRW-ETH', chart_data=None, btc_chart_data=None)
+
+        stage._analyze_market_correlation(context)
+
+        assert context.market_correlation['beta'] == 1.0
+        assert context.market_correlation['market_risk'] == 'unknown'
+
+    def test_risk_stage_skips_correlated_coins(self):
+        """보유 코인과 상관관계가 높은 후보는 제외, 계산 불가 코인은 통과"""
+        closes = _closes()
+        service = MarketStructureService(window=30, loader=lambda t: closes.get(t))
+        stage = HybridRiskCheckStage(market_structure=service, max_position_correlation=0.85)
+        coins = [SimpleNamespace(ticker=t) for t in ('KRW-ETH', 'KRW-XRP', 'KRW-DOGE')]
+
+        allowed = stage._filter_correlated_coins(coins, ['KRW-BTC'])
+
+        assert [c.ticker for c in allowed] == ['KRW-XRP', 'KRW-DOGE']
@@ -0,0 +1,220 @@
+"""
+PortfolioSnapshotCache / ScanResultStore 테스트
+
+텔레그램 봇 조회 명령이 공유하는 스냅샷 캐시와 스캔 결과 파일 저장소를 검증합니다.
+"""
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.services.portfolio_snapshot import (
+    PortfolioSnapshotCache,
+    build_portfolio_snapshot,
+    fetch_prices,
+)
+from src.application.services.scan_result_store import ScanResultStore
+
+
+BALANCES = [
+    {'currency': 'KRW', 'balance': '1000000', 'locked': '0', 'avg_buy_price': '0'},
+    {'currency': 'BTC', 'balance': '0.01', 'locked': '0', 'avg_buy_price': '50000000'},
+    {'currency': 'DUST', 'balance': '1', 'locked': '0', 'avg_buy_price': '10'},
+]
+PRICES = {'KRW-BTC': 55000000.0, 'KRW-DUST': 12.0}
+
+
+def make_exchange(balances=None, prices=None):
+    exchange = MagicMock()
+    exchange.get_balances.return_value = BALANCES if balances is None else balances
+    exchange.get_current_prices.return_value = PRICES if prices is None else prices
+    return exchange
+
+
+class TestBuildPortfolioSnapshot:
+    """스냅샷 생성 테스트"""
+
+    def test_two_api_calls_regardless_of_coin_count(self):
+        """잔고 1회 + 현재가 일괄 1회 (코인별 현재가 조회 없음)"""
+        exchange = make_exchange()
+
+        snapshot = build_portfolio_snapshot(exchange)
+
+        exchange.get_balances.assert_called_once()
+        exchange.get_current_prices.assert_called_once_with(['KRW-BTC', 'KRW-DUST'])
+        exchange.get_current_price.assert_not_called()
+        exchange.get_balance.assert_not_called()
+
+        # PortfolioManager 판단 로직 유지 (최소 포지션 가치 미만 DUST 제외)
+        status = snapshot.status
+        assert status.krw_balance == 1000000
+        assert [p.symbol for p in status.positions] == ['BTC']
+        assert status.position_count == 1
+        # /balance는 소액 코인도 표시
+        assert [h.currency for h in snapshot.holdings] == ['BTC', 'DUST']
+        assert snapshot.total_value == pytest.approx(1000000 + 550000 + 12)
+
+    def test_batch_failure_falls_back_to_per_ticker(self):
+        """일괄 조회 실패 시 티커별 조회 (실패 티커만 제외)"""
+        exchange = make_exchange()
+        exchange.get_current_prices.side_effect = RuntimeError("invalid market")
+        exchange.get_current_price.side_effect = lambda t: 55000000.0 if t == 'KRW-BTC' else None
+
+        prices = fetch_prices(exchange, ['KRW-BTC', 'KRW-DUST'])
+
+        assert prices == {'KRW-BTC': 55000000.0}
+
+
+class TestPortfolioSnapshotCache:
+    """TTL / stale-while-revalidate / single-flight 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_served_from_memory(self):
+        """TTL 이내 재조회는 거래소 호출 없음"""
+        exchange = make_exchange()
+        cache = PortfolioSnapshotCache(exchange, ttl=60.0)
+
+        first = await cache.get()
+        second = await cache.get()
+
+        assert first is second
+        assert exchange.get_balances.call_count == 1
+        stats = cache.get_stats()
+        assert stats['misses'] == 1 and stats['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_returned_while_refreshing(self):
+        """TTL이 지나면 기존 스냅샷을 즉시 반환하고 백그라운드 갱신"""
+        exchange = make_exchange()
+        cache = PortfolioSnapshotCache(exchange, ttl=0.0, max_stale=60.0)
+        first = await cache.get()
+
+        release = threading.Event()
+        exchange.get_balances.side_effect = lambda: release.wait(5) and BALANCES
+
+        stale = await cache.get()
+        assert stale is first
+        assert cache.get_stats()['refreshing'] is True
+
+        release.set()
+        await cache._inflight
+        assert cache.snapshot is not first
+        assert cache.get_stats()['stale_hits'] == 1
+        await cache.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_refresh(self):
+        """동시 요청은 갱신 1건을 공유"""
+        exchange = make_exchange()
+        cache = PortfolioSnapshotCache(exchange, ttl=60.0)
+
+        snapshots = await asyncio.gather(*(cache.get() for _ in range(10)))
+
+        assert all(s is snapshots[0] for s in snapshots)
+        assert exchange.get_balances.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_background_failure_keeps_previous_snapshot(self):
+        """백그라운드 갱신 실패 시 기존 스냅샷 유지"""
+        exchange = make_exchange()
+        cache = PortfolioSnapshotCache(exchange, ttl=0.0, max_stale=60.0)
+        first = await cache.get()
+
+        exchange.get_balances.side_effect = RuntimeError("429 Too Many Requests")
+        assert await cache.get() is first
+        with pytest.raises(RuntimeError):
+            await cache._inflight
+
+        assert cache.snapshot is first
+        assert cache.get_stats()['errors'] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidated_waits_for_refresh(self):
+        """무효화 후에는 새 스냅샷을 기다림 (거래 직후)"""
+        exchange = make_exchange()
+        cache = PortfolioSnapshotCache(exchange, ttl=60.0)
+        first = await cache.get()
+
+        cache.invalidate()
+        second = await cache.get()
+
+        assert second is not first
+        assert exchange.get_balances.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_discards_inflight_refresh(self):
+        """무효화 이전에 시작된 갱신은 완료되어도 스냅샷을 덮어쓰지 않음"""
+        pre_trade = BALANCES
+        post_trade = [{'currency': 'KRW', 'balance': '1550000', 'locked': '0', 'avg_buy_price': '0'}]
+        exchange = make_exchange()
+        cache = PortfolioSnapshotCache(exchange, ttl=0.0, max_stale=60.0)
+        await cache.get()
+
+        # 거래 전 잔고를 읽는 백그라운드 갱신이 진행 중
+        started, release = threading.Event(), threading.Event()
+
+        def read_pre_trade():
+            started.set()
+            release.wait(5)
+            return pre_trade
+
+        exchange.get_balances.side_effect = read_pre_trade
+        await cache.get()
+        stale_refresh = cache._inflight
+        await asyncio.to_thread(started.wait, 5)
+
+        # 거래 후 무효화 → 새 요청은 진행 중인 갱신을 공유하지 않음
+        cache.invalidate()
+        exchange.get_balances.side_effect = None
+        exchange.get_balances.return_value = post_trade
+        fresh = await cache.get()
+        assert fresh.status.krw_balance == 1550000
+
+        release.set()
+        await stale_refresh
+        assert cache.snapshot is fresh
+
+
+class TestScanResultStore:
+    """스캔 결과 파일 저장소 테스트"""
+
+    def test_save_and_load_between_instances(self, tmp_path):
+        """다른 인스턴스(다른 프로세스 가정)가 저장한 결과를 읽음"""
+        import numpy as np
+
+        path = tmp_path / "last_scan.json"
+        ScanResultStore(path).save({
+            'ticker': 'KRW-SOL',
+            'scan_summary': {'liquidity_scanned': 20, 'best_score': np.float64(81.5)},
+            'selected_coin': {'ticker': 'KRW-SOL', 'score': np.float64(81.5)},
+            'all_backtest_results': [{'symbol': 'SOL', 'score': 81.5}],
+            'backtest_result': {'metrics': {'trades': list(range(1000))}},  # 저장 대상 아님
+        })
+
+        record = ScanResultStore(path).load()
+
+        assert record['ticker'] == 'KRW-SOL'
+        assert record['selected_coin']['score'] == 81.5
+        assert 'backtest_result' not in record
+        assert ScanResultStore(path).age_seconds(record) < 60
+
+    def test_load_cached_until_file_changes(self, tmp_path):
+        """mtime이 같으면 파일을 다시 읽지 않음"""
+        path = tmp_path / "last_scan.json"
+        writer = ScanResultStore(path)
+        reader = ScanResultStore(path)
+        writer.save({'scan_summary': {'liquidity_scanned': 1}})
+
+        first = reader.load()
+        assert reader.load() is first
+
+        writer.save({'scan_summary': {'liquidity_scanned': 2}})
+        import os
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert reader.load()['scan_summary']['liquidity_scanned'] == 2
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert ScanResultStore(tmp_path / "none.json").load() is None
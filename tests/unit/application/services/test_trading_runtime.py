@@ -0,0 +1,296 @@
+"""
+Tests for TradingRuntime - 장기 실행 런타임
+
+검증 항목:
+- 수명 주기 (start → health → shutdown)
+- 파이프라인/코인 선택기 캐싱 (사이클당 재생성 없음)
+- TradingOrchestrator 연동
+- Soak 테스트: 1000 사이클 동안 스레드 수/메모리 평탄
+"""
+import gc
+import threading
+import tracemalloc
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.application.services.trading_runtime import TradingRuntime
+from src.application.services.trading_orchestrator import TradingOrchestrator
+from src.scanner.coin_selector import ScanResult
+
+
+class StubCoinSelector:
+    """선택 코인이 없는 스캔 결과를 반환하는 코인 선택기"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def select_coins(self, exclude_tickers=None, force_data_sync=False):
+        self.calls += 1
+        return ScanResult(
+            scan_time=datetime.now(),
+            liquidity_scanned=0,
+            backtest_passed=0,
+            ai_analyzed=0,
+            candidates=[],
+            selected_coins=[],
+            total_duration_seconds=0.0,
+            all_backtest_results=[]
+        )
+
+
+class StubUpbitClient:
+    """포지션 없음 + 충분한 KRW 잔고 (ENTRY 모드 진입용)"""
+
+    def get_balance(self, ticker="KRW"):
+        return 1_000_000.0
+
+    def get_balances(self):
+        return [{'currency': 'KRW', 'balance': '1000000', 'locked': '0', 'avg_buy_price': '0'}]
+
+    def get_current_price(self, ticker):
+        return 50_000_000.0
+
+
+class StubIdempotencyPort:
+    """항상 신규 키로 판단 (상태 누적 없음)"""
+
+    async def check_key(self, key):
+        return False
+
+    async def mark_key(self, key, ttl_hours=24):
+        return None
+
+
+class StubContainer:
+    """레거시 클라이언트 추출 경로만 지원하는 최소 컨테이너"""
+
+    def __init__(self):
+        self._exchange_port = MagicMock(_client=StubUpbitClient(), _trading_service=None)
+        self._market_data_port = MagicMock(_collector=None)
+        self._ai_port = MagicMock(_service=None)
+        self._idempotency_port = StubIdempotencyPort()
+
+    def get_idempotency_port(self):
+        return self._idempotency_port
+
+    def get_exchange_port(self):
+        return self._exchange_port
+
+    def get_market_data_port(self):
+        return self._market_data_port
+
+    def get_ai_port(self):
+        return self._ai_port
+
+
+class TestTradingRuntimeLifecycle:
+    """수명 주기 테스트"""
+
+    def test_initial_state_is_created(self):
+        runtime = TradingRuntime()
+
+        health = runtime.health()
+
+        assert health['status'] == 'created'
+        assert health['scan_executor_alive'] is False
+        assert runtime.is_running is False
+
+    def test_start_and_shutdown(self):
+        runtime = TradingRuntime()
+
+        runtime.start()
+        assert runtime.health()['status'] == 'running'
+        assert runtime.health()['scan_executor_alive'] is True
+
+        runtime.shutdown()
+        health = runtime.health()
+        assert health['status'] == 'stopped'
+        assert health['scan_executor_alive'] is False
+        assert health['cached_pipelines'] == 0
+
+    def test_start_is_idempotent(self):
+        runtime = TradingRuntime()
+        runtime.start()
+        executor = runtime._scan_executor
+
+        runtime.start()
+
+        assert runtime._scan_executor is executor
+        runtime.shutdown()
+
+    def test_shutdown_without_start_is_noop(self):
+        runtime = TradingRuntime()
+
+        runtime.shutdown()
+
+        assert runtime.health()['status'] == 'created'
+
+    def test_get_pipeline_auto_starts(self):
+        runtime = TradingRuntime()
+
+        runtime.get_position_management_pipeline()
+
+        assert runtime.is_running
+        runtime.shutdown()
+
+    def test_shutdown_closes_shared_scanner_components(self):
+        runtime = TradingRuntime()
+        runtime.get_coin_selector()
+        data_sync = runtime._data_sync
+        multi_backtest = runtime._multi_backtest
+
+        runtime.shutdown()
+
+        assert data_sync._executor._shutdown is True
+        assert multi_backtest._executor._shutdown is True
+
+
+class TestTradingRuntimeCaching:
+    """파이프라인 캐싱 테스트"""
+
+    def test_trading_pipeline_is_cached(self):
+        runtime = TradingRuntime()
+
+        first = runtime.get_trading_pipeline(enable_scanning=False)
+        second = runtime.get_trading_pipeline(enable_scanning=False)
+
+        assert first is second
+        assert runtime.health()['cached_pipelines'] == 1
+        runtime.shutdown()
+
+    def test_different_params_create_different_pipelines(self):
+        runtime = TradingRuntime()
+
+        first = runtime.get_trading_pipeline(enable_scanning=False, max_positions=3)
+        second = runtime.get_trading_pipeline(enable_scanning=False, max_positions=2)
+
+        assert first is not second
+        runtime.shutdown()
+
+    def test_position_management_pipeline_is_cached(self):
+        runtime = TradingRuntime()
+
+        first = runtime.get_position_management_pipeline()
+        second = runtime.get_position_management_pipeline()
+
+        assert first is second
+        runtime.shutdown()
+
+    def test_scanning_pipeline_shares_selector_and_executor(self):
+        runtime = TradingRuntime()
+
+        pipeline = runtime.get_trading_pipeline(enable_scanning=True)
+        stage = pipeline.stages[0]
+
+        assert stage._coin_selector is runtime.get_coin_selector()
+        assert stage._scan_executor is runtime._scan_executor
+        runtime.shutdown()
+
+    def test_coin_selectors_share_data_sync(self):
+        runtime = TradingRuntime()
+
+        first = runtime.get_coin_selector(liquidity_top_n=10)
+        second = runtime.get_coin_selector(liquidity_top_n=20)
+
+        assert first is not second
+        assert first.data_sync is second.data_sync
+        assert first.multi_backtest is second.multi_backtest
+        runtime.shutdown()
+
+
+class TestOrchestratorWithRuntime:
+    """TradingOrchestrator 런타임 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_uses_runtime_pipeline(self):
+        mock_container = MagicMock()
+        mock_container.get_idempotency_port.return_value = StubIdempotencyPort()
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute = AsyncMock(return_value={'status': 'success'})
+        runtime = MagicMock()
+        runtime.get_trading_pipeline.return_value = mock_pipeline
+
+        with patch('src.application.services.trading_orchestrator.create_hybrid_trading_pipeline') as mock_create:
+            orchestrator = TradingOrchestrator(container=mock_container, runtime=runtime)
+            await orchestrator.execute_trading_cycle(ticker="KRW-BTC")
+
+        mock_create.assert_not_called()
+        runtime.get_trading_pipeline.assert_called_once()
+        runtime.record_cycle.assert_called_once_with('trading')
+
+    @pytest.mark.asyncio
+    async def test_position_management_uses_runtime_pipeline(self):
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute = AsyncMock(return_value={'status': 'success'})
+        runtime = MagicMock()
+        runtime.get_position_management_pipeline.return_value = mock_pipeline
+
+        with patch('src.application.services.trading_orchestrator.create_position_management_pipeline') as mock_create:
+            orchestrator = TradingOrchestrator(container=MagicMock(), runtime=runtime)
+            result = await orchestrator.execute_position_management()
+
+        mock_create.assert_not_called()
+        assert result['cycle_type'] == 'position_management'
+        runtime.record_cycle.assert_called_once_with('position_management')
+
+    def test_container_passes_runtime(self):
+        from src.container import Container
+
+        runtime = TradingRuntime()
+        orchestrator = Container().get_trading_orchestrator(runtime=runtime)
+
+        assert orchestrator._runtime is runtime
+
+
+@pytest.mark.slow
+class TestTradingRuntimeSoak:
+    """Soak 테스트: 반복 사이클에서 스레드/메모리 누수 없음"""
+
+    CYCLES = 1000
+    WARMUP_CYCLES = 50
+    MAX_MEMORY_GROWTH_BYTES = 2 * 1024 * 1024  # 2MB
+
+    @pytest.mark.asyncio
+    async def test_thread_count_and_memory_stay_flat(self, capsys):
+        selector = StubCoinSelector()
+        runtime = TradingRuntime()
+        runtime.start()
+        orchestrator = TradingOrchestrator(container=StubContainer(), runtime=runtime)
+
+        async def run_cycles(count):
+            for _ in range(count):
+                result = await orchestrator.execute_trading_cycle(ticker="KRW-BTC")
+                assert result['status'] == 'success'
+                assert result['decision'] == 'hold'
+                await orchestrator.execute_position_management()
+            capsys.readouterr()  # 로그 출력 버퍼 비우기
+
+        with patch.object(TradingRuntime, '_build_coin_selector', return_value=selector):
+            # 워밍업 (지연 초기화 완료)
+            await run_cycles(self.WARMUP_CYCLES)
+            gc.collect()
+            threads_before = threading.active_count()
+            thread_names_before = {t.name for t in threading.enumerate()}
+
+            tracemalloc.start()
+            baseline, _ = tracemalloc.get_traced_memory()
+
+            await run_cycles(self.CYCLES - self.WARMUP_CYCLES)
+            gc.collect()
+
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        threads_after = threading.active_count()
+        thread_names_after = {t.name for t in threading.enumerate()}
+        health = runtime.health()
+        runtime.shutdown()
+
+        assert selector.calls == self.CYCLES
+        assert health['cycles'] == {'trading': self.CYCLES, 'position_management': self.CYCLES}
+        assert health['cached_pipelines'] == 2
+        assert threads_after == threads_before
+        assert thread_names_after == thread_names_before
+        assert current - baseline < self.MAX_MEMORY_GROWTH_BYTES
@@ -389,3 +389,92 @@ class TestExecuteTradeUseCaseFeeCalculation:
         # Then
         saved_trade = mock_persistence_port.save_trade.call_args[0][0]
         assert saved_trade.fee == expected_fee
+
+    @pytest.mark.asyncio
+    async def test_execute_buy_updates_position(self, mock_exchange_port, mock_persistence_port):
+        """Executed trades are applied to the persisted position."""
+        from src.application.use_cases.execute_trade import ExecuteTradeUseCase
+        position_manager = AsyncMock()
+        use_case = ExecuteTradeUseCase(
+            exchange=mock_exchange_port,
+            persistence=mock_persistence_port,
+            position_manager=position_manager,
+        )
+        mock_exchange_port.execute_market_buy.return_value = OrderResponse.success_response(
+            ticker="KRW-BTC",
+            side=OrderSide.BUY,
+            order_id="order-123",
+            executed_price=Money.krw(Decimal("50000000")),
+            executed_volume=Decimal("0.002"),
+            fee=Money.krw(Decimal("50")),
+        )
+        mock_exchange_port.get_balance.return_value = MagicMock(
+            available=Money.krw(Decimal("1000000"))
+        )
+
+        await use_case.execute_buy("KRW-BTC", Money.krw(Decimal("100000")))
+
+        trade = position_manager.update_position_from_trade.call_args[0][0]
+        assert trade.ticker == "KRW-BTC"
+        assert trade.volume == Decimal("0.002")
+
+
+class TestExecuteTradeUseCaseFencing:
+    """Fencing token checks for orders placed under a lock lease."""
+
+    @pytest.fixture
+    def mock_exchange_port(self):
+        mock = AsyncMock()
+        mock.get_balance.return_value = MagicMock(available=Money.krw(Decimal("1000000")))
+        mock.execute_market_buy.return_value = OrderResponse.success_response(
+            ticker="KRW-BTC",
+            side=OrderSide.BUY,
+            order_id="order-123",
+            executed_price=Money.krw(Decimal("50000000")),
+            executed_volume=Decimal("0.002"),
+            fee=Money.krw(Decimal("50")),
+        )
+        return mock
+
+    def _use_case(self, exchange, lease_valid):
+        from src.application.use_cases.execute_trade import ExecuteTradeUseCase
+        lock_port = MagicMock()
+        lock_port.validate_lease = AsyncMock(return_value=lease_valid)
+        return ExecuteTradeUseCase(exchange=exchange, persistence=AsyncMock(), lock_port=lock_port)
+
+    @pytest.mark.asyncio
+    async def test_order_sent_with_current_lease(self, mock_exchange_port):
+        """A current lease lets the order through."""
+        from src.application.ports.outbound.lock_port import LockLease
+        use_case = self._use_case(mock_exchange_port, lease_valid=True)
+
+        result = await use_case.execute_buy(
+            "KRW-BTC", Money.krw(Decimal("100000")), lease=LockLease("trading_cycle", token=7)
+        )
+
+        assert result.success is True
+        mock_exchange_port.execute_market_buy.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_order_rejected_with_stale_lease(self, mock_exchange_port):
+        """An expired lease (stale fencing token) blocks the order."""
+        from src.application.ports.outbound.lock_port import LockLease
+        use_case = self._use_case(mock_exchange_port, lease_valid=False)
+
+        result = await use_case.execute_buy(
+            "KRW-BTC", Money.krw(Decimal("100000")), lease=LockLease("trading_cycle", token=7)
+        )
+
+        assert result.success is False
+        assert "fencing token 7" in result.error_message
+        mock_exchange_port.execute_market_buy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_lease_skips_check(self, mock_exchange_port):
+        """Callers without a lease (CLI runner) are not fenced."""
+        use_case = self._use_case(mock_exchange_port, lease_valid=False)
+
+        result = await use_case.execute_buy("KRW-BTC", Money.krw(Decimal("100000")))
+
+        assert result.success is True
+        use_case.lock_port.validate_lease.assert_not_called()
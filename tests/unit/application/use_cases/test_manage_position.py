@@ -427,3 +427,178 @@ class TestManagePositionUseCaseValidation:
         # Then
         # Should handle gracefully (always return False for invalid input)
         assert result is False
+
+
+class TestLocalPositions:
+    """Tests for local (persisted) position reads and reconciliation."""
+
+    @pytest.fixture
+    def exchange(self):
+        mock = AsyncMock()
+        mock.get_current_price = AsyncMock(return_value=Money.krw(Decimal("55000000")))
+        return mock
+
+    @pytest.fixture
+    def persistence(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def use_case(self, exchange, persistence):
+        from src.application.use_cases.manage_position import ManagePositionUseCase
+        return ManagePositionUseCase(
+            exchange=exchange,
+            persistence=persistence,
+            use_local_positions=True,
+            empty_read_confirm_seconds=0,
+        )
+
+    @staticmethod
+    def exchange_position(ticker, volume, avg_price):
+        return MagicMock(
+            ticker=ticker,
+            symbol=ticker.split("-")[1],
+            volume=Decimal(volume),
+            avg_buy_price=Money.krw(Decimal(avg_price)),
+        )
+
+    @staticmethod
+    def balances(*tickers):
+        """Exchange balance list holding the given tickers."""
+        return [
+            MagicMock(currency=ticker.split("-")[1], total=Money.krw(Decimal("1")))
+            for ticker in tickers
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_position_reads_persistence(self, use_case, exchange, persistence):
+        """Local mode reads the stored position, not exchange balances."""
+        persistence.get_position.return_value = Position.create(
+            ticker="KRW-BTC",
+            symbol="BTC",
+            volume=Decimal("0.1"),
+            avg_entry_price=Money.krw(Decimal("50000000")),
+        )
+
+        result = await use_case.get_position("KRW-BTC")
+
+        assert result["avg_buy_price"] == Decimal("50000000")
+        assert result["profit_rate"] == Decimal("10")
+        exchange.get_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_creates_updates_and_closes(self, use_case, exchange, persistence):
+        """Exchange balances are the source of truth for reconciliation."""
+        stale = Position.create(
+            ticker="KRW-ETH",
+            symbol="ETH",
+            volume=Decimal("1"),
+            avg_entry_price=Money.krw(Decimal("3000000")),
+        )
+        gone = Position.create(
+            ticker="KRW-XRP",
+            symbol="XRP",
+            volume=Decimal("100"),
+            avg_entry_price=Money.krw(Decimal("700")),
+        )
+        persistence.get_all_positions.return_value = [stale, gone]
+        exchange.get_all_balances.return_value = self.balances("KRW-BTC", "KRW-ETH")
+        exchange.get_all_positions.return_value = [
+            self.exchange_position("KRW-BTC", "0.1", "50000000"),
+            self.exchange_position("KRW-ETH", "1.5", "3100000"),
+        ]
+
+        report = await use_case.reconcile_positions()
+
+        assert report == {
+            "created": ["KRW-BTC"], "updated": ["KRW-ETH"], "closed": ["KRW-XRP"], "unreadable": []
+        }
+        saved = {call.args[0].ticker: call.args[0] for call in persistence.save_position.call_args_list}
+        assert saved["KRW-ETH"].id == stale.id
+        assert saved["KRW-ETH"].volume == Decimal("1.5")
+        assert saved["KRW-ETH"].avg_entry_price.amount == Decimal("3100000")
+        persistence.close_position.assert_called_once_with("KRW-XRP")
+
+    @pytest.mark.asyncio
+    async def test_reconcile_in_sync_is_noop(self, use_case, exchange, persistence):
+        persistence.get_all_positions.return_value = [Position.create(
+            ticker="KRW-BTC",
+            symbol="BTC",
+            volume=Decimal("0.1"),
+            avg_entry_price=Money.krw(Decimal("50000000")),
+        )]
+        exchange.get_all_balances.return_value = self.balances("KRW-BTC")
+        exchange.get_all_positions.return_value = [
+            self.exchange_position("KRW-BTC", "0.1", "50000000"),
+        ]
+
+        report = await use_case.reconcile_positions()
+
+        assert report == {"created": [], "updated": [], "closed": [], "unreadable": []}
+        persistence.save_position.assert_not_called()
+
+    @staticmethod
+    def stored_position(ticker="KRW-BTC"):
+        return Position.create(
+            ticker=ticker,
+            symbol=ticker.split("-")[1],
+            volume=Decimal("0.1"),
+            avg_entry_price=Money.krw(Decimal("50000000")),
+        )
+
+    @pytest.mark.asyncio
+    async def test_reconcile_exchange_failure_keeps_positions(self, use_case, exchange, persistence):
+        """A failed exchange read aborts reconciliation without touching stored positions."""
+        from src.exceptions import APIError
+        persistence.get_all_positions.return_value = [self.stored_position(), self.stored_position("KRW-ETH")]
+        exchange.get_all_balances.side_effect = APIError("get_balances", reason="timeout")
+        exchange.get_all_positions.side_effect = APIError("get_balances", reason="timeout")
+
+        with pytest.raises(APIError):
+            await use_case.reconcile_positions()
+
+        persistence.close_position.assert_not_called()
+        persistence.save_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_sudden_empty_read_is_confirmed(self, use_case, exchange, persistence):
+        """An empty exchange read is re-read; a non-empty second read wins."""
+        persistence.get_all_positions.return_value = [self.stored_position()]
+        exchange.get_all_balances.side_effect = [[], self.balances("KRW-BTC")]
+        exchange.get_all_positions.side_effect = [
+            [],
+            [self.exchange_position("KRW-BTC", "0.1", "50000000")],
+        ]
+
+        report = await use_case.reconcile_positions()
+
+        assert report == {"created": [], "updated": [], "closed": [], "unreadable": []}
+        assert exchange.get_all_positions.call_count == 2
+        persistence.close_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_closes_after_two_empty_reads(self, use_case, exchange, persistence):
+        """Positions are closed only when the second read is also empty."""
+        persistence.get_all_positions.return_value = [self.stored_position()]
+        exchange.get_all_balances.return_value = []
+        exchange.get_all_positions.return_value = []
+
+        report = await use_case.reconcile_positions()
+
+        assert report["closed"] == ["KRW-BTC"]
+        assert exchange.get_all_positions.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reconcile_keeps_held_but_unreadable_position(self, use_case, exchange, persistence):
+        """A coin still in the balance list but missing from positions is not closed."""
+        persistence.get_all_positions.return_value = [self.stored_position(), self.stored_position("KRW-ETH")]
+        # ETH is fully locked in an open order, so its position read is skipped
+        exchange.get_all_balances.return_value = self.balances("KRW-BTC", "KRW-ETH")
+        exchange.get_all_positions.return_value = [
+            self.exchange_position("KRW-BTC", "0.1", "50000000"),
+        ]
+
+        report = await use_case.reconcile_positions()
+
+        assert report["unreadable"] == ["KRW-ETH"]
+        assert report["closed"] == []
+        persistence.close_position.assert_not_called()
@@ -0,0 +1,262 @@
+"""
+AI 결정 기록/재생 저장소 테스트
+
+- DecisionStore: (ticker, 봉 시각, 프롬프트 해시) 키 저장/조회, 파일 영속성
+- AITradingStrategy: live / record / replay 모드와 미스 정책
+- DecisionBatchLabeler: 미기록 봉만 동시 라벨링
+"""
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.application.dto.analysis import DecisionType, TradingDecision
+from src.backtesting.ai_strategy import AITradingStrategy
+from src.backtesting.decision_labeler import DecisionBatchLabeler
+from src.backtesting.decision_store import DecisionStore, compute_prompt_hash
+from src.backtesting.strategy import Signal
+
+
+def make_data(bars: int = 40) -> pd.DataFrame:
+    index = pd.date_range("2025-01-01", periods=bars, freq="D")
+    close = np.linspace(100.0, 140.0, bars)
+    return pd.DataFrame({
+        "open": close * 0.99,
+        "high": close * 1.01,
+        "low": close * 0.98,
+        "close": close,
+        "volume": np.full(bars, 1000.0),
+    }, index=index)
+
+
+class StubRuleStrategy:
+    """지정한 봉 인덱스에서만 매수 신호를 내는 룰 필터 스텁"""
+
+    def __init__(self, passing):
+        self.passing = set(passing)
+
+    def prepare_indicators(self, data):
+        pass
+
+    def generate_signal(self, data, portfolio=None):
+        if len(data) - 1 not in self.passing:
+            return None
+        return Signal(action="buy", price=data["close"].iloc[-1],
+                      reason={"gate1": "ok", "gate2": "ok", "gate3": "ok"})
+
+
+class StubAIPort:
+    """호출 횟수와 동시 실행 수를 기록하는 AI 포트"""
+
+    def __init__(self, decision=DecisionType.BUY, delay=0.0, fail_on=None):
+        self.decision = decision
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def analyze(self, request):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.fail_on is not None and self.calls == self.fail_on:
+                raise RuntimeError("boom")
+            return TradingDecision(
+                decision=self.decision,
+                confidence=Decimal("0.8"),
+                reasoning=f"stub {request.current_price}",
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def make_strategy(store, ai_port, mode, passing=(30, 35), miss_policy="hold"):
+    strategy = AITradingStrategy(
+        "KRW-BTC", ai_port=ai_port, decision_store=store,
+        decision_mode=mode, miss_policy=miss_policy,
+    )
+    strategy._rule_strategy = StubRuleStrategy(passing)
+    return strategy
+
+
+def run_bars(strategy, data):
+    return [strategy.generate_signal(data.iloc[:i + 1]) for i in range(len(data))]
+
+
+@pytest.fixture
+def store():
+    s = DecisionStore(":memory:")
+    yield s
+    s.close()
+
+
+class TestDecisionStore:
+    """DecisionStore 저장/조회 테스트"""
+
+    def test_put_and_get_roundtrip(self, store):
+        """저장한 결정을 같은 키로 조회"""
+        ts = datetime(2025, 1, 1, 9)
+        decision = TradingDecision(
+            decision=DecisionType.SELL, confidence=Decimal("0.65"),
+            reasoning="과열", stop_loss_price=Decimal("95.5"),
+        )
+        store.put("KRW-BTC", ts, "abc", decision)
+
+        loaded = store.get("KRW-BTC", ts, "abc")
+        assert loaded.decision == DecisionType.SELL
+        assert loaded.confidence == Decimal("0.65")
+        assert loaded.stop_loss_price == Decimal("95.5")
+        assert store.get("KRW-BTC", ts, "other") is None
+        assert store.get_stats()["hits"] == 1
+        assert store.get_stats()["misses"] == 1
+
+    def test_persists_to_file(self, tmp_path):
+        """파일 저장소는 재시작 후에도 결정 유지"""
+        path = tmp_path / "decisions.sqlite"
+        ts = pd.Timestamp("2025-01-02")
+        first = DecisionStore(path)
+        first.put("KRW-ETH", ts, "h1", TradingDecision(
+            decision=DecisionType.BUY, confidence=Decimal("0.9"), reasoning="r"))
+        first.close()
+
+        second = DecisionStore(path)
+        assert second.get("KRW-ETH", ts, "h1").decision == DecisionType.BUY
+        assert second.count() == 1
+        second.close()
+
+    def test_prompt_hash_changes_with_input(self):
+        """입력이 바뀌면 해시도 바뀜"""
+        strategy = AITradingStrategy("KRW-BTC")
+        signal = Signal(action="buy", price=100.0, reason={"gate1": "ok"})
+        a = strategy.build_request(100.0, {"rsi": 55}, signal)
+        b = strategy.build_request(100.0, {"rsi": 55}, signal)
+        c = strategy.build_request(100.0, {"rsi": 70}, signal)
+
+        assert compute_prompt_hash(a) == compute_prompt_hash(b)
+        assert compute_prompt_hash(a) != compute_prompt_hash(c)
+
+
+class TestAITradingStrategyReplay:
+    """AITradingStrategy 기록/재생 모드 테스트"""
+
+    def test_record_then_replay_without_ai_calls(self, store):
+        """기록 후 재생 시 AI를 호출하지 않고 같은 신호 생성"""
+        data = make_data()
+        recorder_port = StubAIPort()
+        recorded = run_bars(make_strategy(store, recorder_port, "record"), data)
+        assert recorder_port.calls == 2
+        assert store.count() == 2
+
+        replay_port = StubAIPort(decision=DecisionType.SELL)
+        replayed = run_bars(make_strategy(store, replay_port, "replay"), data)
+
+        assert replay_port.calls == 0
+        assert [s and s.action for s in replayed] == [s and s.action for s in recorded]
+        assert replayed[30].reason == recorded[30].reason
+
+    def test_replay_miss_hold(self, store):
+        """미스 정책 hold: 신호 없음"""
+        port = StubAIPort()
+        signals = run_bars(make_strategy(store, port, "replay", miss_policy="hold"), make_data())
+        assert all(s is None for s in signals)
+        assert port.calls == 0
+
+    def test_replay_miss_rule_based(self, store):
+        """미스 정책 rule_based: 룰 신호 그대로 사용"""
+        port = StubAIPort()
+        signals = run_bars(make_strategy(store, port, "replay", miss_policy="rule_based"), make_data())
+        assert signals[30].action == "buy"
+        assert signals[30].reason["gate1"] == "ok"
+        assert port.calls == 0
+
+    def test_replay_miss_call_and_record(self, store):
+        """미스 정책 call_and_record: AI 호출 후 저장, 다음 재생은 히트"""
+        data = make_data()
+        port = StubAIPort()
+        run_bars(make_strategy(store, port, "replay", miss_policy="call_and_record"), data)
+        assert port.calls == 2
+        assert store.count() == 2
+
+        run_bars(make_strategy(store, port, "replay", miss_policy="call_and_record"), data)
+        assert port.calls == 2
+
+    def test_failed_ai_decision_not_recorded(self, store):
+        """AI 실패(HOLD, confidence 0) 결정은 기록하지 않음"""
+        class FailingPort:
+            async def analyze(self, request):
+                return TradingDecision(decision=DecisionType.HOLD, confidence=Decimal("0"),
+                                       reasoning="Analysis failed: timeout")
+
+        run_bars(make_strategy(store, FailingPort(), "record"), make_data())
+        assert store.count() == 0
+
+    def test_store_required_for_replay(self):
+        """replay/record 모드는 저장소 필수"""
+        with pytest.raises(ValueError):
+            AITradingStrategy("KRW-BTC", decision_mode="replay")
+
+
+class TestDecisionBatchLabeler:
+    """DecisionBatchLabeler 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_labels_only_uncached_bars_concurrently(self, store):
+        """미기록 봉만 동시 라벨링"""
+        data = make_data()
+        passing = (10, 15, 20, 25, 30, 35)
+        port = StubAIPort(delay=0.02)
+        strategy = make_strategy(store, port, "replay", passing=passing)
+
+        # 한 봉은 미리 기록
+        run_bars(make_strategy(store, StubAIPort(), "record", passing=(10,)), data)
+
+        labeler = DecisionBatchLabeler(strategy, max_concurrency=3, requests_per_minute=None)
+        report = await labeler.label(data)
+
+        assert report.total_bars == len(data)
+        assert report.rule_passed == 6
+        assert report.cached == 1
+        assert report.labelled == 5
+        assert port.calls == 5
+        assert 1 < port.max_in_flight <= 3
+        assert store.count() == 6
+
+        # 라벨링 후 재생은 AI 호출 없음
+        replay_port = StubAIPort()
+        signals = run_bars(make_strategy(store, replay_port, "replay", passing=passing), data)
+        assert replay_port.calls == 0
+        assert sum(1 for s in signals if s is not None) == 6
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_not_stored(self, store):
+        """AI 호출 실패는 리포트에 기록되고 저장되지 않음"""
+        port = StubAIPort(fail_on=1)
+        strategy = make_strategy(store, port, "replay", passing=(20, 30))
+
+        report = await DecisionBatchLabeler(strategy, max_concurrency=1,
+                                            requests_per_minute=None).label(make_data())
+
+        assert report.failed == 1
+        assert report.labelled == 1
+        assert len(report.errors) == 1
+        assert store.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_requests(self, store):
+        """분당 요청 제한에 따라 요청 시작 간격 유지"""
+        port = StubAIPort()
+        strategy = make_strategy(store, port, "replay", passing=(10, 20, 30))
+
+        # 분당 1200회 = 0.05초 간격 → 3건은 최소 0.1초
+        report = await DecisionBatchLabeler(strategy, max_concurrency=3,
+                                            requests_per_minute=1200).label(make_data())
+
+        assert report.labelled == 3
+        assert report.duration_seconds >= 0.09
@@ -0,0 +1,143 @@
+"""
+몬테카를로 강건성 분석 테스트
+
+- 블록 요약 기반 경로 통계 == 봉 단위 경로 직접 계산
+- 재표본 방식별 성질 (shuffle: 최종 수익률 불변)
+- 파산 확률 / 청크 분할
+- 거래 수익률은 거래 직전 자본 대비
+"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.backtesting.backtester import BacktestResult
+from src.backtesting.monte_carlo import (
+    MonteCarloConfig,
+    MonteCarloSimulator,
+    _segment_path_statistics,
+    _segment_table,
+    _step_path_statistics,
+    check_ruin_filter,
+    create_monte_carlo_simulator,
+    trade_equity_returns,
+)
+from src.backtesting.portfolio import Trade
+
+
+def _trade(pnl):
+    return Trade(
+        symbol="KRW-AAA", entry_price=100.0, exit_price=100.0, size=1.0,
+        entry_time=datetime(2024, 1, 1), exit_time=datetime(2024, 1, 2),
+        pnl=pnl, pnl_percent=0.0, commission=0.0
+    )
+
+
+class TestPathStatistics:
+    """경로 통계 정확성"""
+
+    @pytest.mark.parametrize('block', [3, 4])
+    def test_block_summary_matches_bar_paths(self, block):
+        """블록 요약으로 계산한 최종 수익률/낙폭/최저 자산 == 이어 붙인 봉 경로 직접 계산"""
+        rng = np.random.default_rng(3)
+        log_returns = np.log1p(rng.normal(0.0, 0.05, 10))
+        n_starts = len(log_returns) - block + 1
+        n_segments = -(-len(log_returns) // block)
+        tail = len(log_returns) - (n_segments - 1) * block
+        segments = rng.integers(0, n_starts, size=(200, n_segments))
+
+        table = _segment_table(log_returns, block, n_starts)
+        tail_table = _segment_table(log_returns, tail, n_starts) if tail != block else None
+        actual = _segment_path_statistics(table, tail_table, segments)
+
+        lengths = [block] * (n_segments - 1) + [tail]
+        bar_paths = np.array([
+            np.concatenate([log_returns[s:s + n] for s, n in zip(row, lengths)])
+            for row in segments
+        ])
+        expected = _step_path_statistics(bar_paths)
+        for a, e in zip(actual, expected):
+            np.testing.assert_allclose(a, e, rtol=1e-12, atol=1e-12)
+
+    def test_step_statistics_against_equity_curve(self):
+        """로그 누적 통계 == 자산 곡선 기준 수익률/낙폭"""
+        returns = np.array([0.1, -0.2, 0.05, -0.1, 0.3])
+        final, drawdown, min_equity = _step_path_statistics(np.log1p(returns)[None, :].copy())
+
+        equity = np.concatenate(([1.0], np.cumprod(1 + returns)))
+        peak = np.maximum.accumulate(equity)
+        assert final[0] == pytest.approx(equity[-1] - 1)
+        assert drawdown[0] == pytest.approx((1 - equity / peak).max())
+        assert min_equity[0] == pytest.approx(equity.min())
+
+
+class TestMonteCarloSimulator:
+    """시뮬레이터"""
+
+    def test_shuffle_keeps_final_return(self):
+        """순서만 섞으면 최종 수익률 분포는 한 점, 낙폭만 퍼짐"""
+        returns = np.array([0.05, -0.03, 0.08, -0.06, 0.02, -0.04, 0.07])
+        mc = MonteCarloSimulator(MonteCarloConfig(n_paths=2000, method='shuffle', seed=1)).simulate(returns)
+
+        expected = (np.prod(1 + returns) - 1) * 100
+        assert all(v == pytest.approx(expected) for v in mc.return_percentiles.values())
+        assert mc.drawdown_percentiles[5] < mc.drawdown_percentiles[95]
+
+    def test_ruin_probability_and_chunking(self):
+        """모든 거래 -20%면 5번째 거래 후 자본 33% → 파산(50% 손실) 확률 1, 청크 크기와 무관"""
+        returns = np.full(5, -0.2)
+        for chunk_elements in (5, 2_000_000):
+            config = MonteCarloConfig(n_paths=101, seed=0, max_chunk_elements=chunk_elements)
+            mc = MonteCarloSimulator(config).simulate(returns)
+
+            assert mc.n_paths == 101
+            assert mc.probability_of_ruin == 1.0
+            assert mc.probability_of_loss == 1.0
+            assert mc.drawdown_percentiles[50] == pytest.approx((1 - 0.8 ** 5) * 100)
+            assert check_ruin_filter(mc, 0.05) == (False, 1.0)
+
+    def test_block_bootstrap_bands_and_min_samples(self):
+        """블록 부트스트랩 분위수는 단조 증가, 표본 부족이면 None"""
+        rng = np.random.default_rng(5)
+        simulator = MonteCarloSimulator(MonteCarloConfig(n_paths=1000, method='block', seed=2))
+
+        mc = simulator.simulate(rng.normal(0.001, 0.02, 100))
+
+        assert mc.n_steps == 100
+        assert list(mc.return_percentiles.values()) == sorted(mc.return_percentiles.values())
+        assert list(mc.drawdown_percentiles.values()) == sorted(mc.drawdown_percentiles.values())
+        assert simulator.simulate(np.array([0.01, 0.02])) is None
+
+    def test_trade_returns_use_capital_before_trade(self):
+        """거래 수익률 = 손익 / (초기 자본 + 이전 손익 누적)"""
+        result = BacktestResult(
+            initial_capital=1_000.0, final_equity=1_050.0, equity_curve=np.array([1_000.0, 1_050.0]),
+            trades=[_trade(100.0), _trade(-55.0)], metrics={}
+        )
+
+        np.testing.assert_allclose(trade_equity_returns(result), [0.1, -0.05])
+
+    def test_invalid_method(self):
+        """지원하지 않는 재표본 방식은 ValueError"""
+        with pytest.raises(ValueError):
+            MonteCarloSimulator(MonteCarloConfig(method='garch'))
+
+
+class TestMonteCarloConfigValidation:
+    """재표본 방식 설정 검증"""
+
+    def test_unknown_method_falls_back_to_bootstrap(self, monkeypatch):
+        """설정 오타는 게이트 생성을 막지 않고 bootstrap으로 대체"""
+        from src.config.settings import ScannerConfig
+        monkeypatch.setattr(ScannerConfig, 'MONTE_CARLO_METHOD', 'bootstarp')
+
+        assert create_monte_carlo_simulator().config.method == 'bootstrap'
+
+    def test_scanner_config_rejects_unknown_method(self, monkeypatch):
+        """ScannerConfig.validate()는 지원하지 않는 방식을 ConfigurationError로 거부"""
+        from src.config.settings import ScannerConfig
+        from src.exceptions import ConfigurationError
+        monkeypatch.setattr(ScannerConfig, 'MONTE_CARLO_METHOD', 'garch')
+
+        with pytest.raises(ConfigurationError):
+            ScannerConfig.validate()
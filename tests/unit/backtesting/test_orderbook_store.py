@@ -0,0 +1,155 @@
+"""
+오더북 기록/재생 저장소 테스트
+
+- 고정폭 열 단위 기록 + 델타 타임스탬프 왕복
+- 중단된 기록 복구 (meta 이후 초과분 잘라냄)
+- 바 시각 기준 재생 (backward/nearest, 최대 지연)
+- Backtester가 바 시각과 기준 가격을 provider에 전달
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtesting.backtester import Backtester
+from src.backtesting.orderbook_store import (
+    OrderbookRecorder,
+    OrderbookStore,
+    PRICES_FILE,
+    TS_FILE,
+)
+
+BASE_TS = 1_700_000_000
+
+
+def _orderbook(price: float, levels: int = 3, market: str = "KRW-BTC", timestamp_ms=None):
+    units = [
+        {
+            'ask_price': price + 10 * i, 'ask_size': 1.0 + i,
+            'bid_price': price - 10 * (i + 1), 'bid_size': 2.0 + i,
+        }
+        for i in range(levels)
+    ]
+    orderbook = {'market': market, 'orderbook_units': units}
+    if timestamp_ms is not None:
+        orderbook['timestamp'] = timestamp_ms
+    return orderbook
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = OrderbookStore(tmp_path / "orderbooks", levels=5)
+    for i, price in enumerate([1000.0, 1100.0, 1200.0]):
+        store.append("KRW-BTC", BASE_TS + i * 60, _orderbook(price))
+    return store
+
+
+class TestOrderbookStore:
+    """기록/재생 왕복 테스트"""
+
+    def test_round_trip_with_padding(self, store, tmp_path):
+        """델타 타임스탬프 복원, 부족한 호가는 NaN 패딩 후 제외"""
+        replay = store.open("KRW-BTC", max_staleness_seconds=None)
+
+        assert len(replay) == 3
+        assert list(replay.timestamps) == [BASE_TS, BASE_TS + 60, BASE_TS + 120]
+        deltas = np.fromfile(tmp_path / "orderbooks" / "KRW-BTC" / TS_FILE, dtype='<u4')
+        assert list(deltas) == [0, 60, 60]
+
+        snapshot = replay.snapshot(1)
+        assert len(snapshot.asks) == 3
+        assert snapshot.asks.best_price == 1100.0
+        assert snapshot.bids.fill_size(2.0).avg_price == pytest.approx(1090.0)
+
+    def test_out_of_order_snapshot_ignored(self, store):
+        """직전 기록보다 이른 스냅샷은 기록하지 않음"""
+        assert store.append("KRW-BTC", BASE_TS + 30, _orderbook(999.0)) is False
+        assert store.read_meta("KRW-BTC")['count'] == 3
+
+    def test_interrupted_write_is_truncated(self, store, tmp_path):
+        """meta 갱신 전 중단된 초과 바이트는 다음 기록 시 제거"""
+        prices_path = tmp_path / "orderbooks" / "KRW-BTC" / PRICES_FILE
+        with open(prices_path, 'ab') as f:
+            f.write(b'\x00' * 17)
+
+        store.append("KRW-BTC", BASE_TS + 180, _orderbook(1300.0))
+        replay = store.open("KRW-BTC")
+
+        assert len(replay) == 4
+        assert replay.snapshot(3).asks.best_price == 1300.0
+
+    def test_replay_lookup_modes(self, store):
+        """backward는 바 시각 이전 스냅샷만, nearest는 가장 가까운 스냅샷, 최대 지연 초과 시 None"""
+        backward = store.open("KRW-BTC", max_staleness_seconds=45)
+        nearest = store.open("KRW-BTC", max_staleness_seconds=45, direction='nearest')
+
+        assert backward.index_at(BASE_TS + 100) == 1
+        assert nearest.index_at(BASE_TS + 100) == 2
+        assert backward.index_at(BASE_TS - 1) is None
+        assert backward.index_at(BASE_TS + 500) is None
+
+        # tz 정보 없는 바 시각은 KST로 간주
+        bar_time = pd.Timestamp(BASE_TS + 60, unit='s', tz='UTC').tz_convert('Asia/Seoul').tz_localize(None)
+        assert backward.index_at(bar_time) == 1
+
+    def test_default_staleness_from_config(self, store, monkeypatch):
+        """max_staleness_seconds 생략 시 SlippageConfig 값 사용"""
+        from src.config.settings import SlippageConfig
+        monkeypatch.setattr(SlippageConfig, "ORDERBOOK_REPLAY_MAX_STALENESS", 45.0)
+
+        replay = store.open("KRW-BTC")
+
+        assert replay.max_staleness_seconds == 45.0
+        assert replay.index_at(BASE_TS + 500) is None
+
+    def test_reference_price_rescales_book(self, store):
+        """기준 가격으로 호가를 비례 조정하고 KRW 깊이는 유지"""
+        replay = store.open("KRW-BTC", max_staleness_seconds=None)
+        original = replay.snapshot(0)
+        scaled = replay(BASE_TS, reference_price=2 * 995.0)
+
+        assert scaled.asks.best_price == pytest.approx(2000.0)
+        assert scaled.asks.total_notional == pytest.approx(original.asks.total_notional)
+
+
+class TestOrderbookRecorder:
+    """오더북 기록기 테스트"""
+
+    def test_record_once_uses_exchange_timestamp(self, tmp_path):
+        """감시 티커만 기록, Upbit timestamp(ms) 사용"""
+        store = OrderbookStore(tmp_path, levels=3)
+        fetched = [
+            _orderbook(1000.0, market="KRW-BTC", timestamp_ms=BASE_TS * 1000),
+            _orderbook(50.0, market="KRW-DOGE", timestamp_ms=BASE_TS * 1000),
+        ]
+        recorder = OrderbookRecorder(store, ["KRW-BTC"], fetcher=lambda tickers: fetched)
+
+        assert recorder.record_once() == 1
+        assert store.tickers() == ["KRW-BTC"]
+        assert store.read_meta("KRW-BTC")['last_ts'] == BASE_TS
+
+    def test_fetch_failure_is_counted(self, tmp_path):
+        """조회 실패 시 0건, 실패 횟수 증가"""
+        def failing(tickers):
+            raise ConnectionError("timeout")
+
+        recorder = OrderbookRecorder(OrderbookStore(tmp_path), ["KRW-BTC"], fetcher=failing)
+
+        assert recorder.record_once() == 0
+        assert recorder.failures == 1
+
+
+class TestBacktesterOrderbookProvider:
+    """Backtester provider 호출 테스트"""
+
+    def test_provider_receives_bar_time_and_price(self):
+        """인자를 받는 provider에는 바 시각과 기준 가격 전달, 인자 없는 provider는 그대로 호출"""
+        bar = pd.Series({'close': 123.0}, name=pd.Timestamp('2024-01-01 09:00'))
+        calls = []
+
+        def replay(timestamp, reference_price=None):
+            calls.append((timestamp, reference_price))
+            return {'ask_prices': [reference_price]}
+
+        assert Backtester._fetch_orderbook(replay, bar, 123.0) == {'ask_prices': [123.0]}
+        assert calls == [(bar.name, 123.0)]
+        assert Backtester._fetch_orderbook(lambda: {'legacy': True}, bar, 123.0) == {'legacy': True}
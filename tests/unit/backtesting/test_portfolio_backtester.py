@@ -0,0 +1,166 @@
+"""
+다중 종목 포트폴리오 백테스터 테스트
+
+- 서로 다른 봉 시각의 합집합 타임라인 진행
+- 종목별 가격 반영 (Portfolio.update의 단일 종목 가정 제거)
+- 공유 자본 + 최대 포지션 수 제한
+- PortfolioManager 사이징
+"""
+import pandas as pd
+import pytest
+
+from src.backtesting.portfolio import Portfolio
+from src.backtesting.portfolio_backtester import PortfolioBacktester
+from src.backtesting.strategy import Signal, Strategy
+from src.position.portfolio_manager import PortfolioManager
+
+
+def _bars(index, closes):
+    closes = list(closes)
+    return pd.DataFrame({
+        'open': closes, 'high': closes, 'low': closes, 'close': closes,
+        'volume': [1.0] * len(closes),
+    }, index=pd.DatetimeIndex(index))
+
+
+class ScriptedStrategy(Strategy):
+    """지정한 봉 번호에서 매수/매도하는 테스트 전략"""
+
+    def __init__(self, ticker, buy_at=None, sell_at=None):
+        self.ticker = ticker
+        self.buy_at = buy_at
+        self.sell_at = sell_at
+        self.seen = []
+
+    def generate_signal(self, data, portfolio=None):
+        self.seen.append(data.index[-1])
+        bar_num = len(data)
+        price = data['close'].iloc[-1]
+        if bar_num == self.buy_at:
+            return Signal(action='buy', price=price)
+        if bar_num == self.sell_at and self.ticker in portfolio.positions:
+            return Signal(action='sell', price=price)
+        return None
+
+    def calculate_position_size(self, signal: Signal, portfolio: Portfolio) -> float:
+        return portfolio.equity / signal.price  # 전액 요청 → 사이징에서 제한
+
+
+def _engine(data, plan, **kwargs):
+    strategies = {}
+
+    def factory(ticker):
+        strategies[ticker] = ScriptedStrategy(ticker, **plan.get(ticker, {}))
+        return strategies[ticker]
+
+    kwargs.setdefault('commission', 0.0)
+    kwargs.setdefault('slippage', 0.0)
+    engine = PortfolioBacktester(factory, data, initial_capital=1_000_000, **kwargs)
+    return engine, strategies
+
+
+class TestPortfolioBacktester:
+    """공유 시계 포트폴리오 백테스트"""
+
+    def test_union_timeline_and_per_ticker_marking(self):
+        """봉 시각이 다른 종목도 합집합 시각마다 한 번씩 평가, 각 종목 가격은 자기 종가로 반영"""
+        hourly = pd.date_range('2024-01-01', periods=6, freq='h')
+        data = {
+            'KRW-AAA': _bars(hourly, [100, 100, 110, 120, 130, 140]),
+            'KRW-BBB': _bars(hourly[::2], [10, 10, 20]),  # 2시간 간격
+        }
+        engine, strategies = _engine(
+            data, {'KRW-AAA': {'buy_at': 1}, 'KRW-BBB': {'buy_at': 1}},
+            max_positions=2, max_allocation_per_coin=0.5
+        )
+
+        result = engine.run()
+
+        assert result.timestamps == list(hourly)
+        assert strategies['KRW-BBB'].seen == list(hourly[::2])
+        positions = engine.portfolio.positions
+        assert positions['KRW-AAA'].current_price == 140
+        assert positions['KRW-BBB'].current_price == 20
+        assert result.final_equity == pytest.approx(engine.portfolio.total_value)
+
+    def test_max_positions_limits_concurrent_entries(self):
+        """슬롯이 찬 뒤의 매수 신호는 건너뛰고, 매도로 슬롯이 비면 같은 시각 매수 체결"""
+        index = pd.date_range('2024-01-01', periods=5, freq='D')
+        data = {
+            'KRW-AAA': _bars(index, [100] * 5),
+            'KRW-BBB': _bars(index, [100] * 5),
+            'KRW-CCC': _bars(index, [100] * 5),
+        }
+        engine, _ = _engine(data, {
+            'KRW-AAA': {'buy_at': 1, 'sell_at': 3},
+            'KRW-BBB': {'buy_at': 1},
+            'KRW-CCC': {'buy_at': 3},
+        }, max_positions=2)
+
+        result = engine.run()
+
+        assert set(engine.portfolio.positions) == {'KRW-BBB', 'KRW-CCC'}
+        assert result.skipped_entries == 0
+        assert result.ticker_stats['KRW-AAA']['trades'] == 1
+
+        blocked, _ = _engine(data, {
+            'KRW-AAA': {'buy_at': 1},
+            'KRW-BBB': {'buy_at': 1},
+            'KRW-CCC': {'buy_at': 3},
+        }, max_positions=2)
+        assert blocked.run().skipped_entries == 1
+        assert 'KRW-CCC' not in blocked.portfolio.positions
+
+    def test_entry_size_follows_portfolio_manager(self):
+        """진입 금액 = PortfolioManager.calculate_entry_capital (예비 자금, 코인당 비율, 남은 슬롯)"""
+        index = pd.date_range('2024-01-01', periods=3, freq='D')
+        engine, _ = _engine(
+            {'KRW-AAA': _bars(index, [100] * 3)}, {'KRW-AAA': {'buy_at': 1}},
+            max_positions=3, max_allocation_per_coin=0.4
+        )
+
+        engine.run()
+
+        manager = PortfolioManager(exchange_client=None, max_positions=3, max_allocation_per_coin=0.4)
+        expected = manager.calculate_entry_capital(1_000_000, 1_000_000, 0)
+        position = engine.portfolio.positions['KRW-AAA']
+        assert position.size * position.entry_price == pytest.approx(expected)
+        assert expected == pytest.approx(1_000_000 * 0.4 / 3)
+
+    def test_intrabar_stop_exits_at_stop_price(self):
+        """use_intrabar_stops: 저가가 스탑에 닿으면 스탑 가격에 청산"""
+        index = pd.date_range('2024-01-01', periods=4, freq='D')
+        frame = _bars(index, [100, 100, 100, 100])
+        frame.loc[index[2], 'low'] = 90
+
+        class StopStrategy(ScriptedStrategy):
+            def generate_signal(self, data, portfolio=None):
+                if len(data) == 1:
+                    return Signal(action='buy', price=100, stop_loss=95)
+                return None
+
+        engine = PortfolioBacktester(
+            lambda ticker: StopStrategy(ticker), {'KRW-AAA': frame},
+            initial_capital=1_000_000, commission=0.0, slippage=0.0, use_intrabar_stops=True
+        )
+
+        result = engine.run()
+
+        assert len(result.trades) == 1
+        assert result.trades[0].exit_price == 95
+        assert engine.orders[-1]['exit_reason'] == 'stop_loss'
+
+
+class TestPortfolioMark:
+    """Portfolio.mark_price"""
+
+    def test_mark_price_updates_only_symbol(self):
+        """지정 종목만 가격 갱신"""
+        portfolio = Portfolio(1_000_000)
+        portfolio.open_position('KRW-AAA', 1, 100, 0, 0)
+        portfolio.open_position('KRW-BBB', 1, 200, 0, 0)
+
+        portfolio.mark_price('KRW-AAA', 150)
+
+        assert portfolio.positions['KRW-AAA'].current_price == 150
+        assert portfolio.positions['KRW-BBB'].current_price == 200
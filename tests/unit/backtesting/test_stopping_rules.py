@@ -0,0 +1,150 @@
+"""
+백테스트 조기 종료 규칙 테스트
+
+- 규칙별 확정 실패 판정 (남은 봉의 최선 경우를 가정)
+- Backtester 조기 종료 시 부분 결과 + terminated 플래그
+- 규칙 없으면 전체 구간 실행 (기존 동작)
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtesting.backtester import Backtester
+from src.backtesting.performance import StreamingMetrics
+from src.backtesting.portfolio import Portfolio, Trade
+from src.backtesting.stopping_rules import (
+    BacktestProgress,
+    MaxConsecutiveLossesRule,
+    MaxDrawdownRule,
+    MinTradesRule,
+    MinWinRateRule,
+    stopping_rules_from_criteria,
+)
+from src.backtesting.strategy import Signal, Strategy
+
+
+def _trade(pnl):
+    return Trade(
+        symbol="KRW-AAA", entry_price=100.0, exit_price=100.0, size=1.0,
+        entry_time=datetime(2024, 1, 1), exit_time=datetime(2024, 1, 2),
+        pnl=pnl, pnl_percent=pnl, commission=0.0
+    )
+
+
+def _progress(bars_processed=10, total_bars=100, **kwargs):
+    return BacktestProgress(
+        bars_processed=bars_processed, total_bars=total_bars,
+        metrics=StreamingMetrics(1_000_000), **kwargs
+    )
+
+
+class TestStoppingRules:
+    """규칙별 판정"""
+
+    def test_max_drawdown_breach(self):
+        """진행 중 최대 낙폭이 한도를 넘으면 종료"""
+        progress = _progress()
+        for equity in [1_000_000, 900_000]:
+            progress.metrics.update(equity)
+        assert MaxDrawdownRule(15.0).check(progress) is None
+        progress.metrics.update(800_000)
+        assert "최대 낙폭" in MaxDrawdownRule(15.0).check(progress)
+
+    def test_min_trades_unreachable(self):
+        """남은 봉으로 만들 수 있는 최대 거래 수(보유 포지션 포함)가 기준 미달이면 종료"""
+        progress = _progress(bars_processed=94, total_bars=100, bars_per_trade=2)
+        progress.record_trades([_trade(1.0)] * 6)
+
+        assert progress.max_possible_trades == 6 + 3
+        assert MinTradesRule(9).check(progress) is None
+        assert MinTradesRule(10).check(progress) is not None
+
+        progress.has_position = True
+        assert MinTradesRule(10).check(progress) is None
+
+    def test_win_rate_and_consecutive_losses(self):
+        """남은 거래를 모두 이겨도 승률 미달이면 종료, 연속 손실은 새 거래만 반영"""
+        progress = _progress(bars_processed=96, total_bars=100, bars_per_trade=2)
+        trades = [_trade(1.0)] + [_trade(-1.0)] * 4
+        progress.record_trades(trades)
+
+        # 최선: (1 + 2) / (5 + 2) = 42.9%
+        assert MinWinRateRule(40.0).check(progress) is None
+        assert "최대 가능 승률" in MinWinRateRule(45.0).check(progress)
+        assert MaxConsecutiveLossesRule(4).check(progress) is None
+
+        trades.append(_trade(-1.0))
+        progress.record_trades(trades)
+        assert progress.closed_trades == 6
+        assert progress.max_consecutive_losses == 5
+        assert MaxConsecutiveLossesRule(4).check(progress) is not None
+
+    def test_rules_from_criteria(self):
+        """필터 기준에 있는 키만 규칙으로 변환"""
+        rules = stopping_rules_from_criteria({'max_drawdown': 30.0, 'min_trades': 10, 'min_return': 8.0})
+        assert [type(rule) for rule in rules] == [MaxDrawdownRule, MinTradesRule]
+
+
+class BuyAndHoldStrategy(Strategy):
+    """첫 봉에 매수 후 보유"""
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    def generate_signal(self, data, portfolio=None):
+        if len(data) == 1:
+            return Signal(action='buy', price=data['close'].iloc[-1])
+        return None
+
+    def calculate_position_size(self, signal: Signal, portfolio: Portfolio) -> float:
+        return portfolio.cash * 0.9 / signal.price
+
+
+@pytest.fixture
+def falling_data():
+    """100봉 동안 한 봉에 1%씩 하락"""
+    index = pd.date_range('2024-01-01', periods=100, freq='D')
+    close = 100 * 0.99 ** np.arange(100)
+    return pd.DataFrame({
+        'open': close, 'high': close, 'low': close, 'close': close,
+        'volume': np.ones(100),
+    }, index=index)
+
+
+class TestBacktesterEarlyTermination:
+    """Backtester 조기 종료"""
+
+    def _run(self, data, stopping_rules=None):
+        return Backtester(
+            strategy=BuyAndHoldStrategy("KRW-AAA"),
+            data=data,
+            ticker="KRW-AAA",
+            initial_capital=1_000_000,
+            commission=0.0,
+            slippage=0.0,
+            stopping_rules=stopping_rules
+        ).run()
+
+    def test_terminates_with_partial_result(self, falling_data):
+        """낙폭 한도 초과 시점에 멈추고 그 시점까지의 부분 결과 반환"""
+        result = self._run(falling_data, [MaxDrawdownRule(10.0)])
+
+        assert result.terminated
+        assert "최대 낙폭" in result.termination_reason
+        assert result.total_bars == 100
+        assert 0 < result.bars_processed < 100
+        assert len(result.equity_curve) == result.bars_processed
+        assert abs(result.metrics['max_drawdown']) > 10.0
+        assert result.cpu_saved_seconds >= 0.0
+
+    def test_no_rules_runs_full_history(self, falling_data):
+        """규칙이 없으면 전체 구간 실행 (terminated=False)"""
+        result = self._run(falling_data)
+
+        assert not result.terminated
+        assert result.termination_reason is None
+        assert result.bars_processed == result.total_bars == 100
+        assert len(result.equity_curve) == 100
+        assert result.cpu_saved_seconds == 0.0
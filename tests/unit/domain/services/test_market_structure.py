@@ -0,0 +1,98 @@
+"""
+시장 구조 도메인 서비스 단위 테스트.
+
+롤링 교차 모멘트로 계산한 상관계수/베타 행렬이 쌍별 계산과 일치하는지,
+증분 갱신이 전체 재계산과 같은 결과를 내는지 테스트합니다.
+"""
+import numpy as np
+import pandas as pd
+
+from src.domain.services.market_analysis import calculate_correlation
+from src.domain.services.market_structure import RollingCrossMoments
+
+
+def _returns(days: int = 80, coins: int = 4, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.03, days)
+    columns = [market]
+    for i in range(1, coins):
+        columns.append(0.5 * i * market + rng.normal(0, 0.02, days))
+    return np.column_stack(columns)
+
+
+class TestRollingCrossMoments:
+    """RollingCrossMoments 테스트"""
+
+    def test_matrix_matches_pairwise_functions(self):
+        """상관계수/알파가 market_analysis 쌍별 계산과 일치"""
+        returns = _returns()
+        window = 30
+        closes = np.vstack([np.full(returns.shape[1], 100.0), 100.0 * np.cumprod(1 + returns, axis=0)])
+        dates = pd.date_range('2024-01-01', periods=len(closes), freq='D')
+        frames = [pd.DataFrame({'close': closes[:, i]}, index=dates) for i in range(closes.shape[1])]
+
+        snapshot = RollingCrossMoments.from_returns(returns, window).snapshot(market_index=0)
+
+        for i in range(1, returns.shape[1]):
+            expected = calculate_correlation(frames[0], frames[i], lookback_days=window)
+            assert np.isclose(snapshot.correlation[i, 0], expected)
+            assert np.isclose(snapshot.correlation[0, i], expected)
+
+            recent = returns[-window:]
+            expected_beta = np.cov(recent[:, i], recent[:, 0])[0][1] / np.var(recent[:, 0], ddof=1)
+            assert np.isclose(snapshot.beta[i], expected_beta)
+
+            # 알파: 최근 1일 잔차 (%)
+            expected_alpha = (returns[-1, i] - snapshot.beta[i] * returns[-1, 0]) * 100
+            assert np.isclose(snapshot.alpha[i], expected_alpha)
+
+        assert np.isclose(snapshot.beta[0], 1.0)
+        assert np.allclose(np.diag(snapshot.correlation), 1.0)
+
+    def test_incremental_push_equals_full_recompute(self):
+        """push()로 갱신한 행렬 == 최근 윈도우로 다시 만든 행렬"""
+        returns = _returns(days=100)
+        window = 30
+
+        moments = RollingCrossMoments.from_returns(returns[:50], window)
+        for row in returns[50:]:
+            moments.push(row)
+
+        incremental = moments.snapshot()
+        full = RollingCrossMoments.from_returns(returns, window).snapshot()
+
+        assert np.allclose(incremental.correlation, full.correlation)
+        assert np.allclose(incremental.beta, full.beta)
+        assert np.allclose(incremental.alpha, full.alpha)
+
+    def test_replace_last_equals_full_recompute(self):
+        """replace_last()로 마지막 행을 바꾼 행렬 == 바뀐 수익률로 다시 만든 행렬"""
+        returns = _returns(days=60)
+        window = 30
+        moments = RollingCrossMoments.from_returns(returns, window)
+
+        revised = returns.copy()
+        revised[-1] = returns[-1] * 1.5
+        moments.replace_last(revised[-1])
+
+        incremental = moments.snapshot()
+        full = RollingCrossMoments.from_returns(revised, window).snapshot()
+
+        assert np.allclose(incremental.correlation, full.correlation)
+        assert np.allclose(incremental.beta, full.beta)
+
+    def test_missing_history_uses_pairwise_overlap(self):
+        """상장 전 구간(NaN)은 쌍별 겹치는 날만 사용"""
+        returns = _returns(days=40)
+        returns[:25, 2] = np.nan  # 2번 코인은 최근 15일만 존재
+
+        snapshot = RollingCrossMoments.from_returns(returns, 40).snapshot(min_observations=10)
+        overlap = returns[25:]
+        expected = np.corrcoef(overlap[:, 2], overlap[:, 0])[0, 1]
+
+        assert snapshot.observations[2, 0] == 15
+        assert np.isclose(snapshot.correlation[2, 0], expected)
+
+        short = RollingCrossMoments.from_returns(returns, 40).snapshot(min_observations=20)
+        assert np.isnan(short.correlation[2, 0])
+        assert np.isnan(short.beta[2])
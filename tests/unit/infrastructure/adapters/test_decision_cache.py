@@ -0,0 +1,275 @@
+"""
+AI 결정 캐시 테스트
+
+검증 항목:
+- 캐시 키 안정성 (프롬프트/버전/캔들/분석 유형)
+- 다음 캔들 종가까지 TTL
+- 메모리 LRU + 영속 저장소 read-through
+- OpenAIAdapter 연동 (캐시 적중 시 API 미호출, 동시 요청 단일 호출)
+- PostgresDecisionCacheAdapter 직렬화 (SQLite로 검증)
+"""
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+
+from src.application.dto.analysis import (
+    AnalysisRequest,
+    DecisionType,
+    MarketData,
+    TradingDecision,
+)
+from src.application.ports.outbound.decision_cache_port import (
+    DecisionCachePort,
+    floor_to_candle,
+    make_decision_cache_key,
+    next_candle_close,
+)
+from src.domain.value_objects.prompt_version import PromptType, PromptVersion
+from src.infrastructure.adapters.ai.openai_adapter import OpenAIAdapter
+from src.infrastructure.adapters.persistence.memory_decision_cache_adapter import (
+    InMemoryDecisionCacheAdapter,
+)
+
+
+CANDLE_TS = datetime(2026, 1, 1, 9, 0)
+DECISION_JSON = '{"decision": "buy", "reason": "test", "confidence": "high"}'
+
+
+def make_decision(decision=DecisionType.BUY):
+    return TradingDecision(
+        decision=decision,
+        confidence=Decimal("0.8"),
+        reasoning="test",
+        target_price=Decimal("51000000"),
+        key_factors=["momentum"],
+    )
+
+
+def make_request(ticker="KRW-BTC", price="50000000", candle_ts=CANDLE_TS):
+    candle = MarketData(
+        ticker=ticker,
+        timestamp=candle_ts,
+        open=Decimal(price),
+        high=Decimal(price),
+        low=Decimal(price),
+        close=Decimal(price),
+        volume=Decimal("1"),
+    )
+    return AnalysisRequest(ticker=ticker, current_price=Decimal(price), market_data=[candle])
+
+
+def make_mock_client(content=DECISION_JSON, delay=0.0):
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=content))]
+
+    async def create(**kwargs):
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+    client = Mock()
+    client.chat.completions.create = AsyncMock(side_effect=create)
+    return client
+
+
+class TestDecisionCacheKey:
+    """캐시 키 테스트"""
+
+    def test_same_inputs_same_key(self):
+        version = PromptVersion.current(PromptType.GENERAL)
+
+        first = make_decision_cache_key("KRW-BTC", "prompt", version, CANDLE_TS)
+        second = make_decision_cache_key("KRW-BTC", "prompt", version, CANDLE_TS)
+
+        assert first == second
+        assert first.startswith("KRW-BTC:")
+
+    def test_key_changes_with_each_component(self):
+        version = PromptVersion.current(PromptType.GENERAL)
+        base = make_decision_cache_key("KRW-BTC", "prompt", version, CANDLE_TS)
+
+        assert base != make_decision_cache_key("KRW-BTC", "prompt2", version, CANDLE_TS)
+        assert base != make_decision_cache_key("KRW-BTC", "prompt", PromptVersion.entry_v1(), CANDLE_TS)
+        assert base != make_decision_cache_key("KRW-BTC", "prompt", version, CANDLE_TS + timedelta(hours=1))
+        assert base != make_decision_cache_key("KRW-BTC", "prompt", version, CANDLE_TS, analysis_type="entry")
+
+    def test_next_candle_close(self):
+        now = datetime(2026, 1, 1, 9, 37, 12)
+
+        assert floor_to_candle(now, timedelta(hours=1)) == datetime(2026, 1, 1, 9, 0)
+        assert next_candle_close(now, timedelta(hours=1)) == datetime(2026, 1, 1, 10, 0)
+        assert next_candle_close(now, timedelta(minutes=15)) == datetime(2026, 1, 1, 9, 45)
+
+
+class TestInMemoryDecisionCacheAdapter:
+    """메모리 LRU 캐시 테스트"""
+
+    def test_implements_port(self):
+        assert isinstance(InMemoryDecisionCacheAdapter(), DecisionCachePort)
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self):
+        cache = InMemoryDecisionCacheAdapter()
+        decision = make_decision()
+
+        await cache.set("k", decision, datetime.now() + timedelta(minutes=5))
+
+        assert await cache.get("k") is decision
+        assert cache.get_stats()["hits_memory"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self):
+        cache = InMemoryDecisionCacheAdapter()
+        await cache.set("k", make_decision(), datetime.now() - timedelta(seconds=1))
+
+        assert await cache.get("k") is None
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = InMemoryDecisionCacheAdapter(max_entries=2)
+        expires = datetime.now() + timedelta(minutes=5)
+        await cache.set("a", make_decision(), expires)
+        await cache.set("b", make_decision(), expires)
+        await cache.get("a")  # a를 최근 사용으로 갱신
+
+        await cache.set("c", make_decision(), expires)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+
+    @pytest.mark.asyncio
+    async def test_read_through_backing_store(self):
+        store = InMemoryDecisionCacheAdapter()
+        decision = make_decision()
+        await store.set("k", decision, datetime.now() + timedelta(minutes=5))
+        cache = InMemoryDecisionCacheAdapter(backing_store=store)
+
+        assert await cache.get("k") is decision
+        assert cache.get_stats()["hits_store"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_through_and_hit_rate(self):
+        store = InMemoryDecisionCacheAdapter()
+        cache = InMemoryDecisionCacheAdapter(backing_store=store)
+
+        await cache.get("k")
+        await cache.set("k", make_decision(), datetime.now() + timedelta(minutes=5))
+        await cache.get("k")
+
+        assert store.get_stats()["entries"] == 1
+        assert cache.get_stats()["hit_rate"] == 0.5
+
+
+class TestOpenAIAdapterDecisionCache:
+    """OpenAIAdapter 캐시 연동 테스트"""
+
+    @pytest.fixture
+    def adapter(self):
+        adapter = OpenAIAdapter(api_key="test", decision_cache=InMemoryDecisionCacheAdapter())
+        adapter._client = make_mock_client()
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_second_call_same_candle_hits_cache(self, adapter):
+        first = await adapter.analyze(make_request())
+        second = await adapter.analyze(make_request())
+
+        assert first.decision == DecisionType.BUY
+        assert second is first
+        assert adapter.client.chat.completions.create.await_count == 1
+        assert adapter.get_decision_cache_stats()["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_new_candle_calls_api_again(self, adapter):
+        await adapter.analyze(make_request())
+        await adapter.analyze(make_request(candle_ts=CANDLE_TS + timedelta(hours=1)))
+
+        assert adapter.client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_and_general_are_cached_separately(self, adapter):
+        await adapter.analyze(make_request())
+        await adapter.analyze_entry(make_request())
+
+        assert adapter.client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        adapter = OpenAIAdapter(api_key="test", decision_cache=InMemoryDecisionCacheAdapter())
+        adapter._client = make_mock_client(delay=0.05)
+
+        results = await asyncio.gather(*[adapter.analyze(make_request()) for _ in range(5)])
+
+        assert adapter.client.chat.completions.create.await_count == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_not_cached(self):
+        cache = InMemoryDecisionCacheAdapter()
+        adapter = OpenAIAdapter(api_key="test", max_retries=0, decision_cache=cache)
+        adapter._client = Mock()
+        adapter._client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+
+        decision = await adapter.analyze(make_request())
+
+        assert decision.decision == DecisionType.HOLD
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_no_cache_by_default(self):
+        adapter = OpenAIAdapter(api_key="test")
+        adapter._client = make_mock_client()
+
+        await adapter.analyze(make_request())
+        await adapter.analyze(make_request())
+
+        assert adapter.client.chat.completions.create.await_count == 2
+        assert adapter.get_decision_cache_stats() is None
+
+
+class TestPostgresDecisionCacheAdapter:
+    """영속 저장소 테스트 (SQLite 인메모리)"""
+
+    @pytest_asyncio.fixture
+    async def session_factory(self):
+        pytest.importorskip("aiosqlite")
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from backend.app.models.ai_decision_cache import AIDecisionCacheEntry
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(AIDecisionCacheEntry.__table__.create)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, session_factory):
+        from src.infrastructure.adapters.persistence.postgres_decision_cache_adapter import (
+            PostgresDecisionCacheAdapter,
+        )
+        adapter = PostgresDecisionCacheAdapter(session_factory)
+        decision = make_decision()
+
+        await adapter.set("k", decision, datetime.now() + timedelta(minutes=5), ticker="KRW-BTC")
+        await adapter.set("k", decision, datetime.now() + timedelta(minutes=5))  # 중복 키 무시
+        loaded = await adapter.get("k")
+
+        assert loaded == decision
+
+    @pytest.mark.asyncio
+    async def test_expired_entries(self, session_factory):
+        from src.infrastructure.adapters.persistence.postgres_decision_cache_adapter import (
+            PostgresDecisionCacheAdapter,
+        )
+        adapter = PostgresDecisionCacheAdapter(session_factory)
+        await adapter.set("old", make_decision(), datetime.now() - timedelta(seconds=1))
+
+        assert await adapter.get("old") is None
+        assert await adapter.delete_expired() == 1
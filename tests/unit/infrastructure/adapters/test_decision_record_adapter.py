@@ -128,12 +128,26 @@ class TestDecisionRecordAdapterRecord:
         assert added_obj.params == params
 
 
+def _unlinked_record():
+    """PnL 미연동 DB 레코드 Mock"""
+    record = MagicMock()
+    record.symbol = "KRW-BTC"
+    record.decision = "ALLOW"
+    record.prompt_version = "1.0.0"
+    record.created_at = datetime(2026, 1, 5, 10, 0)
+    record.pnl_percent = None
+    record.is_profitable = None
+    return record
+
+
 class TestDecisionRecordAdapterLinkPnL:
     """link_pnl 메서드 테스트"""
 
     @pytest.fixture
     def mock_session(self):
-        return AsyncMock()
+        session = AsyncMock()
+        session.get_bind = MagicMock()
+        return session
 
     @pytest.fixture
     def adapter(self, mock_session):
@@ -142,7 +156,7 @@ class TestDecisionRecordAdapterLinkPnL:
     @pytest.mark.asyncio
     async def test_link_pnl_success(self, adapter, mock_session):
         """Given: 유효한 ID When: link_pnl Then: True 반환"""
-        mock_record = MagicMock()
+        mock_record = _unlinked_record()
         mock_record.id = 123
         mock_session.get = AsyncMock(return_value=mock_record)
 
@@ -174,7 +188,7 @@ class TestDecisionRecordAdapterLinkPnL:
     @pytest.mark.asyncio
     async def test_link_pnl_updates_record(self, adapter, mock_session):
         """Given: 유효한 ID When: link_pnl Then: 레코드 업데이트"""
-        mock_record = MagicMock()
+        mock_record = _unlinked_record()
         mock_session.get = AsyncMock(return_value=mock_record)
 
         pnl = PnLLabel(
@@ -0,0 +1,106 @@
+"""
+PostgresPersistenceAdapter 포지션 저장 테스트
+
+SQLite(aiosqlite)를 PostgreSQL 대용으로 사용하여
+- positions 테이블 write-through 저장
+- 재시작(새 어댑터) 시 테이블에서 인덱스 복구
+- 로드 이후 조회는 DB 접근 없이 인메모리 인덱스 사용
+을 검증합니다.
+"""
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from src.domain.entities.trade import Position
+from src.domain.value_objects.money import Money
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from backend.app.models.position import Position as PositionModel
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'positions.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(PositionModel.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def make_adapter(session_factory):
+    from src.infrastructure.adapters.persistence.postgres_persistence_adapter import (
+        PostgresPersistenceAdapter,
+    )
+    return PostgresPersistenceAdapter(session_factory=session_factory)
+
+
+def make_position(ticker="KRW-BTC", volume="0.1", price="50000000"):
+    return Position.create(
+        ticker=ticker,
+        symbol=ticker.split("-")[1],
+        volume=Decimal(volume),
+        avg_entry_price=Money.krw(Decimal(price)),
+    )
+
+
+class CountingFactory:
+    """세션 생성 횟수를 세는 session_factory 래퍼"""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self._factory()
+
+
+class TestPersistentPositions:
+    """positions 테이블 + 인메모리 인덱스"""
+
+    @pytest.mark.asyncio
+    async def test_positions_survive_restart(self, session_factory):
+        """저장한 포지션은 새 어댑터(재시작)에서도 조회"""
+        adapter = make_adapter(session_factory)
+        btc = make_position()
+        await adapter.save_position(btc)
+        await adapter.save_position(btc.add(Decimal("0.1"), Money.krw(Decimal("60000000"))))
+        await adapter.save_position(make_position("KRW-ETH", "2", "3000000"))
+
+        restarted = make_adapter(session_factory)
+        position = await restarted.get_position("KRW-BTC")
+
+        assert position.id == btc.id
+        assert position.volume == Decimal("0.2")
+        assert position.avg_entry_price.amount == Decimal("55000000")
+        assert len(await restarted.get_all_positions()) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_position_removes_row(self, session_factory):
+        """청산 시 테이블과 인덱스에서 모두 제거"""
+        from backend.app.models.position import Position as PositionModel
+        adapter = make_adapter(session_factory)
+        await adapter.save_position(make_position())
+
+        assert await adapter.close_position("KRW-BTC") is True
+        assert await adapter.close_position("KRW-BTC") is False
+        assert await adapter.get_position("KRW-BTC") is None
+        async with session_factory() as session:
+            count = (await session.execute(select(func.count()).select_from(PositionModel))).scalar_one()
+        assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_reads_are_local_after_load(self, session_factory):
+        """최초 로드 이후 조회는 세션을 열지 않음"""
+        await make_adapter(session_factory).save_position(make_position())
+        counting = CountingFactory(session_factory)
+        adapter = make_adapter(counting)
+
+        for _ in range(5):
+            await adapter.get_position("KRW-BTC")
+            await adapter.get_all_positions()
+
+        assert counting.calls == 1
@@ -0,0 +1,275 @@
+"""
+PostgresPersistenceAdapter write-behind 테스트
+
+SQLite(aiosqlite)를 PostgreSQL 대용으로 사용하여
+- 큐잉 + 배치 INSERT (크기/시간 트리거)
+- 주문/거래 durable 기록
+- 읽기 전 flush (read-your-writes)
+- 실패 배치 행 단위 재시도/폐기
+를 검증합니다.
+"""
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+
+from src.application.dto.analysis import DecisionType, TradingDecision
+from src.domain.entities.trade import Order, OrderSide, OrderStatus, OrderType, Trade, TradeStatus
+from src.domain.value_objects.money import Currency, Money
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from backend.app.models.trade import Trade as TradeModel
+    from backend.app.models.order import Order as OrderModel
+    from backend.app.models.ai_decision import AIDecision
+    from backend.app.models.portfolio import PortfolioSnapshot
+    from backend.app.models.trade_daily_stat import TradeDailyStat
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'persistence.db'}")
+    async with engine.begin() as conn:
+        for model in (TradeModel, OrderModel, AIDecision, PortfolioSnapshot, TradeDailyStat):
+            await conn.run_sync(model.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def make_adapter(session_factory, **kwargs):
+    from src.infrastructure.adapters.persistence.postgres_persistence_adapter import (
+        PostgresPersistenceAdapter,
+    )
+    return PostgresPersistenceAdapter(session_factory=session_factory, **kwargs)
+
+
+def make_trade(trade_id=None):
+    return Trade(
+        id=trade_id or uuid4(),
+        ticker="KRW-BTC",
+        side=OrderSide.BUY,
+        price=Money(Decimal("50000000"), Currency.KRW),
+        volume=Decimal("0.001"),
+        fee=Money(Decimal("25"), Currency.KRW),
+        status=TradeStatus.COMPLETED,
+        executed_at=datetime.utcnow(),
+    )
+
+
+def make_order():
+    return Order(
+        id=uuid4(),
+        ticker="KRW-BTC",
+        side=OrderSide.BUY,
+        order_type=OrderType.MARKET,
+        volume=Decimal("0.001"),
+        status=OrderStatus.PENDING,
+        created_at=datetime.utcnow(),
+    )
+
+
+async def count_rows(session_factory, table_name):
+    from backend.app.db.base import Base
+    table = Base.metadata.tables[table_name]
+    async with session_factory() as session:
+        return (await session.execute(select(func.count()).select_from(table))).scalar_one()
+
+
+class TestImmediateWrites:
+    """write-behind 비활성화 (즉시 INSERT, refresh 없음)"""
+
+    @pytest.mark.asyncio
+    async def test_save_and_read_back(self, session_factory):
+        """즉시 기록 후 조회 및 생성 ID 반환"""
+        adapter = make_adapter(session_factory)
+        trade = make_trade()
+
+        await adapter.save_trade(trade)
+        retrieved = await adapter.get_trade(trade.id)
+        saved_decision = await adapter.save_decision("KRW-BTC", TradingDecision(
+            decision=DecisionType.BUY, confidence=Decimal("0.8"), reasoning="breakout"))
+
+        assert retrieved.id == trade.id
+        assert retrieved.volume == Decimal("0.001")
+        assert isinstance(saved_decision["id"], int)
+        assert adapter.get_write_stats() == {}
+
+
+class TestWriteBehind:
+    """write-behind 큐 + 배치 INSERT"""
+
+    @pytest.mark.asyncio
+    async def test_rows_are_queued_then_flushed_in_batches(self, session_factory):
+        """큐에 쌓인 기록은 flush 시 배치 크기 단위로 INSERT"""
+        adapter = make_adapter(session_factory, write_behind=True, durable_trades=False,
+                               max_batch_size=10, flush_interval=60)
+
+        for _ in range(9):
+            await adapter.save_trade(make_trade())
+
+        assert adapter.get_write_stats()["depth"] == 9
+        assert await count_rows(session_factory, "trades") == 0
+
+        # 배치 크기 도달 → 백그라운드 flush
+        await adapter.save_portfolio_snapshot(Decimal("1000000"), {"KRW-BTC": 0.001})
+        for _ in range(15):
+            await adapter.save_trade(make_trade())
+        await adapter.flush()
+
+        stats = adapter.get_write_stats()
+        assert await count_rows(session_factory, "trades") == 24
+        assert await count_rows(session_factory, "portfolio_snapshots") == 1
+        assert stats["written"] == 25
+        assert stats["depth"] == 0
+        assert stats["batches"] == 3
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_time_trigger_flushes_partial_batch(self, session_factory):
+        """flush_interval 경과 시 부분 배치도 기록"""
+        adapter = make_adapter(session_factory, write_behind=True,
+                               max_batch_size=100, flush_interval=0.05)
+
+        await adapter.save_decision("KRW-ETH", TradingDecision(
+            decision=DecisionType.HOLD, confidence=Decimal("0.5"), reasoning="range"))
+        await asyncio.sleep(0.3)
+
+        assert await count_rows(session_factory, "ai_decisions") == 1
+        assert adapter.get_write_stats()["depth"] == 0
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_orders_are_durable(self, session_factory):
+        """주문은 write-behind 모드에서도 반환 전에 기록"""
+        adapter = make_adapter(session_factory, write_behind=True, flush_interval=60)
+
+        await adapter.save_order(make_order())
+
+        assert await count_rows(session_factory, "orders") == 1
+        assert adapter.get_write_stats()["durable_writes"] == 1
+        assert adapter.get_write_stats()["depth"] == 0
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_explicit_durable_trade(self, session_factory):
+        """durable=True 지정 시 거래도 즉시 기록"""
+        adapter = make_adapter(session_factory, write_behind=True, flush_interval=60)
+
+        await adapter.save_trade(make_trade(), durable=True)
+
+        assert await count_rows(session_factory, "trades") == 1
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_trades_are_durable_by_default(self, session_factory):
+        """거래는 durable 지정 없이도 반환 전에 기록 (큐에 쌓이지 않음)"""
+        adapter = make_adapter(session_factory, write_behind=True, flush_interval=60)
+
+        await adapter.save_trade(make_trade())
+
+        assert await count_rows(session_factory, "trades") == 1
+        assert adapter.get_write_stats()["durable_writes"] == 1
+        assert adapter.get_write_stats()["depth"] == 0
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_reads_see_queued_writes(self, session_factory):
+        """조회 전에 해당 테이블의 대기 기록을 flush"""
+        adapter = make_adapter(session_factory, write_behind=True, durable_trades=False,
+                               flush_interval=60)
+        trade = make_trade()
+
+        await adapter.save_trade(trade)
+        retrieved = await adapter.get_trade(trade.id)
+
+        assert retrieved is not None
+        assert retrieved.id == trade.id
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_flushes_remaining(self, session_factory):
+        """종료 시 남은 기록 flush"""
+        adapter = make_adapter(session_factory, write_behind=True, durable_trades=False,
+                               flush_interval=60)
+        for _ in range(3):
+            await adapter.save_trade(make_trade())
+
+        await adapter.aclose()
+
+        assert await count_rows(session_factory, "trades") == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_rows_retried_then_dropped(self, session_factory):
+        """실패한 배치는 재시도 후 max_attempts 초과 시 폐기"""
+        adapter = make_adapter(session_factory, write_behind=True, durable_trades=False,
+                               flush_interval=60)
+        trade_id = uuid4()
+        await adapter.save_trade(make_trade(trade_id), durable=True)
+
+        # 같은 trade_id (unique 위반) → 배치 실패
+        await adapter.save_trade(make_trade(trade_id))
+        for _ in range(3):
+            with pytest.raises(Exception):
+                await adapter.flush()
+
+        stats = adapter.get_write_stats()
+        assert stats["failed_batches"] == 3
+        assert stats["dropped"] == 1
+        assert stats["depth"] == 0
+
+        # 이후 정상 기록은 계속 동작
+        await adapter.save_trade(make_trade())
+        assert await adapter.flush() == 1
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_bad_row_does_not_fail_its_batch(self, session_factory):
+        """배치 실패 시 행 단위로 재시도 → 정상 행은 기록, 불량 행만 큐에 남음"""
+        adapter = make_adapter(session_factory, write_behind=True, durable_trades=False,
+                               flush_interval=60)
+        trade_id = uuid4()
+        await adapter.save_trade(make_trade(trade_id), durable=True)
+
+        await adapter.save_trade(make_trade())
+        await adapter.save_trade(make_trade(trade_id))
+        await adapter.save_trade(make_trade())
+        with pytest.raises(Exception):
+            await adapter.flush()
+
+        stats = adapter.get_write_stats()
+        assert await count_rows(session_factory, "trades") == 3
+        assert stats["failed_batches"] == 1
+        assert stats["written"] == 2
+        assert stats["depth"] == 1
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_dropped_rows_are_exported(self, session_factory, monkeypatch):
+        """폐기된 행은 테이블별 메트릭으로 노출"""
+        from src.infrastructure.adapters.persistence.write_behind import WriteBehindQueue
+        dropped = []
+        monkeypatch.setattr(WriteBehindQueue, "_export_dropped",
+                            lambda self, table: dropped.append(table))
+        adapter = make_adapter(session_factory, write_behind=True, durable_trades=False,
+                               flush_interval=60)
+        trade_id = uuid4()
+        await adapter.save_trade(make_trade(trade_id), durable=True)
+
+        await adapter.save_trade(make_trade(trade_id))
+        for _ in range(3):
+            with pytest.raises(Exception):
+                await adapter.flush()
+
+        assert dropped == ["trades"]
+        await adapter.aclose()
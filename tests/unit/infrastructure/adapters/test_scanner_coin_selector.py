@@ -465,3 +465,178 @@ class TestCoinSelectorAsync:
 
                             # 데이터 동기화가 호출되었는지 확인
                             mock_sync.assert_called_once()
+
+
+@pytest.mark.asyncio
+class TestCoinSelectorIncrementalRescoring:
+    """증분 재채점 테스트 (새 일봉/유동성 순위 변화가 있는 코인만 재평가)"""
+
+    TICKERS = ['KRW-BTC', 'KRW-ETH', 'KRW-XRP']
+
+    def _coins(self, tickers):
+        return [
+            CoinInfo(
+                ticker=t, symbol=t.replace('KRW-', ''), korean_name=t,
+                current_price=1000.0, volume_24h=1.0, acc_trade_price_24h=1e11 - i,
+                signed_change_rate=0.0, high_price=1000.0, low_price=1000.0
+            )
+            for i, t in enumerate(tickers)
+        ]
+
+    def _statuses(self, last_candles):
+        from src.scanner.data_sync import SyncStatus
+        return [
+            SyncStatus(
+                ticker=t, symbol=t.replace('KRW-', ''), status='skipped',
+                rows_before=365, rows_after=365, rows_added=0,
+                date_range=(datetime(2023, 1, 1), last)
+            )
+            for t, last in last_candles.items()
+        ]
+
+    def _scores(self, tickers):
+        return [
+            BacktestScore(
+                ticker=t, symbol=t.replace('KRW-', ''), passed=True, score=90.0 - i,
+                grade='STRONG PASS', metrics={'total_return': 25.0, 'win_rate': 48.0},
+                filter_results={}, reason='통과'
+            )
+            for i, t in enumerate(tickers)
+        ]
+
+    def _selector(self, **kwargs):
+        selector = CoinSelector(enable_sector_diversification=False, backtest_top_n=3, **kwargs)
+        selector.liquidity_scanner.scan_top_coins = AsyncMock(return_value=self._coins(self.TICKERS))
+        selector.liquidity_scanner.print_scan_result = MagicMock()
+        selector.multi_backtest.print_results = MagicMock()
+        selector.multi_backtest.run_parallel_backtest = AsyncMock(
+            side_effect=lambda coin_list, coin_infos, top_n: self._scores(coin_list)
+        )
+        return selector
+
+    async def test_unchanged_coins_reuse_scores(self):
+        """일봉/순위 변화 없으면 두 번째 스캔은 백테스팅/Trading Pass를 다시 하지 않음"""
+        selector = self._selector()
+        candles = {t: datetime(2024, 3, 1, 9) for t in self.TICKERS}
+        selector.data_sync.sync_multiple_coins = AsyncMock(return_value=self._statuses(candles))
+
+        first = await selector.select_coins()
+        with patch(
+            'src.scanner.coin_selector.QuickBacktestFilter.evaluate_trading_pass'
+        ) as evaluate:
+            second = await selector.select_coins()
+
+        selector.multi_backtest.run_parallel_backtest.assert_awaited_once()
+        evaluate.assert_not_called()
+        assert second.tier_stats['tier2']['recomputed'] == 0
+        assert second.tier_stats['tier2']['reused'] == 3
+        assert second.tier_stats['tier2']['recompute_ratio'] == 0.0
+        assert [c.symbol for c in second.selected_coins] == [c.symbol for c in first.selected_coins]
+        assert [c.trading_pass_passed for c in second.candidates] == \
+            [c.trading_pass_passed for c in first.candidates]
+
+    async def test_new_candle_recomputes_only_that_coin(self):
+        """새 일봉이 생긴 코인만 재계산, 나머지는 캐시 점수와 병합"""
+        selector = self._selector()
+        candles = {t: datetime(2024, 3, 1, 9) for t in self.TICKERS}
+        selector.data_sync.sync_multiple_coins = AsyncMock(return_value=self._statuses(candles))
+        await selector.select_coins()
+
+        candles['KRW-XRP'] = datetime(2024, 3, 2, 9)
+        selector.data_sync.sync_multiple_coins = AsyncMock(return_value=self._statuses(candles))
+        result = await selector.select_coins()
+
+        last_call = selector.multi_backtest.run_parallel_backtest.call_args
+        assert last_call.kwargs['coin_list'] == ['KRW-XRP']
+        assert result.tier_stats['tier2']['recomputed'] == 1
+        assert result.tier_stats['tier2']['recompute_ratio'] == pytest.approx(1 / 3, abs=1e-3)
+        assert {c.ticker for c in result.candidates} == set(self.TICKERS)
+
+    async def test_rank_change_beyond_tolerance_recomputes(self):
+        """유동성 순위가 허용치 이상 바뀐 코인은 재계산"""
+        selector = self._selector(rescore_rank_tolerance=1)
+        candles = {t: datetime(2024, 3, 1, 9) for t in self.TICKERS}
+        selector.data_sync.sync_multiple_coins = AsyncMock(return_value=self._statuses(candles))
+        await selector.select_coins()
+
+        # XRP: 2위 → 0위 (변화 2), BTC: 0 → 1, ETH: 1 → 2 (변화 1)
+        selector.liquidity_scanner.scan_top_coins = AsyncMock(
+            return_value=self._coins(['KRW-XRP', 'KRW-BTC', 'KRW-ETH'])
+        )
+        result = await selector.select_coins()
+
+        last_call = selector.multi_backtest.run_parallel_backtest.call_args
+        assert last_call.kwargs['coin_list'] == ['KRW-XRP']
+        assert result.tier_stats['tier2']['reused'] == 2
+
+    async def test_disabled_recomputes_every_cycle(self):
+        """증분 재채점 비활성화 시 매 사이클 전체 재계산"""
+        selector = self._selector(incremental_rescoring=False)
+        candles = {t: datetime(2024, 3, 1, 9) for t in self.TICKERS}
+        selector.data_sync.sync_multiple_coins = AsyncMock(return_value=self._statuses(candles))
+
+        await selector.select_coins()
+        result = await selector.select_coins()
+
+        assert selector.multi_backtest.run_parallel_backtest.await_count == 2
+        assert result.tier_stats['tier2']['recompute_ratio'] == 1.0
+
+
+class TestCoinSelectorMonteCarloGate:
+    """몬테카를로 게이트 (Trading Pass 통과 코인의 파산 확률 검증)"""
+
+    def _candidate(self, trade_pnls):
+        from src.backtesting.backtester import BacktestResult
+        from src.backtesting.portfolio import Trade
+
+        trades = [
+            Trade(
+                symbol="KRW-BTC", entry_price=100.0, exit_price=100.0, size=1.0,
+                entry_time=datetime(2024, 1, 1), exit_time=datetime(2024, 1, 2),
+                pnl=pnl, pnl_percent=0.0, commission=0.0
+            )
+            for pnl in trade_pnls
+        ]
+        backtest_score = BacktestScore(
+            ticker="KRW-BTC", symbol="BTC", passed=True, score=80.0, grade="STRONG PASS",
+            metrics={'total_return': 25.0}, filter_results={}, reason="통과",
+            backtest_result=BacktestResult(
+                initial_capital=1_000_000.0, final_equity=1_000_000.0, equity_curve=[1_000_000.0],
+                trades=trades, metrics={}
+            )
+        )
+        return CoinCandidate(
+            ticker="KRW-BTC", symbol="BTC", coin_info=None, backtest_score=backtest_score,
+            entry_signal=None, final_score=80.0, final_grade="BUY", selected=True, selection_reason=""
+        )
+
+    def _apply(self, selector, candidate):
+        from src.backtesting.quick_filter import PassResult
+
+        passed = PassResult(passed=True, pass_type='trading', passed_count=13, failed_count=0, reason="통과")
+        with patch('src.scanner.coin_selector.QuickBacktestFilter.evaluate_trading_pass', return_value=passed), \
+                patch('src.scanner.coin_selector.QuickBacktestFilter.check_expectancy_with_metrics',
+                      return_value={'net_expectancy': 0.2}):
+            return selector._apply_trading_pass([candidate])[0]
+
+    def test_high_ruin_probability_fails_trading_pass(self):
+        """거래 재표본 파산 확률이 한도를 넘으면 Trading Pass 실패"""
+        from src.backtesting.monte_carlo import MonteCarloConfig, MonteCarloSimulator
+
+        selector = CoinSelector(monte_carlo=MonteCarloSimulator(MonteCarloConfig(n_paths=500, seed=0)))
+        candidate = self._apply(selector, self._candidate([500_000, -400_000, 500_000, -400_000, 500_000]))
+
+        assert not candidate.trading_pass_passed
+        assert not candidate.selected
+        assert "몬테카를로 파산 확률" in candidate.trading_pass_reason
+
+    def test_gate_disabled_or_low_risk_keeps_pass(self):
+        """게이트 없음 또는 파산 위험 낮으면 Trading Pass 결과 유지"""
+        from src.backtesting.monte_carlo import MonteCarloConfig, MonteCarloSimulator
+
+        risky = [500_000, -400_000, 500_000, -400_000, 500_000]
+        assert self._apply(CoinSelector(), self._candidate(risky)).trading_pass_passed
+
+        selector = CoinSelector(monte_carlo=MonteCarloSimulator(MonteCarloConfig(n_paths=500, seed=0)))
+        candidate = self._apply(selector, self._candidate([20_000, -10_000, 20_000, -10_000, 20_000]))
+        assert candidate.trading_pass_passed
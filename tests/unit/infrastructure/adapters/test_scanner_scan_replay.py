@@ -0,0 +1,164 @@
+"""
+스캔 정책 시점별 재생 테스트
+
+- 창 지표가 PerformanceAnalyzer를 창 구간에 직접 돌린 결과와 일치
+- 미래 데이터 미사용 (룩어헤드 없음)
+- 날짜별 선택이 CoinSelector 정책 단계를 따름
+"""
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtesting.backtester import BacktestResult
+from src.backtesting.performance import PerformanceAnalyzer
+from src.backtesting.portfolio import Trade
+from src.scanner.coin_selector import CoinSelector
+from src.scanner.multi_backtest import MultiBacktestConfig, MultiCoinBacktest
+from src.scanner.scan_replay import RollingBacktestMetrics, ScanPolicyReplay
+
+COMPARED = [
+    'total_return', 'volatility', 'max_drawdown', 'sharpe_ratio', 'sortino_ratio', 'calmar_ratio',
+    'total_trades', 'win_rate', 'avg_win', 'avg_loss', 'profit_factor',
+    'max_consecutive_wins', 'max_consecutive_losses', 'avg_holding_period_hours',
+]
+
+
+def _trade(index, entry, exit_, pnl):
+    return Trade(
+        symbol="KRW-AAA", entry_price=100.0, exit_price=100.0, size=1.0,
+        entry_time=index[entry].to_pydatetime(), exit_time=index[exit_].to_pydatetime(),
+        pnl=pnl, pnl_percent=pnl, commission=0.0
+    )
+
+
+@pytest.fixture
+def history():
+    """200일 자산 곡선 + 겹치지 않는 거래 20개"""
+    rng = np.random.default_rng(7)
+    index = pd.date_range('2024-01-01', periods=200, freq='D')
+    equity = 1_000_000 * np.cumprod(1 + rng.normal(0.001, 0.02, len(index)))
+    pnls = rng.normal(1000, 5000, 20)
+    trades = [_trade(index, 10 * i, 10 * i + 5, pnl) for i, pnl in enumerate(pnls)]
+    return index, equity, trades
+
+
+class TestRollingBacktestMetrics:
+    """창 지표 정확성"""
+
+    @pytest.mark.parametrize('day', [40, 99, 150, 199])
+    def test_matches_performance_analyzer_on_window(self, history, day):
+        """as_of(d) == PerformanceAnalyzer(창 자산, 창 안 진입/청산 거래)"""
+        index, equity, trades = history
+        window = 60
+        rolling = RollingBacktestMetrics(index, equity, trades, window=window)
+
+        start = max(0, day - window + 1)
+        window_trades = [
+            t for t in trades
+            if t.entry_time >= index[start] and t.exit_time <= index[day]
+        ]
+        expected = PerformanceAnalyzer.calculate_metrics(
+            equity_curve=list(equity[start:day + 1]),
+            trades=window_trades,
+            initial_capital=equity[start]
+        )
+
+        actual = rolling.as_of(index[day])
+        for key in COMPARED:
+            assert actual[key] == pytest.approx(expected[key], rel=1e-6, abs=1e-9), key
+
+    def test_no_lookahead_and_min_bars(self, history):
+        """미래 자산/거래가 바뀌어도 과거 시점 지표는 동일, 최소 봉 수 미달이면 None"""
+        index, equity, trades = history
+        changed = equity.copy()
+        changed[120:] *= 3
+        base = RollingBacktestMetrics(index, equity, trades, window=60)
+        future_changed = RollingBacktestMetrics(
+            index, changed, trades + [_trade(index, 199, 199, 1e9)], window=60
+        )
+
+        assert base.as_of(index[110]) == future_changed.as_of(index[110])
+        assert base.as_of(index[10]) is None
+        assert base.as_of(index[0] - timedelta(days=1)) is None
+
+
+def _bars(index, value):
+    close = np.linspace(100, 120, len(index))
+    return pd.DataFrame({
+        'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+        'volume': np.ones(len(index)), 'value': value,
+    }, index=index)
+
+
+class TestScanPolicyReplay:
+    """날짜별 선택 재생"""
+
+    def _replay(self, data, metrics_by_ticker):
+        multi_backtest = MultiCoinBacktest(config=MultiBacktestConfig(days=30), data_sync=MagicMock())
+
+        def execute(ticker, df):
+            return BacktestResult(
+                initial_capital=1.0, final_equity=1.0, equity_curve=[1.0] * len(df),
+                trades=[], metrics={}
+            )
+
+        multi_backtest._execute_backtest = execute
+        selector = CoinSelector(
+            liquidity_scanner=MagicMock(_passes_filter=lambda coin, volume: True),
+            data_sync=MagicMock(),
+            multi_backtest=multi_backtest,
+            liquidity_top_n=2,
+            backtest_top_n=2,
+            final_select_n=1,
+            min_volume_krw=1.0,
+            enable_sector_diversification=False
+        )
+        replay = ScanPolicyReplay(selector=selector, data=data)
+        replay.prepare()
+        for ticker, metrics in metrics_by_ticker.items():
+            replay.metrics[ticker].as_of = metrics
+        return replay
+
+    def test_liquidity_rank_uses_only_same_day_value(self):
+        """거래대금 순위가 바뀌는 날부터만 선택이 바뀜 (미래 거래대금 미사용)"""
+        index = pd.date_range('2024-01-01', periods=40, freq='D')
+        ramp = np.where(np.arange(40) >= 35, 1e12, 1e9)
+        data = {
+            'KRW-AAA': _bars(index, np.full(40, 5e10)),
+            'KRW-BBB': _bars(index, np.full(40, 4e10)),
+            'KRW-CCC': _bars(index, ramp),
+        }
+        good = {
+            'total_return': 40.0, 'win_rate': 60.0, 'profit_factor': 3.0, 'sharpe_ratio': 2.5,
+            'sortino_ratio': 3.0, 'calmar_ratio': 3.0, 'max_drawdown': -5.0, 'volatility': 30.0,
+            'max_consecutive_losses': 2, 'total_trades': 30, 'avg_win': 3.0, 'avg_loss': -1.0,
+            'avg_holding_period_hours': 48.0,
+        }
+        weak = dict(good, total_return=10.0, sharpe_ratio=0.5, sortino_ratio=0.6)
+        replay = self._replay(data, {
+            'KRW-AAA': lambda date: weak,
+            'KRW-BBB': lambda date: weak,
+            'KRW-CCC': lambda date: good,
+        })
+
+        result = replay.replay(start=index[30])
+
+        stats = result.daily_stats
+        assert list(stats['liquidity'].unique()) == [2]
+        assert 'KRW-CCC' not in result.selections[index[34]]
+        assert result.selections[index[35]] == ['KRW-CCC']
+        assert result.selection_frequency()['KRW-CCC'] == 5
+
+    def test_coin_without_history_is_skipped(self):
+        """최소 기간 미달(지표 None) 코인은 백테스트 단계에서 제외"""
+        index = pd.date_range('2024-01-01', periods=5, freq='D')
+        data = {'KRW-AAA': _bars(index, np.full(5, 5e10))}
+        replay = self._replay(data, {})
+
+        result = replay.replay()
+
+        assert (result.daily_stats['backtested'] == 0).all()
+        assert all(selected == [] for selected in result.selections.values())
@@ -0,0 +1,316 @@
+"""
+UniversePrefilter (2단 스캔 1단계) 단위 테스트
+
+- 패널 지표 벡터 계산 (모멘텀, 변동성, BB 스퀴즈, 거래대금 z-score)
+- 일봉 캐시: 최신 캐시 재사용, 진행 중 캔들 제외, 수집 시간 예산
+- 사전 필터 순위/변동성 범위/이력 부족 제외
+- CoinSelector 2단 스캔: 생존 코인만 백테스팅 + 단계별 통계
+"""
+import time
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.scanner.coin_selector import CoinSelector
+from src.scanner.liquidity_scanner import CoinInfo
+from src.scanner.multi_backtest import BacktestScore
+from src.scanner.universe_prefilter import (
+    DailyBarCache,
+    UniversePrefilter,
+    compute_panel_features,
+)
+
+
+AS_OF = date(2024, 3, 1)
+
+
+def _bars(closes, values=None, end=AS_OF):
+    """완료 일봉 DataFrame (end까지)"""
+    closes = np.asarray(closes, dtype=float)
+    index = pd.date_range(end=pd.Timestamp(end) + pd.Timedelta(hours=9), periods=len(closes), freq='D')
+    values = np.full(len(closes), 1e10) if values is None else np.asarray(values, dtype=float)
+    return pd.DataFrame({
+        'open': closes, 'high': closes * 1.01, 'low': closes * 0.99,
+        'close': closes, 'volume': values / closes, 'value': values,
+    }, index=index)
+
+
+def _coin(ticker, price, value=5e10):
+    return CoinInfo(
+        ticker=ticker, symbol=ticker.replace('KRW-', ''), korean_name=ticker,
+        current_price=price, volume_24h=value / price, acc_trade_price_24h=value,
+        signed_change_rate=0.0, high_price=price, low_price=price
+    )
+
+
+def _wavy(start, drift, amplitude, days=60):
+    """추세 + 진동 (변동성 확보용)"""
+    t = np.arange(days)
+    return start * (1 + drift) ** t * (1 + amplitude * np.sin(t * 1.3))
+
+
+class TestPanelFeatures:
+    """패널 지표 계산 테스트"""
+
+    def test_momentum_and_volatility(self):
+        """모멘텀은 20일 수익률, 변동성은 일간 로그수익률 표준편차(%)"""
+        closes = np.array([
+            np.linspace(100, 120, 61),
+            np.full(61, 100.0),
+        ])
+        values = np.full((2, 60), 1e10)
+
+        features = compute_panel_features(closes, values, current_value=np.array([1e10, 1e10]))
+
+        assert features['momentum'][0] == pytest.approx(120 / closes[0, -21] - 1)
+        assert features['momentum'][1] == pytest.approx(0.0)
+        assert features['volatility'][1] == pytest.approx(0.0)
+        assert features['volatility'][0] > 0
+
+    def test_bb_squeeze_and_volume_z(self):
+        """밴드가 좁아진 코인은 스퀴즈 백분위가 낮고, 거래대금 급증은 z-score가 큼"""
+        t = np.arange(61)
+        contracting = 100 * (1 + np.where(t < 40, 0.08, 0.005) * np.sin(t * 1.3))
+        expanding = 100 * (1 + np.where(t < 40, 0.005, 0.08) * np.sin(t * 1.3))
+        closes = np.array([contracting, expanding])
+        rng = np.random.default_rng(0)
+        values = 1e10 * (1 + 0.1 * rng.standard_normal((2, 60)))
+
+        features = compute_panel_features(closes, values, current_value=np.array([5e10, 1e10]))
+
+        assert features['bb_squeeze'][0] < 0.2
+        assert features['bb_squeeze'][1] > 0.8
+        assert features['volume_z'][0] > 10
+        assert abs(features['volume_z'][1]) < 3
+
+    def test_short_history_yields_nan(self):
+        """이력이 부족하면(앞쪽 NaN) 해당 지표는 NaN"""
+        closes = np.full((1, 61), 100.0)
+        closes[0, :50] = np.nan
+
+        features = compute_panel_features(closes, np.full((1, 60), 1e10), np.array([1e10]))
+
+        assert np.isnan(features['momentum'][0])
+        assert np.isnan(features['bb_squeeze'][0])
+
+
+class TestDailyBarCache:
+    """일봉 캐시 테스트"""
+
+    def test_last_completed_day_uses_utc_boundary(self):
+        """업비트 일봉은 UTC 자정(KST 09:00) 기준"""
+        now = datetime(2024, 3, 2, 0, 30, tzinfo=timezone.utc)
+        assert DailyBarCache.last_completed_day(now) == date(2024, 3, 1)
+
+    def test_put_drops_in_progress_candle(self):
+        """as_of 이후(진행 중) 캔들은 저장하지 않음"""
+        cache = DailyBarCache(lookback_days=10)
+        cache.put('KRW-BTC', _bars(np.arange(1, 13), end=date(2024, 3, 2)), AS_OF)
+
+        bars = cache.get('KRW-BTC')
+        assert bars.index[-1].date() == AS_OF
+        assert len(bars) == 10
+        assert cache.is_fresh('KRW-BTC', AS_OF)
+
+    @pytest.mark.asyncio
+    async def test_refresh_fetches_only_stale_and_persists(self, tmp_path):
+        """최신 캐시는 재사용, 오래된 코인만 수집 후 디스크 저장/재로드"""
+        path = tmp_path / "universe_daily.parquet"
+        cache = DailyBarCache(cache_path=path, lookback_days=30, rate_limit_delay=0)
+        cache.put('KRW-BTC', _bars(np.arange(1, 31)), AS_OF)
+
+        with patch('src.scanner.universe_prefilter.pyupbit.get_ohlcv',
+                   return_value=_bars(np.arange(1, 32), end=date(2024, 3, 2))) as get_ohlcv:
+            cached, fetched, missing = await cache.refresh(['KRW-BTC', 'KRW-ETH'], as_of=AS_OF)
+
+        assert (cached, fetched, missing) == (1, 1, 0)
+        get_ohlcv.assert_called_once()
+        assert get_ohlcv.call_args[0][0] == 'KRW-ETH'
+
+        reloaded = DailyBarCache(cache_path=path, lookback_days=30)
+        with patch('src.scanner.universe_prefilter.pyupbit.get_ohlcv') as get_ohlcv:
+            assert await reloaded.refresh(['KRW-BTC', 'KRW-ETH'], as_of=AS_OF) == (2, 0, 0)
+        get_ohlcv.assert_not_called()
+        assert reloaded.get('KRW-ETH')['close'].iloc[-1] == pytest.approx(30.0)
+
+    @pytest.mark.asyncio
+    async def test_refresh_respects_budget(self):
+        """수집 예산 초과분은 누락 처리 (다음 사이클로 연기)"""
+        cache = DailyBarCache(lookback_days=30, max_concurrent=1, rate_limit_delay=0)
+
+        def slow_fetch(ticker, interval, count):
+            time.sleep(0.2)
+            return _bars(np.arange(1, 32), end=date(2024, 3, 2))
+
+        with patch('src.scanner.universe_prefilter.pyupbit.get_ohlcv', side_effect=slow_fetch):
+            started = time.monotonic()
+            cached, fetched, missing = await cache.refresh(
+                ['KRW-A', 'KRW-B', 'KRW-C', 'KRW-D'], as_of=AS_OF, budget_seconds=0.3
+            )
+
+        assert time.monotonic() - started < 0.6
+        assert cached == 0
+        assert 1 <= fetched < 4
+        assert fetched + missing == 4
+
+
+class TestUniversePrefilter:
+    """사전 필터 실행 테스트"""
+
+    def _prefilter(self, coins, bars, **kwargs):
+        scanner = MagicMock()
+        scanner.scan_universe = AsyncMock(return_value=coins)
+        scanner.last_universe_size = len(coins) + 5
+        cache = DailyBarCache(lookback_days=60)
+        cache.refresh = AsyncMock(return_value=(len(bars), 0, len(coins) - len(bars)))
+        for ticker, df in bars.items():
+            cache.put(ticker, df, AS_OF)
+        return UniversePrefilter(scanner, cache=cache, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_ranks_and_filters_universe(self):
+        """모멘텀 우위 코인이 상위, 변동성 범위 밖/이력 부족/보유 코인 제외"""
+        bars = {
+            'KRW-UP': _bars(_wavy(100, 0.01, 0.03)),
+            'KRW-DOWN': _bars(_wavy(100, -0.01, 0.03)),
+            'KRW-FLAT': _bars(np.full(60, 100.0)),        # 변동성 0 → 제외
+            'KRW-NEW': _bars(_wavy(100, 0.02, 0.03, days=10)),  # 이력 부족 → 제외
+            'KRW-HELD': _bars(_wavy(100, 0.02, 0.03)),
+        }
+        coins = [
+            _coin('KRW-UP', bars['KRW-UP']['close'].iloc[-1] * 1.02, value=8e10),
+            _coin('KRW-DOWN', bars['KRW-DOWN']['close'].iloc[-1] * 0.98),
+            _coin('KRW-FLAT', 100.0),
+            _coin('KRW-NEW', 200.0),
+            _coin('KRW-HELD', 300.0),
+        ]
+        prefilter = self._prefilter(coins, bars, weights={'momentum': 1.0})
+
+        result = await prefilter.run(top_n=5, exclude_tickers=['KRW-HELD'])
+
+        assert [c.ticker for c in result.survivors] == ['KRW-UP', 'KRW-DOWN']
+        assert result.universe == 10
+        assert result.eligible == 4
+        assert result.scored == 3
+        assert 'KRW-FLAT' not in result.scores
+        assert result.features['KRW-UP']['momentum'] > 0
+        # 1단계 일봉으로 7일 변동성 채움
+        assert result.survivors[0].volatility_7d is not None
+        assert result.to_stats()['survivors'] == 2
+
+    @pytest.mark.asyncio
+    async def test_top_n_limits_survivors(self):
+        """생존 코인은 top_n개"""
+        bars = {f'KRW-C{i}': _bars(_wavy(100, 0.001 * i, 0.03)) for i in range(8)}
+        coins = [_coin(t, df['close'].iloc[-1]) for t, df in bars.items()]
+
+        result = await self._prefilter(coins, bars).run(top_n=3)
+
+        assert len(result.survivors) == 3
+        assert result.survivors[0].ticker == 'KRW-C7'
+
+    @pytest.mark.asyncio
+    async def test_survivors_meet_tier2_volume_floor(self):
+        """순위는 전체 마켓 기준, 생존 코인은 2단계 최소 거래대금 이상만"""
+        bars = {f'KRW-C{i}': _bars(_wavy(100, 0.001 * i, 0.03)) for i in range(6)}
+        coins = [
+            _coin(t, df['close'].iloc[-1], value=5e9 if i % 2 else 5e10)
+            for i, (t, df) in enumerate(bars.items())
+        ]
+
+        prefilter = self._prefilter(coins, bars, weights={'momentum': 1.0})
+
+        result = await prefilter.run(top_n=5, survivor_min_volume_krw=1e10)
+
+        assert [c.ticker for c in result.survivors] == ['KRW-C4', 'KRW-C2', 'KRW-C0']
+        assert result.scored == 6
+        assert len(result.scores) == 6
+
+    def test_daily_cache_is_outside_sync_parquet_glob(self, tmp_path):
+        """일봉 캐시는 HistoricalDataSync의 *.parquet 정리/요약 대상이 아님"""
+        from src.scanner.universe_prefilter import create_universe_prefilter
+
+        prefilter = create_universe_prefilter(MagicMock(), data_dir=str(tmp_path))
+
+        assert prefilter.cache.cache_path.parent == tmp_path / "universe"
+
+    @pytest.mark.asyncio
+    async def test_full_universe_panel_is_fast(self):
+        """~200개 마켓 지표 계산이 1초 안에 끝남 (캐시된 일봉 기준)"""
+        rng = np.random.default_rng(1)
+        bars = {
+            f'KRW-C{i}': _bars(100 * np.exp(np.cumsum(0.03 * rng.standard_normal(60))))
+            for i in range(200)
+        }
+        coins = [_coin(t, df['close'].iloc[-1]) for t, df in bars.items()]
+
+        result = await self._prefilter(coins, bars).run(top_n=20)
+
+        assert result.scored == 200
+        assert len(result.survivors) == 20
+        assert result.duration_seconds < 1.0
+
+
+@pytest.mark.asyncio
+class TestCoinSelectorTwoTier:
+    """CoinSelector 2단 스캔 테스트"""
+
+    def _score(self, ticker):
+        return BacktestScore(
+            ticker=ticker, symbol=ticker.replace('KRW-', ''), passed=True, score=80.0,
+            grade='STRONG PASS', metrics={'total_return': 20.0, 'win_rate': 48.0}, filter_results={}, reason='통과'
+        )
+
+    async def test_tier2_runs_only_on_survivors(self):
+        """사전 필터 생존 코인만 동기화/백테스팅, 단계별 통계 기록"""
+        survivors = [_coin(f'KRW-C{i}', 100.0) for i in range(6)]
+        prefilter = MagicMock()
+        prefilter.run = AsyncMock(return_value=MagicMock(
+            survivors=survivors, universe=180, eligible=150, scored=140, duration_seconds=0.4,
+            to_stats=MagicMock(return_value={'universe': 180, 'survivors': 6, 'seconds': 0.4})
+        ))
+        selector = CoinSelector(
+            universe_prefilter=prefilter,
+            liquidity_top_n=4,
+            enable_sector_diversification=False,
+            prefilter_top_n=6
+        )
+        selector.liquidity_scanner.scan_top_coins = AsyncMock()
+        selector.data_sync.sync_multiple_coins = AsyncMock()
+        selector.multi_backtest.run_parallel_backtest = AsyncMock(return_value=[self._score('KRW-C0')])
+        selector.liquidity_scanner.print_scan_result = MagicMock()
+        selector.multi_backtest.print_results = MagicMock()
+
+        result = await selector.select_coins(exclude_tickers=['KRW-BTC'])
+
+        prefilter.run.assert_awaited_once_with(
+            top_n=6, exclude_tickers=['KRW-BTC'], survivor_min_volume_krw=10_000_000_000
+        )
+        selector.liquidity_scanner.scan_top_coins.assert_not_awaited()
+        backtested = selector.multi_backtest.run_parallel_backtest.call_args.kwargs['coin_list']
+        assert backtested == ['KRW-C0', 'KRW-C1', 'KRW-C2', 'KRW-C3']
+        assert result.liquidity_scanned == 4
+        assert result.universe_scanned == 180
+        assert result.tier_stats['tier1']['survivors'] == 6
+        assert result.tier_stats['tier2']['candidates'] == 4
+        assert result.tier_stats['tier2']['passed'] == 1
+        assert result.tier_stats['within_budget'] is True
+
+    async def test_falls_back_to_liquidity_scan(self):
+        """사전 필터 생존 코인이 없으면 기존 유동성 상위 스캔으로 대체"""
+        prefilter = MagicMock()
+        prefilter.run = AsyncMock(return_value=MagicMock(
+            survivors=[], universe=180, eligible=0, scored=0, duration_seconds=0.1,
+            to_stats=MagicMock(return_value={'universe': 180, 'survivors': 0, 'seconds': 0.1})
+        ))
+        selector = CoinSelector(universe_prefilter=prefilter)
+        selector.liquidity_scanner.scan_top_coins = AsyncMock(return_value=[])
+
+        result = await selector.select_coins()
+
+        selector.liquidity_scanner.scan_top_coins.assert_awaited_once()
+        assert result.liquidity_scanned == 0
+        assert result.tier_stats['tier1']['universe'] == 180
@@ -0,0 +1,344 @@
+"""
+토큰 예산 프롬프트 빌더 테스트
+
+검증 항목:
+- 오프라인 토큰 카운터 (결정적 근사)
+- 압축 표기 (숫자/딕셔너리/표)
+- 섹션 분할/복원, 예산 맞춤 (압축 → 제거), 섹션별 리포트
+- TokenBudgetPromptAdapter (YAMLPromptAdapter 래핑)
+- OpenAIAdapter 프롬프트 예산
+- 회귀 하네스: 예산 축소 시 기록된 입력의 결정 변경률
+"""
+import json
+import re
+from decimal import Decimal
+
+import pytest
+
+from src.application.dto.analysis import AnalysisRequest, TechnicalIndicators
+from src.domain.value_objects.prompt_version import PromptType
+from src.infrastructure.adapters.ai.openai_adapter import OpenAIAdapter
+from src.infrastructure.adapters.prompt import (
+    PromptBudgeter,
+    TokenBudgetPromptAdapter,
+    TokenCounter,
+    YAMLPromptAdapter,
+)
+from src.infrastructure.adapters.prompt.budget_regression import (
+    load_recorded_inputs,
+    run_budget_regression,
+)
+from src.infrastructure.adapters.prompt.token_budget import compact_section, encode_compact
+
+
+SAMPLE_PROMPT = """## 분석 요청: KRW-BTC
+
+### 현재 상태:
+- 현재가: 50,000,000 KRW
+
+### 기술적 지표:
+- RSI: 55.1
+- MACD: 0.0012
+- SMA20: 49,000,000
+
+### 백테스팅 성과 (최근 30일):
+- 통과 여부: ✅ 통과
+- 총 수익률: 12.50%
+- 승률: 55.00%
+
+### 요청:
+위 정보를 바탕으로 판단하세요."""
+
+PRIORITIES = {"백테스팅 성과": 2, "기술적 지표": 1}
+
+
+def make_entry_context(rsi=55.0, volume_ratio=1.2, regime="TRENDING_UP"):
+    return {
+        "ticker": "KRW-BTC",
+        "timestamp": "2026-01-01T09:00",
+        "regime": regime,
+        "atr_percent": 2.345678,
+        "breakout_strength": "STRONG",
+        "risk_budget": 0.02,
+        "rsi": rsi,
+        "volume_ratio": volume_ratio,
+        "macd_status": "bullish",
+        "bb_position": 0.7,
+        "btc_dominance": 52.1,
+        "fear_greed": 60,
+        "flash_crash_risk": False,
+        "backtest_summary": {"win_rate": 55.5, "sharpe": 1.23, "mdd": -8.2, "trades": 42},
+    }
+
+
+def extract_feature(prompt: str, key: str):
+    """불릿("- key: v") 또는 압축 표("key|...\\nv|...")에서 값 추출"""
+    match = re.search(rf"^- {re.escape(key)}: (.+)$", prompt, re.MULTILINE)
+    if match:
+        return match.group(1).strip()
+    lines = prompt.splitlines()
+    for index, line in enumerate(lines[:-1]):
+        headers = line.split("|")
+        if key in headers:
+            return lines[index + 1].split("|")[headers.index(key)].strip()
+    return None
+
+
+async def rule_based_decide(prompt: str) -> str:
+    """기록된 입력 회귀 검증용 결정적 결정 함수 (LLM 대역)"""
+    rsi = extract_feature(prompt, "RSI")
+    volume_ratio = extract_feature(prompt, "Volume Ratio")
+    regime = extract_feature(prompt, "Regime")
+    if rsi is None or volume_ratio is None or regime is None:
+        return "HOLD"
+    if not 30 <= float(rsi) <= 70:
+        return "BLOCK"
+    if float(volume_ratio) < 0.8 or regime not in ("TRENDING_UP", "RANGING"):
+        return "BLOCK"
+    return "ALLOW"
+
+
+class TestTokenCounter:
+    """토큰 카운터 테스트"""
+
+    def test_approx_counter_is_deterministic(self):
+        counter = TokenCounter(use_tiktoken=False)
+
+        assert counter.backend == "approx"
+        assert counter.count("") == 0
+        assert counter.count(SAMPLE_PROMPT) == counter.count(SAMPLE_PROMPT)
+
+    def test_approx_counter_scales_with_content(self):
+        counter = TokenCounter(use_tiktoken=False)
+
+        assert counter.count("RSI") == 1
+        assert counter.count("123456") == 2
+        assert counter.count("현재가") == 3
+        assert counter.count(SAMPLE_PROMPT) > counter.count("## 분석 요청: KRW-BTC")
+
+
+class TestCompactEncoding:
+    """압축 표기 테스트"""
+
+    def test_numbers(self):
+        assert encode_compact(50000000.0) == "50000000"
+        assert encode_compact(Decimal("55.1234")) == "55.12"
+        assert encode_compact(0.001234) == "0.0012"
+        assert encode_compact(True) == "Y"
+
+    def test_dict_and_table(self):
+        assert encode_compact({"win_rate": 55.5, "trades": 42}) == "win_rate=55.5 trades=42"
+        rows = [{"t": "KRW-BTC", "r": 1.5}, {"t": "KRW-ETH", "r": -0.25}]
+        assert encode_compact(rows) == "t|r\nKRW-BTC|1.5\nKRW-ETH|-0.25"
+
+    def test_compact_section_builds_table(self):
+        body = "- RSI: 55.1\n- MACD: 0.0012\n\n설명 라인"
+
+        assert compact_section(body) == "설명 라인\nRSI|MACD\n55.1|0.0012"
+
+
+class TestPromptBudgeter:
+    """예산 맞춤 테스트"""
+
+    def test_split_sections_roundtrip(self):
+        sections = PromptBudgeter.split_sections(SAMPLE_PROMPT)
+
+        assert "\n".join(s.render() for s in sections) == SAMPLE_PROMPT
+        assert [s.name for s in sections][:3] == ["분석 요청: KRW-BTC", "현재 상태", "기술적 지표"]
+
+    def test_no_budget_reports_only(self):
+        budgeter = PromptBudgeter(counter=TokenCounter(use_tiktoken=False))
+
+        result = budgeter.fit(SAMPLE_PROMPT)
+
+        assert result.text == SAMPLE_PROMPT
+        assert result.report.total_tokens == result.report.original_tokens
+        assert set(result.report.section_tokens) >= {"현재 상태", "기술적 지표", "요청"}
+        assert budgeter.last_report is result.report
+
+    def test_compacts_before_dropping(self):
+        counter = TokenCounter(use_tiktoken=False)
+        budgeter = PromptBudgeter(section_priorities=PRIORITIES, counter=counter)
+        original = counter.count(SAMPLE_PROMPT)
+
+        result = budgeter.fit(SAMPLE_PROMPT, budget=original - 3)
+
+        assert result.report.within_budget
+        assert result.report.summarized == ["백테스팅 성과 (최근 30일)"]
+        assert result.report.dropped == []
+        assert "통과 여부|총 수익률|승률" in result.text
+
+    def test_drops_lowest_value_first_and_keeps_required(self):
+        counter = TokenCounter(use_tiktoken=False)
+        budgeter = PromptBudgeter(section_priorities=PRIORITIES, counter=counter)
+
+        result = budgeter.fit(SAMPLE_PROMPT, budget=40)
+
+        assert result.report.dropped[0] == "백테스팅 성과 (최근 30일)"
+        assert "현재가" in result.text
+        assert "### 요청" in result.text
+
+    def test_budget_below_required_sections_stops_at_required(self):
+        budgeter = PromptBudgeter(section_priorities=PRIORITIES, counter=TokenCounter(use_tiktoken=False))
+
+        result = budgeter.fit(SAMPLE_PROMPT, budget=1)
+
+        assert not result.report.within_budget
+        assert set(result.report.dropped) == {"백테스팅 성과 (최근 30일)", "기술적 지표"}
+
+    def test_priority_zero_is_compacted_but_never_dropped(self):
+        budgeter = PromptBudgeter(
+            section_priorities={"백테스팅 성과": 2, "기술적 지표": 0},
+            counter=TokenCounter(use_tiktoken=False),
+        )
+
+        result = budgeter.fit(SAMPLE_PROMPT, budget=1)
+
+        assert result.report.dropped == ["백테스팅 성과 (최근 30일)"]
+        assert "RSI|MACD|SMA20" in result.text
+
+
+class TestTokenBudgetPromptAdapter:
+    """YAML 프롬프트 래퍼 테스트"""
+
+    @pytest.fixture
+    def adapter(self):
+        return TokenBudgetPromptAdapter(
+            inner=YAMLPromptAdapter(),
+            counter=TokenCounter(use_tiktoken=False),
+        )
+
+    @pytest.mark.asyncio
+    async def test_compact_context_encoding(self, adapter):
+        prompt = await adapter.render_prompt(PromptType.ENTRY, make_entry_context(), budget=100_000)
+
+        assert "ATR%: 2.35" in prompt
+        assert "win_rate=55.5 sharpe=1.23" in prompt
+        assert adapter.last_report.prompt_name == "entry"
+
+    @pytest.mark.asyncio
+    async def test_no_budget_is_byte_identical(self, adapter):
+        """예산이 없으면 압축 없이 원본 렌더링 그대로 (토큰 측정만)"""
+        original = await YAMLPromptAdapter().render_prompt(PromptType.ENTRY, make_entry_context())
+
+        prompt = await adapter.render_prompt(PromptType.ENTRY, make_entry_context())
+
+        assert prompt == original
+        assert adapter.last_report.total_tokens > 0
+
+    @pytest.mark.asyncio
+    async def test_budget_trims_low_value_sections(self, adapter):
+        full = await adapter.render_prompt(PromptType.ENTRY, make_entry_context())
+        full_tokens = adapter.last_report.total_tokens
+
+        trimmed = await adapter.render_prompt(
+            PromptType.ENTRY, make_entry_context(), budget=full_tokens - 60
+        )
+        report = adapter.last_report
+
+        assert report.within_budget
+        assert "Backtest Summary" in report.dropped
+        assert len(trimmed) < len(full)
+        # 마무리 지시문은 유지
+        assert "Risk Hunter. Find reasons NOT to trade." in trimmed
+
+    @pytest.mark.asyncio
+    async def test_delegates_version(self, adapter):
+        version = await adapter.get_current_version(PromptType.ENTRY)
+
+        assert version.prompt_type == PromptType.ENTRY
+
+
+class TestOpenAIAdapterPromptBudget:
+    """OpenAIAdapter 프롬프트 예산 테스트"""
+
+    def make_request(self):
+        return AnalysisRequest(
+            ticker="KRW-BTC",
+            current_price=Decimal("50000000"),
+            indicators=TechnicalIndicators(rsi=Decimal("55.1"), sma_20=Decimal("49000000")),
+            additional_context={
+                "backtest_result": {"passed": True, "metrics": {"total_return": 12.5, "win_rate": 55.0}},
+                "market_correlation": {"market_risk": "low", "btc_correlation": 0.8},
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_budget_applied_to_analysis_prompt(self):
+        adapter = OpenAIAdapter(api_key="test", prompt_token_budget=60)
+        captured = {}
+
+        async def fake_completion(call_type, **kwargs):
+            captured["prompt"] = kwargs["messages"][1]["content"]
+            raise RuntimeError("stop")
+
+        adapter._create_completion = fake_completion
+        await adapter.analyze(self.make_request())
+        report = adapter.get_last_prompt_report()
+
+        assert report.budget == 60
+        assert report.original_tokens > report.total_tokens
+        assert "시장 상관관계" in report.dropped
+        assert captured["prompt"].endswith("한국어 JSON 형식으로 응답하세요.")
+
+
+class TestBudgetRegressionHarness:
+    """예산 축소 회귀 하네스 테스트"""
+
+    @pytest.fixture
+    def recorded_inputs(self, tmp_path):
+        path = tmp_path / "records.jsonl"
+        contexts = [
+            make_entry_context(rsi=55.0),
+            make_entry_context(rsi=75.0),
+            make_entry_context(rsi=45.0, volume_ratio=0.5),
+            make_entry_context(rsi=60.0, regime="VOLATILE"),
+            make_entry_context(rsi=25.0),
+        ]
+        path.write_text("\n".join(json.dumps(c) for c in contexts), encoding="utf-8")
+        return load_recorded_inputs(path)
+
+    @pytest.mark.asyncio
+    async def test_moderate_budget_keeps_decisions(self, recorded_inputs):
+        adapter = TokenBudgetPromptAdapter(YAMLPromptAdapter(), counter=TokenCounter(use_tiktoken=False))
+
+        async def render(context, budget):
+            return await adapter.render_prompt(PromptType.ENTRY, context, budget=budget)
+
+        baseline = await render(recorded_inputs[0], None)
+        full_tokens = adapter.last_report.total_tokens
+
+        results = await run_budget_regression(
+            recorded_inputs,
+            render=render,
+            decide=rule_based_decide,
+            budgets=[full_tokens - 20, full_tokens - 80, full_tokens - 200],
+            max_change_rate=0.0,
+        )
+
+        assert baseline
+        assert all(r.passed for r in results)
+        assert all(r.total == 5 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_extreme_budget_regression_detected(self, recorded_inputs):
+        # 핵심 지표까지 제거 가능한 설정 → 결정 변경이 감지되어야 함
+        adapter = TokenBudgetPromptAdapter(
+            YAMLPromptAdapter(),
+            section_priorities={"Backtest Summary": 3, "Risk Context": 2, "Market Summary": 1, "Technical Indicators": 1},
+            counter=TokenCounter(use_tiktoken=False),
+        )
+
+        async def render(context, budget):
+            return await adapter.render_prompt(PromptType.ENTRY, context, budget=budget)
+
+        results = await run_budget_regression(
+            recorded_inputs,
+            render=render,
+            decide=rule_based_decide,
+            budgets=[1],
+            max_change_rate=0.2,
+        )
+
+        assert results[0].changed == 5
+        assert not results[0].passed
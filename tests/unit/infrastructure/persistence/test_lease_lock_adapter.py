@@ -0,0 +1,201 @@
+"""
+SQLiteLeaseLockAdapter 테스트
+
+- 배타적 lease + 증가하는 fencing token
+- 하트비트 갱신 / 보유자 중단 시 만료 후 인계
+- 보유 한도(timeout_seconds) 이후 갱신 중단
+- FIFO 대기열 (새 요청이 대기자를 앞지르지 않음) + 대기 한도
+- 대기/보유 시간 메트릭 기록
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.application.ports.outbound.lock_port import LockLease
+from src.infrastructure.adapters.persistence.fallback_coordination_adapter import FallbackLockAdapter
+from src.infrastructure.adapters.persistence.lease_lock_adapter import SQLiteLeaseLockAdapter
+
+
+def _adapter(tmp_path, **kwargs):
+    options = {'lease_ttl': 30.0, 'heartbeat_interval': 10.0, 'poll_interval': 0.01}
+    options.update(kwargs)
+    return SQLiteLeaseLockAdapter(tmp_path / "coordination.db", **options)
+
+
+class TestLeaseLock:
+    """lease 획득/해제 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_lease_is_exclusive_and_tokens_increase(self, tmp_path):
+        """다른 프로세스(어댑터)는 보유 중인 lease를 얻지 못하고, 재획득 시 토큰 증가"""
+        first = _adapter(tmp_path)
+        second = _adapter(tmp_path)
+
+        lease = await first.acquire_lease("trading_cycle")
+        assert lease is not None and lease.token == 1
+        assert await second.acquire("trading_cycle") is False
+        assert await second.is_locked("trading_cycle") is True
+
+        await first.release("trading_cycle")
+        assert await second.is_locked("trading_cycle") is False
+
+        next_lease = await second.acquire_lease("trading_cycle")
+        assert next_lease.token == 2
+        assert await second.validate_lease(next_lease) is True
+        assert await second.validate_lease(lease) is False
+        first.close()
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_same_adapter_is_not_reentrant(self, tmp_path):
+        """같은 프로세스의 다른 작업도 보유 중인 lease를 얻지 못함"""
+        adapter = _adapter(tmp_path)
+
+        assert await adapter.acquire("trading_cycle") is True
+        assert await adapter.acquire("trading_cycle") is False
+        assert adapter.get_lease("trading_cycle").token == 1
+        adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_crashed_holder_lease_expires(self, tmp_path):
+        """하트비트가 멈춘 보유자의 lease는 TTL 후 인계, 이전 토큰은 무효"""
+        crashed = _adapter(tmp_path, lease_ttl=0.05, heartbeat_interval=60.0)
+        successor = _adapter(tmp_path, lease_ttl=0.05)
+
+        stale = await crashed.acquire_lease("trading_cycle")
+        await asyncio.sleep(0.1)
+
+        lease = await successor.acquire_lease("trading_cycle")
+        assert lease is not None and lease.token > stale.token
+        assert await crashed.validate_lease(stale) is False
+        crashed.close()
+        successor.close()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_keeps_lease_alive(self, tmp_path):
+        """하트비트가 TTL보다 오래 lease를 유지"""
+        holder = _adapter(tmp_path, lease_ttl=0.2, heartbeat_interval=0.03)
+        other = _adapter(tmp_path)
+
+        lease = await holder.acquire_lease("trading_cycle")
+        await asyncio.sleep(0.4)
+
+        assert await holder.validate_lease(lease) is True
+        assert await other.acquire("trading_cycle") is False
+        holder.close()
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_lease_not_renewed_past_hold_limit(self, tmp_path):
+        """timeout_seconds(보유 한도) 이후에는 갱신되지 않고 만료"""
+        holder = _adapter(tmp_path, lease_ttl=0.2, heartbeat_interval=0.03)
+
+        lease = await holder.acquire_lease("trading_cycle", timeout_seconds=0.1)
+        await asyncio.sleep(0.3)
+
+        assert await holder.validate_lease(lease) is False
+        assert await holder.is_locked("trading_cycle") is False
+        holder.close()
+
+
+class TestLeaseQueue:
+    """대기열 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_waiters_granted_in_fifo_order(self, tmp_path):
+        """먼저 대기한 작업이 먼저 획득, 대기 중에는 새 요청이 앞지르지 못함"""
+        holder = _adapter(tmp_path)
+        first_waiter = _adapter(tmp_path)
+        second_waiter = _adapter(tmp_path)
+        order = []
+
+        await holder.acquire("trading_cycle")
+
+        async def wait_and_hold(adapter, name):
+            lease = await adapter.acquire_lease("trading_cycle", wait_seconds=5.0)
+            order.append((name, lease.token))
+            await asyncio.sleep(0.02)
+            await adapter.release("trading_cycle")
+
+        first = asyncio.create_task(wait_and_hold(first_waiter, "first"))
+        await asyncio.sleep(0.05)
+        second = asyncio.create_task(wait_and_hold(second_waiter, "second"))
+        await asyncio.sleep(0.05)
+
+        await holder.release("trading_cycle")
+        # 대기자가 있으므로 대기하지 않는 요청은 실패
+        assert await holder.acquire("trading_cycle") is False
+
+        await asyncio.gather(first, second)
+        assert [name for name, _ in order] == ["first", "second"]
+        assert order[0][1] < order[1][1]
+        for adapter in (holder, first_waiter, second_waiter):
+            adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_wait_is_bounded(self, tmp_path):
+        """대기 한도 초과 시 None, 대기열에서 제거"""
+        holder = _adapter(tmp_path)
+        waiter = _adapter(tmp_path)
+        await holder.acquire("trading_cycle")
+
+        started = time.monotonic()
+        assert await waiter.acquire_lease("trading_cycle", wait_seconds=0.05) is None
+        assert time.monotonic() - started < 1.0
+
+        await holder.release("trading_cycle")
+        # 만료된 대기자가 남아 있지 않으므로 즉시 획득
+        assert await waiter.acquire("trading_cycle") is True
+        holder.close()
+        waiter.close()
+
+    @pytest.mark.asyncio
+    async def test_blocking_acquire_uses_max_wait(self, tmp_path):
+        """acquire(blocking=True)는 max_wait_seconds까지 대기"""
+        holder = _adapter(tmp_path)
+        waiter = _adapter(tmp_path, max_wait_seconds=5.0)
+        await holder.acquire("trading_cycle")
+
+        async def release_soon():
+            await asyncio.sleep(0.05)
+            await holder.release("trading_cycle")
+
+        task = asyncio.create_task(release_soon())
+        assert await waiter.acquire("trading_cycle", blocking=True) is True
+        await task
+        holder.close()
+        waiter.close()
+
+    @pytest.mark.asyncio
+    async def test_wait_and_hold_metrics(self, tmp_path):
+        """대기/보유 시간 히스토그램 기록"""
+        adapter = _adapter(tmp_path)
+
+        module = 'src.infrastructure.adapters.persistence.lease_lock_adapter'
+        with patch(f'{module}._observe_wait') as record_wait, \
+             patch(f'{module}._observe_hold') as record_hold:
+            await adapter.acquire("trading_cycle")
+            await adapter.release("trading_cycle")
+
+        assert record_wait.call_args[0][:2] == ("trading_cycle", "acquired")
+        assert record_hold.call_args[0][0] == "trading_cycle"
+        adapter.close()
+
+
+class TestFallbackLease:
+    """FallbackLockAdapter를 통한 lease"""
+
+    @pytest.mark.asyncio
+    async def test_fallback_returns_local_lease(self, tmp_path):
+        """primary 없이도 로컬 lease와 fencing token 제공"""
+        lock = FallbackLockAdapter(None, _adapter(tmp_path))
+
+        lease = await lock.acquire_lease("trading_cycle", wait_seconds=0.1)
+
+        assert isinstance(lease, LockLease) and lease.token == 1
+        assert lock.get_lease("trading_cycle") == lease
+        assert await lock.validate_lease(lease) is True
+        await lock.release("trading_cycle")
+        assert await lock.validate_lease(lease) is False
@@ -0,0 +1,175 @@
+"""
+로컬 조율 어댑터 테스트
+
+- SQLiteIdempotencyAdapter: 키 기록/만료/원자적 check_and_mark
+- CycleRunBoard: 사이클 기록, 중단 사이클 처리, 중복 실행 비율
+- Fallback*Adapter: PostgreSQL 장애 시 로컬 저장소로 대체
+"""
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.adapters.persistence.fallback_coordination_adapter import (
+    FallbackIdempotencyAdapter,
+    FallbackLockAdapter,
+)
+from src.infrastructure.adapters.persistence.lease_lock_adapter import SQLiteLeaseLockAdapter
+from src.infrastructure.adapters.persistence.local_coordination_adapter import (
+    CycleRunBoard,
+    SQLiteIdempotencyAdapter,
+)
+
+
+class TestSQLiteIdempotencyAdapter:
+    """SQLiteIdempotencyAdapter 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_mark_and_check_shared_between_connections(self, tmp_path):
+        """다른 연결에서 기록한 키도 조회됨"""
+        writer = SQLiteIdempotencyAdapter(tmp_path / "coordination.db")
+        reader = SQLiteIdempotencyAdapter(tmp_path / "coordination.db")
+
+        assert await reader.check_key("KRW-BTC-1h-1") is False
+        await writer.mark_key("KRW-BTC-1h-1")
+        assert await reader.check_key("KRW-BTC-1h-1") is True
+
+    @pytest.mark.asyncio
+    async def test_check_and_mark_only_first_caller_wins(self, tmp_path):
+        """check_and_mark는 처음 호출만 False (미사용 → 기록)"""
+        adapter = SQLiteIdempotencyAdapter(tmp_path / "coordination.db")
+
+        assert await adapter.check_and_mark("key") is False
+        assert await adapter.check_and_mark("key") is True
+
+    @pytest.mark.asyncio
+    async def test_expired_key_is_reusable(self, tmp_path):
+        """만료된 키는 미사용 처리 + cleanup으로 삭제"""
+        adapter = SQLiteIdempotencyAdapter(tmp_path / "coordination.db")
+        await adapter.mark_key("old", ttl_hours=0)
+        time.sleep(0.01)
+
+        assert await adapter.check_key("old") is False
+        assert await adapter.cleanup_expired() == 1
+
+
+class TestCycleRunBoard:
+    """CycleRunBoard 테스트"""
+
+    def test_run_lifecycle(self, tmp_path):
+        """begin → update_stage → finish 기록이 다른 연결에서 보임"""
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        reader = CycleRunBoard(tmp_path / "coordination.db")
+
+        run_id = board.begin("1h-100", "scheduler")
+        assert reader.current_run()['id'] == run_id
+
+        board.update_stage(run_id, "scanned", {'selected_coin': {'symbol': 'ETH'}})
+        run = reader.get_run(run_id)
+        assert run['stage'] == "scanned"
+        assert run['detail']['selected_coin']['symbol'] == 'ETH'
+
+        board.finish(run_id, {'status': 'success', 'decision': 'hold'})
+        assert reader.current_run() is None
+        assert reader.latest_finished("1h-100")['result']['decision'] == 'hold'
+        assert reader.latest_finished("1h-200") is None
+
+    def test_begin_abandons_previous_running_row(self, tmp_path):
+        """이전 보유자가 종료 기록 없이 죽은 경우 새 begin에서 abandoned 처리"""
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        crashed = board.begin("1h-100", "scheduler")
+        board.begin("1h-100", "telegram")
+
+        assert board.get_run(crashed)['status'] == 'abandoned'
+
+    def test_stale_running_row(self, tmp_path):
+        """갱신 없는 실행 중 사이클은 stale"""
+        board = CycleRunBoard(tmp_path / "coordination.db", stale_after_seconds=0)
+        run_id = board.begin("1h-100", "scheduler")
+        time.sleep(0.01)
+
+        assert board.is_stale(board.get_run(run_id)) is True
+
+    def test_stats_duplicate_ratio(self, tmp_path):
+        """같은 캔들이 두 번 실행되면 중복 실행으로 집계"""
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        first = board.begin("1h-100", "scheduler")
+        board.record_request("1h-100", "scheduler", "executed", first)
+        board.finish(first, {'status': 'success'})
+        board.record_request("1h-100", "telegram", "reused", first)
+
+        second = board.begin("1h-100", "telegram")
+        board.record_request("1h-100", "telegram", "executed", second)
+        board.finish(second, {'status': 'success'})
+
+        stats = board.get_stats()
+        assert stats['requests'] == 3
+        assert stats['executed'] == 2
+        assert stats['reused'] == 1
+        assert stats['duplicate_executions'] == 1
+        assert stats['duplicate_ratio'] == pytest.approx(0.5)
+        assert stats['avoided_ratio'] == pytest.approx(1 / 3)
+
+
+class TestFallbackAdapters:
+    """PostgreSQL + 로컬 대체 어댑터 테스트"""
+
+    def _primary_lock(self, acquired, last_error=None):
+        primary = MagicMock()
+        primary.acquire = AsyncMock(return_value=acquired)
+        primary.release = AsyncMock()
+        primary.last_error = last_error
+        return primary
+
+    @pytest.mark.asyncio
+    async def test_lock_uses_primary_when_available(self, tmp_path):
+        """primary 획득 성공 시 해제도 primary까지"""
+        primary = self._primary_lock(True)
+        lock = FallbackLockAdapter(primary, SQLiteLeaseLockAdapter(tmp_path / "coordination.db"))
+
+        assert await lock.acquire("trading_cycle") is True
+        await lock.release("trading_cycle")
+        primary.release.assert_awaited_once_with("trading_cycle")
+
+    @pytest.mark.asyncio
+    async def test_lock_falls_back_to_local_when_primary_unreachable(self, tmp_path):
+        """primary 연결 오류 → 로컬 락만으로 진행 (같은 호스트 배타성 유지)"""
+        primary = self._primary_lock(False, last_error=ConnectionError("db down"))
+        lock = FallbackLockAdapter(primary, SQLiteLeaseLockAdapter(tmp_path / "coordination.db"))
+        other = FallbackLockAdapter(primary, SQLiteLeaseLockAdapter(tmp_path / "coordination.db"))
+
+        assert await lock.acquire("trading_cycle") is True
+        assert await other.acquire("trading_cycle") is False
+
+        await lock.release("trading_cycle")
+        primary.release.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lock_contended_on_primary_releases_local(self, tmp_path):
+        """다른 호스트가 primary 보유 → 실패, 로컬 락은 반환"""
+        local = SQLiteLeaseLockAdapter(tmp_path / "coordination.db")
+        lock = FallbackLockAdapter(self._primary_lock(False), local)
+
+        assert await lock.acquire("trading_cycle") is False
+        assert await local.is_locked("trading_cycle") is False
+
+    @pytest.mark.asyncio
+    async def test_idempotency_keys_survive_primary_outage(self, tmp_path):
+        """DB 장애 중 기록된 키도 이후 중복으로 판정"""
+        primary = MagicMock()
+        primary.check_key = AsyncMock(side_effect=ConnectionError("db down"))
+        primary.mark_key = AsyncMock(side_effect=ConnectionError("db down"))
+        adapter = FallbackIdempotencyAdapter(primary, SQLiteIdempotencyAdapter(tmp_path / "c.db"))
+
+        assert await adapter.check_and_mark("KRW-BTC-1h-1") is False
+        assert await adapter.check_key("KRW-BTC-1h-1") is True
+
+    @pytest.mark.asyncio
+    async def test_idempotency_key_marked_on_primary(self, tmp_path):
+        """primary에 있는 키는 로컬에 없어도 사용됨"""
+        primary = MagicMock()
+        primary.check_key = AsyncMock(return_value=True)
+        adapter = FallbackIdempotencyAdapter(primary, SQLiteIdempotencyAdapter(tmp_path / "c.db"))
+
+        assert await adapter.check_key("key") is True
+        assert await adapter.check_and_mark("key") is True
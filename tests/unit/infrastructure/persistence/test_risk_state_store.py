@@ -0,0 +1,139 @@
+"""
+RiskStateStore 테스트
+
+- append-only 기록 + 메모리 캐시 조회
+- 다른 연결(프로세스)의 변경 감지
+- 동시 기록 시 갱신 유실 없음
+- 기존 JSON 파일 가져오기
+"""
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.risk.state_store import RiskStateStore
+
+
+def _record_trades(path, count):
+    store = RiskStateStore(path)
+    for _ in range(count):
+        store.record_trade(-0.5)
+    store.close()
+
+
+class TestRiskStateStore:
+    """RiskStateStore 단위 테스트"""
+
+    def test_trade_events_accumulate(self, tmp_path):
+        """거래 증분이 오늘 상태에 누적"""
+        store = RiskStateStore(tmp_path / "risk.db")
+        store.put_state({'daily_pnl': -1.0, 'safe_mode': False})
+        store.record_trade(-2.0)
+        store.record_trade(0.5)
+
+        state = store.get_state()
+        assert state['daily_pnl'] == pytest.approx(-2.5)
+        assert state['daily_trade_count'] == 2
+        assert state['last_trade_time'] is not None
+
+    def test_partial_set_keeps_other_fields(self, tmp_path):
+        """set 이벤트는 주어진 필드만 덮어씀"""
+        store = RiskStateStore(tmp_path / "risk.db")
+        store.record_trade(-3.0)
+        store.put_state({'safe_mode': True, 'safe_mode_reason': 'limit'})
+
+        state = store.get_state()
+        assert state['daily_pnl'] == -3.0
+        assert state['safe_mode'] is True
+
+    def test_reads_do_not_create_file(self, tmp_path):
+        """조회만 하면 파일을 만들지 않음"""
+        path = tmp_path / "risk.db"
+        store = RiskStateStore(path)
+
+        assert store.get_state() is None
+        assert store.daily_pnl_sum() == 0.0
+        assert not path.exists()
+
+    def test_changes_from_other_connection_are_visible(self, tmp_path):
+        """다른 연결의 커밋을 data_version으로 감지하여 반영"""
+        path = tmp_path / "risk.db"
+        reader = RiskStateStore(path)
+        writer = RiskStateStore(path)
+        reader.record_trade(-1.0)
+        version = reader.refresh()
+
+        # 변경 없으면 version 유지
+        assert reader.refresh() == version
+
+        writer.record_trade(-4.0)
+
+        assert reader.refresh() > version
+        assert reader.get_state()['daily_pnl'] == -5.0
+        assert reader.get_state()['daily_trade_count'] == 2
+
+    def test_concurrent_writers_do_not_lose_updates(self, tmp_path):
+        """여러 연결(프로세스 대용)이 동시에 거래를 기록해도 유실 없음"""
+        path = tmp_path / "risk.db"
+        RiskStateStore(path).put_state({'daily_pnl': 0.0})
+
+        workers = [threading.Thread(target=_record_trades, args=(path, 100)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+
+        state = RiskStateStore(path).get_state()
+        assert state['daily_trade_count'] == 400
+        assert state['daily_pnl'] == pytest.approx(-200.0)
+
+    def test_retention_window(self, tmp_path):
+        """보관 기간 밖 날짜는 조회/주간 합계에서 제외"""
+        store = RiskStateStore(tmp_path / "risk.db")
+        for i in range(10):
+            day = (datetime.now() - timedelta(days=i)).date()
+            store.put_state({'daily_pnl': -1.0}, day=day)
+
+        assert len(store.get_all_states()) == 8  # 오늘 + 7일
+        assert store.daily_pnl_sum(days=7) == -7.0
+
+    def test_imports_legacy_json_once(self, tmp_path):
+        """기존 JSON 상태는 최초 1회만 가져옴"""
+        legacy = tmp_path / "risk_state.json"
+        today = datetime.now().date().isoformat()
+        legacy.write_text(json.dumps({today: {'daily_pnl': -3.0, 'daily_trade_count': 2}}))
+
+        store = RiskStateStore(tmp_path / "risk.db", legacy_json=legacy)
+        store.record_trade(-1.0)
+        reopened = RiskStateStore(tmp_path / "risk.db", legacy_json=legacy)
+
+        assert reopened.get_state()['daily_pnl'] == -4.0
+        assert reopened.get_state()['daily_trade_count'] == 3
+
+
+class TestRiskManagerSync:
+    """RiskManager와 다른 프로세스 기록 동기화"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_state_file(self, tmp_path):
+        from src.risk.state_manager import RiskStateManager
+        original = RiskStateManager.STATE_FILE
+        RiskStateManager.STATE_FILE = tmp_path / "risk_state.json"
+        yield
+        RiskStateManager.STATE_FILE = original
+
+    def test_circuit_breaker_sees_other_process_trades(self, tmp_path):
+        """다른 프로세스가 기록한 손실이 Circuit Breaker에 반영"""
+        from src.risk.manager import RiskLimits, RiskManager
+
+        risk_manager = RiskManager(limits=RiskLimits(daily_loss_limit_pct=-10.0))
+        risk_manager.record_trade(-4.0)
+        assert risk_manager.check_circuit_breaker()['allowed'] is True
+
+        other_process = RiskStateStore(tmp_path / "risk_state.db")
+        other_process.record_trade(-7.0)
+
+        result = risk_manager.check_circuit_breaker()
+        assert result['allowed'] is False
+        assert risk_manager.daily_trade_count == 2
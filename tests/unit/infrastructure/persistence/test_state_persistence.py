@@ -2,7 +2,7 @@
 State Persistence 전용 테스트
 
 리스크 관리 상태의 영속성을 검증합니다:
-- JSON 파일 저장/로드
+- 상태 저장소(SQLite) 저장/로드, 기존 JSON 파일 가져오기
 - 프로그램 재시작 시뮬레이션
 - 일일/주간 리셋
 - Circuit Breaker와의 통합
@@ -138,18 +138,14 @@ class TestRiskStateManager:
         # Given: 8일 전 ~ 오늘까지 데이터 저장
         for i in range(10):
             date = (datetime.now() - timedelta(days=i)).date().isoformat()
-            # 직접 파일에 저장 (save_state의 cleanup 로직 테스트)
-            all_states = RiskStateManager.load_all_states()
-            all_states[date] = {
+            # 날짜를 지정해 저장소에 직접 기록 (save_state의 cleanup 로직 테스트)
+            RiskStateManager.get_store().put_state({
                 'daily_pnl': float(-i),
                 'daily_trade_count': i,
                 'weekly_pnl': 0.0,
                 'safe_mode': False,
                 'safe_mode_reason': ''
-            }
-            RiskStateManager.STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(RiskStateManager.STATE_FILE, 'w') as f:
-                json.dump(all_states, f)
+            }, day=date)
 
         # When: 새 상태 저장 (cleanup 트리거)
         RiskStateManager.save_state({
@@ -172,17 +168,13 @@ class TestRiskStateManager:
         # Given: 최근 7일간 각 날짜별 daily_pnl 저장
         for i in range(7):
             date = (datetime.now() - timedelta(days=i)).date().isoformat()
-            all_states = RiskStateManager.load_all_states()
-            all_states[date] = {
+            RiskStateManager.get_store().put_state({
                 'daily_pnl': -1.0,  # 매일 -1%
                 'daily_trade_count': 1,
                 'weekly_pnl': 0.0,
                 'safe_mode': False,
                 'safe_mode_reason': ''
-            }
-            RiskStateManager.STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(RiskStateManager.STATE_FILE, 'w') as f:
-                json.dump(all_states, f)
+            }, day=date)
 
         # When: 주간 손익 계산
         weekly_pnl = RiskStateManager.calculate_weekly_pnl()
@@ -317,6 +309,34 @@ class TestRiskManagerWithPersistence:
         assert risk_manager_2.daily_pnl == -9.0
         assert risk_manager_2.daily_trade_count == 3
 
+    def test_disable_safe_mode_survives_sync_and_restart(self):
+        """안전 모드 해제가 저장소에 기록되어 동기화/재시작 후에도 유지"""
+        risk_manager = RiskManager(persist_state=True)
+        risk_manager.enable_safe_mode("연속 손실")
+
+        risk_manager.disable_safe_mode()
+        risk_manager._sync_state()
+
+        assert risk_manager.safe_mode is False
+        restarted = RiskManager(persist_state=True)
+        assert restarted.safe_mode is False
+        assert restarted.safe_mode_reason == ''
+
+    def test_reset_daily_stats_survives_sync_and_restart(self):
+        """일일 통계 초기화가 저장소에 기록되어 동기화/재시작 후에도 유지"""
+        risk_manager = RiskManager(persist_state=True)
+        risk_manager.record_trade(-3.0)
+        risk_manager.record_trade(-2.0)
+
+        risk_manager.reset_daily_stats()
+        risk_manager._sync_state()
+
+        assert risk_manager.daily_pnl == 0.0
+        assert risk_manager.daily_trade_count == 0
+        restarted = RiskManager(persist_state=True)
+        assert restarted.daily_pnl == 0.0
+        assert restarted.daily_trade_count == 0
+
     def test_no_persistence_mode(self):
         """persist_state=False일 때 파일 미사용 테스트"""
         # Given: 저장된 상태
@@ -123,6 +123,44 @@ class TestLegacyExchangeAdapter:
 
         assert price.amount == Decimal("50000000")
 
+    @pytest.mark.asyncio
+    async def test_get_all_positions_raises_on_failed_balance_call(self):
+        """A failed balance call raises instead of reading as 'no holdings'."""
+        from src.exceptions import APIError
+        from src.infrastructure.adapters.legacy_bridge import LegacyExchangeAdapter
+
+        mock_client = MagicMock()
+        mock_client.get_balances.side_effect = RuntimeError("502 Bad Gateway")
+
+        adapter = LegacyExchangeAdapter(mock_client)
+        with pytest.raises(APIError):
+            await adapter.get_all_positions()
+
+    @pytest.mark.asyncio
+    async def test_get_all_positions_skips_unreadable_coin(self):
+        """A coin whose per-coin read fails is skipped; other positions are returned."""
+        from src.infrastructure.adapters.legacy_bridge import LegacyExchangeAdapter
+
+        mock_client = MagicMock()
+        mock_client.get_balances.return_value = [
+            {"currency": "KRW", "balance": "100000"},
+            {"currency": "BTC", "balance": "0.01"},
+            {"currency": "ETH", "balance": "0", "locked": "1.5"},
+        ]
+        # legacy client reports errors (and fully locked coins) as a 0 balance
+        mock_client.get_balance.side_effect = lambda symbol: 0.01 if symbol == "BTC" else 0.0
+        mock_client.get_avg_buy_price.return_value = 50000000
+        mock_client.get_current_price.return_value = 55000000
+
+        adapter = LegacyExchangeAdapter(mock_client)
+        positions = await adapter.get_all_positions()
+        balances = await adapter.get_all_balances()
+
+        assert [p.ticker for p in positions] == ["KRW-BTC"]
+        eth = next(b for b in balances if b.currency == "ETH")
+        assert eth.total.amount == Decimal("1.5")
+        assert eth.available.amount == Decimal("0")
+
 
 class TestLegacyAIAdapter:
     """Test LegacyAIAdapter wrapping AIService."""
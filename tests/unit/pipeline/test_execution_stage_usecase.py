@@ -165,7 +165,7 @@ class TestExecutionStageWithUseCase:
         result = await stage.execute(mock_context)
 
         # Then: UseCase.execute_sell_all()가 호출되어야 함
-        mock_use_case.execute_sell_all.assert_called_once_with("KRW-BTC")
+        mock_use_case.execute_sell_all.assert_called_once_with("KRW-BTC", lease=None)
 
     @pytest.mark.asyncio
     async def test_execution_stage_hold_does_not_call_use_case(
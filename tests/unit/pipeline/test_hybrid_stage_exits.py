@@ -0,0 +1,119 @@
+"""
+HybridRiskCheckStage 포지션 관리(손절/익절) 테스트
+
+- 수익률이 stop_loss_pct 이하 / take_profit_pct 이상이면 청산
+- 청산은 Container가 있으면 ExecuteTradeUseCase로 실행 (거래/포지션 기록 유지)
+- Container가 없으면 lease 없는 실행에서만 레거시 trading_service 사용
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock
+
+from src.application.dto.trading import OrderResponse
+from src.domain.entities.trade import OrderSide
+from src.position.portfolio_manager import PortfolioPosition
+from src.trading.pipeline.base_stage import PipelineContext
+from src.trading.pipeline.hybrid_stage import HybridRiskCheckStage
+
+
+def make_position(ticker, current_price, avg_buy_price=1_000):
+    return PortfolioPosition(
+        ticker=ticker, symbol=ticker.split("-")[1], amount=2.0,
+        avg_buy_price=avg_buy_price, current_price=current_price
+    )
+
+
+@pytest.fixture
+def use_case():
+    use_case = MagicMock()
+    use_case.execute_sell_all = AsyncMock(return_value=MagicMock(success=True))
+    return use_case
+
+
+@pytest.fixture
+def context(use_case):
+    container = MagicMock()
+    container.get_execute_trade_use_case.return_value = use_case
+    return PipelineContext(
+        ticker="KRW-BTC",
+        container=container,
+        trading_service=MagicMock(),
+        lock_lease=MagicMock(),
+    )
+
+
+@pytest.fixture
+def stage():
+    return HybridRiskCheckStage(stop_loss_pct=-5.0, take_profit_pct=10.0, enable_scanning=False)
+
+
+class TestManagementModeExits:
+    """MANAGEMENT 모드 손절/익절"""
+
+    @pytest.mark.asyncio
+    async def test_threshold_breaches_are_sold_via_use_case(self, stage, context, use_case):
+        """손절/익절 기준을 넘은 포지션만 UseCase로 청산, 나머지는 보유"""
+        status = SimpleNamespace(positions=[
+            make_position("KRW-AAA", 940),    # -6% → 손절
+            make_position("KRW-BBB", 1_120),  # +12% → 익절
+            make_position("KRW-CCC", 1_020),  # +2% → 보유
+        ])
+
+        result = await stage._handle_management_mode(context, status)
+
+        assert result.action == 'exit'
+        actions = {a['ticker']: a for a in result.data['actions']}
+        assert actions["KRW-AAA"]['trigger'] == 'stop_loss'
+        assert actions["KRW-BBB"]['trigger'] == 'take_profit'
+        assert actions["KRW-CCC"]['action'] == 'hold'
+        sold = [call.args[0] for call in use_case.execute_sell_all.await_args_list]
+        assert sold == ["KRW-AAA", "KRW-BBB"]
+        assert all(call.kwargs['lease'] is context.lock_lease for call in use_case.execute_sell_all.await_args_list)
+        context.trading_service.execute_sell.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_breach_continues(self, stage, context, use_case):
+        """기준 내 포지션만 있으면 청산 없이 다음 단계로"""
+        status = SimpleNamespace(positions=[make_position("KRW-CCC", 1_020)])
+
+        result = await stage._handle_management_mode(context, status)
+
+        assert result.action == 'continue'
+        use_case.execute_sell_all.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_order_is_not_counted_as_exit(self, stage, context, use_case):
+        """주문 실패는 exit_failed로 기록하고 파이프라인을 종료하지 않음"""
+        use_case.execute_sell_all.return_value = OrderResponse.failure_response(
+            ticker="KRW-AAA", side=OrderSide.SELL, error_message="No position found for KRW-AAA"
+        )
+        status = SimpleNamespace(positions=[make_position("KRW-AAA", 940)])
+
+        result = await stage._handle_management_mode(context, status)
+
+        assert result.action == 'continue'
+        action = result.data['actions'][0]
+        assert action['action'] == 'exit_failed'
+        assert action['result'] == {'success': False, 'error': "No position found for KRW-AAA"}
+
+    @pytest.mark.asyncio
+    async def test_legacy_service_without_container(self, stage, context):
+        """Container와 lease가 없으면 레거시 서비스로 매도"""
+        context.container = None
+        context.lock_lease = None
+
+        result = await stage._execute_exit(context, make_position("KRW-AAA", 940), 'stop_loss')
+
+        assert result['success'] is True
+        context.trading_service.execute_sell.assert_called_once_with("KRW-AAA")
+
+    @pytest.mark.asyncio
+    async def test_legacy_service_rejected_under_lease(self, stage, context):
+        """lease를 보유한 실행에서는 펜싱할 수 없는 레거시 매도를 거부"""
+        context.container = None
+
+        result = await stage._execute_exit(context, make_position("KRW-AAA", 940), 'stop_loss')
+
+        assert result['success'] is False
+        assert 'lease' in result['error']
+        context.trading_service.execute_sell.assert_not_called()
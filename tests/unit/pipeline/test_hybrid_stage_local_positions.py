@@ -0,0 +1,94 @@
+"""
+HybridRiskCheckStage 로컬 포지션 조회 테스트
+
+- 영속 포지션 인덱스가 켜져 있으면 거래소 잔고/코인별 현재가 조회 없이 포트폴리오 구성
+- 현재가는 일괄 1회, 현금은 KRW 잔고 1회만 조회
+- 포지션 티커 조회는 거래소 호출 없음
+"""
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from src.domain.entities.trade import Position
+from src.domain.value_objects.money import Money
+from src.infrastructure.adapters.persistence.memory_adapter import InMemoryPersistenceAdapter
+from src.position.portfolio_manager import PortfolioManager
+from src.trading.pipeline.base_stage import PipelineContext
+from src.trading.pipeline.hybrid_stage import HybridRiskCheckStage
+
+
+def make_position(ticker, volume, avg_price):
+    return Position.create(
+        ticker=ticker,
+        symbol=ticker.split("-")[1],
+        volume=Decimal(str(volume)),
+        avg_entry_price=Money.krw(avg_price),
+    )
+
+
+@pytest.fixture
+def exchange():
+    exchange = MagicMock()
+    exchange.get_balance.return_value = 1_000_000.0
+    exchange.get_current_prices.return_value = {"KRW-BTC": 51_000_000.0}
+    return exchange
+
+
+@pytest.fixture
+def persistence():
+    return InMemoryPersistenceAdapter()
+
+
+@pytest.fixture
+def context(exchange, persistence):
+    container = MagicMock()
+    container.uses_local_positions.return_value = True
+    container.get_persistence_port.return_value = persistence
+    return PipelineContext(ticker="KRW-BTC", container=container, upbit_client=exchange)
+
+
+class TestLocalPositionReads:
+    """영속 포지션 인덱스 기반 조회"""
+
+    @pytest.mark.asyncio
+    async def test_hot_path_skips_exchange_position_reads(self, context, exchange, persistence):
+        """스테이지는 잔고 목록/코인별 현재가를 거래소에서 조회하지 않음"""
+        await persistence.save_position(make_position("KRW-BTC", 0.01, 50_000_000))
+        stage = HybridRiskCheckStage(max_positions=1, enable_scanning=False)
+
+        result = await stage.execute(context)
+
+        assert result.success is True
+        status = context.portfolio_status
+        assert [p.ticker for p in status.positions] == ["KRW-BTC"]
+        assert status.positions[0].avg_buy_price == 50_000_000
+        assert status.positions[0].current_price == 51_000_000
+        exchange.get_balances.assert_not_called()
+        exchange.get_current_price.assert_not_called()
+        exchange.get_current_prices.assert_called_once_with(["KRW-BTC"])
+        exchange.get_balance.assert_called_once_with("KRW")
+
+    @pytest.mark.asyncio
+    async def test_disabled_falls_back_to_exchange_balances(self, context, exchange):
+        """로컬 조회가 꺼져 있으면 기존처럼 거래소 잔고 조회"""
+        context.container.uses_local_positions.return_value = False
+        exchange.get_balances.return_value = []
+        stage = HybridRiskCheckStage(max_positions=1, enable_scanning=False)
+        stage._handle_entry_mode = MagicMock(return_value=MagicMock(action='continue'))
+
+        await stage.execute(context)
+
+        exchange.get_balances.assert_called_once()
+        context.container.get_persistence_port.assert_not_called()
+
+    def test_position_tickers_make_no_exchange_calls(self, exchange):
+        """보유 티커/보유 여부 조회는 거래소 호출 없음"""
+        manager = PortfolioManager(
+            exchange_client=exchange,
+            positions=[make_position("KRW-BTC", 0.01, 50_000_000), make_position("KRW-ETH", 0, 3_000_000)],
+        )
+
+        assert manager.get_position_tickers() == ["KRW-BTC"]
+        assert manager.has_position("KRW-BTC") is True
+        assert manager.has_position("KRW-ETH") is False
+        assert exchange.mock_calls == []
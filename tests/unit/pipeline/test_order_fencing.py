@@ -0,0 +1,108 @@
+"""
+파이프라인 주문 lease 펜싱 테스트
+
+- RiskCheckStage 손절/익절 매도는 Container가 있으면 UseCase로 lease와 함께 실행
+- lease를 보유한 실행에서 레거시 trading_service 주문은 거부 (펜싱 불가)
+- lease 없는 실행은 기존처럼 레거시 서비스 사용
+"""
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from src.application.dto.trading import OrderResponse
+from src.domain.entities.trade import OrderSide
+from src.trading.pipeline.base_stage import PipelineContext
+from src.trading.pipeline.execution_stage import ExecutionStage
+from src.trading.pipeline.risk_check_stage import RiskCheckStage
+
+
+@pytest.fixture
+def use_case():
+    use_case = MagicMock()
+    use_case.execute_sell_all = AsyncMock(return_value=MagicMock(success=True, order_id="order-1"))
+    return use_case
+
+
+@pytest.fixture
+def context(use_case):
+    container = MagicMock()
+    container.get_execute_trade_use_case.return_value = use_case
+    return PipelineContext(
+        ticker="KRW-BTC",
+        container=container,
+        trading_service=MagicMock(),
+        lock_lease=MagicMock(),
+    )
+
+
+class TestRiskCheckStageFencing:
+    """RiskCheckStage 손절/익절 매도"""
+
+    @pytest.mark.asyncio
+    async def test_sell_goes_through_use_case_with_lease(self, context, use_case):
+        """Container가 있으면 UseCase에 lease를 넘겨 매도"""
+        result = await RiskCheckStage()._sell_position(context)
+
+        assert result == {'success': True, 'trade_id': "order-1"}
+        use_case.execute_sell_all.assert_awaited_once_with("KRW-BTC", lease=context.lock_lease)
+        context.trading_service.execute_sell.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_reported(self, context, use_case):
+        """lease 만료로 거부된 매도는 실패로 보고"""
+        use_case.execute_sell_all.return_value = OrderResponse.failure_response(
+            ticker="KRW-BTC", side=OrderSide.SELL, error_message="Lock lease expired"
+        )
+
+        result = await RiskCheckStage()._sell_position(context)
+
+        assert result == {'success': False, 'error': "Lock lease expired"}
+
+    @pytest.mark.asyncio
+    async def test_legacy_sell_rejected_under_lease(self, context):
+        """lease 보유 중 레거시 매도는 거부"""
+        context.container = None
+
+        result = await RiskCheckStage()._sell_position(context)
+
+        assert result['success'] is False
+        context.trading_service.execute_sell.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_legacy_sell_without_lease(self, context):
+        """lease 없는 실행은 레거시 서비스로 매도"""
+        context.container = None
+        context.lock_lease = None
+
+        await RiskCheckStage()._sell_position(context)
+
+        context.trading_service.execute_sell.assert_called_once_with("KRW-BTC")
+
+
+class TestExecutionStageLegacyFencing:
+    """ExecutionStage 레거시 주문"""
+
+    def test_legacy_orders_rejected_under_lease(self, context):
+        """lease 보유 중 레거시 매수/매도는 거부"""
+        context.container = None
+        stage = ExecutionStage()
+
+        stage._execute_buy_legacy(context)
+        buy_result = context.trade_result
+        stage._execute_sell_legacy(context)
+
+        assert buy_result['success'] is False
+        assert context.trade_result['success'] is False
+        context.trading_service.execute_buy.assert_not_called()
+        context.trading_service.execute_sell.assert_not_called()
+
+    def test_legacy_orders_without_lease(self, context):
+        """lease 없는 실행은 레거시 서비스로 주문"""
+        context.container = None
+        context.lock_lease = None
+        stage = ExecutionStage()
+
+        stage._execute_buy_legacy(context)
+        stage._execute_sell_legacy(context)
+
+        context.trading_service.execute_buy.assert_called_once_with("KRW-BTC")
+        context.trading_service.execute_sell.assert_called_once_with("KRW-BTC")
@@ -218,6 +218,34 @@ class TestContainerPersistenceSelection:
         assert isinstance(persistence, InMemoryPersistenceAdapter)
 
 
+class TestContainerClose:
+    """Test Container.close() releases created ports."""
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_persistence_port(self):
+        """close() should aclose the persistence port (flushing write-behind)."""
+        from src.container import Container
+
+        mock_persistence = MagicMock()
+        mock_persistence.aclose = AsyncMock()
+        container = Container(persistence_port=mock_persistence)
+
+        await container.close()
+
+        mock_persistence.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_does_not_create_ports(self):
+        """close() on a fresh container should not create a persistence port."""
+        from src.container import Container
+
+        container = Container(session_factory=MagicMock())
+
+        await container.close()
+
+        assert container._persistence_port is None
+
+
 class TestContainerExecutionPort:
     """Test Container.get_execution_port() for live/backtest mode selection."""
 
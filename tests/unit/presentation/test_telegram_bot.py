@@ -150,8 +150,13 @@ class TestTelegramBotCommands:
         assert "이미 트레이딩 사이클이 실행 중" in call_args
 
     @pytest.mark.asyncio
-    async def test_cmd_run_executes_trading_cycle(self, bot_service, mock_update, mock_context):
+    async def test_cmd_run_executes_trading_cycle(
+        self, bot_service, mock_update, mock_context, tmp_path, monkeypatch
+    ):
         """트레이딩 사이클 실행"""
+        from src.config.settings import CoordinationConfig
+        monkeypatch.setattr(CoordinationConfig, 'DIR', str(tmp_path / "coordination"))
+
         mock_result = {
             'status': 'success',
             'decision': 'hold',
@@ -172,72 +177,284 @@ class TestTelegramBotCommands:
                     # 실행 후 플래그가 False로 복원되어야 함
                     assert bot_service._is_running_cycle is False
 
+    @pytest.fixture
+    def snapshot_factory(self):
+        """포트폴리오 스냅샷 생성기 (잔고 목록 + 현재가)"""
+        from src.application.services.portfolio_snapshot import build_portfolio_snapshot
+
+        def factory(balances, prices):
+            exchange = MagicMock()
+            exchange.get_balances.return_value = balances
+            exchange.get_current_prices.return_value = prices
+            return build_portfolio_snapshot(exchange)
+
+        return factory
+
+    def _use_snapshot(self, bot_service, snapshot):
+        """스냅샷 캐시를 고정 스냅샷으로 교체"""
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=snapshot)
+        bot_service._snapshot_cache = cache
+        return cache
+
     @pytest.mark.asyncio
-    async def test_cmd_status_shows_portfolio_info(self, bot_service, mock_update, mock_context):
+    async def test_cmd_status_shows_portfolio_info(
+        self, bot_service, mock_update, mock_context, snapshot_factory, tmp_path
+    ):
         """상태 명령어 - 포트폴리오 정보 표시"""
-        mock_status = MagicMock()
-        mock_status.trading_mode.value = 'entry'
-        mock_status.positions = []
-        mock_status.can_open_new_position = True
-        mock_status.total_current_value = 1000000  # Updated attribute name
-        mock_status.krw_balance = 500000  # Updated attribute name
-        mock_status.total_invested = 500000
-
-        with patch('src.api.upbit_client.UpbitClient'):
-            with patch('src.position.portfolio_manager.PortfolioManager') as mock_pm_class:
-                mock_pm = MagicMock()
-                mock_pm.get_portfolio_status.return_value = mock_status
-                mock_pm_class.return_value = mock_pm
-
-                await bot_service._cmd_status(mock_update, mock_context)
-
-                call_args = mock_update.message.reply_text.call_args[0][0]
-                assert "봇 상태" in call_args
-                assert "총 자산" in call_args
+        from src.application.services.scan_result_store import ScanResultStore
+
+        bot_service._scan_store = ScanResultStore(tmp_path / "last_scan.json")
+        self._use_snapshot(bot_service, snapshot_factory(
+            [{'currency': 'KRW', 'balance': '500000', 'locked': '0', 'avg_buy_price': '0'}], {}
+        ))
+
+        await bot_service._cmd_status(mock_update, mock_context)
+
+        call_args = mock_update.message.reply_text.call_args[0][0]
+        assert "봇 상태" in call_args
+        assert "총 자산" in call_args
+        assert "500,000 KRW" in call_args
+        assert "마지막 스캔" not in call_args  # 스캔 결과 없음
 
     @pytest.mark.asyncio
-    async def test_cmd_positions_no_positions(self, bot_service, mock_update, mock_context):
-        """포지션 명령어 - 포지션 없음"""
-        mock_status = MagicMock()
-        mock_status.positions = []
+    async def test_cmd_status_includes_last_scan(
+        self, bot_service, mock_update, mock_context, snapshot_factory, tmp_path
+    ):
+        """상태 명령어 - 스케줄러가 저장한 마지막 스캔 요약 포함"""
+        from src.application.services.scan_result_store import ScanResultStore
+
+        store = ScanResultStore(tmp_path / "last_scan.json")
+        store.save({
+            'scan_summary': {'liquidity_scanned': 20, 'backtest_passed': 3},
+            'selected_coin': {'ticker': 'KRW-SOL', 'symbol': 'SOL', 'score': 81.0},
+        })
+        bot_service._scan_store = store
+        self._use_snapshot(bot_service, snapshot_factory([], {}))
+
+        await bot_service._cmd_status(mock_update, mock_context)
 
-        with patch('src.api.upbit_client.UpbitClient'):
-            with patch('src.position.portfolio_manager.PortfolioManager') as mock_pm_class:
-                mock_pm = MagicMock()
-                mock_pm.get_portfolio_status.return_value = mock_status
-                mock_pm_class.return_value = mock_pm
+        call_args = mock_update.message.reply_text.call_args[0][0]
+        assert "마지막 스캔" in call_args
+        assert "SOL" in call_args
+
+    @pytest.mark.asyncio
+    async def test_cmd_positions_no_positions(
+        self, bot_service, mock_update, mock_context, snapshot_factory
+    ):
+        """포지션 명령어 - 포지션 없음"""
+        self._use_snapshot(bot_service, snapshot_factory(
+            [{'currency': 'KRW', 'balance': '100000', 'locked': '0', 'avg_buy_price': '0'}], {}
+        ))
 
-                await bot_service._cmd_positions(mock_update, mock_context)
+        await bot_service._cmd_positions(mock_update, mock_context)
 
-                call_args = mock_update.message.reply_text.call_args[0][0]
-                assert "보유 포지션 없음" in call_args
+        call_args = mock_update.message.reply_text.call_args[0][0]
+        assert "보유 포지션 없음" in call_args
 
     @pytest.mark.asyncio
-    async def test_cmd_positions_with_positions(self, bot_service, mock_update, mock_context):
+    async def test_cmd_positions_with_positions(
+        self, bot_service, mock_update, mock_context, snapshot_factory
+    ):
         """포지션 명령어 - 포지션 있음"""
-        mock_position = MagicMock()
-        mock_position.symbol = 'BTC'
-        mock_position.avg_buy_price = 50000000
-        mock_position.current_price = 51000000
-        mock_position.balance = 0.01
-        mock_position.current_value = 510000
-        mock_position.unrealized_pnl = 10000
-        mock_position.profit_rate = 2.0
-
-        mock_status = MagicMock()
-        mock_status.positions = [mock_position]
-
-        with patch('src.api.upbit_client.UpbitClient'):
-            with patch('src.position.portfolio_manager.PortfolioManager') as mock_pm_class:
-                mock_pm = MagicMock()
-                mock_pm.get_portfolio_status.return_value = mock_status
-                mock_pm_class.return_value = mock_pm
-
-                await bot_service._cmd_positions(mock_update, mock_context)
-
-                call_args = mock_update.message.reply_text.call_args[0][0]
-                assert "BTC" in call_args
-                assert "보유 포지션 목록" in call_args
+        self._use_snapshot(bot_service, snapshot_factory(
+            [{'currency': 'BTC', 'balance': '0.01', 'locked': '0', 'avg_buy_price': '50000000'}],
+            {'KRW-BTC': 51000000.0},
+        ))
+
+        await bot_service._cmd_positions(mock_update, mock_context)
+
+        call_args = mock_update.message.reply_text.call_args[0][0]
+        assert "BTC" in call_args
+        assert "보유 포지션 목록" in call_args
+        assert "+2.00%" in call_args
+
+    @pytest.mark.asyncio
+    async def test_cmd_balance_uses_snapshot(
+        self, bot_service, mock_update, mock_context, snapshot_factory
+    ):
+        """잔고 명령어 - 스냅샷의 KRW + 코인 평가금액"""
+        self._use_snapshot(bot_service, snapshot_factory(
+            [
+                {'currency': 'KRW', 'balance': '100000', 'locked': '0', 'avg_buy_price': '0'},
+                {'currency': 'ETH', 'balance': '0.5', 'locked': '0', 'avg_buy_price': '4000000'},
+            ],
+            {'KRW-ETH': 4400000.0},
+        ))
+
+        await bot_service._cmd_balance(mock_update, mock_context)
+
+        call_args = mock_update.message.reply_text.call_args[0][0]
+        assert "ETH" in call_args
+        assert "+10.00%" in call_args
+        assert "2,300,000 KRW" in call_args  # 100,000 + 0.5 × 4,400,000
+
+    @pytest.mark.asyncio
+    async def test_portfolio_commands_share_one_snapshot(self, bot_service, mock_update, mock_context):
+        """/status, /positions, /balance 연속 호출 시 거래소 조회는 1회"""
+        exchange = MagicMock()
+        exchange.get_balances.return_value = [
+            {'currency': 'KRW', 'balance': '100000', 'locked': '0', 'avg_buy_price': '0'},
+            {'currency': 'BTC', 'balance': '0.01', 'locked': '0', 'avg_buy_price': '50000000'},
+        ]
+        exchange.get_current_prices.return_value = {'KRW-BTC': 51000000.0}
+        bot_service._exchange_client = exchange
+        bot_service._scan_store = MagicMock(load=MagicMock(return_value=None))
+
+        await bot_service._cmd_status(mock_update, mock_context)
+        await bot_service._cmd_positions(mock_update, mock_context)
+        await bot_service._cmd_balance(mock_update, mock_context)
+
+        assert exchange.get_balances.call_count == 1
+        assert exchange.get_current_prices.call_count == 1
+        exchange.get_current_price.assert_not_called()
+        await bot_service.stop()
+
+    @pytest.mark.asyncio
+    async def test_cmd_scan_formats_stored_result(self, bot_service, mock_update, mock_context, tmp_path):
+        """스캔 명령어 - 저장된 스캔 결과를 재스캔 없이 표시"""
+        from src.application.services.scan_result_store import ScanResultStore
+
+        store = ScanResultStore(tmp_path / "last_scan.json")
+        store.save({
+            'scan_summary': {'liquidity_scanned': 20, 'backtest_passed': 2, 'selected': 1},
+            'selected_coin': {'ticker': 'KRW-SOL', 'symbol': 'SOL', 'score': 81.0},
+            'all_backtest_results': [{'symbol': 'SOL', 'score': 81.0, 'passed': True}],
+        })
+        bot_service._scan_store = store
+
+        await bot_service._cmd_scan(mock_update, mock_context)
+
+        call_args = mock_update.message.reply_text.call_args[0][0]
+        assert "멀티코인 스캔 결과" in call_args
+        assert "SOL" in call_args
+        assert "스캔 시각" in call_args
+
+    @pytest.mark.asyncio
+    async def test_cmd_scan_without_result(self, bot_service, mock_update, mock_context, tmp_path):
+        """스캔 명령어 - 저장된 결과 없음"""
+        from src.application.services.scan_result_store import ScanResultStore
+
+        bot_service._scan_store = ScanResultStore(tmp_path / "missing.json")
+
+        await bot_service._cmd_scan(mock_update, mock_context)
+
+        assert "스캔 결과 없음" in mock_update.message.reply_text.call_args[0][0]
+
+    def _use_coordinator(self, bot_service, tmp_path, owner="telegram"):
+        """임시 디렉토리의 lease 락 + 사이클 보드로 조율기 구성"""
+        from src.application.services.cycle_coordinator import CycleCoordinator
+        from src.infrastructure.adapters.persistence.lease_lock_adapter import SQLiteLeaseLockAdapter
+        from src.infrastructure.adapters.persistence.local_coordination_adapter import CycleRunBoard
+
+        board = CycleRunBoard(tmp_path / "coordination.db")
+        coordinator = CycleCoordinator(
+            lock_port=SQLiteLeaseLockAdapter(tmp_path / "coordination.db", poll_interval=0.01),
+            board=board,
+            owner=owner,
+            poll_interval=0.01,
+            lock_wait=0.05,
+        )
+        bot_service._coordinator = coordinator
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_cmd_run_reuses_container(self, bot_service, mock_update, mock_context, tmp_path):
+        """트레이딩 사이클 - Container/Runtime은 명령마다 새로 만들지 않음"""
+        from src.application.services.scan_result_store import ScanResultStore
+
+        orchestrator = MagicMock()
+        orchestrator.execute_trading_cycle = AsyncMock(return_value={
+            'status': 'success',
+            'decision': 'hold',
+            'confidence': 'medium',
+            'reason': '관망',
+            'scan_summary': {'liquidity_scanned': 10, 'backtest_passed': 0},
+        })
+        container = MagicMock()
+        container.get_trading_orchestrator.return_value = orchestrator
+        bot_service._container = container
+        bot_service._runtime = MagicMock()
+        bot_service._snapshot_cache = MagicMock()
+        bot_service._scan_store = ScanResultStore(tmp_path / "last_scan.json")
+        self._use_coordinator(bot_service, tmp_path)
+
+        await bot_service._cmd_run(mock_update, mock_context)
+
+        assert bot_service._container is container
+        container.get_trading_orchestrator.assert_called_with(runtime=bot_service._runtime)
+        # 거래 후 스냅샷 무효화 + 스캔 결과 공유
+        assert bot_service._snapshot_cache.invalidate.call_count == 1
+        assert bot_service._scan_store.load()['scan_summary']['liquidity_scanned'] == 10
+
+    @pytest.mark.asyncio
+    async def test_cmd_run_reuses_finished_cycle(self, bot_service, mock_update, mock_context, tmp_path):
+        """같은 캔들에서 다시 /run - 완료된 사이클 결과 재사용 (재실행 없음)"""
+        orchestrator = MagicMock()
+        orchestrator.execute_trading_cycle = AsyncMock(return_value={
+            'status': 'success', 'decision': 'hold', 'confidence': 'medium', 'reason': '관망',
+        })
+        container = MagicMock()
+        container.get_trading_orchestrator.return_value = orchestrator
+        bot_service._container = container
+        bot_service._runtime = MagicMock()
+        bot_service._snapshot_cache = MagicMock()
+        coordinator = self._use_coordinator(bot_service, tmp_path)
+
+        await bot_service._cmd_run(mock_update, mock_context)
+        await bot_service._cmd_run(mock_update, mock_context)
+
+        assert orchestrator.execute_trading_cycle.await_count == 1
+        last_message = mock_update.message.reply_text.call_args[0][0]
+        assert "이미 완료됨" in last_message
+        assert "재사용 1" in last_message
+        assert coordinator.get_stats()['duplicate_executions'] == 0
+
+    @pytest.mark.asyncio
+    async def test_cmd_run_attaches_to_scheduler_cycle(
+        self, bot_service, mock_update, mock_context, tmp_path
+    ):
+        """스케줄러 사이클 진행 중 /run - 재실행 없이 진행 상황과 결과 전달"""
+        import asyncio
+        from src.application.services.cycle_coordinator import CYCLE_LOCK_NAME
+
+        coordinator = self._use_coordinator(bot_service, tmp_path)
+        coordinator.attach_timeout = 5.0
+        bot_service._container = MagicMock()
+        bot_service._snapshot_cache = MagicMock()
+
+        # 스케줄러 프로세스 역할: 같은 락 디렉토리/보드를 쓰는 별도 조율기
+        from src.application.services.cycle_coordinator import CycleCoordinator
+        from src.infrastructure.adapters.persistence.lease_lock_adapter import SQLiteLeaseLockAdapter
+
+        scheduler_lock = SQLiteLeaseLockAdapter(tmp_path / "coordination.db")
+        scheduler = CycleCoordinator(lock_port=scheduler_lock, board=coordinator.board, owner="scheduler")
+        assert await scheduler_lock.acquire(CYCLE_LOCK_NAME)
+        run_id = scheduler.begin()
+
+        async def scheduler_cycle():
+            await asyncio.sleep(0.05)
+            scheduler.progress(run_id, "scanned", {
+                'scan_summary': {'liquidity_scanned': 20, 'backtest_passed': 2},
+                'selected_coin': {'symbol': 'ETH'},
+            })
+            await asyncio.sleep(0.05)
+            scheduler.finish(run_id, {
+                'status': 'success', 'decision': 'buy', 'confidence': 'high', 'reason': '돌파',
+            })
+            await scheduler_lock.release(CYCLE_LOCK_NAME)
+
+        task = asyncio.create_task(scheduler_cycle())
+        await bot_service._cmd_run(mock_update, mock_context)
+        await task
+
+        bot_service._container.get_trading_orchestrator.assert_not_called()
+        messages = [c[0][0] for c in mock_update.message.reply_text.call_args_list]
+        assert any("진행 중인 사이클에 합류" in m for m in messages)
+        assert any("ETH" in m for m in messages)
+        assert "스케줄러 사이클" in messages[-1]
+        assert "매수" in messages[-1]
+        bot_service._snapshot_cache.invalidate.assert_called_once()
 
 
 class TestEnvironmentValidation:
@@ -0,0 +1,110 @@
+"""
+오더북 깊이 인덱스 테스트 (orderbook_depth.py)
+
+누적 배열 + searchsorted 결과가 호가 순회 결과와 일치하는지 검증합니다.
+"""
+import numpy as np
+import pytest
+
+from src.trading.liquidity_analyzer import LiquidityAnalyzer
+from src.trading.orderbook_depth import DepthLevels, OrderbookSnapshot
+
+
+def _walk(prices, sizes, amount, by_notional):
+    """기준 구현: 호가 순회"""
+    cost = filled = 0.0
+    levels = 0
+    for price, size in zip(prices, sizes):
+        if amount <= 0:
+            break
+        take = min(size, amount / price if by_notional else amount)
+        cost += take * price
+        filled += take
+        amount -= take * price if by_notional else take
+        levels += 1
+    return cost / filled, levels
+
+
+@pytest.fixture
+def upbit_orderbook():
+    """정상 호가창 (Upbit 형식)"""
+    return {
+        'orderbook_units': [
+            {'ask_price': 50000000, 'ask_size': 0.5, 'bid_price': 49950000, 'bid_size': 0.6},
+            {'ask_price': 50010000, 'ask_size': 0.4, 'bid_price': 49940000, 'bid_size': 0.5},
+            {'ask_price': 50020000, 'ask_size': 0.0, 'bid_price': 49930000, 'bid_size': 0.4},
+            {'ask_price': 50030000, 'ask_size': 0.3, 'bid_price': 49920000, 'bid_size': 0.3},
+            {'ask_price': 50040000, 'ask_size': 0.2, 'bid_price': 49910000, 'bid_size': 0.2},
+        ]
+    }
+
+
+class TestDepthLevels:
+    """DepthLevels 질의 테스트"""
+
+    @pytest.mark.parametrize('amount', [1_000_000, 25_000_000, 45_000_000, 60_000_000])
+    def test_fill_notional_matches_walk(self, upbit_orderbook, amount):
+        """금액 기준 평균 체결가/호가 단계 == 순회 결과 (수량 0 호가 제외)"""
+        asks = OrderbookSnapshot.from_upbit(upbit_orderbook).asks
+        fill = asks.fill_notional(amount)
+
+        prices = [50000000, 50010000, 50030000, 50040000]
+        sizes = [0.5, 0.4, 0.3, 0.2]
+        avg_price, levels = _walk(prices, sizes, amount, by_notional=True)
+
+        assert fill.complete
+        assert fill.avg_price == pytest.approx(avg_price)
+        assert fill.levels == levels
+
+    def test_fill_size_beyond_book_is_incomplete(self, upbit_orderbook):
+        """호가창 전체보다 큰 주문은 complete=False, 전체 수량 체결"""
+        bids = OrderbookSnapshot.from_upbit(upbit_orderbook).bids
+
+        fill = bids.fill_size(5.0)
+
+        assert not fill.complete
+        assert fill.filled_size == pytest.approx(2.0)
+        assert fill.levels == 5
+
+    def test_max_size_within_slippage(self):
+        """최대 수량에서 평균 슬리피지가 정확히 한계값"""
+        asks = DepthLevels([100.0, 101.0, 102.0, 105.0], [1.0, 1.0, 1.0, 5.0], is_ask=True)
+        bids = DepthLevels([100.0, 99.0, 98.0], [1.0, 1.0, 1.0], is_ask=False)
+
+        size = asks.max_size_within(1.0)
+        assert asks.fill_size(size).avg_price == pytest.approx(101.0)
+        assert asks.fill_size(size + 0.01).avg_price > 101.0
+
+        bid_size = bids.max_size_within(0.5)
+        assert bids.fill_size(bid_size).avg_price == pytest.approx(99.5)
+        # 호가창 전체가 허용 범위 안이면 전체 수량
+        assert bids.max_size_within(5.0) == pytest.approx(3.0)
+
+    def test_optimal_splits(self):
+        """상위 5개 호가 평균 물량 기준 분할 (2~10개)"""
+        asks = DepthLevels(np.arange(100, 110), np.ones(10), is_ask=True)
+
+        assert asks.optimal_splits(0.5) == 1
+        assert asks.optimal_splits(3.5) == 3
+        assert asks.optimal_splits(50.0) == 10
+
+
+class TestSnapshotConsumers:
+    """LiquidityAnalyzer / 백테스트 전략이 스냅샷을 재사용"""
+
+    def test_liquidity_analyzer_accepts_snapshot(self, upbit_orderbook):
+        """dict와 스냅샷 입력 결과 동일"""
+        snapshot = OrderbookSnapshot.coerce(upbit_orderbook)
+
+        from_dict = LiquidityAnalyzer.calculate_slippage(upbit_orderbook, 'buy', 30_000_000)
+        from_snapshot = LiquidityAnalyzer.calculate_slippage(snapshot, 'buy', 30_000_000)
+
+        assert from_dict == from_snapshot
+        assert OrderbookSnapshot.coerce(snapshot) is snapshot
+
+    def test_max_order_within_slippage(self, upbit_orderbook):
+        """허용 슬리피지 이내 최대 주문 규모"""
+        result = LiquidityAnalyzer.max_order_within_slippage(upbit_orderbook, 'buy', 0.02)
+
+        slippage = LiquidityAnalyzer.calculate_slippage(upbit_orderbook, 'buy', result['max_krw_amount'])
+        assert slippage['expected_slippage_pct'] == pytest.approx(0.02)